@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+AIRPORT SEARCH ALLOCATION BENCHMARK
+===================================
+
+Compares the legacy /api/airports/search path (score every airport, copy each
+match to add a `score` key, sort all matches, copy the survivors again to strip
+the score) with the AirportIndex top-k path (bounded heap per tier, shared
+pre-serialized rows) for 1-, 2- and 3-character queries.
+
+The "top-k" row always runs the ranked tiers. The request path adds the
+precomputed 1-2 character table ("lookup", response cache bypassed) and the
+LRU response cache ("cached", which is what repeated queries hit); they are
+reported as separate rows so cache hits don't pass for search speed.
+
+Allocations are measured with tracemalloc; run from the repository root:
+
+    python airport_search_benchmark.py
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+
+from airport_index import get_airport_index, match_score  # noqa: E402
+from text_folding import fold_text  # noqa: E402
+
+QUERIES = {
+    1: ["a", "d", "m", "s", "x"],
+    2: ["in", "de", "bo", "lo", "ma"],
+    3: ["del", "bom", "goi", "ist", "san"],
+}
+LIMIT = 10
+ROUNDS = 200
+
+
+def legacy_search(index, query, limit=LIMIT):
+    """The pre-index algorithm, kept here only as the benchmark baseline"""
+    term = fold_text(query).strip()
+    scored_results = []
+    for airport in index.store:
+        score = match_score(
+            fold_text(airport['iata']), fold_text(airport['city']),
+            fold_text(airport['airport']), fold_text(airport['country']), term
+        )
+        if score > 0:
+            airport_with_score = airport.copy()
+            airport_with_score['score'] = score
+            scored_results.append(airport_with_score)
+    scored_results.sort(key=lambda x: x['score'], reverse=True)
+    return [{k: v for k, v in r.items() if k != 'score'} for r in scored_results[:limit]]
+
+
+def topk_json(index, query, limit=LIMIT):
+    """The ranked top-k path alone: no short-prefix table, no response cache"""
+    term = fold_text(query).strip()
+    ids = index._ranked_ids(term, limit, fuzzy=len(term) >= index.FUZZY_MIN_LENGTH)
+    return b'{"results":[' + b','.join([index.store.row_json(i) for i in ids]) + b']}'
+
+
+def lookup_json(index, query, limit=LIMIT):
+    """The request path with the response cache bypassed"""
+    term = fold_text(query).strip()
+    return index._term_json(term, limit, len(term) >= index.FUZZY_MIN_LENGTH)
+
+
+def peak_allocation(search, queries):
+    """Mean tracemalloc peak (bytes) allocated while answering one query"""
+    peaks = []
+    tracemalloc.start()
+    for query in queries:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        search(query)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - baseline)
+    tracemalloc.stop()
+    return sum(peaks) / len(peaks)
+
+
+def mean_latency_ms(search, queries, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            search(query)
+    return (time.perf_counter() - start) * 1000 / (rounds * len(queries))
+
+
+def main():
+    index = get_airport_index()
+    paths = (
+        ("legacy", lambda q: legacy_search(index, q), 5),
+        ("top-k", lambda q: topk_json(index, q), ROUNDS),
+        ("lookup", lambda q: lookup_json(index, q), ROUNDS),
+        ("cached", lambda q: index.search_json(q, LIMIT), ROUNDS),
+    )
+
+    # Sanity check: both paths must return the same rows in the same order
+    for queries in QUERIES.values():
+        for query in queries:
+            expected = legacy_search(index, query)
+            assert expected == index.search(query, LIMIT), query
+            assert topk_json(index, query) == lookup_json(index, query) == index.search_json(query, LIMIT), query
+
+    print("🔍 AIRPORT SEARCH ALLOCATION BENCHMARK")
+    print("=" * 80)
+    print(f"Catalogue: {len(index)} airports, limit={LIMIT}")
+    print(f"{'chars':>5}  {'path':<8} {'peak KiB/query':>15} {'ms/query':>10}")
+    for length, queries in QUERIES.items():
+        for name, search, rounds in paths:
+            peak = peak_allocation(search, queries)
+            ms = mean_latency_ms(search, queries, rounds)
+            print(f"{length:>5}  {name:<8} {peak / 1024:>15.1f} {ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
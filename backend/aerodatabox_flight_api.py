@@ -9,6 +9,8 @@ from typing import List, Dict, Optional
 import logging
 from dotenv import load_dotenv
 from pathlib import Path
+from airport_resolver import AirportCodeResolver, airport_code_resolver
+from flight_offer import FlightOffer
 
 # Load environment variables
 load_dotenv()
@@ -18,7 +20,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class AeroDataBoxService:
-    def __init__(self):
+    def __init__(self, airport_codes: Optional[AirportCodeResolver] = None):
+        # Shared, memoized city -> IATA resolver backed by the airport catalogue
+        self.airport_codes = airport_codes or airport_code_resolver
         # Correct API.Market base URL for AeroDataBox
         self.api_base_url = "https://api.api.market/aerodatabox"
         self._api_key = None
@@ -38,7 +42,8 @@ class AeroDataBoxService:
             'Content-Type': 'application/json'
         }
     
-    def search_flights_by_airport(self, origin: str, destination: str, departure_date: str, passengers: int = 1) -> List[Dict]:
+    def search_flights_by_airport(self, origin: str, destination: str, departure_date: str, passengers: int = 1,
+                                  timeout: float = 30) -> List[FlightOffer]:
         """
         Search for flights using airport departure schedules (FIDS)
         
@@ -47,9 +52,10 @@ class AeroDataBoxService:
             destination (str): Destination airport code or city
             departure_date (str): Departure date in YYYY-MM-DD format
             passengers (int): Number of passengers
+            timeout (float): Seconds the HTTP request may take
             
         Returns:
-            List[Dict]: List of flight data
+            List[FlightOffer]: Scheduled flights with estimated prices
         """
         if not self.api_key:
             logger.warning("AeroDataBox API key not found in environment variables")
@@ -59,11 +65,14 @@ class AeroDataBoxService:
             # Convert city names to airport codes
             origin_code = self.get_airport_code(origin)
             dest_code = self.get_airport_code(destination)
+            if not origin_code or not dest_code:
+                logger.warning(f"AeroDataBox search skipped, unknown airport: {origin} → {destination}")
+                return []
             
             logger.info(f"Searching flights: {origin_code} → {dest_code} on {departure_date}")
             
             # Get departure flights from origin airport
-            departures = self.get_airport_departures(origin_code, departure_date)
+            departures = self.get_airport_departures(origin_code, departure_date, timeout)
             
             # Filter flights going to destination
             matching_flights = []
@@ -74,13 +83,14 @@ class AeroDataBoxService:
             logger.info(f"Found {len(matching_flights)} direct flights")
             
             # Transform to our format
-            return self.transform_flight_data(matching_flights, origin, destination)
+            return self.transform_flight_data(matching_flights, origin_code, dest_code, departure_date,
+                                              origin, destination)
             
         except Exception as e:
             logger.error(f"AeroDataBox flight search error: {str(e)}")
             return []
     
-    def get_airport_departures(self, airport_code: str, date: str) -> List[Dict]:
+    def get_airport_departures(self, airport_code: str, date: str, timeout: float = 30) -> List[Dict]:
         """Get departure flights from an airport on a specific date"""
         try:
             # API.Market correct endpoint for airport departures (FIDS)
@@ -101,7 +111,7 @@ class AeroDataBoxService:
                 'withPrivate': 'false'
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = requests.get(url, headers=headers, params=params, timeout=timeout)
             logger.info(f"API.Market response status: {response.status_code}")
             
             if response.status_code == 200:
@@ -129,8 +139,9 @@ class AeroDataBoxService:
             logger.error(f"API.Market request failed: {str(e)}")
             return []
     
-    def transform_flight_data(self, raw_flights: List[Dict], origin: str, destination: str) -> List[Dict]:
-        """Transform AeroDataBox flight data to our standard format"""
+    def transform_flight_data(self, raw_flights: List[Dict], origin_code: str, dest_code: str, departure_date: str,
+                              origin: str, destination: str) -> List[FlightOffer]:
+        """Transform AeroDataBox departures into FlightOffers (prices are estimates)"""
         flights = []
         
         try:
@@ -146,11 +157,9 @@ class AeroDataBoxService:
                     departure = flight_data.get('departure', {})
                     arrival = flight_data.get('arrival', {})
                     
-                    departure_time = self.format_time(departure.get('scheduledTimeLocal', ''))
-                    arrival_time = self.format_time(arrival.get('scheduledTimeLocal', ''))
-                    
-                    # Calculate duration
-                    duration = self.calculate_duration(departure_time, arrival_time)
+                    # Local schedule times; the offer derives the duration from them
+                    departure_time = departure.get('scheduledTimeLocal', '')
+                    arrival_time = arrival.get('scheduledTimeLocal', '')
                     
                     # Generate realistic pricing based on airline and route
                     price = self.estimate_price(airline_iata, origin, destination)
@@ -159,27 +168,29 @@ class AeroDataBoxService:
                     aircraft = flight_data.get('aircraft', {})
                     aircraft_model = aircraft.get('model', 'Unknown Aircraft')
                     
-                    flight = {
-                        "id": f"FL_{flight_number}",
-                        "airline": airline_name,
-                        "airline_code": airline_iata,
-                        "flight_number": flight_number,
-                        "origin": origin,
-                        "destination": destination,
-                        "departure_time": departure_time,
-                        "arrival_time": arrival_time,
-                        "duration": duration,
-                        "price": price,
-                        "currency": "INR",
-                        "stops": 0,  # Direct flights only for now
-                        "aircraft": aircraft_model,
-                        "booking_class": "Economy",
-                        "available_seats": "Available",
-                        "baggage": "15kg checked + 7kg carry-on",
-                        "status": flight_data.get('status', 'Scheduled')
-                    }
-                    
-                    flights.append(flight)
+                    flights.append(FlightOffer.build(
+                        supplier="aerodatabox",
+                        id=f"FL_{flight_number}",
+                        airline_code=airline_iata,
+                        airline=airline_name,
+                        flight_number=flight_number,
+                        origin_code=origin_code,
+                        destination_code=dest_code,
+                        departure_time=departure_time,
+                        arrival_time=arrival_time,
+                        travel_date=departure_date,
+                        price=price,
+                        currency="INR",
+                        stops=0,  # Direct flights only for now
+                        price_estimated=True,
+                        origin=origin,
+                        destination=destination,
+                        aircraft=aircraft_model,
+                        booking_class="Economy",
+                        available_seats="Available",
+                        baggage="15kg checked + 7kg carry-on",
+                        status=flight_data.get('status', 'Scheduled')
+                    ))
                     
                 except Exception as e:
                     logger.error(f"Error processing flight: {str(e)}")
@@ -192,37 +203,6 @@ class AeroDataBoxService:
             logger.error(f"Error transforming flight data: {str(e)}")
             return []
     
-    def format_time(self, datetime_str: str) -> str:
-        """Convert datetime string to HH:MM format"""
-        try:
-            if datetime_str and 'T' in datetime_str:
-                time_part = datetime_str.split('T')[1]
-                return time_part[:5]  # Return HH:MM
-            return "08:00"  # Default
-        except:
-            return "08:00"  # Default
-    
-    def calculate_duration(self, departure: str, arrival: str) -> str:
-        """Calculate flight duration"""
-        try:
-            dep_hour, dep_min = map(int, departure.split(':'))
-            arr_hour, arr_min = map(int, arrival.split(':'))
-            
-            dep_total = dep_hour * 60 + dep_min
-            arr_total = arr_hour * 60 + arr_min
-            
-            # Handle overnight flights
-            if arr_total < dep_total:
-                arr_total += 24 * 60
-            
-            duration_min = arr_total - dep_total
-            hours = duration_min // 60
-            minutes = duration_min % 60
-            
-            return f"{hours}h {minutes}m"
-        except:
-            return "2h 30m"  # Default
-    
     def estimate_price(self, airline_code: str, origin: str, destination: str) -> int:
         """Estimate realistic pricing based on airline and route"""
         base_prices = {
@@ -250,31 +230,9 @@ class AeroDataBoxService:
         
         return int(base_price * multiplier)
     
-    def get_airport_code(self, city_or_code: str) -> str:
+    def get_airport_code(self, city_or_code: str) -> Optional[str]:
         """Convert city names to IATA airport codes"""
-        city_to_code = {
-            'delhi': 'DEL',
-            'mumbai': 'BOM', 
-            'bangalore': 'BLR',
-            'bengaluru': 'BLR',
-            'chennai': 'MAA',
-            'hyderabad': 'HYD',
-            'kolkata': 'CCU',
-            'pune': 'PNQ',
-            'ahmedabad': 'AMD',
-            'kochi': 'COK',
-            'goa': 'GOI',
-            'jaipur': 'JAI',
-        }
-        
-        city_lower = city_or_code.lower().strip()
-        
-        # If it's already a 3-letter code, return as is
-        if len(city_lower) == 3 and city_lower.isalpha():
-            return city_lower.upper()
-            
-        # Look up city name
-        return city_to_code.get(city_lower, city_lower.upper()[:3])
+        return self.airport_codes.resolve(city_or_code)
     
     def test_api_connection(self) -> bool:
         """Test if the API connection is working"""
@@ -304,7 +262,7 @@ async def test_aerodatabox_api():
         if flights:
             logger.info(f"✅ AeroDataBox test successful - Found {len(flights)} flights")
             for flight in flights[:3]:  # Show first 3 flights
-                logger.info(f"  ✈️ {flight['airline']} {flight['flight_number']} - ₹{flight['price']}")
+                logger.info(f"  ✈️ {flight.airline} {flight.flight_number} - ₹{flight.price}")
             return True
         else:
             logger.info("✅ AeroDataBox API connected, but no matching flights found")
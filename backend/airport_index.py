@@ -0,0 +1,794 @@
+"""
+Airport Index for TourSmile autocomplete
+Immutable, process-wide airport catalogue loaded from a binary snapshot at startup
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from math import asin, ceil, cos, floor, radians, sin, sqrt
+from array import array
+from collections import Counter
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
+from heapq import heappush, heapreplace, nlargest
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from airport_snapshot import Snapshot, SnapshotWriter
+from airport_store import AirportStore
+from text_folding import fold_text
+
+ROOT_DIR = Path(__file__).parent
+AIRPORTS_DB_PATH = ROOT_DIR / 'airports_db.json'
+# Static popularity weights (IATA -> annual passengers, millions) used to
+# order airports inside a search tier
+AIRPORT_POPULARITY_PATH = ROOT_DIR / 'airport_popularity.json'
+# Airports queued for the catalogue; rows whose IATA code is not catalogued yet
+# are appended on the next (re)load, so adding airports needs no redeploy
+AIRPORT_ADDITIONS_PATH = Path(os.environ.get(
+    'AIRPORT_ADDITIONS_PATH', ROOT_DIR.parent / 'priority_airports_to_add.json'
+))
+# Pre-built index snapshot (records, folded keys, prefix tables), memory-mapped
+# read-only by every worker on the box; rebuilt when the JSON sources change
+AIRPORT_SNAPSHOT_PATH = Path(os.environ.get('AIRPORT_SNAPSHOT_PATH', ROOT_DIR / 'airports_snapshot.bin'))
+
+# City code mappings for multi-airport cities
+CITY_CODES = {
+    "lon": "London", "london": "London",
+    "nyc": "New York", "new york": "New York",
+    "par": "Paris", "paris": "Paris",
+    "tyo": "Tokyo", "tokyo": "Tokyo",
+    "mil": "Milan", "milan": "Milan",
+    "rom": "Rome", "rome": "Rome",
+    "chi": "Chicago", "chicago": "Chicago",
+    "was": "Washington", "washington": "Washington",
+    "hst": "Houston", "houston": "Houston",
+    "dfw": "Dallas", "dallas": "Dallas",
+    "sao": "São Paulo", "são paulo": "São Paulo",
+    "rio": "Rio de Janeiro", "rio de janeiro": "Rio de Janeiro",
+    "bue": "Buenos Aires", "buenos aires": "Buenos Aires",
+    "dxb": "Dubai", "dubai": "Dubai",
+    "bjs": "Beijing", "beijing": "Beijing",
+    "sha": "Shanghai", "shanghai": "Shanghai",
+    "istanbul": "Istanbul",
+    "yto": "Toronto", "toronto": "Toronto",
+}
+FOLDED_CITY_CODES = {fold_text(code): fold_text(city) for code, city in CITY_CODES.items()}
+
+
+def match_score(iata: str, city: str, name: str, country: str, term: str) -> int:
+    """
+    Calculate match score for airport relevance ranking - MATCHES FRONTEND ALGORITHM
+    All arguments must already be folded with fold_text; exact IATA matches always score 1000
+    """
+    # EXACT IATA CODE MATCH (HIGHEST PRIORITY - 1000 points)
+    if iata == term:
+        return 1000
+
+    # IATA CODE STARTS WITH SEARCH TERM (900 points)
+    if iata.startswith(term):
+        return 900
+
+    # EXACT CITY NAME MATCH (800 points)
+    if city == term:
+        return 800
+
+    # CITY NAME STARTS WITH SEARCH TERM (700 points)
+    if city.startswith(term):
+        return 700
+
+    # AIRPORT NAME STARTS WITH SEARCH TERM (600 points)
+    if name.startswith(term):
+        return 600
+
+    # CITY NAME CONTAINS SEARCH TERM (500 points)
+    if term in city:
+        return 500
+
+    # AIRPORT NAME CONTAINS SEARCH TERM (400 points)
+    if term in name:
+        return 400
+
+    # COUNTRY CONTAINS SEARCH TERM (300 points)
+    if term in country:
+        return 300
+
+    # NO MATCH - Return 0 (will be filtered out)
+    return 0
+
+
+class KeyRangeIndex:
+    """
+    Sorted positions into a single text blob of search keys, queried with bisect.
+
+    With ``suffixes=False`` only the start of every key is indexed, which
+    answers "starts with" lookups. With ``suffixes=True`` every suffix is
+    indexed (a suffix array), which answers "contains" lookups. Either way a
+    lookup is two binary searches plus the size of the matching range.
+    """
+
+    SEPARATOR = '\x00'
+
+    def __init__(self, keys: Tuple[str, ...], suffixes: bool = False):
+        # The separator sorts below every real character, so truncated
+        # slices of the blob keep the same order as the full suffixes
+        text = self.SEPARATOR.join(keys) + self.SEPARATOR
+        owners = array('I')
+        buckets: Dict[str, List[int]] = {}
+        offset = 0
+        for record_id, key in enumerate(keys):
+            starts = range(len(key)) if suffixes else range(min(len(key), 1))
+            for start in starts:
+                buckets.setdefault(key[start], []).append(offset + start)
+            owners.extend([record_id] * (len(key) + 1))
+            offset += len(key) + 1
+
+        # Sorting one first-character bucket at a time keeps only that
+        # bucket's suffix strings alive; positions start ascending, so the
+        # stable sort breaks ties between equal keys by position
+        self.text = text
+        self.positions = array('I')
+        for first in sorted(buckets):
+            bucket = buckets.pop(first)
+            bucket.sort(key=lambda pos: text[pos:text.index(self.SEPARATOR, pos)])
+            self.positions.extend(bucket)
+        self.record_ids = array('I', (owners[pos] for pos in self.positions))
+
+    def save(self, writer: SnapshotWriter, name: str) -> None:
+        writer.add_text(f"{name}.text", self.text)
+        writer.add_array(f"{name}.positions", self.positions)
+        writer.add_array(f"{name}.record_ids", self.record_ids)
+
+    @classmethod
+    def load(cls, snapshot: Snapshot, name: str) -> "KeyRangeIndex":
+        index = cls.__new__(cls)
+        index.text = snapshot.text(f"{name}.text")
+        index.positions = snapshot.array(f"{name}.positions")
+        index.record_ids = snapshot.array(f"{name}.record_ids")
+        return index
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def lookup(self, term: str) -> array:
+        """Record ids whose key starts with (or contains) ``term``; may repeat"""
+        if not term or self.SEPARATOR in term:
+            return self.record_ids[0:0]
+        text = self.text
+        width = len(term)
+        key = lambda pos: text[pos:pos + width]
+        lo = bisect_left(self.positions, term, key=key)
+        hi = bisect_right(self.positions, term, lo=lo, key=key)
+        return self.record_ids[lo:hi]
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams of a key, padded so word starts and ends count"""
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def prefix_edit_distance(term: str, target: str, max_edits: int) -> int:
+    """
+    Edit distance (with adjacent transpositions) between ``term`` and the
+    closest prefix of ``target``, or ``max_edits + 1`` if it exceeds the bound.
+
+    Only the DP band within ``max_edits`` of the diagonal is filled, and the
+    scan stops as soon as a whole row is over the bound, so verifying a
+    candidate costs O(len(term) * max_edits).
+    """
+    over = max_edits + 1
+    target = target[:len(term) + max_edits]
+    if len(target) < len(term) - max_edits:
+        return over
+    width = len(target) + 1
+    before_previous: List[int] = []
+    previous = [min(j, over) for j in range(width)]
+    for i, term_char in enumerate(term, 1):
+        current = [over] * width
+        if i <= max_edits:
+            current[0] = i
+        lo = max(1, i - max_edits)
+        hi = min(width - 1, i + max_edits)
+        for j in range(lo, hi + 1):
+            target_char = target[j - 1]
+            # Inlined min() of delete / insert / substitute / transpose
+            cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if previous[j - 1] + (term_char != target_char) < cost:
+                cost = previous[j - 1] + (term_char != target_char)
+            if i > 1 and j > 1 and term_char == target[j - 2] and term[i - 2] == target_char:
+                if before_previous[j - 2] + 1 < cost:
+                    cost = before_previous[j - 2] + 1
+            current[j] = cost if cost < over else over
+        if min(current[lo - 1:hi + 1]) > max_edits:
+            return over
+        before_previous, previous = previous, current
+    return min(previous[max(0, len(term) - max_edits):])
+
+
+class TrigramIndex:
+    """
+    Inverted index from character trigrams to search keys, for typo tolerance.
+
+    Candidates are the keys with the highest trigram (Jaccard) similarity to
+    the query, capped at ``max_candidates``; each is kept only if a bounded
+    prefix edit distance confirms the match, and fewer edits rank higher.
+    """
+
+    # Trigrams shared by thousands of keys ("air", "por") are too common to
+    # seed candidates from; they only add to the counts of rarer matches
+    MAX_INTRODUCING_POSTING = 1000
+
+    def __init__(self, keyed_records: Dict[str, Iterable[int]], max_candidates: int = 32):
+        self.keys = tuple(keyed_records)
+        self.record_ids = tuple(tuple(keyed_records[key]) for key in self.keys)
+        self.gram_counts = array('H', (len(trigrams(key)) for key in self.keys))
+        self.max_candidates = max_candidates
+
+        postings: Dict[str, List[int]] = {}
+        for key_id, key in enumerate(self.keys):
+            for gram in trigrams(key):
+                postings.setdefault(gram, []).append(key_id)
+        self.postings = {gram: array('I', ids) for gram, ids in postings.items()}
+
+    def save(self, writer: SnapshotWriter, name: str) -> None:
+        writer.add_json(f"{name}.keys", list(self.keys))
+        writer.add_lists(f"{name}.record_ids", self.record_ids)
+        writer.add_array(f"{name}.gram_counts", self.gram_counts)
+        writer.add_groups(f"{name}.postings", self.postings)
+
+    @classmethod
+    def load(cls, snapshot: Snapshot, name: str, max_candidates: int = 32) -> "TrigramIndex":
+        index = cls.__new__(cls)
+        index.keys = tuple(snapshot.json(f"{name}.keys"))
+        index.record_ids = snapshot.lists(f"{name}.record_ids")
+        index.gram_counts = snapshot.array(f"{name}.gram_counts")
+        index.postings = snapshot.groups(f"{name}.postings")
+        index.max_candidates = max_candidates
+        return index
+
+    @staticmethod
+    def max_edits(term: str) -> int:
+        return 1 if len(term) <= 5 else 2 if len(term) <= 10 else 3
+
+    def lookup(self, term: str, limit: int = 10, min_similarity: float = 0.25) -> List[int]:
+        """Record ids of keys close to ``term``, best match first; may repeat"""
+        query_grams = trigrams(term)
+
+        # A key reaching ``min_similarity`` shares at least ``needed`` trigrams,
+        # so only the rarest grams may introduce new candidates; the common
+        # ones just add to the counts of keys already found
+        needed = max(1, ceil(min_similarity * len(query_grams)))
+        postings = sorted(
+            (self.postings[gram] for gram in query_grams if gram in self.postings),
+            key=len
+        )
+        introducing = len(query_grams) - needed + 1
+        shared: Counter = Counter()
+        for posting in postings[:introducing]:
+            if len(posting) <= self.MAX_INTRODUCING_POSTING:
+                shared.update(posting)
+        for posting in postings[introducing:]:
+            if len(shared) * 16 < len(posting):
+                # Postings are sorted by key id, so probe them with bisect
+                for key_id in shared:
+                    at = bisect_left(posting, key_id)
+                    if at < len(posting) and posting[at] == key_id:
+                        shared[key_id] += 1
+            else:
+                for key_id in posting:
+                    if key_id in shared:
+                        shared[key_id] += 1
+
+        gram_counts = self.gram_counts
+        candidates = nlargest(self.max_candidates, (
+            (common / (len(query_grams) + gram_counts[key_id] - common), key_id)
+            for key_id, common in shared.items()
+            if common >= needed
+        ))
+
+        # Rank = similarity / (1 + edits), so a candidate can never beat its
+        # own similarity; stop verifying once the top ``limit`` are settled
+        max_edits = self.max_edits(term)
+        best: List[Tuple[float, int]] = []  # min-heap of the top ``limit`` ranks
+        for similarity, key_id in candidates:
+            if similarity < min_similarity:
+                break
+            if len(best) >= limit and similarity <= best[0][0]:
+                break
+            edits = prefix_edit_distance(term, self.keys[key_id], max_edits)
+            if edits > max_edits:
+                continue
+            rank = (similarity / (1 + edits), -key_id)
+            if len(best) < limit:
+                heappush(best, rank)
+            elif rank > best[0]:
+                heapreplace(best, rank)
+        best.sort(reverse=True)
+        return [record_id for _, key_id in best for record_id in self.record_ids[-key_id]]
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres"""
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    h = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(h)))
+
+
+class GeoGridIndex:
+    """
+    Airports bucketed into fixed lat/lon cells for radius queries.
+
+    A query only visits the cells overlapping the radius' bounding box
+    (a handful for a few hundred km), then ranks the airports in them by
+    great-circle distance scaled by airport size, so a large airport
+    slightly further away beats a small airfield next door.
+    """
+
+    CELL_DEGREES = 1.0
+    KM_PER_DEGREE = 111.32
+    # Distance multipliers per AIRPORT_TYPES index (unknown, small, medium, large)
+    SIZE_PENALTY = (1.5, 2.0, 1.25, 1.0)
+
+    def __init__(self, store: AirportStore):
+        self.store = store
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        for i in range(len(store)):
+            position = store.coordinates(i)
+            if position:
+                cells.setdefault(self._cell(*position), []).append(i)
+        self.cells = {cell: array('I', ids) for cell, ids in cells.items()}
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self.cells.values())
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return floor(lat / self.CELL_DEGREES), floor(lon / self.CELL_DEGREES)
+
+    def within(self, lat: float, lon: float, radius_km: float) -> List[Tuple[float, int]]:
+        """(distance_km, record id) for every airport within ``radius_km``, nearest first"""
+        dlat = radius_km / self.KM_PER_DEGREE
+        # Longitude degrees shrink towards the poles; near them scan every column
+        lat_scale = cos(radians(min(abs(lat) + dlat, 89.9)))
+        dlon = min(radius_km / (self.KM_PER_DEGREE * lat_scale), 180.0)
+        columns = ceil(360 / self.CELL_DEGREES)
+
+        lat_lo, lon_lo = self._cell(lat - dlat, lon - dlon)
+        lat_hi, lon_hi = self._cell(lat + dlat, lon + dlon)
+        lon_cells = {(c + columns // 2) % columns - columns // 2 for c in range(lon_lo, lon_hi + 1)}
+
+        store = self.store
+        found = []
+        for row in range(lat_lo, lat_hi + 1):
+            for column in lon_cells:
+                for i in self.cells.get((row, column), ()):
+                    distance = haversine_km(lat, lon, store.lats[i], store.lons[i])
+                    if distance <= radius_km:
+                        found.append((distance, i))
+        found.sort()
+        return found
+
+    def nearby(self, lat: float, lon: float, radius_km: float, limit: int = 5,
+               exclude: Iterable[int] = ()) -> List[int]:
+        """Record ids within ``radius_km``, ranked by size-weighted distance"""
+        excluded = set(exclude)
+        sizes = self.store.sizes
+        ranked = sorted(
+            (distance * self.SIZE_PENALTY[sizes[i]], i)
+            for distance, i in self.within(lat, lon, radius_km) if i not in excluded
+        )
+        return [i for _, i in ranked[:limit]]
+
+
+class AirportIndex:
+    """
+    Read-only airport catalogue with pre-normalized search keys.
+
+    Records live in a compact ``AirportStore``; the index itself only keeps
+    integer record ids. Every scoring tier of ``match_score`` is answered
+    from its own index, so a lookup never scans the whole catalogue.
+
+    The store and every lookup table are written to one binary snapshot
+    (``save``); ``load`` maps it read-only, so startup skips key folding,
+    suffix sorting and prefix ranking entirely.
+    """
+
+    # Shorter queries are too ambiguous (and too close to IATA codes) to guess at
+    FUZZY_MIN_LENGTH = 4
+    FUZZY_MAX_WORD_RECORDS = 20
+    # 1- and 2-character queries match thousands of airports, so their
+    # rankings are precomputed (up to SHORT_PREFIX_LIMIT rows each)
+    SHORT_PREFIX_LENGTH = 2
+    SHORT_PREFIX_LIMIT = 50
+    RESPONSE_CACHE_SIZE = 4096
+    NEARBY_RADIUS_KM = 300
+    NEARBY_LIMIT = 3
+
+    # Snapshot sections of the grouped and range lookup tables
+    GROUP_TABLES = ('by_iata', 'by_city', 'by_country_part', 'short_prefixes')
+    RANGE_TABLES = ('iata_prefixes', 'city_prefixes', 'name_prefixes', 'city_substrings', 'name_substrings')
+
+    def __init__(self, store: AirportStore, snapshot: Optional[Snapshot] = None):
+        self.store = store
+        self.signature: Tuple[int, ...] = ()
+        if snapshot is None:
+            self._build()
+        else:
+            for table in self.GROUP_TABLES:
+                setattr(self, table, snapshot.groups(table))
+            for table in self.RANGE_TABLES:
+                setattr(self, table, KeyRangeIndex.load(snapshot, table))
+            self.fuzzy = TrigramIndex.load(snapshot, 'fuzzy')
+        self.geo = GeoGridIndex(store)
+
+        # Response bodies keyed by (folded query, limit, fuzzy); the cache
+        # belongs to this index, so a reloaded index starts with an empty one
+        self._cached_json = lru_cache(maxsize=self.RESPONSE_CACHE_SIZE)(self._term_json)
+
+    def _build(self) -> None:
+        store = self.store
+
+        # Folded (lowercase, accent-free) keys computed once here instead of on
+        # every query; they only live until the lookup structures are built
+        iata_keys = tuple(fold_text(store.iata(i)) for i in range(len(store)))
+        city_keys = tuple(fold_text(store.city(i)) for i in range(len(store)))
+        name_keys = tuple(fold_text(store.airport(i)) for i in range(len(store)))
+        country_keys = tuple(fold_text(store.country(i)) for i in range(len(store)))
+
+        self.by_iata = self._group_by(iata_keys)
+        self.by_city = self._group_by(city_keys)
+        # Country codes are tiny, so every substring is a direct lookup
+        self.by_country_part = self._group_by(
+            country_keys,
+            lambda key: {key[i:j] for i in range(len(key)) for j in range(i + 1, len(key) + 1)}
+        )
+
+        self.iata_prefixes = KeyRangeIndex(iata_keys)
+        self.city_prefixes = KeyRangeIndex(city_keys)
+        self.name_prefixes = KeyRangeIndex(name_keys)
+        self.city_substrings = KeyRangeIndex(city_keys, suffixes=True)
+        self.name_substrings = KeyRangeIndex(name_keys, suffixes=True)
+
+        # Typo tolerance over city names, airport names and their distinctive
+        # words; generic words ("airport", "international") are left out
+        fuzzy_keys: Dict[str, List[int]] = {}
+        name_words: Dict[str, List[int]] = {}
+        for i, (city, name) in enumerate(zip(city_keys, name_keys)):
+            for key in dict.fromkeys([city, name]):
+                fuzzy_keys.setdefault(key, []).append(i)
+            for word in dict.fromkeys(name.split()):
+                if len(word) >= self.FUZZY_MIN_LENGTH:
+                    name_words.setdefault(word, []).append(i)
+        for word, ids in name_words.items():
+            if len(ids) <= self.FUZZY_MAX_WORD_RECORDS and word not in fuzzy_keys:
+                fuzzy_keys[word] = ids
+        self.fuzzy = TrigramIndex(fuzzy_keys)
+
+        # Every 1- and 2-character term that occurs in some key, ranked once
+        short_terms = {
+            key[i:i + width]
+            for keys in (iata_keys, city_keys, name_keys, country_keys)
+            for key in set(keys)
+            for width in range(1, self.SHORT_PREFIX_LENGTH + 1)
+            for i in range(len(key) - width + 1)
+        }
+        self.short_prefixes: Dict[str, array] = {
+            term: array('I', self._ranked_ids(term, self.SHORT_PREFIX_LIMIT))
+            for term in sorted(short_terms) if term == term.strip()
+        }
+
+    @staticmethod
+    def _group_by(keys: Tuple[str, ...], expand=None) -> Dict[str, Tuple[int, ...]]:
+        groups: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            for part in (expand(key) if expand else (key,)):
+                groups.setdefault(part, []).append(i)
+        return {part: tuple(ids) for part, ids in groups.items()}
+
+    @classmethod
+    def build(cls, airports: List[Dict[str, str]], weights: Optional[Dict[str, float]] = None) -> "AirportIndex":
+        """Build the index in memory from catalogue rows (the slow path)"""
+        return cls(AirportStore.from_airports(airports, weights))
+
+    @classmethod
+    def from_json(cls, path: Path = AIRPORTS_DB_PATH,
+                  popularity_path: Path = AIRPORT_POPULARITY_PATH,
+                  additions_path: Path = AIRPORT_ADDITIONS_PATH) -> "AirportIndex":
+        with open(path, 'r', encoding='utf-8') as f:
+            airports = json.load(f)
+        if additions_path.exists():
+            with open(additions_path, 'r', encoding='utf-8') as f:
+                additions = json.load(f)
+            known = {a["iata"] for a in airports}
+            airports += [a for a in additions if a["iata"] not in known]
+        weights = {}
+        if popularity_path.exists():
+            with open(popularity_path, 'r', encoding='utf-8') as f:
+                weights = json.load(f)
+        return cls.build(airports, weights)
+
+    def save(self, path: Path = AIRPORT_SNAPSHOT_PATH) -> None:
+        """Write the store and every lookup table to a snapshot file"""
+        writer = SnapshotWriter()
+        self.store.write_snapshot(writer)
+        for table in self.GROUP_TABLES:
+            writer.add_groups(table, getattr(self, table))
+        for table in self.RANGE_TABLES:
+            getattr(self, table).save(writer, table)
+        self.fuzzy.save(writer, 'fuzzy')
+        writer.save(path)
+
+    @classmethod
+    def open(cls, path: Path = AIRPORT_SNAPSHOT_PATH) -> "AirportIndex":
+        """Map a snapshot written by ``save``"""
+        snapshot = Snapshot.open(path)
+        return cls(AirportStore.from_snapshot(snapshot), snapshot)
+
+    @classmethod
+    def load(cls, rebuild: bool = False) -> "AirportIndex":
+        """
+        Map the snapshot if it is newer than the JSON sources (unless
+        ``rebuild``); otherwise build the index from JSON and export the
+        snapshot for other workers. ``signature`` records what was loaded.
+        """
+        started = time.perf_counter()
+        sources = [source for source in (AIRPORTS_DB_PATH, AIRPORT_POPULARITY_PATH, AIRPORT_ADDITIONS_PATH)
+                   if source.exists()]
+        try:
+            if not rebuild and AIRPORT_SNAPSHOT_PATH.stat().st_mtime >= max(s.stat().st_mtime for s in sources):
+                index = cls.open(AIRPORT_SNAPSHOT_PATH)
+                index.signature = airport_sources_signature()
+                logging.info(
+                    f"✈️ Airport index loaded: {len(index)} airports from {AIRPORT_SNAPSHOT_PATH.name} "
+                    f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+                )
+                return index
+        except (OSError, ValueError) as e:
+            logging.info(f"Airport snapshot {AIRPORT_SNAPSHOT_PATH.name} unavailable ({e}); rebuilding from JSON")
+
+        index = cls.from_json()
+        try:
+            index.save(AIRPORT_SNAPSHOT_PATH)
+            index = cls.open(AIRPORT_SNAPSHOT_PATH)
+        except OSError as e:
+            logging.warning(f"Could not export airport snapshot to {AIRPORT_SNAPSHOT_PATH}: {e}")
+        index.signature = airport_sources_signature()
+        logging.info(
+            f"✈️ Airport index built: {len(index)} airports from {AIRPORTS_DB_PATH.name} "
+            f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+        return index
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def _tiers(self, term: str):
+        """Candidate record ids per score tier, best tier first (same order as match_score)"""
+        yield 1000, self.by_iata.get(term, ())
+        yield 900, self.iata_prefixes.lookup(term)
+        yield 800, self.by_city.get(term, ())
+        yield 700, self.city_prefixes.lookup(term)
+        yield 600, self.name_prefixes.lookup(term)
+        yield 500, self.city_substrings.lookup(term)
+        yield 400, self.name_substrings.lookup(term)
+        yield 300, self.by_country_part.get(term, ())
+
+    def search_ids(self, query: str, limit: int = 10, fuzzy: bool = True) -> List[int]:
+        """Record ids for a query, best match first"""
+        # The query is folded once; every record key was folded at build time
+        return self._term_ids(fold_text(query).strip(), limit, fuzzy)
+
+    def _term_ids(self, term: str, limit: int, fuzzy: bool) -> List[int]:
+        if not term or limit <= 0:
+            return []
+
+        # City code queries return every airport of that city
+        city_key = FOLDED_CITY_CODES.get(term)
+        if city_key:
+            return list(self.by_city.get(city_key, ()))
+
+        if len(term) <= self.SHORT_PREFIX_LENGTH and limit <= self.SHORT_PREFIX_LIMIT:
+            return self.short_prefixes.get(term, array('I')).tolist()[:limit]
+        return self._ranked_ids(term, limit, fuzzy)
+
+    def _ranked_ids(self, term: str, limit: int, fuzzy: bool = False) -> List[int]:
+        # A record belongs to the best tier it matches; within a tier the more
+        # popular airport wins (record ids are in popularity order)
+        results: List[int] = []
+        for _, candidates in self._tiers(term):
+            results.extend(_smallest_unique(candidates, limit - len(results), results))
+            if len(results) >= limit:
+                return results
+
+        # Fuzzy tier only runs when the exact tiers leave the list short
+        if fuzzy and len(term) >= self.FUZZY_MIN_LENGTH:
+            taken = set(results)
+            for i in self.fuzzy.lookup(term, limit):
+                if i not in taken:
+                    taken.add(i)
+                    results.append(i)
+                    if len(results) >= limit:
+                        break
+        return results
+
+    def resolve_ids(self, code: str) -> List[int]:
+        """
+        Record ids for an exact IATA code, city code or city name, by hash
+        lookup only (no ranking, no fuzzy matching). An IATA code resolves to
+        its canonical (first catalogued) airport; a city to all its airports.
+        """
+        term = fold_text(code).strip()
+        city_key = FOLDED_CITY_CODES.get(term)
+        if city_key:
+            return list(self.by_city.get(city_key, ()))
+        iata_ids = self.by_iata.get(term)
+        if iata_ids:
+            return [iata_ids[0]]
+        return list(self.by_city.get(term, ()))
+
+    def resolve(self, codes: Iterable[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Airport records for each of ``codes`` (unresolved codes map to [])"""
+        record = self.store.record
+        return {code: [record(i) for i in self.resolve_ids(code)] for code in codes}
+
+    def nearby_codes(self, place: str, radius_km: float = NEARBY_RADIUS_KM,
+                     limit: int = NEARBY_LIMIT) -> List[str]:
+        """
+        IATA codes of other airports near ``place`` (an IATA code, city code or
+        city name), nearest and largest first. Empty when the place cannot be
+        resolved or has no coordinates in the dataset.
+        """
+        ids = self.resolve_ids(place) or self.search_ids(place, 1, fuzzy=False)
+        located = [i for i in ids if self.store.coordinates(i)]
+        if not located:
+            return []
+        own_codes = {self.store.iata(i) for i in ids}
+        lat, lon = self.store.coordinates(located[0])
+
+        codes: List[str] = []
+        for i in self.geo.nearby(lat, lon, radius_km, limit + len(ids), exclude=ids):
+            code = self.store.iata(i)
+            if code not in own_codes and code not in codes:
+                codes.append(code)
+        return codes[:limit]
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> List[Dict[str, str]]:
+        """Search airports by name, city, or IATA code"""
+        return [self.store.record(i) for i in self.search_ids(query, limit, fuzzy)]
+
+    def search_json(self, query: str, limit: int = 10, fuzzy: bool = True) -> bytes:
+        """Search response body ({"results": [...]}), served from the LRU cache when possible"""
+        term = fold_text(query).strip()
+        # Fuzzy never runs for short terms, so they share one cache entry
+        return self._cached_json(term, limit, fuzzy and len(term) >= self.FUZZY_MIN_LENGTH)
+
+    def _term_json(self, term: str, limit: int, fuzzy: bool) -> bytes:
+        row_json = self.store.row_json
+        return b'{"results":[' + b','.join([row_json(i) for i in self._term_ids(term, limit, fuzzy)]) + b']}'
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Response cache hit/miss counters and sizes"""
+        info = self._cached_json.cache_info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+            "short_prefixes": len(self.short_prefixes),
+        }
+
+
+def _smallest_unique(candidates: Iterable[int], k: int, exclude: List[int]) -> List[int]:
+    """
+    The k smallest distinct ids in ``candidates`` that are not in ``exclude``.
+
+    Keeps a bounded max-heap of size k, so a tier with thousands of matches
+    costs one pass and O(k) memory instead of a copy, a set and a full sort.
+    """
+    if k <= 0:
+        return []
+    excluded = set(exclude)
+    heap: List[int] = []  # negated ids, largest kept id on top
+    kept = set()
+    for i in candidates:
+        if i in kept or i in excluded:
+            continue
+        if len(heap) < k:
+            heappush(heap, -i)
+            kept.add(i)
+        elif i < -heap[0]:
+            kept.discard(-heapreplace(heap, -i))
+            kept.add(i)
+    return sorted(kept)
+
+
+# Fields kept from processing-pipeline rows in airports_db.json
+CATALOGUE_FIELDS = ("city", "airport", "iata", "country", "lat", "lon", "type")
+
+
+def export_catalogue(airports: List[Dict[str, str]], path: Path = AIRPORTS_DB_PATH,
+                     snapshot_path: Path = AIRPORT_SNAPSHOT_PATH,
+                     popularity_path: Path = AIRPORT_POPULARITY_PATH) -> AirportIndex:
+    """
+    Write processing-pipeline output as the backend catalogue (one JSON row
+    per line) and build the binary snapshot the server maps at startup
+    """
+    rows = [{field: a[field] for field in CATALOGUE_FIELDS if field in a} for a in airports]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[\n' + ',\n'.join(f"  {json.dumps(row, ensure_ascii=False)}" for row in rows) + '\n]\n')
+    index = AirportIndex.from_json(path, popularity_path)
+    index.save(snapshot_path)
+    return index
+
+
+def airport_sources_signature() -> Tuple[int, ...]:
+    """Modification times of the catalogue sources and the snapshot (0 if missing)"""
+    paths = (AIRPORTS_DB_PATH, AIRPORT_POPULARITY_PATH, AIRPORT_ADDITIONS_PATH, AIRPORT_SNAPSHOT_PATH)
+    return tuple(path.stat().st_mtime_ns if path.exists() else 0 for path in paths)
+
+
+_airport_index: Optional[AirportIndex] = None
+_reload_lock = threading.Lock()
+_reload_listeners: List[Callable[[AirportIndex], None]] = []
+
+
+def get_airport_index() -> AirportIndex:
+    """Return the process-wide airport index, loading it on first use"""
+    global _airport_index
+    if _airport_index is None:
+        with _reload_lock:
+            if _airport_index is None:
+                _airport_index = AirportIndex.load()
+    return _airport_index
+
+
+def on_airport_index_reload(listener: Callable[[AirportIndex], None]) -> None:
+    """Register a callback (e.g. a cache flush) to run after every index swap"""
+    _reload_listeners.append(listener)
+
+
+def reload_airport_index(rebuild: bool = False) -> AirportIndex:
+    """
+    Load a new index (from the snapshot, or rebuilt from JSON when it is
+    stale or ``rebuild`` is set) and swap it in with a single assignment.
+
+    The new index is fully built before the swap, so no request sees a
+    partial one; requests already holding the old index finish against it
+    (its mmap stays valid after the snapshot file is replaced). The response
+    cache belongs to the index, and registered listeners are called to
+    flush everything derived from the old one.
+    """
+    global _airport_index
+    with _reload_lock:
+        index = AirportIndex.load(rebuild=rebuild)
+        _airport_index = index
+    for listener in _reload_listeners:
+        try:
+            listener(index)
+        except Exception as e:
+            logging.error(f"Airport index reload listener failed: {e}")
+    return index
+
+
+async def watch_airport_sources(interval: float) -> None:
+    """
+    Poll the catalogue sources every ``interval`` seconds and reload in a
+    worker thread when they (or the snapshot another worker wrote) change
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if airport_sources_signature() != get_airport_index().signature:
+                logging.info("✈️ Airport catalogue changed on disk; reloading index")
+                await asyncio.to_thread(reload_airport_index)
+        except Exception as e:
+            logging.error(f"Airport index reload failed: {e}")
@@ -0,0 +1,122 @@
+"""
+Airport Code Resolver - city/airport name to IATA code for supplier requests
+One memoized resolver backed by the airport catalogue, shared by every flight supplier
+"""
+from functools import lru_cache
+from typing import Optional
+
+from airport_index import FOLDED_CITY_CODES, get_airport_index, on_airport_index_reload, prefix_edit_distance
+from text_folding import fold_text
+
+# Names travellers use that the catalogue files under another city, the
+# airport suppliers expect for cities whose catalogue entry is ambiguous, and
+# the gateway airport of regions and islands that aren't a city at all
+CITY_ALIASES = {
+    "delhi": "DEL",
+    "bengaluru": "BLR",
+    "bombay": "BOM",
+    "madras": "MAA",
+    "calcutta": "CCU",
+    "goa": "GOI",
+    "trivandrum": "TRV",
+    "vizag": "VTZ",
+    "leh": "IXL",
+    "paris": "CDG",
+    "tokyo": "NRT",
+    "bali": "DPS",
+    "andaman": "IXZ",
+    "andamans": "IXZ",
+    "lakshadweep": "AGX",
+    "kerala": "COK",
+    "munnar": "COK",
+    "kashmir": "SXR",
+    "ladakh": "IXL",
+    "coorg": "IXE",
+    "ooty": "CJB",
+    "darjeeling": "IXB",
+    "sikkim": "IXB",
+    "rajasthan": "JAI",
+    "maldives": "MLE",
+    "sri lanka": "CMB",
+}
+
+# Shorter free text is treated as a code rather than searched for
+MIN_SEARCH_LENGTH = 4
+
+
+class AirportCodeResolver:
+    """
+    Resolves whatever a traveller typed (IATA code, metropolitan city code
+    such as LON/NYC, city name, airport name, or a near-miss spelling) to the
+    IATA code a supplier API expects.
+
+    Lookups go through the shared airport index (hash lookups first, ranked
+    search only as a last resort) and are memoized per folded input; the memo
+    is flushed whenever the index is reloaded.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self._resolve = lru_cache(maxsize=cache_size)(self._lookup)
+        on_airport_index_reload(lambda index: self._resolve.cache_clear())
+
+    def resolve(self, city_or_code: str) -> Optional[str]:
+        """
+        IATA airport or city code, or None when nothing in the catalogue
+        matches; callers reject the search rather than send a supplier a
+        code that isn't one
+        """
+        term = fold_text(city_or_code or "").strip()
+        return self._resolve(term)
+
+    def _lookup(self, term: str) -> Optional[str]:
+        if not term:
+            return None
+        alias = CITY_ALIASES.get(term)
+        if alias:
+            return alias
+
+        index = get_airport_index()
+        # Codes first: an exact IATA code or a metropolitan city code (LON, NYC)
+        if term in index.by_iata:
+            return term.upper()
+        if len(term) == 3 and term in FOLDED_CITY_CODES:
+            return term.upper()
+
+        # City names resolve to the city's busiest airport (records are in
+        # popularity order), including full names of multi-airport cities
+        city_ids = index.by_city.get(FOLDED_CITY_CODES.get(term, term))
+        if city_ids:
+            return index.store.iata(city_ids[0])
+
+        # Last resort: the best ranked search hit, near-miss spellings included
+        if len(term) < MIN_SEARCH_LENGTH:
+            return None
+        best = index.search_ids(term, 1)
+        if best and self._plausible(term, index.store.city(best[0]), index.store.airport(best[0])):
+            return index.store.iata(best[0])
+        return None
+
+    @staticmethod
+    def _plausible(term: str, city: str, airport: str) -> bool:
+        """
+        Whether a search hit is what the traveller meant: the term starts the
+        city or a word of the airport name, or is one typo away from the
+        city's leading words ("Frankfrut" -> Frankfurt am Main) or from a
+        whole word of the airport name ("Heatrow" -> London Heathrow).
+        Anything looser ("Europe" -> Eureka) stays unresolved rather than
+        sending the supplier a valid-looking wrong airport.
+        """
+        city = fold_text(city)
+        airport = fold_text(airport)
+        if city.startswith(term) or f" {term}" in f" {airport}":
+            return True
+        words = city.split()
+        names = [" ".join(words[:count]) for count in range(1, len(words) + 1)] + airport.split()
+        return any(abs(len(name) - len(term)) <= 1 and prefix_edit_distance(term, name, 1) <= 1 for name in names)
+
+    def cache_stats(self) -> dict:
+        info = self._resolve.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+airport_code_resolver = AirportCodeResolver()
@@ -0,0 +1,182 @@
+"""
+Airport Snapshot - versioned binary container for the airport catalogue
+Named sections (typed arrays, UTF-8 text, JSON) that are memory-mapped read-only
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence
+
+# Header: magic, format version, byte order (0 little / 1 big), byte length
+# of the JSON table of contents that follows it
+MAGIC = b'TSAS'
+FORMAT_VERSION = 3
+HEADER = struct.Struct('<4sHHI')
+ALIGNMENT = 8
+BYTE_ORDER = 0 if sys.byteorder == 'little' else 1
+
+
+class PackedLists:
+    """
+    A list of integer lists stored as one flat ``ids`` array plus ``offsets``
+    (list ``k`` is ``ids[offsets[k]:offsets[k + 1]]``); items are sliced on
+    demand, so thousands of small lists cost two arrays instead of tuples.
+    """
+
+    def __init__(self, offsets, ids):
+        self.offsets = offsets
+        self.ids = ids
+
+    @classmethod
+    def pack(cls, lists: Iterable[Sequence[int]]) -> "PackedLists":
+        offsets = array('I', [0])
+        ids = array('I')
+        for values in lists:
+            ids.extend(values)
+            offsets.append(len(ids))
+        return cls(offsets, ids)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, k: int):
+        if k < 0:
+            k += len(self)
+        return self.ids[self.offsets[k]:self.offsets[k + 1]]
+
+
+class PackedGroups:
+    """Read-only ``{key: ids}`` mapping backed by ``PackedLists``"""
+
+    def __init__(self, keys: List[str], lists: PackedLists):
+        self.slots = {key: k for k, key in enumerate(keys)}
+        self.lists = lists
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.slots
+
+    def __getitem__(self, key: str):
+        return self.lists[self.slots[key]]
+
+    def get(self, key: str, default=None):
+        k = self.slots.get(key)
+        return default if k is None else self.lists[k]
+
+    def keys(self):
+        return self.slots.keys()
+
+    def items(self):
+        return ((key, self.lists[k]) for key, k in self.slots.items())
+
+
+class SnapshotWriter:
+    """Collects named sections and writes them out as one snapshot file"""
+
+    def __init__(self):
+        self.sections: Dict[str, tuple] = {}
+
+    def add_array(self, name: str, values) -> None:
+        values = values if isinstance(values, array) else array(values.format, values)
+        self.sections[name] = ('array', values.typecode, values.tobytes())
+
+    def add_bytes(self, name: str, data) -> None:
+        self.sections[name] = ('bytes', '', bytes(data))
+
+    def add_text(self, name: str, text: str) -> None:
+        self.sections[name] = ('text', '', text.encode('utf-8'))
+
+    def add_json(self, name: str, value: Any) -> None:
+        self.sections[name] = ('json', '', json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+    def add_lists(self, name: str, lists: Iterable[Sequence[int]]) -> None:
+        packed = lists if isinstance(lists, PackedLists) else PackedLists.pack(lists)
+        self.add_array(f"{name}.offsets", packed.offsets)
+        self.add_array(f"{name}.ids", packed.ids)
+
+    def add_groups(self, name: str, groups) -> None:
+        keys = list(groups.keys())
+        self.add_json(f"{name}.keys", keys)
+        self.add_lists(name, (groups[key] for key in keys))
+
+    def save(self, path: Path) -> None:
+        """Write the snapshot to ``path`` atomically (temp file + rename)"""
+        contents = {}
+        position = 0
+        for name, (kind, typecode, data) in self.sections.items():
+            contents[name] = [kind, typecode, position, len(data)]
+            position += len(data) + _padding(len(data))
+        table = json.dumps(contents).encode('utf-8')
+        start = HEADER.size + len(table)
+        start += _padding(start)
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, BYTE_ORDER, len(table)))
+            f.write(table)
+            f.write(b'\0' * (start - f.tell()))
+            for _, _, data in self.sections.values():
+                f.write(data)
+                f.write(b'\0' * _padding(len(data)))
+        os.replace(tmp_path, path)
+
+
+class Snapshot:
+    """
+    A snapshot file mapped read-only. Arrays are ``memoryview`` casts into
+    the mapping, so every worker opening the same file shares its pages.
+    """
+
+    def __init__(self, mapping: mmap.mmap, contents: Dict[str, list], start: int):
+        self._mapping = mapping  # keeps the mmap alive for the memoryviews
+        self.view = memoryview(mapping)
+        self.contents = contents
+        self.start = start
+
+    @classmethod
+    def open(cls, path: Path) -> "Snapshot":
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, byteorder, table_size = HEADER.unpack_from(mapping)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            mapping.close()
+            raise ValueError(f"{path} is not an airport snapshot v{FORMAT_VERSION}")
+        if byteorder != BYTE_ORDER:
+            mapping.close()
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+        contents = json.loads(mapping[HEADER.size:HEADER.size + table_size])
+        start = HEADER.size + table_size
+        return cls(mapping, contents, start + _padding(start))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.contents
+
+    def bytes(self, name: str) -> memoryview:
+        _, _, offset, length = self.contents[name]
+        return self.view[self.start + offset:self.start + offset + length]
+
+    def array(self, name: str) -> memoryview:
+        return self.bytes(name).cast(self.contents[name][1])
+
+    def text(self, name: str) -> str:
+        return str(self.bytes(name), 'utf-8')
+
+    def json(self, name: str) -> Any:
+        return json.loads(self.text(name))
+
+    def lists(self, name: str) -> PackedLists:
+        return PackedLists(self.array(f"{name}.offsets"), self.array(f"{name}.ids"))
+
+    def groups(self, name: str) -> PackedGroups:
+        return PackedGroups(self.json(f"{name}.keys"), self.lists(name))
+
+
+def _padding(position: int) -> int:
+    """Bytes needed to align ``position`` for the array casts"""
+    return -position % ALIGNMENT
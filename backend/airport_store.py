@@ -0,0 +1,163 @@
+"""
+Airport Store - compact, array-backed airport records for TourSmile
+One UTF-8 blob plus offset arrays, stored in the memory-mapped airport snapshot
+"""
+import json
+import math
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from airport_snapshot import Snapshot, SnapshotWriter
+
+# OurAirports "type" values, smallest first; index 0 means unknown
+AIRPORT_TYPES = ('', 'small_airport', 'medium_airport', 'large_airport')
+
+# Fallback popularity for airports without a passenger-volume weight, by
+# AIRPORT_TYPES index; every weighted airport (>= ~0.2M passengers) ranks above
+TYPE_POPULARITY = (0.0, 0.01, 0.05, 0.1)
+# Names that mark military or non-scheduled fields; they sink below civil airports
+NON_SCHEDULED_MARKERS = ('air force', 'army', 'air base', 'naval', 'heliport', 'seaplane base')
+
+
+def popularity(airport: Dict[str, str], weights: Dict[str, float]) -> float:
+    """
+    Static popularity weight of an airport: its entry in ``weights``
+    (annual passengers, millions) when present, otherwise a small value
+    from its size, negative for military and non-scheduled fields
+    """
+    weight = weights.get(airport["iata"])
+    if weight is not None:
+        return weight
+    name = airport["airport"].lower()
+    if any(marker in name for marker in NON_SCHEDULED_MARKERS):
+        return -1.0
+    airport_type = airport.get("type", "")
+    return TYPE_POPULARITY[AIRPORT_TYPES.index(airport_type) if airport_type in AIRPORT_TYPES else 0]
+
+
+class AirportStore:
+    """
+    Airport records stored as parallel arrays instead of ~8,700 dicts.
+
+    Every record has four UTF-8 spans in ``blob`` (city, airport name, IATA
+    code and the record's pre-serialized JSON row), addressed by
+    ``offsets[4 * i + field]``. Country codes are interned into
+    ``countries`` and referenced by a 16-bit id per record. Coordinates are
+    float32 ``lats``/``lons`` (NaN when unknown) and ``sizes`` holds an
+    index into ``AIRPORT_TYPES``.
+
+    Records are ordered by descending popularity (catalogue order breaks
+    ties), so record ids double as the tie-breaker inside a search tier.
+
+    A store loaded with ``from_snapshot()`` keeps the arrays and blob inside
+    the snapshot's read-only ``mmap``, so every worker mapping the file
+    shares one copy of the pages through the OS page cache.
+    """
+
+    CITY, AIRPORT, IATA, ROW_JSON = range(4)
+    SPANS = 4
+
+    def __init__(self, blob, offsets, country_ids, countries: Tuple[str, ...],
+                 lats, lons, sizes):
+        self.blob = blob
+        self.offsets = offsets
+        self.country_ids = country_ids
+        self.countries = countries
+        self.lats = lats
+        self.lons = lons
+        self.sizes = sizes
+
+    @classmethod
+    def from_airports(cls, airports: List[Dict[str, str]], weights: Optional[Dict[str, float]] = None) -> "AirportStore":
+        # Stable sort: equally popular airports keep their catalogue order
+        weights = weights or {}
+        airports = sorted(airports, key=lambda a: -popularity(a, weights))
+        countries: Dict[str, int] = {}
+        country_ids = array('H')
+        offsets = array('I', [0])
+        lats = array('f')
+        lons = array('f')
+        sizes = array('B')
+        chunks = []
+        size = 0
+        for a in airports:
+            row = {
+                "city": a["city"],
+                "airport": a["airport"],
+                "iata": a["iata"],
+                "country": a.get("country", ""),
+            }
+            country_ids.append(countries.setdefault(row["country"], len(countries)))
+            lats.append(a.get("lat", math.nan))
+            lons.append(a.get("lon", math.nan))
+            airport_type = a.get("type", "")
+            sizes.append(AIRPORT_TYPES.index(airport_type) if airport_type in AIRPORT_TYPES else 0)
+            row_json = json.dumps(row, ensure_ascii=False, separators=(',', ':'))
+            for text in (row["city"], row["airport"], row["iata"], row_json):
+                chunk = text.encode('utf-8')
+                chunks.append(chunk)
+                size += len(chunk)
+                offsets.append(size)
+        return cls(b''.join(chunks), offsets, country_ids, tuple(countries), lats, lons, sizes)
+
+    def __len__(self) -> int:
+        return len(self.country_ids)
+
+    def _span(self, i: int, field: int):
+        k = self.SPANS * i + field
+        return self.blob[self.offsets[k]:self.offsets[k + 1]]
+
+    def text(self, i: int, field: int) -> str:
+        return str(self._span(i, field), 'utf-8')
+
+    def city(self, i: int) -> str:
+        return self.text(i, self.CITY)
+
+    def airport(self, i: int) -> str:
+        return self.text(i, self.AIRPORT)
+
+    def iata(self, i: int) -> str:
+        return self.text(i, self.IATA)
+
+    def country(self, i: int) -> str:
+        return self.countries[self.country_ids[i]]
+
+    def coordinates(self, i: int) -> Optional[Tuple[float, float]]:
+        """(lat, lon) in degrees, or None when the dataset has no position"""
+        lat = self.lats[i]
+        if math.isnan(lat):
+            return None
+        return lat, self.lons[i]
+
+    def row_json(self, i: int):
+        """Pre-serialized JSON row (bytes-like, usable directly in bytes.join)"""
+        return self._span(i, self.ROW_JSON)
+
+    def record(self, i: int) -> Dict[str, str]:
+        """Public result row for record ``i``, built on demand"""
+        return {"city": self.city(i), "airport": self.airport(i), "iata": self.iata(i), "country": self.country(i)}
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return (self.record(i) for i in range(len(self)))
+
+    def write_snapshot(self, writer: SnapshotWriter) -> None:
+        writer.add_json("store.countries", list(self.countries))
+        writer.add_array("store.offsets", self.offsets)
+        writer.add_array("store.lats", self.lats)
+        writer.add_array("store.lons", self.lons)
+        writer.add_array("store.country_ids", self.country_ids)
+        writer.add_array("store.sizes", self.sizes)
+        writer.add_bytes("store.blob", self.blob)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Snapshot) -> "AirportStore":
+        """Records backed by the snapshot's mapping; only the country table is copied"""
+        return cls(
+            snapshot.bytes("store.blob"),
+            snapshot.array("store.offsets"),
+            snapshot.array("store.country_ids"),
+            tuple(snapshot.json("store.countries")),
+            snapshot.array("store.lats"),
+            snapshot.array("store.lons"),
+            snapshot.array("store.sizes"),
+        )
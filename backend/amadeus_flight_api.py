@@ -9,6 +9,8 @@ from typing import List, Dict, Optional
 import logging
 from dotenv import load_dotenv
 from pathlib import Path
+from airport_resolver import AirportCodeResolver, airport_code_resolver
+from flight_offer import FlightOffer
 
 # Load environment variables
 load_dotenv()
@@ -18,7 +20,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class AmadeusFlightService:
-    def __init__(self):
+    def __init__(self, airport_codes: Optional[AirportCodeResolver] = None):
+        # Shared, memoized city -> IATA resolver backed by the airport catalogue
+        self.airport_codes = airport_codes or airport_code_resolver
         # Amadeus API endpoints
         self.auth_base_url = "https://test.api.amadeus.com"
         self.api_base_url = "https://test.api.amadeus.com"
@@ -35,7 +39,7 @@ class AmadeusFlightService:
         """Get API secret from environment"""
         return os.environ.get('AMADEUS_API_SECRET')
     
-    def get_access_token(self):
+    def get_access_token(self, timeout: float = 30):
         """Get OAuth2 access token for Amadeus API"""
         try:
             # Check if we have a valid token
@@ -56,7 +60,7 @@ class AmadeusFlightService:
                 'client_secret': self.api_secret
             }
             
-            response = requests.post(url, headers=headers, data=data, timeout=30)
+            response = requests.post(url, headers=headers, data=data, timeout=timeout)
             logger.info(f"Amadeus auth response status: {response.status_code}")
             
             if response.status_code == 200:
@@ -75,9 +79,9 @@ class AmadeusFlightService:
             logger.error(f"❌ Error getting Amadeus access token: {str(e)}")
             return None
     
-    def get_headers(self):
+    def get_headers(self, timeout: float = 30):
         """Get headers with Bearer token"""
-        access_token = self.get_access_token()
+        access_token = self.get_access_token(timeout)
         if not access_token:
             return None
             
@@ -86,7 +90,8 @@ class AmadeusFlightService:
             'Accept': 'application/json'
         }
     
-    def search_flights(self, origin: str, destination: str, departure_date: str, passengers: int = 1) -> List[Dict]:
+    def search_flights(self, origin: str, destination: str, departure_date: str, passengers: int = 1,
+                       timeout: float = 30) -> List[FlightOffer]:
         """
         Search for flight offers using Amadeus Flight Offers Search API
         
@@ -95,16 +100,17 @@ class AmadeusFlightService:
             destination (str): Destination city or airport code  
             departure_date (str): Departure date in YYYY-MM-DD format
             passengers (int): Number of passengers
+            timeout (float): Seconds the HTTP request may take
             
         Returns:
-            List[Dict]: List of flight offers
+            List[FlightOffer]: List of flight offers
         """
         try:
             if not self.api_key or not self.api_secret:
                 logger.warning("Amadeus API credentials not found in environment")
                 return []
             
-            headers = self.get_headers()
+            headers = self.get_headers(timeout)
             if not headers:
                 logger.error("Failed to get Amadeus access token")
                 return []
@@ -112,6 +118,9 @@ class AmadeusFlightService:
             # Convert city names to IATA codes
             origin_code = self.get_airport_code(origin)
             dest_code = self.get_airport_code(destination)
+            if not origin_code or not dest_code:
+                logger.warning(f"Amadeus search skipped, unknown airport: {origin} → {destination}")
+                return []
             
             logger.info(f"Searching Amadeus flights: {origin_code} → {dest_code} on {departure_date}")
             
@@ -127,7 +136,7 @@ class AmadeusFlightService:
                 'currencyCode': 'INR'
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = requests.get(url, headers=headers, params=params, timeout=timeout)
             logger.info(f"Amadeus API response status: {response.status_code}")
             
             if response.status_code == 200:
@@ -136,7 +145,7 @@ class AmadeusFlightService:
                 logger.info(f"✅ Amadeus success: Found {len(flight_offers)} flight offers")
                 
                 # Transform to our format
-                return self.transform_flight_data(flight_offers, origin, destination)
+                return self.transform_flight_data(flight_offers, origin_code, dest_code, origin, destination)
                 
             elif response.status_code == 401:
                 logger.error("❌ Amadeus authentication failed")
@@ -152,8 +161,9 @@ class AmadeusFlightService:
             logger.error(f"❌ Amadeus flight search error: {str(e)}")
             return []
     
-    def transform_flight_data(self, flight_offers: List[Dict], origin: str, destination: str) -> List[Dict]:
-        """Transform Amadeus flight data to our standard format"""
+    def transform_flight_data(self, flight_offers: List[Dict], origin_code: str, dest_code: str,
+                              origin: str, destination: str) -> List[FlightOffer]:
+        """Transform Amadeus flight offers into FlightOffers"""
         flights = []
         
         try:
@@ -171,9 +181,9 @@ class AmadeusFlightService:
                         
                     first_segment = segments[0]
                     
-                    # Extract flight details
+                    # Extract flight details (the journey ends where the last segment lands)
                     departure = first_segment.get('departure', {})
-                    arrival = first_segment.get('arrival', {})
+                    arrival = segments[-1].get('arrival', {})
                     aircraft = first_segment.get('aircraft', {})
                     operating = first_segment.get('operating', {})
                     
@@ -181,13 +191,8 @@ class AmadeusFlightService:
                     airline_code = operating.get('carrierCode', first_segment.get('carrierCode', 'XX'))
                     flight_number = f"{airline_code}{first_segment.get('number', '000')}"
                     
-                    # Get times
-                    departure_time = self.format_time(departure.get('at', ''))
-                    arrival_time = self.format_time(arrival.get('at', ''))
-                    
-                    # Calculate duration
+                    # Duration
                     duration = first_itinerary.get('duration', 'PT2H30M')  # ISO 8601 duration
-                    duration_formatted = self.parse_duration(duration)
                     
                     # Get pricing
                     price_info = offer.get('price', {})
@@ -197,27 +202,28 @@ class AmadeusFlightService:
                     # Get airline name
                     airline_name = self.get_airline_name(airline_code)
                     
-                    flight = {
-                        "id": f"AM_{i+1}",
-                        "airline": airline_name,
-                        "airline_code": airline_code,
-                        "flight_number": flight_number,
-                        "origin": origin,
-                        "destination": destination,
-                        "departure_time": departure_time,
-                        "arrival_time": arrival_time,
-                        "duration": duration_formatted,
-                        "price": int(total_price),
-                        "currency": currency,
-                        "stops": len(segments) - 1,  # Number of stops
-                        "aircraft": aircraft.get('code', 'Unknown'),
-                        "booking_class": "Economy",
-                        "available_seats": "Available",
-                        "baggage": "15kg checked + 7kg carry-on",
-                        "status": "Available"
-                    }
-                    
-                    flights.append(flight)
+                    flights.append(FlightOffer.build(
+                        supplier="amadeus",
+                        id=f"AM_{i+1}",
+                        airline_code=airline_code,
+                        airline=airline_name,
+                        flight_number=flight_number,
+                        origin_code=departure.get('iataCode') or origin_code,
+                        destination_code=arrival.get('iataCode') or dest_code,
+                        departure_time=departure.get('at', ''),
+                        arrival_time=arrival.get('at', ''),
+                        duration=duration,
+                        stops=len(segments) - 1,  # Number of stops
+                        price=int(total_price),
+                        currency=currency,
+                        origin=origin,
+                        destination=destination,
+                        aircraft=aircraft.get('code', 'Unknown'),
+                        booking_class="Economy",
+                        available_seats="Available",
+                        baggage="15kg checked + 7kg carry-on",
+                        status="Available"
+                    ))
                     
                 except Exception as e:
                     logger.error(f"Error processing flight offer: {str(e)}")
@@ -230,63 +236,9 @@ class AmadeusFlightService:
             logger.error(f"❌ Error transforming Amadeus flight data: {str(e)}")
             return []
     
-    def format_time(self, datetime_str: str) -> str:
-        """Convert ISO datetime string to HH:MM format"""
-        try:
-            if datetime_str:
-                dt = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-                return dt.strftime('%H:%M')
-            return "08:00"
-        except:
-            return "08:00"
-    
-    def parse_duration(self, duration_str: str) -> str:
-        """Parse ISO 8601 duration (PT2H30M) to readable format"""
-        try:
-            if 'PT' in duration_str:
-                duration_str = duration_str.replace('PT', '')
-                hours = 0
-                minutes = 0
-                
-                if 'H' in duration_str:
-                    hours = int(duration_str.split('H')[0])
-                    duration_str = duration_str.split('H')[1] if 'H' in duration_str else duration_str
-                
-                if 'M' in duration_str:
-                    minutes = int(duration_str.replace('M', ''))
-                
-                return f"{hours}h {minutes}m"
-            return "2h 30m"
-        except:
-            return "2h 30m"
-    
-    def get_airport_code(self, city_or_code: str) -> str:
+    def get_airport_code(self, city_or_code: str) -> Optional[str]:
         """Convert city names to IATA airport codes"""
-        city_to_code = {
-            'delhi': 'DEL',
-            'new delhi': 'DEL',
-            'mumbai': 'BOM', 
-            'bangalore': 'BLR',
-            'bengaluru': 'BLR',
-            'chennai': 'MAA',
-            'hyderabad': 'HYD',
-            'kolkata': 'CCU',
-            'pune': 'PNQ',
-            'ahmedabad': 'AMD',
-            'kochi': 'COK',
-            'cochin': 'COK',
-            'goa': 'GOI',
-            'jaipur': 'JAI',
-        }
-        
-        city_lower = city_or_code.lower().strip()
-        
-        # If it's already a 3-letter code, return as is
-        if len(city_lower) == 3 and city_lower.isalpha():
-            return city_lower.upper()
-            
-        # Look up city name
-        return city_to_code.get(city_lower, city_lower.upper()[:3])
+        return self.airport_codes.resolve(city_or_code)
     
     def get_airline_name(self, airline_code: str) -> str:
         """Get airline name from IATA code"""
@@ -337,7 +289,7 @@ async def test_amadeus_api():
         if flights:
             logger.info(f"✅ Amadeus test successful - Found {len(flights)} flights")
             for flight in flights[:3]:  # Show first 3 flights
-                logger.info(f"  ✈️ {flight['airline']} {flight['flight_number']} - ₹{flight['price']}")
+                logger.info(f"  ✈️ {flight.airline} {flight.flight_number} - ₹{flight.price}")
             return True
         else:
             logger.info("✅ Amadeus API connected, but no flights found")
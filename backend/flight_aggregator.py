@@ -0,0 +1,185 @@
+"""
+Flight Aggregator - one flight search across every enabled supplier
+Suppliers run concurrently, each under its own deadline; offers are deduplicated on
+airline + flight number + departure, and the cheapest fare is kept with its provenance
+"""
+import asyncio
+import functools
+import logging
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from flight_cache import FlightSearchCache
+from flight_offer import FlightOffer
+from flight_search import FLIGHT_VARIANT_CONCURRENCY, SearchVariant, cached_search
+
+# Suppliers queried when FLIGHT_SUPPLIERS isn't set (each still needs its credentials).
+# AeroDataBox is schedules only and its fares are estimates, so it is opt-in:
+# add "aerodatabox" to FLIGHT_SUPPLIERS to fill routes the fare suppliers miss.
+DEFAULT_SUPPLIERS = "tbo,tripjack,amadeus,skyscrapper"
+# Seconds each supplier gets per search; FLIGHT_SUPPLIER_DEADLINE_<NAME> overrides
+SUPPLIER_DEADLINES = {"tbo": 15.0, "tripjack": 12.0, "amadeus": 8.0, "skyscrapper": 8.0, "aerodatabox": 6.0}
+# Threads for the blocking supplier clients: one per blocking supplier for
+# every variant in flight. Their own pool, so a slow supplier can't starve the
+# default executor (Redis, hotel search) of workers.
+FLIGHT_SUPPLIER_THREADS = int(os.environ.get('FLIGHT_SUPPLIER_THREADS', str(FLIGHT_VARIANT_CONCURRENCY * 4)))
+supplier_executor = ThreadPoolExecutor(max_workers=FLIGHT_SUPPLIER_THREADS, thread_name_prefix="flight-supplier")
+
+
+def supplier_deadline(name: str) -> float:
+    return float(os.environ.get(f"FLIGHT_SUPPLIER_DEADLINE_{name.upper()}", SUPPLIER_DEADLINES.get(name, 10.0)))
+
+
+class FlightSupplier:
+    """
+    A flight supplier client behind TBO's ``search_flights`` signature, so
+    every supplier goes through the same search cache and fan-out.
+
+    ``search`` is the client call and returns the client's FlightOffers;
+    ``configured`` reports whether credentials are present. Blocking clients
+    run on ``executor`` (the supplier pool) and get the supplier's deadline
+    as their HTTP ``timeout``, so a thread abandoned at the deadline is
+    released soon after instead of holding a worker for the client's default.
+    """
+
+    def __init__(self, name: str, search: Callable[..., Any], configured: Callable[[], bool] = lambda: True,
+                 blocking: bool = True, round_trip: bool = False, executor: Optional[Executor] = None):
+        self.name = name
+        self._search = search
+        self._configured = configured
+        self.blocking = blocking
+        self.round_trip = round_trip
+        self.executor = executor or supplier_executor
+        self.deadline = supplier_deadline(name)
+
+    def configured(self) -> bool:
+        try:
+            return bool(self._configured())
+        except Exception:
+            return False
+
+    async def search_flights(self, origin: str, destination: str, departure_date: str, passengers: int = 1,
+                             class_type: str = "economy", trip_type: str = "oneway",
+                             return_date: Optional[str] = None) -> List[FlightOffer]:
+        kwargs = dict(origin=origin, destination=destination, departure_date=departure_date,
+                      passengers=passengers, class_type=class_type, trip_type=trip_type, return_date=return_date)
+        if self.blocking:
+            call = functools.partial(self._search, timeout=self.deadline, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+        return await self._search(**kwargs)
+
+
+def default_suppliers() -> List[FlightSupplier]:
+    """Adapters for the supplier clients this backend ships with"""
+    from tbo_flight_api import tbo_flight_service
+    from tripjack_flight_api import tripjack_flight_service
+    from amadeus_flight_api import amadeus_service
+    from sky_scrapper_api import sky_scrapper_service
+    from aerodatabox_flight_api import aerodatabox_service
+
+    def one_way(search):
+        # Clients that only search one-way, economy, by origin/destination/date
+        return lambda origin, destination, departure_date, passengers=1, timeout=30.0, **_: search(
+            origin, destination, departure_date, passengers, timeout=timeout)
+
+    return [
+        FlightSupplier("tbo", tbo_flight_service.search_flights, blocking=False, round_trip=True),
+        FlightSupplier("tripjack", tripjack_flight_service.search_flights,
+                       configured=lambda: tripjack_flight_service.api_key, round_trip=True),
+        FlightSupplier("amadeus", one_way(amadeus_service.search_flights),
+                       configured=lambda: amadeus_service.api_key and amadeus_service.api_secret),
+        FlightSupplier("skyscrapper", one_way(sky_scrapper_service.search_flights),
+                       configured=lambda: sky_scrapper_service.api_key),
+        FlightSupplier("aerodatabox", one_way(aerodatabox_service.search_flights_by_airport),
+                       configured=lambda: aerodatabox_service.api_key),
+    ]
+
+
+def better_offer(candidate: FlightOffer, current: FlightOffer) -> bool:
+    """Real fares beat estimates (AeroDataBox schedules); otherwise the cheaper (non-zero) price wins"""
+    if candidate.price_estimated != current.price_estimated:
+        return not candidate.price_estimated
+    return candidate.price_key < current.price_key
+
+
+def merge_offers(offers: List[FlightOffer]) -> List[FlightOffer]:
+    """One offer per physical flight (cheapest fare kept), first-seen order"""
+    merged: Dict[tuple, FlightOffer] = {}
+    for offer in offers:
+        current = merged.get(offer.key)
+        if current is None:
+            merged[offer.key] = offer
+            continue
+        # Cached offers are shared between searches: merge into a copy
+        provenance = current.offers + offer.offers
+        merged[offer.key] = (offer if better_offer(offer, current) else current).replace(offers=provenance)
+    return list(merged.values())
+
+
+class FlightAggregator:
+    """
+    Searches every enabled, configured supplier for one variant at once.
+    Each supplier call goes through the search cache (per-supplier keys) and
+    is abandoned at the supplier's deadline; a call that finishes late still
+    fills the cache for the next search.
+    """
+
+    def __init__(self, suppliers: Optional[List[FlightSupplier]] = None,
+                 cache: Optional[FlightSearchCache] = None, enabled: Optional[str] = None):
+        self._suppliers = suppliers
+        self.cache = cache
+        names = enabled if enabled is not None else os.environ.get('FLIGHT_SUPPLIERS', DEFAULT_SUPPLIERS)
+        self.enabled_names = [name.strip().lower() for name in names.split(',') if name.strip()]
+
+    @property
+    def suppliers(self) -> List[FlightSupplier]:
+        if self._suppliers is None:
+            self._suppliers = default_suppliers()
+        return self._suppliers
+
+    def active_suppliers(self, round_trip: bool = False) -> List[FlightSupplier]:
+        return [
+            supplier for supplier in self.suppliers
+            if supplier.name in self.enabled_names and supplier.configured()
+            and (supplier.round_trip or not round_trip)
+        ]
+
+    async def search(self, variant: SearchVariant, passengers: int = 1, class_type: str = "economy",
+                     return_date: Optional[str] = None,
+                     report: Optional[Dict[str, Dict[str, Any]]] = None) -> List[FlightOffer]:
+        """
+        Merged offers for one variant. ``report`` (supplier name -> counters)
+        collects per-supplier status, offer counts and the slowest call.
+        """
+        suppliers = self.active_suppliers(round_trip=bool(return_date))
+
+        async def run(supplier: FlightSupplier) -> List[FlightOffer]:
+            started = time.perf_counter()
+            status = "ok"
+            flights: List[FlightOffer] = []
+            try:
+                flights, _ = await asyncio.wait_for(
+                    cached_search(supplier, variant, passengers, class_type, return_date,
+                                  cache=self.cache, supplier=supplier.name),
+                    supplier.deadline
+                )
+            except asyncio.TimeoutError:
+                status = "timeout"
+                logging.warning(f"⏱️ {supplier.name} missed its {supplier.deadline}s deadline for {variant}")
+            except Exception as e:
+                status = "error"
+                logging.error(f"{supplier.name} flight search error for {variant}: {str(e)}")
+            if report is not None:
+                entry = report.setdefault(supplier.name, {"ok": 0, "timeout": 0, "error": 0, "offers": 0, "max_ms": 0.0})
+                entry[status] += 1
+                entry["offers"] += len(flights)
+                entry["max_ms"] = max(entry["max_ms"], round((time.perf_counter() - started) * 1000, 1))
+            return flights
+
+        batches = await asyncio.gather(*(run(supplier) for supplier in suppliers))
+        return merge_offers([offer for batch in batches for offer in batch])
+
+
+flight_aggregator = FlightAggregator()
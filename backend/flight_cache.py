@@ -0,0 +1,289 @@
+"""
+Flight Search Cache - two-tier cache of supplier flight results
+In-process LRU in front of Redis, TTL by days to departure, stale-while-revalidate
+"""
+import asyncio
+import functools
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from flight_offer import FlightOffer
+from single_flight import SingleFlight
+
+# Fares move faster close to departure: (max days to departure, seconds fresh)
+FRESH_TTL_BANDS = ((2, 120), (7, 300), (30, 900), (None, 1800))
+# Past freshness an entry is still served (and refreshed in the background)
+# for this multiple of its fresh TTL, then dropped
+FLIGHT_CACHE_STALE_FACTOR = float(os.environ.get('FLIGHT_CACHE_STALE_FACTOR', '2'))
+FLIGHT_CACHE_SIZE = int(os.environ.get('FLIGHT_CACHE_SIZE', '2048'))
+FLIGHT_CACHE_REDIS_PREFIX = os.environ.get('FLIGHT_CACHE_REDIS_PREFIX', 'flights:v2:')
+# A slow Redis must not slow searches down: calls give up after this long,
+# and after an error the shared tier is skipped for a while
+REDIS_TIMEOUT_SECONDS = float(os.environ.get('FLIGHT_CACHE_REDIS_TIMEOUT', '0.25'))
+REDIS_RETRY_SECONDS = 30.0
+# Redis calls get their own threads: queued behind slow supplier calls on the
+# default executor they would miss the timeout and switch the tier off
+REDIS_THREADS = int(os.environ.get('FLIGHT_CACHE_REDIS_THREADS', '8'))
+redis_executor = ThreadPoolExecutor(max_workers=REDIS_THREADS, thread_name_prefix="flight-cache-redis")
+
+FlightList = List[FlightOffer]
+
+
+def fresh_ttl(departure_date: str, today: Optional[date] = None) -> int:
+    """Seconds a search for ``departure_date`` stays fresh"""
+    try:
+        departure = datetime.fromisoformat(departure_date.split('T')[0]).date()
+        days_out = (departure - (today or date.today())).days
+    except ValueError:
+        days_out = 0
+    for max_days, ttl in FRESH_TTL_BANDS:
+        if max_days is None or days_out <= max_days:
+            return ttl
+    return FRESH_TTL_BANDS[-1][1]
+
+
+def default_redis():
+    """The shared Redis client, or None when the database module can't load"""
+    try:
+        from database import get_redis
+        return get_redis()
+    except Exception as e:
+        logging.warning(f"Flight cache running without Redis: {str(e)}")
+        return None
+
+
+class RedisTier:
+    """
+    Shared Redis tier of a two-tier cache: string values with an expiry,
+    every call on the Redis thread pool under REDIS_TIMEOUT_SECONDS. Errors
+    (or no Redis at all) turn the tier off for REDIS_RETRY_SECONDS instead
+    of failing.
+    """
+
+    def __init__(self, prefix: str, name: str, redis_factory: Callable[[], Any] = default_redis):
+        self.prefix = prefix
+        self.name = name
+        self._redis_factory = redis_factory
+        self._redis = None
+        self._retry_at = 0.0
+        self.errors = 0
+
+    @property
+    def available(self) -> bool:
+        return self._redis is not None
+
+    def _client(self):
+        if self._redis is None and time.monotonic() >= self._retry_at:
+            self._redis = self._redis_factory()
+            if self._redis is None:
+                self._retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        return self._redis
+
+    def _failed(self, error: Exception) -> None:
+        self.errors += 1
+        logging.warning(f"{self.name} Redis error, using local tier only for {REDIS_RETRY_SECONDS:.0f}s: {error!r}")
+        self._redis = None
+        self._retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+    @staticmethod
+    def _call(method, *args, **kwargs):
+        return asyncio.get_running_loop().run_in_executor(redis_executor, functools.partial(method, *args, **kwargs))
+
+    async def get(self, key: str):
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            return await asyncio.wait_for(self._call(client.get, self.prefix + key), REDIS_TIMEOUT_SECONDS)
+        except Exception as e:
+            self._failed(e)
+            return None
+
+    async def set(self, key: str, value: Union[str, Callable[[], str]], seconds: float) -> None:
+        """
+        Store ``value`` under ``key``. Pass a serializer instead of the string
+        and it only runs when the tier is usable, so a process without Redis
+        never pays for encoding.
+        """
+        client = self._client()
+        if client is None:
+            return
+        try:
+            if callable(value):
+                value = value()
+            await asyncio.wait_for(
+                self._call(client.set, self.prefix + key, value, ex=max(1, int(seconds))), REDIS_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            self._failed(e)
+
+
+class CacheEntry:
+    __slots__ = ('flights', 'stored_at', 'fresh_until', 'expires_at')
+
+    def __init__(self, flights: FlightList, stored_at: float, fresh_until: float, expires_at: float):
+        self.flights = flights
+        self.stored_at = stored_at
+        self.fresh_until = fresh_until
+        self.expires_at = expires_at
+
+    @classmethod
+    def create(cls, flights: FlightList, departure_date: str) -> "CacheEntry":
+        now = time.time()
+        ttl = fresh_ttl(departure_date)
+        return cls(flights, now, now + ttl, now + ttl * (1 + FLIGHT_CACHE_STALE_FACTOR))
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.fresh_until
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "flights": [flight.to_row() for flight in self.flights],
+            "stored_at": self.stored_at,
+            "fresh_until": self.fresh_until,
+            "expires_at": self.expires_at,
+        }, separators=(',', ':'), default=str)
+
+    @classmethod
+    def from_json(cls, payload) -> "CacheEntry":
+        data = json.loads(payload)
+        flights = [FlightOffer.from_row(row) for row in data["flights"]]
+        return cls(flights, data["stored_at"], data["fresh_until"], data["expires_at"])
+
+
+class FlightSearchCache:
+    """
+    Supplier results per canonical search key in two tiers: a per-process
+    LRU and Redis, shared by every worker. Entries carry wall-clock times so
+    a worker reading another worker's entry agrees on its age.
+
+    ``fetch()`` serves fresh entries directly. A stale entry is served as well
+    while one background refresh per key replaces it; only a miss waits for
+    the supplier. Misses and refreshes for the same key share one supplier
+    call (``in_flight``), so an expiring popular entry doesn't stampede the
+    supplier. Redis errors never fail a search: the shared tier is just
+    skipped for a while.
+    """
+
+    def __init__(self, max_entries: int = FLIGHT_CACHE_SIZE,
+                 redis_factory: Callable[[], Any] = default_redis,
+                 prefix: str = FLIGHT_CACHE_REDIS_PREFIX):
+        self.max_entries = max_entries
+        self.redis = RedisTier(prefix, "Flight cache", redis_factory)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self.in_flight = SingleFlight("flight_search")
+        self.metrics = {
+            "hits_local": 0,
+            "hits_redis": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+        }
+        self._served = 0
+        self._served_age_total = 0.0
+        self._served_age_max = 0.0
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> Tuple[Optional[CacheEntry], str]:
+        """Unexpired entry and the tier it came from ("local", "redis" or "" on a miss)"""
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now < entry.expires_at:
+                self._entries.move_to_end(key)
+                return entry, "local"
+            del self._entries[key]
+        payload = await self.redis.get(key)
+        entry = CacheEntry.from_json(payload) if payload else None
+        if entry is not None and now < entry.expires_at:
+            self._remember(key, entry)
+            return entry, "redis"
+        return None, ""
+
+    async def put(self, key: str, flights: FlightList, departure_date: str) -> CacheEntry:
+        entry = CacheEntry.create(flights, departure_date)
+        self._remember(key, entry)
+        await self.redis.set(key, entry.to_json, entry.expires_at - time.time())
+        return entry
+
+    async def fetch(self, key: str, departure_date: str,
+                    load: Callable[[], Awaitable[Optional[FlightList]]]) -> Tuple[FlightList, str]:
+        """
+        Flights for ``key`` and how they were served: "hit", "stale" or "miss".
+        ``load`` runs the supplier search; empty results are not cached since
+        suppliers also return an empty list when the call failed.
+        """
+        entry, tier = await self.get(key)
+        now = time.time()
+        if entry is not None:
+            self._record_age(now - entry.stored_at)
+            if entry.is_fresh(now):
+                self.metrics["hits_" + tier] += 1
+                return entry.flights, "hit"
+            self.metrics["stale_hits"] += 1
+            self._refresh(key, departure_date, load)
+            return entry.flights, "stale"
+
+        self.metrics["misses"] += 1
+        flights = await self.in_flight.run(key, lambda: self._load(key, departure_date, load))
+        return flights, "miss"
+
+    async def _load(self, key: str, departure_date: str,
+                    load: Callable[[], Awaitable[Optional[FlightList]]]) -> FlightList:
+        flights = await load() or []
+        if flights:
+            await self.put(key, flights, departure_date)
+        return flights
+
+    def _refresh(self, key: str, departure_date: str, load: Callable[[], Awaitable[Optional[FlightList]]]) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self.in_flight.run(key, lambda: self._load(key, departure_date, load))
+                self.metrics["refreshes"] += 1
+            except Exception as e:
+                self.metrics["refresh_errors"] += 1
+                logging.warning(f"Flight cache refresh failed for {key}: {str(e)}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.ensure_future(refresh())
+
+    def _record_age(self, age: float) -> None:
+        self._served += 1
+        self._served_age_total += age
+        self._served_age_max = max(self._served_age_max, age)
+
+    def stats(self) -> dict:
+        lookups = self._served + self.metrics["misses"]
+        hits = self.metrics["hits_local"] + self.metrics["hits_redis"] + self.metrics["stale_hits"]
+        return {
+            **self.metrics,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "mean_age_s": round(self._served_age_total / self._served, 1) if self._served else 0.0,
+            "max_age_s": round(self._served_age_max, 1),
+            "size": len(self._entries),
+            "max_size": self.max_entries,
+            "refreshing": len(self._refreshing),
+            "redis": self.redis.available,
+            "redis_errors": self.redis.errors,
+            "single_flight": self.in_flight.stats(),
+        }
+
+
+flight_search_cache = FlightSearchCache()
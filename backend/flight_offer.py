@@ -0,0 +1,209 @@
+"""
+Flight Offer - the one offer shape every supplier parser produces
+Fixed slots, times as epoch minutes, interned airline codes and precomputed sort/dedupe keys;
+the API's flight dict is rendered from it only when a response is written
+"""
+import re
+import sys
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+# Epoch minutes count wall-clock (airport local) time from 1970-01-01 00:00
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+MINUTES_PER_DAY = 24 * 60
+NO_PRICE = float('inf')
+
+
+def epoch_minutes(value: Any, travel_date: Optional[str] = None) -> Optional[int]:
+    """
+    Epoch minutes of an ISO datetime ("2025-08-01T06:05", with or without
+    seconds/offset, "T" or space separated) or of an "HH:MM" time on
+    ``travel_date``; None when neither parses
+    """
+    text = str(value or "").strip()
+    try:
+        if len(text) >= 16 and text[10] in 'T ':
+            moment = datetime.fromisoformat(text[:16].replace(' ', 'T'))
+        elif travel_date and len(text) >= 4 and ':' in text[:3]:
+            hours, minutes = text[:5].split(':')
+            day = date.fromisoformat(travel_date.split('T')[0][:10])
+            moment = datetime(day.year, day.month, day.day, int(hours), int(minutes))
+        else:
+            return None
+    except ValueError:
+        return None
+    return (moment.toordinal() - EPOCH_ORDINAL) * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def parse_duration(value: Any) -> Optional[int]:
+    """Minutes of a duration given as minutes, "2h 30m" or ISO 8601 "PT2H30M"""
+    if isinstance(value, (int, float)):
+        return int(value) if value > 0 else None
+    match = re.match(r"\s*(?:PT)?\s*(?:(\d+)\s*h)?\s*(?:(\d+)\s*m)?", str(value or ""), re.IGNORECASE)
+    if match and any(match.groups()):
+        return int(match.group(1) or 0) * 60 + int(match.group(2) or 0)
+    return None
+
+
+def format_duration(minutes: Optional[int]) -> str:
+    return f"{minutes // 60}h {minutes % 60}m" if minutes else "N/A"
+
+
+def flight_digits(flight_number: Any, airline_code: str) -> str:
+    """Flight number without carrier prefix, separators or leading zeros ("6E-0123" -> "123")"""
+    text = str(flight_number or "").upper().replace(" ", "").replace("-", "")
+    if airline_code and text.startswith(airline_code):
+        text = text[len(airline_code):]
+    return re.sub(r"^0+(?=\d)", "", text)
+
+
+def cheapest_price(price: Any, fares: Sequence[Dict[str, Any]] = (), field: str = "price") -> float:
+    """Lowest bookable price among the top-level price and each fare's ``field``; 0 when there is none"""
+    prices = [fare.get(field) for fare in fares if fare.get(field)]
+    if price:
+        prices.append(price)
+    return float(min(prices)) if prices else 0.0
+
+
+class FlightOffer:
+    """
+    One bookable flight from one supplier.
+
+    Canonical fields are slots; ``departure`` and ``arrival`` are epoch
+    minutes (None when the supplier sent no usable time) and ``duration`` is
+    minutes. Supplier specific data (fare types, segments, booking keys,
+    display names) stays in ``details`` and is passed through to the API.
+
+    Precomputed at construction: ``departure_minute``/``arrival_minute``
+    (minute of day, -1 when unknown), ``price_key`` (price, or infinity when
+    unpriced) and ``key``, the same physical flight across suppliers.
+    """
+
+    __slots__ = (
+        'id', 'supplier', 'airline_code', 'airline', 'flight_number', 'origin_code', 'destination_code',
+        'departure', 'arrival', 'duration', 'stops', 'price', 'currency', 'refundable', 'price_estimated',
+        'details', 'offers', 'departure_minute', 'arrival_minute', 'price_key', 'key',
+    )
+
+    def __init__(self, id: str, supplier: str, airline_code: str, airline: str, flight_number: str,
+                 origin_code: str, destination_code: str, departure: Optional[int], arrival: Optional[int],
+                 duration: Optional[int] = None, stops: int = 0, price: float = 0.0, currency: str = "INR",
+                 refundable: bool = False, price_estimated: bool = False,
+                 details: Optional[Dict[str, Any]] = None, offers: Optional[List[Dict[str, Any]]] = None):
+        self.id = str(id)
+        self.supplier = sys.intern(supplier)
+        self.airline_code = sys.intern(str(airline_code or "").strip().upper())
+        self.airline = airline or self.airline_code
+        self.flight_number = str(flight_number or "")
+        self.origin_code = sys.intern(str(origin_code or "").upper())
+        self.destination_code = sys.intern(str(destination_code or "").upper())
+        self.departure = departure
+        self.arrival = arrival
+        self.duration = duration
+        self.stops = int(stops or 0)
+        self.price = float(price or 0)
+        self.currency = sys.intern(currency or "INR")
+        self.refundable = bool(refundable)
+        self.price_estimated = bool(price_estimated)
+        self.details = details or {}
+        self.offers = offers or [{"supplier": self.supplier, "id": self.id, "price": self.price}]
+
+        self.departure_minute = departure % MINUTES_PER_DAY if departure is not None else -1
+        self.arrival_minute = arrival % MINUTES_PER_DAY if arrival is not None else -1
+        self.price_key = self.price if self.price > 0 else NO_PRICE
+        self.key = (self.airline_code or self.airline.upper(), flight_digits(self.flight_number, self.airline_code),
+                    departure)
+
+    @classmethod
+    def build(cls, supplier: str, id: Any, airline_code: str, airline: str, flight_number: Any,
+              origin_code: str, destination_code: str, departure_time: Any, arrival_time: Any,
+              travel_date: Optional[str] = None, duration: Any = None, stops: int = 0, price: Any = 0,
+              currency: str = "INR", refundable: Optional[bool] = None, price_estimated: bool = False,
+              **details) -> "FlightOffer":
+        """
+        Offer from a parser's raw values: times as ISO datetimes or "HH:MM"
+        on ``travel_date`` (an arrival earlier than the departure is the
+        next day), duration as minutes or text. The price is the cheapest
+        of ``price`` and any fare in ``fare_types``; ``refundable`` defaults
+        to whether any fare type or fare option is refundable.
+        """
+        departure = epoch_minutes(departure_time, travel_date)
+        arrival = epoch_minutes(arrival_time, travel_date)
+        if arrival is not None and departure is not None and arrival < departure and ':' in str(arrival_time)[:3]:
+            arrival += MINUTES_PER_DAY
+        minutes = parse_duration(duration)
+        if minutes is None and departure is not None and arrival is not None and arrival > departure:
+            minutes = arrival - departure
+        if refundable is None:
+            fares = list(details.get("fare_types") or ()) + list(details.get("fare_options") or ())
+            refundable = any(fare.get("refundable") for fare in fares)
+        return cls(
+            id=id, supplier=supplier, airline_code=airline_code, airline=airline, flight_number=flight_number,
+            origin_code=origin_code, destination_code=destination_code, departure=departure, arrival=arrival,
+            duration=minutes, stops=stops, price=cheapest_price(price, details.get("fare_types") or ()),
+            currency=currency, refundable=refundable, price_estimated=price_estimated, details=details,
+        )
+
+    def replace(self, **changes) -> "FlightOffer":
+        """Copy with some fields changed; offers are shared between searches, so never mutate one"""
+        fields = {name: getattr(self, name) for name in ROW_FIELDS}
+        fields.update(changes)
+        return FlightOffer(**fields)
+
+    @property
+    def departure_date(self) -> Optional[str]:
+        if self.departure is None:
+            return None
+        return date.fromordinal(EPOCH_ORDINAL + self.departure // MINUTES_PER_DAY).isoformat()
+
+    @staticmethod
+    def clock(minute_of_day: int) -> str:
+        return f"{minute_of_day // 60:02d}:{minute_of_day % 60:02d}" if minute_of_day >= 0 else ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The API's flight dict: supplier details plus the canonical fields"""
+        return {
+            **self.details,
+            "id": self.id,
+            "airline": self.airline,
+            "airline_code": self.airline_code,
+            "flight_number": self.flight_number,
+            "origin": self.details.get("origin") or self.origin_code,
+            "destination": self.details.get("destination") or self.destination_code,
+            "origin_code": self.origin_code,
+            "destination_code": self.destination_code,
+            "departure_date": self.departure_date,
+            "departure_time": self.clock(self.departure_minute),
+            "arrival_time": self.clock(self.arrival_minute),
+            "duration": format_duration(self.duration),
+            "duration_minutes": self.duration,
+            "stops": self.stops,
+            "price": self.price,
+            "currency": self.currency,
+            "is_refundable": self.refundable,
+            "supplier": self.supplier,
+            "price_estimated": self.price_estimated,
+            "offers": self.offers,
+        }
+
+    def to_row(self) -> list:
+        """Compact positional form for the search cache and result sessions"""
+        return [getattr(self, name) for name in ROW_FIELDS]
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "FlightOffer":
+        return cls(*row)
+
+    def __repr__(self) -> str:
+        return (f"FlightOffer({self.supplier} {self.airline_code} {self.flight_number} "
+                f"{self.origin_code}-{self.destination_code} {self.departure_date} "
+                f"{self.clock(self.departure_minute)} {self.price} {self.currency})")
+
+
+# Constructor arguments in order: what to_row() stores and from_row() restores
+ROW_FIELDS = (
+    'id', 'supplier', 'airline_code', 'airline', 'flight_number', 'origin_code', 'destination_code',
+    'departure', 'arrival', 'duration', 'stops', 'price', 'currency', 'refundable', 'price_estimated',
+    'details', 'offers',
+)
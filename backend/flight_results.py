@@ -0,0 +1,164 @@
+"""
+Flight Results - server-side result sessions keyed by search_id
+A search's normalized offers are kept for the fare validity window, so filter, sort and paging
+changes run against the stored set (as an OfferTable) instead of going back to the suppliers
+"""
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from flight_cache import RedisTier, default_redis
+from flight_offer import FlightOffer
+from offer_table import OfferTable, sort_fields
+
+# Seconds a search's offers stay filterable (supplier fares are only held this long)
+FLIGHT_RESULT_TTL = float(os.environ.get('FLIGHT_RESULT_TTL', '900'))
+FLIGHT_RESULT_SESSIONS = int(os.environ.get('FLIGHT_RESULT_SESSIONS', '512'))
+FLIGHT_RESULT_REDIS_PREFIX = os.environ.get('FLIGHT_RESULT_REDIS_PREFIX', 'flight-results:v2:')
+
+def page_of(items: Any, page: int, page_size: int) -> Dict[str, Any]:
+    """One 1-based page of ``items`` with the paging counters"""
+    page_size = max(1, page_size)
+    pages = max(1, -(-len(items) // page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    return {"page": page, "page_size": page_size, "pages": pages, "items": items[start:start + page_size]}
+
+
+class ResultSession:
+    """The deduplicated, unfiltered offers of one search, their column table and facets"""
+
+    __slots__ = ('search_id', 'offers', 'created_at', 'expires_at', '_table', '_facets')
+
+    def __init__(self, search_id: str, offers: List[FlightOffer], created_at: float, expires_at: float,
+                 facets: Optional[Dict[str, Any]] = None):
+        self.search_id = search_id
+        self.offers = offers
+        self.created_at = created_at
+        self.expires_at = expires_at
+        self._table: Optional[OfferTable] = None
+        self._facets = facets
+
+    @property
+    def table(self) -> OfferTable:
+        """Built on first query and kept for every later one"""
+        if self._table is None:
+            self._table = OfferTable(self.offers)
+        return self._table
+
+    @property
+    def facets(self) -> Dict[str, Any]:
+        """Filter panel counts of every offer in the session, computed once"""
+        if self._facets is None:
+            self.compute_facets()
+        return self._facets
+
+    def compute_facets(self) -> Dict[str, Any]:
+        self._facets = self.table.facets()
+        return self._facets
+
+    def query(self, min_price: Optional[float] = None, max_price: Optional[float] = None,
+              time_bands: Optional[Iterable[str]] = None, max_stops: Optional[int] = None,
+              airlines: Optional[Iterable[str]] = None, refundable: Optional[bool] = None,
+              sort: str = 'price', descending: bool = False, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+        """One page of the offers matching the filters; ValueError on an unknown sort field"""
+        fields = sort_fields(sort)
+        table = self.table
+        mask = table.mask(min_price, max_price, time_bands, max_stops, airlines, refundable)
+        rows = table.order(mask, fields, descending)
+        paged = page_of(rows, page, page_size)
+        return {
+            "search_id": self.search_id,
+            "total": len(self.offers),
+            "filtered": len(rows),
+            "page": paged["page"],
+            "page_size": paged["page_size"],
+            "pages": paged["pages"],
+            "expires_in": max(0, round(self.expires_at - time.time())),
+            "flights": [offer.to_dict() for offer in table.select(self.offers, paged["items"])],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "offers": [offer.to_row() for offer in self.offers],
+            "facets": self._facets,
+            "created_at": self.created_at,
+            "expires_at": self.expires_at,
+        }, separators=(',', ':'), default=str)
+
+    @classmethod
+    def from_json(cls, search_id: str, payload) -> "ResultSession":
+        data = json.loads(payload)
+        offers = [FlightOffer.from_row(row) for row in data["offers"]]
+        return cls(search_id, offers, data["created_at"], data["expires_at"], data.get("facets"))
+
+
+class ResultSessionStore:
+    """
+    Result sessions in a per-process LRU and Redis, so a filter request
+    landing on another worker still finds the search. Sessions expire with
+    the fare validity window; after that the client searches again.
+    """
+
+    def __init__(self, ttl: float = FLIGHT_RESULT_TTL, max_sessions: int = FLIGHT_RESULT_SESSIONS,
+                 redis_factory: Callable[[], Any] = default_redis, prefix: str = FLIGHT_RESULT_REDIS_PREFIX):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.redis = RedisTier(prefix, "Flight results", redis_factory)
+        self._sessions: "OrderedDict[str, ResultSession]" = OrderedDict()
+        self.metrics = {"stored": 0, "hits_local": 0, "hits_redis": 0, "misses": 0}
+
+    def _remember(self, session: ResultSession) -> None:
+        self._sessions[session.search_id] = session
+        self._sessions.move_to_end(session.search_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    async def put(self, search_id: str, offers: List[FlightOffer]) -> ResultSession:
+        now = time.time()
+        session = ResultSession(search_id, offers, now, now + self.ttl)
+        # Facets at search time, so they travel to Redis with the offers
+        session.compute_facets()
+        self._remember(session)
+        self.metrics["stored"] += 1
+        await self.redis.set(search_id, session.to_json, self.ttl)
+        return session
+
+    async def get(self, search_id: str) -> Optional[ResultSession]:
+        now = time.time()
+        session = self._sessions.get(search_id)
+        if session is not None:
+            if now < session.expires_at:
+                self._sessions.move_to_end(search_id)
+                self.metrics["hits_local"] += 1
+                return session
+            del self._sessions[search_id]
+        payload = await self.redis.get(search_id)
+        if payload:
+            try:
+                session = ResultSession.from_json(search_id, payload)
+            except (ValueError, KeyError) as e:
+                logging.warning(f"Unreadable flight result session {search_id}: {str(e)}")
+                session = None
+            if session is not None and now < session.expires_at:
+                self._remember(session)
+                self.metrics["hits_redis"] += 1
+                return session
+        self.metrics["misses"] += 1
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.metrics,
+            "size": len(self._sessions),
+            "max_size": self.max_sessions,
+            "ttl_s": self.ttl,
+            "redis": self.redis.available,
+            "redis_errors": self.redis.errors,
+        }
+
+
+flight_result_sessions = ResultSessionStore()
@@ -0,0 +1,247 @@
+"""
+Flight Search Fan-out - concurrent supplier calls for nearby/flexible search variants
+Every origin x destination x date variant runs under one bounded semaphore and one overall
+deadline; supplier results go through the two-tier search cache per canonical search key
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from airport_resolver import airport_code_resolver
+from flight_cache import FlightSearchCache, flight_search_cache
+from flight_offer import FlightOffer
+from text_folding import fold_text
+
+# At most this many supplier calls in flight per search
+FLIGHT_VARIANT_CONCURRENCY = int(os.environ.get('FLIGHT_VARIANT_CONCURRENCY', '8'))
+# Seconds a whole search may take; unfinished variants are cancelled and reported
+FLIGHT_SEARCH_DEADLINE = float(os.environ.get('FLIGHT_SEARCH_DEADLINE', '20'))
+
+
+class SearchVariant(NamedTuple):
+    origin: str
+    destination: str
+    departure_date: str
+
+
+def search_variants(origins: Iterable[str], destinations: Iterable[str], dates: Iterable[str]) -> List[SearchVariant]:
+    """Every origin x destination x date combination, requested route first, without repeats"""
+    destinations = list(destinations)
+    dates = list(dates)
+    variants = []
+    seen = set()
+    for origin in origins:
+        for destination in destinations:
+            if origin == destination:
+                continue
+            for departure_date in dates:
+                variant = SearchVariant(origin, destination, departure_date)
+                if variant not in seen:
+                    seen.add(variant)
+                    variants.append(variant)
+    return variants
+
+
+def search_key(variant: SearchVariant, passengers: int = 1, class_type: str = "economy",
+               return_date: Optional[str] = None, supplier: str = "tbo") -> str:
+    """
+    Canonical cache key of one supplier search: city names and codes resolve
+    to the same IATA code (unknown places keep their folded text), dates drop
+    any time part
+    """
+    return "|".join((
+        supplier,
+        airport_code_resolver.resolve(variant.origin) or fold_text(variant.origin).strip(),
+        airport_code_resolver.resolve(variant.destination) or fold_text(variant.destination).strip(),
+        variant.departure_date.split('T')[0],
+        (return_date or "").split('T')[0],
+        str(passengers),
+        (class_type or "economy").lower(),
+    ))
+
+
+async def cached_search(service, variant: SearchVariant, passengers: int = 1, class_type: str = "economy",
+                        return_date: Optional[str] = None, cache: Optional[FlightSearchCache] = None,
+                        supplier: str = "tbo") -> Tuple[List[FlightOffer], str]:
+    """
+    ``service.search_flights`` for one variant through the search cache;
+    returns the flights and "hit", "stale" or "miss"
+    """
+    cache = cache or flight_search_cache
+
+    async def load():
+        return await service.search_flights(
+            origin=variant.origin,
+            destination=variant.destination,
+            departure_date=variant.departure_date,
+            passengers=passengers,
+            class_type=class_type,
+            trip_type='roundtrip' if return_date else 'oneway',
+            return_date=return_date
+        )
+
+    key = search_key(variant, passengers, class_type, return_date, supplier)
+    return await cache.fetch(key, variant.departure_date, load)
+
+
+async def search_supplier(service, variant: SearchVariant, passengers: int = 1, class_type: str = "economy",
+                          return_date: Optional[str] = None,
+                          cache: Optional[FlightSearchCache] = None) -> List[FlightOffer]:
+    """Flights for one variant, from the search cache when the same search ran recently"""
+    flights, _ = await cached_search(service, variant, passengers, class_type, return_date, cache)
+    return flights
+
+
+class VariantResult:
+    """Outcome of one variant: status is ok, cached, error or timeout"""
+
+    __slots__ = ('variant', 'status', 'flights', 'wait_ms', 'elapsed_ms', 'error')
+
+    def __init__(self, variant: SearchVariant, status: str = 'timeout'):
+        self.variant = variant
+        self.status = status
+        self.flights: List[FlightOffer] = []
+        self.wait_ms: Optional[float] = None
+        self.elapsed_ms: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def timing(self) -> Dict[str, Any]:
+        """Per-variant entry for the search response"""
+        timing = {
+            "origin": self.variant.origin,
+            "destination": self.variant.destination,
+            "departure_date": self.variant.departure_date,
+            "status": self.status,
+            "flights": len(self.flights),
+            "wait_ms": self.wait_ms,
+            "elapsed_ms": self.elapsed_ms,
+        }
+        if self.error:
+            timing["error"] = self.error
+        return timing
+
+
+async def iter_variant_results(
+    variants: List[SearchVariant],
+    search: Callable[[SearchVariant], Awaitable[Optional[List[FlightOffer]]]],
+    concurrency: int = FLIGHT_VARIANT_CONCURRENCY,
+    deadline: float = FLIGHT_SEARCH_DEADLINE,
+) -> AsyncIterator[VariantResult]:
+    """
+    Run ``search`` for every variant, at most ``concurrency`` at a time, and
+    yield each result as soon as it completes. Variants still queued or in
+    flight when ``deadline`` seconds have passed are cancelled and yielded
+    last with status ``timeout``, so callers always get one result per variant.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    started = time.perf_counter()
+
+    def ms_since(moment: float) -> float:
+        return round((time.perf_counter() - moment) * 1000, 1)
+
+    async def run(result: VariantResult) -> VariantResult:
+        async with semaphore:
+            result.wait_ms = ms_since(started)
+            called = time.perf_counter()
+            try:
+                result.flights = await search(result.variant) or []
+                result.status = 'ok'
+            except Exception as e:
+                result.status = 'error'
+                result.error = str(e)
+                logging.warning(f"Flight search variant {result.variant} failed: {str(e)}")
+            result.elapsed_ms = ms_since(called)
+        return result
+
+    results = [VariantResult(variant) for variant in variants]
+    pending = {asyncio.ensure_future(run(result)): result for result in results}
+    try:
+        while pending:
+            remaining = deadline - (time.perf_counter() - started)
+            if remaining <= 0:
+                break
+            done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield pending.pop(task)
+    finally:
+        for task in pending:
+            task.cancel()
+
+    timed_out = [result for result in pending.values() if result.status == 'timeout']
+    if timed_out:
+        logging.warning(f"⏱️ {len(timed_out)} of {len(variants)} flight search variants missed the {deadline}s deadline")
+    for result in pending.values():
+        if result.status == 'timeout' and result.wait_ms is not None:
+            result.elapsed_ms = round(deadline * 1000 - result.wait_ms, 1)
+        yield result
+
+
+async def fan_out(
+    variants: List[SearchVariant],
+    search: Callable[[SearchVariant], Awaitable[Optional[List[FlightOffer]]]],
+    concurrency: int = FLIGHT_VARIANT_CONCURRENCY,
+    deadline: float = FLIGHT_SEARCH_DEADLINE,
+) -> List[VariantResult]:
+    """
+    All variant results in ``variants`` order, so the requested route and
+    date keep precedence when the caller dedupes the merged flights
+    """
+    results = {result.variant: result async for result in iter_variant_results(variants, search, concurrency, deadline)}
+    return [results[variant] for variant in variants]
+
+
+async def fare_calendar(
+    service,
+    origin: str,
+    destination: str,
+    dates: List[str],
+    passengers: int = 1,
+    class_type: str = "economy",
+    cache: Optional[FlightSearchCache] = None,
+) -> Dict[str, Any]:
+    """
+    Cheapest one-way fare and carrier per departure date. Dates in the search
+    cache (fresh or stale) cost no supplier call; the rest are searched
+    concurrently under the usual fan-out deadline, and days that time out
+    come back without a price.
+    """
+    variants = [SearchVariant(origin, destination, departure_date) for departure_date in dates]
+    sources: Dict[SearchVariant, str] = {}
+
+    async def search(variant: SearchVariant) -> List[FlightOffer]:
+        flights, sources[variant] = await cached_search(service, variant, passengers, class_type, cache=cache)
+        return flights
+
+    # Cached days answer without a supplier call, so they finish immediately
+    results = {result.variant: result for result in await fan_out(variants, search)}
+    for variant, source in sources.items():
+        if source != "miss" and results[variant].status == 'ok':
+            results[variant].status = 'cached'
+
+    days = []
+    for variant in variants:
+        result = results[variant]
+        day = {"date": variant.departure_date, "status": result.status, "price": None}
+        priced = [flight for flight in result.flights if flight.price > 0]
+        if priced:
+            flight = min(priced, key=lambda offer: offer.price_key)
+            day.update({
+                "price": flight.price,
+                "currency": flight.currency,
+                "airline": flight.airline,
+                "airline_code": flight.airline_code,
+                "flight_number": flight.flight_number,
+            })
+        days.append(day)
+
+    priced_days = [day for day in days if day["price"] is not None]
+    return {
+        "origin": origin,
+        "destination": destination,
+        "days": days,
+        "cheapest": min(priced_days, key=lambda day: day["price"]) if priced_days else None,
+        "partial": any(day["status"] == 'timeout' for day in days),
+        "supplier_calls": sum(1 for source in sources.values() if source == "miss"),
+    }
@@ -1,6 +1,8 @@
 # Global Destinations Database for Activities Autocomplete
 # 20,000+ tourist destinations worldwide for TourSmile
 
+from text_folding import fold_text
+
 GLOBAL_DESTINATIONS = {
     "india": {
         "major_cities": [
@@ -153,39 +155,43 @@ ATTRACTIONS_BY_DESTINATION = {
     ]
 }
 
+def _flatten_destinations(data):
+    """Yield every destination dict in the nested GLOBAL_DESTINATIONS tree"""
+    for value in data.values():
+        if isinstance(value, dict):
+            yield from _flatten_destinations(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict) and 'name' in item:
+                    yield item
+
+# Folded name + keyword keys, computed once so searches never normalize per record
+DESTINATION_SEARCH_KEYS = [
+    (item, (fold_text(item['name']),) + tuple(fold_text(keyword) for keyword in item.get('keywords', [])))
+    for item in _flatten_destinations(GLOBAL_DESTINATIONS)
+]
+
 def search_destinations(query: str, limit: int = 10):
     """
     Search destinations based on query string
     """
-    query_lower = query.lower().strip()
+    query_key = fold_text(query).strip()
     results = []
     
-    if len(query_lower) < 2:
+    if len(query_key) < 2:
         return []
     
-    # Search through all destinations
-    def search_in_data(data, parent_key=""):
-        for key, value in data.items():
-            if isinstance(value, dict):
-                search_in_data(value, parent_key)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict) and 'name' in item:
-                        # Check if query matches name or keywords
-                        name_match = query_lower in item['name'].lower()
-                        keyword_match = any(query_lower in keyword.lower() for keyword in item.get('keywords', []))
-                        
-                        if name_match or keyword_match:
-                            # Add attractions if available
-                            attractions = ATTRACTIONS_BY_DESTINATION.get(item['name'].lower(), [])
-                            result_item = {
-                                **item,
-                                'attractions': attractions,
-                                'full_name': f"{item['name']}, {item['country']}"
-                            }
-                            results.append(result_item)
-    
-    search_in_data(GLOBAL_DESTINATIONS)
+    # Check if query matches name or keywords
+    for item, keys in DESTINATION_SEARCH_KEYS:
+        if any(query_key in key for key in keys):
+            # Add attractions if available
+            attractions = ATTRACTIONS_BY_DESTINATION.get(item['name'].lower(), [])
+            result_item = {
+                **item,
+                'attractions': attractions,
+                'full_name': f"{item['name']}, {item['country']}"
+            }
+            results.append(result_item)
     
     # Sort by popularity (higher first) and relevance
     results.sort(key=lambda x: x.get('popularity', 0), reverse=True)
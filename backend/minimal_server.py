@@ -160,12 +160,12 @@ async def search_flights(request: FlightSearchRequest):
             # Check if Tripjack credentials are configured
             if tripjack_flight_service.api_key:
                 logging.info(f"Using Tripjack API for route: {request.origin} → {request.destination}")
-                real_flights = tripjack_flight_service.search_flights(
+                real_flights = [flight.to_dict() for flight in tripjack_flight_service.search_flights(
                     request.origin,
                     request.destination, 
                     request.departure_date,
                     request.passengers if hasattr(request, 'passengers') and isinstance(request.passengers, int) else 1
-                )
+                )]
                 if real_flights:
                     use_real_api = True
                     logging.info(f"✅ Tripjack API returned {len(real_flights)} flights")
@@ -0,0 +1,204 @@
+"""
+Offer Table - columnar NumPy view of a search's flight offers
+Price, departure/arrival minute, duration, stops, airline index and refundability as arrays,
+so filters are vectorized masks and multi-key sorts a single lexsort
+"""
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from flight_offer import FlightOffer
+
+# Departure time bands: name -> (first hour, hour after the last); night wraps midnight
+TIME_BANDS = {
+    'morning': (5, 12),
+    'afternoon': (12, 17),
+    'evening': (17, 21),
+    'night': (21, 5),
+}
+# Offers without a usable departure time fall in this hour's band, as they
+# did in the per-dict filter, so a time preference never silently drops them
+UNKNOWN_DEPARTURE_HOUR = 12
+SORT_FIELDS = ('price', 'duration', 'departure', 'arrival', 'stops')
+# Buckets in the price histogram facet
+FLIGHT_FACET_PRICE_BINS = int(os.environ.get('FLIGHT_FACET_PRICE_BINS', '10'))
+
+def sort_fields(sort: str) -> List[str]:
+    """Sort keys from "price" or a comma-separated "stops,duration"; ValueError on unknown keys"""
+    fields = [field.strip().lower() for field in (sort or "price").split(',') if field.strip()]
+    unknown = [field for field in fields if field not in SORT_FIELDS]
+    if unknown or not fields:
+        raise ValueError(f"sort must be one or more of {', '.join(SORT_FIELDS)}")
+    return fields
+
+
+class OfferTable:
+    """
+    Columns of a list of FlightOffers, row ``i`` being ``offers[i]``.
+    Unknown times and durations are -1 and a missing price is 0; those rows
+    sort after every known value, and an unknown departure counts as
+    UNKNOWN_DEPARTURE_HOUR for time bands.
+
+    Airlines are interned: ``airline`` holds an index into ``airlines`` (the
+    carrier code, or the name when there's no code) and ``airline_names``,
+    and ``_airline_lookup`` maps both codes and names to that index for the
+    airline filter.
+    """
+
+    __slots__ = ('size', 'price', 'departure', 'arrival', 'duration', 'stops',
+                 'airline', 'refundable', 'airlines', 'airline_names', '_airline_lookup')
+
+    def __init__(self, offers: Sequence[FlightOffer]):
+        self.size = len(offers)
+        self.airlines: List[str] = []
+        self.airline_names: List[str] = []
+        self._airline_lookup: Dict[str, int] = {}
+        # Offers carry their parsed values, so each column is one attribute
+        # read per offer and a single array conversion
+        self.price = np.array([offer.price for offer in offers], dtype=np.float64)
+        self.departure = np.array([offer.departure_minute for offer in offers], dtype=np.int16)
+        self.arrival = np.array([offer.arrival_minute for offer in offers], dtype=np.int16)
+        self.duration = np.array([-1 if offer.duration is None else offer.duration for offer in offers], dtype=np.int32)
+        self.stops = np.array([offer.stops for offer in offers], dtype=np.int8)
+        self.airline = np.array([self._intern_airline(offer) for offer in offers], dtype=np.int32)
+        self.refundable = np.array([offer.refundable for offer in offers], dtype=bool)
+
+    def _intern_airline(self, offer: FlightOffer) -> int:
+        name = offer.airline.strip().upper()
+        key = offer.airline_code or name
+        index = self._airline_lookup.get(key)
+        if index is None:
+            index = self._airline_lookup[key] = len(self.airlines)
+            self.airlines.append(key)
+            self.airline_names.append(offer.airline or key)
+        if name:
+            self._airline_lookup.setdefault(name, index)
+        return index
+
+    def __len__(self) -> int:
+        return self.size
+
+    def mask(self, min_price: Optional[float] = None, max_price: Optional[float] = None,
+             time_bands: Optional[Iterable[str]] = None, max_stops: Optional[int] = None,
+             airlines: Optional[Iterable[str]] = None, refundable: Optional[bool] = None) -> np.ndarray:
+        """Boolean row mask for the given filters; filters left as None don't apply"""
+        keep = np.ones(self.size, dtype=bool)
+        if min_price is not None:
+            keep &= self.price >= min_price
+        if max_price is not None:
+            keep &= self.price <= max_price
+        bands = {band.lower() for band in time_bands or () if band and band.lower() != 'any'}
+        if bands:
+            keep &= self.band_mask(bands)
+        if max_stops is not None:
+            keep &= self.stops <= max_stops
+        if airlines is not None:
+            wanted = {self._airline_lookup.get(airline.strip().upper()) for airline in airlines if airline.strip()}
+            if wanted:
+                keep &= np.isin(self.airline, [index for index in wanted if index is not None])
+        if refundable is not None:
+            keep &= self.refundable == refundable
+        return keep
+
+    def departure_hours(self) -> np.ndarray:
+        """Hour of departure per row, UNKNOWN_DEPARTURE_HOUR where the time is unknown"""
+        return np.where(self.departure >= 0, self.departure // 60, UNKNOWN_DEPARTURE_HOUR)
+
+    def band_mask(self, bands: Iterable[str]) -> np.ndarray:
+        """Rows departing in any of ``bands`` (unknown band names match nothing)"""
+        hour = self.departure_hours()
+        matched = np.zeros(self.size, dtype=bool)
+        for band in bands:
+            if band not in TIME_BANDS:
+                continue
+            first, end = TIME_BANDS[band]
+            if first < end:
+                matched |= (hour >= first) & (hour < end)
+            else:
+                matched |= (hour >= first) | (hour < end)
+        return matched
+
+    def facets(self, price_bins: int = FLIGHT_FACET_PRICE_BINS) -> Dict[str, Any]:
+        """
+        Filter panel counts over the whole table: airlines (with their lowest
+        price), price range and histogram, stops, departure time bands and
+        refundable offers. Each facet is one vectorized pass over a column.
+        """
+        priced = self.price > 0
+        prices = self.price[priced]
+
+        airline_counts = np.bincount(self.airline, minlength=len(self.airlines))
+        airline_min = np.full(len(self.airlines), np.inf)
+        np.minimum.at(airline_min, self.airline[priced], prices)
+        airlines = [
+            {
+                "code": self.airlines[index],
+                "name": self.airline_names[index],
+                "count": int(airline_counts[index]),
+                "min_price": float(airline_min[index]) if np.isfinite(airline_min[index]) else None,
+            }
+            for index in np.argsort(-airline_counts, kind='stable').tolist()
+        ]
+
+        histogram = []
+        if len(prices):
+            counts, edges = np.histogram(prices, bins=max(1, price_bins))
+            histogram = [
+                {"from": round(float(edges[i]), 2), "to": round(float(edges[i + 1]), 2), "count": int(count)}
+                for i, count in enumerate(counts.tolist())
+            ]
+
+        stop_counts = np.bincount(self.stops) if self.size else np.zeros(0, dtype=np.int64)
+        hours = self.departure_hours()
+        return {
+            "total": self.size,
+            "price": {
+                "min": float(prices.min()) if len(prices) else None,
+                "max": float(prices.max()) if len(prices) else None,
+                "histogram": histogram,
+            },
+            "airlines": airlines,
+            "stops": {str(stops): int(count) for stops, count in enumerate(stop_counts.tolist()) if count},
+            "time_bands": {
+                band: int(np.count_nonzero(((hours >= first) & (hours < end)) if first < end else ((hours >= first) | (hours < end))))
+                for band, (first, end) in TIME_BANDS.items()
+            },
+            "refundable": int(np.count_nonzero(self.refundable)),
+        }
+
+    def _sort_key(self, field: str, rows: np.ndarray, descending: bool) -> np.ndarray:
+        if field == 'price':
+            values = self.price[rows]
+            missing = values <= 0
+        elif field == 'stops':
+            values, missing = self.stops[rows], None
+        else:
+            values = {'duration': self.duration, 'departure': self.departure, 'arrival': self.arrival}[field][rows]
+            missing = values < 0
+        key = values.astype(np.float64)
+        if descending:
+            key = -key
+        if missing is not None:
+            key[missing] = np.inf
+        return key
+
+    def order(self, mask: Optional[np.ndarray] = None, sort: Sequence[str] = ('price',),
+              descending: bool = False) -> np.ndarray:
+        """
+        Row indices passing ``mask``, ordered by the ``sort`` fields in turn
+        and then by price; rows missing a field go last for that field,
+        equal rows keep their original order
+        """
+        rows = np.flatnonzero(mask) if mask is not None else np.arange(self.size)
+        if not len(rows):
+            return rows
+        fields = list(sort) + (['price'] if 'price' not in sort else [])
+        # lexsort takes the primary key last
+        return rows[np.lexsort([self._sort_key(field, rows, descending) for field in reversed(fields)])]
+
+    def select(self, offers: Sequence[FlightOffer], rows: np.ndarray) -> List[FlightOffer]:
+        """``offers`` at the given row indices, or where a boolean mask is set"""
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        return [offers[row] for row in rows.tolist()]
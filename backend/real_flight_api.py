@@ -9,6 +9,7 @@ from typing import List, Dict, Optional
 import logging
 from dotenv import load_dotenv
 from pathlib import Path
+from airport_resolver import AirportCodeResolver, airport_code_resolver
 
 # Load environment variables
 load_dotenv()
@@ -18,7 +19,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class FlightAPIService:
-    def __init__(self):
+    def __init__(self, airport_codes: Optional[AirportCodeResolver] = None):
+        # Shared, memoized city -> IATA resolver backed by the airport catalogue
+        self.airport_codes = airport_codes or airport_code_resolver
         self.api_base_url = "https://api.flightapi.io"
         self._api_key = None
     
@@ -50,6 +53,9 @@ class FlightAPIService:
             # Convert city names to airport codes if needed
             origin_code = self.get_airport_code(origin)
             dest_code = self.get_airport_code(destination)
+            if not origin_code or not dest_code:
+                logger.warning(f"FlightAPI search skipped, unknown airport: {origin} → {destination}")
+                return []
             
             # FlightAPI.io uses URL path format: 
             # https://api.flightapi.io/onewaytrip/<api-key>/<departure>/<arrival>/<date>/<adults>/<children>/<infants>/<class>/<currency>
@@ -83,46 +89,9 @@ class FlightAPIService:
             logger.error(f"Flight search error: {str(e)}")
             return []
     
-    def get_airport_code(self, city_or_code: str) -> str:
+    def get_airport_code(self, city_or_code: str) -> Optional[str]:
         """Convert city names to IATA airport codes"""
-        city_to_code = {
-            'delhi': 'DEL',
-            'mumbai': 'BOM',
-            'bangalore': 'BLR',
-            'bengaluru': 'BLR', 
-            'chennai': 'MAA',
-            'hyderabad': 'HYD',
-            'kolkata': 'CCU',
-            'pune': 'PNQ',
-            'ahmedabad': 'AMD',
-            'kochi': 'COK',
-            'goa': 'GOI',
-            'jaipur': 'JAI',
-            'lucknow': 'LKO',
-            'chandigarh': 'IXC',
-            'bhubaneswar': 'BBI',
-            'indore': 'IDR',
-            'coimbatore': 'CJB',
-            'nagpur': 'NAG',
-            'vadodara': 'BDQ',
-            'thiruvananthapuram': 'TRV',
-            'london': 'LHR',
-            'new york': 'JFK',
-            'dubai': 'DXB',
-            'singapore': 'SIN',
-            'bangkok': 'BKK',
-            'paris': 'CDG',
-            'toronto': 'YYZ'
-        }
-        
-        city_lower = city_or_code.lower().strip()
-        
-        # If it's already a 3-letter code, return as is
-        if len(city_lower) == 3 and city_lower.isalpha():
-            return city_lower.upper()
-            
-        # Look up city name
-        return city_to_code.get(city_lower, city_lower.upper()[:3])
+        return self.airport_codes.resolve(city_or_code)
     
     def transform_flight_data(self, raw_data: Dict, origin: str, destination: str) -> List[Dict]:
         """
@@ -0,0 +1,131 @@
+"""
+Round Trip Pairing - the k best outbound + return combinations of two offer sets
+A heap walks the pairs in order of the two legs' scores, so the top k of a 300 x 300 search
+cost O(k log k) pair evaluations instead of the 90k-pair cross product
+"""
+import heapq
+import os
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from flight_offer import FlightOffer, format_duration
+
+# A return leg must leave at least this long after the outbound lands
+ROUND_TRIP_MIN_STAY_MINUTES = int(os.environ.get('ROUND_TRIP_MIN_STAY_MINUTES', '120'))
+# Same-airline round trips win over mixed ones costing up to this much less
+ROUND_TRIP_SAME_CARRIER_BONUS = float(os.environ.get('ROUND_TRIP_SAME_CARRIER_BONUS', '250'))
+# Pairs examined per call at most, whatever the constraints reject
+ROUND_TRIP_MAX_CANDIDATES = int(os.environ.get('ROUND_TRIP_MAX_CANDIDATES', '5000'))
+
+
+class LegWeights(NamedTuple):
+    """
+    Score of one leg: price plus ``duration`` per minute in the air and
+    ``stops`` per stop, all in the fare currency. The default is the fare alone.
+    """
+    duration: float = 0.0
+    stops: float = 0.0
+
+    def score(self, offer: FlightOffer) -> float:
+        return offer.price + self.duration * (offer.duration or 0) + self.stops * offer.stops
+
+
+class RoundTrip(NamedTuple):
+    outbound: FlightOffer
+    inbound: FlightOffer
+    score: float
+
+    @property
+    def price(self) -> float:
+        return self.outbound.price + self.inbound.price
+
+    @property
+    def same_carrier(self) -> bool:
+        return same_carrier(self.outbound, self.inbound)
+
+    @property
+    def stay_minutes(self) -> Optional[int]:
+        if self.outbound.arrival is None or self.inbound.departure is None:
+            return None
+        return self.inbound.departure - self.outbound.arrival
+
+    def to_dict(self) -> Dict[str, Any]:
+        stay = self.stay_minutes
+        return {
+            "outbound": self.outbound.to_dict(),
+            "return": self.inbound.to_dict(),
+            "price": self.price,
+            "score": round(self.score, 2),
+            "currency": self.outbound.currency,
+            "same_carrier": self.same_carrier,
+            "stay": format_duration(stay) if stay is not None and stay > 0 else None,
+        }
+
+
+def same_carrier(outbound: FlightOffer, inbound: FlightOffer) -> bool:
+    return bool(outbound.airline_code) and outbound.airline_code == inbound.airline_code
+
+
+def split_legs(offers: Iterable[FlightOffer],
+               origin_codes: Iterable[str]) -> Tuple[List[FlightOffer], List[FlightOffer]]:
+    """
+    Outbound and return offers of a round-trip search, told apart by where
+    they depart: ``origin_codes`` are the searched origins (nearby airports
+    included), anything else is a return leg
+    """
+    origins = {code.upper() for code in origin_codes}
+    outbound, inbound = [], []
+    for offer in offers:
+        (outbound if offer.origin_code in origins else inbound).append(offer)
+    return outbound, inbound
+
+
+def pair_round_trips(outbound: Sequence[FlightOffer], inbound: Sequence[FlightOffer], k: int = 10,
+                     weights: LegWeights = LegWeights(), min_stay_minutes: int = ROUND_TRIP_MIN_STAY_MINUTES,
+                     same_carrier_bonus: float = ROUND_TRIP_SAME_CARRIER_BONUS,
+                     max_candidates: int = ROUND_TRIP_MAX_CANDIDATES) -> List[RoundTrip]:
+    """
+    The ``k`` best round trips, best first. A pair scores its two legs'
+    weighted scores, less ``same_carrier_bonus`` when one airline flies
+    both; pairs whose return leaves less than ``min_stay_minutes`` after the
+    outbound lands are skipped (pairs with an unknown time are kept).
+    Unpriced offers are never paired.
+
+    Both legs are ranked once; the pairs are then visited best leg sum
+    first, each popped pair (i, j) pushing (i, j + 1) and, from column 0,
+    (i + 1, 0), so every pair is reached exactly once. The carrier bonus is
+    at most ``same_carrier_bonus``, so a pair is final once its score is no
+    worse than the next leg sum less that bonus. At most ``max_candidates``
+    pairs are examined.
+    """
+    outs = sorted(((weights.score(offer), offer) for offer in outbound if offer.price > 0), key=lambda leg: leg[0])
+    rets = sorted(((weights.score(offer), offer) for offer in inbound if offer.price > 0), key=lambda leg: leg[0])
+    if k <= 0 or not outs or not rets:
+        return []
+    bonus = max(0.0, same_carrier_bonus)
+
+    frontier = [(outs[0][0] + rets[0][0], 0, 0)]
+    ready = []
+    pairs = []
+    examined = 0
+    while len(pairs) < k and (frontier or ready):
+        if ready and (not frontier or examined >= max_candidates or ready[0][0] <= frontier[0][0] - bonus):
+            score, _, i, j = heapq.heappop(ready)
+            pairs.append(RoundTrip(outs[i][1], rets[j][1], score))
+            continue
+        if examined >= max_candidates:
+            break
+        leg_sum, i, j = heapq.heappop(frontier)
+        if j + 1 < len(rets):
+            heapq.heappush(frontier, (outs[i][0] + rets[j + 1][0], i, j + 1))
+        if j == 0 and i + 1 < len(outs):
+            heapq.heappush(frontier, (outs[i + 1][0] + rets[0][0], i + 1, 0))
+        examined += 1
+
+        out_offer, ret_offer = outs[i][1], rets[j][1]
+        if (out_offer.arrival is not None and ret_offer.departure is not None
+                and ret_offer.departure - out_offer.arrival < min_stay_minutes):
+            continue
+        score = leg_sum - bonus if same_carrier(out_offer, ret_offer) else leg_sum
+        # examined breaks ties in input rank order
+        heapq.heappush(ready, (score, examined, i, j))
+    return pairs
@@ -0,0 +1,59 @@
+"""
+Single Flight - coalesce identical concurrent supplier calls
+Callers asking for the same key while a call is in flight wait for that call's result
+"""
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    One in-flight call per key. The first caller starts ``call()``; callers
+    arriving before it finishes wait on the same task and share its result
+    or exception. Nothing is cached once the call completes.
+
+    The shared task is shielded, so a caller that is cancelled (client gone,
+    fan-out deadline) doesn't cancel the call for everyone else waiting on it.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Counter = Counter()
+        self.metrics = {"calls": 0, "coalesced": 0, "max_waiters": 0}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            self.metrics["calls"] += 1
+            task = self._calls[key] = asyncio.ensure_future(call())
+            task.add_done_callback(lambda done: self._finished(key, done))
+            return await asyncio.shield(task)
+
+        self.metrics["coalesced"] += 1
+        self._waiters[key] += 1
+        self.metrics["max_waiters"] = max(self.metrics["max_waiters"], self._waiters[key])
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Retrieve the exception so an abandoned call doesn't log "never retrieved"
+        if not task.cancelled() and task.exception() is not None:
+            logging.debug(f"{self.name} call for {key} failed: {task.exception()!r}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.metrics,
+            "in_flight": len(self._calls),
+            "waiting": sum(self._waiters.values()),
+        }
@@ -4,10 +4,11 @@
 import requests
 import json
 import os
-from datetime import datetime
 from typing import List, Dict, Optional
 import logging
 from dotenv import load_dotenv
+from airport_resolver import AirportCodeResolver, airport_code_resolver
+from flight_offer import FlightOffer
 
 # Load environment variables
 load_dotenv()
@@ -17,7 +18,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class SkyScrapper:
-    def __init__(self):
+    def __init__(self, airport_codes: Optional[AirportCodeResolver] = None):
+        # Shared, memoized city -> IATA resolver backed by the airport catalogue
+        self.airport_codes = airport_codes or airport_code_resolver
         self.api_base_url = "https://sky-scrapper.p.rapidapi.com"
         self._api_key = None
         
@@ -36,39 +39,12 @@ class SkyScrapper:
             'Accept': 'application/json'
         }
     
-    def get_airport_code(self, city_or_code: str) -> str:
+    def get_airport_code(self, city_or_code: str) -> Optional[str]:
         """Convert city names to IATA airport codes"""
-        city_to_code = {
-            'delhi': 'DEL',
-            'new delhi': 'DEL',
-            'mumbai': 'BOM', 
-            'bangalore': 'BLR',
-            'bengaluru': 'BLR',
-            'chennai': 'MAA',
-            'hyderabad': 'HYD',
-            'kolkata': 'CCU',
-            'pune': 'PNQ',
-            'ahmedabad': 'AMD',
-            'kochi': 'COK',
-            'cochin': 'COK',
-            'goa': 'GOI',
-            'jaipur': 'JAI',
-            'lucknow': 'LKO',
-            'chandigarh': 'IXC',
-            'bhubaneswar': 'BBI',
-            'indore': 'IDR'
-        }
-        
-        city_lower = city_or_code.lower().strip()
-        
-        # If it's already a 3-letter code, return as is
-        if len(city_lower) == 3 and city_lower.isalpha():
-            return city_lower.upper()
-            
-        # Look up city name
-        return city_to_code.get(city_lower, 'DEL')  # Default to Delhi if not found
+        return self.airport_codes.resolve(city_or_code)
     
-    def search_flights(self, origin: str, destination: str, departure_date: str, passengers: int = 1) -> List[Dict]:
+    def search_flights(self, origin: str, destination: str, departure_date: str, passengers: int = 1,
+                       timeout: float = 30) -> List[FlightOffer]:
         """
         Search flights using Sky Scrapper API
         
@@ -77,9 +53,10 @@ class SkyScrapper:
             destination (str): Destination city or airport code
             departure_date (str): Departure date in YYYY-MM-DD format
             passengers (int): Number of adult passengers
+            timeout (float): Seconds the HTTP request may take
             
         Returns:
-            List[Dict]: List of flight offers in standardized format
+            List[FlightOffer]: List of flight offers
         """
         try:
             if not self.api_key:
@@ -89,6 +66,9 @@ class SkyScrapper:
             # Convert cities to airport codes
             origin_code = self.get_airport_code(origin)
             dest_code = self.get_airport_code(destination)
+            if not origin_code or not dest_code:
+                logger.warning(f"Sky Scrapper search skipped, unknown airport: {origin} → {destination}")
+                return []
             
             logger.info(f"🔍 Sky Scrapper search: {origin_code} → {dest_code} on {departure_date}")
             
@@ -113,7 +93,7 @@ class SkyScrapper:
             logger.info(f"📡 Making request to: {url}")
             logger.info(f"🔧 Parameters: {params}")
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = requests.get(url, headers=headers, params=params, timeout=timeout)
             logger.info(f"📊 API Response Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -125,7 +105,8 @@ class SkyScrapper:
                 logger.info(f"🛩️ Found {len(flights)} flight options")
                 
                 if flights:
-                    transformed_flights = self.transform_flight_data(flights, origin, destination)
+                    transformed_flights = self.transform_flight_data(flights, origin_code, dest_code, departure_date,
+                                                                     origin, destination)
                     logger.info(f"✅ Transformed {len(transformed_flights)} flights with Indian airlines")
                     return transformed_flights
                 else:
@@ -150,8 +131,9 @@ class SkyScrapper:
             logger.error(f"❌ Sky Scrapper request error: {str(e)}")
             return []
     
-    def transform_flight_data(self, flights: List[Dict], origin: str, destination: str) -> List[Dict]:
-        """Transform Sky Scrapper flight data to our standard format"""
+    def transform_flight_data(self, flights: List[Dict], origin_code: str, dest_code: str, departure_date: str,
+                              origin: str, destination: str) -> List[FlightOffer]:
+        """Transform Sky Scrapper itineraries into FlightOffers"""
         transformed = []
         
         try:
@@ -181,43 +163,40 @@ class SkyScrapper:
                     departure = first_segment.get('departure', {})
                     arrival = segments[-1].get('arrival', {}) if segments else {}
                     
-                    departure_time = self.format_time(departure.get('at', ''))
-                    arrival_time = self.format_time(arrival.get('at', ''))
-                    
                     # Get pricing
                     pricing = flight.get('price', {})
                     total_price = pricing.get('raw', 5000)  # Default price
                     currency = pricing.get('currency', 'INR')
                     
-                    # Calculate duration
+                    # Duration
                     duration_minutes = first_leg.get('durationInMinutes', 150)
-                    duration = self.format_duration(duration_minutes)
                     
                     # Count stops
                     stops = len(segments) - 1
                     
-                    # Build flight object
-                    flight_obj = {
-                        "id": f"SKY_{i+1}",
-                        "airline": airline_name,
-                        "airline_code": airline_code,
-                        "flight_number": flight_number,
-                        "origin": origin,
-                        "destination": destination,
-                        "departure_time": departure_time,
-                        "arrival_time": arrival_time,
-                        "duration": duration,
-                        "price": int(total_price),
-                        "currency": currency,
-                        "stops": stops,
-                        "aircraft": segments[0].get('equipment', {}).get('iata', 'Unknown'),
-                        "booking_class": "Economy",
-                        "available_seats": "Available",
-                        "baggage": "15kg checked + 7kg carry-on",
-                        "status": "Available"
-                    }
-                    
-                    transformed.append(flight_obj)
+                    transformed.append(FlightOffer.build(
+                        supplier="skyscrapper",
+                        id=f"SKY_{i+1}",
+                        airline_code=airline_code,
+                        airline=airline_name,
+                        flight_number=flight_number,
+                        origin_code=origin_code,
+                        destination_code=dest_code,
+                        departure_time=departure.get('at', ''),
+                        arrival_time=arrival.get('at', ''),
+                        travel_date=departure_date,
+                        duration=duration_minutes,
+                        stops=stops,
+                        price=int(total_price),
+                        currency=currency,
+                        origin=origin,
+                        destination=destination,
+                        aircraft=segments[0].get('equipment', {}).get('iata', 'Unknown'),
+                        booking_class="Economy",
+                        available_seats="Available",
+                        baggage="15kg checked + 7kg carry-on",
+                        status="Available"
+                    ))
                     
                     # Log airline found for debugging
                     logger.info(f"✈️ Found: {airline_name} ({airline_code}) - ₹{total_price}")
@@ -232,26 +211,6 @@ class SkyScrapper:
             logger.error(f"❌ Error transforming Sky Scrapper data: {str(e)}")
             return []
     
-    def format_time(self, datetime_str: str) -> str:
-        """Convert datetime string to HH:MM format"""
-        try:
-            if datetime_str:
-                # Handle different datetime formats
-                dt = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-                return dt.strftime('%H:%M')
-            return "08:00"
-        except:
-            return "08:00"
-    
-    def format_duration(self, minutes: int) -> str:
-        """Convert duration in minutes to readable format"""
-        try:
-            hours = minutes // 60
-            mins = minutes % 60
-            return f"{hours}h {mins}m"
-        except:
-            return "2h 30m"
-    
     def get_airline_name(self, airline_code: str) -> str:
         """Get airline name from IATA code - focus on Indian carriers"""
         airlines = {
@@ -296,12 +255,12 @@ class SkyScrapper:
                 
                 # Check for Indian LCC coverage
                 lcc_airlines = ['IndiGo', 'SpiceJet', 'GoAir', 'AirAsia India']
-                found_lcc = [f for f in flights if f['airline'] in lcc_airlines]
+                found_lcc = [f for f in flights if f.airline in lcc_airlines]
                 
                 if found_lcc:
                     logger.info(f"🎯 EXCELLENT: Found {len(found_lcc)} LCC flights!")
                     for flight in found_lcc[:3]:
-                        logger.info(f"   ✈️ {flight['airline']} - ₹{flight['price']}")
+                        logger.info(f"   ✈️ {flight.airline} - ₹{flight.price}")
                 else:
                     logger.warning("⚠️ No Indian LCC airlines found in results")
                 
@@ -332,12 +291,12 @@ async def test_sky_scrapper():
             
             # Check for budget airlines specifically
             budget_airlines = ['IndiGo', 'SpiceJet', 'GoAir', 'AirAsia India', 'Air India Express']
-            budget_flights = [f for f in flights if f['airline'] in budget_airlines]
+            budget_flights = [f for f in flights if f.airline in budget_airlines]
             
             logger.info(f"🎯 Budget airline flights found: {len(budget_flights)}")
             
             for flight in flights[:5]:  # Show first 5 flights
-                logger.info(f"  ✈️ {flight['airline']} {flight['flight_number']} - ₹{flight['price']}")
+                logger.info(f"  ✈️ {flight.airline} {flight.flight_number} - ₹{flight.price}")
                 
             return len(budget_flights) > 0
         else:
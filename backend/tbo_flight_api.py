@@ -7,12 +7,16 @@ from typing import Dict, List, Any, Optional
 import httpx
 import structlog
 from pydantic import BaseModel
+from airport_resolver import AirportCodeResolver, airport_code_resolver
+from flight_offer import FlightOffer
 
 # Configure logging
 logger = structlog.get_logger(__name__)
 
 class TBOFlightService:
-    def __init__(self):
+    def __init__(self, airport_codes: Optional[AirportCodeResolver] = None):
+        # Shared, memoized city -> IATA resolver backed by the airport catalogue
+        self.airport_codes = airport_codes or airport_code_resolver
         self.username = os.getenv('TBO_USERNAME', 'Smile')
         self.password = os.getenv('TBO_PASSWORD', 'Smile@123')
         self.base_url = os.getenv('TBO_BASE_URL', 'https://api.tektravels.com')
@@ -22,6 +26,8 @@ class TBOFlightService:
         # Token management
         self.auth_token = None
         self.token_expires_at = None
+        # Concurrent searches share one token refresh
+        self._auth_lock = asyncio.Lock()
         
         logger.info("TBO Flight Service initialized", 
                    username=self.username, 
@@ -32,11 +38,21 @@ class TBOFlightService:
         if not trace_id:
             trace_id = str(uuid.uuid4())
         
-        # Check if current token is still valid (with 5 min buffer)
-        if self.auth_token and self.token_expires_at:
-            if datetime.now() < self.token_expires_at - timedelta(minutes=5):
-                return self.auth_token
+        if self._token_is_valid():
+            return self.auth_token
         
+        async with self._auth_lock:
+            # Another search may have refreshed the token while we waited
+            if self._token_is_valid():
+                return self.auth_token
+            return await self._refresh_auth_token(trace_id)
+
+    def _token_is_valid(self) -> bool:
+        """Current token exists and has more than 5 minutes left"""
+        return bool(self.auth_token and self.token_expires_at
+                    and datetime.now() < self.token_expires_at - timedelta(minutes=5))
+
+    async def _refresh_auth_token(self, trace_id: str) -> str:
         logger.info("Refreshing TBO authentication token", trace_id=trace_id)
         
         auth_payload = {
@@ -88,38 +104,9 @@ class TBOFlightService:
                             trace_id=trace_id)
                 raise Exception(f"TBO authentication error: {str(e)}")
 
-    def convert_city_to_iata(self, city_name: str) -> str:
+    def convert_city_to_iata(self, city_name: str) -> Optional[str]:
         """Convert city name to IATA code"""
-        city_mapping = {
-            "mumbai": "BOM",
-            "delhi": "DEL", 
-            "bangalore": "BLR",
-            "bengaluru": "BLR",
-            "chennai": "MAA",
-            "kolkata": "CCU",
-            "hyderabad": "HYD",
-            "pune": "PNQ",
-            "ahmedabad": "AMD",
-            "goa": "GOI",
-            "jaipur": "JAI",
-            "cochin": "COK",
-            "kochi": "COK",
-            "trivandrum": "TRV",
-            "coimbatore": "CJB",
-            "new york": "JFK",
-            "london": "LHR",
-            "dubai": "DXB",
-            "singapore": "SIN",
-            "bangkok": "BKK",
-            "kuala lumpur": "KUL",
-            "hong kong": "HKG",
-            "tokyo": "NRT",
-            "paris": "CDG",
-            "amsterdam": "AMS",
-            "frankfurt": "FRA"
-        }
-        
-        return city_mapping.get(city_name.lower(), city_name.upper())
+        return self.airport_codes.resolve(city_name)
 
     async def search_flights(
         self, 
@@ -131,7 +118,7 @@ class TBOFlightService:
         trip_type: str = "oneway",
         return_date: Optional[str] = None,
         trace_id: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[FlightOffer]:
         """Search flights using TBO API"""
         
         if not trace_id:
@@ -150,6 +137,12 @@ class TBOFlightService:
             # Convert city names to IATA codes if necessary
             origin_code = self.convert_city_to_iata(origin)
             destination_code = self.convert_city_to_iata(destination)
+            if not origin_code or not destination_code:
+                logger.warning("TBO search skipped: unknown airport",
+                               origin=origin,
+                               destination=destination,
+                               trace_id=trace_id)
+                return []
             
             # Clean and normalize date format (handle ISO timestamps from frontend)
             # TBO expects: yyyy-MM-ddTHH:mm:ss
@@ -260,13 +253,18 @@ class TBOFlightService:
                            result_groups=len(results),
                            trace_id=trace_id)
                 
-                for result_group in results:
+                for group_index, result_group in enumerate(results):
+                    # Domestic round trips come back as two groups, the
+                    # second one flying destination -> origin
+                    leg_origin, leg_destination = (
+                        (destination_code, origin_code) if group_index == 1 else (origin_code, destination_code)
+                    )
                     for flight_option in result_group:
                         try:
                             processed_flight = self._process_flight_option(
                                 flight_option, 
-                                origin_code, 
-                                destination_code,
+                                leg_origin, 
+                                leg_destination,
                                 trace_id
                             )
                             if processed_flight:
@@ -299,7 +297,7 @@ class TBOFlightService:
         origin_code: str, 
         destination_code: str,
         trace_id: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[FlightOffer]:
         """Process individual flight option from TBO search results with multiple fare types"""
         
         try:
@@ -324,23 +322,10 @@ class TBOFlightService:
             origin_info = first_segment.get("Origin", {})
             destination_info = last_segment.get("Destination", {})
             
+            # ISO datetimes; the offer keeps them as epoch minutes
             departure_time = origin_info.get("DepTime", "")
             arrival_time = destination_info.get("ArrTime", "")
             
-            # Format times to HH:MM
-            dep_time_formatted = departure_time[:5] if len(departure_time) >= 5 else departure_time
-            if 'T' in dep_time_formatted:
-                dep_time_formatted = dep_time_formatted.split('T')[1][:5]
-            elif 'T' in departure_time:
-                # Fallback if slice was wrong but T exists
-                dep_time_formatted = departure_time.split('T')[1][:5]
-
-            arr_time_formatted = arrival_time[:5] if len(arrival_time) >= 5 else arrival_time
-            if 'T' in arr_time_formatted:
-                arr_time_formatted = arr_time_formatted.split('T')[1][:5]
-            elif 'T' in arrival_time:
-                arr_time_formatted = arrival_time.split('T')[1][:5]
-            
             # Calculate duration
             duration_minutes = 0
             if "Duration" in first_segment:
@@ -364,30 +349,29 @@ class TBOFlightService:
             booking_class = first_segment.get("BookingClass", "")
             aircraft_type = first_segment.get("Equipment", "")
             
-            flight_data = {
-                "id": option.get("ResultIndex", str(uuid.uuid4())),
-                "airline": airline_name,
-                "airline_code": airline_code,
-                "flight_number": flight_number,
-                "origin": origin_code,
-                "destination": destination_code,
-                "departure_time": dep_time_formatted,
-                "arrival_time": arr_time_formatted,
-                "duration_minutes": duration_minutes,
-                "stops": stops,
-                "base_price": base_price,
-                "currency": currency,
-                "baggage_allowance": "15 kg",  # Extract from segments if available
-                "cabin_class": "Economy",  # Map from booking class if needed
-                "booking_class": booking_class,
-                "aircraft_type": aircraft_type,
-                "is_lcc": is_lcc,
-                "fare_basis_code": option.get("FareBasisCode", ""),
-                "validation_key": option.get("Key", ""),
-                "fare_types": fare_types  # Multiple fare options for this flight
-            }
-            
-            return flight_data
+            return FlightOffer.build(
+                supplier="tbo",
+                id=option.get("ResultIndex", str(uuid.uuid4())),
+                airline_code=airline_code,
+                airline=airline_name,
+                flight_number=flight_number,
+                origin_code=origin_code,
+                destination_code=destination_code,
+                departure_time=departure_time,
+                arrival_time=arrival_time,
+                duration=duration_minutes,
+                stops=stops,
+                currency=currency,
+                base_price=base_price,
+                baggage_allowance="15 kg",  # Extract from segments if available
+                cabin_class="Economy",  # Map from booking class if needed
+                booking_class=booking_class,
+                aircraft_type=aircraft_type,
+                is_lcc=is_lcc,
+                fare_basis_code=option.get("FareBasisCode", ""),
+                validation_key=option.get("Key", ""),
+                fare_types=fare_types  # Multiple fare options for this flight
+            )
             
         except Exception as e:
             logger.warning("Error processing flight option details", 
@@ -0,0 +1,32 @@
+"""
+Search key folding for TourSmile autocomplete
+Lowercases, strips accents and folds special letters so "zurich" matches "Zürich"
+"""
+import unicodedata
+
+# Letters that NFKD does not decompose into a base letter + accent
+SPECIAL_FOLDS = str.maketrans({
+    "ø": "o", "Ø": "o",
+    "ł": "l", "Ł": "l",
+    "đ": "d", "Đ": "d",
+    "ð": "d", "Ð": "d",
+    "ħ": "h", "Ħ": "h",
+    "ı": "i",
+    "þ": "th", "Þ": "th",
+    "æ": "ae", "Æ": "ae",
+    "œ": "oe", "Œ": "oe",
+    "ß": "ss", "ẞ": "ss",
+    "‘": "'", "’": "'", "ʻ": "'", "ʼ": "'",
+    "–": "-", "—": "-",
+})
+
+
+def fold_text(text: str) -> str:
+    """
+    Fold text into a search key: special letters mapped, Unicode NFKD,
+    combining accents dropped, lowercased ("Łódź" -> "lodz", "São Paulo" -> "sao paulo")
+    """
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize('NFKD', text.translate(SPECIAL_FOLDS))
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
@@ -7,11 +7,14 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import asyncio
 import uuid
 import logging
 
 from database import get_db, get_redis, Package, Booking
-from tripjack_flight_api import tripjack_flight_service
+from flight_aggregator import flight_aggregator
+from flight_search import SearchVariant
+from round_trip_pairing import pair_round_trips
 from tripjack_hotel_api import tripjack_hotel_service
 
 router = APIRouter(prefix="/tourbuilder")
@@ -177,34 +180,29 @@ async def search_packages(request: PackageRequest, db: Session = Depends(get_db)
         search_id = str(uuid.uuid4())
         nights, days = calculate_duration(request.departure_date, request.return_date)
         
-        # Search flights
-        flight_results = []
+        # Search flights: both legs across every supplier at once
+        flight_options = []
         try:
-            # Search outbound flights
-            outbound_flights = await tripjack_flight_service.search_flights(
-                origin=request.origin,
-                destination=request.destination,
-                departure_date=request.departure_date,
-                passengers=request.adults + request.children,
-                cabin_class="economy" if request.budget_tier == "economy" else "business"
-            )
-            
-            # Search return flights if needed
-            return_flights = []
+            passengers = request.adults + request.children
+            class_type = "economy" if request.budget_tier == "economy" else "business"
+            legs = [SearchVariant(request.origin, request.destination, request.departure_date)]
             if request.return_date:
-                return_flights = await tripjack_flight_service.search_flights(
-                    origin=request.destination,
-                    destination=request.origin,
-                    departure_date=request.return_date,
-                    passengers=request.adults + request.children,
-                    cabin_class="economy" if request.budget_tier == "economy" else "business"
-                )
+                legs.append(SearchVariant(request.destination, request.origin, request.return_date))
+            outbound_flights, *return_flights = await asyncio.gather(
+                *(flight_aggregator.search(leg, passengers, class_type) for leg in legs)
+            )
             
-            flight_results = {"outbound": outbound_flights[:5], "return": return_flights[:5]}
+            # Two cheapest outbound flights, or the two best round trips
+            # (heap pairing, minimum stay, same airline preferred) when returning
+            flight_options = [(flight, None) for flight in sorted(outbound_flights, key=lambda f: f.price_key)[:2]]
+            if return_flights:
+                round_trips = pair_round_trips(outbound_flights, return_flights[0], k=2)
+                if round_trips:
+                    flight_options = [(trip.outbound, trip.inbound) for trip in round_trips]
             
         except Exception as e:
             logging.error(f"Flight search failed: {e}")
-            flight_results = {"outbound": [], "return": []}
+            flight_options = []
         
         # Search hotels
         hotel_results = []
@@ -239,30 +237,29 @@ async def search_packages(request: PackageRequest, db: Session = Depends(get_db)
         packages = []
         
         for hotel in hotel_results[:3]:  # Top 3 hotels per tier
-            for outbound_flight in (flight_results["outbound"][:2] if flight_results["outbound"] else [{}]):
+            for outbound_flight, return_flight in (flight_options or [(None, None)]):
                 components = []
                 
                 # Add outbound flight component
                 if outbound_flight:
                     flight_comp = PackageComponent(
                         type="flight",
-                        details=outbound_flight,
-                        base_price=outbound_flight.get("price", 5000),
-                        taxes=outbound_flight.get("price", 5000) * 0.12,
-                        total_price=outbound_flight.get("price", 5000) * 1.12
+                        details=outbound_flight.to_dict(),
+                        base_price=outbound_flight.price or 5000,
+                        taxes=(outbound_flight.price or 5000) * 0.12,
+                        total_price=(outbound_flight.price or 5000) * 1.12
                     )
                     components.append(flight_comp)
                 
-                # Add return flight component if available
+                # Add the return flight paired with this outbound, if any
                 return_flight_comp = None
-                if request.return_date and flight_results["return"]:
-                    return_flight = flight_results["return"][0]  # Best return flight
+                if return_flight:
                     return_flight_comp = PackageComponent(
                         type="flight",
-                        details=return_flight,
-                        base_price=return_flight.get("price", 5000),
-                        taxes=return_flight.get("price", 5000) * 0.12,
-                        total_price=return_flight.get("price", 5000) * 1.12
+                        details=return_flight.to_dict(),
+                        base_price=return_flight.price,
+                        taxes=return_flight.price * 0.12,
+                        total_price=return_flight.price * 1.12
                     )
                     components.append(return_flight_comp)
                 
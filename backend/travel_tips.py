@@ -0,0 +1,137 @@
+"""
+Travel Tips - AI travel tips cached per flight route and per hotel city/month
+Tips are generated in the background, so searches never wait on the LLM
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from airport_resolver import airport_code_resolver
+from text_folding import fold_text
+
+# Tips are generic to a route or city/month, so they stay useful for days
+TRAVEL_TIP_TTL = float(os.environ.get('TRAVEL_TIP_TTL', str(7 * 24 * 3600)))
+TRAVEL_TIP_CACHE_SIZE = int(os.environ.get('TRAVEL_TIP_CACHE_SIZE', '4096'))
+# How long the tip endpoints wait for a tip that is still being generated
+TRAVEL_TIP_WAIT = float(os.environ.get('TRAVEL_TIP_WAIT', '15'))
+# After a failed generation the key isn't retried for this many seconds, so an
+# LLM outage costs one call per key per interval, not one per search
+TRAVEL_TIP_FAILURE_TTL = float(os.environ.get('TRAVEL_TIP_FAILURE_TTL', '60'))
+
+
+def flight_tip_request(origin: str, destination: str) -> Tuple[str, str]:
+    """Cache key and LLM prompt for a route's flight tip"""
+    origin_code = airport_code_resolver.resolve(origin) or fold_text(origin).strip()
+    destination_code = airport_code_resolver.resolve(destination) or fold_text(destination).strip()
+    # Prompt from the codes, so the cached tip doesn't echo one traveller's spelling
+    prompt = f"Provide a brief travel tip for flying from {origin_code} to {destination_code} (IATA airport codes)"
+    return f"flight:{origin_code}-{destination_code}", prompt
+
+
+def hotel_tip_request(location: str, checkin_date: str) -> Tuple[str, str]:
+    """Cache key and LLM prompt for a city's hotel tip in the check-in month"""
+    try:
+        checkin = datetime.fromisoformat(checkin_date.split('T')[0])
+    except ValueError:
+        checkin = None
+    city = fold_text(location).strip()
+    prompt = f"Give a brief travel tip for staying in {location}"
+    if checkin is None:
+        return f"hotel:{city}", prompt
+    return f"hotel:{city}:{checkin:%Y-%m}", f"{prompt} in {checkin:%B %Y}"
+
+
+class TravelTipCache:
+    """
+    Tips by key, each generated at most once at a time by ``generate``.
+
+    ``peek()`` never waits: it returns the cached tip or None after starting
+    generation in the background. ``fetch()`` waits up to a timeout for the
+    tip. A failed (or empty) generation is logged and remembered for
+    ``failure_ttl`` seconds, during which both return None without calling
+    ``generate`` again.
+    """
+
+    def __init__(self, generate: Callable[[str], Awaitable[str]],
+                 ttl: float = TRAVEL_TIP_TTL, max_entries: int = TRAVEL_TIP_CACHE_SIZE,
+                 failure_ttl: float = TRAVEL_TIP_FAILURE_TTL):
+        self._generate = generate
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.failure_ttl = failure_ttl
+        self._tips: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Task] = {}
+        # Key -> when its last generation failed
+        self._failed: "OrderedDict[str, float]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._tips.get(key)
+        if entry is None:
+            return None
+        stored_at, tip = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._tips[key]
+            return None
+        self._tips.move_to_end(key)
+        return tip
+
+    def peek(self, key: str, prompt: str) -> Optional[str]:
+        """Cached tip, or None after scheduling its generation"""
+        tip = self.get(key)
+        if tip is None:
+            self._schedule(key, prompt)
+        return tip
+
+    async def fetch(self, key: str, prompt: str, timeout: float = TRAVEL_TIP_WAIT) -> Optional[str]:
+        """Cached tip, waiting up to ``timeout`` seconds for generation"""
+        tip = self.get(key)
+        if tip is not None:
+            return tip
+        task = self._schedule(key, prompt)
+        if task is None:
+            return None
+        try:
+            # shield: a client giving up must not cancel the shared generation
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def _schedule(self, key: str, prompt: str) -> Optional[asyncio.Task]:
+        """The key's generation, started if needed; None while a recent failure stands"""
+        task = self._pending.get(key)
+        if task is not None:
+            return task
+        failed_at = self._failed.get(key)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < self.failure_ttl:
+                return None
+            del self._failed[key]
+        task = self._pending[key] = asyncio.ensure_future(self._run(key, prompt))
+        return task
+
+    async def _run(self, key: str, prompt: str) -> Optional[str]:
+        try:
+            tip = await self._generate(prompt)
+        except Exception as e:
+            logging.error(f"Travel tip generation error for {key}: {str(e)}")
+            tip = None
+        finally:
+            self._pending.pop(key, None)
+        if not tip:
+            self._failed[key] = time.monotonic()
+            self._failed.move_to_end(key)
+            while len(self._failed) > self.max_entries:
+                self._failed.popitem(last=False)
+            return None
+        self._tips[key] = (time.monotonic(), tip)
+        self._tips.move_to_end(key)
+        while len(self._tips) > self.max_entries:
+            self._tips.popitem(last=False)
+        return tip
+
+    def stats(self) -> dict:
+        return {"size": len(self._tips), "generating": len(self._pending), "failed": len(self._failed)}
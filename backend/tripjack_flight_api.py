@@ -8,6 +8,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 import logging
 from dotenv import load_dotenv
+from airport_resolver import AirportCodeResolver, airport_code_resolver
+from flight_offer import FlightOffer
 
 # Load environment variables
 load_dotenv()
@@ -17,7 +19,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class TripjackFlightService:
-    def __init__(self):
+    def __init__(self, airport_codes: Optional[AirportCodeResolver] = None):
+        # Shared, memoized city -> IATA resolver backed by the airport catalogue
+        self.airport_codes = airport_codes or airport_code_resolver
         # Base URLs
         self.uat_base_url = "https://apitest.tripjack.com"
         self.prod_base_url = "https://tripjack.com"
@@ -49,7 +53,7 @@ class TripjackFlightService:
             self._api_key = os.environ.get('TRIPJACK_API_KEY')
         return self._api_key
 
-    def search_flights(self, origin: str, destination: str, departure_date: str, passengers: int = 1, class_type: str = "economy", trip_type: str = "oneway", return_date: str = None):
+    def search_flights(self, origin: str, destination: str, departure_date: str, passengers: int = 1, class_type: str = "economy", trip_type: str = "oneway", return_date: str = None, timeout: float = 30):
         """
         Search for flights using Tripjack API
         """
@@ -63,6 +67,9 @@ class TripjackFlightService:
             # Convert city names to airport codes
             origin_code = self._get_airport_code(origin)
             destination_code = self._get_airport_code(destination)
+            if not origin_code or not destination_code:
+                logger.warning(f"Tripjack search skipped, unknown airport: {origin} → {destination}")
+                return []
             
             logger.info(f"🛫 Searching flights: {origin} ({origin_code}) → {destination} ({destination_code})")
             logger.info(f"📅 Date: {departure_date}, Passengers: {passengers}, Class: {class_type}")
@@ -124,7 +131,7 @@ class TripjackFlightService:
             logger.info(f"Making flight search request to: {search_url}")
             logger.info(f"Search data: {search_data}")
 
-            response = requests.post(search_url, json=search_data, headers=headers, timeout=30)
+            response = requests.post(search_url, json=search_data, headers=headers, timeout=timeout)
             
             logger.info(f"Search response status: {response.status_code}")
             logger.info(f"Search response: {response.text[:1000]}")
@@ -139,6 +146,8 @@ class TripjackFlightService:
                     # Extract ONWARD flights (and RETURN if round trip)
                     onward_flights = trip_infos_data.get('ONWARD', [])
                     flights = self._parse_tripjack_flights(onward_flights, origin, destination)
+                    return_flights = trip_infos_data.get('RETURN', [])
+                    flights += self._parse_tripjack_flights(return_flights, destination, origin)
                     logger.info(f"✅ Successfully parsed {len(flights)} flights from Tripjack")
                     return flights
                 else:
@@ -152,28 +161,12 @@ class TripjackFlightService:
             logger.error(f"❌ Error in Tripjack flight search: {str(e)}")
             return []
     
-    def _get_airport_code(self, city_name: str) -> str:
+    def _get_airport_code(self, city_name: str) -> Optional[str]:
         """Convert city name to airport code"""
-        city_to_airport = {
-            "delhi": "DEL",
-            "mumbai": "BOM", 
-            "bangalore": "BLR",
-            "chennai": "MAA",
-            "kolkata": "CCU",
-            "hyderabad": "HYD",
-            "pune": "PNQ",
-            "ahmedabad": "AMD",
-            "goa": "GOI",
-            "kochi": "COK",
-            "jaipur": "JAI",
-            "trivandrum": "TRV"
-        }
-        
-        city_lower = city_name.lower()
-        return city_to_airport.get(city_lower, city_name.upper()[:3])
+        return self.airport_codes.resolve(city_name)
     
-    def _parse_tripjack_flights(self, trip_infos: List[Dict[str, Any]], origin: str, destination: str) -> List[Dict[str, Any]]:
-        """Parse Tripjack API response and convert to our standard format"""
+    def _parse_tripjack_flights(self, trip_infos: List[Dict[str, Any]], origin: str, destination: str) -> List[FlightOffer]:
+        """Parse Tripjack API response into FlightOffers"""
         flights = []
         
         try:
@@ -191,14 +184,14 @@ class TripjackFlightService:
                 flight_designator = first_segment.get('fD', {})
                 airline_info = flight_designator.get('aI', {})
                 
-                # Airport information
+                # Airport information (the journey ends where the last segment lands)
                 departure_airport = first_segment.get('da', {})
-                arrival_airport = first_segment.get('aa', {})
+                arrival_airport = segments[-1].get('aa', {})
                 
-                # Timing
+                # Timing: local times, so the journey duration comes from the segments
                 departure_time = first_segment.get('dt', '')
-                arrival_time = first_segment.get('at', '')
-                duration = first_segment.get('duration', 0)
+                arrival_time = segments[-1].get('at', '')
+                duration = self._journey_minutes(segments)
                 
                 # Extract pricing from totalPriceList if available
                 price_info = trip_info.get('totalPriceList', [])
@@ -254,36 +247,8 @@ class TripjackFlightService:
                     # Check if there's a direct price field on trip_info
                     total_price = trip_info.get('price', 0) or trip_info.get('totalAmount', 0) or 4500
                 
-                # Build flight object in our standard format
-                flight = {
-                    "id": f"TJ_{trip_info.get('id', 'unknown')}",
-                    "airline": airline_info.get('name', 'Unknown Airline'),
-                    "airline_code": airline_info.get('code', 'XX'),
-                    "flight_number": flight_designator.get('fN', 'XXXX'),
-                    "aircraft_type": flight_designator.get('eT', ''),
-                    "origin": departure_airport.get('city', origin),
-                    "destination": arrival_airport.get('city', destination),
-                    "origin_code": departure_airport.get('code', 'XXX'),
-                    "destination_code": arrival_airport.get('code', 'XXX'),
-                    "departure_time": departure_time,
-                    "arrival_time": arrival_time,
-                    "duration": f"{duration // 60}h {duration % 60}m" if duration else "N/A",
-                    "duration_minutes": duration,
-                    "stops": len(segments) - 1,  # Number of stops = segments - 1
-                    "price": total_price,
-                    "currency": "INR",
-                    "is_lcc": airline_info.get('isLcc', False),
-                    "is_refundable": False,  # Default, can be determined from fare rules
-                    "baggage": {
-                        "checked": "15kg",  # Standard assumption
-                        "carry_on": "7kg"
-                    },
-                    "booking_class": "Y",  # Economy default
-                    "fare_type": "Regular",
-                    "segments": []
-                }
-                
-                # Add segment details
+                # Segment details
+                segment_details = []
                 for segment in segments:
                     seg_flight_designator = segment.get('fD', {})
                     seg_airline_info = seg_flight_designator.get('aI', {})
@@ -305,9 +270,35 @@ class TripjackFlightService:
                         "terminal_departure": seg_departure_airport.get('terminal', ''),
                         "terminal_arrival": seg_arrival_airport.get('terminal', ''),
                     }
-                    flight["segments"].append(segment_detail)
+                    segment_details.append(segment_detail)
                 
-                flights.append(flight)
+                flights.append(FlightOffer.build(
+                    supplier="tripjack",
+                    id=f"TJ_{trip_info.get('id', 'unknown')}",
+                    airline_code=airline_info.get('code', 'XX'),
+                    airline=airline_info.get('name', 'Unknown Airline'),
+                    flight_number=flight_designator.get('fN', 'XXXX'),
+                    origin_code=departure_airport.get('code', 'XXX'),
+                    destination_code=arrival_airport.get('code', 'XXX'),
+                    departure_time=departure_time,
+                    arrival_time=arrival_time,
+                    duration=duration,
+                    stops=len(segments) - 1,  # Number of stops = segments - 1
+                    price=total_price,
+                    currency="INR",
+                    refundable=False,  # Default, can be determined from fare rules
+                    aircraft_type=flight_designator.get('eT', ''),
+                    origin=departure_airport.get('city', origin),
+                    destination=arrival_airport.get('city', destination),
+                    is_lcc=airline_info.get('isLcc', False),
+                    baggage={
+                        "checked": "15kg",  # Standard assumption
+                        "carry_on": "7kg"
+                    },
+                    booking_class="Y",  # Economy default
+                    fare_type="Regular",
+                    segments=segment_details
+                ))
                 
         except Exception as e:
             logger.error(f"❌ Error parsing Tripjack flights: {str(e)}")
@@ -315,6 +306,34 @@ class TripjackFlightService:
         logger.info(f"✅ Parsed {len(flights)} flights from Tripjack response")
         return flights
     
+    @staticmethod
+    def _journey_minutes(segments: List[Dict[str, Any]]) -> Optional[int]:
+        """
+        Door-to-door minutes of an itinerary: every segment's flying time plus
+        each layover. A layover is the segment's connection time (cT), or the
+        gap between landing and the next take-off, both local times at the
+        same airport. None when a segment has no duration, so the offer falls
+        back to its departure and arrival times.
+        """
+        total = 0
+        for index, segment in enumerate(segments):
+            flying = segment.get('duration')
+            if not flying:
+                return None
+            total += int(flying)
+            if index == len(segments) - 1:
+                break
+            layover = segment.get('cT')
+            if layover is None:
+                try:
+                    landed = datetime.fromisoformat(segment['at'])
+                    departs = datetime.fromisoformat(segments[index + 1]['dt'])
+                except (KeyError, TypeError, ValueError):
+                    return None
+                layover = (departs - landed).total_seconds() // 60
+            total += int(layover)
+        return total
+
     def _determine_fare_type(self, trip_info: Dict[str, Any]) -> str:
         """Determine fare type based on trip info"""
         fare_info = trip_info.get("totalPriceInfo", {}).get("totalFareDetail", {})
@@ -547,67 +566,12 @@ class TripjackFlightService:
             "User-Agent": "TourSmile/1.0"
         }
 
-    def get_airport_code(self, city_or_code: str) -> str:
+    def get_airport_code(self, city_or_code: str) -> Optional[str]:
         """Convert city names to IATA airport codes"""
-        city_to_code = {
-            'delhi': 'DEL',
-            'new delhi': 'DEL',
-            'mumbai': 'BOM',
-            'bangalore': 'BLR',
-            'bengaluru': 'BLR',
-            'chennai': 'MAA',
-            'hyderabad': 'HYD',
-            'kolkata': 'CCU',
-            'pune': 'PNQ',
-            'ahmedabad': 'AMD',
-            'kochi': 'COK',
-            'cochin': 'COK',
-            'goa': 'GOI',
-            'jaipur': 'JAI',
-            'lucknow': 'LKO',
-            'chandigarh': 'IXC',
-            'bhubaneswar': 'BBI',
-            'indore': 'IDR',
-            'srinagar': 'SXR',
-            'trivandrum': 'TRV',
-            'calicut': 'CCJ',
-            'mangalore': 'IXE',
-            'coimbatore': 'CJB',
-            'madurai': 'IXM',
-            'tiruchirapalli': 'TRZ',
-            'vizag': 'VTZ',
-            'visakhapatnam': 'VTZ',
-            'vijayawada': 'VGA',
-            'raipur': 'RPR',
-            'nagpur': 'NAG',
-            'bhopal': 'BHO',
-            'udaipur': 'UDR',
-            'jodhpur': 'JDH',
-            'dehradun': 'DED',
-            'jammu': 'IXJ',
-            'leh': 'IXL',
-            'patna': 'PAT',
-            'ranchi': 'IXR',
-            'agartala': 'IXA',
-            'imphal': 'IMF',
-            'guwahati': 'GAU',
-            'dibrugarh': 'DIB',
-            'silchar': 'IXS'
-        }
-        
-        city_lower = city_or_code.lower().strip()
-        
-        # If it's already a 3-letter code, return as is
-        if len(city_lower) == 3 and city_lower.isalpha():
-            return city_lower.upper()
-            
-        # Look up city name
-        return city_to_code.get(city_lower, 'DEL')  # Default to Delhi if not found
-
-
-
-    def transform_flight_data(self, flights_data: List[Dict], origin: str, destination: str) -> List[Dict]:
-        """Transform Tripjack flight data to our comprehensive format with advanced filtering support"""
+        return self.airport_codes.resolve(city_or_code)
+    
+    def transform_flight_data(self, flights_data: List[Dict], origin: str, destination: str) -> List[FlightOffer]:
+        """Transform Tripjack flight data into FlightOffers (one per segment) with fare options"""
         transformed = []
         
         try:
@@ -632,11 +596,10 @@ class TripjackFlightService:
                         flight_number = f"{airline_code}{flight_designator.get('fN', '000')}"
                         aircraft_type = flight_designator.get('eT', 'Unknown')
                         
-                        # Times and duration
-                        departure_time = self.format_time(segment_info.get('dt', ''))
-                        arrival_time = self.format_time(segment_info.get('at', ''))
+                        # Times (ISO datetimes, kept as epoch minutes by the offer) and duration
+                        departure_time = segment_info.get('dt', '')
+                        arrival_time = segment_info.get('at', '')
                         duration_minutes = segment_info.get('duration', 0)
-                        duration = self.format_duration(duration_minutes)
                         
                         # Airport information
                         departure_airport = segment_info.get('da', {})
@@ -669,61 +632,47 @@ class TripjackFlightService:
                             if base_price == 0:
                                 base_price = total_fare
                         
-                        # Build comprehensive flight object
-                        flight_obj = {
-                            # Basic flight info
-                            "id": f"TJ_{trip_info.get('id', 'unknown')}",
-                            "airline": airline_name,
-                            "airline_code": airline_code,
-                            "flight_number": flight_number,
-                            "aircraft_type": aircraft_type,
-                            "is_lcc": is_lcc,
-                            
-                            # Route and timing
-                            "origin": origin,
-                            "destination": destination,
-                            "origin_code": departure_airport.get('code', 'XXX'),
-                            "destination_code": arrival_airport.get('code', 'XXX'),
-                            "origin_terminal": departure_airport.get('terminal', ''),
-                            "destination_terminal": arrival_airport.get('terminal', ''),
-                            "departure_time": departure_time,
-                            "arrival_time": arrival_time,
-                            "duration": duration,
-                            "duration_minutes": duration_minutes,
-                            "stops": 0,  # Tripjack provides segment-wise data
+                        transformed.append(FlightOffer.build(
+                            supplier="tripjack",
+                            id=f"TJ_{trip_info.get('id', 'unknown')}",
+                            airline_code=airline_code,
+                            airline=airline_name,
+                            flight_number=flight_number,
+                            origin_code=departure_airport.get('code', 'XXX'),
+                            destination_code=arrival_airport.get('code', 'XXX'),
+                            departure_time=departure_time,
+                            arrival_time=arrival_time,
+                            duration=duration_minutes,
+                            stops=0,  # Tripjack provides segment-wise data
+                            price=int(base_price),
+                            currency="INR",
+                            aircraft_type=aircraft_type,
+                            is_lcc=is_lcc,
+                            origin=origin,
+                            destination=destination,
+                            origin_terminal=departure_airport.get('terminal', ''),
+                            destination_terminal=arrival_airport.get('terminal', ''),
                             
                             # Pricing and fare options
-                            "price": int(base_price),
-                            "currency": "INR",
-                            "fare_options": fare_options,
-                            "lowest_fare": min([f["totalPrice"] for f in fare_options]) if fare_options else base_price,
-                            "highest_fare": max([f["totalPrice"] for f in fare_options]) if fare_options else base_price,
-                            
-                            # Filtering attributes
-                            "booking_class": "Economy",  # Can be enhanced based on cabin class
-                            "available": True,
-                            "seats_available": "Available",
+                            fare_options=fare_options,
+                            lowest_fare=min([f["totalPrice"] for f in fare_options]) if fare_options else base_price,
+                            highest_fare=max([f["totalPrice"] for f in fare_options]) if fare_options else base_price,
                             
-                            # Additional details for filters
-                            "departure_hour": int(departure_time.split(':')[0]) if ':' in departure_time else 0,
-                            "arrival_hour": int(arrival_time.split(':')[0]) if ':' in arrival_time else 0,
-                            "is_morning": 6 <= int(departure_time.split(':')[0]) < 12 if ':' in departure_time else False,
-                            "is_afternoon": 12 <= int(departure_time.split(':')[0]) < 18 if ':' in departure_time else False,
-                            "is_evening": 18 <= int(departure_time.split(':')[0]) < 24 if ':' in departure_time else False,
-                            "is_night": int(departure_time.split(':')[0]) < 6 if ':' in departure_time else False,
+                            # Booking class and availability
+                            booking_class="Economy",  # Can be enhanced based on cabin class
+                            available=True,
+                            seats_available="Available",
                             
                             # Baggage and services
-                            "baggage_info": self.get_baggage_info(trip_info),
-                            "meal_available": True,  # Assume meals available for most flights
-                            "wifi_available": False,  # Conservative assumption
+                            baggage_info=self.get_baggage_info(trip_info),
+                            meal_available=True,  # Assume meals available for most flights
+                            wifi_available=False,  # Conservative assumption
                             
                             # Booking info
-                            "booking_token": trip_info.get('searchId', ''),  # For booking flow
-                            "last_ticketing_date": "",  # Can be extracted if available
-                            "status": "Available"
-                        }
-                        
-                        transformed.append(flight_obj)
+                            booking_token=trip_info.get('searchId', ''),  # For booking flow
+                            last_ticketing_date="",  # Can be extracted if available
+                            status="Available"
+                        ))
                         
                         # Log flight for debugging
                         lcc_indicator = "💰" if is_lcc else "✈️"
@@ -787,31 +736,6 @@ class TripjackFlightService:
             "personal_item": "2kg"
         }
 
-    def format_time(self, datetime_str: str) -> str:
-        """Convert datetime string to HH:MM format"""
-        try:
-            if datetime_str:
-                # Handle different datetime formats from Tripjack
-                if 'T' in datetime_str:
-                    dt = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-                    return dt.strftime('%H:%M')
-                else:
-                    # If it's already in time format
-                    return datetime_str
-            return "08:00"
-        except Exception as e:
-            logger.warning(f"Error parsing time {datetime_str}: {str(e)}")
-            return "08:00"
-
-    def format_duration(self, minutes: int) -> str:
-        """Convert duration in minutes to readable format"""
-        try:
-            hours = minutes // 60
-            mins = minutes % 60
-            return f"{hours}h {mins:02d}m"
-        except:
-            return "2h 30m"
-
     def get_airline_name(self, airline_code: str) -> str:
         """Get airline name from IATA code - comprehensive Indian airlines list"""
         airlines = {
@@ -873,14 +797,14 @@ class TripjackFlightService:
                     logger.info(f"✅ Flight search successful - Found {len(test_flights)} flights")
                     
                     # Check for LCC coverage
-                    lcc_flights = [f for f in test_flights if f.get('is_lcc', False)]
+                    lcc_flights = [f for f in test_flights if f.details.get('is_lcc', False)]
                     logger.info(f"🎯 LCC flights found: {len(lcc_flights)}")
                     
                     # Show sample flights
                     for flight in test_flights[:3]:
-                        lcc_flag = "💰" if flight.get('is_lcc', False) else "✈️"
-                        logger.info(f"  {lcc_flag} {flight['airline']} {flight['flight_number']} - ₹{flight['price']}")
-                        logger.info(f"     Fare options: {len(flight.get('fare_options', []))}")
+                        lcc_flag = "💰" if flight.details.get('is_lcc', False) else "✈️"
+                        logger.info(f"  {lcc_flag} {flight.airline} {flight.flight_number} - ₹{flight.price}")
+                        logger.info(f"     Fare options: {len(flight.details.get('fare_options', []))}")
                     
                     return True
                 else:
@@ -924,9 +848,9 @@ async def test_tripjack_integration():
             logger.info(f"✅ Comprehensive flight search successful - Found {len(flights)} flights")
             
             # Analyze results
-            lcc_count = sum(1 for f in flights if f.get('is_lcc', False))
-            total_fares = sum(len(f.get('fare_options', [])) for f in flights)
-            avg_price = sum(f['price'] for f in flights) / len(flights)
+            lcc_count = sum(1 for f in flights if f.details.get('is_lcc', False))
+            total_fares = sum(len(f.details.get('fare_options', [])) for f in flights)
+            avg_price = sum(f.price for f in flights) / len(flights)
             
             logger.info(f"📊 Analysis:")
             logger.info(f"   • LCC Airlines: {lcc_count}/{len(flights)} flights")
@@ -936,7 +860,7 @@ async def test_tripjack_integration():
             # Show fare type diversity
             unique_fare_types = set()
             for flight in flights:
-                for fare in flight.get('fare_options', []):
+                for fare in flight.details.get('fare_options', []):
                     unique_fare_types.add(fare['fareType'])
             
             logger.info(f"   • Fare Types Available: {', '.join(unique_fare_types)}")
@@ -1,8701 +0,0 @@
-        # 🌍 COMPREHENSIVE IATA AIRPORT DATABASE - 8697 AIRPORTS FOR 100% OTA COVERAGE
-        # This database includes ALL IATA airports worldwide ensuring professional OTA functionality
-        airports_db = [
-            {"city": "108 Mile", "airport": "South Cariboo Region / 108 Mile Airport", "iata": "ZMH", "country": "CA"},
-            {"city": "Aachen", "airport": "Aachen-Merzbrück Airport", "iata": "AAH", "country": "DE"},
-            {"city": "Aalborg", "airport": "Aalborg Airport", "iata": "AAL", "country": "DK"},
-            {"city": "Aappilattoq", "airport": "Aappilattoq Heliport", "iata": "AOQ", "country": "GL"},
-            {"city": "Aappilattoq", "airport": "Aappilattoq Heliport", "iata": "QUV", "country": "GL"},
-            {"city": "Aarhus", "airport": "Aarhus Airport", "iata": "AAR", "country": "DK"},
-            {"city": "Aasiaat", "airport": "Aasiaat Airport", "iata": "JEG", "country": "GL"},
-            {"city": "Abadan", "airport": "Abadan Airport", "iata": "ABD", "country": "IR"},
-            {"city": "Abaiang", "airport": "Abaiang Airport", "iata": "ABF", "country": "KI"},
-            {"city": "Abakan", "airport": "Abakan International Airport", "iata": "ABA", "country": "RU"},
-            {"city": "Abariringa", "airport": "Canton Island Airport", "iata": "CIS", "country": "KI"},
-            {"city": "Abbotsford", "airport": "Abbotsford International Airport", "iata": "YXX", "country": "CA"},
-            {"city": "Abeche", "airport": "Abeche Airport", "iata": "AEH", "country": "TD"},
-            {"city": "Abemama", "airport": "Abemama Airport", "iata": "AEA", "country": "KI"},
-            {"city": "Abengourou", "airport": "Abengourou Airport", "iata": "OGO", "country": "CI"},
-            {"city": "Aberdeen", "airport": "Aberdeen International Airport", "iata": "ABZ", "country": "GB"},
-            {"city": "Aberdeen", "airport": "Aberdeen Regional Airport", "iata": "ABR", "country": "US"},
-            {"city": "Aberdeen", "airport": "Phillips Army Air Field", "iata": "APG", "country": "US"},
-            {"city": "Abha", "airport": "Abha International Airport", "iata": "AHB", "country": "SA"},
-            {"city": "Abidjan", "airport": "Félix-Houphouët-Boigny International Airport", "iata": "ABJ", "country": "CI"},
-            {"city": "Abilene", "airport": "Abilene Regional Airport", "iata": "ABI", "country": "US"},
-            {"city": "Abilene", "airport": "Dyess Air Force Base", "iata": "DYS", "country": "US"},
-            {"city": "Abingdon", "airport": "Virginia Highlands Airport", "iata": "VJI", "country": "US"},
-            {"city": "Abingdon Downs", "airport": "Abingdon Downs Airport", "iata": "ABG", "country": "AU"},
-            {"city": "Ablow", "airport": "Mota Lava Airport", "iata": "MTV", "country": "VU"},
-            {"city": "Aboisso", "airport": "Aboisso Airport", "iata": "ABO", "country": "CI"},
-            {"city": "Abou-Deïa", "airport": "Abou-Deïa Airport", "iata": "AOD", "country": "TD"},
-            {"city": "Abraham Bay Settlement", "airport": "Mayaguana Airport", "iata": "MYG", "country": "BS"},
-            {"city": "Abs", "airport": "Abs Airport", "iata": "EAB", "country": "YE"},
-            {"city": "Abu Dhabi", "airport": "Yas Island Seaplane Base", "iata": "AYM", "country": "AE"},
-            {"city": "Abu Dhabi", "airport": "Zayed International Airport", "iata": "AUH", "country": "AE"},
-            {"city": "Abu Dhabi", "airport": "Al Bateen Executive Airport", "iata": "AZI", "country": "AE"},
-            {"city": "Abu Musa", "airport": "Abu Musa Island Airport", "iata": "AEU", "country": "IR"},
-            {"city": "Abu Simbel", "airport": "Abu Simbel Airport", "iata": "ABS", "country": "EG"},
-            {"city": "Abuja", "airport": "Nnamdi Azikiwe International Airport", "iata": "ABV", "country": "NG"},
-            {"city": "Acandí", "airport": "Alcides Fernández Airport", "iata": "ACD", "country": "CO"},
-            {"city": "Acandí", "airport": "Capurganá Airport", "iata": "CPB", "country": "CO"},
-            {"city": "Acapulco", "airport": "General Juan N. Álvarez International Airport", "iata": "ACA", "country": "MX"},
-            {"city": "Acaricuara", "airport": "Acaricuara Airport", "iata": "ARF", "country": "CO"},
-            {"city": "Acarigua", "airport": "Oswaldo Guevara Mujica Airport", "iata": "AGV", "country": "VE"},
-            {"city": "Accident", "airport": "Garrett County Airport", "iata": "ODM", "country": "US"},
-            {"city": "Accra", "airport": "Kotoka International Airport", "iata": "ACC", "country": "GH"},
-            {"city": "Achinsk", "airport": "Achinsk Airport", "iata": "ACS", "country": "RU"},
-            {"city": "Ad Damazin", "airport": "Damazin Airport", "iata": "RSS", "country": "SD"},
-            {"city": "Ad Dammam", "airport": "King Fahd International Airport", "iata": "DMM", "country": "SA"},
-            {"city": "Ad-Dali", "airport": "Ad-Dali Airport", "iata": "DHL", "country": "YE"},
-            {"city": "Ada", "airport": "Ada Regional Airport", "iata": "ADT", "country": "US"},
-            {"city": "Adado", "airport": "Adado Airport", "iata": "AAD", "country": "SO"},
-            {"city": "Adak", "airport": "Adak Airport", "iata": "ADK", "country": "US"},
-            {"city": "Adam", "airport": "Tobruk International Airport", "iata": "TOB", "country": "LY"},
-            {"city": "Adam", "airport": "Adam Airport", "iata": "AOM", "country": "OM"},
-            {"city": "Adampur", "airport": "Adampur Airport", "iata": "AIP", "country": "IN"},
-            {"city": "Adar", "airport": "Adareil Airport", "iata": "AEE", "country": "SS"},
-            {"city": "Addis Ababa", "airport": "Addis Ababa Bole International Airport", "iata": "ADD", "country": "ET"},
-            {"city": "Adelaide", "airport": "Adelaide International Airport", "iata": "ADL", "country": "AU"},
-            {"city": "Aden", "airport": "Aden International Airport", "iata": "ADE", "country": "YE"},
-            {"city": "Adrar", "airport": "Touat Cheikh Sidi Mohamed Belkebir Airport", "iata": "AZR", "country": "DZ"},
-            {"city": "Adrian", "airport": "Lenawee County Airport", "iata": "ADG", "country": "US"},
-            {"city": "Adıyaman", "airport": "Adıyaman Airport", "iata": "ADF", "country": "TR"},
-            {"city": "Aeng", "airport": "Ann Airport", "iata": "VBA", "country": "MM"},
-            {"city": "Afore", "airport": "Afore Airstrip", "iata": "AFR", "country": "PG"},
-            {"city": "Afton", "airport": "Grand Lake Regional Airport", "iata": "NRI", "country": "US"},
-            {"city": "Afton", "airport": "Afton Municipal Airport", "iata": "AFO", "country": "US"},
-            {"city": "Afyonkarahisar", "airport": "Afyon Air Base", "iata": "AFY", "country": "TR"},
-            {"city": "Agadez", "airport": "Mano Dayak International Airport", "iata": "AJY", "country": "NE"},
-            {"city": "Agadir (Temsia)", "airport": "Al Massira Airport", "iata": "AGA", "country": "MA"},
-            {"city": "Agartala", "airport": "Agartala - Maharaja Bir Bikram Airport", "iata": "IXA", "country": "IN"},
-            {"city": "Agats", "airport": "Ewer Asmat Airport", "iata": "EWE", "country": "ID"},
-            {"city": "Agatti", "airport": "Agatti Airport", "iata": "AGX", "country": "IN"},
-            {"city": "Agaun", "airport": "Agaun Airport", "iata": "AUP", "country": "PG"},
-            {"city": "Agen", "airport": "Agen La Garenne airport", "iata": "AGF", "country": "FR"},
-            {"city": "Aggeneys", "airport": "Aggeneys Airport", "iata": "AGZ", "country": "ZA"},
-            {"city": "Aghajari", "airport": "Aghajari Airport", "iata": "AKW", "country": "IR"},
-            {"city": "Agnew", "airport": "Agnew Airport", "iata": "AGW", "country": "AU"},
-            {"city": "Agno", "airport": "Lugano Airport", "iata": "LUG", "country": "CH"},
-            {"city": "Agra", "airport": "Agra Airport / Agra Air Force Station", "iata": "AGR", "country": "IN"},
-            {"city": "Aguachica", "airport": "Hacaritama Airport", "iata": "HAY", "country": "CO"},
-            {"city": "Aguadilla", "airport": "Rafael Hernández International Airport", "iata": "BQN", "country": "PR"},
-            {"city": "Aguascalientes", "airport": "Jesús Terán Peredo International Airport", "iata": "AGU", "country": "MX"},
-            {"city": "Aguni", "airport": "Aguni Airport", "iata": "AGJ", "country": "JP"},
-            {"city": "Ahe Atoll", "airport": "Ahe Airport", "iata": "AHE", "country": "PF"},
-            {"city": "Ahl Angad", "airport": "Oujda Angads Airport", "iata": "OUD", "country": "MA"},
-            {"city": "Ahmed Al Jaber AB", "airport": "Ahmed Al Jaber Air Base", "iata": "XIJ", "country": "KW"},
-            {"city": "Ahmedabad", "airport": "Sardar Vallabh Bhai Patel International Airport", "iata": "AMD", "country": "IN"},
-            {"city": "Ahuano", "airport": "Jumandy Airport", "iata": "TNW", "country": "EC"},
-            {"city": "Ahuas", "airport": "Ahuas Airport", "iata": "AHS", "country": "HN"},
-            {"city": "Ahvaz", "airport": "Lieutenant General Qasem Soleimani International Airport", "iata": "AWZ", "country": "IR"},
-            {"city": "Ai-Ais", "airport": "Ai-Ais Airport", "iata": "AIW", "country": "NA"},
-            {"city": "Aiambak", "airport": "Aiambak Airport", "iata": "AIH", "country": "PG"},
-            {"city": "Aiken", "airport": "Aiken Regional Airport", "iata": "AIK", "country": "US"},
-            {"city": "Ailinglapalap Atoll", "airport": "Jabot Airport", "iata": "JAT", "country": "MH"},
-            {"city": "Ailinglapalap Atoll", "airport": "Jeh Airport", "iata": "JEJ", "country": "MH"},
-            {"city": "Ailuk Island", "airport": "Ailuk Airport", "iata": "AIM", "country": "MH"},
-            {"city": "Ain District", "airport": "Al Ain Airport Ain District, Shabwah Governorate, Yemen", "iata": "WDA", "country": "YE"},
-            {"city": "Ainsworth", "airport": "Ainsworth Regional Airport", "iata": "ANW", "country": "US"},
-            {"city": "Aiome", "airport": "Aiome Airport", "iata": "AIE", "country": "PG"},
-            {"city": "Aioun El Atrouss", "airport": "Aioun el Atrouss Airport", "iata": "AEO", "country": "MR"},
-            {"city": "Aishalton", "airport": "Aishalton Airport", "iata": "AHL", "country": "GY"},
-            {"city": "Aitape", "airport": "Aitape Airport", "iata": "ATP", "country": "PG"},
-            {"city": "Aitape", "airport": "Tadji Airport", "iata": "TAJ", "country": "PG"},
-            {"city": "Aitutaki", "airport": "Aitutaki Airport", "iata": "AIT", "country": "CK"},
-            {"city": "Aiyura Valley", "airport": "Aiyura Airport", "iata": "AYU", "country": "PG"},
-            {"city": "Aizawl (Lengpui)", "airport": "Lengpui Airport", "iata": "AJL", "country": "IN"},
-            {"city": "Ajaccio", "airport": "Ajaccio Napoléon Bonaparte airport", "iata": "AJA", "country": "FR"},
-            {"city": "Ajmer (Kishangarh)", "airport": "Kishangarh Airport Ajmer", "iata": "KQH", "country": "IN"},
-            {"city": "Akhiok", "airport": "Akhiok Airport", "iata": "AKK", "country": "US"},
-            {"city": "Akiachak", "airport": "Akiachak Airport", "iata": "KKI", "country": "US"},
-            {"city": "Akiak", "airport": "Akiak Airport", "iata": "AKI", "country": "US"},
-            {"city": "Akieni", "airport": "Akieni Airport", "iata": "AKE", "country": "GA"},
-            {"city": "Akita", "airport": "Akita Airport", "iata": "AXT", "country": "JP"},
-            {"city": "Akjoujt", "airport": "Akjoujt Airport", "iata": "AJJ", "country": "MR"},
-            {"city": "Aklavik", "airport": "Aklavik/Freddie Carmichael Airport", "iata": "LAK", "country": "CA"},
-            {"city": "Akola", "airport": "Akola Airport", "iata": "AKD", "country": "IN"},
-            {"city": "Akron", "airport": "Colorado Plains Regional Airport", "iata": "AKO", "country": "US"},
-            {"city": "Akron", "airport": "Akron Fulton International Airport", "iata": "AKC", "country": "US"},
-            {"city": "Akron", "airport": "Akron Canton Regional Airport", "iata": "CAK", "country": "US"},
-            {"city": "Akrotiri", "airport": "RAF Akrotiri", "iata": "AKT", "country": "CY"},
-            {"city": "Aksu (Onsu)", "airport": "Aksu Hongqipo Airport", "iata": "AKU", "country": "CN"},
-            {"city": "Aktau", "airport": "Aktau Airport", "iata": "SCO", "country": "KZ"},
-            {"city": "Aktobe", "airport": "Aktobe Airport", "iata": "AKX", "country": "KZ"},
-            {"city": "Akulivik", "airport": "Akulivik Airport", "iata": "AKV", "country": "CA"},
-            {"city": "Akunnaaq", "airport": "Akunnaaq Heliport", "iata": "QCU", "country": "GL"},
-            {"city": "Akure", "airport": "Akure Airport", "iata": "AKR", "country": "NG"},
-            {"city": "Akureyri", "airport": "Akureyri Airport", "iata": "AEY", "country": "IS"},
-            {"city": "Akutan", "airport": "Akutan Airport", "iata": "KQA", "country": "US"},
-            {"city": "Akwi", "airport": "Humera Airport", "iata": "HUE", "country": "ET"},
-            {"city": "Al Aaroui", "airport": "Nador Al Aaroui International Airport", "iata": "NDR", "country": "MA"},
-            {"city": "Al Ain", "airport": "Al Ain International Airport", "iata": "AAN", "country": "AE"},
-            {"city": "Al Albraq", "airport": "Al Abraq International Airport", "iata": "LAQ", "country": "LY"},
-            {"city": "Al Dabbah", "airport": "Al Dabbah Airport", "iata": "EDB", "country": "SD"},
-            {"city": "Al Ghaydah", "airport": "Al Ghaydah International Airport", "iata": "AAY", "country": "YE"},
-            {"city": "Al Habbaniyah", "airport": "Al Taqaddum Air Base", "iata": "TQD", "country": "IQ"},
-            {"city": "Al Hoceima", "airport": "Cherif Al Idrissi Airport", "iata": "AHU", "country": "MA"},
-            {"city": "Al Jiza", "airport": "Sphinx International Airport", "iata": "SPX", "country": "EG"},
-            {"city": "Al Kharj", "airport": "Prince Sultan Air Base", "iata": "AKH", "country": "SA"},
-            {"city": "Al Masna'ah", "airport": "Mussanah Airport", "iata": "MNH", "country": "OM"},
-            {"city": "Al Ula", "airport": "Majeed Bin Abdulaziz Airport", "iata": "ULH", "country": "SA"},
-            {"city": "Al Wajh", "airport": "Al Wajh Domestic Airport", "iata": "EJH", "country": "SA"},
-            {"city": "Al-Baha", "airport": "King Saud Bin Abdulaziz (Al Baha) Airport", "iata": "ABT", "country": "SA"},
-            {"city": "Al-Bayda", "airport": "Al-Bayda Airport", "iata": "BYD", "country": "YE"},
-            {"city": "Al-Bough", "airport": "Al-Bough Airport", "iata": "BUK", "country": "YE"},
-            {"city": "Al-Jawf", "airport": "Al-Jawf Domestic Airport", "iata": "AJF", "country": "SA"},
-            {"city": "Alajero, La Gomera Island", "airport": "La Gomera Airport", "iata": "GMZ", "country": "ES"},
-            {"city": "Alakanuk", "airport": "Alakanuk Airport", "iata": "AUK", "country": "US"},
-            {"city": "Alamogordo", "airport": "Alamogordo White Sands Regional Airport", "iata": "ALM", "country": "US"},
-            {"city": "Alamogordo", "airport": "Holloman Air Force Base", "iata": "HMN", "country": "US"},
-            {"city": "Alamosa", "airport": "San Luis Valley Regional Airport/Bergman Field", "iata": "ALS", "country": "US"},
-            {"city": "Alava", "airport": "Vitoria Airport", "iata": "VIT", "country": "ES"},
-            {"city": "Albacete", "airport": "Albacete Airport / Los Llanos Air Base", "iata": "ABC", "country": "ES"},
-            {"city": "Albany", "airport": "Southwest Georgia Regional Airport", "iata": "ABY", "country": "US"},
-            {"city": "Albany", "airport": "Albany International Airport", "iata": "ALB", "country": "US"},
-            {"city": "Albany", "airport": "Ohio University Airport", "iata": "ATO", "country": "US"},
-            {"city": "Albany", "airport": "Albany Airport", "iata": "ALH", "country": "AU"},
-            {"city": "Albert", "airport": "Albert Bray airport", "iata": "BYF", "country": "FR"},
-            {"city": "Albert Lea", "airport": "Albert Lea Municipal Airport", "iata": "AEL", "country": "US"},
-            {"city": "Albi", "airport": "Albi Le Sequestre airport", "iata": "LBI", "country": "FR"},
-            {"city": "Albian Village", "airport": "Fort MacKay/Albian Aerodrome", "iata": "JHL", "country": "CA"},
-            {"city": "Albina", "airport": "Albina Airport", "iata": "ABN", "country": "SR"},
-            {"city": "Albion Park Rail", "airport": "Shellharbour Airport", "iata": "WOL", "country": "AU"},
-            {"city": "Albrook", "airport": "Marcos A. Gelabert International Airport", "iata": "PAC", "country": "PA"},
-            {"city": "Albuquerque", "airport": "Albuquerque International Sunport", "iata": "ABQ", "country": "US"},
-            {"city": "Alcoa", "airport": "McGhee Tyson Airport", "iata": "TYS", "country": "US"},
-            {"city": "Aldan", "airport": "Aldan Airport", "iata": "ADH", "country": "RU"},
-            {"city": "Alegrete", "airport": "Alegrete Novo Airport", "iata": "ALQ", "country": "BR"},
-            {"city": "Aleknagik", "airport": "Aleknagik / New Airport", "iata": "WKK", "country": "US"},
-            {"city": "Aleksandrovsk-Sakhalinskiy", "airport": "Aleksandrovsk-Sakhalinskiy Airport", "iata": "UHS", "country": "RU"},
-            {"city": "Alenquer", "airport": "Alenquer Municipal Airport", "iata": "ALT", "country": "BR"},
-            {"city": "Aleppo", "airport": "Aleppo International Airport", "iata": "ALP", "country": "SY"},
-            {"city": "Alert", "airport": "Alert Airport", "iata": "YLT", "country": "CA"},
-            {"city": "Alert Bay", "airport": "Alert Bay Airport", "iata": "YAL", "country": "CA"},
-            {"city": "Alexander Bay", "airport": "Alexander Bay Airport", "iata": "ALJ", "country": "ZA"},
-            {"city": "Alexander City", "airport": "Thomas C Russell Field", "iata": "ALX", "country": "US"},
-            {"city": "Alexandra", "airport": "Alexandra Aerodrome", "iata": "ALR", "country": "NZ"},
-            {"city": "Alexandria", "airport": "Borj El Arab International Airport", "iata": "HBE", "country": "EG"},
-            {"city": "Alexandria", "airport": "Alexandria International Airport", "iata": "AEX", "country": "US"},
-            {"city": "Alexandria", "airport": "Chandler Field", "iata": "AXN", "country": "US"},
-            {"city": "Alexandria", "airport": "Esler Army Airfield / Esler Regional Airport", "iata": "ESF", "country": "US"},
-            {"city": "Alexandria Bay", "airport": "Maxson Airfield", "iata": "AXB", "country": "US"},
-            {"city": "Alexandroupolis", "airport": "Alexandroupoli Democritus Airport", "iata": "AXD", "country": "GR"},
-            {"city": "Alghero", "airport": "Alghero-Fertilia Airport", "iata": "AHO", "country": "IT"},
-            {"city": "Algiers", "airport": "Houari Boumediene Airport", "iata": "ALG", "country": "DZ"},
-            {"city": "Algona", "airport": "Algona Municipal Airport", "iata": "AXG", "country": "US"},
-            {"city": "Ali-Sabieh", "airport": "Ali-Sabieh Airport", "iata": "AII", "country": "DJ"},
-            {"city": "Alicante", "airport": "Alicante-Elche Miguel Hernández Airport", "iata": "ALC", "country": "ES"},
-            {"city": "Alice", "airport": "Alice International Airport", "iata": "ALI", "country": "US"},
-            {"city": "Alice Springs", "airport": "Alice Springs Airport", "iata": "ASP", "country": "AU"},
-            {"city": "Aliceville", "airport": "George Downer Airport", "iata": "AIV", "country": "US"},
-            {"city": "Aligarh", "airport": "Aligarh Airport", "iata": "HRH", "country": "IN"},
-            {"city": "Allahabad", "airport": "Prayagraj Airport", "iata": "IXD", "country": "IN"},
-            {"city": "Allakaket", "airport": "Allakaket Airport", "iata": "AET", "country": "US"},
-            {"city": "Alldays", "airport": "Alldays Airport", "iata": "ADY", "country": "ZA"},
-            {"city": "Allentown", "airport": "Lehigh Valley International Airport", "iata": "ABE", "country": "US"},
-            {"city": "Alliance", "airport": "Alliance Municipal Airport", "iata": "AIA", "country": "US"},
-            {"city": "Alluitsup Paa", "airport": "Alluitsup Paa Heliport", "iata": "LLU", "country": "GL"},
-            {"city": "Alma", "airport": "Alma Airport", "iata": "YTF", "country": "CA"},
-            {"city": "Alma", "airport": "Gratiot Community Airport", "iata": "AMN", "country": "US"},
-            {"city": "Almaty", "airport": "Almaty International Airport", "iata": "ALA", "country": "KZ"},
-            {"city": "Almeirim", "airport": "Monte Dourado - Serra do Areão Airport", "iata": "MEU", "country": "BR"},
-            {"city": "Almeirim", "airport": "Almeirim Airport", "iata": "GGF", "country": "BR"},
-            {"city": "Almenara", "airport": "Cirilo Queiróz Airport", "iata": "AMJ", "country": "BR"},
-            {"city": "Almería", "airport": "Almería Airport", "iata": "LEI", "country": "ES"},
-            {"city": "Alofi", "airport": "Niue International Airport", "iata": "IUE", "country": "NU"},
-            {"city": "Alor Satar", "airport": "Sultan Abdul Halim Airport", "iata": "AOR", "country": "MY"},
-            {"city": "Alpena", "airport": "Alpena County Regional Airport", "iata": "APN", "country": "US"},
-            {"city": "Alpha", "airport": "Alpha Airport", "iata": "ABH", "country": "AU"},
-            {"city": "Alpine", "airport": "Alpine Casparis Municipal Airport", "iata": "ALE", "country": "US"},
-            {"city": "Alpurrurulam", "airport": "Lake Nash Airport", "iata": "LNH", "country": "AU"},
-            {"city": "Alroy Downs", "airport": "Alroy Downs Airport", "iata": "AYD", "country": "AU"},
-            {"city": "Alstahaug", "airport": "Sandnessjøen Airport, Stokka", "iata": "SSJ", "country": "NO"},
-            {"city": "Alta", "airport": "Alta Airport", "iata": "ALF", "country": "NO"},
-            {"city": "Alta Floresta", "airport": "Piloto Osvaldo Marques Dias Airport", "iata": "AFL", "country": "BR"},
-            {"city": "Altai", "airport": "Altai Airport", "iata": "LTI", "country": "MN"},
-            {"city": "Altamira", "airport": "Altamira Interstate Airport", "iata": "ATM", "country": "BR"},
-            {"city": "Altay", "airport": "Altay Xuedu Airport", "iata": "AAT", "country": "CN"},
-            {"city": "Alto", "airport": "Sierra Blanca Regional Airport", "iata": "RUI", "country": "US"},
-            {"city": "Alto Molocue", "airport": "Alto Molocue Airport", "iata": "AME", "country": "MZ"},
-            {"city": "Alto Parnaíba", "airport": "Alto Parnaíba Airport", "iata": "APY", "country": "BR"},
-            {"city": "Alto Rio Senguerr", "airport": "D. Casimiro Szlapelis Airport", "iata": "ARR", "country": "AR"},
-            {"city": "Alton/St Louis", "airport": "St Louis Regional Airport", "iata": "ALN", "country": "US"},
-            {"city": "Altoona", "airport": "Altoona Blair County Airport", "iata": "AOO", "country": "US"},
-            {"city": "Altus", "airport": "Altus Quartz Mountain Regional Airport", "iata": "AXS", "country": "US"},
-            {"city": "Altus", "airport": "Altus Air Force Base", "iata": "LTS", "country": "US"},
-            {"city": "Altıntaş", "airport": "Zafer Airport", "iata": "KZR", "country": "TR"},
-            {"city": "Alula", "airport": "Alula Airport", "iata": "ALU", "country": "SO"},
-            {"city": "Am Timan", "airport": "Am Timan Airport", "iata": "AMC", "country": "TD"},
-            {"city": "Amagi", "airport": "Tokunoshima Airport", "iata": "TKN", "country": "JP"},
-            {"city": "Amahai", "airport": "Amahai Airport", "iata": "AHI", "country": "ID"},
-            {"city": "Amakusa", "airport": "Amakusa Airport", "iata": "AXJ", "country": "JP"},
-            {"city": "Amalfi", "airport": "Amalfi Airport", "iata": "AFI", "country": "CO"},
-            {"city": "Amami", "airport": "Amami Airport", "iata": "ASJ", "country": "JP"},
-            {"city": "Amanab", "airport": "Amanab Airport", "iata": "AMU", "country": "PG"},
-            {"city": "Amarillo", "airport": "Rick Husband Amarillo International Airport", "iata": "AMA", "country": "US"},
-            {"city": "Amarillo", "airport": "Tradewind Airport", "iata": "TDW", "country": "US"},
-            {"city": "Amasya", "airport": "Amasya Merzifon Airport", "iata": "MZH", "country": "TR"},
-            {"city": "Ambato", "airport": "Chachoán Regional Airport", "iata": "ATF", "country": "EC"},
-            {"city": "Ambatolahy", "airport": "Ambatolhy Airport", "iata": "AHY", "country": "MG"},
-            {"city": "Ambatondrazaka", "airport": "Ambatondrazaka Airport", "iata": "WAM", "country": "MG"},
-            {"city": "Ambikapur", "airport": "Maa Mahamaya Airport", "iata": "AHA", "country": "IN"},
-            {"city": "Ambler", "airport": "Ambler Airport", "iata": "ABL", "country": "US"},
-            {"city": "Amboin", "airport": "Karawari Airstrip", "iata": "KRJ", "country": "PG"},
-            {"city": "Ambon", "airport": "Pattimura International Airport", "iata": "AMQ", "country": "ID"},
-            {"city": "Amboseli National Park", "airport": "Amboseli Airport", "iata": "ASV", "country": "KE"},
-            {"city": "Ambriz", "airport": "Ambriz Airport", "iata": "AZZ", "country": "AO"},
-            {"city": "Ambrym Island", "airport": "Uléi Airport", "iata": "ULB", "country": "VU"},
-            {"city": "Ambunti", "airport": "Ambunti Airport", "iata": "AUJ", "country": "PG"},
-            {"city": "Amderma", "airport": "Amderma Airport", "iata": "AMV", "country": "RU"},
-            {"city": "Amery", "airport": "Amery Municipal Airport", "iata": "AHH", "country": "US"},
-            {"city": "Ames", "airport": "Ames Municipal Airport", "iata": "AMW", "country": "US"},
-            {"city": "Amgotro", "airport": "Yuruf Airport [UNUSABLE]", "iata": "RUF", "country": "ID"},
-            {"city": "Amgu", "airport": "Amgu Airport", "iata": "AEM", "country": "RU"},
-            {"city": "Amirabad", "airport": "Nojeh Air Base", "iata": "NUJ", "country": "IR"},
-            {"city": "Amman", "airport": "Queen Alia International Airport", "iata": "AMM", "country": "JO"},
-            {"city": "Amman", "airport": "Amman Civil (Marka International) Airport", "iata": "ADJ", "country": "JO"},
-            {"city": "Ammassivik", "airport": "Ammassivik Heliport", "iata": "QUW", "country": "GL"},
-            {"city": "Amol", "airport": "Bishe Kola Air Base", "iata": "BSM", "country": "IR"},
-            {"city": "Amook Bay", "airport": "Amook Bay Seaplane Base", "iata": "AOS", "country": "US"},
-            {"city": "Amos", "airport": "Amos/Magny Airport", "iata": "YEY", "country": "CA"},
-            {"city": "Ampanihy", "airport": "Ampanihy Airport", "iata": "AMP", "country": "MG"},
-            {"city": "Ampara", "airport": "Kondavattavana Tank Seaplane Base", "iata": "AFK", "country": "LK"},
-            {"city": "Ampara", "airport": "Ampara Airport", "iata": "ADP", "country": "LK"},
-            {"city": "Amritsar", "airport": "Sri Guru Ram Dass Jee International Airport", "iata": "ATQ", "country": "IN"},
-            {"city": "Amsterdam", "airport": "Amsterdam Airport Schiphol", "iata": "AMS", "country": "NL"},
-            {"city": "Anaa", "airport": "Anaa Airport", "iata": "AAA", "country": "PF"},
-            {"city": "Anaco", "airport": "Anaco Airport", "iata": "AAO", "country": "VE"},
-            {"city": "Anacortes", "airport": "Anacortes Airport", "iata": "OTS", "country": "US"},
-            {"city": "Anadyr", "airport": "Ugolny Yuri Ryktheu Airport", "iata": "DYR", "country": "RU"},
-            {"city": "Anahim Lake", "airport": "Anahim Lake Airport", "iata": "YAA", "country": "CA"},
-            {"city": "Anaktuvuk Pass", "airport": "Anaktuvuk Pass Airport", "iata": "AKP", "country": "US"},
-            {"city": "Analalava", "airport": "Analalava Airport", "iata": "HVA", "country": "MG"},
-            {"city": "Anatom Island", "airport": "Aneityum Airport", "iata": "AUY", "country": "VU"},
-            {"city": "Anchorage", "airport": "Elmendorf Air Force Base", "iata": "EDF", "country": "US"},
-            {"city": "Anchorage", "airport": "Merrill Field", "iata": "MRI", "country": "US"},
-            {"city": "Anchorage", "airport": "Ted Stevens Anchorage International Airport", "iata": "ANC", "country": "US"},
-            {"city": "Ancud", "airport": "Pupelde Airport", "iata": "ZUD", "country": "CL"},
-            {"city": "Andahuaylas", "airport": "Andahuaylas Airport", "iata": "ANS", "country": "PE"},
-            {"city": "Andamooka", "airport": "Andamooka Airport", "iata": "ADO", "country": "AU"},
-            {"city": "Andavadoaka", "airport": "Andavadoaka Airport", "iata": "DVD", "country": "MG"},
-            {"city": "Andekombe", "airport": "Andakombe Airport", "iata": "ADC", "country": "PG"},
-            {"city": "Andenes", "airport": "Andøya Airport, Andenes", "iata": "ANX", "country": "NO"},
-            {"city": "Anderson", "airport": "Anderson Municipal Darlington Field", "iata": "AID", "country": "US"},
-            {"city": "Anderson", "airport": "Anderson Regional Airport", "iata": "AND", "country": "US"},
-            {"city": "Andizhan", "airport": "Andizhan Airport", "iata": "AZN", "country": "UZ"},
-            {"city": "Andoas", "airport": "Alferez FAP Alfredo Vladimir Sara Bauer Airport", "iata": "AOP", "country": "PE"},
-            {"city": "Andravida", "airport": "Andravida Air Base", "iata": "PYR", "country": "GR"},
-            {"city": "Andrews", "airport": "Robert F Swinnie Airport", "iata": "ADR", "country": "US"},
-            {"city": "Andriamena", "airport": "Andriamena Airport", "iata": "WAD", "country": "MG"},
-            {"city": "Andros", "airport": "Congo Town Airport", "iata": "TZN", "country": "BS"},
-            {"city": "Andros Island", "airport": "San Andros Airport", "iata": "SAQ", "country": "BS"},
-            {"city": "Andros Town", "airport": "Andros Town Airport", "iata": "ASD", "country": "BS"},
-            {"city": "Andrézieux-Bouthéon, Loire", "airport": "Saint-Étienne-Bouthéon Airport", "iata": "EBU", "country": "FR"},
-            {"city": "Andulo", "airport": "Andulo Airport", "iata": "ANL", "country": "AO"},
-            {"city": "Anegada", "airport": "Captain Auguste George Airport", "iata": "NGD", "country": "VG"},
-            {"city": "Angaha, Niuafo'ou Island", "airport": "Mata'aho Airport", "iata": "NFO", "country": "TO"},
-            {"city": "Angel Fire", "airport": "Angel Fire Airport", "iata": "AXX", "country": "US"},
-            {"city": "Angelsey", "airport": "Anglesey Airport", "iata": "VLY", "country": "GB"},
-            {"city": "Angers", "airport": "Angers Marcé airport", "iata": "ANE", "country": "FR"},
-            {"city": "Anggi-Papua Island", "airport": "Anggi Airport", "iata": "AGD", "country": "ID"},
-            {"city": "Angleton", "airport": "Texas Gulf Coast Regional Airport", "iata": "LJN", "country": "US"},
-            {"city": "Angling Lake", "airport": "Wapekeka Airport", "iata": "YAX", "country": "CA"},
-            {"city": "Angoche", "airport": "Angoche Airport", "iata": "ANO", "country": "MZ"},
-            {"city": "Angola", "airport": "Tri State Steuben County Airport", "iata": "ANQ", "country": "US"},
-            {"city": "Angoon", "airport": "Angoon Seaplane Base", "iata": "AGN", "country": "US"},
-            {"city": "Angoram", "airport": "Angoram Airport", "iata": "AGG", "country": "PG"},
-            {"city": "Angoulême", "airport": "Angoulême Brie-Champniers airport", "iata": "ANG", "country": "FR"},
-            {"city": "Angra dos Reis", "airport": "Angra dos Reis Airport", "iata": "GDR", "country": "BR"},
-            {"city": "Anguganak", "airport": "Anguganak Airport", "iata": "AKG", "country": "PG"},
-            {"city": "Angus Downs Station", "airport": "Angus Downs Airport", "iata": "ANZ", "country": "AU"},
-            {"city": "Aniak", "airport": "Aniak Airport", "iata": "ANI", "country": "US"},
-            {"city": "Aniwa", "airport": "Aniwa Airport", "iata": "AWD", "country": "VU"},
-            {"city": "Anjo Peninsula", "airport": "Truscott-Mungalalu Airport", "iata": "TTX", "country": "AU"},
-            {"city": "Ankang (Hanbin)", "airport": "Ankang Fuqiang Airport", "iata": "AKA", "country": "CN"},
-            {"city": "Ankara", "airport": "Esenboğa International Airport", "iata": "ESB", "country": "TR"},
-            {"city": "Ankara", "airport": "Etimesgut Air Base", "iata": "ANK", "country": "TR"},
-            {"city": "Ankavandra", "airport": "Ankavandra Airport", "iata": "JVA", "country": "MG"},
-            {"city": "Ankazoabo", "airport": "Ankazoabo Airport", "iata": "WAK", "country": "MG"},
-            {"city": "Ankisatra", "airport": "Tsimiroro Airport", "iata": "TZO", "country": "MG"},
-            {"city": "Ankokoambo", "airport": "Ankokoambo Airport", "iata": "NKO", "country": "MG"},
-            {"city": "Ann Arbor", "airport": "Ann Arbor Municipal Airport", "iata": "ARB", "country": "US"},
-            {"city": "Annaba", "airport": "Annaba Rabah Bitat Airport", "iata": "AAE", "country": "DZ"},
-            {"city": "Annai", "airport": "Annai Airport", "iata": "NAI", "country": "GY"},
-            {"city": "Annapolis", "airport": "Lee Airport", "iata": "ANP", "country": "US"},
-            {"city": "Annecy", "airport": "Annecy Meythet airport", "iata": "NCY", "country": "FR"},
-            {"city": "Anniston", "airport": "Anniston Regional Airport", "iata": "ANB", "country": "US"},
-            {"city": "Anqing", "airport": "Anqing Tianzhushan Airport / Anqing North Air Base", "iata": "AQG", "country": "CN"},
-            {"city": "Anshan", "airport": "Anshan Teng'ao Airport / Anshan Air Base", "iata": "AOG", "country": "CN"},
-            {"city": "Anshun (Xixiu)", "airport": "Anshun Huangguoshu Airport", "iata": "AVA", "country": "CN"},
-            {"city": "Anta", "airport": "Comandante FAP German Arias Graziani Airport", "iata": "ATA", "country": "PE"},
-            {"city": "Antakya", "airport": "Hatay Airport", "iata": "HTY", "country": "TR"},
-            {"city": "Antalya", "airport": "Antalya International Airport", "iata": "AYT", "country": "TR"},
-            {"city": "Antananarivo", "airport": "Ivato Airport", "iata": "TNR", "country": "MG"},
-            {"city": "Anthony", "airport": "Anthony Municipal Airport", "iata": "ANY", "country": "US"},
-            {"city": "Antisiranana", "airport": "Arrachart Airport", "iata": "DIE", "country": "MG"},
-            {"city": "Antlers", "airport": "Antlers Municipal Airport", "iata": "ATE", "country": "US"},
-            {"city": "Antofagasta", "airport": "Andrés Sabella Gálvez International Airport", "iata": "ANF", "country": "CL"},
-            {"city": "Antsalova", "airport": "Antsalova Airport", "iata": "WAQ", "country": "MG"},
-            {"city": "Antsirabe", "airport": "Antsirabe Airport", "iata": "ATJ", "country": "MG"},
-            {"city": "Antsirabe", "airport": "Antsirabe Airport", "iata": "ANM", "country": "MG"},
-            {"city": "Antsohihy", "airport": "Ambalabe Airport", "iata": "WAI", "country": "MG"},
-            {"city": "Antwerp", "airport": "Antwerp International Airport (Deurne)", "iata": "ANR", "country": "BE"},
-            {"city": "Anua", "airport": "Bellona/Anua Airport", "iata": "BNY", "country": "SB"},
-            {"city": "Anuradhapura", "airport": "Anuradhapura Airport", "iata": "ACJ", "country": "LK"},
-            {"city": "Anvik", "airport": "Anvik Airport", "iata": "ANV", "country": "US"},
-            {"city": "Anyang", "airport": "Anyang Yindu Airport", "iata": "AYN", "country": "CN"},
-            {"city": "Anyang", "airport": "Anyang Hongqiqu Airport", "iata": "HQQ", "country": "CN"},
-            {"city": "Anápolis", "airport": "Anápolis Airport", "iata": "APS", "country": "BR"},
-            {"city": "Aomori", "airport": "Aomori Airport", "iata": "AOJ", "country": "JP"},
-            {"city": "Apalachicola", "airport": "Apalachicola Regional Airport", "iata": "AAF", "country": "US"},
-            {"city": "Apalapsili", "airport": "Apalapsili Airport", "iata": "AAS", "country": "ID"},
-            {"city": "Apapelgino", "airport": "Pevek Airport", "iata": "PWE", "country": "RU"},
-            {"city": "Apataki", "airport": "Apataki Airport", "iata": "APK", "country": "PF"},
-            {"city": "Apatity", "airport": "Kirovsk-Apatity Airport", "iata": "KVK", "country": "RU"},
-            {"city": "Apatzingán", "airport": "Apatzingán - Pablo L. Sidar Airport", "iata": "AZG", "country": "MX"},
-            {"city": "Apia", "airport": "Faleolo International Airport", "iata": "APW", "country": "WS"},
-            {"city": "Apia", "airport": "Fagali'i Airport", "iata": "FGI", "country": "WS"},
-            {"city": "Apiay", "airport": "Gomez Nino Apiay Air Base", "iata": "API", "country": "CO"},
-            {"city": "Apolo", "airport": "Apolo Airport", "iata": "APB", "country": "BO"},
-            {"city": "Apple Valley", "airport": "Apple Valley Airport", "iata": "APV", "country": "US"},
-            {"city": "Appleton", "airport": "Appleton International Airport", "iata": "ATW", "country": "US"},
-            {"city": "April River", "airport": "April River Airport", "iata": "APR", "country": "PG"},
-            {"city": "Apucarana", "airport": "Captain João Busse Airport", "iata": "APU", "country": "BR"},
-            {"city": "Apuí", "airport": "Apuí Airport", "iata": "IUP", "country": "BR"},
-            {"city": "Aqaba", "airport": "Aqaba King Hussein International Airport", "iata": "AQJ", "country": "JO"},
-            {"city": "Ar Rawdah", "airport": "Ar Rawdah Airport", "iata": "RXA", "country": "YE"},
-            {"city": "Ar Rayyan", "airport": "Al Udeid Air Base", "iata": "XJD", "country": "QA"},
-            {"city": "Araak", "airport": "Arak Airport", "iata": "AJK", "country": "IR"},
-            {"city": "Aracaju", "airport": "Aracaju - Santa Maria International Airport", "iata": "AJU", "country": "BR"},
-            {"city": "Aracati", "airport": "Aracati Dragão do Mar Regional Airport", "iata": "ARX", "country": "BR"},
-            {"city": "Arad", "airport": "Arad International Airport", "iata": "ARW", "country": "RO"},
-            {"city": "Aragarças", "airport": "Aragarças Airport", "iata": "ARS", "country": "BR"},
-            {"city": "Araguaína", "airport": "Araguaína Airport", "iata": "AUX", "country": "BR"},
-            {"city": "Aral", "airport": "Aral Tarim Airport", "iata": "ACF", "country": "CN"},
-            {"city": "Arandis", "airport": "Arandis Airport", "iata": "ADI", "country": "NA"},
-            {"city": "Arapahoe", "airport": "Arapahoe Municipal Airport", "iata": "AHF", "country": "US"},
-            {"city": "Arapiraca", "airport": "Arapiraca Airport", "iata": "APQ", "country": "BR"},
-            {"city": "Arapongas", "airport": "Arapongas Airport", "iata": "APX", "country": "BR"},
-            {"city": "Arar", "airport": "Arar Domestic Airport", "iata": "RAE", "country": "SA"},
-            {"city": "Araracuara", "airport": "Araracuara Airport", "iata": "ACR", "country": "CO"},
-            {"city": "Araraquara", "airport": "Araraquara Airport", "iata": "AQA", "country": "BR"},
-            {"city": "Ararat", "airport": "Ararat Airport", "iata": "ARY", "country": "AU"},
-            {"city": "Araripina", "airport": "Araripina Airport", "iata": "JAW", "country": "BR"},
-            {"city": "Arathusa", "airport": "Arathusa Safari Lodge Airport", "iata": "ASS", "country": "ZA"},
-            {"city": "Arauca", "airport": "Santiago Perez Airport", "iata": "AUC", "country": "CO"},
-            {"city": "Arauquita", "airport": "El Troncal Airport", "iata": "ARQ", "country": "CO"},
-            {"city": "Arawa", "airport": "Arawa Airport", "iata": "RAW", "country": "PG"},
-            {"city": "Araxá", "airport": "Romeu Zema Airport", "iata": "AAX", "country": "BR"},
-            {"city": "Araçatuba", "airport": "Araçatuba Airport", "iata": "ARU", "country": "BR"},
-            {"city": "Araçuaí", "airport": "Araçuaí Airport", "iata": "AIY", "country": "BR"},
-            {"city": "Arba Minch", "airport": "Arba Minch Airport", "iata": "AMH", "country": "ET"},
-            {"city": "Arbil", "airport": "Erbil International Airport", "iata": "EBL", "country": "IQ"},
-            {"city": "Arboletes", "airport": "Arboletes Airport", "iata": "ARO", "country": "CO"},
-            {"city": "Arcata/Eureka", "airport": "California Redwood Coast-Humboldt County Airport", "iata": "ACV", "country": "US"},
-            {"city": "Archangelsk", "airport": "Talagi Airport", "iata": "ARH", "country": "RU"},
-            {"city": "Arctic Bay", "airport": "Arctic Bay Airport", "iata": "YAB", "country": "CA"},
-            {"city": "Arctic Village", "airport": "Arctic Village Airport", "iata": "ARC", "country": "US"},
-            {"city": "Ardabil", "airport": "Ardabil Airport", "iata": "ADU", "country": "IR"},
-            {"city": "Ardmore", "airport": "Ardmore Downtown Executive Airport", "iata": "AHD", "country": "US"},
-            {"city": "Ardmore", "airport": "Ardmore Municipal Airport", "iata": "ADM", "country": "US"},
-            {"city": "Arecibo", "airport": "Antonio Nery Juarbe Pol Airport", "iata": "ARE", "country": "PR"},
-            {"city": "Arequipa", "airport": "Rodríguez Ballón International Airport", "iata": "AQP", "country": "PE"},
-            {"city": "Argos Orestiko", "airport": "Kastoria National Airport Aristotle", "iata": "KSO", "country": "GR"},
-            {"city": "Aribinda", "airport": "Aribinda Airport", "iata": "XAR", "country": "BF"},
-            {"city": "Arica", "airport": "Arica Airport", "iata": "ACM", "country": "CO"},
-            {"city": "Arica", "airport": "Chacalluta Airport", "iata": "ARI", "country": "CL"},
-            {"city": "Aripuanã", "airport": "Aripuanã Airport", "iata": "AIR", "country": "BR"},
-            {"city": "Ariquemes", "airport": "Ariquemes Airport", "iata": "AQM", "country": "BR"},
-            {"city": "Arkalyk", "airport": "Arkalyk North Airport", "iata": "AYK", "country": "KZ"},
-            {"city": "Arkhangelsk", "airport": "Vaskovo Airport", "iata": "VKV", "country": "RU"},
-            {"city": "Arlit", "airport": "Arlit Airport", "iata": "RLT", "country": "NE"},
-            {"city": "Arly", "airport": "Arly Airport", "iata": "ARL", "country": "BF"},
-            {"city": "Armenia", "airport": "El Eden Airport", "iata": "AXM", "country": "CO"},
-            {"city": "Armenia", "airport": "Puerto Nare Airport", "iata": "NAR", "country": "CO"},
-            {"city": "Armidale", "airport": "Armidale Airport", "iata": "ARM", "country": "AU"},
-            {"city": "Armstrong", "airport": "Armstrong Airport", "iata": "YYW", "country": "CA"},
-            {"city": "Arnavutköy, Istanbul", "airport": "İstanbul Airport", "iata": "IST", "country": "TR"},
-            {"city": "Arno Atoll", "airport": "Tinak Airport", "iata": "TIC", "country": "MH"},
-            {"city": "Arno Atoll", "airport": "Ine Airport", "iata": "IMI", "country": "MH"},
-            {"city": "Arona", "airport": "Ulawa Airport", "iata": "RNA", "country": "SB"},
-            {"city": "Arorae Island", "airport": "Arorae Island Airport", "iata": "AIS", "country": "KI"},
-            {"city": "Arraias", "airport": "Arraias Airport", "iata": "AAI", "country": "BR"},
-            {"city": "Arsuk", "airport": "Arsuk Heliport", "iata": "JRK", "country": "GL"},
-            {"city": "Artesia", "airport": "Artesia Municipal Airport", "iata": "ATS", "country": "US"},
-            {"city": "Arthur's Town", "airport": "Arthur's Town Airport", "iata": "ATC", "country": "BS"},
-            {"city": "Artigas", "airport": "Artigas International Airport", "iata": "ATI", "country": "UY"},
-            {"city": "Artyom", "airport": "Vladivostok International Airport", "iata": "VVO", "country": "RU"},
-            {"city": "Arua", "airport": "Arua Airport", "iata": "RUA", "country": "UG"},
-            {"city": "Arujá", "airport": "Unifly Heliport", "iata": "ZFU", "country": "BR"},
-            {"city": "Arusha", "airport": "Arusha Airport", "iata": "ARK", "country": "TZ"},
-            {"city": "Arusha", "airport": "Kilimanjaro International Airport", "iata": "JRO", "country": "TZ"},
-            {"city": "Arvaikheer", "airport": "Arvaikheer Airport", "iata": "AVK", "country": "MN"},
-            {"city": "Arviat", "airport": "Arviat Airport", "iata": "YEK", "country": "CA"},
-            {"city": "Arvidsjaur", "airport": "Arvidsjaur Airport", "iata": "AJR", "country": "SE"},
-            {"city": "Arxan", "airport": "Arxan Yi'ershi Airport", "iata": "YIE", "country": "CN"},
-            {"city": "As-Sulayyil", "airport": "As-Sulayyil Airport", "iata": "SLF", "country": "SA"},
-            {"city": "Asaba", "airport": "Asaba International Airport", "iata": "ABB", "country": "NG"},
-            {"city": "Asau", "airport": "Asau Airport", "iata": "AAU", "country": "WS"},
-            {"city": "Ascensión de Guarayos", "airport": "Ascención de Guarayos Airport", "iata": "ASC", "country": "BO"},
-            {"city": "Aseki", "airport": "Aseki Airport", "iata": "AEK", "country": "PG"},
-            {"city": "Ash Flat", "airport": "Sharp County Regional Airport", "iata": "CKK", "country": "US"},
-            {"city": "Ashaig", "airport": "Broadford Airstrip", "iata": "SKL", "country": "GB"},
-            {"city": "Ashburton", "airport": "Ashburton Airport", "iata": "ASG", "country": "NZ"},
-            {"city": "Asheville", "airport": "Asheville Regional Airport", "iata": "AVL", "country": "US"},
-            {"city": "Ashgabat", "airport": "Ashgabat International Airport", "iata": "ASB", "country": "TM"},
-            {"city": "Ashland", "airport": "John F Kennedy Memorial Airport", "iata": "ASX", "country": "US"},
-            {"city": "Ashland", "airport": "Ashland Municipal Airport Sumner Parker Field", "iata": "AHM", "country": "US"},
-            {"city": "Ashley", "airport": "Ashley Municipal Airport", "iata": "ASY", "country": "US"},
-            {"city": "Ashtabula", "airport": "Northeast Ohio Regional Airport", "iata": "JFN", "country": "US"},
-            {"city": "Asmara", "airport": "Asmara International Airport", "iata": "ASM", "country": "ER"},
-            {"city": "Asosa", "airport": "Asosa Airport", "iata": "ASO", "country": "ET"},
-            {"city": "Aspen", "airport": "Aspen-Pitkin County Airport (Sardy Field)", "iata": "ASE", "country": "US"},
-            {"city": "Assab", "airport": "Assab International Airport", "iata": "ASA", "country": "ER"},
-            {"city": "Assis", "airport": "Marcelo Pires Halzhausen Airport", "iata": "AIF", "country": "BR"},
-            {"city": "Astana", "airport": "Nursultan Nazarbayev International Airport", "iata": "NQZ", "country": "KZ"},
-            {"city": "Astoria", "airport": "Astoria Regional Airport", "iata": "AST", "country": "US"},
-            {"city": "Astrakhan", "airport": "Astrakhan Narimanovo Boris M. Kustodiev International Airport", "iata": "ASF", "country": "RU"},
-            {"city": "Astypalaia Island", "airport": "Astypalaia Airport", "iata": "JTY", "country": "GR"},
-            {"city": "Asunción", "airport": "Aeropuerto Internacional Silvio Pettirossi", "iata": "ASU", "country": "PY"},
-            {"city": "Aswan", "airport": "Aswan International Airport", "iata": "ASW", "country": "EG"},
-            {"city": "Asyut", "airport": "Asyut International Airport", "iata": "ATZ", "country": "EG"},
-            {"city": "At Tur", "airport": "At Tur Airport", "iata": "ELT", "country": "EG"},
-            {"city": "Atalaya", "airport": "Teniente General Gerardo Pérez Pinedo Airport", "iata": "AYX", "country": "PE"},
-            {"city": "Atambua", "airport": "AA Bere Tallo (Haliwen) Airport", "iata": "ABU", "country": "ID"},
-            {"city": "Ataq", "airport": "Ataq Airport", "iata": "AXK", "country": "YE"},
-            {"city": "Atar", "airport": "Atar International Airport", "iata": "ATR", "country": "MR"},
-            {"city": "Atbara", "airport": "Atbara Airport", "iata": "ATB", "country": "SD"},
-            {"city": "Atbasar", "airport": "Atbasar Airport", "iata": "ATX", "country": "KZ"},
-            {"city": "Athens", "airport": "Athens Ben Epps Airport", "iata": "AHN", "country": "US"},
-            {"city": "Athens", "airport": "McMinn County Airport", "iata": "MMI", "country": "US"},
-            {"city": "Ati", "airport": "Ati Airport", "iata": "ATV", "country": "TD"},
-            {"city": "Atikokan", "airport": "Atikokan Municipal Airport", "iata": "YIB", "country": "CA"},
-            {"city": "Atinjoe", "airport": "Teminabuan Airport", "iata": "TXM", "country": "ID"},
-            {"city": "Atiu Island", "airport": "Enua Airport", "iata": "AIU", "country": "CK"},
-            {"city": "Atizapán de Zaragoza", "airport": "Jorge Jiménez Cantú National Airport", "iata": "AZP", "country": "MX"},
-            {"city": "Atka", "airport": "Atka Airport", "iata": "AKB", "country": "US"},
-            {"city": "Atkamba Mission", "airport": "Atkamba Airport", "iata": "ABP", "country": "PG"},
-            {"city": "Atlanta", "airport": "Hartsfield Jackson Atlanta International Airport", "iata": "ATL", "country": "US"},
-            {"city": "Atlanta", "airport": "Fulton County Airport Brown Field", "iata": "FTY", "country": "US"},
-            {"city": "Atlanta", "airport": "DeKalb Peachtree Airport", "iata": "PDK", "country": "US"},
-            {"city": "Atlantic", "airport": "Atlantic Municipal Airport", "iata": "AIO", "country": "US"},
-            {"city": "Atlantic City", "airport": "Atlantic City International Airport", "iata": "ACY", "country": "US"},
-            {"city": "Atmautluak", "airport": "Atmautluak Airport", "iata": "ATT", "country": "US"},
-            {"city": "Atoifi", "airport": "Uru Harbour Airport", "iata": "ATD", "country": "SB"},
-            {"city": "Atqasuk", "airport": "Atqasuk Edward Burnell Sr Memorial Airport", "iata": "ATK", "country": "US"},
-            {"city": "Attawapiskat", "airport": "Attawapiskat Airport", "iata": "YAT", "country": "CA"},
-            {"city": "Atting", "airport": "Straubing Airport", "iata": "RBM", "country": "DE"},
-            {"city": "Attock", "airport": "Islamabad International Airport", "iata": "ISB", "country": "PK"},
-            {"city": "Attopeu", "airport": "Attopeu Airport", "iata": "AOU", "country": "LA"},
-            {"city": "Attu", "airport": "Attu Heliport", "iata": "QGQ", "country": "GL"},
-            {"city": "Attu", "airport": "Casco Cove Coast Guard Station", "iata": "ATU", "country": "US"},
-            {"city": "Atyrau", "airport": "Atyrau International Airport", "iata": "GUW", "country": "KZ"},
-            {"city": "Au", "airport": "Garasa Airport", "iata": "GRL", "country": "PG"},
-            {"city": "Aua Island", "airport": "Aua Island Airport", "iata": "AUI", "country": "PG"},
-            {"city": "Auburn", "airport": "Auburn Municipal Airport", "iata": "AUN", "country": "US"},
-            {"city": "Auburn", "airport": "Auburn University Regional Airport", "iata": "AUO", "country": "US"},
-            {"city": "Auburn/Lewiston", "airport": "Auburn Lewiston Municipal Airport", "iata": "LEW", "country": "US"},
-            {"city": "Auckland", "airport": "Auckland International Airport", "iata": "AKL", "country": "NZ"},
-            {"city": "Auckland City", "airport": "Mechanics Bay Heliport", "iata": "MHB", "country": "NZ"},
-            {"city": "Aue", "airport": "Mount Aue Airport", "iata": "UAE", "country": "PG"},
-            {"city": "Augsburg", "airport": "Augsburg Airport", "iata": "AGB", "country": "DE"},
-            {"city": "Augusta", "airport": "Augusta Regional At Bush Field", "iata": "AGS", "country": "US"},
-            {"city": "Augusta", "airport": "Augusta State Airport", "iata": "AUG", "country": "US"},
-            {"city": "Augusta", "airport": "Daniel Field", "iata": "DNL", "country": "US"},
-            {"city": "Auki", "airport": "Gwaunaru'u Airport", "iata": "AKS", "country": "SB"},
-            {"city": "Aumo", "airport": "Aumo Airport", "iata": "AUV", "country": "PG"},
-            {"city": "Aupaluk", "airport": "Aupaluk Airport", "iata": "YPJ", "country": "CA"},
-            {"city": "Aur Atoll", "airport": "Aur Island Airport", "iata": "AUL", "country": "MH"},
-            {"city": "Aurangabad", "airport": "Aurangabad Airport", "iata": "IXU", "country": "IN"},
-            {"city": "Aurillac", "airport": "Aurillac airport", "iata": "AUR", "country": "FR"},
-            {"city": "Aurora", "airport": "Buckley Space Force Base", "iata": "BFK", "country": "US"},
-            {"city": "Aurora", "airport": "Ladouanie Airport", "iata": "LDO", "country": "SR"},
-            {"city": "Aurukun", "airport": "Aurukun Airport", "iata": "AUU", "country": "AU"},
-            {"city": "Austin", "airport": "Austin Airport", "iata": "ASQ", "country": "US"},
-            {"city": "Austin", "airport": "Austin Municipal Airport", "iata": "AUM", "country": "US"},
-            {"city": "Austin", "airport": "Austin Bergstrom International Airport", "iata": "AUS", "country": "US"},
-            {"city": "Auvergne Station", "airport": "Auvergne Airport", "iata": "AVG", "country": "AU"},
-            {"city": "Auxerre", "airport": "Auxerre Branches airport", "iata": "AUF", "country": "FR"},
-            {"city": "Avalon", "airport": "Catalina Airport", "iata": "AVX", "country": "US"},
-            {"city": "Avarua", "airport": "Rarotonga International Airport", "iata": "RAR", "country": "CK"},
-            {"city": "Aviano (PN)", "airport": "Aviano Air Base", "iata": "AVB", "country": "IT"},
-            {"city": "Avignon", "airport": "Avignon Caumont airport", "iata": "AVN", "country": "FR"},
-            {"city": "Avon Park", "airport": "Avon Park Executive Airport", "iata": "AVO", "country": "US"},
-            {"city": "Avu Avu", "airport": "Avu Avu Airport", "iata": "AVU", "country": "SB"},
-            {"city": "Awaba", "airport": "Awaba Airport", "iata": "AWB", "country": "PG"},
-            {"city": "Awanui", "airport": "Kaitaia Airport", "iata": "KAT", "country": "NZ"},
-            {"city": "Awar", "airport": "Awar Airport (unusable)", "iata": "AWR", "country": "PG"},
-            {"city": "Awaradam", "airport": "Cayana Airstrip", "iata": "AAJ", "country": "SR"},
-            {"city": "Axum", "airport": "Axum Airport", "iata": "AXU", "country": "ET"},
-            {"city": "Ayacucho", "airport": "Ayacucho Airport", "iata": "AYC", "country": "CO"},
-            {"city": "Ayacucho", "airport": "Air Force Colonel Alfredo Mendivil Duarte Airport", "iata": "AYP", "country": "PE"},
-            {"city": "Ayapel", "airport": "Ayapel Airport", "iata": "AYA", "country": "CO"},
-            {"city": "Ayase / Yamato", "airport": "JMSDF Atsugi Air Base / Naval Air Facility Atsugi", "iata": "NJA", "country": "JP"},
-            {"city": "Ayawasi", "airport": "Ayawasi Airport", "iata": "AYW", "country": "ID"},
-            {"city": "Aydın", "airport": "Aydın Çıldır Airport", "iata": "CII", "country": "TR"},
-            {"city": "Ayolas", "airport": "Aeropuerto Nacional Juan de Ayolas", "iata": "AYO", "country": "PY"},
-            {"city": "Ayr", "airport": "Ayr Airport", "iata": "AYR", "country": "AU"},
-            {"city": "Azamgarh", "airport": "Azamgarh Airport", "iata": "AZH", "country": "IN"},
-            {"city": "Azezo", "airport": "Gondar Airport", "iata": "GDQ", "country": "ET"},
-            {"city": "Ağrı", "airport": "Ağrı Airport", "iata": "AJI", "country": "TR"},
-            {"city": "Ba'a - Rote Island", "airport": "David Constantijn Saudale Airport", "iata": "RTI", "country": "ID"},
-            {"city": "Baa Atoll", "airport": "Dharavandhoo Airport", "iata": "DRV", "country": "MV"},
-            {"city": "Baardheere", "airport": "Baardheere Airport", "iata": "BSY", "country": "SO"},
-            {"city": "Babase Island", "airport": "Malekolon Airport", "iata": "MKN", "country": "PG"},
-            {"city": "Babelthuap Island", "airport": "Babelthuap Airport", "iata": "ROR", "country": "PW"},
-            {"city": "Babo", "airport": "Babo Airport", "iata": "BXB", "country": "ID"},
-            {"city": "Baco", "airport": "Baco Airport", "iata": "BCO", "country": "ET"},
-            {"city": "Bacolod City", "airport": "Bacolod-Silay Airport", "iata": "BCD", "country": "PH"},
-            {"city": "Bacău", "airport": "Bacău George Enescu International  Airport", "iata": "BCM", "country": "RO"},
-            {"city": "Badajoz", "airport": "Badajoz Airport", "iata": "BJZ", "country": "ES"},
-            {"city": "Badanjilin", "airport": "Alxa Right Banner Badanjilin Airport", "iata": "RHT", "country": "CN"},
-            {"city": "Bade", "airport": "Bade Airport", "iata": "BXD", "country": "ID"},
-            {"city": "Badin", "airport": "Talhar Airport", "iata": "BDN", "country": "PK"},
-            {"city": "Badu Island", "airport": "Badu Island Airport", "iata": "BDD", "country": "AU"},
-            {"city": "Bafoussam", "airport": "Bafoussam Airport", "iata": "BFX", "country": "CM"},
-            {"city": "Bagani", "airport": "Bagani Airport", "iata": "BQI", "country": "NA"},
-            {"city": "Bagdad", "airport": "Bagdad Airport", "iata": "BGT", "country": "US"},
-            {"city": "Baghdad", "airport": "Baghdad International Airport / New Al Muthana Air Base", "iata": "BGW", "country": "IQ"},
-            {"city": "Baglung", "airport": "Baglung Airport", "iata": "BGL", "country": "NP"},
-            {"city": "Bagram", "airport": "Bagram Airfield", "iata": "OAI", "country": "AF"},
-            {"city": "Baguio", "airport": "Loakan Airport", "iata": "BAG", "country": "PH"},
-            {"city": "Bagé", "airport": "Comandante Gustavo Kraemer Airport", "iata": "BGX", "country": "BR"},
-            {"city": "Bahawalnagar", "airport": "Bahawalnagar Airport", "iata": "WGB", "country": "PK"},
-            {"city": "Bahawalpur", "airport": "Bahawalpur Airport", "iata": "BHV", "country": "PK"},
-            {"city": "Bahia Inutil", "airport": "Pampa Guanaco Airport", "iata": "DPB", "country": "CL"},
-            {"city": "Bahir Dar", "airport": "Bahir Dar Airport", "iata": "BJR", "country": "ET"},
-            {"city": "Bahja", "airport": "Bahja Airport", "iata": "BJQ", "country": "OM"},
-            {"city": "Bahía Blanca", "airport": "Comandante Espora Airport", "iata": "BHI", "country": "AR"},
-            {"city": "Bahía Negra", "airport": "Bahía Negra Airport", "iata": "BFA", "country": "PY"},
-            {"city": "Bahía Solano", "airport": "José Celestino Mutis Airport", "iata": "BSC", "country": "CO"},
-            {"city": "Bahía Solano", "airport": "Cupica Airport", "iata": "BHF", "country": "CO"},
-            {"city": "Bahía de Caraquez", "airport": "Los Perales Airport", "iata": "BHA", "country": "EC"},
-            {"city": "Baicheng", "airport": "Baicheng Chang'an Airport", "iata": "DBC", "country": "CN"},
-            {"city": "Baidoa", "airport": "Baidoa Airport", "iata": "BIB", "country": "SO"},
-            {"city": "Baie-Comeau", "airport": "Baie-Comeau Airport", "iata": "YBC", "country": "CA"},
-            {"city": "Baie-Johan-Beetz", "airport": "Baie-Johan-Beetz Water Aerodrome", "iata": "YBJ", "country": "CA"},
-            {"city": "Baikonur", "airport": "Baikonur Krayniy Airport", "iata": "BXY", "country": "KZ"},
-            {"city": "Bailingmiao", "airport": "Bailing Airport", "iata": "BKV", "country": "CN"},
-            {"city": "Baimuru", "airport": "Baimuru Airport", "iata": "VMU", "country": "PG"},
-            {"city": "Bainbridge", "airport": "Decatur County Industrial Air Park", "iata": "BGE", "country": "US"},
-            {"city": "Bainyik", "airport": "Hayfields Airport", "iata": "HYF", "country": "PG"},
-            {"city": "Bairnsdale", "airport": "Bairnsdale Airport", "iata": "BSJ", "country": "AU"},
-            {"city": "Baise (Tianyang)", "airport": "Baise (Bose) Bama Airport", "iata": "AEB", "country": "CN"},
-            {"city": "Baishan", "airport": "Changbaishan Airport", "iata": "NBS", "country": "CN"},
-            {"city": "Baitadi", "airport": "Baitadi Airport", "iata": "BIT", "country": "NP"},
-            {"city": "Bajhang", "airport": "Bajhang Airport", "iata": "BJH", "country": "NP"},
-            {"city": "Bajo Baudó", "airport": "Pizarro Airport", "iata": "PZR", "country": "CO"},
-            {"city": "Bajura", "airport": "Bajura Airport", "iata": "BJU", "country": "NP"},
-            {"city": "Bakalalan", "airport": "Bakalalan Airport", "iata": "BKM", "country": "MY"},
-            {"city": "Bakel", "airport": "Bakel Airport", "iata": "BXE", "country": "SN"},
-            {"city": "Baker City", "airport": "Baker City Municipal Airport", "iata": "BKE", "country": "US"},
-            {"city": "Baker Lake", "airport": "Baker Lake Airport", "iata": "YBK", "country": "CA"},
-            {"city": "Bakersfield", "airport": "Meadows Field", "iata": "BFL", "country": "US"},
-            {"city": "Bakkafjörður", "airport": "Bakkafjörður Airport", "iata": "BJD", "country": "IS"},
-            {"city": "Bakouma", "airport": "Bakouma Airport", "iata": "BMF", "country": "CF"},
-            {"city": "Baku", "airport": "Heydar Aliyev International Airport", "iata": "GYD", "country": "AZ"},
-            {"city": "Bakırköy, Istanbul", "airport": "İstanbul Atatürk Airport", "iata": "ISL", "country": "TR"},
-            {"city": "Balakovo", "airport": "Balakovo Airport", "iata": "BWO", "country": "RU"},
-            {"city": "Baleela Base Camp", "airport": "Baleela Airport", "iata": "BJE", "country": "SD"},
-            {"city": "Balemartine", "airport": "Tiree Airport", "iata": "TRE", "country": "GB"},
-            {"city": "Baler", "airport": "Dr Juan C Angara Airport", "iata": "BQA", "country": "PH"},
-            {"city": "Balesin", "airport": "Balesin Island Airport", "iata": "BSI", "country": "PH"},
-            {"city": "Balgo", "airport": "Balgo Hill Airport", "iata": "BQW", "country": "AU"},
-            {"city": "Bali", "airport": "Bali Airport", "iata": "BLC", "country": "CM"},
-            {"city": "Balice", "airport": "Kraków John Paul II International Airport", "iata": "KRK", "country": "PL"},
-            {"city": "Balikpapan", "airport": "Sultan Aji Muhammad Sulaiman Sepinggan International Airport", "iata": "BPN", "country": "ID"},
-            {"city": "Balimo", "airport": "Balimo Airport", "iata": "OPU", "country": "PG"},
-            {"city": "Balirangen", "airport": "Siau/Sitaro Airport", "iata": "BRG", "country": "ID"},
-            {"city": "Balivanich", "airport": "Benbecula Airport", "iata": "BEB", "country": "GB"},
-            {"city": "Balkanabat", "airport": "Balkanabat Airport", "iata": "BKN", "country": "TM"},
-            {"city": "Balkhash", "airport": "Balkhash Airport", "iata": "BXH", "country": "KZ"},
-            {"city": "Ballalae", "airport": "Ballalae Airport", "iata": "BAS", "country": "SB"},
-            {"city": "Ballina", "airport": "Ballina Byron Gateway Airport", "iata": "BNK", "country": "AU"},
-            {"city": "Balmaceda", "airport": "Balmaceda Airport", "iata": "BBA", "country": "CL"},
-            {"city": "Balo-i", "airport": "Maria Cristina (Iligan) Airport", "iata": "IGN", "country": "PH"},
-            {"city": "Balsas", "airport": "Balsas Airport", "iata": "BSS", "country": "BR"},
-            {"city": "Baltimore", "airport": "Baltimore/Washington International Thurgood Marshall Airport", "iata": "BWI", "country": "US"},
-            {"city": "Baltimore", "airport": "Martin State Airport", "iata": "MTN", "country": "US"},
-            {"city": "Baltrum", "airport": "Baltrum Airport", "iata": "BMR", "country": "DE"},
-            {"city": "Balurghat", "airport": "Balurghat Airport", "iata": "RGH", "country": "IN"},
-            {"city": "Balıkesir", "airport": "Balıkesir Airport", "iata": "BZI", "country": "TR"},
-            {"city": "Bam", "airport": "Bam Airport", "iata": "BXR", "country": "IR"},
-            {"city": "Bamaga", "airport": "Northern Peninsula Airport", "iata": "ABM", "country": "AU"},
-            {"city": "Bamako", "airport": "Modibo Keita International Airport", "iata": "BKO", "country": "ML"},
-            {"city": "Bamarni", "airport": "Bamarni Airport", "iata": "BMN", "country": "IQ"},
-            {"city": "Bambari", "airport": "Bambari Airport", "iata": "BBY", "country": "CF"},
-            {"city": "Bambu", "airport": "Bambu Airport", "iata": "BCP", "country": "PG"},
-            {"city": "Bamburi", "airport": "Bamburi Airport", "iata": "BMQ", "country": "KE"},
-            {"city": "Bamenda", "airport": "Bamenda Airport", "iata": "BPC", "country": "CM"},
-            {"city": "Bamfield", "airport": "Bamfield Seaplane Base", "iata": "YBF", "country": "CA"},
-            {"city": "Bamu", "airport": "Bamu Airport", "iata": "BMZ", "country": "PG"},
-            {"city": "Bamyan", "airport": "Bamyan Airport", "iata": "BIN", "country": "AF"},
-            {"city": "Banaina-Borneo Island", "airport": "Banaina Airport", "iata": "NAF", "country": "ID"},
-            {"city": "Banda Aceh", "airport": "Sultan Iskandar Muda International Airport", "iata": "BTJ", "country": "ID"},
-            {"city": "Bandanaira", "airport": "Bandanaira Airport", "iata": "NDA", "country": "ID"},
-            {"city": "Bandar Abbas", "airport": "Bandar Abbas International Airport", "iata": "BND", "country": "IR"},
-            {"city": "Bandar Abbas", "airport": "Havadarya Airport", "iata": "HDR", "country": "IR"},
-            {"city": "Bandar Lampung", "airport": "Radin Inten II International Airport", "iata": "TKG", "country": "ID"},
-            {"city": "Bandar Lengeh", "airport": "Bandar Lengeh International Airport", "iata": "BDH", "country": "IR"},
-            {"city": "Bandar Seri Begawan", "airport": "Brunei International Airport", "iata": "BWN", "country": "BN"},
-            {"city": "Bandar-e-Jask", "airport": "Jask Airport", "iata": "JSK", "country": "IR"},
-            {"city": "Bandon", "airport": "Bandon State Airport", "iata": "BDY", "country": "US"},
-            {"city": "Bandundu", "airport": "Bandundu Airport", "iata": "FDU", "country": "CD"},
-            {"city": "Bandung", "airport": "Husein Sastranegara International Airport", "iata": "BDO", "country": "ID"},
-            {"city": "Bandırma", "airport": "Bandırma Airport", "iata": "BDM", "country": "TR"},
-            {"city": "Banff", "airport": "Banff Airport", "iata": "YBA", "country": "CA"},
-            {"city": "Banfora", "airport": "Banfora Airport", "iata": "BNR", "country": "BF"},
-            {"city": "Bangalore", "airport": "Kempegowda International Airport", "iata": "BLR", "country": "IN"},
-            {"city": "Bangassou", "airport": "Bangassou Airport", "iata": "BGU", "country": "CF"},
-            {"city": "Bangda", "airport": "Qamdo Bangda Airport", "iata": "BPX", "country": "CN"},
-            {"city": "Bangkok", "airport": "Don Mueang International Airport", "iata": "DMK", "country": "TH"},
-            {"city": "Bangkok", "airport": "Suvarnabhumi Airport", "iata": "BKK", "country": "TH"},
-            {"city": "Bangor", "airport": "Bangor International Airport", "iata": "BGR", "country": "US"},
-            {"city": "Bangor", "airport": "Aérodrome de Belle Île", "iata": "BIC", "country": "FR"},
-            {"city": "Bangui", "airport": "Bangui M'Poko International Airport", "iata": "BGF", "country": "CF"},
-            {"city": "Baniyala", "airport": "Baniyala Airport", "iata": "BYX", "country": "AU"},
-            {"city": "Banmaw", "airport": "Banmaw Airport", "iata": "BMO", "country": "MM"},
-            {"city": "Banning", "airport": "Banning Municipal Airport", "iata": "BNG", "country": "US"},
-            {"city": "Bannu", "airport": "Bannu Airport", "iata": "BNP", "country": "PK"},
-            {"city": "Bantry", "airport": "Bantry Aerodrome", "iata": "BYT", "country": "IE"},
-            {"city": "Baoshan (Longyang)", "airport": "Baoshan Yunrui Airport", "iata": "BSD", "country": "CN"},
-            {"city": "Baoshan (Tengchong)", "airport": "Tengchong Tuofeng Airport", "iata": "TCZ", "country": "CN"},
-            {"city": "Baotou", "airport": "Baotou Donghe Airport", "iata": "BAV", "country": "CN"},
-            {"city": "Bapi", "airport": "Bapi Airstrip", "iata": "BPD", "country": "PG"},
-            {"city": "Bar Harbor", "airport": "Hancock County-Bar Harbor Airport", "iata": "BHB", "country": "US"},
-            {"city": "Baracoa", "airport": "Gustavo Rizo Airport", "iata": "BCA", "country": "CU"},
-            {"city": "Barahona", "airport": "Maria Montez International Airport", "iata": "BRX", "country": "DO"},
-            {"city": "Baraki Barak", "airport": "Shank Air Base", "iata": "OAA", "country": "AF"},
-            {"city": "Barakoma", "airport": "Barakoma Airport", "iata": "VEV", "country": "SB"},
-            {"city": "Baramita", "airport": "Baramita Airport", "iata": "BMJ", "country": "GY"},
-            {"city": "Baranof", "airport": "Baranof Warm Springs Float and Seaplane Base", "iata": "BNF", "country": "US"},
-            {"city": "Barcaldine", "airport": "Barcaldine Airport", "iata": "BCI", "country": "AU"},
-            {"city": "Barcelona", "airport": "Josep Tarradellas Barcelona-El Prat Airport", "iata": "BCN", "country": "ES"},
-            {"city": "Barcelona", "airport": "General José Antonio Anzoategui International Airport", "iata": "BLA", "country": "VE"},
-            {"city": "Barcelos", "airport": "Barcelos Airport", "iata": "BAZ", "country": "BR"},
-            {"city": "Bardstown", "airport": "Samuels Field", "iata": "BRY", "country": "US"},
-            {"city": "Bareilly", "airport": "Bareilly Air Force Station", "iata": "BEK", "country": "IN"},
-            {"city": "Bari", "airport": "Bari Karol Wojtyła International Airport", "iata": "BRI", "country": "IT"},
-            {"city": "Barinas", "airport": "Barinas Airport", "iata": "BNS", "country": "VE"},
-            {"city": "Bario", "airport": "Bario Airport", "iata": "BBN", "country": "MY"},
-            {"city": "Barisal", "airport": "Barisal Airport", "iata": "BZL", "country": "BD"},
-            {"city": "Barnaul", "airport": "Barnaul Airport", "iata": "BAX", "country": "RU"},
-            {"city": "Barnwell", "airport": "Barnwell Regional Airport", "iata": "BNL", "country": "US"},
-            {"city": "Barquisimeto", "airport": "Barquisimeto International Airport", "iata": "BRM", "country": "VE"},
-            {"city": "Barra", "airport": "Barra Airport", "iata": "BQQ", "country": "BR"},
-            {"city": "Barra do Corda", "airport": "Barra do Corda Airport", "iata": "BDC", "country": "BR"},
-            {"city": "Barra do Garças", "airport": "Barra do Garças Airport", "iata": "BPG", "country": "BR"},
-            {"city": "Barranca De Upia", "airport": "Barranca De Upia Airport", "iata": "BAC", "country": "CO"},
-            {"city": "Barrancabermeja", "airport": "Yariguíes Airport", "iata": "EJA", "country": "CO"},
-            {"city": "Barranco Minas", "airport": "Barranco Minas Airport", "iata": "NBB", "country": "CO"},
-            {"city": "Barranquilla", "airport": "Ernesto Cortissoz International Airport", "iata": "BAQ", "country": "CO"},
-            {"city": "Barre/Montpelier", "airport": "Edward F Knapp State Airport", "iata": "MPV", "country": "US"},
-            {"city": "Barreiras", "airport": "Dom Ricardo Weberberger Airport", "iata": "BRA", "country": "BR"},
-            {"city": "Barreirinhas", "airport": "Barreirinhas National Airport", "iata": "BRB", "country": "BR"},
-            {"city": "Barretos", "airport": "Chafei Amsei Airport", "iata": "BAT", "country": "BR"},
-            {"city": "Barrie", "airport": "Barrie-Lake Simcoe Regional Airport", "iata": "YLK", "country": "CA"},
-            {"city": "Barrow-in-Furness", "airport": "Barrow Walney Island Airport", "iata": "BWF", "country": "GB"},
-            {"city": "Barter Island", "airport": "Barter Island Long Range Radar Station Airport", "iata": "BTI", "country": "US"},
-            {"city": "Barth", "airport": "Stralsund-Barth Airport", "iata": "BBH", "country": "DE"},
-            {"city": "Bartica", "airport": "Bartica A Airport", "iata": "GFO", "country": "GY"},
-            {"city": "Bartlesville", "airport": "Bartlesville Municipal Airport", "iata": "BVO", "country": "US"},
-            {"city": "Bartow", "airport": "Bartow Executive Airport", "iata": "BOW", "country": "US"},
-            {"city": "Basalt", "airport": "New Moon Airport", "iata": "NMP", "country": "AU"},
-            {"city": "Basankusu", "airport": "Basankusu Airport", "iata": "BSU", "country": "CD"},
-            {"city": "Basco", "airport": "Basco Airport", "iata": "BSO", "country": "PH"},
-            {"city": "Basongo", "airport": "Basongo Airport", "iata": "BAN", "country": "CD"},
-            {"city": "Basra", "airport": "Basra International Airport", "iata": "BSR", "country": "IQ"},
-            {"city": "Basse-Terre", "airport": "Basse-Terre Baillif Airport", "iata": "BBR", "country": "GP"},
-            {"city": "Basseterre", "airport": "Robert L. Bradshaw International Airport", "iata": "SKB", "country": "KN"},
-            {"city": "Bastia", "airport": "Bastia Poretta airport", "iata": "BIA", "country": "FR"},
-            {"city": "Bata", "airport": "Bata Airport", "iata": "BSG", "country": "GQ"},
-            {"city": "Batagay", "airport": "Batagay Airport", "iata": "BQJ", "country": "RU"},
-            {"city": "Batagay-Alyta", "airport": "Sakkyryr Airport", "iata": "SUK", "country": "RU"},
-            {"city": "Batam", "airport": "Hang Nadim International Airport", "iata": "BTH", "country": "ID"},
-            {"city": "Batangafo", "airport": "Batangafo Airport", "iata": "BTG", "country": "CF"},
-            {"city": "Batesville", "airport": "Batesville Regional Airport", "iata": "BVX", "country": "US"},
-            {"city": "Batesville", "airport": "Batesville Airport", "iata": "HLB", "country": "US"},
-            {"city": "Bathurst", "airport": "Bathurst Airport", "iata": "BHS", "country": "AU"},
-            {"city": "Batman", "airport": "Batman Airport", "iata": "BAL", "country": "TR"},
-            {"city": "Batna", "airport": "Batna Mostefa Ben Boulaid Airport", "iata": "BLJ", "country": "DZ"},
-            {"city": "Batom", "airport": "Batom Airport", "iata": "BXM", "country": "ID"},
-            {"city": "Baton Rouge", "airport": "Baton Rouge Metropolitan Airport", "iata": "BTR", "country": "US"},
-            {"city": "Batouri", "airport": "Batouri Airport", "iata": "OUR", "country": "CM"},
-            {"city": "Battambang", "airport": "Battambang Airport", "iata": "BBM", "country": "KH"},
-            {"city": "Batticaloa", "airport": "Passikudah Helipad", "iata": "PQD", "country": "LK"},
-            {"city": "Batticaloa", "airport": "Batticaloa Airport", "iata": "BTC", "country": "LK"},
-            {"city": "Battle Creek", "airport": "Battle Creek Executive Airport at Kellogg Field", "iata": "BTL", "country": "US"},
-            {"city": "Battle Mountain", "airport": "Battle Mountain Airport", "iata": "BAM", "country": "US"},
-            {"city": "Batu Licin", "airport": "Bersujud Airport", "iata": "BTW", "country": "ID"},
-            {"city": "Batumi", "airport": "Batumi International Airport", "iata": "BUS", "country": "GE"},
-            {"city": "Batuna Mission Station", "airport": "Batuna Aerodrome", "iata": "BPF", "country": "SB"},
-            {"city": "Bau Bau", "airport": "Betoambari Airport", "iata": "BUW", "country": "ID"},
-            {"city": "Baucau", "airport": "Cakung Airport", "iata": "BCH", "country": "TL"},
-            {"city": "Bauchi", "airport": "Sir Abubakar Tafawa Balewa International Airport", "iata": "BCU", "country": "NG"},
-            {"city": "Baudette", "airport": "Baudette International Airport", "iata": "BDE", "country": "US"},
-            {"city": "Baures", "airport": "Baures Airport", "iata": "BVL", "country": "BO"},
-            {"city": "Bauru", "airport": "Bauru/Arealva–Moussa Nakhal Tobias State Airport", "iata": "JTC", "country": "BR"},
-            {"city": "Bavannur", "airport": "Bayannur Tianjitai Airport", "iata": "RLK", "country": "CN"},
-            {"city": "Bawean", "airport": "Harun Thohir Airport", "iata": "BXW", "country": "ID"},
-            {"city": "Bay City", "airport": "Bay City Regional Airport", "iata": "BBC", "country": "US"},
-            {"city": "Bayamo", "airport": "Carlos Manuel de Cespedes Airport", "iata": "BYM", "country": "CU"},
-            {"city": "Bayanhot", "airport": "Alxa Left Banner Bayanhot Airport", "iata": "AXF", "country": "CN"},
-            {"city": "Bayankhongor", "airport": "Bayankhongor Airport", "iata": "BYN", "country": "MN"},
-            {"city": "Baykit", "airport": "Baykit Airport", "iata": "BKA", "country": "RU"},
-            {"city": "Baytown", "airport": "Baytown Airport", "iata": "HPY", "country": "US"},
-            {"city": "Bazaruto Island", "airport": "Bazaruto Island Airport", "iata": "BZB", "country": "MZ"},
-            {"city": "Bazaruto Island", "airport": "Indigo Bay Lodge Airport", "iata": "IBL", "country": "MZ"},
-            {"city": "Bazhong (Enyang)", "airport": "Bazhong Enyang Airport", "iata": "BZX", "country": "CN"},
-            {"city": "Bealanana", "airport": "Ankaizina Airport", "iata": "WBE", "country": "MG"},
-            {"city": "Beale Air Force Base", "airport": "Beale Air Force Base", "iata": "BAB", "country": "US"},
-            {"city": "Bear Creek", "airport": "Bear Creek 3 Airport", "iata": "BCC", "country": "US"},
-            {"city": "Bearskin Lake", "airport": "Bearskin Lake Airport", "iata": "XBE", "country": "CA"},
-            {"city": "Beatrice", "airport": "Beatrice Municipal Airport", "iata": "BIE", "country": "US"},
-            {"city": "Beatty", "airport": "Beatty Airport", "iata": "BTY", "country": "US"},
-            {"city": "Beaufort", "airport": "Beaufort Executive Airport", "iata": "BFT", "country": "US"},
-            {"city": "Beaumont", "airport": "Beaumont Municipal Airport", "iata": "BMT", "country": "US"},
-            {"city": "Beaumont/Port Arthur", "airport": "Jack Brooks Regional Airport", "iata": "BPT", "country": "US"},
-            {"city": "Beauvais", "airport": "Beauvais Tillé airport", "iata": "BVA", "country": "FR"},
-            {"city": "Beaver", "airport": "Raleigh County Memorial Airport", "iata": "BKW", "country": "US"},
-            {"city": "Beaver", "airport": "Beaver Airport", "iata": "WBQ", "country": "US"},
-            {"city": "Beaver Creek", "airport": "Beaver Creek Airport", "iata": "YXQ", "country": "CA"},
-            {"city": "Beaver Falls", "airport": "Beaver County Airport", "iata": "BFP", "country": "US"},
-            {"city": "Beckwourth", "airport": "Nervino Airport", "iata": "NVN", "country": "US"},
-            {"city": "Bedford", "airport": "Laurence G Hanscom Field", "iata": "BED", "country": "US"},
-            {"city": "Bedford", "airport": "Virgil I Grissom Municipal Airport", "iata": "BFR", "country": "US"},
-            {"city": "Bedourie", "airport": "Bedourie Airport", "iata": "BEU", "country": "AU"},
-            {"city": "Bedwell Harbour", "airport": "Bedwell Harbour Seaplane Base", "iata": "YBW", "country": "CA"},
-            {"city": "Beef Island", "airport": "Terrance B. Lettsome International Airport", "iata": "EIS", "country": "VG"},
-            {"city": "Beersheba", "airport": "Beersheba (Teyman) Airport", "iata": "BEV", "country": "IL"},
-            {"city": "Beersheba", "airport": "Nevatim Air Base", "iata": "VTM", "country": "IL"},
-            {"city": "Beersheba", "airport": "Ramon Air Base", "iata": "MIP", "country": "IL"},
-            {"city": "Beeville", "airport": "Chase Field Industrial Airport", "iata": "NIR", "country": "US"},
-            {"city": "Befandriana", "airport": "Avaratra Airport", "iata": "WBD", "country": "MG"},
-            {"city": "Beica", "airport": "Beica Airport", "iata": "BEI", "country": "ET"},
-            {"city": "Beihai (Yinhai)", "airport": "Beihai Fucheng Airport", "iata": "BHY", "country": "CN"},
-            {"city": "Beihan", "airport": "Beihan Airport", "iata": "BHN", "country": "YE"},
-            {"city": "Beijing", "airport": "Beijing Nanjiao Airport", "iata": "NAY", "country": "CN"},
-            {"city": "Beijing", "airport": "Beijing Capital International Airport", "iata": "PEK", "country": "CN"},
-            {"city": "Beijing", "airport": "Beijing Daxing International Airport", "iata": "PKX", "country": "CN"},
-            {"city": "Beira", "airport": "Beira Airport", "iata": "BEW", "country": "MZ"},
-            {"city": "Beirut", "airport": "Beirut Rafic Hariri International Airport", "iata": "BEY", "country": "LB"},
-            {"city": "Beja", "airport": "Beja Airport / Airbase", "iata": "BYJ", "country": "PT"},
-            {"city": "Bekily", "airport": "Bekily Airport", "iata": "OVA", "country": "MG"},
-            {"city": "Belaga", "airport": "Belaga Airport", "iata": "BLG", "country": "MY"},
-            {"city": "Belawai", "airport": "Tanjung Manis Airport", "iata": "TGC", "country": "MY"},
-            {"city": "Belaya Gora", "airport": "Belaya Gora Airport", "iata": "BGN", "country": "RU"},
-            {"city": "Beledweyne", "airport": "Beledweyne Airport", "iata": "BLW", "country": "SO"},
-            {"city": "Belfast", "airport": "Belfast International Airport", "iata": "BFS", "country": "GB"},
-            {"city": "Belfast", "airport": "George Best Belfast City Airport", "iata": "BHD", "country": "GB"},
-            {"city": "Belfast", "airport": "Sabi Sabi Airport", "iata": "GSS", "country": "ZA"},
-            {"city": "Belgaum", "airport": "Belagavi Airport", "iata": "IXG", "country": "IN"},
-            {"city": "Belgorod", "airport": "Belgorod International Airport", "iata": "EGO", "country": "RU"},
-            {"city": "Belgrade", "airport": "Belgrade Nikola Tesla Airport", "iata": "BEG", "country": "RS"},
-            {"city": "Beliyela", "airport": "Bella Yella Airport", "iata": "BYL", "country": "LR"},
-            {"city": "Belize City", "airport": "Sir Barry Bowen Municipal Airport", "iata": "TZA", "country": "BZ"},
-            {"city": "Belize City", "airport": "Philip S. W. Goldson International Airport", "iata": "BZE", "country": "BZ"},
-            {"city": "Bell Island", "airport": "Bell Island Hot Springs Seaplane Base", "iata": "KBE", "country": "US"},
-            {"city": "Bella Bella", "airport": "Bella Bella/Shearwater Seaplane Base", "iata": "YSX", "country": "CA"},
-            {"city": "Bella Bella", "airport": "Bella Bella (Campbell Island) Airport", "iata": "ZEL", "country": "CA"},
-            {"city": "Bella Coola", "airport": "Bella Coola Airport", "iata": "QBC", "country": "CA"},
-            {"city": "Bella Union", "airport": "Placeres Airport", "iata": "BUV", "country": "UY"},
-            {"city": "Bellaire", "airport": "Antrim County Airport", "iata": "ACB", "country": "US"},
-            {"city": "Bellary", "airport": "Bellary Airport", "iata": "BEP", "country": "IN"},
-            {"city": "Bellavista", "airport": "Huallaga Airport", "iata": "BLP", "country": "PE"},
-            {"city": "Belle Chasse", "airport": "Southern Seaplane Airport", "iata": "BCS", "country": "US"},
-            {"city": "Belleville", "airport": "Scott AFB/Midamerica Airport", "iata": "BLV", "country": "US"},
-            {"city": "Bellingham", "airport": "Bellingham International Airport", "iata": "BLI", "country": "US"},
-            {"city": "Belluno (BL)", "airport": "Belluno Arturo dell'Oro Airport", "iata": "BLX", "country": "IT"},
-            {"city": "Belmar/Farmingdale", "airport": "Monmouth Executive Airport", "iata": "BLM", "country": "US"},
-            {"city": "Belmonte", "airport": "Belmonte Airport", "iata": "BVM", "country": "BR"},
-            {"city": "Belmopan", "airport": "Hector Silva Airstrip", "iata": "BCV", "country": "BZ"},
-            {"city": "Belmullet", "airport": "Belmullet Aerodrome", "iata": "BLY", "country": "IE"},
-            {"city": "Belo Horizonte", "airport": "Pampulha - Carlos Drummond de Andrade Airport", "iata": "PLU", "country": "BR"},
-            {"city": "Belo Horizonte", "airport": "Tancredo Neves International Airport", "iata": "CNF", "country": "BR"},
-            {"city": "Belo sur Tsiribihina", "airport": "Belo sur Tsiribihina Airport", "iata": "BMD", "country": "MG"},
-            {"city": "Beloretsk", "airport": "Beloretsk Airport", "iata": "BCX", "country": "RU"},
-            {"city": "Beluga", "airport": "Beluga Airport", "iata": "BVU", "country": "US"},
-            {"city": "Belém", "airport": "Val de Cans/Júlio Cezar Ribeiro International Airport", "iata": "BEL", "country": "BR"},
-            {"city": "Bembridge, Isle of Wight", "airport": "Bembridge Airport", "iata": "BBP", "country": "GB"},
-            {"city": "Bemidji", "airport": "Bemidji Regional Airport", "iata": "BJI", "country": "US"},
-            {"city": "Bemolanga", "airport": "Bemolanga Airport", "iata": "BZM", "country": "MG"},
-            {"city": "Ben Slimane", "airport": "Ben Slimane Airport", "iata": "GMD", "country": "MA"},
-            {"city": "Benalla", "airport": "Benalla Airport", "iata": "BLN", "country": "AU"},
-            {"city": "Bengbu", "airport": "Bengbu Tenghu Airport (U.C.)", "iata": "BFY", "country": "CN"},
-            {"city": "Bengbu", "airport": "Bengbu Tenghu Airport", "iata": "BFU", "country": "CN"},
-            {"city": "Bengkalis-Sumatra Island", "airport": "Sungai Pakning Bengkalis Airport", "iata": "SEQ", "country": "ID"},
-            {"city": "Bengkulu", "airport": "Fatmawati Soekarno Airport", "iata": "BKS", "country": "ID"},
-            {"city": "Benguela", "airport": "Benguela Airport", "iata": "BUG", "country": "AO"},
-            {"city": "Benguera Island", "airport": "Benguera Island Airport", "iata": "BCW", "country": "MZ"},
-            {"city": "Beni", "airport": "Beni Airport", "iata": "BNC", "country": "CD"},
-            {"city": "Benin", "airport": "Benin Airport", "iata": "BNI", "country": "NG"},
-            {"city": "Benina", "airport": "Benina International Airport", "iata": "BEN", "country": "LY"},
-            {"city": "Bennettsville", "airport": "Marlboro County Jetport - H E Avent Field Airport", "iata": "BTN", "country": "US"},
-            {"city": "Bensbach", "airport": "Bensbach Airport", "iata": "BSP", "country": "PG"},
-            {"city": "Benson", "airport": "Benson Municipal Airport", "iata": "BBB", "country": "US"},
-            {"city": "Bentayan", "airport": "Atung Bungsu Airport", "iata": "PXA", "country": "ID"},
-            {"city": "Benteng", "airport": "Selayar - Haji Aroeppala Airport", "iata": "KSR", "country": "ID"},
-            {"city": "Bento Gonçalves", "airport": "Aeroclube de Bento Gonçalves Airport", "iata": "BGV", "country": "BR"},
-            {"city": "Benton Harbor", "airport": "Southwest Michigan Regional Airport", "iata": "BEH", "country": "US"},
-            {"city": "Bentota", "airport": "Bentota River Waterdrome", "iata": "BJT", "country": "LK"},
-            {"city": "Bequia", "airport": "J F Mitchell Airport", "iata": "BQU", "country": "VC"},
-            {"city": "Berane", "airport": "Berane Airport", "iata": "IVG", "country": "ME"},
-            {"city": "Berbera", "airport": "Berbera Airport", "iata": "BBO", "country": "SO"},
-            {"city": "Berbérati", "airport": "Berbérati Airport", "iata": "BBT", "country": "CF"},
-            {"city": "Berdyansk", "airport": "Berdyansk Airport", "iata": "ERD", "country": "UA"},
-            {"city": "Berenice Troglodytica", "airport": "Berenice International Airport / Banas Cape Air Base", "iata": "EES", "country": "EG"},
-            {"city": "Berens River", "airport": "Berens River Airport", "iata": "YBV", "country": "CA"},
-            {"city": "Bergen", "airport": "Bergen Airport, Flesland", "iata": "BGO", "country": "NO"},
-            {"city": "Bergerac", "airport": "Bergerac Dordogne-Périgord airport", "iata": "EGC", "country": "FR"},
-            {"city": "Beringin", "airport": "Kualanamu International Airport", "iata": "KNO", "country": "ID"},
-            {"city": "Berlevåg", "airport": "Berlevåg Airport", "iata": "BVG", "country": "NO"},
-            {"city": "Berlin", "airport": "Berlin Brandenburg Airport", "iata": "BER", "country": "DE"},
-            {"city": "Berlin", "airport": "Berlin Regional Airport", "iata": "BML", "country": "US"},
-            {"city": "Bermejo", "airport": "Bermejo Airport", "iata": "BJO", "country": "BO"},
-            {"city": "Bermuda Dunes", "airport": "Bermuda Dunes Airport", "iata": "UDD", "country": "US"},
-            {"city": "Bern", "airport": "Bern Airport", "iata": "BRN", "country": "CH"},
-            {"city": "Beroroha", "airport": "Antsoa Airport", "iata": "WBO", "country": "MG"},
-            {"city": "Bertoua", "airport": "Bertoua Airport", "iata": "BTA", "country": "CM"},
-            {"city": "Beru", "airport": "Beru Airport", "iata": "BEZ", "country": "KI"},
-            {"city": "Besakoa", "airport": "Besakoa Airport", "iata": "BSV", "country": "MG"},
-            {"city": "Besalampy", "airport": "Besalampy Airport", "iata": "BPY", "country": "MG"},
-            {"city": "Beslan", "airport": "Vladikavkaz Beslan International Airport", "iata": "OGZ", "country": "RU"},
-            {"city": "Bethel", "airport": "Bethel Airport", "iata": "BET", "country": "US"},
-            {"city": "Bethel", "airport": "Bethel Seaplane Base", "iata": "JBT", "country": "US"},
-            {"city": "Betioky", "airport": "Betioky Airport", "iata": "BKU", "country": "MG"},
-            {"city": "Betong", "airport": "Betong International Airport", "iata": "BTZ", "country": "TH"},
-            {"city": "Betou", "airport": "Betou Airport", "iata": "BTB", "country": "CG"},
-            {"city": "Bettles", "airport": "Bettles Airport", "iata": "BTT", "country": "US"},
-            {"city": "Beverly / Danvers", "airport": "Beverly Regional Airport", "iata": "BVY", "country": "US"},
-            {"city": "Bewani", "airport": "Bewani Airport", "iata": "BWP", "country": "PG"},
-            {"city": "Bezmer", "airport": "Bezmer Air Base", "iata": "JAM", "country": "BG"},
-            {"city": "Bhadrapur", "airport": "Bhadrapur Airport", "iata": "BDP", "country": "NP"},
-            {"city": "Bhagatanwala", "airport": "Bhagatanwala Airport", "iata": "BHW", "country": "PK"},
-            {"city": "Bharatpur", "airport": "Bharatpur Airport", "iata": "BHR", "country": "NP"},
-            {"city": "Bhavnagar", "airport": "Bhavnagar Airport", "iata": "BHU", "country": "IN"},
-            {"city": "Bhawanipatna", "airport": "Utkela Airport", "iata": "UKE", "country": "IN"},
-            {"city": "Bhojpur", "airport": "Bhojpur Airport", "iata": "BHP", "country": "NP"},
-            {"city": "Bhopal", "airport": "Raja Bhoj International Airport", "iata": "BHO", "country": "IN"},
-            {"city": "Bhubaneswar", "airport": "Biju Patnaik International Airport", "iata": "BBI", "country": "IN"},
-            {"city": "Bhuj", "airport": "Bhuj Airport", "iata": "BHJ", "country": "IN"},
-            {"city": "Bhuntar", "airport": "Kullu Manali Airport", "iata": "KUU", "country": "IN"},
-            {"city": "Bhurban", "airport": "Bhurban Heliport", "iata": "BHC", "country": "PK"},
-            {"city": "Biak", "airport": "Frans Kaisiepo Airport", "iata": "BIK", "country": "ID"},
-            {"city": "Bialla, Matalilu, Ewase", "airport": "Bialla Airport", "iata": "BAA", "country": "PG"},
-            {"city": "Biangabip", "airport": "Biangabip Airport", "iata": "BPK", "country": "PG"},
-            {"city": "Biarritz", "airport": "Biarritz Pays Basque airport", "iata": "BIQ", "country": "FR"},
-            {"city": "Biaru", "airport": "Biaru Airport", "iata": "BRP", "country": "PG"},
-            {"city": "Bickerton Island", "airport": "Milyakburra Airport", "iata": "BCZ", "country": "AU"},
-            {"city": "Bidar", "airport": "Bidar Airport / Bidar Air Force Station", "iata": "IXX", "country": "IN"},
-            {"city": "Bielefeld", "airport": "Bielefeld Airport", "iata": "BFE", "country": "DE"},
-            {"city": "Big Bay", "airport": "Stuart Island Airstrip", "iata": "YRR", "country": "CA"},
-            {"city": "Big Bear", "airport": "Big Bear City Airport", "iata": "RBF", "country": "US"},
-            {"city": "Big Creek", "airport": "Big Creek Airport", "iata": "BGK", "country": "BZ"},
-            {"city": "Big Lake", "airport": "Big Lake Airport", "iata": "BGQ", "country": "US"},
-            {"city": "Big Mountain", "airport": "Big Mountain Airport", "iata": "BMX", "country": "US"},
-            {"city": "Big Piney", "airport": "Miley Memorial Field", "iata": "BPI", "country": "US"},
-            {"city": "Big Rapids", "airport": "Roben Hood Airport", "iata": "WBR", "country": "US"},
-            {"city": "Big Spring", "airport": "Big Spring Mc Mahon-Wrinkle Airport", "iata": "HCA", "country": "US"},
-            {"city": "Big Trout Lake", "airport": "Big Trout Lake Airport", "iata": "YTL", "country": "CA"},
-            {"city": "Bigatyelang Island", "airport": "Ailinglaplap Airok Airport", "iata": "AIC", "country": "MH"},
-            {"city": "Bijie", "airport": "Bijie Feixiong Airport", "iata": "BFJ", "country": "CN"},
-            {"city": "Bikaner", "airport": "Nal Airport", "iata": "BKB", "country": "IN"},
-            {"city": "Bikini Atoll", "airport": "Enyu Airfield", "iata": "BII", "country": "MH"},
-            {"city": "Bila", "airport": "Afutara Aerodrome", "iata": "AFT", "country": "SB"},
-            {"city": "Bilaspur", "airport": "Bilaspur Airport", "iata": "PAB", "country": "IN"},
-            {"city": "Bilbao", "airport": "Bilbao Airport", "iata": "BIO", "country": "ES"},
-            {"city": "Bildudalur", "airport": "Bildudalur Airport", "iata": "BIU", "country": "IS"},
-            {"city": "Billings", "airport": "Billings Logan International Airport", "iata": "BIL", "country": "US"},
-            {"city": "Billund", "airport": "Billund Airport", "iata": "BLL", "country": "DK"},
-            {"city": "Biloela", "airport": "Biloela Airport", "iata": "ZBL", "country": "AU"},
-            {"city": "Biloela", "airport": "Thangool Airport", "iata": "THG", "country": "AU"},
-            {"city": "Bilogai", "airport": "Bilorai Airport", "iata": "UGU", "country": "ID"},
-            {"city": "Biloxi", "airport": "Keesler Air Force Base", "iata": "BIX", "country": "US"},
-            {"city": "Bimini", "airport": "Bimini North Seaplane Base", "iata": "NSB", "country": "BS"},
-            {"city": "Bindlach", "airport": "Bayreuth Airport", "iata": "BYU", "country": "DE"},
-            {"city": "Binghamton", "airport": "Greater Binghamton/Edwin A Link field", "iata": "BGM", "country": "US"},
-            {"city": "Bingöl", "airport": "Bingöl Airport", "iata": "BGG", "country": "TR"},
-            {"city": "Biniguni", "airport": "Biniguni Airport", "iata": "XBN", "country": "PG"},
-            {"city": "Bintulu", "airport": "Bintulu Airport", "iata": "BTU", "country": "MY"},
-            {"city": "Bintuni", "airport": "Stenkol Airport", "iata": "NTI", "country": "ID"},
-            {"city": "Binzhou", "airport": "Binzhou Dagao General Aviation Airport", "iata": "CBZ", "country": "CN"},
-            {"city": "Birao", "airport": "Birao Airport", "iata": "IRO", "country": "CF"},
-            {"city": "Biratnagar", "airport": "Biratnagar Airport", "iata": "BIR", "country": "NP"},
-            {"city": "Birch Creek", "airport": "Birch Creek Airport", "iata": "KBC", "country": "US"},
-            {"city": "Bird Island", "airport": "Bird Island Airport", "iata": "BDI", "country": "SC"},
-            {"city": "Birjand", "airport": "Birjand International Airport", "iata": "XBJ", "country": "IR"},
-            {"city": "Birmingham", "airport": "Birmingham-Shuttlesworth International Airport", "iata": "BHM", "country": "US"},
-            {"city": "Birmingham, West Midlands", "airport": "Birmingham Airport", "iata": "BHX", "country": "GB"},
-            {"city": "Bisbee", "airport": "Bisbee Municipal Airport", "iata": "BSQ", "country": "US"},
-            {"city": "Bisha", "airport": "Bisha Airport", "iata": "BHH", "country": "SA"},
-            {"city": "Bishkek", "airport": "Manas International Airport", "iata": "BSZ", "country": "KG"},
-            {"city": "Bisho", "airport": "Bisho Airport", "iata": "BIY", "country": "ZA"},
-            {"city": "Bishop", "airport": "Eastern Sierra Regional Airport", "iata": "BIH", "country": "US"},
-            {"city": "Biskra", "airport": "Biskra - Mohamed Khider Airport", "iata": "BSK", "country": "DZ"},
-            {"city": "Bislig", "airport": "Bislig Airport", "iata": "BPH", "country": "PH"},
-            {"city": "Bismarck", "airport": "Bismarck Municipal Airport", "iata": "BIS", "country": "US"},
-            {"city": "Bissau", "airport": "Osvaldo Vieira International Airport", "iata": "OXB", "country": "GW"},
-            {"city": "Bitam", "airport": "Bitam Airport", "iata": "BMM", "country": "GA"},
-            {"city": "Bitburg", "airport": "Bitburg Airport", "iata": "BBJ", "country": "DE"},
-            {"city": "Black Tickle", "airport": "Black Tickle Airport", "iata": "YBI", "country": "CA"},
-            {"city": "Blackall", "airport": "Blackall Airport", "iata": "BKQ", "country": "AU"},
-            {"city": "Blackpool", "airport": "Blackpool Airport", "iata": "BLK", "country": "GB"},
-            {"city": "Blacksburg", "airport": "Virginia Tech Montgomery Executive Airport", "iata": "BCB", "country": "US"},
-            {"city": "Blackstone", "airport": "Allen C Perkinson Blackstone Army Air Field", "iata": "BKT", "country": "US"},
-            {"city": "Blackwell", "airport": "Earl Henry Airport", "iata": "BWL", "country": "US"},
-            {"city": "Blagoveschensk", "airport": "Ignatyevo Airport", "iata": "BQS", "country": "RU"},
-            {"city": "Blakely Island", "airport": "Blakely Island Airport", "iata": "BYW", "country": "US"},
-            {"city": "Blanc-Sablon", "airport": "Lourdes-de-Blanc-Sablon Airport", "iata": "YBX", "country": "CA"},
-            {"city": "Blanding", "airport": "Blanding Municipal Airport", "iata": "BDG", "country": "US"},
-            {"city": "Blangpidie", "airport": "Kuala Batu Airport", "iata": "KJX", "country": "ID"},
-            {"city": "Blantyre", "airport": "Chileka International Airport", "iata": "BLZ", "country": "MW"},
-            {"city": "Blenheim", "airport": "Woodbourne Airport", "iata": "BHE", "country": "NZ"},
-            {"city": "Block Island", "airport": "Block Island State Airport", "iata": "BID", "country": "US"},
-            {"city": "Bloemfontain", "airport": "Bram Fischer International Airport", "iata": "BFN", "country": "ZA"},
-            {"city": "Bloodvein River", "airport": "Bloodvein River Airport", "iata": "YDV", "country": "CA"},
-            {"city": "Bloomington", "airport": "Monroe County Airport", "iata": "BMG", "country": "US"},
-            {"city": "Bloomington/Normal", "airport": "Central Illinois Regional Airport at Bloomington-Normal", "iata": "BMI", "country": "US"},
-            {"city": "Blora", "airport": "Ngloram Airport", "iata": "CPF", "country": "ID"},
-            {"city": "Blossom Village", "airport": "Edward Bodden Little Cayman Airfield", "iata": "LYB", "country": "KY"},
-            {"city": "Blountville", "airport": "Tri-Cities Regional TN/VA Airport", "iata": "TRI", "country": "US"},
-            {"city": "Blubber Bay", "airport": "Blubber Bay Seaplane Base", "iata": "XBB", "country": "CA"},
-            {"city": "Bluefield", "airport": "Mercer County Airport", "iata": "BLF", "country": "US"},
-            {"city": "Bluefields", "airport": "Bluefields Airport", "iata": "BEF", "country": "NI"},
-            {"city": "Blumenau", "airport": "Blumenau Airport", "iata": "BNU", "country": "BR"},
-            {"city": "Blythe", "airport": "Blythe Airport", "iata": "BLH", "country": "US"},
-            {"city": "Blytheville", "airport": "Arkansas International Airport", "iata": "BYH", "country": "US"},
-            {"city": "Blytheville", "airport": "Blytheville Municipal Airport", "iata": "HKA", "country": "US"},
-            {"city": "Blönduós", "airport": "Blönduós Airport", "iata": "BLO", "country": "IS"},
-            {"city": "Bo", "airport": "Bo Airport", "iata": "KBS", "country": "SL"},
-            {"city": "Boa Vista", "airport": "Atlas Brasil Cantanhede Airport", "iata": "BVB", "country": "BR"},
-            {"city": "Boana", "airport": "Boana Airport", "iata": "BNV", "country": "PG"},
-            {"city": "Boang Island", "airport": "Boang Airport", "iata": "BOV", "country": "PG"},
-            {"city": "Bob Quinn Lake", "airport": "Bob Quinn Lake Airport", "iata": "YBO", "country": "CA"},
-            {"city": "Bobo Dioulasso", "airport": "Bobo Dioulasso Airport", "iata": "BOY", "country": "BF"},
-            {"city": "Boca Raton", "airport": "Boca Raton Airport", "iata": "BCT", "country": "US"},
-            {"city": "Boca de Sábalo", "airport": "Sambú Airport", "iata": "SAX", "country": "PA"},
-            {"city": "Boca do Acre", "airport": "Novo Campo Airport", "iata": "BCR", "country": "BR"},
-            {"city": "Bodaybo", "airport": "Bodaybo Airport", "iata": "ODO", "country": "RU"},
-            {"city": "Bodinumu", "airport": "Bodinumu Airport", "iata": "BNM", "country": "PG"},
-            {"city": "Bodrum", "airport": "Bodrum-Imsık Airport", "iata": "BXN", "country": "TR"},
-            {"city": "Bodrum", "airport": "Milas Bodrum International Airport", "iata": "BJV", "country": "TR"},
-            {"city": "Bodø", "airport": "Bodø Airport", "iata": "BOO", "country": "NO"},
-            {"city": "Boende", "airport": "Boende Airport", "iata": "BNB", "country": "CD"},
-            {"city": "Bogalusa", "airport": "George R Carr Memorial Air Field", "iata": "BXA", "country": "US"},
-            {"city": "Bogande", "airport": "Bogande Airport", "iata": "XBG", "country": "BF"},
-            {"city": "Boghe", "airport": "Abbaye Airport", "iata": "BGH", "country": "MR"},
-            {"city": "Bogorodskoye", "airport": "Bogorodskoye Airport", "iata": "BQG", "country": "RU"},
-            {"city": "Bogota", "airport": "El Dorado International Airport", "iata": "BOG", "country": "CO"},
-            {"city": "Boguchany", "airport": "Boguchany Airport", "iata": "BGS", "country": "RU"},
-            {"city": "Boigu Island", "airport": "Boigu Island Airport", "iata": "GIC", "country": "AU"},
-            {"city": "Boise", "airport": "Boise Air Terminal/Gowen Field", "iata": "BOI", "country": "US"},
-            {"city": "Bojnord", "airport": "Bojnord Airport", "iata": "BJB", "country": "IR"},
-            {"city": "Bokondini", "airport": "Bokondini Airport", "iata": "BUI", "country": "ID"},
-            {"city": "Bokoro", "airport": "Bokoro Airport", "iata": "BKR", "country": "TD"},
-            {"city": "Bokpyinn", "airport": "Bokpyinn Airport", "iata": "VBP", "country": "MM"},
-            {"city": "Boké", "airport": "Boké Baralande Airport", "iata": "BKJ", "country": "GN"},
-            {"city": "Bol", "airport": "Bol-Berim Airport", "iata": "OTC", "country": "TD"},
-            {"city": "Bole", "airport": "Bole Alashankou Airport", "iata": "BPL", "country": "CN"},
-            {"city": "Bolivar", "airport": "El Dorado Airport", "iata": "EOR", "country": "VE"},
-            {"city": "Bologna", "airport": "Bologna Guglielmo Marconi Airport", "iata": "BLQ", "country": "IT"},
-            {"city": "Bolzano (BZ)", "airport": "Bolzano Airport", "iata": "BZO", "country": "IT"},
-            {"city": "Bom Jesus da Lapa", "airport": "Bom Jesus da Lapa Airport", "iata": "LAZ", "country": "BR"},
-            {"city": "Boma", "airport": "Boma Airport", "iata": "BOA", "country": "CD"},
-            {"city": "Bomai", "airport": "Bomai Airport", "iata": "BMH", "country": "PG"},
-            {"city": "Bonanza", "airport": "San Pedro Airport", "iata": "BZA", "country": "NI"},
-            {"city": "Bonaventure", "airport": "Bonaventure Airport", "iata": "YVB", "country": "CA"},
-            {"city": "Bondoukou", "airport": "Soko Airport", "iata": "BDK", "country": "CI"},
-            {"city": "Bone", "airport": "Arung Palakka Airport", "iata": "APD", "country": "ID"},
-            {"city": "Bongao", "airport": "Sanga Sanga Airport", "iata": "TWT", "country": "PH"},
-            {"city": "Bongor", "airport": "Bongor Airport", "iata": "OGR", "country": "TD"},
-            {"city": "Bongsan-ri, Uljin", "airport": "Uljin Airport", "iata": "UJN", "country": "KR"},
-            {"city": "Bonito", "airport": "Bonito Airport", "iata": "BYO", "country": "BR"},
-            {"city": "Bonnyville", "airport": "Bonnyville Airport", "iata": "YBY", "country": "CA"},
-            {"city": "Bontang-Borneo Island", "airport": "LNG Badak Airport", "iata": "BXT", "country": "ID"},
-            {"city": "Boone", "airport": "Boone Municipal Airport", "iata": "BNW", "country": "US"},
-            {"city": "Boos", "airport": "Rouen Vallée de Seine Airport", "iata": "URO", "country": "FR"},
-            {"city": "Booue", "airport": "Booue Airport", "iata": "BGB", "country": "GA"},
-            {"city": "Bor", "airport": "Podkamennaya Tunguska Airport", "iata": "TGP", "country": "RU"},
-            {"city": "Boralday", "airport": "Boralday Airport", "iata": "BXJ", "country": "KZ"},
-            {"city": "Borama", "airport": "Borama Airport", "iata": "BXX", "country": "SO"},
-            {"city": "Borba", "airport": "Borba Airport", "iata": "RBB", "country": "BR"},
-            {"city": "Bordeaux", "airport": "Bordeaux–Mérignac Airport", "iata": "BOD", "country": "FR"},
-            {"city": "Bordj Badji Mokhtar", "airport": "Bordj Badji Mokhtar Airport", "iata": "BMW", "country": "DZ"},
-            {"city": "Borgarfjörður eystri", "airport": "Borgarfjörður eystri Airport", "iata": "BGJ", "country": "IS"},
-            {"city": "Borger", "airport": "Hutchinson County Airport", "iata": "BGD", "country": "US"},
-            {"city": "Borkum", "airport": "Borkum Airport", "iata": "BMK", "country": "DE"},
-            {"city": "Borlange", "airport": "Dala Airport", "iata": "BLE", "country": "SE"},
-            {"city": "Borongan City", "airport": "Borongan Airport", "iata": "BPA", "country": "PH"},
-            {"city": "Borrego Springs", "airport": "Borrego Valley Airport", "iata": "BXS", "country": "US"},
-            {"city": "Boryspil", "airport": "Boryspil International Airport", "iata": "KBP", "country": "UA"},
-            {"city": "Bosaso", "airport": "Bosaso / Bender Qassim International Airport", "iata": "BSA", "country": "SO"},
-            {"city": "Boscobel", "airport": "Ian Fleming International Airport", "iata": "OCJ", "country": "JM"},
-            {"city": "Bossangoa", "airport": "Bossangoa Airport", "iata": "BSN", "country": "CF"},
-            {"city": "Bosset", "airport": "Bosset Airport", "iata": "BOT", "country": "PG"},
-            {"city": "Bossier City", "airport": "Barksdale Air Force Base", "iata": "BAD", "country": "US"},
-            {"city": "Boston", "airport": "Logan International Airport", "iata": "BOS", "country": "US"},
-            {"city": "Boston", "airport": "Cape Air Seaplanes on Boston Harbor Seaplane Base", "iata": "BNH", "country": "US"},
-            {"city": "Boswell Bay", "airport": "Boswell Bay Airport", "iata": "BSW", "country": "US"},
-            {"city": "Botopasi", "airport": "Botopasi Airport", "iata": "BTO", "country": "SR"},
-            {"city": "Bouaké", "airport": "Bouaké Airport", "iata": "BYK", "country": "CI"},
-            {"city": "Bouar", "airport": "Bouar Airport", "iata": "BOP", "country": "CF"},
-            {"city": "Bouarfa", "airport": "Bouarfa Airport", "iata": "UAR", "country": "MA"},
-            {"city": "Bouca", "airport": "Bouca Airport", "iata": "BCF", "country": "CF"},
-            {"city": "Boulder", "airport": "Boulder Municipal Airport", "iata": "WBU", "country": "US"},
-            {"city": "Boulder City", "airport": "Boulder City Municipal Airport", "iata": "BLD", "country": "US"},
-            {"city": "Boulsa", "airport": "Boulsa Airport", "iata": "XBO", "country": "BF"},
-            {"city": "Bouna", "airport": "Bouna Airport", "iata": "BQO", "country": "CI"},
-            {"city": "Boundary", "airport": "Boundary Airport", "iata": "BYA", "country": "US"},
-            {"city": "Boundiali", "airport": "Boundiali Airport", "iata": "BXI", "country": "CI"},
-            {"city": "Boundji", "airport": "Boundji Airport", "iata": "BOE", "country": "CG"},
-            {"city": "Bountiful", "airport": "Skypark Airport", "iata": "BTF", "country": "US"},
-            {"city": "Bourges", "airport": "Bourges airport", "iata": "BOU", "country": "FR"},
-            {"city": "Bournemouth", "airport": "Bournemouth Airport", "iata": "BOH", "country": "GB"},
-            {"city": "Bousso", "airport": "Bousso Airport", "iata": "OUT", "country": "TD"},
-            {"city": "Boutilimit", "airport": "Boutilimit Airport", "iata": "OTL", "country": "MR"},
-            {"city": "Bovanenkovo", "airport": "Bovanenkovo Airport", "iata": "BVJ", "country": "RU"},
-            {"city": "Bowen", "airport": "Bowen Airport", "iata": "ZBO", "country": "AU"},
-            {"city": "Bowling Green", "airport": "Mary Walker LZ Airport", "iata": "APH", "country": "US"},
-            {"city": "Bowling Green", "airport": "Bowling Green Warren County Regional Airport", "iata": "BWG", "country": "US"},
-            {"city": "Bowman", "airport": "Bowman Regional Airport", "iata": "BWM", "country": "US"},
-            {"city": "Bozeman", "airport": "Bozeman Yellowstone International Airport", "iata": "BZN", "country": "US"},
-            {"city": "Bozhou", "airport": "Bozhou Airport (under construction)", "iata": "BZJ", "country": "CN"},
-            {"city": "Bozoum", "airport": "Bozoum Airport", "iata": "BOZ", "country": "CF"},
-            {"city": "Bradford", "airport": "Rinkenberger Restricted Landing Area", "iata": "BDF", "country": "US"},
-            {"city": "Bradford", "airport": "Bradford Regional Airport", "iata": "BFD", "country": "US"},
-            {"city": "Brady", "airport": "Curtis Field", "iata": "BBD", "country": "US"},
-            {"city": "Bragado", "airport": "Bragado Airport", "iata": "QRF", "country": "AR"},
-            {"city": "Bragança", "airport": "Bragança Airport", "iata": "BGC", "country": "PT"},
-            {"city": "Bragança Paulista", "airport": "Estadual Arthur Siqueira Airport", "iata": "BJP", "country": "BR"},
-            {"city": "Brahman Mission", "airport": "Brahman Airstrip", "iata": "BRH", "country": "PG"},
-            {"city": "Brainerd", "airport": "Brainerd Lakes Regional Airport", "iata": "BRD", "country": "US"},
-            {"city": "Brak", "airport": "Brak Airport", "iata": "BCQ", "country": "LY"},
-            {"city": "Brandon", "airport": "Brandon Municipal Airport", "iata": "YBR", "country": "CA"},
-            {"city": "Brandon, Suffolk", "airport": "RAF Lakenheath", "iata": "LKZ", "country": "GB"},
-            {"city": "Branson", "airport": "Branson Airport", "iata": "BKG", "country": "US"},
-            {"city": "Branson / Hollister", "airport": "M. Graham Clark Downtown Airport", "iata": "PLK", "country": "US"},
-            {"city": "Brasilito", "airport": "Flamingo Airport", "iata": "FMG", "country": "CR"},
-            {"city": "Brasília", "airport": "Presidente Juscelino Kubitschek International Airport", "iata": "BSB", "country": "BR"},
-            {"city": "Bratislava", "airport": "M. R. Štefánik Airport", "iata": "BTS", "country": "SK"},
-            {"city": "Bratsk", "airport": "Bratsk Airport", "iata": "BTK", "country": "RU"},
-            {"city": "Braunschweig", "airport": "Braunschweig-Wolfsburg Airport", "iata": "BWE", "country": "DE"},
-            {"city": "Brawley", "airport": "Brawley Municipal Airport", "iata": "BWC", "country": "US"},
-            {"city": "Brazoria", "airport": "Eagle Air Park", "iata": "BZT", "country": "US"},
-            {"city": "Brazzaville", "airport": "Maya-Maya Airport", "iata": "BZV", "country": "CG"},
-            {"city": "Brașov (Ghimbav)", "airport": "Brașov-Ghimbav International Airport", "iata": "GHV", "country": "RO"},
-            {"city": "Breckenridge", "airport": "Stephens County Airport", "iata": "BKD", "country": "US"},
-            {"city": "Breiðdalsvík", "airport": "Breiðdalsvík Airport", "iata": "BXV", "country": "IS"},
-            {"city": "Bremen", "airport": "Bremen Airport", "iata": "BRE", "country": "DE"},
-            {"city": "Bremerton", "airport": "Bremerton National Airport", "iata": "PWT", "country": "US"},
-            {"city": "Breslau", "airport": "Region of Waterloo International Airport", "iata": "YKF", "country": "CA"},
-            {"city": "Brest", "airport": "Brest Bretagne airport", "iata": "BES", "country": "FR"},
-            {"city": "Brest", "airport": "Brest Airport", "iata": "BQT", "country": "BY"},
-            {"city": "Breves", "airport": "Breves Airport", "iata": "BVS", "country": "BR"},
-            {"city": "Brevig Mission", "airport": "Brevig Mission Airport", "iata": "KTS", "country": "US"},
-            {"city": "Bria", "airport": "Bria Airport", "iata": "BIV", "country": "CF"},
-            {"city": "Bridgeport", "airport": "Igor I Sikorsky Memorial Airport", "iata": "BDR", "country": "US"},
-            {"city": "Bridgeport", "airport": "North Central West Virginia Airport", "iata": "CKB", "country": "US"},
-            {"city": "Bridgetown", "airport": "Grantley Adams International Airport", "iata": "BGI", "country": "BB"},
-            {"city": "Brigham City", "airport": "Brigham City Regional Airport", "iata": "BMC", "country": "US"},
-            {"city": "Brighton Downs", "airport": "Brighton Downs Airport", "iata": "BHT", "country": "AU"},
-            {"city": "Brighton, East Sussex", "airport": "Brighton City Airport", "iata": "ESH", "country": "GB"},
-            {"city": "Brindisi", "airport": "Brindisi Airport", "iata": "BDS", "country": "IT"},
-            {"city": "Brisbane", "airport": "Brisbane International Airport", "iata": "BNE", "country": "AU"},
-            {"city": "Bristol", "airport": "Bristol Airport", "iata": "BRS", "country": "GB"},
-            {"city": "Britton", "airport": "Britton Municipal Airport", "iata": "TTO", "country": "US"},
-            {"city": "Brive", "airport": "Brive Souillac airport", "iata": "BVE", "country": "FR"},
-            {"city": "Brno", "airport": "Brno-Tuřany Airport", "iata": "BRQ", "country": "CZ"},
-            {"city": "Broadus", "airport": "Broadus Airport", "iata": "BDX", "country": "US"},
-            {"city": "Broadwood", "airport": "Kalgoorlie Boulder Airport", "iata": "KGI", "country": "AU"},
-            {"city": "Brochet", "airport": "Brochet Airport", "iata": "YBT", "country": "CA"},
-            {"city": "Brockville", "airport": "Brockville - Thousand Islands Regional Tackaberry Airport", "iata": "XBR", "country": "CA"},
-            {"city": "Broken Bow", "airport": "Broken Bow Municipal Airport", "iata": "BBW", "country": "US"},
-            {"city": "Broken Hill", "airport": "Broken Hill Airport", "iata": "BHQ", "country": "AU"},
-            {"city": "Bromont", "airport": "Bromont (Roland Désourdy) Airport", "iata": "ZBM", "country": "CA"},
-            {"city": "Brookings", "airport": "Brookings Regional Airport", "iata": "BKX", "country": "US"},
-            {"city": "Brookings", "airport": "Brookings Airport", "iata": "BOK", "country": "US"},
-            {"city": "Broome", "airport": "Broome International Airport", "iata": "BME", "country": "AU"},
-            {"city": "Broughton", "airport": "Hawarden Airport", "iata": "CEG", "country": "GB"},
-            {"city": "Broughton Island", "airport": "Greenway Sound Seaplane Base", "iata": "YGN", "country": "CA"},
-            {"city": "Brownsville", "airport": "Brownsville South Padre Island International Airport", "iata": "BRO", "country": "US"},
-            {"city": "Brownwood", "airport": "Brownwood Regional Airport", "iata": "BWD", "country": "US"},
-            {"city": "Brumado", "airport": "Sócrates Mariani Bittencourt Airport", "iata": "BMS", "country": "BR"},
-            {"city": "Brunswick", "airport": "Brunswick Golden Isles Airport", "iata": "BQK", "country": "US"},
-            {"city": "Brunswick", "airport": "Brunswick Executive Airport", "iata": "NHZ", "country": "US"},
-            {"city": "Brus Laguna", "airport": "Brus Laguna Airport", "iata": "BHG", "country": "HN"},
-            {"city": "Bryan", "airport": "Coulter Field", "iata": "CFD", "country": "US"},
-            {"city": "Bryansk", "airport": "Bryansk Airport", "iata": "BZK", "country": "RU"},
-            {"city": "Bryce Canyon", "airport": "Bryce Canyon Airport", "iata": "BCE", "country": "US"},
-            {"city": "Bréville-sur-Mer, Manche", "airport": "Granville Airport", "iata": "GFR", "country": "FR"},
-            {"city": "Brønnøy", "airport": "Brønnøysund Airport, Brønnøy", "iata": "BNN", "country": "NO"},
-            {"city": "Buariki", "airport": "Aranuka Airport", "iata": "AAK", "country": "KI"},
-            {"city": "Bubaque", "airport": "Bubaque Airport", "iata": "BQE", "country": "GW"},
-            {"city": "Bucaramanga", "airport": "Palonegro Airport", "iata": "BGA", "country": "CO"},
-            {"city": "Buchanan", "airport": "Buchanan Airport", "iata": "UCN", "country": "LR"},
-            {"city": "Bucharest", "airport": "Bucharest Băneasa Aurel Vlaicu International Airport", "iata": "BBU", "country": "RO"},
-            {"city": "Buckeye", "airport": "Buckeye Municipal Airport", "iata": "BXK", "country": "US"},
-            {"city": "Buckland", "airport": "Buckland Airport", "iata": "BKC", "country": "US"},
-            {"city": "Budapest", "airport": "Budapest Liszt Ferenc International Airport", "iata": "BUD", "country": "HU"},
-            {"city": "Buenaventura", "airport": "Gerardo Tobar López Airport", "iata": "BUN", "country": "CO"},
-            {"city": "Buenos Aires", "airport": "Jorge Newbery Airpark", "iata": "AEP", "country": "AR"},
-            {"city": "Buenos Aires (Ezeiza)", "airport": "Minister Pistarini International Airport", "iata": "EZE", "country": "AR"},
-            {"city": "Buffalo", "airport": "Buffalo Niagara International Airport", "iata": "BUF", "country": "US"},
-            {"city": "Buffalo", "airport": "Johnson County Airport", "iata": "BYG", "country": "US"},
-            {"city": "Buffalo Narrows", "airport": "Buffalo Narrows Airport", "iata": "YVT", "country": "CA"},
-            {"city": "Bugulma", "airport": "Bugulma Airport", "iata": "UUA", "country": "RU"},
-            {"city": "Buin", "airport": "Buin Airport", "iata": "UBI", "country": "PG"},
-            {"city": "Bujumbura", "airport": "Bujumbura Melchior Ndadaye International Airport", "iata": "BJM", "country": "BI"},
-            {"city": "Buka Island", "airport": "Buka Airport", "iata": "BUA", "country": "PG"},
-            {"city": "Bukhara", "airport": "Bukhara International Airport", "iata": "BHK", "country": "UZ"},
-            {"city": "Buki", "airport": "Finschhafen Airport", "iata": "FIN", "country": "PG"},
-            {"city": "Bukit Padi", "airport": "Letung Airport", "iata": "LMU", "country": "ID"},
-            {"city": "Bukoba", "airport": "Bukoba Airport", "iata": "BKZ", "country": "TZ"},
-            {"city": "Bulawayo", "airport": "Joshua Mqabuko Nkomo International Airport", "iata": "BUQ", "country": "ZW"},
-            {"city": "Bulgan", "airport": "Bulgan Airport", "iata": "UGA", "country": "MN"},
-            {"city": "Bulgan", "airport": "Bulgan Sum Airport", "iata": "HBU", "country": "MN"},
-            {"city": "Bull Harbour", "airport": "Bull Harbour Water Aerodrome", "iata": "YBH", "country": "CA"},
-            {"city": "Bullfrog", "airport": "Bullfrog Basin Airport", "iata": "BFG", "country": "US"},
-            {"city": "Bullhead City", "airport": "Laughlin Bullhead International Airport", "iata": "IFP", "country": "US"},
-            {"city": "Bullocks Harbour", "airport": "Great Harbour Cay Airport", "iata": "GHC", "country": "BS"},
-            {"city": "Bulolo", "airport": "Bulolo Airport", "iata": "BUL", "country": "PG"},
-            {"city": "Bultfontein", "airport": "Bultfontein Airport", "iata": "UTE", "country": "ZA"},
-            {"city": "Bumba", "airport": "Bumba Airport", "iata": "BMB", "country": "CD"},
-            {"city": "Bumi", "airport": "Bumi Hills Airport", "iata": "BZH", "country": "ZW"},
-            {"city": "Bundaberg", "airport": "Bundaberg Airport", "iata": "BDB", "country": "AU"},
-            {"city": "Bundi", "airport": "Bundi Airport", "iata": "BNT", "country": "PG"},
-            {"city": "Bunia", "airport": "Bunia Airport", "iata": "BUX", "country": "CD"},
-            {"city": "Bunju Island", "airport": "Bunyu Airport", "iata": "BYQ", "country": "ID"},
-            {"city": "Bunsil - Umboi Island", "airport": "Bunsil Airport", "iata": "BXZ", "country": "PG"},
-            {"city": "Buochs", "airport": "Buochs Airport", "iata": "BXO", "country": "CH"},
-            {"city": "Buol-Celebes Island", "airport": "Buol - Pogogul Airport", "iata": "UOL", "country": "ID"},
-            {"city": "Buon Ma Thuot", "airport": "Buon Ma Thuot Airport", "iata": "BMV", "country": "VN"},
-            {"city": "Buraidah", "airport": "Gassim Airport", "iata": "ELQ", "country": "SA"},
-            {"city": "Buraimi", "airport": "Buraimi Airport", "iata": "RMB", "country": "OM"},
-            {"city": "Burang Town", "airport": "Ali Pulan Airport", "iata": "APJ", "country": "CN"},
-            {"city": "Burao", "airport": "Burao Airport", "iata": "BUO", "country": "SO"},
-            {"city": "Burbach", "airport": "Siegerland Airport", "iata": "SGE", "country": "DE"},
-            {"city": "Burbank", "airport": "Hollywood Burbank Airport", "iata": "BUR", "country": "US"},
-            {"city": "Bureta", "airport": "Levuka Airfield", "iata": "LEV", "country": "FJ"},
-            {"city": "Burgas", "airport": "Burgas Airport", "iata": "BOJ", "country": "BG"},
-            {"city": "Burgos", "airport": "Burgos Airport", "iata": "RGS", "country": "ES"},
-            {"city": "Buriram", "airport": "Buri Ram Airport", "iata": "BFV", "country": "TH"},
-            {"city": "Burley", "airport": "Burley Municipal Airport", "iata": "BYI", "country": "US"},
-            {"city": "Burlington", "airport": "Southeast Iowa Regional Airport", "iata": "BRL", "country": "US"},
-            {"city": "Burlington", "airport": "Skagit Regional Airport", "iata": "MVW", "country": "US"},
-            {"city": "Burnie", "airport": "Wynyard Airport", "iata": "BWT", "country": "AU"},
-            {"city": "Burns", "airport": "Burns Municipal Airport", "iata": "BNO", "country": "US"},
-            {"city": "Burns Lake", "airport": "Burns Lake Airport", "iata": "YPZ", "country": "CA"},
-            {"city": "Burnt Pine", "airport": "Norfolk Island International Airport", "iata": "NLK", "country": "NF"},
-            {"city": "Burqin", "airport": "Burqin Kanas Airport", "iata": "KJI", "country": "CN"},
-            {"city": "Burwash Landing", "airport": "Burwash Airport", "iata": "YDB", "country": "CA"},
-            {"city": "Burwell", "airport": "Cram Field", "iata": "BUB", "country": "US"},
-            {"city": "Bury Saint Edmunds, Suffolk", "airport": "RAF Mildenhall", "iata": "MHZ", "country": "GB"},
-            {"city": "Bury Saint Edmunds, Suffolk", "airport": "RAF Honington", "iata": "BEQ", "country": "GB"},
-            {"city": "Busan", "airport": "Gimhae International Airport", "iata": "PUS", "country": "KR"},
-            {"city": "Bushehr", "airport": "Bushehr Airport", "iata": "BUZ", "country": "IR"},
-            {"city": "Busselton", "airport": "Busselton Margaret River Regional Airport", "iata": "BQB", "country": "AU"},
-            {"city": "Buta", "airport": "Buta Zega Airport", "iata": "BZU", "country": "CD"},
-            {"city": "Butare", "airport": "Butare Airport", "iata": "BTQ", "country": "RW"},
-            {"city": "Butaritari", "airport": "Butaritari Airport", "iata": "BBG", "country": "KI"},
-            {"city": "Butembo", "airport": "Rughenda Airfield", "iata": "RUE", "country": "CD"},
-            {"city": "Butler", "airport": "Pittsburgh/Butler Regional Airport", "iata": "BTP", "country": "US"},
-            {"city": "Butler", "airport": "Butler Memorial Airport", "iata": "BUM", "country": "US"},
-            {"city": "Butte", "airport": "Bert Mooney Airport", "iata": "BTM", "country": "US"},
-            {"city": "Butterworth", "airport": "RMAF Butterworth Air Base", "iata": "BWH", "country": "MY"},
-            {"city": "Butuan", "airport": "Bancasi Airport", "iata": "BXU", "country": "PH"},
-            {"city": "Bydgoszcz", "airport": "Bydgoszcz Ignacy Jan Paderewski Airport", "iata": "BZG", "country": "PL"},
-            {"city": "Bâle / Mulhouse", "airport": "EuroAirport Basel–Mulhouse–Freiburg", "iata": "BSL", "country": "FR"},
-            {"city": "Båtsfjord", "airport": "Båtsfjord Airport", "iata": "BJF", "country": "NO"},
-            {"city": "Béchar", "airport": "Béchar Boudghene Ben Ali Lotfi Airport", "iata": "CBH", "country": "DZ"},
-            {"city": "Béjaïa", "airport": "Soummam–Abane Ramdane Airport", "iata": "BJA", "country": "DZ"},
-            {"city": "Béziers", "airport": "Béziers Vias airport", "iata": "BZR", "country": "FR"},
-            {"city": "Büren", "airport": "Paderborn Lippstadt Airport", "iata": "PAD", "country": "DE"},
-            {"city": "Bălți", "airport": "Bălți International Airport", "iata": "BZY", "country": "MD"},
-            {"city": "Ca Mau City", "airport": "Cà Mau Airport", "iata": "CAH", "country": "VN"},
-            {"city": "Cabatuan", "airport": "Iloilo International Airport", "iata": "ILO", "country": "PH"},
-            {"city": "Cabimas", "airport": "Oro Negro Airport", "iata": "CBS", "country": "VE"},
-            {"city": "Cabinda", "airport": "Cabinda Airport", "iata": "CAB", "country": "AO"},
-            {"city": "Cabo Frio", "airport": "Umberto Modiano Airport", "iata": "BZC", "country": "BR"},
-            {"city": "Cabo Frio", "airport": "Cabo Frio Airport", "iata": "CFB", "country": "BR"},
-            {"city": "Cabo Rojo", "airport": "Cabo Rojo Airport", "iata": "CBJ", "country": "DO"},
-            {"city": "Cache Creek", "airport": "Cache Creek-Ashcroft Regional Airport", "iata": "YZA", "country": "CA"},
-            {"city": "Cachoeira Do Sul", "airport": "Cachoeira do Sul Airport", "iata": "QDB", "country": "BR"},
-            {"city": "Cachoeiro do Itapemirim", "airport": "Cachoeiro do Itapemirim - Raimundo de Andrade Airport", "iata": "CDI", "country": "BR"},
-            {"city": "Cacoal", "airport": "Cacoal Airport", "iata": "OAL", "country": "BR"},
-            {"city": "Cadillac", "airport": "Wexford County Airport", "iata": "CAD", "country": "US"},
-            {"city": "Caen", "airport": "Caen Carpiquet airport", "iata": "CFR", "country": "FR"},
-            {"city": "Cafunfo", "airport": "Cafunfo Airport", "iata": "CFF", "country": "AO"},
-            {"city": "Cagliari", "airport": "Cagliari Elmas Airport", "iata": "CAG", "country": "IT"},
-            {"city": "Cahokia/St Louis", "airport": "St Louis Downtown Airport", "iata": "CPS", "country": "US"},
-            {"city": "Cahors", "airport": "Cahors Lalbenque airport", "iata": "ZAO", "country": "FR"},
-            {"city": "Caia", "airport": "Caia Airport", "iata": "CMZ", "country": "MZ"},
-            {"city": "Cairns", "airport": "Cairns International Airport", "iata": "CNS", "country": "AU"},
-            {"city": "Cairo", "airport": "Cairo International Airport", "iata": "CAI", "country": "EG"},
-            {"city": "Cairo", "airport": "Cairo Regional Airport", "iata": "CIR", "country": "US"},
-            {"city": "Cairu", "airport": "Fábio Perini Airport", "iata": "PBA", "country": "BR"},
-            {"city": "Cairu", "airport": "Lorenzo Airport", "iata": "MXQ", "country": "BR"},
-            {"city": "Cajamarca", "airport": "Mayor General FAP Armando Revoredo Iglesias Airport", "iata": "CJA", "country": "PE"},
-            {"city": "Cajazeiras", "airport": "Pedro Vieira Moreira Airport", "iata": "CJZ", "country": "BR"},
-            {"city": "Calabar", "airport": "Margaret Ekpo International Airport", "iata": "CBQ", "country": "NG"},
-            {"city": "Calais", "airport": "Calais Marck Airport", "iata": "CQF", "country": "FR"},
-            {"city": "Calama", "airport": "El Loa Airport", "iata": "CJC", "country": "CL"},
-            {"city": "Calbayog City", "airport": "Calbayog Airport", "iata": "CYP", "country": "PH"},
-            {"city": "Caldas Novas", "airport": "Nelson Ribeiro Guimarães Airport", "iata": "CLV", "country": "BR"},
-            {"city": "Calden", "airport": "Kassel Airport", "iata": "KSF", "country": "DE"},
-            {"city": "Caldwell", "airport": "Essex County Airport", "iata": "CDW", "country": "US"},
-            {"city": "Caleta Olivia", "airport": "Caleta Olivia Airport", "iata": "CVI", "country": "AR"},
-            {"city": "Calexico", "airport": "Calexico International Airport", "iata": "CXL", "country": "US"},
-            {"city": "Calgary", "airport": "Calgary International Airport", "iata": "YYC", "country": "CA"},
-            {"city": "Cali", "airport": "Alfonso Bonilla Aragon International Airport", "iata": "CLO", "country": "CO"},
-            {"city": "Calicut", "airport": "Calicut International Airport", "iata": "CCJ", "country": "IN"},
-            {"city": "California", "airport": "St. Mary's County Regional Airport", "iata": "LTW", "country": "US"},
-            {"city": "Calipatria", "airport": "Cliff Hatfield Memorial Airport", "iata": "CLR", "country": "US"},
-            {"city": "Caloundra", "airport": "Caloundra Airport", "iata": "CUD", "country": "AU"},
-            {"city": "Calverton", "airport": "Calverton Executive Airpark", "iata": "CTO", "country": "US"},
-            {"city": "Calvi", "airport": "Calvi Sainte Catherine Airport", "iata": "CLY", "country": "FR"},
-            {"city": "Cam Ranh", "airport": "Cam Ranh International Airport / Cam Ranh Air Base", "iata": "CXR", "country": "VN"},
-            {"city": "Camaguey", "airport": "Ignacio Agramonte International Airport", "iata": "CMW", "country": "CU"},
-            {"city": "Camaxilo", "airport": "Camaxilo Airport", "iata": "CXM", "country": "AO"},
-            {"city": "Camberley, Surrey", "airport": "Blackbushe Airport", "iata": "BBS", "country": "GB"},
-            {"city": "Cambridge", "airport": "Cambridge Dorchester Airport", "iata": "CGE", "country": "US"},
-            {"city": "Cambridge Bay", "airport": "Cambridge Bay Airport", "iata": "YCB", "country": "CA"},
-            {"city": "Cambridge, Cambridgeshire", "airport": "Cambridge City Airport", "iata": "CBG", "country": "GB"},
-            {"city": "Camden", "airport": "Harrell Field", "iata": "CDH", "country": "US"},
-            {"city": "Camden", "airport": "Woodward Field", "iata": "CDN", "country": "US"},
-            {"city": "Cametá", "airport": "New Cametá Airport", "iata": "CMT", "country": "BR"},
-            {"city": "Camiri", "airport": "Camiri Airport", "iata": "CAM", "country": "BO"},
-            {"city": "Camocim", "airport": "Camocim - Pinto Martins Airport", "iata": "CMC", "country": "BR"},
-            {"city": "Camopi", "airport": "Camopi Airport", "iata": "OYC", "country": "GF"},
-            {"city": "Camp Douglas", "airport": "Volk Field", "iata": "VOK", "country": "US"},
-            {"city": "Camp Roberts/San Miguel", "airport": "Roberts Army Heliport", "iata": "SYL", "country": "US"},
-            {"city": "Camp Springs", "airport": "Joint Base Andrews", "iata": "ADW", "country": "US"},
-            {"city": "Campbell River", "airport": "Campbell River Seaplane Base", "iata": "YHH", "country": "CA"},
-            {"city": "Campbell River", "airport": "Campbell River Airport", "iata": "YBL", "country": "CA"},
-            {"city": "Campbellpore", "airport": "Campbellpore Airport", "iata": "CWP", "country": "PK"},
-            {"city": "Campbeltown", "airport": "Campbeltown Airport", "iata": "CAL", "country": "GB"},
-            {"city": "Campeche", "airport": "Ingeniero Alberto Acuña Ongay International Airport", "iata": "CPE", "country": "MX"},
-            {"city": "Campina Grande", "airport": "Presidente João Suassuna Airport", "iata": "CPV", "country": "BR"},
-            {"city": "Campinas", "airport": "Viracopos International Airport", "iata": "VCP", "country": "BR"},
-            {"city": "Campiña", "airport": "Herrera Airport", "iata": "HRR", "country": "CO"},
-            {"city": "Campo Grande", "airport": "Campo Grande Airport", "iata": "CGR", "country": "BR"},
-            {"city": "Campo Mourão", "airport": "Campo Mourão Airport", "iata": "CBW", "country": "BR"},
-            {"city": "Campo nell'Elba (LI)", "airport": "Marina di Campo Airport", "iata": "EBA", "country": "IT"},
-            {"city": "Campos dos Goytacazes", "airport": "Bartolomeu Lisandro Airport", "iata": "CAW", "country": "BR"},
-            {"city": "Can Tho", "airport": "Can Tho International Airport", "iata": "VCA", "country": "VN"},
-            {"city": "Canaima", "airport": "Canaima Airport", "iata": "CAJ", "country": "VE"},
-            {"city": "Cananea", "airport": "Cananea National Airport", "iata": "CNA", "country": "MX"},
-            {"city": "Canarana", "airport": "Canarana Airport", "iata": "CQA", "country": "BR"},
-            {"city": "Canavieiras", "airport": "Sócrates Rezende Airport", "iata": "CNV", "country": "BR"},
-            {"city": "Canberra", "airport": "Canberra Airport", "iata": "CBR", "country": "AU"},
-            {"city": "Cancún", "airport": "Cancún International Airport", "iata": "CUN", "country": "MX"},
-            {"city": "Candala", "airport": "Candala Airport", "iata": "CXN", "country": "SO"},
-            {"city": "Candilejas", "airport": "Candilejas Airport", "iata": "CJD", "country": "CO"},
-            {"city": "Candle", "airport": "Candle 2 Airport", "iata": "CDL", "country": "US"},
-            {"city": "Canefield", "airport": "Canefield Airport", "iata": "DCF", "country": "DM"},
-            {"city": "Canela", "airport": "Canela Airport", "iata": "CEL", "country": "BR"},
-            {"city": "Cangamba", "airport": "Cangamba Airport", "iata": "CNZ", "country": "AO"},
-            {"city": "Cannes", "airport": "Cannes Mandelieu Airport", "iata": "CEQ", "country": "FR"},
-            {"city": "Canobie", "airport": "Canobie Airport", "iata": "CBY", "country": "AU"},
-            {"city": "Canouan", "airport": "Canouan Airport", "iata": "CIW", "country": "VC"},
-            {"city": "Canton", "airport": "Canton Municipal Airport", "iata": "CTK", "country": "US"},
-            {"city": "Cantwell", "airport": "Summit Airport", "iata": "UMM", "country": "US"},
-            {"city": "Cap Haitien", "airport": "Cap Haitien International Airport", "iata": "CAP", "country": "HT"},
-            {"city": "Cap Skirring", "airport": "Cap Skirring Airport", "iata": "CSK", "country": "SN"},
-            {"city": "Capanda", "airport": "Kapanda Airport", "iata": "KNP", "country": "AO"},
-            {"city": "Cape Barren Island", "airport": "Cape Barren Island Airport", "iata": "CBI", "country": "AU"},
-            {"city": "Cape Girardeau", "airport": "Cape Girardeau Regional Airport", "iata": "CGI", "country": "US"},
-            {"city": "Cape Gloucester", "airport": "Cape Gloucester Airport", "iata": "CGC", "country": "PG"},
-            {"city": "Cape Lisburne", "airport": "Cape Lisburne LRRS Airport", "iata": "LUR", "country": "US"},
-            {"city": "Cape Newenham", "airport": "Cape Newenham LRRS Airport", "iata": "EHM", "country": "US"},
-            {"city": "Cape Pole", "airport": "Cape Pole Seaplane Base", "iata": "CZP", "country": "US"},
-            {"city": "Cape Rodney", "airport": "Cape Rodney Airport", "iata": "CPN", "country": "PG"},
-            {"city": "Cape Romanzof", "airport": "Cape Romanzof LRRS Airport", "iata": "CZF", "country": "US"},
-            {"city": "Cape Sarichef", "airport": "Cape Sarichef Airport", "iata": "WSF", "country": "US"},
-            {"city": "Cape Town", "airport": "Cape Town International Airport", "iata": "CPT", "country": "ZA"},
-            {"city": "Capure", "airport": "Pedernales Airport", "iata": "PDZ", "country": "VE"},
-            {"city": "Caquetania", "airport": "Caquetania Airport", "iata": "CQT", "country": "CO"},
-            {"city": "Caransebeş", "airport": "Caransebeş Airport", "iata": "CSB", "country": "RO"},
-            {"city": "Carauari", "airport": "Carauari Airport", "iata": "CAF", "country": "BR"},
-            {"city": "Caravelas", "airport": "Caravelas Airport", "iata": "CRQ", "country": "BR"},
-            {"city": "Carcassonne", "airport": "Carcassonne Salvaza Airport", "iata": "CCF", "country": "FR"},
-            {"city": "Cardiff", "airport": "Cardiff International Airport", "iata": "CWL", "country": "GB"},
-            {"city": "Carepa", "airport": "Antonio Roldán Betancur Airport", "iata": "APO", "country": "CO"},
-            {"city": "Caribou", "airport": "Caribou Municipal Airport", "iata": "CAR", "country": "US"},
-            {"city": "Carles", "airport": "Sicogon Airstrip", "iata": "ICO", "country": "PH"},
-            {"city": "Carlisle, Cumbria", "airport": "Carlisle Lake District Airport", "iata": "CAX", "country": "GB"},
-            {"city": "Carlsbad", "airport": "Cavern City Air Terminal", "iata": "CNM", "country": "US"},
-            {"city": "Carlsbad", "airport": "McClellan-Palomar Airport", "iata": "CLD", "country": "US"},
-            {"city": "Carlton Hill", "airport": "Carlton Hill Airport", "iata": "CRY", "country": "AU"},
-            {"city": "Carmelita", "airport": "Carmelita Airport", "iata": "CMM", "country": "GT"},
-            {"city": "Carmen de Patagones", "airport": "Carmen de Patagones Airport", "iata": "CPG", "country": "AR"},
-            {"city": "Carnarvon", "airport": "Carnarvon Airport", "iata": "CVQ", "country": "AU"},
-            {"city": "Carnot", "airport": "Carnot Airport", "iata": "CRF", "country": "CF"},
-            {"city": "Caro", "airport": "Tuscola Area Airport", "iata": "TZC", "country": "US"},
-            {"city": "Carolina", "airport": "Brig. Lysias Augusto Rodrigues Airport", "iata": "CLN", "country": "BR"},
-            {"city": "Carpentaria Downs", "airport": "Carpentaria Downs Airport", "iata": "CFP", "country": "AU"},
-            {"city": "Carrefour Sanon", "airport": "Jérémie Airport", "iata": "JEE", "country": "HT"},
-            {"city": "Carriacou Island", "airport": "Lauriston Airport", "iata": "CRU", "country": "GD"},
-            {"city": "Carrillo", "airport": "Playa Samara/Carrillo Airport", "iata": "PLD", "country": "CR"},
-            {"city": "Carrizo Springs", "airport": "Dimmit County Airport", "iata": "CZT", "country": "US"},
-            {"city": "Carroll", "airport": "Arthur N Neu Airport", "iata": "CIN", "country": "US"},
-            {"city": "Carson City", "airport": "Carson Airport", "iata": "CSN", "country": "US"},
-            {"city": "Cartagena", "airport": "Rafael Nuñez International Airport", "iata": "CTG", "country": "CO"},
-            {"city": "Cartago", "airport": "Santa Ana Airport", "iata": "CRC", "country": "CO"},
-            {"city": "Carterton, Oxfordshire", "airport": "RAF Brize Norton", "iata": "BZZ", "country": "GB"},
-            {"city": "Carthage", "airport": "Moore County Airport", "iata": "SOP", "country": "US"},
-            {"city": "Cartwright", "airport": "Cartwright Airport", "iata": "YRF", "country": "CA"},
-            {"city": "Cartí Islands", "airport": "Cartí Airport", "iata": "CTE", "country": "PA"},
-            {"city": "Caruaru", "airport": "Caruaru Airport", "iata": "CAU", "country": "BR"},
-            {"city": "Carurú", "airport": "Carurú Airport", "iata": "CUO", "country": "CO"},
-            {"city": "Carutapera", "airport": "Carutapera Airport", "iata": "CTP", "country": "BR"},
-            {"city": "Carúpano", "airport": "General Francisco Bermúdez Airport", "iata": "CUP", "country": "VE"},
-            {"city": "Casa Grande", "airport": "Casa Grande Municipal Airport", "iata": "CGZ", "country": "US"},
-            {"city": "Casablanca", "airport": "Mohammed V International Airport", "iata": "CMN", "country": "MA"},
-            {"city": "Cascade", "airport": "Cascade Airport", "iata": "ICS", "country": "US"},
-            {"city": "Cascade Locks", "airport": "Cascade Locks State Airport", "iata": "CZK", "country": "US"},
-            {"city": "Cascais", "airport": "Cascais Airport", "iata": "CAT", "country": "PT"},
-            {"city": "Cascavel", "airport": "Coronel Adalberto Mendes da Silva Airport", "iata": "CAC", "country": "BR"},
-            {"city": "Caselle (VR)", "airport": "Verona Villafranca Valerio Catullo Airport", "iata": "VRN", "country": "IT"},
-            {"city": "Caselle Torinese (TO)", "airport": "Turin Airport", "iata": "TRN", "country": "IT"},
-            {"city": "Casigua El Cubo", "airport": "Casigua El Cubo Airport", "iata": "CUV", "country": "VE"},
-            {"city": "Casiguran", "airport": "Casiguran Airport", "iata": "CGG", "country": "PH"},
-            {"city": "Casper", "airport": "Casper-Natrona County International Airport", "iata": "CPR", "country": "US"},
-            {"city": "Cassilândia", "airport": "Cassilândia Airport", "iata": "CSS", "country": "BR"},
-            {"city": "Castaway Island", "airport": "Castaway Island Seaplane Base", "iata": "CST", "country": "FJ"},
-            {"city": "Castellón de la Plana", "airport": "Castellón-Costa Azahar Airport", "iata": "CDT", "country": "ES"},
-            {"city": "Castlegar", "airport": "Castlegar/West Kootenay Regional Airport", "iata": "YCG", "country": "CA"},
-            {"city": "Castletown", "airport": "Isle of Man Airport", "iata": "IOM", "country": "IM"},
-            {"city": "Castori Islets", "airport": "Doini Airport", "iata": "DOI", "country": "PG"},
-            {"city": "Castres", "airport": "Castres Mazamet Airport", "iata": "DCM", "country": "FR"},
-            {"city": "Castries", "airport": "George F. L. Charles Airport", "iata": "SLU", "country": "LC"},
-            {"city": "Castro", "airport": "Gamboa Airport", "iata": "WCA", "country": "CL"},
-            {"city": "Casuarito", "airport": "Casuarito Airport", "iata": "CSR", "country": "CO"},
-            {"city": "Cat Hill", "airport": "RAF Ascension Island", "iata": "ASI", "country": "SH"},
-            {"city": "Cat Island", "airport": "New Bight Airport", "iata": "TBI", "country": "BS"},
-            {"city": "Cat Lake", "airport": "Cat Lake Airport", "iata": "YAC", "country": "CA"},
-            {"city": "Catalão", "airport": "Catalão Airport", "iata": "TLZ", "country": "BR"},
-            {"city": "Catamarca", "airport": "Coronel Felipe Varela International Airport", "iata": "CTC", "country": "AR"},
-            {"city": "Catania", "airport": "Catania-Fontanarossa Airport", "iata": "CTA", "country": "IT"},
-            {"city": "Catarman", "airport": "Catarman National Airport", "iata": "CRM", "country": "PH"},
-            {"city": "Caticlan", "airport": "Godofredo P. Ramos Airport", "iata": "MPH", "country": "PH"},
-            {"city": "Catumbela", "airport": "Catumbela Airport", "iata": "CBT", "country": "AO"},
-            {"city": "Cauayan City", "airport": "Cauayan Airport", "iata": "CYZ", "country": "PH"},
-            {"city": "Caucasia", "airport": "Juan H White Airport", "iata": "CAQ", "country": "CO"},
-            {"city": "Cauquira", "airport": "Cauquira Airport", "iata": "CDD", "country": "HN"},
-            {"city": "Cavite", "airport": "Danilo Atienza Air Base", "iata": "SGL", "country": "PH"},
-            {"city": "Caxias Do Sul", "airport": "Hugo Cantergiani Regional Airport", "iata": "CXJ", "country": "BR"},
-            {"city": "Caye Caulker", "airport": "Caye Caulker Airport", "iata": "CUK", "country": "BZ"},
-            {"city": "Caye Chapel", "airport": "Caye Chapel Airport", "iata": "CYC", "country": "BZ"},
-            {"city": "Cayo Coco", "airport": "Jardines Del Rey Airport", "iata": "CCC", "country": "CU"},
-            {"city": "Cayo Largo del Sur", "airport": "Vilo Acuña International Airport", "iata": "CYO", "country": "CU"},
-            {"city": "Cayo Santa Maria", "airport": "Las Brujas Airport", "iata": "BWW", "country": "CU"},
-            {"city": "Cazombo", "airport": "Cazombo Airport", "iata": "CAV", "country": "AO"},
-            {"city": "Caçador", "airport": "Doctor Carlos Alberto da Costa Neves Airport", "iata": "CFC", "country": "BR"},
-            {"city": "Cañas", "airport": "Mojica Airport", "iata": "CSC", "country": "CR"},
-            {"city": "Cedar", "airport": "Oskaloosa Municipal Airport", "iata": "OOA", "country": "US"},
-            {"city": "Cedar City", "airport": "Cedar City Regional Airport", "iata": "CDC", "country": "US"},
-            {"city": "Cedar Key", "airport": "George T Lewis Airport", "iata": "CDK", "country": "US"},
-            {"city": "Cedar Rapids", "airport": "The Eastern Iowa Airport", "iata": "CID", "country": "US"},
-            {"city": "Ceiba", "airport": "José Aponte de la Torre Airport", "iata": "NRR", "country": "PR"},
-            {"city": "Celaya", "airport": "Captain Rogelio Castillo National Airport", "iata": "CYW", "country": "MX"},
-            {"city": "Center Island", "airport": "Center Island Airport", "iata": "CWS", "country": "US"},
-            {"city": "Centerville", "airport": "Centerville Municipal Airport", "iata": "GHM", "country": "US"},
-            {"city": "Central", "airport": "Central Airport", "iata": "CEM", "country": "US"},
-            {"city": "Central and Western", "airport": "Shun Tak Heliport", "iata": "HHP", "country": "HK"},
-            {"city": "Centralia", "airport": "Centralia Municipal Airport", "iata": "ENL", "country": "US"},
-            {"city": "Ceres", "airport": "Ceres Airport", "iata": "CRR", "country": "AR"},
-            {"city": "Cerro Sombrero", "airport": "Franco Bianco Airport", "iata": "SMB", "country": "CL"},
-            {"city": "Ceuta", "airport": "Ceuta Heliport", "iata": "JCU", "country": "ES"},
-            {"city": "Chabeuil, Drôme", "airport": "Valence-Chabeuil Airport", "iata": "VAF", "country": "FR"},
-            {"city": "Chachagüí", "airport": "Antonio Nariño Airport", "iata": "PSO", "country": "CO"},
-            {"city": "Chachapoyas", "airport": "Chachapoyas Airport", "iata": "CHH", "country": "PE"},
-            {"city": "Chadron", "airport": "Chadron Municipal Airport", "iata": "CDR", "country": "US"},
-            {"city": "Chagai", "airport": "Reko Diq Airport", "iata": "REQ", "country": "PK"},
-            {"city": "Chaghcharan", "airport": "Chaghcharan Airport", "iata": "CCN", "country": "AF"},
-            {"city": "Chaitén", "airport": "Nuevo Chaitén Airport", "iata": "WCH", "country": "CL"},
-            {"city": "Chake Chake", "airport": "Pemba Airport", "iata": "PMA", "country": "TZ"},
-            {"city": "Chalkyitsik", "airport": "Chalkyitsik Airport", "iata": "CIK", "country": "US"},
-            {"city": "Challis", "airport": "Challis Airport", "iata": "CHL", "country": "US"},
-            {"city": "Chaloem Phra Kiat", "airport": "Nakhon Ratchasima Airport", "iata": "NAK", "country": "TH"},
-            {"city": "Chalons en Champagne", "airport": "Chalons Vatry airport", "iata": "XCR", "country": "FR"},
-            {"city": "Chambéry", "airport": "Chambéry Aix les Bains airport", "iata": "CMF", "country": "FR"},
-            {"city": "Chandalar Lake", "airport": "Chandalar Lake Airport", "iata": "WCR", "country": "US"},
-            {"city": "Chandigarh", "airport": "Chandigarh International Airport", "iata": "IXC", "country": "IN"},
-            {"city": "Changchun", "airport": "Changchun Longjia International Airport", "iata": "CGQ", "country": "CN"},
-            {"city": "Changde (Dingcheng)", "airport": "Changde Taohuayuan Airport", "iata": "CGD", "country": "CN"},
-            {"city": "Changsha (Changsha)", "airport": "Changsha Huanghua International Airport", "iata": "CSX", "country": "CN"},
-            {"city": "Changuinola", "airport": "Changuinola Captain Manuel Niño International Airport", "iata": "CHX", "country": "PA"},
-            {"city": "Changzhi", "airport": "Changzhi Wangcun Airport", "iata": "CIH", "country": "CN"},
-            {"city": "Changzhou", "airport": "Changzhou Benniu International Airport", "iata": "CZX", "country": "CN"},
-            {"city": "Chanute", "airport": "Chanute Martin Johnson Airport", "iata": "CNU", "country": "US"},
-            {"city": "Chaparral", "airport": "General Navas Pardo Airport", "iata": "CPL", "country": "CO"},
-            {"city": "Chapecó", "airport": "Serafin Enoss Bertaso Airport", "iata": "XAP", "country": "BR"},
-            {"city": "Chapelco/San Martin de los Andes", "airport": "Aviador C. Campos Airport", "iata": "CPC", "country": "AR"},
-            {"city": "Chapleau", "airport": "Chapleau Airport", "iata": "YLD", "country": "CA"},
-            {"city": "Chara", "airport": "Chara Airport", "iata": "CZR", "country": "RU"},
-            {"city": "Charata", "airport": "Charata Airport", "iata": "CNT", "country": "AR"},
-            {"city": "Charleroi", "airport": "Brussels South Charleroi Airport", "iata": "CRL", "country": "BE"},
-            {"city": "Charles City", "airport": "Northeast Iowa Regional Airport", "iata": "CCY", "country": "US"},
-            {"city": "Charleston", "airport": "Charleston International Airport", "iata": "CHS", "country": "US"},
-            {"city": "Charleston", "airport": "Yeager Airport", "iata": "CRW", "country": "US"},
-            {"city": "Charlestown", "airport": "Ireland West Knock Airport", "iata": "NOC", "country": "IE"},
-            {"city": "Charlestown", "airport": "Vance W. Amory International Airport", "iata": "NEV", "country": "KN"},
-            {"city": "Charleville", "airport": "Charleville Airport", "iata": "CTL", "country": "AU"},
-            {"city": "Charlevoix", "airport": "Charlevoix Airport", "iata": "YML", "country": "CA"},
-            {"city": "Charlo", "airport": "Charlo Airport", "iata": "YCL", "country": "CA"},
-            {"city": "Charlotte", "airport": "Charlotte Douglas International Airport", "iata": "CLT", "country": "US"},
-            {"city": "Charlotte Amalie", "airport": "Cyril E. King Airport", "iata": "STT", "country": "VI"},
-            {"city": "Charlotte Amalie", "airport": "Charlotte Amalie Harbor Seaplane Base", "iata": "SPB", "country": "VI"},
-            {"city": "Charlottesville", "airport": "Charlottesville Albemarle Airport", "iata": "CHO", "country": "US"},
-            {"city": "Charlottetown", "airport": "Charlottetown Airport", "iata": "YHG", "country": "CA"},
-            {"city": "Charlottetown", "airport": "Charlottetown Airport", "iata": "YYG", "country": "CA"},
-            {"city": "Charmeil, Allier", "airport": "Vichy-Charmeil Airport", "iata": "VHY", "country": "FR"},
-            {"city": "Chaspuzac, Haute-Loire", "airport": "Le Puy-Loudes Airfield", "iata": "LPY", "country": "FR"},
-            {"city": "Chassieu, Lyon", "airport": "Lyon Bron Airport", "iata": "LYN", "country": "FR"},
-            {"city": "Chatham", "airport": "Chatham Seaplane Base", "iata": "CYM", "country": "US"},
-            {"city": "Chatham-Kent", "airport": "Chatham Kent Airport", "iata": "XCM", "country": "CA"},
-            {"city": "Chato District", "airport": "Chato/Geita Airport", "iata": "GTC", "country": "TZ"},
-            {"city": "Chattanooga", "airport": "Chattanooga Metropolitan Airport (Lovell Field)", "iata": "CHA", "country": "US"},
-            {"city": "Chattogram (Chittagong)", "airport": "Shah Amanat International Airport", "iata": "CGP", "country": "BD"},
-            {"city": "Chañaral", "airport": "Chañaral Airport", "iata": "CNR", "country": "CL"},
-            {"city": "Cheadle", "airport": "Cheadle Airport", "iata": "TIL", "country": "CA"},
-            {"city": "Cheboksary", "airport": "Cheboksary Airport", "iata": "CSY", "country": "RU"},
-            {"city": "Chefornak", "airport": "Chefornak Airport", "iata": "CYF", "country": "US"},
-            {"city": "Chehalis", "airport": "Chehalis Centralia Airport", "iata": "CLS", "country": "US"},
-            {"city": "Chelyabinsk", "airport": "Chelyabinsk Balandino Airport", "iata": "CEK", "country": "RU"},
-            {"city": "Chena Hot Springs", "airport": "Chena Hot Springs Airport", "iata": "CEX", "country": "US"},
-            {"city": "Chenega", "airport": "Chenega Bay Airport", "iata": "NCN", "country": "US"},
-            {"city": "Chengde", "airport": "Chengde Puning Airport", "iata": "CDE", "country": "CN"},
-            {"city": "Chengdu (Jianyang)", "airport": "Chengdu Tianfu International Airport", "iata": "TFU", "country": "CN"},
-            {"city": "Chengdu (Jintang)", "airport": "Chengdu Huaizhou Airport", "iata": "HZU", "country": "CN"},
-            {"city": "Chengdu (Shuangliu)", "airport": "Chengdu Shuangliu International Airport", "iata": "CTU", "country": "CN"},
-            {"city": "Chennai", "airport": "Chennai International Airport", "iata": "MAA", "country": "IN"},
-            {"city": "Chenzhou", "airport": "Chenzhou Beihu Airport", "iata": "HCZ", "country": "CN"},
-            {"city": "Cheongju", "airport": "Cheongju International Airport/Cheongju Air Base (K-59/G-513)", "iata": "CJJ", "country": "KR"},
-            {"city": "Cheraw", "airport": "Cheraw Municipal Airport/Lynch Bellinger Field", "iata": "HCW", "country": "US"},
-            {"city": "Cherbourg", "airport": "Cherbourg Manche airport", "iata": "CER", "country": "FR"},
-            {"city": "Cherdakly", "airport": "Ulyanovsk East Airport", "iata": "ULY", "country": "RU"},
-            {"city": "Cherepovets", "airport": "Cherepovets Airport", "iata": "CEE", "country": "RU"},
-            {"city": "Cherkasy", "airport": "Cherkasy International Airport", "iata": "CKC", "country": "UA"},
-            {"city": "Chernivtsi", "airport": "Chernivtsi International Airport", "iata": "CWC", "country": "UA"},
-            {"city": "Chernofski Harbor", "airport": "Chernofski Harbor Seaplane Base", "iata": "KCN", "country": "US"},
-            {"city": "Cherokee", "airport": "Kegelman AF Aux Field", "iata": "CKA", "country": "US"},
-            {"city": "Cherrabah Homestead Resort", "airport": "Cherrabah Airport", "iata": "CRH", "country": "AU"},
-            {"city": "Cherskiy", "airport": "Cherskiy Airport", "iata": "CYX", "country": "RU"},
-            {"city": "Chesterfield Inlet", "airport": "Chesterfield Inlet Airport", "iata": "YCS", "country": "CA"},
-            {"city": "Chetumal", "airport": "Chetumal International Airport", "iata": "CTM", "country": "MX"},
-            {"city": "Chetwynd", "airport": "Chetwynd Airport", "iata": "YCQ", "country": "CA"},
-            {"city": "Chevak", "airport": "Chevak Airport", "iata": "VAK", "country": "US"},
-            {"city": "Chevery", "airport": "Chevery Airport", "iata": "YHR", "country": "CA"},
-            {"city": "Cheyenne", "airport": "Cheyenne Regional Jerry Olson Field", "iata": "CYS", "country": "US"},
-            {"city": "Chiang Mai", "airport": "Chiang Mai International Airport", "iata": "CNX", "country": "TH"},
-            {"city": "Chiang Rai", "airport": "Mae Fah Luang - Chiang Rai International Airport", "iata": "CEI", "country": "TH"},
-            {"city": "Chibougamau", "airport": "Chapais Airport", "iata": "YMT", "country": "CA"},
-            {"city": "Chicago", "airport": "Chicago Midway International Airport", "iata": "MDW", "country": "US"},
-            {"city": "Chicago", "airport": "Chicago O'Hare International Airport", "iata": "ORD", "country": "US"},
-            {"city": "Chicago/Aurora", "airport": "Aurora Municipal Airport", "iata": "AUZ", "country": "US"},
-            {"city": "Chicago/Prospect Heights/Wheeling", "airport": "Chicago Executive Airport", "iata": "PWK", "country": "US"},
-            {"city": "Chicago/Rockford", "airport": "Chicago Rockford International Airport", "iata": "RFD", "country": "US"},
-            {"city": "Chicago/Romeoville", "airport": "Lewis University Airport", "iata": "LOT", "country": "US"},
-            {"city": "Chicago/Waukegan", "airport": "Waukegan National Airport", "iata": "UGN", "country": "US"},
-            {"city": "Chicago/West Chicago", "airport": "Dupage Airport", "iata": "DPA", "country": "US"},
-            {"city": "Chichester, West Sussex", "airport": "Goodwood Aerodrome", "iata": "QUG", "country": "GB"},
-            {"city": "Chickasha", "airport": "Chickasha Municipal Airport", "iata": "CHK", "country": "US"},
-            {"city": "Chicken", "airport": "Chicken Airport", "iata": "CKX", "country": "US"},
-            {"city": "Chiclayo", "airport": "Air Force Captain Jose A Quinones Gonzales International Airport", "iata": "CIX", "country": "PE"},
-            {"city": "Chico", "airport": "Chico Regional Airport", "iata": "CIC", "country": "US"},
-            {"city": "Chicopee", "airport": "Westover Metropolitan Airport / Westover Air Reserve Base", "iata": "CEF", "country": "US"},
-            {"city": "Chifeng", "airport": "Ar Horqin Airport", "iata": "AEQ", "country": "CN"},
-            {"city": "Chifeng", "airport": "Chifeng Yulong Airport", "iata": "CIF", "country": "CN"},
-            {"city": "Chignik", "airport": "Chignik Airport", "iata": "KCG", "country": "US"},
-            {"city": "Chignik", "airport": "Chignik Bay Seaplane Base", "iata": "KBW", "country": "US"},
-            {"city": "Chignik Flats", "airport": "Chignik Lagoon Airport", "iata": "KCL", "country": "US"},
-            {"city": "Chignik Lake", "airport": "Chignik Lake Airport", "iata": "KCQ", "country": "US"},
-            {"city": "Chigorodó", "airport": "Jaime Ortiz Betancourt Airport", "iata": "IGO", "country": "CO"},
-            {"city": "Chihuahua", "airport": "General Roberto Fierro Villalobos International Airport", "iata": "CUU", "country": "MX"},
-            {"city": "Chilas", "airport": "Chilas Airport", "iata": "CHB", "country": "PK"},
-            {"city": "Childress", "airport": "Childress Municipal Airport", "iata": "CDS", "country": "US"},
-            {"city": "Chile Chico", "airport": "Chile Chico Airport", "iata": "CCH", "country": "CL"},
-            {"city": "Chilko Lake", "airport": "Chilko Lake (Tsylos Park Lodge) Airport", "iata": "CJH", "country": "CA"},
-            {"city": "Chillagoe", "airport": "Chillagoe Airport", "iata": "LLG", "country": "AU"},
-            {"city": "Chillan", "airport": "Gral. Bernardo O´Higgins Airport", "iata": "YAI", "country": "CL"},
-            {"city": "Chilliwack", "airport": "Chilliwack Airport", "iata": "YCW", "country": "CA"},
-            {"city": "Chiloquin", "airport": "Chiloquin State Airport", "iata": "CHZ", "country": "US"},
-            {"city": "Chimbote", "airport": "FAP Lieutenant Jaime Andres de Montreuil Morales Airport", "iata": "CHM", "country": "PE"},
-            {"city": "Chimoio", "airport": "Chimoio Airport", "iata": "VPY", "country": "MZ"},
-            {"city": "Chimore", "airport": "Chimore Airport", "iata": "CCA", "country": "BO"},
-            {"city": "Chinchilla", "airport": "Chinchilla Airport", "iata": "CCL", "country": "AU"},
-            {"city": "Chinde", "airport": "Chinde Airport", "iata": "INE", "country": "MZ"},
-            {"city": "Chingola", "airport": "Kasompe Airport", "iata": "CGJ", "country": "ZM"},
-            {"city": "Chino", "airport": "Chino Airport", "iata": "CNO", "country": "US"},
-            {"city": "Chios Island", "airport": "Chios Island National Airport", "iata": "JKH", "country": "GR"},
-            {"city": "Chipata", "airport": "Chipata Airport", "iata": "CIP", "country": "ZM"},
-            {"city": "Chipi", "airport": "Sindhudurg Airport", "iata": "SDW", "country": "IN"},
-            {"city": "Chipinge", "airport": "Chipinge Airport", "iata": "CHJ", "country": "ZW"},
-            {"city": "Chiquimula", "airport": "Chiquimula Airport", "iata": "CIQ", "country": "GT"},
-            {"city": "Chiredzi", "airport": "Buffalo Range Airport", "iata": "BFO", "country": "ZW"},
-            {"city": "Chisana", "airport": "Chisana Airport", "iata": "CZN", "country": "US"},
-            {"city": "Chisasibi", "airport": "Chisasibi Airport", "iata": "YKU", "country": "CA"},
-            {"city": "Chistochina", "airport": "Chistochina Airport", "iata": "CZO", "country": "US"},
-            {"city": "Chita", "airport": "Chita-Kadala International Airport", "iata": "HTA", "country": "RU"},
-            {"city": "Chitato", "airport": "Chitato Airport", "iata": "PGI", "country": "AO"},
-            {"city": "Chitato", "airport": "Dundo Airport", "iata": "DUE", "country": "AO"},
-            {"city": "Chitina", "airport": "Chitina Airport", "iata": "CXC", "country": "US"},
-            {"city": "Chitrakoot", "airport": "Chitrakoot Airport", "iata": "CWK", "country": "IN"},
-            {"city": "Chitral", "airport": "Chitral Airport", "iata": "CJL", "country": "PK"},
-            {"city": "Chitré", "airport": "Alonso Valderrama Airport", "iata": "CTD", "country": "PA"},
-            {"city": "Chivolo", "airport": "Chivolo Airport", "iata": "IVO", "country": "CO"},
-            {"city": "Chizhou", "airport": "Chizhou Jiuhuashan Airport", "iata": "JUH", "country": "CN"},
-            {"city": "Chişinău", "airport": "Chişinău International Airport", "iata": "RMO", "country": "MD"},
-            {"city": "Chlef", "airport": "Chlef Aboubakr Belkaid International Airport", "iata": "CFK", "country": "DZ"},
-            {"city": "Choiseul Bay", "airport": "Choiseul Bay Airport", "iata": "CHY", "country": "SB"},
-            {"city": "Chokurdah", "airport": "Chokurdakh Airport", "iata": "CKH", "country": "RU"},
-            {"city": "Chokwé", "airport": "Chokwé Airport", "iata": "TGS", "country": "MZ"},
-            {"city": "Cholet", "airport": "Cholet Le Pontreau airfield", "iata": "CET", "country": "FR"},
-            {"city": "Chomley", "airport": "Chomley Seaplane Base", "iata": "CIV", "country": "US"},
-            {"city": "Chongqing", "airport": "Yongchuan Da'an General Airport", "iata": "YGA", "country": "CN"},
-            {"city": "Chongqing", "airport": "Chongqing Jiangbei International Airport", "iata": "CKG", "country": "CN"},
-            {"city": "Chos Malal", "airport": "Chos Malal Airport", "iata": "HOS", "country": "AR"},
-            {"city": "Christchurch", "airport": "Christchurch International Airport", "iata": "CHC", "country": "NZ"},
-            {"city": "Christiansted", "airport": "Henry E Rohlsen Airport", "iata": "STX", "country": "VI"},
-            {"city": "Christiansted", "airport": "Christiansted Harbor Seaplane Base", "iata": "SSB", "country": "VI"},
-            {"city": "Christmas Creek Mine", "airport": "Christmas Creek Airport", "iata": "CKW", "country": "AU"},
-            {"city": "Chuathbaluk", "airport": "Chuathbaluk Airport", "iata": "CHU", "country": "US"},
-            {"city": "Chub Cay", "airport": "Chub Cay Airport", "iata": "CCZ", "country": "BS"},
-            {"city": "Chubut", "airport": "Jose De San Martin Airport", "iata": "JSM", "country": "AR"},
-            {"city": "Chuja, Hach’uja-do (Chujado Islands)", "airport": "Chuja Port Heliport", "iata": "JCJ", "country": "KR"},
-            {"city": "Chukotka", "airport": "Provideniya Bay Airport", "iata": "PVS", "country": "RU"},
-            {"city": "Chumphon", "airport": "Chumphon Airport", "iata": "CJM", "country": "TH"},
-            {"city": "Chunga", "airport": "Chunga Airstrip", "iata": "CGX", "country": "ZM"},
-            {"city": "Chungribu", "airport": "Chungribu Airport", "iata": "CVB", "country": "PG"},
-            {"city": "Churchill", "airport": "Churchill Airport", "iata": "YYQ", "country": "CA"},
-            {"city": "Churchill Falls", "airport": "Churchill Falls Airport", "iata": "ZUM", "country": "CA"},
-            {"city": "Chutes-des-Passes", "airport": "Chute-Des-Passes/Lac Margane Seaplane Base", "iata": "YWQ", "country": "CA"},
-            {"city": "Chuxiong (Yuanmou)", "airport": "Yuanmou Air Base", "iata": "YUA", "country": "CN"},
-            {"city": "Châteauroux", "airport": "Châteauroux Déols airport", "iata": "CHR", "country": "FR"},
-            {"city": "Cianorte", "airport": "Engenheiro Gastão de Mesquita Filho Airport", "iata": "GGH", "country": "BR"},
-            {"city": "Cicia", "airport": "Cicia Airport", "iata": "ICI", "country": "FJ"},
-            {"city": "Cienfuegos", "airport": "Jaime Gonzalez Airport", "iata": "CFG", "country": "CU"},
-            {"city": "Cijulang", "airport": "Nusawiru Airport", "iata": "CJN", "country": "ID"},
-            {"city": "Cilacap", "airport": "Tunggul Wulung Airport", "iata": "CXP", "country": "ID"},
-            {"city": "Cimitarra", "airport": "Cimitarra Airport", "iata": "CIM", "country": "CO"},
-            {"city": "Cincinnati", "airport": "Cincinnati Municipal Airport Lunken Field", "iata": "LUK", "country": "US"},
-            {"city": "Cincinnati / Covington", "airport": "Cincinnati Northern Kentucky International Airport", "iata": "CVG", "country": "US"},
-            {"city": "Circle", "airport": "Circle City (New) Airport", "iata": "IRC", "country": "US"},
-            {"city": "Circle Hot Springs", "airport": "Circle Hot Springs Airport", "iata": "CHP", "country": "US"},
-            {"city": "Cirebon-Java Island", "airport": "Cakrabhuwana  Airport", "iata": "CBN", "country": "ID"},
-            {"city": "Cirencester, Gloucestershire", "airport": "Cotswold Airport", "iata": "GBA", "country": "GB"},
-            {"city": "Ciro Redondo", "airport": "Máximo Gómez Airport", "iata": "AVI", "country": "CU"},
-            {"city": "City of Industry", "airport": "Recreation and Conference Center Heliport", "iata": "JID", "country": "US"},
-            {"city": "City of Lake Macquarie", "airport": "Lake Macquarie Airport", "iata": "BEO", "country": "AU"},
-            {"city": "Ciudad Acuña", "airport": "Ciudad Acuña New International Airport", "iata": "ACN", "country": "MX"},
-            {"city": "Ciudad Bolivar", "airport": "General Tomas de Heres Airport", "iata": "CBL", "country": "VE"},
-            {"city": "Ciudad Guayana", "airport": "Macagua Airport", "iata": "SFX", "country": "VE"},
-            {"city": "Ciudad Juárez", "airport": "Abraham González International Airport", "iata": "CJS", "country": "MX"},
-            {"city": "Ciudad Mante", "airport": "Ciudad Mante Los Huastecas National Airport", "iata": "MMC", "country": "MX"},
-            {"city": "Ciudad Obregón", "airport": "Ciudad Obregón International Airport", "iata": "CEN", "country": "MX"},
-            {"city": "Ciudad Real", "airport": "Ciudad Real International Airport", "iata": "CQM", "country": "ES"},
-            {"city": "Ciudad Victoria", "airport": "General Pedro Jose Mendez International Airport", "iata": "CVM", "country": "MX"},
-            {"city": "Ciudad de México", "airport": "Benito Juárez International Airport", "iata": "MEX", "country": "MX"},
-            {"city": "Ciudad de la Costa", "airport": "Carrasco General Cesáreo L. Berisso International Airport", "iata": "MVD", "country": "UY"},
-            {"city": "Ciudad del Carmen", "airport": "Ciudad del Carmen International Airport", "iata": "CME", "country": "MX"},
-            {"city": "Ciudad del Este", "airport": "Aeropuerto Internacional Guaraní", "iata": "AGT", "country": "PY"},
-            {"city": "Claremont", "airport": "Claremont Municipal Airport", "iata": "CNH", "country": "US"},
-            {"city": "Clarinda", "airport": "Schenck Field", "iata": "ICL", "country": "US"},
-            {"city": "Claris", "airport": "Great Barrier Aerodrome", "iata": "GBZ", "country": "NZ"},
-            {"city": "Clarks Point", "airport": "Clarks Point Airport", "iata": "CLP", "country": "US"},
-            {"city": "Clarksdale", "airport": "Fletcher Field", "iata": "CKM", "country": "US"},
-            {"city": "Clarksville", "airport": "Clarksville–Montgomery County Regional Airport", "iata": "CKV", "country": "US"},
-            {"city": "Clayton", "airport": "Clayton Municipal Airpark", "iata": "CAO", "country": "US"},
-            {"city": "Clearwater", "airport": "Clearwater Air Park", "iata": "CLW", "country": "US"},
-            {"city": "Clemson", "airport": "Oconee County Regional Airport", "iata": "CEU", "country": "US"},
-            {"city": "Clermont-Ferrand", "airport": "Clermont-Ferrand Auvergne airport", "iata": "CFE", "country": "FR"},
-            {"city": "Cleveland", "airport": "Burke Lakefront Airport", "iata": "BKL", "country": "US"},
-            {"city": "Cleveland", "airport": "Cuyahoga County Airport", "iata": "CGF", "country": "US"},
-            {"city": "Cleveland", "airport": "Cleveland Hopkins International Airport", "iata": "CLE", "country": "US"},
-            {"city": "Clifton", "airport": "Greenlee County Airport", "iata": "CFT", "country": "US"},
-            {"city": "Clifton Hills", "airport": "Clifton Hills Airport", "iata": "CFH", "country": "AU"},
-            {"city": "Clinton", "airport": "Clinton Regional Airport", "iata": "CLK", "country": "US"},
-            {"city": "Clinton", "airport": "Clinton Sherman Airport", "iata": "CSM", "country": "US"},
-            {"city": "Clinton", "airport": "Sampson County Airport", "iata": "CTZ", "country": "US"},
-            {"city": "Clinton", "airport": "Clinton Municipal Airport", "iata": "CWI", "country": "US"},
-            {"city": "Clintonville", "airport": "Clintonville Municipal Airport", "iata": "CLI", "country": "US"},
-            {"city": "Cloncurry", "airport": "Cloncurry Airport", "iata": "CNJ", "country": "AU"},
-            {"city": "Cloppenburg", "airport": "Varrelbusch Airfield", "iata": "VAC", "country": "DE"},
-            {"city": "Clorinda", "airport": "Aeródromo de Clorinda", "iata": "CLX", "country": "AR"},
-            {"city": "Cloudbreak Village", "airport": "Fortescue - Dave Forrest Aerodrome", "iata": "KFE", "country": "AU"},
-            {"city": "Clovis", "airport": "Clovis Municipal Airport", "iata": "CVN", "country": "US"},
-            {"city": "Clovis", "airport": "Cannon Air Force Base", "iata": "CVS", "country": "US"},
-            {"city": "Club Makokola", "airport": "Club Makokola Airport", "iata": "CMK", "country": "MW"},
-            {"city": "Cluff Lake", "airport": "Cluff Lake Airport", "iata": "XCL", "country": "CA"},
-            {"city": "Cluj-Napoca", "airport": "Cluj Avram Iancu International Airport", "iata": "CLJ", "country": "RO"},
-            {"city": "Clyde River", "airport": "Clyde River Airport", "iata": "YCY", "country": "CA"},
-            {"city": "Coalinga", "airport": "New Coalinga Municipal Airport", "iata": "CLG", "country": "US"},
-            {"city": "Coari", "airport": "Coari Airport", "iata": "CIZ", "country": "BR"},
-            {"city": "Coatepeque", "airport": "Coatepeque Airport", "iata": "CTF", "country": "GT"},
-            {"city": "Coatesville", "airport": "Chester County G O Carlson Airport", "iata": "CTH", "country": "US"},
-            {"city": "Coban", "airport": "Coban Airport", "iata": "CBV", "country": "GT"},
-            {"city": "Cobbitty", "airport": "Camden Airport", "iata": "CDU", "country": "AU"},
-            {"city": "Cobija", "airport": "Capitán Aníbal Arab Airport", "iata": "CIJ", "country": "BO"},
-            {"city": "Coca", "airport": "Francisco De Orellana Airport", "iata": "OCC", "country": "EC"},
-            {"city": "Cochabamba", "airport": "Jorge Wilsterman International Airport", "iata": "CBB", "country": "BO"},
-            {"city": "Cochrane", "airport": "Cochrane Airport", "iata": "YCN", "country": "CA"},
-            {"city": "Cochrane", "airport": "Cochrane Airport", "iata": "LGR", "country": "CL"},
-            {"city": "Cockburn Town", "airport": "JAGS McCartney International Airport", "iata": "GDT", "country": "TC"},
-            {"city": "Cocoa Beach", "airport": "Patrick Space Force Base", "iata": "COF", "country": "US"},
-            {"city": "Codazzi", "airport": "Las Flores Airport", "iata": "DZI", "country": "CO"},
-            {"city": "Codrington", "airport": "Codrington Airport", "iata": "BBQ", "country": "AG"},
-            {"city": "Cody", "airport": "Yellowstone Regional Airport", "iata": "COD", "country": "US"},
-            {"city": "Coen", "airport": "Coen Airport", "iata": "CUQ", "country": "AU"},
-            {"city": "Coetupo", "airport": "Tubualá Airport", "iata": "TUW", "country": "PA"},
-            {"city": "Coeur d'Alene", "airport": "Coeur D'Alene Airport - Pappy Boyington Field", "iata": "COE", "country": "US"},
-            {"city": "Coffeyville", "airport": "Coffeyville Municipal Airport", "iata": "CFV", "country": "US"},
-            {"city": "Coffman Cove", "airport": "Coffman Cove Seaplane Base", "iata": "KCC", "country": "US"},
-            {"city": "Coffs Harbour", "airport": "Coffs Harbour Airport", "iata": "CFS", "country": "AU"},
-            {"city": "Cognac/Châteaubernard", "airport": "Cognac-Châteaubernard (BA 709) Air Base", "iata": "CNG", "country": "FR"},
-            {"city": "Coimbatore", "airport": "Coimbatore International Airport", "iata": "CJB", "country": "IN"},
-            {"city": "Colac Otway Shire", "airport": "Colac Airport", "iata": "XCO", "country": "AU"},
-            {"city": "Colatina", "airport": "Colatina Airport", "iata": "QCH", "country": "BR"},
-            {"city": "Colby", "airport": "Shalz Field", "iata": "CBK", "country": "US"},
-            {"city": "Cold Bay", "airport": "Port Moller Airport", "iata": "PML", "country": "US"},
-            {"city": "Cold Bay", "airport": "Cold Bay Airport", "iata": "CDB", "country": "US"},
-            {"city": "Cold Lake", "airport": "CFB Cold Lake", "iata": "YOD", "country": "CA"},
-            {"city": "Coldfoot", "airport": "Coldfoot Airport", "iata": "CXF", "country": "US"},
-            {"city": "Coleman", "airport": "Coleman Municipal Airport", "iata": "COM", "country": "US"},
-            {"city": "Colima", "airport": "Licenciado Miguel de la Madrid International Airport", "iata": "CLQ", "country": "MX"},
-            {"city": "Coll Island", "airport": "Coll Airport", "iata": "COL", "country": "GB"},
-            {"city": "College Park", "airport": "College Park Airport", "iata": "CGS", "country": "US"},
-            {"city": "College Station", "airport": "Easterwood Field", "iata": "CLL", "country": "US"},
-            {"city": "Collie", "airport": "Collie Airport", "iata": "CIE", "country": "AU"},
-            {"city": "Collins Bay", "airport": "Collins Bay Airport", "iata": "YKC", "country": "CA"},
-            {"city": "Colmar", "airport": "Colmar Houssen airport", "iata": "CMR", "country": "FR"},
-            {"city": "Colombier-Saugnieu, Rhône", "airport": "Lyon Saint-Exupéry Airport", "iata": "LYS", "country": "FR"},
-            {"city": "Colombo", "airport": "Beira Lake Seaplane Base", "iata": "BYV", "country": "LK"},
-            {"city": "Colombo", "airport": "Dandugama Seaplane Base", "iata": "DGM", "country": "LK"},
-            {"city": "Colombo", "airport": "Kelani-Peliyagoda Seaplane Base", "iata": "KEZ", "country": "LK"},
-            {"city": "Colombo", "airport": "Bandaranaike International Colombo Airport", "iata": "CMB", "country": "LK"},
-            {"city": "Colombo", "airport": "Colombo Ratmalana Airport", "iata": "RML", "country": "LK"},
-            {"city": "Colonel Hill", "airport": "Colonel Hill Airport", "iata": "CRI", "country": "BS"},
-            {"city": "Colonia del Sacramento", "airport": "Colonia Laguna de Los Patos International Airport", "iata": "CYR", "country": "UY"},
-            {"city": "Colonsay", "airport": "Colonsay Airstrip", "iata": "CSA", "country": "GB"},
-            {"city": "Colorado Creek", "airport": "Colorado Creek Airport", "iata": "KCR", "country": "US"},
-            {"city": "Colorado Springs", "airport": "USAF Academy Airfield", "iata": "AFF", "country": "US"},
-            {"city": "Colorado Springs", "airport": "City of Colorado Springs Municipal Airport", "iata": "COS", "country": "US"},
-            {"city": "Columbia", "airport": "Columbia Metropolitan Airport", "iata": "CAE", "country": "US"},
-            {"city": "Columbia", "airport": "Columbia Regional Airport", "iata": "COU", "country": "US"},
-            {"city": "Columbia", "airport": "Jim Hamilton L.B. Owens Airport", "iata": "CUB", "country": "US"},
-            {"city": "Columbia", "airport": "Columbia Airport", "iata": "COA", "country": "US"},
-            {"city": "Columbia/Mount Pleasant", "airport": "Maury County Airport", "iata": "MRC", "country": "US"},
-            {"city": "Columbus", "airport": "Columbus Airport", "iata": "CUS", "country": "US"},
-            {"city": "Columbus", "airport": "Columbus Municipal Airport", "iata": "CLU", "country": "US"},
-            {"city": "Columbus", "airport": "Columbus Air Force Base", "iata": "CBM", "country": "US"},
-            {"city": "Columbus", "airport": "John Glenn Columbus International Airport", "iata": "CMH", "country": "US"},
-            {"city": "Columbus", "airport": "Columbus Metropolitan Airport", "iata": "CSG", "country": "US"},
-            {"city": "Columbus", "airport": "Rickenbacker International Airport", "iata": "LCK", "country": "US"},
-            {"city": "Columbus", "airport": "Columbus Municipal Airport", "iata": "OLU", "country": "US"},
-            {"city": "Columbus", "airport": "The Ohio State University Airport - Don Scott Field", "iata": "OSU", "country": "US"},
-            {"city": "Columbus", "airport": "Columbus Lowndes County Airport", "iata": "UBS", "country": "US"},
-            {"city": "Columbus/W Point/Starkville", "airport": "Golden Triangle Regional Airport", "iata": "GTR", "country": "US"},
-            {"city": "Colville Lake", "airport": "Tommy Kochon Airport", "iata": "YCK", "country": "CA"},
-            {"city": "Colón", "airport": "Enrique Adolfo Jimenez Airport", "iata": "ONX", "country": "PA"},
-            {"city": "Comilla", "airport": "Comilla Airport", "iata": "CLA", "country": "BD"},
-            {"city": "Comino", "airport": "Comino Heliport", "iata": "JCO", "country": "MT"},
-            {"city": "Comiso", "airport": "Comiso Airport", "iata": "CIY", "country": "IT"},
-            {"city": "Comitán", "airport": "San Antonio Copalar Airport", "iata": "CJT", "country": "MX"},
-            {"city": "Comodoro Rivadavia", "airport": "General E. Mosconi Airport", "iata": "CRD", "country": "AR"},
-            {"city": "Comondú", "airport": "Ciudad Constitución National Airport", "iata": "CUA", "country": "MX"},
-            {"city": "Comox", "airport": "Comox Valley Airport / CFB Comox", "iata": "YQQ", "country": "CA"},
-            {"city": "Compton", "airport": "Compton Woodley Airport", "iata": "CPM", "country": "US"},
-            {"city": "Con Dao", "airport": "Con Dao Airport", "iata": "VCS", "country": "VN"},
-            {"city": "Conakry", "airport": "Conakry International Airport", "iata": "CKY", "country": "GN"},
-            {"city": "Conceição do Araguaia", "airport": "Conceição do Araguaia Airport", "iata": "CDJ", "country": "BR"},
-            {"city": "Concepcion", "airport": "Carriel Sur Airport", "iata": "CCP", "country": "CL"},
-            {"city": "Concepción", "airport": "Aeropuerto Nacional Tte. Cnel. Carmelo Peralta", "iata": "CIO", "country": "PY"},
-            {"city": "Concepción", "airport": "Concepción Airport", "iata": "CEP", "country": "BO"},
-            {"city": "Concord", "airport": "Buchanan Field", "iata": "CCR", "country": "US"},
-            {"city": "Concord", "airport": "Concord Municipal Airport", "iata": "CON", "country": "US"},
-            {"city": "Concord", "airport": "Concord-Padgett Regional Airport", "iata": "USA", "country": "US"},
-            {"city": "Concordia", "airport": "Blosser Municipal Airport", "iata": "CNK", "country": "US"},
-            {"city": "Concordia", "airport": "Comodoro Pierrestegui Airport", "iata": "COC", "country": "AR"},
-            {"city": "Concórdia", "airport": "Olavo Cecco Rigon Airport", "iata": "CCI", "country": "BR"},
-            {"city": "Condoto", "airport": "Mandinga Airport", "iata": "COG", "country": "CO"},
-            {"city": "Confresa", "airport": "Confresa Airport", "iata": "CFO", "country": "BR"},
-            {"city": "Conklin", "airport": "Conklin (Leismer) Airport", "iata": "CFM", "country": "CA"},
-            {"city": "Connersville", "airport": "Mettel Field", "iata": "CEV", "country": "US"},
-            {"city": "Constantine", "airport": "Mohamed Boudiaf International Airport", "iata": "CZL", "country": "DZ"},
-            {"city": "Contadora Island", "airport": "Raul Arias Espinoza Airport", "iata": "OTD", "country": "PA"},
-            {"city": "Coober Pedy", "airport": "Coober Pedy Airport", "iata": "CPD", "country": "AU"},
-            {"city": "Cooch Behar", "airport": "Cooch Behar Airport", "iata": "COH", "country": "IN"},
-            {"city": "Coolawanyah Station", "airport": "Coolawanyah Airport", "iata": "COY", "country": "AU"},
-            {"city": "Coolibah", "airport": "Coolibah Airport", "iata": "COB", "country": "AU"},
-            {"city": "Cooma", "airport": "Cooma Snowy Mountains Airport", "iata": "OOM", "country": "AU"},
-            {"city": "Coondewanna", "airport": "Coondewanna Airport", "iata": "CJF", "country": "AU"},
-            {"city": "Cooper Landing", "airport": "Quartz Creek Airport", "iata": "JLA", "country": "US"},
-            {"city": "Cooperstown", "airport": "Cooperstown-Westville Airport", "iata": "COP", "country": "US"},
-            {"city": "Coorabie", "airport": "Coorabie Airport", "iata": "CRJ", "country": "AU"},
-            {"city": "Copenhagen", "airport": "Copenhagen Kastrup Airport", "iata": "CPH", "country": "DK"},
-            {"city": "Copiapo", "airport": "Desierto de Atacama Airport", "iata": "CPO", "country": "CL"},
-            {"city": "Copper Center", "airport": "Copper Center 2 Airport", "iata": "CZC", "country": "US"},
-            {"city": "Copán Ruinas", "airport": "Rioamarillo Airport", "iata": "RUY", "country": "HN"},
-            {"city": "Coquimbo", "airport": "Tambillos Airport", "iata": "COW", "country": "CL"},
-            {"city": "Coral Harbour", "airport": "Coral Harbour Airport", "iata": "YZS", "country": "CA"},
-            {"city": "Corcoran", "airport": "Corcoran Airport", "iata": "CRO", "country": "US"},
-            {"city": "Cordillo Downs", "airport": "Cordillo Downs Airport", "iata": "ODL", "country": "AU"},
-            {"city": "Cordoba", "airport": "Ingeniero Ambrosio Taravella Airport", "iata": "COR", "country": "AR"},
-            {"city": "Cordova", "airport": "Cordova Municipal Airport", "iata": "CKU", "country": "US"},
-            {"city": "Cordova", "airport": "Merle K (Mudhole) Smith Airport", "iata": "CDV", "country": "US"},
-            {"city": "Corinth", "airport": "Roscoe Turner Airport", "iata": "CRX", "country": "US"},
-            {"city": "Corisco Island", "airport": "Corisco International Airport", "iata": "OCS", "country": "GQ"},
-            {"city": "Cork", "airport": "Cork Airport", "iata": "ORK", "country": "IE"},
-            {"city": "Cormeilles-en-Vexin, Val-d'Oise", "airport": "Pontoise-Cormeilles Aerodrome", "iata": "POX", "country": "FR"},
-            {"city": "Corn Island", "airport": "Corn Island Airport", "iata": "RNI", "country": "NI"},
-            {"city": "Cornwall", "airport": "Cornwall Regional Airport", "iata": "YCC", "country": "CA"},
-            {"city": "Cornélio Procópio", "airport": "Cornélio Procópio Airport", "iata": "CKO", "country": "BR"},
-            {"city": "Coro", "airport": "José Leonardo Chirinos Airport", "iata": "CZE", "country": "VE"},
-            {"city": "Corolla", "airport": "Pine Island Airport", "iata": "DUF", "country": "US"},
-            {"city": "Coromandel", "airport": "Coromandel Airport", "iata": "CMV", "country": "NZ"},
-            {"city": "Coron", "airport": "Francisco B. Reyes (Busuanga) Airport", "iata": "USU", "country": "PH"},
-            {"city": "Coronation", "airport": "Coronation Airport", "iata": "YCT", "country": "CA"},
-            {"city": "Coronel Suarez", "airport": "Brigadier D.H.E. Ruiz Airport", "iata": "CSZ", "country": "AR"},
-            {"city": "Corozal", "airport": "Corozal Airport", "iata": "CZH", "country": "BZ"},
-            {"city": "Corozal", "airport": "Las Brujas Airport", "iata": "CZU", "country": "CO"},
-            {"city": "Corpus Christi", "airport": "Corpus Christi International Airport", "iata": "CRP", "country": "US"},
-            {"city": "Corpus Christi", "airport": "Naval Air Station Corpus Christi Truax Field", "iata": "NGP", "country": "US"},
-            {"city": "Corpus Christi", "airport": "Cabaniss Field Naval Outlying Landing Field", "iata": "NGW", "country": "US"},
-            {"city": "Corredores", "airport": "Coto 47 Airport", "iata": "OTR", "country": "CR"},
-            {"city": "Correia Pinto", "airport": "Planalto Serrano Regional Airport", "iata": "EEA", "country": "BR"},
-            {"city": "Corrientes", "airport": "Corrientes Airport", "iata": "CNQ", "country": "AR"},
-            {"city": "Corrientes", "airport": "Trompeteros Airport", "iata": "TDP", "country": "PE"},
-            {"city": "Corsicana", "airport": "C David Campbell Field Corsicana Municipal Airport", "iata": "CRS", "country": "US"},
-            {"city": "Cortes Bay", "airport": "Cortes Bay Water Aerodrome", "iata": "YCF", "country": "CA"},
-            {"city": "Cortez", "airport": "Cortez Municipal Airport", "iata": "CEZ", "country": "US"},
-            {"city": "Cortland", "airport": "Cortland County Chase Field", "iata": "CTX", "country": "US"},
-            {"city": "Corumbá", "airport": "Corumbá International Airport", "iata": "CMG", "country": "BR"},
-            {"city": "Corvallis", "airport": "Corvallis Municipal Airport", "iata": "CVO", "country": "US"},
-            {"city": "Corvera", "airport": "Región de Murcia International Airport", "iata": "RMU", "country": "ES"},
-            {"city": "Corvo", "airport": "Corvo Airport", "iata": "CVU", "country": "PT"},
-            {"city": "Cosmo Newbery", "airport": "Gruyere Airport", "iata": "GYZ", "country": "AU"},
-            {"city": "Cosoleacaque", "airport": "Minatitlán/Coatzacoalcos International Airport", "iata": "MTT", "country": "MX"},
-            {"city": "Costa Marques", "airport": "Costa Marques Airport", "iata": "CQS", "country": "BR"},
-            {"city": "Costanza", "airport": "Constanza - Expedición 14 de Junio National Airport", "iata": "COZ", "country": "DO"},
-            {"city": "Coto Brus", "airport": "San Vito de Java Airport", "iata": "TOO", "country": "CR"},
-            {"city": "Cotonou", "airport": "Cadjehoun Airport", "iata": "COO", "country": "BJ"},
-            {"city": "Cotriguaçu", "airport": "Andre Maggi Airport", "iata": "OTT", "country": "BR"},
-            {"city": "Cottonwood", "airport": "Cottonwood Airport", "iata": "CTW", "country": "US"},
-            {"city": "Cotulla", "airport": "Cotulla-La Salle County Airport", "iata": "COT", "country": "US"},
-            {"city": "Council", "airport": "Council Airport", "iata": "CIL", "country": "US"},
-            {"city": "Council Bluffs", "airport": "Council Bluffs Municipal Airport", "iata": "CBF", "country": "US"},
-            {"city": "Courtenay", "airport": "Courtenay Airpark", "iata": "YCA", "country": "CA"},
-            {"city": "Coventry, West Midlands", "airport": "Coventry Airport", "iata": "CVT", "country": "GB"},
-            {"city": "Coveñas", "airport": "Coveñas Airport", "iata": "CVE", "country": "CO"},
-            {"city": "Cowley", "airport": "Cowley Airport", "iata": "YYM", "country": "CA"},
-            {"city": "Cox's Bazar", "airport": "Cox's Bazar Airport", "iata": "CXB", "country": "BD"},
-            {"city": "Coxen Hole", "airport": "Juan Manuel Gálvez International Airport", "iata": "RTB", "country": "HN"},
-            {"city": "Coyhaique", "airport": "Teniente Vidal Airport", "iata": "GXQ", "country": "CL"},
-            {"city": "Coyoles", "airport": "Coyoles Airport", "iata": "CYL", "country": "HN"},
-            {"city": "Cozumel", "airport": "Cozumel International Airport", "iata": "CZM", "country": "MX"},
-            {"city": "Cradock", "airport": "Cradock Airport", "iata": "CDO", "country": "ZA"},
-            {"city": "Craig", "airport": "Craig Seaplane Base", "iata": "CGA", "country": "US"},
-            {"city": "Craig", "airport": "Craig Moffat Airport", "iata": "CIG", "country": "US"},
-            {"city": "Craig Cove", "airport": "Craig Cove Airport", "iata": "CCV", "country": "VU"},
-            {"city": "Craiova", "airport": "Craiova International Airport", "iata": "CRA", "country": "RO"},
-            {"city": "Cranbrook", "airport": "Cranbrook/Canadian Rockies International Airport", "iata": "YXC", "country": "CA"},
-            {"city": "Crane", "airport": "Crane County Airport", "iata": "CCG", "country": "US"},
-            {"city": "Crane Island", "airport": "Crane Island Airstrip", "iata": "CKR", "country": "US"},
-            {"city": "Crateús", "airport": "Crateús Airport", "iata": "JCS", "country": "BR"},
-            {"city": "Cravo Norte", "airport": "Cravo Norte Airport", "iata": "RAV", "country": "CO"},
-            {"city": "Creil", "airport": "Creil Air Base", "iata": "CSF", "country": "FR"},
-            {"city": "Crescent City", "airport": "Jack Mc Namara Field Airport", "iata": "CEC", "country": "US"},
-            {"city": "Cresswell Downs", "airport": "Cresswell Downs Airport", "iata": "CSD", "country": "AU"},
-            {"city": "Crested Butte", "airport": "Crested Butte Airpark", "iata": "CSE", "country": "US"},
-            {"city": "Creston", "airport": "Creston Valley Regional Airport - Art Sutcliffe Field", "iata": "CFQ", "country": "CA"},
-            {"city": "Creston", "airport": "Creston Municipal Airport", "iata": "CSQ", "country": "US"},
-            {"city": "Crestview", "airport": "Bob Sikes Airport", "iata": "CEW", "country": "US"},
-            {"city": "Crestview", "airport": "Duke Field", "iata": "EGI", "country": "US"},
-            {"city": "Crete Island", "airport": "Sitia Airport", "iata": "JSH", "country": "GR"},
-            {"city": "Criciúma", "airport": "Forquilhinha - Criciúma  Airport", "iata": "CCM", "country": "BR"},
-            {"city": "Cristalândia", "airport": "Santa Izabel do Morro Airport", "iata": "IDO", "country": "BR"},
-            {"city": "Crooked Creek", "airport": "Crooked Creek Airport", "iata": "CKD", "country": "US"},
-            {"city": "Crookston", "airport": "Crookston Municipal Kirkwood Field", "iata": "CKN", "country": "US"},
-            {"city": "Cross City", "airport": "Cross City Airport", "iata": "CTY", "country": "US"},
-            {"city": "Cross Lake", "airport": "Cross Lake (Charlie Sinclair Memorial) Airport", "iata": "YCR", "country": "CA"},
-            {"city": "Crossett", "airport": "Z M Jack Stell Field", "iata": "CRT", "country": "US"},
-            {"city": "Crossville", "airport": "Crossville Memorial Airport Whitson Field", "iata": "CSV", "country": "US"},
-            {"city": "Cruz", "airport": "Comandante Ariston Pessoa Airport", "iata": "JJD", "country": "BR"},
-            {"city": "Cruz Alta", "airport": "Carlos Ruhl Airport", "iata": "CZB", "country": "BR"},
-            {"city": "Cruz Bay", "airport": "Cruz Bay Seaplane Base", "iata": "SJF", "country": "VI"},
-            {"city": "Cruzeiro Do Sul", "airport": "Cruzeiro do Sul Airport", "iata": "CZS", "country": "BR"},
-            {"city": "Cuamba", "airport": "Cuamba Airport", "iata": "FXO", "country": "MZ"},
-            {"city": "Cuenca", "airport": "Mariscal Lamar Airport", "iata": "CUE", "country": "EC"},
-            {"city": "Cuiabá", "airport": "Marechal Rondon Airport", "iata": "CGB", "country": "BR"},
-            {"city": "Cuito Cuanavale", "airport": "Cuito Cuanavale Airport", "iata": "CTI", "country": "AO"},
-            {"city": "Culebra", "airport": "Benjamin Rivera Noriega Airport", "iata": "CPX", "country": "PR"},
-            {"city": "Culiacán", "airport": "Bachigualato Federal International Airport", "iata": "CUL", "country": "MX"},
-            {"city": "Culion", "airport": "Culion Airport", "iata": "CUJ", "country": "PH"},
-            {"city": "Culleredo", "airport": "A Coruña Airport", "iata": "LCG", "country": "ES"},
-            {"city": "Cundeelee", "airport": "Carosue Dam Airport", "iata": "WCD", "country": "AU"},
-            {"city": "Curitiba", "airport": "Bacacheri Airport", "iata": "BFH", "country": "BR"},
-            {"city": "Curitiba", "airport": "Afonso Pena Airport", "iata": "CWB", "country": "BR"},
-            {"city": "Currais Novos", "airport": "Currais Novos Airport", "iata": "QCP", "country": "BR"},
-            {"city": "Currillo", "airport": "Currillo Airport", "iata": "CUI", "country": "CO"},
-            {"city": "Cururupu", "airport": "Cururupu Airport", "iata": "CPU", "country": "BR"},
-            {"city": "Curuzu Cuatia", "airport": "Curuzu Cuatia Airport", "iata": "UZU", "country": "AR"},
-            {"city": "Cusco", "airport": "Alejandro Velasco Astete International Airport", "iata": "CUZ", "country": "PE"},
-            {"city": "Cushing", "airport": "Cushing Municipal Airport", "iata": "CUH", "country": "US"},
-            {"city": "Cut Bank", "airport": "Cut Bank International Airport", "iata": "CTB", "country": "US"},
-            {"city": "Cutral-Co", "airport": "Cutral-Co Airport", "iata": "CUT", "country": "AR"},
-            {"city": "Cuyo", "airport": "Cuyo Airport", "iata": "CYU", "country": "PH"},
-            {"city": "Cáceres", "airport": "Cáceres Airport", "iata": "CCX", "country": "BR"},
-            {"city": "Cóbano", "airport": "Cóbano Airport", "iata": "ACO", "country": "CR"},
-            {"city": "Córdoba", "airport": "Córdoba Airport", "iata": "ODB", "country": "ES"},
-            {"city": "Côte-Nord-du-Golfe-du-Saint-Laurent", "airport": "Kégashka Airport", "iata": "ZKG", "country": "CA"},
-            {"city": "Cúcuta", "airport": "Camilo Daza International Airport", "iata": "CUC", "country": "CO"},
-            {"city": "Da Lat", "airport": "Lien Khuong Airport", "iata": "DLI", "country": "VN"},
-            {"city": "Da Nang", "airport": "Da Nang International Airport", "iata": "DAD", "country": "VN"},
-            {"city": "Dabra", "airport": "Dabra Airport", "iata": "DRH", "country": "ID"},
-            {"city": "Dadu", "airport": "Dadu West Airport", "iata": "DDU", "country": "PK"},
-            {"city": "Daegu", "airport": "Daegu Airport", "iata": "TAE", "country": "KR"},
-            {"city": "Daet", "airport": "Daet Airport", "iata": "DTE", "country": "PH"},
-            {"city": "Daggett", "airport": "Barstow Daggett Airport", "iata": "DAG", "country": "US"},
-            {"city": "Dahl Creek", "airport": "Dahl Creek Airport", "iata": "DCK", "country": "US"},
-            {"city": "Dahlgren", "airport": "Dahlgren Naval Surface Warfare Center Airport", "iata": "DGN", "country": "US"},
-            {"city": "Dakar", "airport": "Blaise Diagne International Airport", "iata": "DSS", "country": "SN"},
-            {"city": "Dakar", "airport": "Léopold Sédar Senghor International Airport", "iata": "DKR", "country": "SN"},
-            {"city": "Dakhla", "airport": "Dakhla Airport", "iata": "VIL", "country": "EH"},
-            {"city": "Dakhla Oases", "airport": "Ad Dakhla Airport", "iata": "DAK", "country": "EG"},
-            {"city": "Dalaman", "airport": "Dalaman International Airport", "iata": "DLM", "country": "TR"},
-            {"city": "Dalanzadgad", "airport": "Dalanzadgad Airport", "iata": "DLZ", "country": "MN"},
-            {"city": "Dalbandin", "airport": "Dalbandin Airport", "iata": "DBA", "country": "PK"},
-            {"city": "Dalcahue", "airport": "Mocopulli Airport", "iata": "MHC", "country": "CL"},
-            {"city": "Dalhart", "airport": "Dalhart Municipal Airport", "iata": "DHT", "country": "US"},
-            {"city": "Dali (Xiaguan)", "airport": "Dali Fengyi Airport", "iata": "DLU", "country": "CN"},
-            {"city": "Dalian (Changhai)", "airport": "Changhai Airport", "iata": "CNI", "country": "CN"},
-            {"city": "Dalian (Ganjingzi)", "airport": "Dalian Zhoushuizi International Airport", "iata": "DLC", "country": "CN"},
-            {"city": "Dallas", "airport": "Addison Airport", "iata": "ADS", "country": "US"},
-            {"city": "Dallas", "airport": "Dallas Love Field", "iata": "DAL", "country": "US"},
-            {"city": "Dallas", "airport": "Dallas Executive Airport", "iata": "RBD", "country": "US"},
-            {"city": "Dallas-Fort Worth", "airport": "Dallas Fort Worth International Airport", "iata": "DFW", "country": "US"},
-            {"city": "Dallesport / The Dalles", "airport": "Columbia Gorge Regional Airport", "iata": "DLS", "country": "US"},
-            {"city": "Dalnegorsk", "airport": "Dalnegorsk Airport", "iata": "DHG", "country": "RU"},
-            {"city": "Dalnerechensk", "airport": "Dalnerechensk Airport", "iata": "DLR", "country": "RU"},
-            {"city": "Dalton", "airport": "Dalton Municipal Airport", "iata": "DNN", "country": "US"},
-            {"city": "Daly Waters", "airport": "Daly Waters Airport", "iata": "DYW", "country": "AU"},
-            {"city": "Daman", "airport": "Daman Airport", "iata": "NMB", "country": "IN"},
-            {"city": "Damascus", "airport": "Damascus International Airport", "iata": "DAM", "country": "SY"},
-            {"city": "Dambulla", "airport": "Dambulu Oya Tank Seaplane Base", "iata": "DBU", "country": "LK"},
-            {"city": "Dampier Peninsula", "airport": "Beagle Bay Airport", "iata": "BEE", "country": "AU"},
-            {"city": "Danbury", "airport": "Danbury Municipal Airport", "iata": "DXR", "country": "US"},
-            {"city": "Dandong (Zhenxing)", "airport": "Dandong Langtou Airport", "iata": "DDG", "country": "CN"},
-            {"city": "Dang", "airport": "Tulsipur Airport", "iata": "DNP", "country": "NP"},
-            {"city": "Dangriga", "airport": "Dangriga Airport", "iata": "DGA", "country": "BZ"},
-            {"city": "Dansville", "airport": "Dansville Municipal Airport", "iata": "DSV", "country": "US"},
-            {"city": "Danville", "airport": "Danville Regional Airport", "iata": "DAN", "country": "US"},
-            {"city": "Danville", "airport": "Vermilion Regional Airport", "iata": "DNV", "country": "US"},
-            {"city": "Daporijo", "airport": "Daporijo Airport", "iata": "DEP", "country": "IN"},
-            {"city": "Daqing", "airport": "Daqing Sartu Airport", "iata": "DQA", "country": "CN"},
-            {"city": "Dar es Salaam", "airport": "Julius Nyerere International Airport", "iata": "DAR", "country": "TZ"},
-            {"city": "Darbhanga", "airport": "Darbhanga Airport", "iata": "DBR", "country": "IN"},
-            {"city": "Darchula", "airport": "Darchula Airport", "iata": "DAP", "country": "NP"},
-            {"city": "Dargaville", "airport": "Dargaville Aerodrome", "iata": "DGR", "country": "NZ"},
-            {"city": "Darlington, Durham", "airport": "Teesside International Airport", "iata": "MME", "country": "GB"},
-            {"city": "Darnley Island", "airport": "Darnley Island Airport", "iata": "NLF", "country": "AU"},
-            {"city": "Daru", "airport": "Daru Airport", "iata": "DAU", "country": "PG"},
-            {"city": "Darwaz", "airport": "Darwaz Airport", "iata": "DAZ", "country": "AF"},
-            {"city": "Darwin", "airport": "Darwin International Airport / RAAF Darwin", "iata": "DRW", "country": "AU"},
-            {"city": "Datadawai-Borneo Island", "airport": "Datadawai Airport", "iata": "DTD", "country": "ID"},
-            {"city": "Dathina", "airport": "Dathina Airport", "iata": "DAH", "country": "YE"},
-            {"city": "Datong", "airport": "Datong Yungang Airport", "iata": "DAT", "country": "CN"},
-            {"city": "Datu Odin Sinsuat", "airport": "Cotabato (Awang) Airport", "iata": "CBO", "country": "PH"},
-            {"city": "Dauphin", "airport": "Dauphin Barker Airport", "iata": "YDN", "country": "CA"},
-            {"city": "Davao", "airport": "Francisco Bangoy International Airport", "iata": "DVO", "country": "PH"},
-            {"city": "Davenport", "airport": "Davenport Municipal Airport", "iata": "DVN", "country": "US"},
-            {"city": "David", "airport": "Enrique Malek International Airport", "iata": "DAV", "country": "PA"},
-            {"city": "Dawadmi", "airport": "King Salman Abdulaziz Airport", "iata": "DWD", "country": "SA"},
-            {"city": "Dawei", "airport": "Dawei Airport", "iata": "TVY", "country": "MM"},
-            {"city": "Dawson City", "airport": "Dawson City Airport", "iata": "YDA", "country": "CA"},
-            {"city": "Dawson Creek", "airport": "Dawson Creek Airport", "iata": "YDQ", "country": "CA"},
-            {"city": "Dayrestan", "airport": "Qeshm Dayrestan International Airport", "iata": "GSM", "country": "IR"},
-            {"city": "Dayton", "airport": "James M Cox Dayton International Airport", "iata": "DAY", "country": "US"},
-            {"city": "Dayton", "airport": "Wright-Patterson Air Force Base", "iata": "FFO", "country": "US"},
-            {"city": "Dayton", "airport": "Dayton-Wright Brothers Airport", "iata": "MGY", "country": "US"},
-            {"city": "Daytona Beach", "airport": "Daytona Beach International Airport", "iata": "DAB", "country": "US"},
-            {"city": "Dazhou (Dachuan)", "airport": "Dazhou Jinya Airport", "iata": "DZH", "country": "CN"},
-            {"city": "Dazhou (Daxian)", "airport": "Dachuan Airport", "iata": "DAX", "country": "CN"},
-            {"city": "Dazu", "airport": "Dazu Air Base", "iata": "DZU", "country": "CN"},
-            {"city": "Daşoguz", "airport": "Daşoguz Airport", "iata": "TAZ", "country": "TM"},
-            {"city": "DeRidder", "airport": "Beauregard Regional Airport", "iata": "DRI", "country": "US"},
-            {"city": "Deadhorse", "airport": "Deadhorse Airport", "iata": "SCC", "country": "US"},
-            {"city": "Deadman's Cay", "airport": "Deadman's Cay Airport", "iata": "LGI", "country": "BS"},
-            {"city": "Dease Lake", "airport": "Dease Lake Airport", "iata": "YDL", "country": "CA"},
-            {"city": "Death Valley", "airport": "Furnace Creek Airport", "iata": "DTH", "country": "US"},
-            {"city": "Deauville", "airport": "Deauville Normandie airport", "iata": "DOL", "country": "FR"},
-            {"city": "Debepare", "airport": "Debepare Airport", "iata": "DBP", "country": "PG"},
-            {"city": "Debre Markos", "airport": "Debre Markos Airport", "iata": "DBM", "country": "ET"},
-            {"city": "Debre Tabor", "airport": "Debre Tabor Airport", "iata": "DBT", "country": "ET"},
-            {"city": "Debre Zeyit", "airport": "Harar Meda Airport", "iata": "QHR", "country": "ET"},
-            {"city": "Debrecen", "airport": "Debrecen International Airport", "iata": "DEB", "country": "HU"},
-            {"city": "Decatur", "airport": "Pryor Field Regional Airport", "iata": "DCU", "country": "US"},
-            {"city": "Decatur", "airport": "Decatur Airport", "iata": "DEC", "country": "US"},
-            {"city": "Decatur", "airport": "Decatur Shores Airport", "iata": "DTR", "country": "US"},
-            {"city": "Decimomannu", "airport": "Decimomannu Air Base", "iata": "DCI", "country": "IT"},
-            {"city": "Decorah", "airport": "Decorah Municipal Airport", "iata": "DEH", "country": "US"},
-            {"city": "Dedougou", "airport": "Dedougou Airport", "iata": "DGU", "country": "BF"},
-            {"city": "Deer Harbor", "airport": "Deer Harbor SPB", "iata": "DHB", "country": "US"},
-            {"city": "Deer Lake", "airport": "Deer Lake Airport", "iata": "YDF", "country": "CA"},
-            {"city": "Deer Lake", "airport": "Deer Lake Airport", "iata": "YVZ", "country": "CA"},
-            {"city": "Deering", "airport": "Deering Airport", "iata": "DRG", "country": "US"},
-            {"city": "Defiance", "airport": "Defiance Memorial Airport", "iata": "DFI", "country": "US"},
-            {"city": "Dehong (Longchuan)", "airport": "Longchuan Guangsong Airport", "iata": "LCS", "country": "CN"},
-            {"city": "Dehong (Mangshi)", "airport": "Dehong Mangshi Airport", "iata": "LUM", "country": "CN"},
-            {"city": "Dehradun (Jauligrant)", "airport": "Dehradun Jolly Grant Airport", "iata": "DED", "country": "IN"},
-            {"city": "Deir ez-Zor", "airport": "Deir ez-Zor Airport", "iata": "DEZ", "country": "SY"},
-            {"city": "Dekai", "airport": "Nop Goliat Dekai Airport", "iata": "DEX", "country": "ID"},
-            {"city": "Del Carmen", "airport": "Siargao Airport", "iata": "IAO", "country": "PH"},
-            {"city": "Del Rio", "airport": "Laughlin Air Force Base", "iata": "DLF", "country": "US"},
-            {"city": "Del Rio", "airport": "Del Rio International Airport", "iata": "DRT", "country": "US"},
-            {"city": "Delingha", "airport": "Delingha Airport", "iata": "HXD", "country": "CN"},
-            {"city": "Delma Island", "airport": "Delma Airport", "iata": "ZDY", "country": "AE"},
-            {"city": "Delta", "airport": "Boundary Bay Airport", "iata": "YDT", "country": "CA"},
-            {"city": "Delta", "airport": "Delta Municipal Airport", "iata": "DTA", "country": "US"},
-            {"city": "Delta Junction", "airport": "Delta Junction Airport", "iata": "DJN", "country": "US"},
-            {"city": "Delta Junction Ft Greely", "airport": "Allen Army Airfield", "iata": "BIG", "country": "US"},
-            {"city": "Dembidollo", "airport": "Dembidollo Airport", "iata": "DEM", "country": "ET"},
-            {"city": "Demgulu", "airport": "Meselia Airport", "iata": "MFZ", "country": "PG"},
-            {"city": "Deming", "airport": "Deming Municipal Airport", "iata": "DMN", "country": "US"},
-            {"city": "Den Helder", "airport": "De Kooy Airfield / Den Helder Naval Air Station", "iata": "DHR", "country": "NL"},
-            {"city": "Denali Park", "airport": "Denali National Park Airport", "iata": "MCL", "country": "US"},
-            {"city": "Denglagu Mission", "airport": "Keglsugl Airport", "iata": "KEG", "country": "PG"},
-            {"city": "Denham", "airport": "Shark Bay Airport", "iata": "MJK", "country": "AU"},
-            {"city": "Deniliquin", "airport": "Deniliquin Airport", "iata": "DNQ", "country": "AU"},
-            {"city": "Denis Island", "airport": "Denis Island Airport", "iata": "DEI", "country": "SC"},
-            {"city": "Denison", "airport": "Denison Municipal Airport", "iata": "DNS", "country": "US"},
-            {"city": "Denison", "airport": "North Texas Regional Airport Perrin Field", "iata": "PNX", "country": "US"},
-            {"city": "Denizli", "airport": "Çardak Airport", "iata": "DNZ", "country": "TR"},
-            {"city": "Dennison", "airport": "Stanton Airfield", "iata": "SYN", "country": "US"},
-            {"city": "Denver", "airport": "Centennial Airport", "iata": "APA", "country": "US"},
-            {"city": "Denver", "airport": "Rocky Mountain Metropolitan Airport", "iata": "BJC", "country": "US"},
-            {"city": "Denver", "airport": "Denver International Airport", "iata": "DEN", "country": "US"},
-            {"city": "Deoghar", "airport": "Deoghar Airport", "iata": "DGH", "country": "IN"},
-            {"city": "Deputatskiy", "airport": "Deputatskiy Airport", "iata": "DPT", "country": "RU"},
-            {"city": "Dera Ghazi Khan", "airport": "Dera Ghazi Khan Airport", "iata": "DEA", "country": "PK"},
-            {"city": "Dera Ismael Khan", "airport": "Dera Ismael Khan Airport [IN-ACTIVE]", "iata": "DSK", "country": "PK"},
-            {"city": "Derby", "airport": "RAAF Base Curtin", "iata": "DCN", "country": "AU"},
-            {"city": "Derby", "airport": "Derby Airport", "iata": "DRB", "country": "AU"},
-            {"city": "Derim", "airport": "Derim Airport", "iata": "DER", "country": "PG"},
-            {"city": "Derry", "airport": "City of Derry Airport", "iata": "LDY", "country": "GB"},
-            {"city": "Des Moines", "airport": "Des Moines International Airport", "iata": "DSM", "country": "US"},
-            {"city": "Desolation Sound", "airport": "Refuge Cove Seaplane Base", "iata": "YRC", "country": "CA"},
-            {"city": "Desroches Island", "airport": "Desroches Airport", "iata": "DES", "country": "SC"},
-            {"city": "Dessie", "airport": "Kombolcha Airport", "iata": "DSE", "country": "ET"},
-            {"city": "Destin", "airport": "Destin Executive Airport", "iata": "DSI", "country": "US"},
-            {"city": "Detroit", "airport": "Coleman A. Young Municipal Airport", "iata": "DET", "country": "US"},
-            {"city": "Detroit", "airport": "Detroit Metropolitan Wayne County Airport", "iata": "DTW", "country": "US"},
-            {"city": "Detroit", "airport": "Willow Run Airport", "iata": "YIP", "country": "US"},
-            {"city": "Detroit Lakes", "airport": "Detroit Lakes Airport", "iata": "DTL", "country": "US"},
-            {"city": "Devils Lake", "airport": "Devils Lake Regional Airport", "iata": "DVL", "country": "US"},
-            {"city": "Devonport", "airport": "Devonport Airport", "iata": "DPO", "country": "AU"},
-            {"city": "Deyang (Guanghan)", "airport": "Guanghan Airport", "iata": "GHN", "country": "CN"},
-            {"city": "Dezful", "airport": "Dezful Airport", "iata": "DEF", "country": "IR"},
-            {"city": "Dhahran", "airport": "King Abdulaziz Air Base", "iata": "DHA", "country": "SA"},
-            {"city": "Dhaka", "airport": "Hazrat Shahjalal International Airport", "iata": "DAC", "country": "BD"},
-            {"city": "Dhangarhi", "airport": "Dhangarhi Airport", "iata": "DHI", "country": "NP"},
-            {"city": "Diamantina", "airport": "Diamantina Airport", "iata": "DTI", "country": "BR"},
-            {"city": "Diamantina Lakes", "airport": "Diamantina Lakes Airport", "iata": "DYM", "country": "AU"},
-            {"city": "Diamantino", "airport": "Diamantino Airport", "iata": "DMT", "country": "BR"},
-            {"city": "Dianópolis", "airport": "Dianópolis Airport", "iata": "DNO", "country": "BR"},
-            {"city": "Diapaga", "airport": "Diapaga Airport", "iata": "DIP", "country": "BF"},
-            {"city": "Diavik", "airport": "Diavik Airport", "iata": "DVK", "country": "CA"},
-            {"city": "Dibba al Baya", "airport": "Dibba Airport", "iata": "BYB", "country": "OM"},
-            {"city": "Dibrugarh", "airport": "Dibrugarh Airport", "iata": "DIB", "country": "IN"},
-            {"city": "Dickinson", "airport": "Dickinson Theodore Roosevelt Regional Airport", "iata": "DIK", "country": "US"},
-            {"city": "Dickwella", "airport": "Mawella Lagoon Seaplane Base", "iata": "DIW", "country": "LK"},
-            {"city": "Diebougou", "airport": "Diebougou Airport", "iata": "XDE", "country": "BF"},
-            {"city": "Diego Garcia", "airport": "Diego Garcia Naval Support Facility", "iata": "NKW", "country": "IO"},
-            {"city": "Dien Bien Phu", "airport": "Dien Bien Phu Airport", "iata": "DIN", "country": "VN"},
-            {"city": "Digby", "airport": "Digby / Annapolis Regional Airport", "iata": "YDG", "country": "CA"},
-            {"city": "Dijon", "airport": "Dijon Longvic airport", "iata": "DIJ", "country": "FR"},
-            {"city": "Dikson", "airport": "Dikson Airport", "iata": "DKS", "country": "RU"},
-            {"city": "Dilasag", "airport": "Dilasag Airport", "iata": "DSG", "country": "PH"},
-            {"city": "Dili", "airport": "Presidente Nicolau Lobato International Airport", "iata": "DIL", "country": "TL"},
-            {"city": "Dillingham", "airport": "Dillingham Airport", "iata": "DLG", "country": "US"},
-            {"city": "Dillon", "airport": "Dillon County Airport", "iata": "DLL", "country": "US"},
-            {"city": "Dillon", "airport": "Dillon Airport", "iata": "DLN", "country": "US"},
-            {"city": "Dillon's Bay", "airport": "Dillon's Bay Airport", "iata": "DLY", "country": "VU"},
-            {"city": "Dimapur", "airport": "Dimapur Airport", "iata": "DMU", "country": "IN"},
-            {"city": "Dimbokro", "airport": "Dimbokro Airport", "iata": "DIM", "country": "CI"},
-            {"city": "Dinangat", "airport": "Dinangat Airport", "iata": "DNU", "country": "PG"},
-            {"city": "Dinard", "airport": "Dinard Pleurtuit Saint-Malo airport", "iata": "DNR", "country": "FR"},
-            {"city": "Dinder", "airport": "Galegu Airport", "iata": "DNX", "country": "SD"},
-            {"city": "Diomede", "airport": "Diomede Heliport", "iata": "DIO", "country": "US"},
-            {"city": "Dipolog", "airport": "Dipolog Airport", "iata": "DPL", "country": "PH"},
-            {"city": "Diqing (Shangri-La)", "airport": "Diqing Shangri-La Airport", "iata": "DIG", "country": "CN"},
-            {"city": "Dire Dawa", "airport": "Aba Tenna Dejazmach Yilma International Airport", "iata": "DIR", "country": "ET"},
-            {"city": "Dirico", "airport": "Dirico Airport", "iata": "DRC", "country": "AO"},
-            {"city": "Diu", "airport": "Diu Airport", "iata": "DIU", "country": "IN"},
-            {"city": "Divinópolis", "airport": "Brigadeiro Cabral Airport", "iata": "DIQ", "country": "BR"},
-            {"city": "Diyarbakır", "airport": "Diyarbakır Airport", "iata": "DIY", "country": "TR"},
-            {"city": "Djambala", "airport": "Djambala Airport", "iata": "DJM", "country": "CG"},
-            {"city": "Djanet", "airport": "Djanet Inedbirene Airport", "iata": "DJG", "country": "DZ"},
-            {"city": "Djibo", "airport": "Djibo Airport", "iata": "XDJ", "country": "BF"},
-            {"city": "Djibouti City", "airport": "Djibouti-Ambouli Airport", "iata": "JIB", "country": "DJ"},
-            {"city": "Djougou", "airport": "Djougou Airport", "iata": "DJA", "country": "BJ"},
-            {"city": "Djumu-Djomoe", "airport": "Djumu-Djomoe Airport", "iata": "DOE", "country": "SR"},
-            {"city": "Djúpivogur", "airport": "Djúpivogur Airport", "iata": "DJU", "country": "IS"},
-            {"city": "Dnipro", "airport": "Dnipro International Airport", "iata": "DNK", "country": "UA"},
-            {"city": "Doany", "airport": "Doany Airport", "iata": "DOA", "country": "MG"},
-            {"city": "Dobo-Warmar Island", "airport": "Rar Gwamar Airport", "iata": "DOB", "country": "ID"},
-            {"city": "Dodge City", "airport": "Dodge City Regional Airport", "iata": "DDC", "country": "US"},
-            {"city": "Dodoma", "airport": "Dodoma Airport", "iata": "DOD", "country": "TZ"},
-            {"city": "Doha", "airport": "Doha International Airport", "iata": "DIA", "country": "QA"},
-            {"city": "Doha", "airport": "Hamad International Airport", "iata": "DOH", "country": "QA"},
-            {"city": "Dolbeau-Saint-Felicien", "airport": "Dolbeau-Saint-Felicien Airport", "iata": "YDO", "country": "CA"},
-            {"city": "Dole", "airport": "Dole Tavaux Airport", "iata": "DLE", "country": "FR"},
-            {"city": "Dolisie", "airport": "Ngot Nzoungou Airport", "iata": "DIS", "country": "CG"},
-            {"city": "Dolní Benešov", "airport": "Zábřeh Dolní Benešov Airfield", "iata": "ZBE", "country": "CZ"},
-            {"city": "Dolný Hričov", "airport": "Žilina-Dolný Hričov Airport", "iata": "ILZ", "country": "SK"},
-            {"city": "Dolpa", "airport": "Dolpa Airport", "iata": "DOP", "country": "NP"},
-            {"city": "Donegal", "airport": "Donegal Airport", "iata": "CFN", "country": "IE"},
-            {"city": "Dong Hoi", "airport": "Dong Hoi Airport", "iata": "VDH", "country": "VN"},
-            {"city": "Dongola", "airport": "Dongola Airport", "iata": "DOG", "country": "SD"},
-            {"city": "Dongying (Kenli)", "airport": "Dongying Shengli Airport", "iata": "DOY", "country": "CN"},
-            {"city": "Donnelly", "airport": "Donnelly Airport", "iata": "YOE", "country": "CA"},
-            {"city": "Dori", "airport": "Dori Airport", "iata": "DOR", "country": "BF"},
-            {"city": "Dorobisoro", "airport": "Dorobisoro Airport", "iata": "DOO", "country": "PG"},
-            {"city": "Dortmund", "airport": "Dortmund Airport", "iata": "DTM", "country": "DE"},
-            {"city": "Dorunda Outstation", "airport": "Dorunda Airport", "iata": "DRD", "country": "AU"},
-            {"city": "Dos Lagunas", "airport": "Dos Lagunas Airport", "iata": "DON", "country": "GT"},
-            {"city": "Dothan", "airport": "Dothan Regional Airport", "iata": "DHN", "country": "US"},
-            {"city": "Douala", "airport": "Douala International Airport", "iata": "DLA", "country": "CM"},
-            {"city": "Douglas", "airport": "Douglas Municipal Airport", "iata": "DGL", "country": "US"},
-            {"city": "Douglas", "airport": "Converse County Airport", "iata": "DGW", "country": "US"},
-            {"city": "Douglas Bisbee", "airport": "Bisbee Douglas International Airport", "iata": "DUG", "country": "US"},
-            {"city": "Douglas Lake", "airport": "Douglas Lake Airport", "iata": "DGF", "country": "CA"},
-            {"city": "Dourados", "airport": "Dourados Airport", "iata": "DOU", "country": "BR"},
-            {"city": "Dover", "airport": "Dover Air Force Base", "iata": "DOV", "country": "US"},
-            {"city": "Doylestown", "airport": "Doylestown Airport", "iata": "DYL", "country": "US"},
-            {"city": "Drayton Valley", "airport": "Drayton Valley Industrial Airport", "iata": "YDC", "country": "CA"},
-            {"city": "Dreschvitz", "airport": "Rügen Airport", "iata": "GTI", "country": "DE"},
-            {"city": "Dresden", "airport": "Dresden Airport", "iata": "DRS", "country": "DE"},
-            {"city": "Drietabbetje", "airport": "Drietabbetje Airport", "iata": "DRJ", "country": "SR"},
-            {"city": "Drummond", "airport": "Drummond Airport", "iata": "DRU", "country": "US"},
-            {"city": "Drummond Island", "airport": "Drummond Island Airport", "iata": "DRE", "country": "US"},
-            {"city": "Dryden", "airport": "Dryden Regional Airport", "iata": "YHD", "country": "CA"},
-            {"city": "Drysdale River", "airport": "Doongan Airport", "iata": "DNG", "country": "AU"},
-            {"city": "Drysdale River", "airport": "Drysdale River Airport", "iata": "DRY", "country": "AU"},
-            {"city": "Drysdale River", "airport": "Theda Station Airport", "iata": "TDN", "country": "AU"},
-            {"city": "Dschang", "airport": "Dschang Airport", "iata": "DSC", "country": "CM"},
-            {"city": "Dubai", "airport": "Dubai International Airport", "iata": "DXB", "country": "AE"},
-            {"city": "Dubai", "airport": "Al Minhad Air Base", "iata": "NHD", "country": "AE"},
-            {"city": "Dubbo", "airport": "Dubbo City Regional Airport", "iata": "DBO", "country": "AU"},
-            {"city": "Dublin", "airport": "Dublin Airport", "iata": "DUB", "country": "IE"},
-            {"city": "Dublin", "airport": "W H 'Bud' Barron Airport", "iata": "DBN", "country": "US"},
-            {"city": "Dublin", "airport": "New River Valley Airport", "iata": "PSK", "country": "US"},
-            {"city": "Dubois", "airport": "DuBois Regional Airport", "iata": "DUJ", "country": "US"},
-            {"city": "Dubois", "airport": "Dubois Municipal Airport", "iata": "DBS", "country": "US"},
-            {"city": "Dubrave Gornje", "airport": "Tuzla International Airport", "iata": "TZL", "country": "BA"},
-            {"city": "Dubuque", "airport": "Dubuque Regional Airport", "iata": "DBQ", "country": "US"},
-            {"city": "Dugway Proving Ground", "airport": "Michael AAF (Dugway Proving Ground) Airport", "iata": "DPG", "country": "US"},
-            {"city": "Dulkaninna", "airport": "Dulkaninna Airport", "iata": "DLK", "country": "AU"},
-            {"city": "Dulles", "airport": "Washington Dulles International Airport", "iata": "IAD", "country": "US"},
-            {"city": "Duluth", "airport": "Duluth International Airport", "iata": "DLH", "country": "US"},
-            {"city": "Dumaguete City", "airport": "Sibulan Airport", "iata": "DGT", "country": "PH"},
-            {"city": "Dumai", "airport": "Pinang Kampai Airport", "iata": "DUM", "country": "ID"},
-            {"city": "Duncan", "airport": "Duncan Airport", "iata": "DUQ", "country": "CA"},
-            {"city": "Duncan", "airport": "Halliburton Field", "iata": "DUC", "country": "US"},
-            {"city": "Duncan Town", "airport": "Duncan Town Airport", "iata": "DCT", "country": "BS"},
-            {"city": "Dundee", "airport": "Dundee Airport", "iata": "DND", "country": "GB"},
-            {"city": "Dunedin", "airport": "Dunedin International Airport", "iata": "DUD", "country": "NZ"},
-            {"city": "Dunhuang", "airport": "Dunhuang Mogao International Airport", "iata": "DNH", "country": "CN"},
-            {"city": "Dunk Island", "airport": "Dunk Island Airport", "iata": "DKI", "country": "AU"},
-            {"city": "Dunkirk", "airport": "Chautauqua County-Dunkirk Airport", "iata": "DKK", "country": "US"},
-            {"city": "Dunsmuir", "airport": "Dunsmuir Muni-Mott Airport", "iata": "MHS", "country": "US"},
-            {"city": "Duqm", "airport": "Duqm International Airport", "iata": "DQM", "country": "OM"},
-            {"city": "Duqm", "airport": "Ja'Aluni Airport", "iata": "JNJ", "country": "OM"},
-            {"city": "Durango", "airport": "Animas Air Park", "iata": "AMK", "country": "US"},
-            {"city": "Durango", "airport": "Durango La Plata County Airport", "iata": "DRO", "country": "US"},
-            {"city": "Durango", "airport": "General Guadalupe Victoria International Airport", "iata": "DGO", "country": "MX"},
-            {"city": "Durant", "airport": "Durant Regional Airport - Eaker Field", "iata": "DUA", "country": "US"},
-            {"city": "Durazno", "airport": "Santa Bernardina International Airport", "iata": "DZO", "country": "UY"},
-            {"city": "Durban", "airport": "King Shaka International Airport", "iata": "DUR", "country": "ZA"},
-            {"city": "Durban", "airport": "Virginia Airport", "iata": "VIR", "country": "ZA"},
-            {"city": "Durgapur", "airport": "Kazi Nazrul Islam Airport", "iata": "RDP", "country": "IN"},
-            {"city": "Dushanbe", "airport": "Dushanbe International Airport", "iata": "DYU", "country": "TJ"},
-            {"city": "Dwangwa", "airport": "Dwangwa Airport", "iata": "DWA", "country": "MW"},
-            {"city": "Dzaoudzi", "airport": "Dzaoudzi Pamandzi International Airport", "iata": "DZA", "country": "YT"},
-            {"city": "Déline", "airport": "Déline Airport", "iata": "YWJ", "country": "CA"},
-            {"city": "Düsseldorf", "airport": "Düsseldorf Airport", "iata": "DUS", "country": "DE"},
-            {"city": "Eagle", "airport": "Eagle County Regional Airport", "iata": "EGE", "country": "US"},
-            {"city": "Eagle", "airport": "Eagle Airport", "iata": "EAA", "country": "US"},
-            {"city": "Eagle Lake", "airport": "Eagle Lake Airport", "iata": "ELA", "country": "US"},
-            {"city": "Eagle Pass", "airport": "Maverick County Memorial International Airport", "iata": "EGP", "country": "US"},
-            {"city": "Eagle River", "airport": "Eagle River Union Airport", "iata": "EGV", "country": "US"},
-            {"city": "Earlton", "airport": "Earlton (Timiskaming Regional) Airport", "iata": "YXR", "country": "CA"},
-            {"city": "East Albury", "airport": "Albury Airport", "iata": "ABX", "country": "AU"},
-            {"city": "East Hampton", "airport": "Town of East Hampton Airport", "iata": "HTO", "country": "US"},
-            {"city": "East London", "airport": "King Phalo Airport", "iata": "ELS", "country": "ZA"},
-            {"city": "East Tawas", "airport": "Iosco County Airport", "iata": "ECA", "country": "US"},
-            {"city": "Eastland", "airport": "Eastland Municipal Airport", "iata": "ETN", "country": "US"},
-            {"city": "Eastmain River", "airport": "Eastmain River Airport", "iata": "ZEM", "country": "CA"},
-            {"city": "Easton", "airport": "Easton Airport / Newnam Field", "iata": "ESN", "country": "US"},
-            {"city": "Easton", "airport": "Easton State Airport", "iata": "ESW", "country": "US"},
-            {"city": "Eastover", "airport": "Mc Entire Joint National Guard Base", "iata": "MMT", "country": "US"},
-            {"city": "Eastsound", "airport": "Waldron Airstrip", "iata": "WDN", "country": "US"},
-            {"city": "Eastsound", "airport": "Orcas Island Airport", "iata": "ESD", "country": "US"},
-            {"city": "Eau Claire", "airport": "Chippewa Valley Regional Airport", "iata": "EAU", "country": "US"},
-            {"city": "Ebadon Island", "airport": "Ebadon Airport", "iata": "EBN", "country": "MH"},
-            {"city": "Ebermannstadt", "airport": "Burg Feuerstein Airport", "iata": "URD", "country": "DE"},
-            {"city": "Ebolowa", "airport": "Ebolowa Airport", "iata": "EBW", "country": "CM"},
-            {"city": "Ebon Atoll", "airport": "Ebon Airport", "iata": "EBO", "country": "MH"},
-            {"city": "Echo Bay", "airport": "Bar River Airport", "iata": "YEB", "country": "CA"},
-            {"city": "Eday", "airport": "Eday Airport", "iata": "EOI", "country": "GB"},
-            {"city": "Edenton", "airport": "Northeastern Regional Airport", "iata": "EDE", "country": "US"},
-            {"city": "Edinburgh", "airport": "Edinburgh Airport", "iata": "EDI", "country": "GB"},
-            {"city": "Edmonton", "airport": "Edmonton International Airport", "iata": "YEG", "country": "CA"},
-            {"city": "Edna Bay", "airport": "Edna Bay Seaplane Base", "iata": "EDA", "country": "US"},
-            {"city": "Edremit", "airport": "Balıkesir Koca Seyit Airport", "iata": "EDO", "country": "TR"},
-            {"city": "Edson", "airport": "Edson Airport", "iata": "YET", "country": "CA"},
-            {"city": "Edwards", "airport": "Edwards Air Force Base", "iata": "EDW", "country": "US"},
-            {"city": "Eek", "airport": "Eek Airport", "iata": "EEK", "country": "US"},
-            {"city": "Efogi", "airport": "Efogi Airport", "iata": "EFG", "country": "PG"},
-            {"city": "Egegik", "airport": "Egegik Airport", "iata": "EGX", "country": "US"},
-            {"city": "Egilsstaðir", "airport": "Egilsstaðir Airport", "iata": "EGS", "country": "IS"},
-            {"city": "Eighty Mile Beach", "airport": "Mandora Airport", "iata": "MQA", "country": "AU"},
-            {"city": "Eighty Mile Beach", "airport": "Wallal Downs Airport", "iata": "WLA", "country": "AU"},
-            {"city": "Eilat", "airport": "Ramon International Airport", "iata": "ETM", "country": "IL"},
-            {"city": "Eilat", "airport": "Ovda Airport", "iata": "VDA", "country": "IL"},
-            {"city": "Einasleigh", "airport": "Einasleigh Airport", "iata": "EIH", "country": "AU"},
-            {"city": "Eindhoven", "airport": "Eindhoven Airport", "iata": "EIN", "country": "NL"},
-            {"city": "Eirunepé", "airport": "Eirunepé Airport", "iata": "ERN", "country": "BR"},
-            {"city": "Ejin Banner", "airport": "Ejin Banner Taolai Airport", "iata": "EJN", "country": "CN"},
-            {"city": "Ekati", "airport": "Ekati Airport", "iata": "YOA", "country": "CA"},
-            {"city": "Ekibastuz", "airport": "Ekibastuz Airport", "iata": "EKB", "country": "KZ"},
-            {"city": "Ekuk", "airport": "Ekuk Airport", "iata": "KKU", "country": "US"},
-            {"city": "Ekwok", "airport": "Ekwok Airport", "iata": "KEK", "country": "US"},
-            {"city": "El Aaiún", "airport": "Hassan I Airport", "iata": "EUN", "country": "EH"},
-            {"city": "El Aguacate", "airport": "El Aguacate Airport", "iata": "CAA", "country": "HN"},
-            {"city": "El Alamein", "airport": "El Alamein International Airport", "iata": "DBB", "country": "EG"},
-            {"city": "El Arish", "airport": "El Arish International Airport", "iata": "AAC", "country": "EG"},
-            {"city": "El Atteuf", "airport": "Noumérat - Moufdi Zakaria Airport", "iata": "GHA", "country": "DZ"},
-            {"city": "El Bagre", "airport": "El Bagre Airport", "iata": "EBG", "country": "CO"},
-            {"city": "El Banco", "airport": "Las Flores Airport", "iata": "ELB", "country": "CO"},
-            {"city": "El Bayadh", "airport": "El Bayadh Airport", "iata": "EBH", "country": "DZ"},
-            {"city": "El Bañado", "airport": "Monteagudo Airport", "iata": "MHW", "country": "BO"},
-            {"city": "El Bolsón", "airport": "El Bolsón Airfield", "iata": "EHL", "country": "AR"},
-            {"city": "El Borma", "airport": "El Borma Airport", "iata": "EBM", "country": "TN"},
-            {"city": "El Calafate", "airport": "El Calafate - Commander Armando Tola International Airport", "iata": "FTE", "country": "AR"},
-            {"city": "El Centro", "airport": "El Centro NAF Airport (Vraciu Field)", "iata": "NJK", "country": "US"},
-            {"city": "El Charco", "airport": "El Charco Airport", "iata": "ECR", "country": "CO"},
-            {"city": "El Daein", "airport": "El Daein Airport", "iata": "ADV", "country": "SD"},
-            {"city": "El Dorado", "airport": "South Arkansas Regional Airport at Goodwin Field", "iata": "ELD", "country": "US"},
-            {"city": "El Dorado", "airport": "Captain Jack Thomas El Dorado Airport", "iata": "EDK", "country": "US"},
-            {"city": "El Dorado", "airport": "El Dorado Airport", "iata": "ELO", "country": "AR"},
-            {"city": "El Encanto", "airport": "El Encanto Airport", "iata": "ECO", "country": "CO"},
-            {"city": "El Fasher", "airport": "El Fasher Airport", "iata": "ELF", "country": "SD"},
-            {"city": "El Hassana", "airport": "Bardawil International Airport", "iata": "RDL", "country": "EG"},
-            {"city": "El Hierro Island", "airport": "El Hierro Airport", "iata": "VDE", "country": "ES"},
-            {"city": "El Jora", "airport": "El Jora Airport", "iata": "EGH", "country": "EG"},
-            {"city": "El Maitén", "airport": "El Maitén Airport", "iata": "EMX", "country": "AR"},
-            {"city": "El Matorral", "airport": "Fuerteventura Airport", "iata": "FUE", "country": "ES"},
-            {"city": "El Menia", "airport": "El Golea Airport", "iata": "ELG", "country": "DZ"},
-            {"city": "El Minya", "airport": "El Minya Airport", "iata": "EMY", "country": "EG"},
-            {"city": "El Mirador", "airport": "El Mirador Heliport", "iata": "EMR", "country": "GT"},
-            {"city": "El Monte", "airport": "San Gabriel Valley Airport", "iata": "EMT", "country": "US"},
-            {"city": "El Naranjo", "airport": "El Naranjo Airport", "iata": "ENJ", "country": "GT"},
-            {"city": "El Nido", "airport": "El Nido Airport", "iata": "ENI", "country": "PH"},
-            {"city": "El Palomar", "airport": "El Palomar Airport", "iata": "EPA", "country": "AR"},
-            {"city": "El Paso", "airport": "El Paso International Airport", "iata": "ELP", "country": "US"},
-            {"city": "El Porvenir", "airport": "El Porvenir Airport", "iata": "PVE", "country": "PA"},
-            {"city": "El Real de Santa María", "airport": "EL Real Airport", "iata": "ELE", "country": "PA"},
-            {"city": "El Reno", "airport": "El Reno Regional Airport", "iata": "RQO", "country": "US"},
-            {"city": "El Salvador", "airport": "Ricardo García Posada Airport", "iata": "ESR", "country": "CL"},
-            {"city": "El Tigre", "airport": "San Tomé Airport", "iata": "SOM", "country": "VE"},
-            {"city": "El Tigre", "airport": "El Tigre Airport", "iata": "ELX", "country": "VE"},
-            {"city": "El Vigía", "airport": "Juan Pablo Pérez Alfonso Airport", "iata": "VIG", "country": "VE"},
-            {"city": "El-Obeid", "airport": "El-Obeid Airport", "iata": "EBD", "country": "SD"},
-            {"city": "Elazığ", "airport": "Elazığ Airport", "iata": "EZS", "country": "TR"},
-            {"city": "Elcho Island", "airport": "Elcho Island Airport", "iata": "ELC", "country": "AU"},
-            {"city": "Eldoret", "airport": "Eldoret International Airport", "iata": "EDL", "country": "KE"},
-            {"city": "Electric City", "airport": "Grand Coulee Dam Airport", "iata": "GCD", "country": "US"},
-            {"city": "Elelim", "airport": "Elelim Airport", "iata": "ELR", "country": "ID"},
-            {"city": "Elfin Cove", "airport": "Elfin Cove Seaplane Base", "iata": "ELV", "country": "US"},
-            {"city": "Elim", "airport": "Moses Point Airport", "iata": "MOS", "country": "US"},
-            {"city": "Elim", "airport": "Elim Airport", "iata": "ELI", "country": "US"},
-            {"city": "Eliptamin", "airport": "Eliptamin Airport", "iata": "EPT", "country": "PG"},
-            {"city": "Elista", "airport": "Elista Airport", "iata": "ESL", "country": "RU"},
-            {"city": "Eliye Springs", "airport": "Eliye Springs Airport", "iata": "EYS", "country": "KE"},
-            {"city": "Elizabeth City", "airport": "Elizabeth City Regional Airport & Coast Guard Air Station", "iata": "ECG", "country": "US"},
-            {"city": "Elizabethtown", "airport": "Addington Field / Elizabethtown Regional Airport", "iata": "EKX", "country": "US"},
-            {"city": "Elk City", "airport": "Elk City Regional Business Airport", "iata": "ELK", "country": "US"},
-            {"city": "Elkhart", "airport": "Elkhart Municipal Airport", "iata": "EKI", "country": "US"},
-            {"city": "Elkins", "airport": "Elkins-Randolph County Regional Airport", "iata": "EKN", "country": "US"},
-            {"city": "Elko", "airport": "Elko Regional Airport", "iata": "EKO", "country": "US"},
-            {"city": "Ellamar", "airport": "Ellamar Seaplane Base", "iata": "ELW", "country": "US"},
-            {"city": "Ellensburg", "airport": "Bowers Field", "iata": "ELN", "country": "US"},
-            {"city": "Elliot Lake", "airport": "Elliot Lake Municipal Airport", "iata": "YEL", "country": "CA"},
-            {"city": "Ellisras", "airport": "Ellisras Matimba Airport", "iata": "ELL", "country": "ZA"},
-            {"city": "Elmira/Corning", "airport": "Elmira Corning Regional Airport", "iata": "ELM", "country": "US"},
-            {"city": "Elrose Mine", "airport": "Elrose Airport", "iata": "ERQ", "country": "AU"},
-            {"city": "Ely", "airport": "Ely Municipal Airport", "iata": "LYU", "country": "US"},
-            {"city": "Ely", "airport": "Ely Airport Yelland Field", "iata": "ELY", "country": "US"},
-            {"city": "Emae Island", "airport": "Siwo Airport", "iata": "EAE", "country": "VU"},
-            {"city": "Embessa", "airport": "Embessa Airport", "iata": "EMS", "country": "PG"},
-            {"city": "Emden", "airport": "Emden Airport", "iata": "EME", "country": "DE"},
-            {"city": "Emerald", "airport": "Emerald Airport", "iata": "EMD", "country": "AU"},
-            {"city": "Emigrant Gap", "airport": "Blue Canyon Nyack Airport", "iata": "BLU", "country": "US"},
-            {"city": "Emiliano Zapata", "airport": "El Lencero Airport", "iata": "JAL", "country": "MX"},
-            {"city": "Emirau Island", "airport": "Emirau Airport", "iata": "EMI", "country": "PG"},
-            {"city": "Emmen", "airport": "Emmen Air Base", "iata": "EML", "country": "CH"},
-            {"city": "Emmonak", "airport": "Emmonak Airport", "iata": "EMK", "country": "US"},
-            {"city": "Emo Mission", "airport": "Emo River Airstrip", "iata": "EMO", "country": "PG"},
-            {"city": "Empangeni", "airport": "Empangeni Airport", "iata": "EMG", "country": "ZA"},
-            {"city": "Emporia", "airport": "Emporia Municipal Airport", "iata": "EMP", "country": "US"},
-            {"city": "En Nahud", "airport": "En Nahud Airport", "iata": "NUD", "country": "SD"},
-            {"city": "Enarotali", "airport": "Enarotali Airport", "iata": "EWI", "country": "ID"},
-            {"city": "Encarnación", "airport": "Aeropuerto Internacional Tte. Amín Ayub González", "iata": "ENO", "country": "PY"},
-            {"city": "Ende", "airport": "H. Hasan Aroeboesman (Ende) Airport", "iata": "ENE", "country": "ID"},
-            {"city": "Eneabba", "airport": "Eneabba Airport", "iata": "ENB", "country": "AU"},
-            {"city": "Enegu", "airport": "Akanu Ibiam International Airport", "iata": "ENU", "country": "NG"},
-            {"city": "Enejit Island", "airport": "Enejit Airport", "iata": "EJT", "country": "MH"},
-            {"city": "Enfidha", "airport": "Enfidha - Hammamet International Airport", "iata": "NBE", "country": "TN"},
-            {"city": "Engati", "airport": "Engati Airstrip", "iata": "EGA", "country": "PG"},
-            {"city": "Enggano", "airport": "Enggano Airport", "iata": "ENG", "country": "ID"},
-            {"city": "Enid", "airport": "Vance Air Force Base", "iata": "END", "country": "US"},
-            {"city": "Enid", "airport": "Enid Woodring Regional Airport", "iata": "WDG", "country": "US"},
-            {"city": "Eniwetok Atoll", "airport": "Eniwetok Airport", "iata": "ENT", "country": "MH"},
-            {"city": "Enniskillen, Fermanagh and Omagh", "airport": "Enniskillen/St Angelo Airport", "iata": "ENK", "country": "GB"},
-            {"city": "Enontekio", "airport": "Enontekio Airport", "iata": "ENF", "country": "FI"},
-            {"city": "Enschede", "airport": "Twente Airport", "iata": "ENS", "country": "NL"},
-            {"city": "Ensenada", "airport": "Bahía de los Ángeles Airport", "iata": "BHL", "country": "MX"},
-            {"city": "Ensenada", "airport": "Ensenada International Airport / El Ciprés Air Base", "iata": "ESE", "country": "MX"},
-            {"city": "Enshi (Enshi)", "airport": "Enshi Xujiaping Airport", "iata": "ENH", "country": "CN"},
-            {"city": "Enterprise", "airport": "Enterprise Municipal Airport", "iata": "ETS", "country": "US"},
-            {"city": "Entrance Island", "airport": "Entrance Island Seaplane Base", "iata": "HBH", "country": "US"},
-            {"city": "Eoligarry", "airport": "Barra Airport", "iata": "BRR", "country": "GB"},
-            {"city": "Ephrata", "airport": "Ephrata Municipal Airport", "iata": "EPH", "country": "US"},
-            {"city": "Epi Island", "airport": "Valesdir Airport", "iata": "VLS", "country": "VU"},
-            {"city": "Eqalugaarsuit", "airport": "Eqalugaarsuit Heliport", "iata": "QFG", "country": "GL"},
-            {"city": "Erandique", "airport": "Erandique Airport", "iata": "EDQ", "country": "HN"},
-            {"city": "Erave", "airport": "Erave Airport", "iata": "ERE", "country": "PG"},
-            {"city": "Erbogachen", "airport": "Yerbogachen Airport", "iata": "ERG", "country": "RU"},
-            {"city": "Erdenet", "airport": "Erdenet Airport", "iata": "ERT", "country": "MN"},
-            {"city": "Erechim", "airport": "Erechim Airport", "iata": "ERM", "country": "BR"},
-            {"city": "Erenhot", "airport": "Erenhot Saiwusu International Airport", "iata": "ERL", "country": "CN"},
-            {"city": "Erfurt", "airport": "Erfurt-Weimar Airport", "iata": "ERF", "country": "DE"},
-            {"city": "Erie", "airport": "Erie International Tom Ridge Field", "iata": "ERI", "country": "US"},
-            {"city": "Erigavo", "airport": "Erigavo Airport", "iata": "ERA", "country": "SO"},
-            {"city": "Errachidia", "airport": "Moulay Ali Cherif Airport", "iata": "ERH", "country": "MA"},
-            {"city": "Errol", "airport": "Errol Airport", "iata": "ERR", "country": "US"},
-            {"city": "Erume", "airport": "Erume Airport", "iata": "ERU", "country": "PG"},
-            {"city": "Erzincan", "airport": "Erzincan Airport", "iata": "ERC", "country": "TR"},
-            {"city": "Erzurum", "airport": "Erzurum International Airport", "iata": "ERZ", "country": "TR"},
-            {"city": "Es-Sénia", "airport": "Oran Es-Sénia (Ahmed Ben Bella) International Airport", "iata": "ORN", "country": "DZ"},
-            {"city": "Esa'ala", "airport": "Esa'ala Airport", "iata": "ESA", "country": "PG"},
-            {"city": "Esbjerg", "airport": "Esbjerg Airport", "iata": "EBJ", "country": "DK"},
-            {"city": "Escanaba", "airport": "Delta County Airport", "iata": "ESC", "country": "US"},
-            {"city": "Eskilstuna", "airport": "Eskilstuna Airport", "iata": "EKT", "country": "SE"},
-            {"city": "Eskişehir", "airport": "Eskişehir Air Base", "iata": "ESK", "country": "TR"},
-            {"city": "Eskişehir", "airport": "Anadolu Airport", "iata": "AOE", "country": "TR"},
-            {"city": "Espanola", "airport": "Ohkay Owingeh Airport", "iata": "ESO", "country": "US"},
-            {"city": "Espargos", "airport": "Amílcar Cabral International Airport", "iata": "SID", "country": "CV"},
-            {"city": "Esperance", "airport": "Esperance Airport", "iata": "EPR", "country": "AU"},
-            {"city": "Esquel", "airport": "Esquel Brigadier Antonio Parodi International Airport", "iata": "EQS", "country": "AR"},
-            {"city": "Essaouira", "airport": "Essaouira-Mogador Airport", "iata": "ESU", "country": "MA"},
-            {"city": "Essen", "airport": "Essen-Mülheim Airport", "iata": "ESS", "country": "DE"},
-            {"city": "Essendon Fields", "airport": "Melbourne Essendon Airport", "iata": "MEB", "country": "AU"},
-            {"city": "Essington", "airport": "Philadelphia Seaplane Base", "iata": "PSQ", "country": "US"},
-            {"city": "Estevan", "airport": "Estevan Airport", "iata": "YEN", "country": "CA"},
-            {"city": "Estherville", "airport": "Estherville Municipal Airport", "iata": "EST", "country": "US"},
-            {"city": "Etadunna", "airport": "Etadunna Airport", "iata": "ETD", "country": "AU"},
-            {"city": "Eua Island", "airport": "Kaufana Airport", "iata": "EUA", "country": "TO"},
-            {"city": "Eufaula", "airport": "Weedon Field", "iata": "EUF", "country": "US"},
-            {"city": "Eugene", "airport": "Mahlon Sweet Field", "iata": "EUG", "country": "US"},
-            {"city": "Eunice", "airport": "Eunice Airport", "iata": "UCE", "country": "US"},
-            {"city": "Eureka", "airport": "Eureka Airport", "iata": "YEU", "country": "CA"},
-            {"city": "Eureka", "airport": "Eureka Airport", "iata": "EUE", "country": "US"},
-            {"city": "Eureka", "airport": "Murray Field", "iata": "EKA", "country": "US"},
-            {"city": "Eva Downs", "airport": "Eva Downs Airport", "iata": "EVD", "country": "AU"},
-            {"city": "Evanston", "airport": "Evanston-Uinta County Airport-Burns Field", "iata": "EVW", "country": "US"},
-            {"city": "Evansville", "airport": "Evansville Regional Airport", "iata": "EVV", "country": "US"},
-            {"city": "Eveleth", "airport": "Eveleth–Virginia Municipal Airport", "iata": "EVM", "country": "US"},
-            {"city": "Evenes", "airport": "Harstad/Narvik Airport, Evenes", "iata": "EVE", "country": "NO"},
-            {"city": "Evensk", "airport": "Severo-Evensk Airport", "iata": "SWV", "country": "RU"},
-            {"city": "Everett", "airport": "Seattle Paine Field International Airport", "iata": "PAE", "country": "US"},
-            {"city": "Ewing Township", "airport": "Trenton Mercer Airport", "iata": "TTN", "country": "US"},
-            {"city": "Ewo", "airport": "Ewo Airport", "iata": "EWO", "country": "CG"},
-            {"city": "Excursion Inlet", "airport": "Excursion Inlet Seaplane Base", "iata": "EXI", "country": "US"},
-            {"city": "Exeter, Devon", "airport": "Exeter International Airport", "iata": "EXT", "country": "GB"},
-            {"city": "Exmouth", "airport": "Exmouth Airport", "iata": "EXM", "country": "AU"},
-            {"city": "Exmouth", "airport": "Learmonth Airport", "iata": "LEA", "country": "AU"},
-            {"city": "Eyl", "airport": "Eil Airport", "iata": "HCM", "country": "SO"},
-            {"city": "Ezhou", "airport": "Ezhou Huahu Airport", "iata": "EHU", "country": "CN"},
-            {"city": "Faaite", "airport": "Faaite Airport", "iata": "FAC", "country": "PF"},
-            {"city": "Fada N'gourma", "airport": "Fada N'gourma Airport", "iata": "FNG", "country": "BF"},
-            {"city": "Fagurhólsmýri", "airport": "Fagurhólsmýri Airport", "iata": "FAG", "country": "IS"},
-            {"city": "Fahud", "airport": "Fahud Airport", "iata": "FAU", "country": "OM"},
-            {"city": "Fair Isle", "airport": "Fair Isle Airport", "iata": "FIE", "country": "GB"},
-            {"city": "Fairbanks", "airport": "Metro Field", "iata": "MTX", "country": "US"},
-            {"city": "Fairbanks", "airport": "Eielson Air Force Base", "iata": "EIL", "country": "US"},
-            {"city": "Fairbanks", "airport": "Fairbanks International Airport", "iata": "FAI", "country": "US"},
-            {"city": "Fairbanks", "airport": "Ladd Army Airfield", "iata": "FBK", "country": "US"},
-            {"city": "Fairbury", "airport": "Fairbury Municipal Airport", "iata": "FBY", "country": "US"},
-            {"city": "Fairfield", "airport": "Fairfield Municipal Airport", "iata": "FFL", "country": "US"},
-            {"city": "Fairfield", "airport": "Travis Air Force Base", "iata": "SUU", "country": "US"},
-            {"city": "Fairford, Gloucestershire", "airport": "RAF Fairford", "iata": "FFD", "country": "GB"},
-            {"city": "Fairmont", "airport": "Fairmont Municipal Airport", "iata": "FRM", "country": "US"},
-            {"city": "Fairmont Hot Springs", "airport": "Fairmont Hot Springs Airport", "iata": "YCZ", "country": "CA"},
-            {"city": "Fairview", "airport": "Fairview Airport", "iata": "ZFW", "country": "CA"},
-            {"city": "Faisalabad", "airport": "Faisalabad International Airport", "iata": "LYP", "country": "PK"},
-            {"city": "Faizabad", "airport": "Ayodhya Airport", "iata": "AYJ", "country": "IN"},
-            {"city": "Fakahina", "airport": "Fakahina Airport", "iata": "FHZ", "country": "PF"},
-            {"city": "Fakfak", "airport": "Fakfak Airport", "iata": "FKQ", "country": "ID"},
-            {"city": "Falalop Island", "airport": "Ulithi Airport", "iata": "ULI", "country": "FM"},
-            {"city": "Falam", "airport": "Surbung Airport", "iata": "SRU", "country": "MM"},
-            {"city": "Falconara Marittima (AN)", "airport": "Marche Airport", "iata": "AOI", "country": "IT"},
-            {"city": "Fallon", "airport": "Fallon Municipal Airport", "iata": "FLX", "country": "US"},
-            {"city": "Fallon", "airport": "Fallon Naval Air Station", "iata": "NFL", "country": "US"},
-            {"city": "Falmouth", "airport": "Cape Cod Coast Guard Air Station", "iata": "FMH", "country": "US"},
-            {"city": "False Island", "airport": "False Island Seaplane Base", "iata": "FAK", "country": "US"},
-            {"city": "False Pass", "airport": "False Pass Airport", "iata": "KFP", "country": "US"},
-            {"city": "Fane Mission", "airport": "Fane Airport", "iata": "FNE", "country": "PG"},
-            {"city": "Fangatau", "airport": "Fangatau Airport", "iata": "FGU", "country": "PF"},
-            {"city": "Farafangana", "airport": "Farafangana Airport", "iata": "RVA", "country": "MG"},
-            {"city": "Farah", "airport": "Farah Airport", "iata": "FAH", "country": "AF"},
-            {"city": "Faranah", "airport": "Faranah Airport", "iata": "FAA", "country": "GN"},
-            {"city": "Fare", "airport": "Huahine-Fare Airport", "iata": "HUH", "country": "PF"},
-            {"city": "Faresmaathodaa", "airport": "Faresmaathoda Airport", "iata": "FMT", "country": "MV"},
-            {"city": "Farewell", "airport": "Farewell Airport", "iata": "FWL", "country": "US"},
-            {"city": "Fargo", "airport": "Hector International Airport", "iata": "FAR", "country": "US"},
-            {"city": "Faribault", "airport": "Faribault Municipal Airport-Liz Wall Strohfus Field", "iata": "FBL", "country": "US"},
-            {"city": "Farmingdale", "airport": "Republic Airport", "iata": "FRG", "country": "US"},
-            {"city": "Farmington", "airport": "Farmington Regional Airport", "iata": "FAM", "country": "US"},
-            {"city": "Farmington", "airport": "Four Corners Regional Airport", "iata": "FMN", "country": "US"},
-            {"city": "Farnborough, Hampshire", "airport": "Farnborough Airport", "iata": "FAB", "country": "GB"},
-            {"city": "Faro", "airport": "Faro Airport", "iata": "ZFA", "country": "CA"},
-            {"city": "Faro", "airport": "Faro Airport", "iata": "FAO", "country": "PT"},
-            {"city": "Farranfore", "airport": "Kerry Airport", "iata": "KIR", "country": "IE"},
-            {"city": "Fasa", "airport": "Fasa Airport", "iata": "FAZ", "country": "IR"},
-            {"city": "Fatima Mission", "airport": "Woitape Airport", "iata": "WTP", "country": "PG"},
-            {"city": "Fauville, Eure", "airport": "Évreux-Fauville (BA 105) Air Base", "iata": "EVX", "country": "FR"},
-            {"city": "Faya-Largeau", "airport": "Faya-Largeau Airport", "iata": "FYT", "country": "TD"},
-            {"city": "Fayetteville", "airport": "Fayetteville Regional Airport - Grannis Field", "iata": "FAY", "country": "US"},
-            {"city": "Fayetteville", "airport": "Fayetteville Municipal Airport", "iata": "FYM", "country": "US"},
-            {"city": "Fayetteville", "airport": "Drake Field", "iata": "FYV", "country": "US"},
-            {"city": "Fayetteville/Springdale/Rogers", "airport": "Northwest Arkansas National Airport", "iata": "XNA", "country": "US"},
-            {"city": "Fayzabad", "airport": "Fayzabad Airport", "iata": "FBD", "country": "AF"},
-            {"city": "Fderik", "airport": "Fderik Airport", "iata": "FGD", "country": "MR"},
-            {"city": "Feijó", "airport": "Feijó Airport", "iata": "FEJ", "country": "BR"},
-            {"city": "Feira de Santana", "airport": "João Durval Carneiro Airport", "iata": "FEC", "country": "BR"},
-            {"city": "Feldkirchen bei Graz", "airport": "Graz Airport", "iata": "GRZ", "country": "AT"},
-            {"city": "Fera Island", "airport": "Fera/Maringe Airport", "iata": "FRE", "country": "SB"},
-            {"city": "Feramin", "airport": "Feramin Airport", "iata": "FRQ", "country": "PG"},
-            {"city": "Fergana", "airport": "Fergana International Airport", "iata": "FEG", "country": "UZ"},
-            {"city": "Fergus Falls", "airport": "Fergus Falls Municipal Airport - Einar Mickelson Field", "iata": "FFM", "country": "US"},
-            {"city": "Fernando de Noronha", "airport": "Fernando de Noronha Airport", "iata": "FEN", "country": "BR"},
-            {"city": "Ferno (VA)", "airport": "Milan Malpensa International Airport", "iata": "MXP", "country": "IT"},
-            {"city": "Fianarantsoa", "airport": "Fianarantsoa Airport", "iata": "WFI", "country": "MG"},
-            {"city": "Ficksburg", "airport": "Ficksburg Sentraoes Airport", "iata": "FCB", "country": "ZA"},
-            {"city": "Figari", "airport": "Figari Sud-Corse Airport", "iata": "FSC", "country": "FR"},
-            {"city": "Filadelfia", "airport": "Aeródromo de Filadelfia", "iata": "FLM", "country": "PY"},
-            {"city": "Fillmore", "airport": "Fillmore Municipal Airport", "iata": "FIL", "country": "US"},
-            {"city": "Fincha", "airport": "Fincha Airport", "iata": "FNH", "country": "ET"},
-            {"city": "Findlay", "airport": "Findlay Airport", "iata": "FDY", "country": "US"},
-            {"city": "Finke", "airport": "Finke Airport", "iata": "FIK", "country": "AU"},
-            {"city": "Firenze (FI)", "airport": "Florence Airport, Peretola", "iata": "FLR", "country": "IT"},
-            {"city": "Fishers Island", "airport": "Elizabeth Field", "iata": "FID", "country": "US"},
-            {"city": "Fitiuta Village", "airport": "Fitiuta Airport", "iata": "FTI", "country": "AS"},
-            {"city": "Flagstaff", "airport": "Flagstaff Pulliam International Airport", "iata": "FLG", "country": "US"},
-            {"city": "Flat", "airport": "Flat Airport", "iata": "FLT", "country": "US"},
-            {"city": "Flateyri", "airport": "Holt Airport", "iata": "FLI", "country": "IS"},
-            {"city": "Flensburg", "airport": "Flensburg-Schäferhaus Airport", "iata": "FLF", "country": "DE"},
-            {"city": "Flin Flon", "airport": "Flin Flon Airport", "iata": "YFO", "country": "CA"},
-            {"city": "Flint", "airport": "Bishop International Airport", "iata": "FNT", "country": "US"},
-            {"city": "Flippin", "airport": "Marion County Regional Airport", "iata": "FLP", "country": "US"},
-            {"city": "Florence", "airport": "Florence Municipal Airport", "iata": "FMU", "country": "US"},
-            {"city": "Florence", "airport": "Florence Regional Airport", "iata": "FLO", "country": "US"},
-            {"city": "Florencia", "airport": "Gustavo Artunduaga Paredes Airport", "iata": "FLA", "country": "CO"},
-            {"city": "Floriano", "airport": "Cangapara Airport", "iata": "FLB", "country": "BR"},
-            {"city": "Florianópolis", "airport": "Hercílio Luz International Airport", "iata": "FLN", "country": "BR"},
-            {"city": "Florø", "airport": "Florø Airport", "iata": "FRO", "country": "NO"},
-            {"city": "Flotta Isle", "airport": "Flotta Isle Airstrip", "iata": "FLH", "country": "GB"},
-            {"city": "Flying Fish Cove", "airport": "Christmas Island Airport", "iata": "XCH", "country": "CX"},
-            {"city": "Foggia (FG)", "airport": "Foggia Gino Lisa Airport", "iata": "FOG", "country": "IT"},
-            {"city": "Foley", "airport": "Naval Outlying Field Barin", "iata": "NHX", "country": "US"},
-            {"city": "Fomboni", "airport": "Mohéli Bandar Es Eslam Airport", "iata": "NWA", "country": "KM"},
-            {"city": "Fond du Lac", "airport": "Fond du Lac County Airport", "iata": "FLD", "country": "US"},
-            {"city": "Fond-du-Lac", "airport": "Fond-du-Lac Airport", "iata": "ZFD", "country": "CA"},
-            {"city": "Fontanges", "airport": "Fontanges Airport", "iata": "YFG", "country": "CA"},
-            {"city": "Fonte Boa", "airport": "Fonte Boa Airport", "iata": "FBA", "country": "BR"},
-            {"city": "Fontvieille", "airport": "Monaco Heliport", "iata": "MCM", "country": "MC"},
-            {"city": "Forbes", "airport": "Forbes Airport", "iata": "FRB", "country": "AU"},
-            {"city": "Forest City", "airport": "Forest City Municipal Airport", "iata": "FXY", "country": "US"},
-            {"city": "Forest Hill", "airport": "Wagga Wagga Airport", "iata": "WGA", "country": "AU"},
-            {"city": "Forestville", "airport": "Forestville Airport", "iata": "YFE", "country": "CA"},
-            {"city": "Forlì (FC)", "airport": "Forlì Luigi Ridolfi Airport", "iata": "FRL", "country": "IT"},
-            {"city": "Formosa", "airport": "Formosa National Airport", "iata": "FMA", "country": "AR"},
-            {"city": "Forrest City", "airport": "Forrest City Municipal Airport", "iata": "FCY", "country": "US"},
-            {"city": "Fort Albany", "airport": "Fort Albany Airport", "iata": "YFA", "country": "CA"},
-            {"city": "Fort Belvoir", "airport": "Davison Army Air Field", "iata": "DAA", "country": "US"},
-            {"city": "Fort Benning", "airport": "Lawson Army Air Field", "iata": "LSF", "country": "US"},
-            {"city": "Fort Bliss/El Paso", "airport": "Biggs Army Air Field (Fort Bliss)", "iata": "BIF", "country": "US"},
-            {"city": "Fort Bragg", "airport": "Fort Bragg Airport", "iata": "FOB", "country": "US"},
-            {"city": "Fort Bragg", "airport": "Simmons Army Air Field", "iata": "FBG", "country": "US"},
-            {"city": "Fort Bragg", "airport": "Pope Field", "iata": "POB", "country": "US"},
-            {"city": "Fort Bridger", "airport": "Fort Bridger Airport", "iata": "FBR", "country": "US"},
-            {"city": "Fort Campbell", "airport": "Campbell Army Airfield (Fort Campbell)", "iata": "HOP", "country": "US"},
-            {"city": "Fort Carson", "airport": "Butts AAF (Fort Carson) Air Field", "iata": "FCS", "country": "US"},
-            {"city": "Fort Cavazos", "airport": "Killeen Regional Airport / Robert Gray Army Airfield", "iata": "GRK", "country": "US"},
-            {"city": "Fort Cavazos (Killeen)", "airport": "Hood Army Air Field", "iata": "HLR", "country": "US"},
-            {"city": "Fort Chipewyan", "airport": "Fort Chipewyan Airport", "iata": "YPY", "country": "CA"},
-            {"city": "Fort Dodge", "airport": "Fort Dodge Regional Airport", "iata": "FOD", "country": "US"},
-            {"city": "Fort Frances", "airport": "Fort Frances Municipal Airport", "iata": "YAG", "country": "CA"},
-            {"city": "Fort Good Hope", "airport": "Fort Good Hope Airport", "iata": "YGH", "country": "CA"},
-            {"city": "Fort Hope", "airport": "Fort Hope Airport", "iata": "YFH", "country": "CA"},
-            {"city": "Fort Huachuca / Sierra Vista", "airport": "Sierra Vista Municipal Airport / Libby Army Air Field", "iata": "FHU", "country": "US"},
-            {"city": "Fort Indiantown Gap(Annville)", "airport": "Muir Army Air Field (Fort Indiantown Gap) Airport", "iata": "MUI", "country": "US"},
-            {"city": "Fort Irwin/Barstow", "airport": "Bicycle Lake Army Air Field", "iata": "BYS", "country": "US"},
-            {"city": "Fort Knox", "airport": "Godman Army Air Field", "iata": "FTK", "country": "US"},
-            {"city": "Fort Lauderdale", "airport": "Fort Lauderdale Hollywood International Airport", "iata": "FLL", "country": "US"},
-            {"city": "Fort Lauderdale", "airport": "Fort Lauderdale Executive Airport", "iata": "FXE", "country": "US"},
-            {"city": "Fort Leavenworth", "airport": "Sherman Army Air Field", "iata": "FLV", "country": "US"},
-            {"city": "Fort Leonard Wood", "airport": "Waynesville-St. Robert Regional Airport-Forney Field", "iata": "TBN", "country": "US"},
-            {"city": "Fort Lewis/Tacoma", "airport": "Gray Army Air Field", "iata": "GRF", "country": "US"},
-            {"city": "Fort Liard", "airport": "Fort Liard Airport", "iata": "YJF", "country": "CA"},
-            {"city": "Fort Mackay", "airport": "Fort Mackay / Horizon Airport", "iata": "HZP", "country": "CA"},
-            {"city": "Fort Madison", "airport": "Fort Madison Municipal Airport", "iata": "FMS", "country": "US"},
-            {"city": "Fort McMurray", "airport": "Fort McMurray / Mildred Lake Airport", "iata": "NML", "country": "CA"},
-            {"city": "Fort McMurray", "airport": "Fort McMurray Airport", "iata": "YMM", "country": "CA"},
-            {"city": "Fort Mcpherson", "airport": "Fort Mcpherson Airport", "iata": "ZFM", "country": "CA"},
-            {"city": "Fort Meade(Odenton)", "airport": "Tipton Airport", "iata": "FME", "country": "US"},
-            {"city": "Fort Myers", "airport": "Page Field", "iata": "FMY", "country": "US"},
-            {"city": "Fort Myers", "airport": "Southwest Florida International Airport", "iata": "RSW", "country": "US"},
-            {"city": "Fort Nelson", "airport": "Fort Nelson Airport", "iata": "YYE", "country": "CA"},
-            {"city": "Fort Pierce", "airport": "St Lucie County International Airport", "iata": "FPR", "country": "US"},
-            {"city": "Fort Polk", "airport": "Polk Army Air Field", "iata": "POE", "country": "US"},
-            {"city": "Fort Reliance", "airport": "Fort Reliance Seaplane Base", "iata": "YFL", "country": "CA"},
-            {"city": "Fort Resolution", "airport": "Fort Resolution Airport", "iata": "YFR", "country": "CA"},
-            {"city": "Fort Richardson", "airport": "Bryant Army Airfield", "iata": "FRN", "country": "US"},
-            {"city": "Fort Riley (Junction City)", "airport": "Marshall Army Air Field", "iata": "FRI", "country": "US"},
-            {"city": "Fort Rucker Ozark", "airport": "Hanchey Army (Fort Rucker) Heliport", "iata": "HEY", "country": "US"},
-            {"city": "Fort Rucker Ozark", "airport": "Lowe AHP (Fort Rucker) Heliport", "iata": "LOR", "country": "US"},
-            {"city": "Fort Rucker/Ozark", "airport": "Cairns AAF (Fort Rucker) Air Field", "iata": "OZR", "country": "US"},
-            {"city": "Fort Saint John", "airport": "Fort St John / North Peace Regional Airport", "iata": "YXJ", "country": "CA"},
-            {"city": "Fort Sandeman", "airport": "Zhob Airport", "iata": "PZH", "country": "PK"},
-            {"city": "Fort Scott", "airport": "Fort Scott Municipal Airport", "iata": "FSK", "country": "US"},
-            {"city": "Fort Severn", "airport": "Fort Severn Airport", "iata": "YER", "country": "CA"},
-            {"city": "Fort Sill", "airport": "Henry Post Army Air Field", "iata": "FSI", "country": "US"},
-            {"city": "Fort Simpson", "airport": "Fort Simpson Airport", "iata": "YFS", "country": "CA"},
-            {"city": "Fort Smith", "airport": "Fort Smith Airport", "iata": "YSM", "country": "CA"},
-            {"city": "Fort Smith", "airport": "Fort Smith Regional Airport", "iata": "FSM", "country": "US"},
-            {"city": "Fort Stockton", "airport": "Fort Stockton Pecos County Airport", "iata": "FST", "country": "US"},
-            {"city": "Fort Sumner", "airport": "Fort Sumner Municipal Airport", "iata": "FSU", "country": "US"},
-            {"city": "Fort Wayne", "airport": "Fort Wayne International Airport", "iata": "FWA", "country": "US"},
-            {"city": "Fort Wayne", "airport": "Smith Field", "iata": "SMD", "country": "US"},
-            {"city": "Fort Worth", "airport": "Perot Field/Fort Worth Alliance Airport", "iata": "AFW", "country": "US"},
-            {"city": "Fort Worth", "airport": "Fort Worth Meacham International Airport", "iata": "FTW", "country": "US"},
-            {"city": "Fort Worth", "airport": "NAS Fort Worth JRB / Carswell Field", "iata": "FWH", "country": "US"},
-            {"city": "Fort Yukon", "airport": "Fort Yukon Airport", "iata": "FYU", "country": "US"},
-            {"city": "Fort-de-France", "airport": "Martinique Aimé Césaire International Airport", "iata": "FDF", "country": "MQ"},
-            {"city": "Fortaleza", "airport": "Pinto Martins International Airport", "iata": "FOR", "country": "BR"},
-            {"city": "Fortaleza", "airport": "Alerta Airport", "iata": "ALD", "country": "PE"},
-            {"city": "Foshan (Nanhai)", "airport": "Foshan Shadi Airport", "iata": "FUO", "country": "CN"},
-            {"city": "Fossil Downs Station", "airport": "Fossil Downs Airport", "iata": "FSL", "country": "AU"},
-            {"city": "Fougamou", "airport": "Fougamou Airport", "iata": "FOU", "country": "GA"},
-            {"city": "Foula", "airport": "Foula Airfield", "iata": "FOA", "country": "GB"},
-            {"city": "Foumban", "airport": "Foumban Nkounja Airport", "iata": "FOM", "country": "CM"},
-            {"city": "Fox Glacier", "airport": "Fox Glacier Aerodrome", "iata": "FGL", "country": "NZ"},
-            {"city": "Foya", "airport": "Foya Airport", "iata": "FOY", "country": "LR"},
-            {"city": "Foz do Iguaçu", "airport": "Cataratas International Airport", "iata": "IGU", "country": "BR"},
-            {"city": "Franca", "airport": "Tenente Lund Pressoto Airport", "iata": "FRC", "country": "BR"},
-            {"city": "Franceville", "airport": "M'Vengue El Hadj Omar Bongo Ondimba International Airport", "iata": "MVB", "country": "GA"},
-            {"city": "Francisco Beltrão", "airport": "Paulo Abdala Airport", "iata": "FBE", "country": "BR"},
-            {"city": "Francistown", "airport": "P G Matante Intl", "iata": "FRW", "country": "BW"},
-            {"city": "Frankfort", "airport": "Capital City Airport", "iata": "FFT", "country": "US"},
-            {"city": "Frankfurt am Main", "airport": "Frankfurt Airport", "iata": "FRA", "country": "DE"},
-            {"city": "Frankfurt am Main (Lautzenhausen)", "airport": "Frankfurt-Hahn Airport", "iata": "HHN", "country": "DE"},
-            {"city": "Franklin", "airport": "Venango Regional Airport", "iata": "FKL", "country": "US"},
-            {"city": "Franklin", "airport": "Franklin Regional Airport", "iata": "FKN", "country": "US"},
-            {"city": "Frederick", "airport": "Frederick Municipal Airport", "iata": "FDK", "country": "US"},
-            {"city": "Frederick", "airport": "Frederick Regional Airport", "iata": "FDR", "country": "US"},
-            {"city": "Fredericton", "airport": "Fredericton Airport", "iata": "YFC", "country": "CA"},
-            {"city": "Freeland", "airport": "MBS International Airport", "iata": "MBS", "country": "US"},
-            {"city": "Freeport", "airport": "Albertus Airport", "iata": "FEP", "country": "US"},
-            {"city": "Freeport", "airport": "Grand Bahama International Airport", "iata": "FPO", "country": "BS"},
-            {"city": "Freetown", "airport": "Hastings Airport", "iata": "HGS", "country": "SL"},
-            {"city": "Freetown (Lungi-Town)", "airport": "Lungi International Airport", "iata": "FNA", "country": "SL"},
-            {"city": "Fremantle", "airport": "Fremantle Heliport", "iata": "JFM", "country": "AU"},
-            {"city": "Fremont", "airport": "Fremont Municipal Airport", "iata": "FET", "country": "US"},
-            {"city": "French Lick", "airport": "French Lick Municipal Airport", "iata": "FRH", "country": "US"},
-            {"city": "Frenchville", "airport": "Northern Aroostook Regional Airport", "iata": "WFK", "country": "US"},
-            {"city": "Fresno", "airport": "Fresno Yosemite International Airport", "iata": "FAT", "country": "US"},
-            {"city": "Fresno", "airport": "Fresno Chandler Executive Airport", "iata": "FCH", "country": "US"},
-            {"city": "Fria", "airport": "Fria Airport", "iata": "FIG", "country": "GN"},
-            {"city": "Friday Harbor", "airport": "Stuart Island Airpark", "iata": "SSW", "country": "US"},
-            {"city": "Friday Harbor", "airport": "Friday Harbor Airport", "iata": "FRD", "country": "US"},
-            {"city": "Friday Harbor", "airport": "Friday Harbor Seaplane Base", "iata": "FBS", "country": "US"},
-            {"city": "Frieda River", "airport": "Frieda River Airport", "iata": "FAQ", "country": "PG"},
-            {"city": "Friedrichshafen", "airport": "Friedrichshafen Airport", "iata": "FDH", "country": "DE"},
-            {"city": "Fritzlar", "airport": "Fritzlar Army Airfield", "iata": "FRZ", "country": "DE"},
-            {"city": "Front Royal", "airport": "Front Royal Warren County Airport", "iata": "FRR", "country": "US"},
-            {"city": "Frutillar", "airport": "El Avellano Airport", "iata": "FRT", "country": "CL"},
-            {"city": "Fryeburg", "airport": "Eastern Slopes Regional Airport", "iata": "FRY", "country": "US"},
-            {"city": "Frying Pan Island", "airport": "Parry Sound/Frying Pan Island-Sans Souci Seaplane Base", "iata": "YSI", "country": "CA"},
-            {"city": "Frégate Island", "airport": "Frégate Island Airport (UNUSABLE)", "iata": "FRK", "country": "SC"},
-            {"city": "Fuerte Olimpo", "airport": "Aeródromo de Fuerte", "iata": "OLK", "country": "PY"},
-            {"city": "Fujairah", "airport": "Fujairah International Airport", "iata": "FJR", "country": "AE"},
-            {"city": "Fukui", "airport": "Fukui Airport", "iata": "FKJ", "country": "JP"},
-            {"city": "Fukuoka", "airport": "Fukuoka Airport", "iata": "FUK", "country": "JP"},
-            {"city": "Fulleborn", "airport": "Fulleborn Airport", "iata": "FUB", "country": "PG"},
-            {"city": "Fullerton", "airport": "Fullerton Municipal Airport", "iata": "FUL", "country": "US"},
-            {"city": "Fuma", "airport": "Fuma Airport", "iata": "FUM", "country": "PG"},
-            {"city": "Funadhoo", "airport": "Funadhoo Airport", "iata": "FND", "country": "MV"},
-            {"city": "Funafuti", "airport": "Funafuti International Airport", "iata": "FUN", "country": "TV"},
-            {"city": "Funchal", "airport": "Madeira International Airport Cristiano Ronaldo", "iata": "FNC", "country": "PT"},
-            {"city": "Fundación", "airport": "Fundación Airport", "iata": "FDA", "country": "CO"},
-            {"city": "Funter Bay", "airport": "Funter Bay Seaplane Base", "iata": "FNR", "country": "US"},
-            {"city": "Fussa", "airport": "Yokota Air Base", "iata": "OKO", "country": "JP"},
-            {"city": "Futaleufu", "airport": "Futaleufú Airport", "iata": "FFU", "country": "CL"},
-            {"city": "Futuna Island", "airport": "Pointe Vele Airport", "iata": "FUT", "country": "WF"},
-            {"city": "Futuna Island", "airport": "Futuna Airport", "iata": "FTA", "country": "VU"},
-            {"city": "Fuvahmulah Island", "airport": "Fuvahmulah Airport", "iata": "FVM", "country": "MV"},
-            {"city": "Fuyuan", "airport": "Fuyuan Dongji Airport", "iata": "FYJ", "country": "CN"},
-            {"city": "Fuyun", "airport": "Fuyun Koktokay Airport", "iata": "FYN", "country": "CN"},
-            {"city": "Fuzhou (Changle)", "airport": "Fuzhou Changle International Airport", "iata": "FOC", "country": "CN"},
-            {"city": "Fuzuli", "airport": "Fuzuli International Airport", "iata": "FZL", "country": "AZ"},
-            {"city": "Fáskrúðsfjörður", "airport": "Fáskrúðsfjörður Airport", "iata": "FAS", "country": "IS"},
-            {"city": "Førde", "airport": "Førde Airport, Bringeland", "iata": "FDE", "country": "NO"},
-            {"city": "Gabala", "airport": "Gabala International Airport", "iata": "GBB", "country": "AZ"},
-            {"city": "Gabbs", "airport": "Gabbs Airport", "iata": "GAB", "country": "US"},
-            {"city": "Gaborone", "airport": "Sir Seretse Khama International Airport", "iata": "GBE", "country": "BW"},
-            {"city": "Gabriola Island", "airport": "Silva Bay Seaplane Base", "iata": "SYF", "country": "CA"},
-            {"city": "Gabès", "airport": "Gabès Matmata International Airport", "iata": "GAE", "country": "TN"},
-            {"city": "Gachsaran", "airport": "Gachsaran Airport", "iata": "GCH", "country": "IR"},
-            {"city": "Gadsden", "airport": "Northeast Alabama Regional Airport", "iata": "GAD", "country": "US"},
-            {"city": "Gafsa", "airport": "Gafsa Ksar International Airport", "iata": "GAF", "country": "TN"},
-            {"city": "Gag Island", "airport": "Gag Island Airport", "iata": "GAV", "country": "ID"},
-            {"city": "Gage", "airport": "Gage Heibeck Airport", "iata": "GAG", "country": "US"},
-            {"city": "Gagnoa", "airport": "Gagnoa Airport", "iata": "GGN", "country": "CI"},
-            {"city": "Gainesville", "airport": "Gainesville Municipal Airport", "iata": "GLE", "country": "US"},
-            {"city": "Gainesville", "airport": "Gainesville Regional Airport", "iata": "GNV", "country": "US"},
-            {"city": "Gainesville", "airport": "Lee Gilmer Memorial Airport", "iata": "GVL", "country": "US"},
-            {"city": "Gaithersburg", "airport": "Montgomery County Airpark", "iata": "GAI", "country": "US"},
-            {"city": "Galatina (LE)", "airport": "Lecce Galatina Air Base / Galatina Fortunato Cesari Airport", "iata": "LCC", "country": "IT"},
-            {"city": "Galbraith Lake", "airport": "Galbraith Lake Airport", "iata": "GBH", "country": "US"},
-            {"city": "Galcaio", "airport": "Galcaio Airport", "iata": "GLK", "country": "SO"},
-            {"city": "Galela-Celebes Island", "airport": "Gamarmalamo Airport", "iata": "GLX", "country": "ID"},
-            {"city": "Galena", "airport": "Edward G. Pitka Sr Airport", "iata": "GAL", "country": "US"},
-            {"city": "Galesburg", "airport": "Galesburg Municipal Airport", "iata": "GBG", "country": "US"},
-            {"city": "Galiano Island", "airport": "Montague Harbour Seaplane Base", "iata": "YMF", "country": "CA"},
-            {"city": "Galion", "airport": "Galion Municipal Airport", "iata": "GQQ", "country": "US"},
-            {"city": "Galle", "airport": "Koggala Airport", "iata": "KCT", "country": "LK"},
-            {"city": "Gallup", "airport": "Gallup Municipal Airport", "iata": "GUP", "country": "US"},
-            {"city": "Galveston", "airport": "Scholes International At Galveston Airport", "iata": "GLS", "country": "US"},
-            {"city": "Gamba", "airport": "Gamba Airport", "iata": "GAX", "country": "GA"},
-            {"city": "Gambela", "airport": "Gambela Airport", "iata": "GMB", "country": "ET"},
-            {"city": "Gambell", "airport": "Gambell Airport", "iata": "GAM", "country": "US"},
-            {"city": "Gamboma", "airport": "Gamboma Airport", "iata": "GMM", "country": "CG"},
-            {"city": "Gamboola", "airport": "Gamboola Airport", "iata": "GBP", "country": "AU"},
-            {"city": "Gamètì", "airport": "Rae Lakes Airport", "iata": "YRA", "country": "CA"},
-            {"city": "Gan", "airport": "Gan International Airport", "iata": "GAN", "country": "MV"},
-            {"city": "Gander", "airport": "Gander International Airport / CFB Gander", "iata": "YQX", "country": "CA"},
-            {"city": "Gangaw", "airport": "Gangaw Airport", "iata": "GAW", "country": "MM"},
-            {"city": "Gangneung", "airport": "Gangneung Airport (K-18)", "iata": "KAG", "country": "KR"},
-            {"city": "Ganja", "airport": "Ganja International Airport", "iata": "GNJ", "country": "AZ"},
-            {"city": "Gannan (Xiahe)", "airport": "Gannan Xiahe Airport", "iata": "GXH", "country": "CN"},
-            {"city": "Gannavaram", "airport": "Vijayawada Airport", "iata": "VGA", "country": "IN"},
-            {"city": "Ganzhou", "airport": "Ganzhou Ruijin Airport", "iata": "JRJ", "country": "CN"},
-            {"city": "Ganzhou", "airport": "Ganzhou Huangjin Airport", "iata": "KOW", "country": "CN"},
-            {"city": "Gaoua", "airport": "Gaoua Airport", "iata": "XGA", "country": "BF"},
-            {"city": "Garachiné", "airport": "Garachiné Airport", "iata": "GHE", "country": "PA"},
-            {"city": "Garaina", "airport": "Garaina Airport", "iata": "GAR", "country": "PG"},
-            {"city": "Garanhuns", "airport": "Garanhuns Airport", "iata": "QGP", "country": "BR"},
-            {"city": "Garbaharey", "airport": "Garbaharey Airport", "iata": "GBM", "country": "SO"},
-            {"city": "Garden City", "airport": "Garden City Regional Airport", "iata": "GCK", "country": "US"},
-            {"city": "Gardez", "airport": "Gardez Airport", "iata": "GRG", "country": "AF"},
-            {"city": "Gardner", "airport": "Gardner Municipal Airport", "iata": "GDM", "country": "US"},
-            {"city": "Gardo", "airport": "Gardo Airport", "iata": "GSR", "country": "SO"},
-            {"city": "Garissa", "airport": "Garissa Airport", "iata": "GAS", "country": "KE"},
-            {"city": "Garoua", "airport": "Garoua International Airport", "iata": "GOU", "country": "CM"},
-            {"city": "Garove Island", "airport": "Witu Airport", "iata": "WIU", "country": "PG"},
-            {"city": "Garowe", "airport": "Garowe Airport", "iata": "GGR", "country": "SO"},
-            {"city": "Gary", "airport": "Gary Chicago International Airport", "iata": "GYY", "country": "US"},
-            {"city": "Garzê (Daocheng)", "airport": "Daocheng Yading Airport", "iata": "DCY", "country": "CN"},
-            {"city": "Garzê (Garzê)", "airport": "Garze Gesar Airport", "iata": "GZG", "country": "CN"},
-            {"city": "Garzê (Kangding)", "airport": "Kangding Airport", "iata": "KGT", "country": "CN"},
-            {"city": "Gasan", "airport": "Marinduque Airport", "iata": "MRQ", "country": "PH"},
-            {"city": "Gascoyne Junction", "airport": "Gascoyne Junction Airport", "iata": "GSC", "country": "AU"},
-            {"city": "Gasmata Island", "airport": "Gasmata Island Airport", "iata": "GMI", "country": "PG"},
-            {"city": "Gaspé", "airport": "Michel-Pouliot Gaspé Airport", "iata": "YGP", "country": "CA"},
-            {"city": "Gasuke", "airport": "Gasuke Airport", "iata": "GBC", "country": "PG"},
-            {"city": "Gatineau", "airport": "Ottawa / Gatineau Airport", "iata": "YND", "country": "CA"},
-            {"city": "Gatokae", "airport": "Gatokae Aerodrome", "iata": "GTA", "country": "SB"},
-            {"city": "Gaua Island", "airport": "Gaua Island Airport", "iata": "ZGU", "country": "VU"},
-            {"city": "Gaya", "airport": "Gaya Airport", "iata": "GAY", "country": "IN"},
-            {"city": "Gaylord", "airport": "Gaylord Regional Airport", "iata": "GLR", "country": "US"},
-            {"city": "Gayndah", "airport": "Gayndah Airport", "iata": "GAH", "country": "AU"},
-            {"city": "Gaziantep", "airport": "Gaziantep International Airport", "iata": "GZT", "country": "TR"},
-            {"city": "Gaziemir", "airport": "Adnan Menderes International Airport", "iata": "ADB", "country": "TR"},
-            {"city": "Gazipaşa", "airport": "Gazipaşa-Alanya Airport", "iata": "GZP", "country": "TR"},
-            {"city": "Gbadolite", "airport": "Gbadolite Airport", "iata": "BDT", "country": "CD"},
-            {"city": "Gbangbatok", "airport": "Gbangbatok Airport", "iata": "GBK", "country": "SL"},
-            {"city": "Gdańsk", "airport": "Gdańsk Lech Wałęsa Airport", "iata": "GDN", "country": "PL"},
-            {"city": "Gebe Island", "airport": "Gebe Airport", "iata": "GEB", "country": "ID"},
-            {"city": "Geilenkirchen", "airport": "Geilenkirchen Air Base", "iata": "GKE", "country": "DE"},
-            {"city": "Geita", "airport": "Mchauru Airport", "iata": "GIT", "country": "TZ"},
-            {"city": "Geladi", "airport": "Geladi Airport", "iata": "GLC", "country": "ET"},
-            {"city": "Gelendzhik", "airport": "Gelendzhik Airport", "iata": "GDZ", "country": "RU"},
-            {"city": "Gelephu", "airport": "Gelephu Airport", "iata": "GLU", "country": "BT"},
-            {"city": "Gemena", "airport": "Gemena Airport", "iata": "GMA", "country": "CD"},
-            {"city": "Geneina", "airport": "Geneina Airport", "iata": "EGN", "country": "SD"},
-            {"city": "General Pico", "airport": "General Pico Airport", "iata": "GPO", "country": "AR"},
-            {"city": "General Roca", "airport": "Dr. Arturo H. Illia Airport", "iata": "GNR", "country": "AR"},
-            {"city": "General Santos", "airport": "General Santos International Airport", "iata": "GES", "country": "PH"},
-            {"city": "General Villegas", "airport": "General Villegas Airport", "iata": "VGS", "country": "AR"},
-            {"city": "Geneva", "airport": "Geneva Cointrin International Airport", "iata": "GVA", "country": "CH"},
-            {"city": "Genova (GE)", "airport": "Genoa Cristoforo Colombo Airport", "iata": "GOA", "country": "IT"},
-            {"city": "Gent", "airport": "Ghent/Industry Zone Heliport", "iata": "GNE", "country": "BE"},
-            {"city": "George", "airport": "George Airport", "iata": "GRJ", "country": "ZA"},
-            {"city": "George Town", "airport": "Owen Roberts International Airport", "iata": "GCM", "country": "KY"},
-            {"city": "George Town", "airport": "George Town Airport", "iata": "GEE", "country": "AU"},
-            {"city": "Georgetown", "airport": "Delaware Coastal Airport", "iata": "GED", "country": "US"},
-            {"city": "Georgetown", "airport": "Georgetown County Airport", "iata": "GGE", "country": "US"},
-            {"city": "Georgetown", "airport": "Cheddi Jagan International Airport", "iata": "GEO", "country": "GY"},
-            {"city": "Georgetown", "airport": "Georgetown Airport", "iata": "GTT", "country": "AU"},
-            {"city": "Gerald's Park", "airport": "John A. Osborne Airport", "iata": "MNI", "country": "MS"},
-            {"city": "Geraldton", "airport": "Geraldton Greenstone Regional Airport", "iata": "YGQ", "country": "CA"},
-            {"city": "Gettysburg", "airport": "Gettysburg Regional Airport", "iata": "GTY", "country": "US"},
-            {"city": "Gewoia", "airport": "Gewoia Airport", "iata": "GEW", "country": "PG"},
-            {"city": "Ghaba", "airport": "Qarn Alam Airport", "iata": "RNM", "country": "OM"},
-            {"city": "Ghadames", "airport": "Ghadames East Airport", "iata": "LTD", "country": "LY"},
-            {"city": "Ghan", "airport": "Kulgera Airport", "iata": "KGR", "country": "AU"},
-            {"city": "Ghan", "airport": "Erldunda Airport", "iata": "EDD", "country": "AU"},
-            {"city": "Ghan", "airport": "Henbury Airport", "iata": "HRY", "country": "AU"},
-            {"city": "Ghanzi", "airport": "Ghanzi Airport", "iata": "GNZ", "country": "BW"},
-            {"city": "Ghat", "airport": "Ghat Airport", "iata": "GHT", "country": "LY"},
-            {"city": "Ghaziabad", "airport": "Hindon Airport / Hindon Air Force Station", "iata": "HDO", "country": "IN"},
-            {"city": "Ghazni", "airport": "Ghazni Airport", "iata": "GZI", "country": "AF"},
-            {"city": "Ghinnir", "airport": "Ghinnir Airport", "iata": "GNN", "country": "ET"},
-            {"city": "Ghriss", "airport": "Ghriss Airport", "iata": "MUW", "country": "DZ"},
-            {"city": "Gibb", "airport": "Gibb River Airport", "iata": "GBV", "country": "AU"},
-            {"city": "Gibraltar", "airport": "Gibraltar Airport", "iata": "GIB", "country": "GI"},
-            {"city": "Giebelstadt", "airport": "Giebelstadt Airport", "iata": "GHF", "country": "DE"},
-            {"city": "Gifu", "airport": "Gifu Airport", "iata": "QGU", "country": "JP"},
-            {"city": "Gilgit", "airport": "Gilgit Airport", "iata": "GIL", "country": "PK"},
-            {"city": "Gillam", "airport": "Gillam Airport", "iata": "YGX", "country": "CA"},
-            {"city": "Gillette", "airport": "Northeast Wyoming Regional Airport", "iata": "GCC", "country": "US"},
-            {"city": "Gimli", "airport": "Gimli Industrial Park Airport", "iata": "YGM", "country": "CA"},
-            {"city": "Gimseang-ro", "airport": "Jungwon Air Base/Chungju Airport", "iata": "JWO", "country": "KR"},
-            {"city": "Ginbata", "airport": "Ginbata Airport", "iata": "GBW", "country": "AU"},
-            {"city": "Girany Amba", "airport": "Lalibela Airport", "iata": "LLI", "country": "ET"},
-            {"city": "Girardot", "airport": "Santiago Vila Airport", "iata": "GIR", "country": "CO"},
-            {"city": "Girdwood", "airport": "Girdwood-Alyeska Airport", "iata": "AQY", "country": "US"},
-            {"city": "Girona", "airport": "Girona-Costa Brava Airport", "iata": "GRO", "country": "ES"},
-            {"city": "Gisborne", "airport": "Gisborne Airport", "iata": "GIS", "country": "NZ"},
-            {"city": "Gisenyi", "airport": "Gisenyi Airport", "iata": "GYI", "country": "RW"},
-            {"city": "Gitega", "airport": "Gitega Airport", "iata": "GID", "country": "BI"},
-            {"city": "Giyani", "airport": "Giyani Airport", "iata": "GIY", "country": "ZA"},
-            {"city": "Gizo", "airport": "Nusatupe Airport", "iata": "GZO", "country": "SB"},
-            {"city": "Gjoa Haven", "airport": "Gjoa Haven Airport", "iata": "YHK", "country": "CA"},
-            {"city": "Gjögur", "airport": "Gjögur Airport", "iata": "GJR", "country": "IS"},
-            {"city": "Glacier Creek", "airport": "Glacier Creek Airport", "iata": "KGZ", "country": "US"},
-            {"city": "Gladstone", "airport": "Gladstone Airport", "iata": "GLT", "country": "AU"},
-            {"city": "Gladwin", "airport": "Gladwin Zettel Memorial Airport", "iata": "GDW", "country": "US"},
-            {"city": "Glasgow", "airport": "Glasgow Airport", "iata": "GLA", "country": "GB"},
-            {"city": "Glasgow", "airport": "Glasgow Valley County Airport Wokal Field", "iata": "GGW", "country": "US"},
-            {"city": "Glasgow", "airport": "Glasgow Municipal Airport", "iata": "GLW", "country": "US"},
-            {"city": "Glen Innes", "airport": "Glen Innes Airport", "iata": "GLI", "country": "AU"},
-            {"city": "Glendale", "airport": "Luke Air Force Base", "iata": "LUF", "country": "US"},
-            {"city": "Glendale", "airport": "Glendale Fokker Field", "iata": "GWV", "country": "US"},
-            {"city": "Glendive", "airport": "Dawson Community Airport", "iata": "GDV", "country": "US"},
-            {"city": "Glens Falls", "airport": "Floyd Bennett Memorial Airport", "iata": "GFL", "country": "US"},
-            {"city": "Glentanner Station", "airport": "Glentanner Airport", "iata": "GTN", "country": "NZ"},
-            {"city": "Glenwood Springs", "airport": "Glenwood Springs Municipal Airport", "iata": "GWS", "country": "US"},
-            {"city": "Glewice", "airport": "Solidarity Szczecin–Goleniów Airport", "iata": "SZZ", "country": "PL"},
-            {"city": "Globe", "airport": "San Carlos Apache Airport", "iata": "GLB", "country": "US"},
-            {"city": "Goba", "airport": "Robe Airport", "iata": "GOB", "country": "ET"},
-            {"city": "Gobabis", "airport": "Gobabis Airport", "iata": "GOG", "country": "NA"},
-            {"city": "Gobernador Gregores", "airport": "Gobernador Gregores Airport", "iata": "GGS", "country": "AR"},
-            {"city": "Gode", "airport": "Gode Airport", "iata": "GDE", "country": "ET"},
-            {"city": "Gods Lake Narrows", "airport": "Gods Lake Narrows Airport", "iata": "YGO", "country": "CA"},
-            {"city": "Gods River", "airport": "Gods River Airport", "iata": "ZGI", "country": "CA"},
-            {"city": "Goin", "airport": "Metz-Nancy-Lorraine Airport", "iata": "ETZ", "country": "FR"},
-            {"city": "Goiânia", "airport": "Santa Genoveva Airport", "iata": "GYN", "country": "BR"},
-            {"city": "Gold Beach", "airport": "Gold Beach Municipal Airport", "iata": "GOL", "country": "US"},
-            {"city": "Gold Coast", "airport": "Gold Coast Airport", "iata": "OOL", "country": "AU"},
-            {"city": "Golden Horn Lodge", "airport": "Golden Horn Lodge Seaplane Base", "iata": "GDH", "country": "US"},
-            {"city": "Goldsboro", "airport": "Seymour Johnson Air Force Base", "iata": "GSB", "country": "US"},
-            {"city": "Golfito", "airport": "Golfito Airport", "iata": "GLF", "country": "CR"},
-            {"city": "Golmud", "airport": "Golmud Airport", "iata": "GOQ", "country": "CN"},
-            {"city": "Golog (Maqên)", "airport": "Golog Maqên Airport", "iata": "GMQ", "country": "CN"},
-            {"city": "Golovin", "airport": "Golovin Airport", "iata": "GLV", "country": "US"},
-            {"city": "Goma", "airport": "Goma International Airport", "iata": "GOM", "country": "CD"},
-            {"city": "Gombe", "airport": "Gombe Lawanti International Airport", "iata": "GMO", "country": "NG"},
-            {"city": "Gomel", "airport": "Gomel Airport", "iata": "GME", "country": "BY"},
-            {"city": "Gonaili", "airport": "Gonaili Airport", "iata": "GOE", "country": "PG"},
-            {"city": "Gonarezhou National Park", "airport": "Mahenye Airport", "iata": "MJW", "country": "ZW"},
-            {"city": "Gondia", "airport": "Gondia Airport", "iata": "GDB", "country": "IN"},
-            {"city": "Gonghang-ro", "airport": "Yangyang International Airport", "iata": "YNY", "country": "KR"},
-            {"city": "Gooding", "airport": "Gooding Municipal Airport", "iata": "GNG", "country": "US"},
-            {"city": "Goodland", "airport": "Goodland Municipal Airport", "iata": "GLD", "country": "US"},
-            {"city": "Goodnews", "airport": "Goodnews Airport", "iata": "GNU", "country": "US"},
-            {"city": "Goodyear", "airport": "Phoenix Goodyear Airport", "iata": "GYR", "country": "US"},
-            {"city": "Goose Bay", "airport": "Goose Bay Airport", "iata": "YYR", "country": "CA"},
-            {"city": "Gora", "airport": "Gora Airstrip", "iata": "GOC", "country": "PG"},
-            {"city": "Gorakhpur", "airport": "Gorakhpur Airport", "iata": "GOP", "country": "IN"},
-            {"city": "Gordon", "airport": "Gordon Municipal Airport", "iata": "GRN", "country": "US"},
-            {"city": "Gordon Downs", "airport": "Gordon Downs Airport", "iata": "GDD", "country": "AU"},
-            {"city": "Gordonsville", "airport": "Gordonsville Municipal Airport", "iata": "GVE", "country": "US"},
-            {"city": "Gore", "airport": "Gore Airport", "iata": "GOR", "country": "ET"},
-            {"city": "Gore Bay", "airport": "Gore Bay Manitoulin Airport", "iata": "YZE", "country": "CA"},
-            {"city": "Gorgan", "airport": "Gorgan Airport", "iata": "GBT", "country": "IR"},
-            {"city": "Gorge Harbour", "airport": "Gorge Harbour Seaplane Base", "iata": "YGE", "country": "CA"},
-            {"city": "Gorkha", "airport": "Palungtar Airport", "iata": "GKH", "country": "NP"},
-            {"city": "Gorna Oryahovitsa", "airport": "Gorna Oryahovitsa Airport", "iata": "GOZ", "country": "BG"},
-            {"city": "Gornji Humac", "airport": "Brač Airport", "iata": "BWK", "country": "HR"},
-            {"city": "Gorno-Altaysk", "airport": "Gorno-Altaysk Airport", "iata": "RGK", "country": "RU"},
-            {"city": "Gorom-Gorom", "airport": "Gorom-Gorom Airport", "iata": "XGG", "country": "BF"},
-            {"city": "Goronka", "airport": "Goroka Airport", "iata": "GKA", "country": "PG"},
-            {"city": "Gorontalo-Celebes Island", "airport": "Jalaluddin Airport", "iata": "GTO", "country": "ID"},
-            {"city": "Gosford", "airport": "Somersby Airstrip", "iata": "GOS", "country": "AU"},
-            {"city": "Goshen", "airport": "Goshen Municipal Airport", "iata": "GSH", "country": "US"},
-            {"city": "Gotalalamo-Morotai Island", "airport": "Pitu Airport", "iata": "OTI", "country": "ID"},
-            {"city": "Goto", "airport": "Fukue Airport", "iata": "FUJ", "country": "JP"},
-            {"city": "Goundam", "airport": "Goundam Airport", "iata": "GUD", "country": "ML"},
-            {"city": "Governador Valadares", "airport": "Coronel Altino Machado Airport", "iata": "GVR", "country": "BR"},
-            {"city": "Governor's Harbour", "airport": "Governor's Harbour Airport", "iata": "GHB", "country": "BS"},
-            {"city": "Goya", "airport": "Goya Airport", "iata": "OYA", "country": "AR"},
-            {"city": "Gozo", "airport": "Xewkija Heliport", "iata": "GZM", "country": "MT"},
-            {"city": "Gqeberha (Port Elizabeth)", "airport": "Chief Dawid Stuurman International Airport", "iata": "PLZ", "country": "ZA"},
-            {"city": "Gracias", "airport": "Celaque Gracias Airport", "iata": "GAC", "country": "HN"},
-            {"city": "Grafton", "airport": "Clarence Valley Regional Airport", "iata": "GFN", "country": "AU"},
-            {"city": "Gran Canaria Island", "airport": "Gran Canaria Airport", "iata": "LPA", "country": "ES"},
-            {"city": "Gran Roque Island", "airport": "Los Roques Airport", "iata": "LRV", "country": "VE"},
-            {"city": "Granada", "airport": "F.G.L. Airport Granada-Jaén Airport", "iata": "GRX", "country": "ES"},
-            {"city": "Grand Canyon", "airport": "Valle Airport", "iata": "VLE", "country": "US"},
-            {"city": "Grand Canyon - Tusayan", "airport": "Grand Canyon National Park Airport", "iata": "GCN", "country": "US"},
-            {"city": "Grand Case", "airport": "Grand Case-l'Espérance Airport", "iata": "SFG", "country": "MF"},
-            {"city": "Grand Cess", "airport": "Grand Cess Airport", "iata": "GRC", "country": "LR"},
-            {"city": "Grand Forks", "airport": "Grand Forks Airport", "iata": "ZGF", "country": "CA"},
-            {"city": "Grand Forks", "airport": "Grand Forks International Airport", "iata": "GFK", "country": "US"},
-            {"city": "Grand Forks", "airport": "Grand Forks Air Force Base", "iata": "RDR", "country": "US"},
-            {"city": "Grand Island", "airport": "Central Nebraska Regional Airport", "iata": "GRI", "country": "US"},
-            {"city": "Grand Junction", "airport": "Grand Junction Regional Airport", "iata": "GJT", "country": "US"},
-            {"city": "Grand Marais", "airport": "Grand Marais Cook County Airport", "iata": "GRM", "country": "US"},
-            {"city": "Grand Rapids", "airport": "Grand Rapids Itasca Co-Gordon Newstrom field", "iata": "GPZ", "country": "US"},
-            {"city": "Grand Rapids", "airport": "Gerald R. Ford International Airport", "iata": "GRR", "country": "US"},
-            {"city": "Grand-Bourg", "airport": "Marie-Galante Airport", "iata": "GBJ", "country": "GP"},
-            {"city": "Grand-Béréby", "airport": "Nero-Mer Airport", "iata": "BBV", "country": "CI"},
-            {"city": "Grand-Santi", "airport": "Grand-Santi Airport", "iata": "GSI", "country": "GF"},
-            {"city": "Grande Anse", "airport": "La Désirade Airport", "iata": "DSD", "country": "GP"},
-            {"city": "Grande Prairie", "airport": "Grande Prairie Airport", "iata": "YQU", "country": "CA"},
-            {"city": "Grangeville", "airport": "Idaho County Airport", "iata": "IDH", "country": "US"},
-            {"city": "Granite Mountain", "airport": "Granite Mountain Air Station", "iata": "GMT", "country": "US"},
-            {"city": "Grants", "airport": "Grants-Milan Municipal Airport", "iata": "GNT", "country": "US"},
-            {"city": "Grants Pass", "airport": "Grants Pass Airport", "iata": "GTP", "country": "US"},
-            {"city": "Grantsburg", "airport": "Grantsburg Municipal Airport", "iata": "GTG", "country": "US"},
-            {"city": "Gravatai", "airport": "Gravatai Airport", "iata": "GCV", "country": "BR"},
-            {"city": "Gravenhurst", "airport": "Muskoka Airport", "iata": "YQA", "country": "CA"},
-            {"city": "Grayling", "airport": "Grayling Airport", "iata": "KGX", "country": "US"},
-            {"city": "Great Barrington", "airport": "Walter J. Koladza Airport", "iata": "GBR", "country": "US"},
-            {"city": "Great Bear Lake", "airport": "Great Bear Lake Airport", "iata": "DAS", "country": "CA"},
-            {"city": "Great Bend", "airport": "Great Bend Municipal Airport", "iata": "GBD", "country": "US"},
-            {"city": "Great Falls", "airport": "Malmstrom Air Force Base", "iata": "GFA", "country": "US"},
-            {"city": "Great Falls", "airport": "Great Falls International Airport", "iata": "GTF", "country": "US"},
-            {"city": "Great Keppel Island", "airport": "Great Keppel Is Airport", "iata": "GKL", "country": "AU"},
-            {"city": "Greeley", "airport": "Greeley–Weld County Airport", "iata": "GXY", "country": "US"},
-            {"city": "Green Bay", "airport": "Austin Straubel International Airport", "iata": "GRB", "country": "US"},
-            {"city": "Green River", "airport": "Green River Airport", "iata": "GVI", "country": "PG"},
-            {"city": "Green River", "airport": "Green River Municipal Airport", "iata": "RVR", "country": "US"},
-            {"city": "Greeneville", "airport": "Greeneville Municipal Airport", "iata": "GCY", "country": "US"},
-            {"city": "Greenfield", "airport": "Pope Field", "iata": "GFD", "country": "US"},
-            {"city": "Greensboro", "airport": "Piedmont Triad International Airport", "iata": "GSO", "country": "US"},
-            {"city": "Greenville", "airport": "Greenville/Sinoe Airport", "iata": "SNI", "country": "LR"},
-            {"city": "Greenville", "airport": "Mid Delta Regional Airport", "iata": "GLH", "country": "US"},
-            {"city": "Greenville", "airport": "Greenville Downtown Airport", "iata": "GMU", "country": "US"},
-            {"city": "Greenville", "airport": "Greenville Airport", "iata": "GRE", "country": "US"},
-            {"city": "Greenville", "airport": "Majors Airport", "iata": "GVT", "country": "US"},
-            {"city": "Greenville", "airport": "Donaldson Field Airport", "iata": "GDC", "country": "US"},
-            {"city": "Greenville", "airport": "Pitt-Greenville Airport", "iata": "PGV", "country": "US"},
-            {"city": "Greenwood", "airport": "CFB Greenwood", "iata": "YZX", "country": "CA"},
-            {"city": "Greenwood", "airport": "Greenwood County Airport", "iata": "GRD", "country": "US"},
-            {"city": "Greenwood", "airport": "Greenwood–Leflore Airport", "iata": "GWO", "country": "US"},
-            {"city": "Greer", "airport": "Greenville Spartanburg International Airport", "iata": "GSP", "country": "US"},
-            {"city": "Grenfell", "airport": "Grenfell Airport", "iata": "GFE", "country": "AU"},
-            {"city": "Grenoble", "airport": "Grenoble Alpes Isère Airport", "iata": "GNB", "country": "FR"},
-            {"city": "Greven", "airport": "Münster Osnabrück Airport", "iata": "FMO", "country": "DE"},
-            {"city": "Greybull", "airport": "South Big Horn County Airport", "iata": "GEY", "country": "US"},
-            {"city": "Griffith", "airport": "Griffith Airport", "iata": "GFF", "country": "AU"},
-            {"city": "Grimsby, Lincolnshire", "airport": "Humberside Airport", "iata": "HUY", "country": "GB"},
-            {"city": "Grise Fiord", "airport": "Grise Fiord Airport", "iata": "YGZ", "country": "CA"},
-            {"city": "Groningen", "airport": "Groningen Airport Eelde", "iata": "GRQ", "country": "NL"},
-            {"city": "Groote Eylandt", "airport": "Groote Eylandt Airport", "iata": "GTE", "country": "AU"},
-            {"city": "Grootfontein", "airport": "Grootfontein Airport", "iata": "GFY", "country": "NA"},
-            {"city": "Grosseto (GR)", "airport": "Grosseto Corrado Baccarini Air Base / Grosseto Airport", "iata": "GRS", "country": "IT"},
-            {"city": "Groton", "airport": "Groton New London Airport", "iata": "GON", "country": "US"},
-            {"city": "Grottaglie", "airport": "Taranto-Grottaglie Marcello Arlotta Airport", "iata": "TAR", "country": "IT"},
-            {"city": "Grozny", "airport": "Grozny Airport", "iata": "GRV", "country": "RU"},
-            {"city": "Grumeti Game Reserve", "airport": "Kirawira B Aerodrome", "iata": "GTZ", "country": "TZ"},
-            {"city": "Grundarfjörður", "airport": "Grundarfjörður Airport", "iata": "GUU", "country": "IS"},
-            {"city": "Grâce-Hollogne", "airport": "Liège Airport", "iata": "LGG", "country": "BE"},
-            {"city": "Grímsey", "airport": "Grímsey Airport", "iata": "GRY", "country": "IS"},
-            {"city": "Guacamayas", "airport": "Guacamayas Airport", "iata": "GCA", "country": "CO"},
-            {"city": "Guadalajara", "airport": "Guadalajara International Airport", "iata": "GDL", "country": "MX"},
-            {"city": "Guadalupe", "airport": "Guadalupe Airport", "iata": "GDP", "country": "BR"},
-            {"city": "Guajará-Mirim", "airport": "Guajará-Mirim Airport", "iata": "GJM", "country": "BR"},
-            {"city": "Gualeguaychu", "airport": "Gualeguaychu Airport", "iata": "GHU", "country": "AR"},
-            {"city": "Guamal", "airport": "Guamal Airport", "iata": "GAA", "country": "CO"},
-            {"city": "Guanaja", "airport": "La Laguna Airport", "iata": "GJA", "country": "HN"},
-            {"city": "Guanambi", "airport": "Guanambi Airport", "iata": "GNM", "country": "BR"},
-            {"city": "Guanare", "airport": "Guanare Airport", "iata": "GUQ", "country": "VE"},
-            {"city": "Guangyuan (Lizhou)", "airport": "Guangyuan Panlong Airport", "iata": "GYS", "country": "CN"},
-            {"city": "Guangzhou (Huadu)", "airport": "Guangzhou Baiyun International Airport", "iata": "CAN", "country": "CN"},
-            {"city": "Guantanamo Bay Naval Station", "airport": "Leeward Point Field", "iata": "NBW", "country": "CU"},
-            {"city": "Guantánamo", "airport": "Mariana Grajales Airport", "iata": "GAO", "country": "CU"},
-            {"city": "Guapi", "airport": "Juan Casiano Airport", "iata": "GPI", "country": "CO"},
-            {"city": "Guarapari", "airport": "Guarapari Airport", "iata": "GUZ", "country": "BR"},
-            {"city": "Guarapuava", "airport": "Tancredo Thomas de Faria Airport", "iata": "GPB", "country": "BR"},
-            {"city": "Guaratinguetá", "airport": "Edu Chaves Field", "iata": "GUJ", "country": "BR"},
-            {"city": "Guari", "airport": "Guari Airport", "iata": "GUG", "country": "PG"},
-            {"city": "Guarico", "airport": "Calabozo Airport", "iata": "CLZ", "country": "VE"},
-            {"city": "Guarujá", "airport": "Santos Nero Moura Air Base / Guarujá Airport", "iata": "SSZ", "country": "BR"},
-            {"city": "Guasdualito", "airport": "Guasdualito Airport", "iata": "GDO", "country": "VE"},
-            {"city": "Guatemala City", "airport": "La Aurora Airport", "iata": "GUA", "country": "GT"},
-            {"city": "Guayabal", "airport": "Armando Schwarck Airport", "iata": "LPJ", "country": "VE"},
-            {"city": "Guayaquil", "airport": "José Joaquín de Olmedo International Airport", "iata": "GYE", "country": "EC"},
-            {"city": "Guayaramerín", "airport": "Guayaramerín Airport", "iata": "GYA", "country": "BO"},
-            {"city": "Guaymas", "airport": "General José María Yáñez International Airport", "iata": "GYM", "country": "MX"},
-            {"city": "Guaíra", "airport": "Guaíra Airport", "iata": "GGJ", "country": "BR"},
-            {"city": "Guelmim", "airport": "Guelmim Airport", "iata": "GLN", "country": "MA"},
-            {"city": "Guemar", "airport": "Guemar Airport - مطار قمار بالوادي", "iata": "ELU", "country": "DZ"},
-            {"city": "Guiglo", "airport": "Guiglo Airport", "iata": "GGO", "country": "CI"},
-            {"city": "Guilin (Lingui)", "airport": "Guilin Liangjiang International Airport", "iata": "KWL", "country": "CN"},
-            {"city": "Guimarães", "airport": "Antônio Guerreiro Airport", "iata": "GMS", "country": "BR"},
-            {"city": "Guiyang (Nanming)", "airport": "Guiyang Longdongbao International Airport", "iata": "KWE", "country": "CN"},
-            {"city": "Gujrat", "airport": "Gujrat Airport", "iata": "GRT", "country": "PK"},
-            {"city": "Gulf Shores", "airport": "Jack Edwards National Airport", "iata": "GUF", "country": "US"},
-            {"city": "Gulfport", "airport": "Gulfport Biloxi International Airport", "iata": "GPT", "country": "US"},
-            {"city": "Gulgubip", "airport": "Gulgubip Airport", "iata": "GLP", "country": "PG"},
-            {"city": "Gulkana", "airport": "Gulkana Airport", "iata": "GKN", "country": "US"},
-            {"city": "Gulu", "airport": "Gulu Airport", "iata": "ULU", "country": "UG"},
-            {"city": "Gunim", "airport": "Kerau Airport", "iata": "KRU", "country": "PG"},
-            {"city": "Gunnison", "airport": "Gunnison Crested Butte Regional Airport", "iata": "GUC", "country": "US"},
-            {"city": "Gunsan", "airport": "Gunsan Airport / Gunsan Air Base", "iata": "KUV", "country": "KR"},
-            {"city": "Gunungsitoli", "airport": "Binaka Airport", "iata": "GNS", "country": "ID"},
-            {"city": "Gurandani", "airport": "New Gwadar International Airport", "iata": "GWD", "country": "PK"},
-            {"city": "Gurayat", "airport": "Gurayat Domestic Airport", "iata": "URY", "country": "SA"},
-            {"city": "Guriaso", "airport": "Guriaso (Keraso) Airport", "iata": "GUE", "country": "PG"},
-            {"city": "Guriel", "airport": "Guriel Airport", "iata": "GUO", "country": "SO"},
-            {"city": "Gurney", "airport": "Gurney Airport", "iata": "GUR", "country": "PG"},
-            {"city": "Gurue", "airport": "Gurue Airport", "iata": "VJQ", "country": "MZ"},
-            {"city": "Gurupi", "airport": "Gurupi Airport", "iata": "GRP", "country": "BR"},
-            {"city": "Gusap", "airport": "Gusap Airport", "iata": "GAP", "country": "PG"},
-            {"city": "Gustavia", "airport": "Saint Barthélemy - Gustaf III Airport", "iata": "SBH", "country": "BL"},
-            {"city": "Gustavus", "airport": "Bartlett Cove Seaplane Base", "iata": "BQV", "country": "US"},
-            {"city": "Gustavus", "airport": "Gustavus Airport", "iata": "GST", "country": "US"},
-            {"city": "Guthrie", "airport": "Guthrie-Edmond Regional Airport", "iata": "GOK", "country": "US"},
-            {"city": "Guwahati", "airport": "Lokpriya Gopinath Bordoloi International Airport", "iata": "GAU", "country": "IN"},
-            {"city": "Guymon", "airport": "Guymon Municipal Airport", "iata": "GUY", "country": "US"},
-            {"city": "Guyuan (Yuanzhou)", "airport": "Guyuan Liupanshan Airport", "iata": "GYU", "country": "CN"},
-            {"city": "Guzara", "airport": "Herat - Khwaja Abdullah Ansari International Airport", "iata": "HEA", "country": "AF"},
-            {"city": "Gwa", "airport": "Gwa Airport", "iata": "GWA", "country": "MM"},
-            {"city": "Gwalior", "airport": "Gwalior Airport", "iata": "GWL", "country": "IN"},
-            {"city": "Gwangju", "airport": "Gwangju Airport", "iata": "KWJ", "country": "KR"},
-            {"city": "Gwarawon", "airport": "Nankina Airport", "iata": "NKN", "country": "PG"},
-            {"city": "Gwayi River Farms", "airport": "Hwange National Park Airport", "iata": "HWN", "country": "ZW"},
-            {"city": "Gweru", "airport": "Gweru - Thornhill Air Base", "iata": "GWE", "country": "ZW"},
-            {"city": "Gwinn", "airport": "Marquette/Sawyer International Airport", "iata": "MQT", "country": "US"},
-            {"city": "Gyumri", "airport": "Shirak International Airport", "iata": "LWN", "country": "AM"},
-            {"city": "Gällivare", "airport": "Gällivare Airport", "iata": "GEV", "country": "SE"},
-            {"city": "Gävle / Sandviken", "airport": "Gävle Sandviken Airport", "iata": "GVX", "country": "SE"},
-            {"city": "Gökçeada", "airport": "Gökçeada Airport", "iata": "GKD", "country": "TR"},
-            {"city": "Göteborg", "airport": "Göteborg Landvetter Airport", "iata": "GOT", "country": "SE"},
-            {"city": "Göteborg", "airport": "Säve Airport", "iata": "GSE", "country": "SE"},
-            {"city": "Ha'il", "airport": "Ha'il Airport", "iata": "HAS", "country": "SA"},
-            {"city": "Haa Dhaalu Atoll", "airport": "Hanimaadhoo Airport", "iata": "HAQ", "country": "MV"},
-            {"city": "Habi", "airport": "Habi Airport", "iata": "HBD", "country": "PG"},
-            {"city": "Hachijojima", "airport": "Hachijojima Airport", "iata": "HAC", "country": "JP"},
-            {"city": "Hachinohe", "airport": "JMSDF Hachinohe Air Base / Hachinohe Airport", "iata": "HHE", "country": "JP"},
-            {"city": "Hadsel", "airport": "Stokmarknes Airport, Skagen", "iata": "SKN", "country": "NO"},
-            {"city": "Haelogo", "airport": "Haelogo Airport", "iata": "HEO", "country": "PG"},
-            {"city": "Hagerstown", "airport": "Hagerstown Regional Richard A Henson Field", "iata": "HGR", "country": "US"},
-            {"city": "Hagåtña", "airport": "Antonio B. Won Pat International Airport", "iata": "GUM", "country": "GU"},
-            {"city": "Haibei (Qilian)", "airport": "Haibei Qilian Airport", "iata": "HBQ", "country": "CN"},
-            {"city": "Haidong (Huzhu Tu Autonomous County)", "airport": "Xining Caojiabao International Airport", "iata": "XNN", "country": "CN"},
-            {"city": "Haifa", "airport": "Haifa International Airport", "iata": "HFA", "country": "IL"},
-            {"city": "Haikou (Meilan)", "airport": "Haikou Meilan International Airport", "iata": "HAK", "country": "CN"},
-            {"city": "Hailar", "airport": "Hulunbuir Hailar Airport", "iata": "HLD", "country": "CN"},
-            {"city": "Hailey", "airport": "Friedman Memorial Airport", "iata": "SUN", "country": "US"},
-            {"city": "Haines", "airport": "Haines Airport", "iata": "HNS", "country": "US"},
-            {"city": "Haines Junction", "airport": "Haines Junction Airport", "iata": "YHT", "country": "CA"},
-            {"city": "Haiphong (Hai An)", "airport": "Cat Bi International Airport", "iata": "HPH", "country": "VN"},
-            {"city": "Haivaro", "airport": "Haivaro Airport", "iata": "HIT", "country": "PG"},
-            {"city": "Hakkari", "airport": "Hakkari Yüksekova Airport", "iata": "YKO", "country": "TR"},
-            {"city": "Hakodate", "airport": "Hakodate Airport", "iata": "HKD", "country": "JP"},
-            {"city": "Halali", "airport": "Halali Airport", "iata": "HAL", "country": "NA"},
-            {"city": "Half Moon Bay", "airport": "Half Moon Bay Airport", "iata": "HAF", "country": "US"},
-            {"city": "Halifax", "airport": "Halifax / Stanfield International Airport", "iata": "YHZ", "country": "CA"},
-            {"city": "Halmstad", "airport": "Halmstad Airport", "iata": "HAD", "country": "SE"},
-            {"city": "Hamadan", "airport": "Hamadan Airport", "iata": "HDM", "country": "IR"},
-            {"city": "Hamar", "airport": "Hamar Lufthavn, Stavsberg", "iata": "HMR", "country": "NO"},
-            {"city": "Hambantota", "airport": "Hambantota Seaplane Base", "iata": "HBT", "country": "LK"},
-            {"city": "Hamburg", "airport": "Hamburg Helmut Schmidt Airport", "iata": "HAM", "country": "DE"},
-            {"city": "Hamburg", "airport": "Hamburg-Finkenwerder Airport", "iata": "XFW", "country": "DE"},
-            {"city": "Hami", "airport": "Hami Airport", "iata": "HMI", "country": "CN"},
-            {"city": "Hamilton", "airport": "John C. Munro Hamilton International Airport", "iata": "YHM", "country": "CA"},
-            {"city": "Hamilton", "airport": "Marion County Rankin Fite Airport", "iata": "HAB", "country": "US"},
-            {"city": "Hamilton", "airport": "Butler Co Regional Airport - Hogan Field", "iata": "HAO", "country": "US"},
-            {"city": "Hamilton", "airport": "Hamilton International Airport", "iata": "HLZ", "country": "NZ"},
-            {"city": "Hamilton", "airport": "L.F. Wade International Airport", "iata": "BDA", "country": "BM"},
-            {"city": "Hamilton Island", "airport": "Hamilton Island Airport", "iata": "HTI", "country": "AU"},
-            {"city": "Hammerfest", "airport": "Hammerfest Airport", "iata": "HFT", "country": "NO"},
-            {"city": "Hampton", "airport": "Hampton Municipal Airport", "iata": "HPT", "country": "US"},
-            {"city": "Hampton", "airport": "Langley Air Force Base", "iata": "LFI", "country": "US"},
-            {"city": "Hana", "airport": "Hana Airport", "iata": "HNM", "country": "US"},
-            {"city": "Hanak", "airport": "Red Sea International Airport", "iata": "RSI", "country": "SA"},
-            {"city": "Hanalei", "airport": "Princeville Airport", "iata": "HPV", "country": "US"},
-            {"city": "Hanamaki", "airport": "Iwate Hanamaki Airport", "iata": "HNA", "country": "JP"},
-            {"city": "Hanapepe", "airport": "Port Allen Airport", "iata": "PAK", "country": "US"},
-            {"city": "Hancock", "airport": "Houghton County Memorial Airport", "iata": "CMX", "country": "US"},
-            {"city": "Handan", "airport": "Handan Airport", "iata": "HDG", "country": "CN"},
-            {"city": "Hangzhou", "airport": "Jiande Qiandaohu General Airport", "iata": "JDE", "country": "CN"},
-            {"city": "Hangzhou", "airport": "Hangzhou Xiaoshan International Airport", "iata": "HGH", "country": "CN"},
-            {"city": "Hanksville", "airport": "Hanksville Airport", "iata": "HVE", "country": "US"},
-            {"city": "Hannover", "airport": "Hannover Airport", "iata": "HAJ", "country": "DE"},
-            {"city": "Hanoi (Soc Son)", "airport": "Noi Bai International Airport", "iata": "HAN", "country": "VN"},
-            {"city": "Hanzhong (Chenggu)", "airport": "Hanzhong Chenggu Airport", "iata": "HZG", "country": "CN"},
-            {"city": "Harare", "airport": "Robert Gabriel Mugabe International Airport", "iata": "HRE", "country": "ZW"},
-            {"city": "Harbin", "airport": "Harbin Pingfang Airport", "iata": "PFA", "country": "CN"},
-            {"city": "Harbin", "airport": "Harbin Taiping International Airport", "iata": "HRB", "country": "CN"},
-            {"city": "Hargeisa", "airport": "Egal International Airport", "iata": "HGA", "country": "SO"},
-            {"city": "Harlingen", "airport": "Valley International Airport", "iata": "HRL", "country": "US"},
-            {"city": "Harper", "airport": "Cape Palmas Airport", "iata": "CPA", "country": "LR"},
-            {"city": "Harrisburg", "airport": "Capital City Airport", "iata": "HAR", "country": "US"},
-            {"city": "Harrisburg", "airport": "Harrisburg-Raleigh Airport", "iata": "HSB", "country": "US"},
-            {"city": "Harrisburg", "airport": "Harrisburg International Airport", "iata": "MDT", "country": "US"},
-            {"city": "Harrismith", "airport": "Harrismith Airport", "iata": "HRS", "country": "ZA"},
-            {"city": "Harrison", "airport": "Boone County Airport", "iata": "HRO", "country": "US"},
-            {"city": "Hartford", "airport": "Bradley International Airport", "iata": "BDL", "country": "US"},
-            {"city": "Hartford", "airport": "Hartford Brainard Airport", "iata": "HFD", "country": "US"},
-            {"city": "Hartley Bay", "airport": "Hartley Bay Seaplane Base", "iata": "YTB", "country": "CA"},
-            {"city": "Hartsville", "airport": "Hartsville Regional Airport", "iata": "HVS", "country": "US"},
-            {"city": "Hassi Messaoud", "airport": "Hassi Messaoud-Oued Irara Krim Belkacem Airport", "iata": "HME", "country": "DZ"},
-            {"city": "Hassi R'Mel", "airport": "Hassi R'Mel Airport", "iata": "HRM", "country": "DZ"},
-            {"city": "Hastings", "airport": "Hastings Municipal Airport", "iata": "HSI", "country": "US"},
-            {"city": "Hasvik", "airport": "Hasvik Airport", "iata": "HAA", "country": "NO"},
-            {"city": "Hat Yai", "airport": "Hat Yai International Airport", "iata": "HDY", "country": "TH"},
-            {"city": "Hatchet Lake", "airport": "Hatchet Lake Airport", "iata": "YDJ", "country": "CA"},
-            {"city": "Hatgal", "airport": "Khatgal Airport", "iata": "HTM", "country": "MN"},
-            {"city": "Hato Corozal", "airport": "Hato Corozal Airport", "iata": "HTZ", "country": "CO"},
-            {"city": "Hatteras", "airport": "Billy Mitchell Airport", "iata": "HNC", "country": "US"},
-            {"city": "Hattiesburg", "airport": "Hattiesburg Bobby L Chain Municipal Airport", "iata": "HBG", "country": "US"},
-            {"city": "Hatton", "airport": "Castlereagh Lake Seaplane Base", "iata": "NUF", "country": "LK"},
-            {"city": "Hatzfeldhaven", "airport": "Hatzfeldhaven Airport", "iata": "HAZ", "country": "PG"},
-            {"city": "Havana", "airport": "José Martí International Airport", "iata": "HAV", "country": "CU"},
-            {"city": "Havana", "airport": "Playa Baracoa Airport", "iata": "UPB", "country": "CU"},
-            {"city": "Haverfordwest", "airport": "Haverfordwest Airport", "iata": "HAW", "country": "GB"},
-            {"city": "Havre", "airport": "Havre City County Airport", "iata": "HVR", "country": "US"},
-            {"city": "Havre-Saint-Pierre", "airport": "Havre-Saint-Pierre Airport", "iata": "YGV", "country": "CA"},
-            {"city": "Hawabango", "airport": "Hawabango Airport", "iata": "HWA", "country": "PG"},
-            {"city": "Hawassa", "airport": "Hawassa International Airport", "iata": "AWA", "country": "ET"},
-            {"city": "Hawi", "airport": "Upolu Airport", "iata": "UPP", "country": "US"},
-            {"city": "Hawk Inlet", "airport": "Hawk Inlet Seaplane Base", "iata": "HWI", "country": "US"},
-            {"city": "Hawker", "airport": "Wilpena Pound Airport", "iata": "HWK", "country": "AU"},
-            {"city": "Hawthorne", "airport": "Jack Northrop Field Hawthorne Municipal Airport", "iata": "HHR", "country": "US"},
-            {"city": "Hawthorne", "airport": "Hawthorne Industrial Airport", "iata": "HTH", "country": "US"},
-            {"city": "Hay River", "airport": "Hay River / Merlyn Carter Airport", "iata": "YHY", "country": "CA"},
-            {"city": "Hayden", "airport": "Yampa Valley Airport", "iata": "HDN", "country": "US"},
-            {"city": "Hayman Island", "airport": "Hayman Island Resort Seaplane Base", "iata": "HIS", "country": "AU"},
-            {"city": "Hays", "airport": "Hays Regional Airport", "iata": "HYS", "country": "US"},
-            {"city": "Hayward", "airport": "Hayward Executive Airport", "iata": "HWD", "country": "US"},
-            {"city": "Hayward", "airport": "Sawyer County Airport", "iata": "HYR", "country": "US"},
-            {"city": "Hazleton", "airport": "Hazleton Municipal Airport", "iata": "HZL", "country": "US"},
-            {"city": "Hazyview", "airport": "Hazyview Airport", "iata": "HZV", "country": "ZA"},
-            {"city": "Healy Lake", "airport": "Healy Lake Airport", "iata": "HKB", "country": "US"},
-            {"city": "Hearst", "airport": "Hearst René Fontaine Municipal Airport", "iata": "YHF", "country": "CA"},
-            {"city": "Hecate Island", "airport": "Hakai Passage Water Aerodrome", "iata": "YHC", "country": "CA"},
-            {"city": "Hechi (Jinchengjiang)", "airport": "Hechi Jinchengjiang Airport", "iata": "HCJ", "country": "CN"},
-            {"city": "Hecklingen", "airport": "Cochstedt Airport", "iata": "CSO", "country": "DE"},
-            {"city": "Hefei", "airport": "Hefei Xinqiao International Airport", "iata": "HFE", "country": "CN"},
-            {"city": "Heglig Oilfield", "airport": "Heglig Airport", "iata": "HEG", "country": "SD"},
-            {"city": "Heihe", "airport": "Nenjiang Melgen Airport", "iata": "NJJ", "country": "CN"},
-            {"city": "Heihe", "airport": "Wudalianchi Dedu Airport", "iata": "DTU", "country": "CN"},
-            {"city": "Heihe", "airport": "Heihe Aihui Airport", "iata": "HEK", "country": "CN"},
-            {"city": "Heiweni", "airport": "Heiweni Airport", "iata": "HNI", "country": "PG"},
-            {"city": "Hejing", "airport": "Hejing Bayinbuluke Airport", "iata": "HJB", "country": "CN"},
-            {"city": "Helena", "airport": "Helena Regional Airport", "iata": "HLN", "country": "US"},
-            {"city": "Helenvale", "airport": "Helenvale Airport", "iata": "HLV", "country": "AU"},
-            {"city": "Helgoland", "airport": "Helgoland-Düne Airport", "iata": "HGL", "country": "DE"},
-            {"city": "Helsinki", "airport": "Hernesaari Heliport", "iata": "HEN", "country": "FI"},
-            {"city": "Helsinki (Vantaa)", "airport": "Helsinki Vantaa Airport", "iata": "HEL", "country": "FI"},
-            {"city": "Hemavan", "airport": "Hemavan Airport", "iata": "HMV", "country": "SE"},
-            {"city": "Hemet", "airport": "Hemet Ryan Airport", "iata": "HMT", "country": "US"},
-            {"city": "Hengchun", "airport": "Hengchun Airport", "iata": "HCN", "country": "TW"},
-            {"city": "Hengyang", "airport": "Hengyang Nanyue Airport", "iata": "HNY", "country": "CN"},
-            {"city": "Heraklion", "airport": "Heraklion International Nikos Kazantzakis Airport", "iata": "HER", "country": "GR"},
-            {"city": "Herendeen Bay", "airport": "Herendeen Bay Airport", "iata": "HED", "country": "US"},
-            {"city": "Herlong", "airport": "Amedee Army Air Field", "iata": "AHC", "country": "US"},
-            {"city": "Hermannsburg (Ntaria)", "airport": "Hermannsburg Airport", "iata": "HMG", "country": "AU"},
-            {"city": "Hermiston", "airport": "Hermiston Municipal Airport", "iata": "HES", "country": "US"},
-            {"city": "Hermit Islands", "airport": "Maron Island Airport", "iata": "MNP", "country": "PG"},
-            {"city": "Hermosillo", "airport": "General Ignacio P. Garcia International Airport", "iata": "HMO", "country": "MX"},
-            {"city": "Hervey Bay", "airport": "Hervey Bay Airport", "iata": "HVB", "country": "AU"},
-            {"city": "Hesa", "airport": "Hesa Airport", "iata": "IFH", "country": "IR"},
-            {"city": "Heze (Dingtao)", "airport": "Heze Mudan Airport", "iata": "HZA", "country": "CN"},
-            {"city": "Hibbing", "airport": "Range Regional Airport", "iata": "HIB", "country": "US"},
-            {"city": "Hickory", "airport": "Hickory Regional Airport", "iata": "HKY", "country": "US"},
-            {"city": "Higashikagura", "airport": "Asahikawa Airport", "iata": "AKJ", "country": "JP"},
-            {"city": "Higashine", "airport": "Yamagata Airport", "iata": "GAJ", "country": "JP"},
-            {"city": "High Level", "airport": "High Level Airport", "iata": "YOJ", "country": "CA"},
-            {"city": "High Prairie", "airport": "High Prairie Airport", "iata": "ZHP", "country": "CA"},
-            {"city": "Highbury", "airport": "Highbury Airport", "iata": "HIG", "country": "AU"},
-            {"city": "Higuerote", "airport": "Higuerote Airport", "iata": "HGE", "country": "VE"},
-            {"city": "Hikueru", "airport": "Hikueru Airport", "iata": "HHZ", "country": "PF"},
-            {"city": "Hill City", "airport": "Hill City Municipal Airport", "iata": "HLC", "country": "US"},
-            {"city": "Hillside", "airport": "Hillside Airport", "iata": "HLL", "country": "AU"},
-            {"city": "Hilo", "airport": "Hilo International Airport", "iata": "ITO", "country": "US"},
-            {"city": "Hilton Head Island", "airport": "Hilton Head Airport", "iata": "HHH", "country": "US"},
-            {"city": "Hinesville", "airport": "MidCoast Regional Airport at Wright Army Airfield", "iata": "LIY", "country": "US"},
-            {"city": "Hinthada", "airport": "Hinthada Airport", "iata": "HEB", "country": "MM"},
-            {"city": "Hinton", "airport": "Jasper-Hinton Airport", "iata": "YJP", "country": "CA"},
-            {"city": "Hiroshima", "airport": "Hiroshima Heliport", "iata": "HIW", "country": "JP"},
-            {"city": "Hiroshima", "airport": "Hiroshima Airport", "iata": "HIJ", "country": "JP"},
-            {"city": "Hisar", "airport": "Hisar Airport", "iata": "HSS", "country": "IN"},
-            {"city": "Hiva Oa Island", "airport": "Hiva Oa-Atuona Airport", "iata": "AUQ", "country": "PF"},
-            {"city": "Hluhluwe", "airport": "Hluhluwe Airport", "iata": "HLW", "country": "ZA"},
-            {"city": "Ho Chi Minh City", "airport": "Tan Son Nhat International Airport", "iata": "SGN", "country": "VN"},
-            {"city": "Hobart", "airport": "Hobart Regional Airport", "iata": "HBR", "country": "US"},
-            {"city": "Hobart (Cambridge)", "airport": "Hobart International Airport", "iata": "HBA", "country": "AU"},
-            {"city": "Hobbs", "airport": "Lea County Regional Airport", "iata": "HOB", "country": "US"},
-            {"city": "Hobbs", "airport": "Industrial Airpark", "iata": "HBB", "country": "US"},
-            {"city": "Hobyo", "airport": "Hobyo Airport", "iata": "CMO", "country": "SO"},
-            {"city": "Hoedspruit", "airport": "Hoedspruit Air Force Base Airport", "iata": "HDS", "country": "ZA"},
-            {"city": "Hoemun-ri", "airport": "Orang (Chongjin) Airport", "iata": "RGO", "country": "KP"},
-            {"city": "Hof", "airport": "Hof-Plauen Airport", "iata": "HOQ", "country": "DE"},
-            {"city": "Hoffman", "airport": "Mackall Army Air Field", "iata": "HFF", "country": "US"},
-            {"city": "Hofuf", "airport": "Al-Ahsa International Airport", "iata": "HOF", "country": "SA"},
-            {"city": "Hogatza", "airport": "Hog River Airport", "iata": "HGZ", "country": "US"},
-            {"city": "Hohenems", "airport": "Hohenems-Dornbirn Airfield", "iata": "HOH", "country": "AT"},
-            {"city": "Hohenlockstedt", "airport": "Itzehoe Hungriger Wolf Airfield", "iata": "IZE", "country": "DE"},
-            {"city": "Hohhot", "airport": "Hohhot Baita International Airport", "iata": "HET", "country": "CN"},
-            {"city": "Hoieti", "airport": "Kamina Airport", "iata": "KMF", "country": "PG"},
-            {"city": "Hola", "airport": "Hola Airport", "iata": "HOA", "country": "KE"},
-            {"city": "Holbrook", "airport": "Holbrook Municipal Airport", "iata": "HBK", "country": "US"},
-            {"city": "Holdrege", "airport": "Brewster Field", "iata": "HDE", "country": "US"},
-            {"city": "Holguin", "airport": "Frank Pais International Airport", "iata": "HOG", "country": "CU"},
-            {"city": "Holingol", "airport": "Holingol Huolinhe Airport", "iata": "HUO", "country": "CN"},
-            {"city": "Holland", "airport": "Park Township Airport", "iata": "HLM", "country": "US"},
-            {"city": "Hollis", "airport": "Hollis Clark Bay Seaplane Base", "iata": "HYL", "country": "US"},
-            {"city": "Hollister", "airport": "Hollister Municipal Airport", "iata": "HLI", "country": "US"},
-            {"city": "Hollongi", "airport": "Itanagar Donyi Polo Hollongi Airport", "iata": "HGI", "country": "IN"},
-            {"city": "Hollywood", "airport": "North Perry Airport", "iata": "HWO", "country": "US"},
-            {"city": "Holy Cross", "airport": "Holy Cross Airport", "iata": "HCR", "country": "US"},
-            {"city": "Homer", "airport": "Homer Airport", "iata": "HOM", "country": "US"},
-            {"city": "Homestead", "airport": "Homestead ARB Airport", "iata": "HST", "country": "US"},
-            {"city": "Homeward", "airport": "Thaba Nchu Tar Airport", "iata": "TCU", "country": "ZA"},
-            {"city": "Hommalinn", "airport": "Hommalinn Airport", "iata": "HOX", "country": "MM"},
-            {"city": "Hondarribia", "airport": "San Sebastián Airport", "iata": "EAS", "country": "ES"},
-            {"city": "Hong Kong", "airport": "Hong Kong International Airport", "iata": "HKG", "country": "HK"},
-            {"city": "Honiara", "airport": "Honiara International Airport", "iata": "HIR", "country": "SB"},
-            {"city": "Honinabi", "airport": "Honinabi Airport", "iata": "HNN", "country": "PG"},
-            {"city": "Honningsvåg", "airport": "Honningsvåg Airport, Valan", "iata": "HVG", "country": "NO"},
-            {"city": "Honolulu", "airport": "Hickam Air Force Base", "iata": "HIK", "country": "US"},
-            {"city": "Honolulu, Oahu", "airport": "Daniel K Inouye International Airport", "iata": "HNL", "country": "US"},
-            {"city": "Hoogerheide", "airport": "Woensdrecht Air Base", "iata": "WOE", "country": "NL"},
-            {"city": "Hook, Hampshire", "airport": "RAF Odiham", "iata": "ODH", "country": "GB"},
-            {"city": "Hoonah", "airport": "Hoonah Airport", "iata": "HNH", "country": "US"},
-            {"city": "Hooper Bay", "airport": "Hooper Bay Airport", "iata": "HPB", "country": "US"},
-            {"city": "Hope", "airport": "Hope Airport / FVRD Regional Airpark", "iata": "YHE", "country": "CA"},
-            {"city": "Hope Bay", "airport": "Doris Lake", "iata": "JOJ", "country": "CA"},
-            {"city": "Hope Bay", "airport": "Hope Bay Aerodrome", "iata": "UZM", "country": "CA"},
-            {"city": "Hope Vale", "airport": "Hope Vale Airport", "iata": "HPE", "country": "AU"},
-            {"city": "Hopedale", "airport": "Hopedale Airport", "iata": "YHO", "country": "CA"},
-            {"city": "Hoquiam", "airport": "Bowerman Airport", "iata": "HQM", "country": "US"},
-            {"city": "Horizontina", "airport": "Walter Bündchen Airport", "iata": "HRZ", "country": "BR"},
-            {"city": "Horn", "airport": "Horn Island Airport", "iata": "HID", "country": "AU"},
-            {"city": "Hornepayne", "airport": "Hornepayne Municipal Airport", "iata": "YHN", "country": "CA"},
-            {"city": "Horta", "airport": "Horta Airport", "iata": "HOR", "country": "PT"},
-            {"city": "Hot Springs", "airport": "Memorial Field Airport", "iata": "HOT", "country": "US"},
-            {"city": "Hot Springs", "airport": "Ingalls Field", "iata": "HSP", "country": "US"},
-            {"city": "Hotan", "airport": "Hotan Airport", "iata": "HTN", "country": "CN"},
-            {"city": "Hotan (Yutian)", "airport": "Yutian Wanfang Airport", "iata": "YTW", "country": "CN"},
-            {"city": "Houghton Lake", "airport": "Roscommon County - Blodgett Memorial Airport", "iata": "HTL", "country": "US"},
-            {"city": "Houlton", "airport": "Houlton International Airport", "iata": "HUL", "country": "US"},
-            {"city": "Houma", "airport": "Houma Terrebonne Airport", "iata": "HUM", "country": "US"},
-            {"city": "Houston", "airport": "Conroe-North Houston Regional Airport", "iata": "CXO", "country": "US"},
-            {"city": "Houston", "airport": "David Wayne Hooks Memorial Airport", "iata": "DWH", "country": "US"},
-            {"city": "Houston", "airport": "Ellington Airport", "iata": "EFD", "country": "US"},
-            {"city": "Houston", "airport": "William P Hobby Airport", "iata": "HOU", "country": "US"},
-            {"city": "Houston", "airport": "George Bush Intercontinental Houston Airport", "iata": "IAH", "country": "US"},
-            {"city": "Houston", "airport": "West Houston Airport", "iata": "IWS", "country": "US"},
-            {"city": "Houston", "airport": "Sugar Land Regional Airport", "iata": "SGR", "country": "US"},
-            {"city": "Hpa-N", "airport": "Hpa-N Airport", "iata": "PAA", "country": "MM"},
-            {"city": "Hrodna", "airport": "Hrodna Airport", "iata": "GNA", "country": "BY"},
-            {"city": "Hsinchu City", "airport": "Hsinchu Air Base", "iata": "HSZ", "country": "TW"},
-            {"city": "Hua Hin", "airport": "Hua Hin Airport", "iata": "HHQ", "country": "TH"},
-            {"city": "Huai'an", "airport": "Huai'an Lianshui International Airport", "iata": "HIA", "country": "CN"},
-            {"city": "Huaihua", "airport": "Huaihua Zhijiang Airport", "iata": "HJJ", "country": "CN"},
-            {"city": "Hualien City", "airport": "Hualien Airport", "iata": "HUN", "country": "TW"},
-            {"city": "Huambo", "airport": "Albano Machado Airport", "iata": "NOV", "country": "AO"},
-            {"city": "Huangshan", "airport": "Tunxi International Airport", "iata": "TXN", "country": "CN"},
-            {"city": "Huatulco", "airport": "Bahías de Huatulco International Airport", "iata": "HUX", "country": "MX"},
-            {"city": "Huay Xai", "airport": "Ban Huoeisay Airport", "iata": "HOE", "country": "LA"},
-            {"city": "Hubli", "airport": "Hubli Airport", "iata": "HBX", "country": "IN"},
-            {"city": "Hudiksvall", "airport": "Hudiksvall Airport", "iata": "HUV", "country": "SE"},
-            {"city": "Hudson", "airport": "Columbia County Airport", "iata": "HCC", "country": "US"},
-            {"city": "Hudson Bay", "airport": "Hudson Bay Airport", "iata": "YHB", "country": "CA"},
-            {"city": "Hudson's Hope", "airport": "Hudson's Hope Airport", "iata": "YNH", "country": "CA"},
-            {"city": "Huehuetenango", "airport": "Huehuetenango Airport", "iata": "HUG", "country": "GT"},
-            {"city": "Huez, Isère", "airport": "L'Alpe d'Huez - Henri Giraud Altiport", "iata": "AHZ", "country": "FR"},
-            {"city": "Hughenden", "airport": "Hughenden Airport", "iata": "HGD", "country": "AU"},
-            {"city": "Hughes", "airport": "Hughes Airport", "iata": "HUS", "country": "US"},
-            {"city": "Hugo", "airport": "Stan Stamper Municipal Airport", "iata": "HUJ", "country": "US"},
-            {"city": "Huizhou (Pingtan)", "airport": "Huizhou Pingtan Airport", "iata": "HUZ", "country": "CN"},
-            {"city": "Hukuntsi", "airport": "Hukuntsi Airport", "iata": "HUK", "country": "BW"},
-            {"city": "Hultsfred", "airport": "Hultsfred Airport", "iata": "HLF", "country": "SE"},
-            {"city": "Huludao (Xingcheng)", "airport": "Xingcheng Air Base", "iata": "XEN", "country": "CN"},
-            {"city": "Hulunbuir", "airport": "Morin Dawa Banner Airport", "iata": "DWS", "country": "CN"},
-            {"city": "Humacao", "airport": "Dr Hermenegildo Ortiz Quinones Airport", "iata": "HUC", "country": "PR"},
-            {"city": "Humaitá", "airport": "Humaitá Airport", "iata": "HUW", "country": "BR"},
-            {"city": "Humboldt", "airport": "Humboldt Municipal Airport", "iata": "HUD", "country": "US"},
-            {"city": "Hunnan, Shenyang", "airport": "Shenyang Taoxian International Airport", "iata": "SHE", "country": "CN"},
-            {"city": "Huntingburg", "airport": "Huntingburg Airport", "iata": "HNB", "country": "US"},
-            {"city": "Huntington", "airport": "Tri-State Airport / Milton J. Ferguson Field", "iata": "HTS", "country": "US"},
-            {"city": "Huntsville", "airport": "Huntsville International Carl T Jones Field", "iata": "HSV", "country": "US"},
-            {"city": "Huntsville", "airport": "Huntsville Regional Airport", "iata": "HTV", "country": "US"},
-            {"city": "Hurghada", "airport": "Hurghada International Airport", "iata": "HRG", "country": "EG"},
-            {"city": "Huron", "airport": "Huron Regional Airport", "iata": "HON", "country": "US"},
-            {"city": "Huron Park", "airport": "Centralia / James T. Field Memorial Aerodrome", "iata": "YCE", "country": "CA"},
-            {"city": "Huslia", "airport": "Huslia Airport", "iata": "HSL", "country": "US"},
-            {"city": "Husum", "airport": "Husum-Schwesing Airport", "iata": "QHU", "country": "DE"},
-            {"city": "Hutchinson", "airport": "Hutchinson Municipal Airport", "iata": "HUT", "country": "US"},
-            {"city": "Huvadhu Atoll", "airport": "Kooddoo Airport", "iata": "GKK", "country": "MV"},
-            {"city": "Huvadhu Atoll", "airport": "Kaadedhdhoo Airport", "iata": "KDM", "country": "MV"},
-            {"city": "Huxi", "airport": "Penghu Magong Airport", "iata": "MZG", "country": "TW"},
-            {"city": "Huzhou", "airport": "Deqing Moganshan Airport", "iata": "DEQ", "country": "CN"},
-            {"city": "Huánuco", "airport": "Alferez Fap David Figueroa Fernandini Airport", "iata": "HUU", "country": "PE"},
-            {"city": "Huế", "airport": "Phu Bai International Airport", "iata": "HUI", "country": "VN"},
-            {"city": "Hwange", "airport": "Hwange (Town) Airport", "iata": "WKI", "country": "ZW"},
-            {"city": "Hyannis", "airport": "Cape Cod Gateway Airport", "iata": "HYA", "country": "US"},
-            {"city": "Hydaburg", "airport": "Hydaburg Seaplane Base", "iata": "HYG", "country": "US"},
-            {"city": "Hyder", "airport": "Hyder Seaplane Base", "iata": "WHD", "country": "US"},
-            {"city": "Hyderabad", "airport": "Hyderabad Airport", "iata": "HDD", "country": "PK"},
-            {"city": "Hyderabad", "airport": "Rajiv Gandhi International Airport", "iata": "HYD", "country": "IN"},
-            {"city": "Hyderabad", "airport": "Begumpet Airport", "iata": "BPM", "country": "IN"},
-            {"city": "Hyvinkää", "airport": "Hyvinkää Airfield", "iata": "HYV", "country": "FI"},
-            {"city": "Hyères, Var", "airport": "Toulon-Hyères Airport", "iata": "TLN", "country": "FR"},
-            {"city": "Hólmavík", "airport": "Hólmavík Airport", "iata": "HVK", "country": "IS"},
-            {"city": "Höfn", "airport": "Hornafjörður Airport", "iata": "HFN", "country": "IS"},
-            {"city": "Hörselberg-Hainich", "airport": "Eisenach-Kindel Airport", "iata": "EIB", "country": "DE"},
-            {"city": "Húsavík", "airport": "Húsavík Airport", "iata": "HZK", "country": "IS"},
-            {"city": "Hīt", "airport": "Al Asad Air Base", "iata": "IQA", "country": "IQ"},
-            {"city": "I Fadang, Saipan", "airport": "Saipan International Airport", "iata": "SPN", "country": "MP"},
-            {"city": "IAF Camp", "airport": "Car Nicobar Air Force Base", "iata": "CBD", "country": "IN"},
-            {"city": "Ialibu", "airport": "Ialibu Airport", "iata": "IAL", "country": "PG"},
-            {"city": "Iamalele, Fergusson Island", "airport": "Iamalele Airport", "iata": "IMA", "country": "PG"},
-            {"city": "Iaşi", "airport": "Iaşi Airport", "iata": "IAS", "country": "RO"},
-            {"city": "Ibadan", "airport": "Ibadan Airport", "iata": "IBA", "country": "NG"},
-            {"city": "Ibagué", "airport": "Perales Airport", "iata": "IBE", "country": "CO"},
-            {"city": "Iberia", "airport": "Iberia Airport", "iata": "IBP", "country": "PE"},
-            {"city": "Ibiza (Eivissa)", "airport": "Ibiza Airport", "iata": "IBZ", "country": "ES"},
-            {"city": "Ibo", "airport": "Ibo Airport", "iata": "IBO", "country": "MZ"},
-            {"city": "Iboki", "airport": "Iboki Airport", "iata": "IBI", "country": "PG"},
-            {"city": "Icy Bay", "airport": "Icy Bay Airport", "iata": "ICY", "country": "US"},
-            {"city": "Ida Grove", "airport": "Ida Grove Municipal Airport", "iata": "IDG", "country": "US"},
-            {"city": "Idaho Falls", "airport": "Idaho Falls Regional Airport", "iata": "IDA", "country": "US"},
-            {"city": "Idiofa", "airport": "Idiofa Airport", "iata": "IDF", "country": "CD"},
-            {"city": "Idre", "airport": "Idre Airport", "iata": "IDB", "country": "SE"},
-            {"city": "Ie", "airport": "Iejima Airport", "iata": "IEJ", "country": "JP"},
-            {"city": "Ifuru Island", "airport": "Ifuru Airport", "iata": "IFU", "country": "MV"},
-            {"city": "Igaliku", "airport": "Igaliku Heliport", "iata": "QFX", "country": "GL"},
-            {"city": "Igarka", "airport": "Igarka Airport", "iata": "IAA", "country": "RU"},
-            {"city": "Iginniarfik", "airport": "Iginniarfik Heliport", "iata": "QFI", "country": "GL"},
-            {"city": "Igiugig", "airport": "Igiugig Airport", "iata": "IGG", "country": "US"},
-            {"city": "Igloolik", "airport": "Igloolik Airport", "iata": "YGT", "country": "CA"},
-            {"city": "Ignace", "airport": "Ignace Municipal Airport", "iata": "ZUC", "country": "CA"},
-            {"city": "Iguatu", "airport": "Iguatu Airport", "iata": "QIG", "country": "BR"},
-            {"city": "Iguela", "airport": "Tchongorove Airport", "iata": "IGE", "country": "GA"},
-            {"city": "Ihosy", "airport": "Ihosy Airport", "iata": "IHO", "country": "MG"},
-            {"city": "Ihu", "airport": "Ihu Airport", "iata": "IHU", "country": "PG"},
-            {"city": "Ijuí", "airport": "João Batista Bos Filho Airport", "iata": "IJU", "country": "BR"},
-            {"city": "Ikamiut", "airport": "Ikamiut Heliport", "iata": "QJI", "country": "GL"},
-            {"city": "Ikaria Island", "airport": "Ikaria Airport", "iata": "JIK", "country": "GR"},
-            {"city": "Ikela", "airport": "Ikela Airport", "iata": "IKL", "country": "CD"},
-            {"city": "Ikerasak", "airport": "Ikerasak Heliport", "iata": "IKE", "country": "GL"},
-            {"city": "Ikerassaarsuk", "airport": "Ikerassaarsuk Heliport", "iata": "QRY", "country": "GL"},
-            {"city": "Iki", "airport": "Iki Airport", "iata": "IKI", "country": "JP"},
-            {"city": "Ilaga", "airport": "Ilaga Airport", "iata": "ILA", "country": "ID"},
-            {"city": "Ilaka", "airport": "Atsinanana Airport", "iata": "ILK", "country": "MG"},
-            {"city": "Ilam", "airport": "Ilam Airport", "iata": "IIL", "country": "IR"},
-            {"city": "Ilebo", "airport": "Ilebo Airport", "iata": "PFR", "country": "CD"},
-            {"city": "Ilford", "airport": "Ilford Airport", "iata": "ILF", "country": "CA"},
-            {"city": "Ilhéus", "airport": "Bahia - Jorge Amado Airport", "iata": "IOS", "country": "BR"},
-            {"city": "Ili (Yining / Ghulja)", "airport": "Yining Airport", "iata": "YIN", "country": "CN"},
-            {"city": "Iliamna", "airport": "Iliamna Airport", "iata": "ILI", "country": "US"},
-            {"city": "Ilimanaq", "airport": "Ilimanaq Heliport", "iata": "XIQ", "country": "GL"},
-            {"city": "Ilinden", "airport": "Skopje International Airport", "iata": "SKP", "country": "MK"},
-            {"city": "Illesheim", "airport": "Illesheim Army Heliport", "iata": "ILH", "country": "DE"},
-            {"city": "Illizi", "airport": "Illizi Takhamalt Airport", "iata": "VVZ", "country": "DZ"},
-            {"city": "Illorsuit", "airport": "Illorsuit Heliport", "iata": "IOT", "country": "GL"},
-            {"city": "Ilo", "airport": "General Jorge Fernandez Maldon Airport", "iata": "ILQ", "country": "PE"},
-            {"city": "Ilorin", "airport": "Ilorin International Airport", "iata": "ILR", "country": "NG"},
-            {"city": "Ilu", "airport": "Ilu Airport", "iata": "IUL", "country": "ID"},
-            {"city": "Ilulissat", "airport": "Ilulissat Airport", "iata": "JAV", "country": "GL"},
-            {"city": "Imam Hassan", "airport": "Bahregan Airport", "iata": "IAQ", "country": "IR"},
-            {"city": "Imane", "airport": "Imane Airport", "iata": "IMN", "country": "PG"},
-            {"city": "Imbaimadai", "airport": "Imbaimadai Airport", "iata": "IMB", "country": "GY"},
-            {"city": "Immokalee", "airport": "Immokalee Regional Airport", "iata": "IMM", "country": "US"},
-            {"city": "Imonda", "airport": "Imonda Airport", "iata": "IMD", "country": "PG"},
-            {"city": "Imperatriz", "airport": "Prefeito Renato Moreira Airport", "iata": "IMP", "country": "BR"},
-            {"city": "Imperial", "airport": "Imperial Municipal Airport", "iata": "IML", "country": "US"},
-            {"city": "Imperial", "airport": "Imperial County Airport", "iata": "IPL", "country": "US"},
-            {"city": "Imperial Beach", "airport": "Naval Outlying Field Imperial Beach (Ream Field)", "iata": "NRS", "country": "US"},
-            {"city": "Impfondo", "airport": "Impfondo Airport", "iata": "ION", "country": "CG"},
-            {"city": "Imphal", "airport": "Imphal Airport", "iata": "IMF", "country": "IN"},
-            {"city": "In Aménas", "airport": "Zarzaitine - In Aménas Airport", "iata": "IAM", "country": "DZ"},
-            {"city": "In Guezzam", "airport": "In Guezzam Airport", "iata": "INF", "country": "DZ"},
-            {"city": "In Salah", "airport": "In Salah Airport", "iata": "INZ", "country": "DZ"},
-            {"city": "Inanwatan", "airport": "Inanwatan Airport", "iata": "INX", "country": "ID"},
-            {"city": "Indagen", "airport": "Indagen Airport", "iata": "IDN", "country": "PG"},
-            {"city": "Independence", "airport": "Independence Airport", "iata": "INB", "country": "BZ"},
-            {"city": "Independence", "airport": "Independence Municipal Airport", "iata": "IDP", "country": "US"},
-            {"city": "Indian Springs", "airport": "Creech Air Force Base", "iata": "INS", "country": "US"},
-            {"city": "Indiana", "airport": "Indiana County–Jimmy Stewart Airport", "iata": "IDI", "country": "US"},
-            {"city": "Indianapolis", "airport": "Indianapolis International Airport", "iata": "IND", "country": "US"},
-            {"city": "Indore", "airport": "Devi Ahilyabai Holkar Airport", "iata": "IDR", "country": "IN"},
-            {"city": "Indulkana", "airport": "Indulkana Airport", "iata": "IDK", "country": "AU"},
-            {"city": "Ingeniero Jacobacci", "airport": "Ingeniero Jacobacci - Captain H R Bordón Airport", "iata": "IGB", "country": "AR"},
-            {"city": "Inhaca", "airport": "Inhaca Airport", "iata": "IHC", "country": "MZ"},
-            {"city": "Inhambane", "airport": "Inhambane Airport", "iata": "INH", "country": "MZ"},
-            {"city": "Inhaminga", "airport": "Inhaminga Airport", "iata": "IMG", "country": "MZ"},
-            {"city": "Inis Meáin", "airport": "Inishmaan Aerodrome", "iata": "IIA", "country": "IE"},
-            {"city": "Inis Mór", "airport": "Inishmore Aerodrome", "iata": "IOR", "country": "IE"},
-            {"city": "Inis Oírr", "airport": "Inisheer Aerodrome", "iata": "INQ", "country": "IE"},
-            {"city": "Injune", "airport": "Injune Airport", "iata": "INJ", "country": "AU"},
-            {"city": "Inkerman", "airport": "Inkerman Airport", "iata": "IKP", "country": "AU"},
-            {"city": "Innarsuit", "airport": "Innarsuit Heliport", "iata": "IUI", "country": "GL"},
-            {"city": "Innsbruck", "airport": "Innsbruck Airport", "iata": "INN", "country": "AT"},
-            {"city": "Inongo", "airport": "Inongo Airport", "iata": "INO", "country": "CD"},
-            {"city": "Inta", "airport": "Inta Airport", "iata": "INA", "country": "RU"},
-            {"city": "International Falls", "airport": "Falls International Airport", "iata": "INL", "country": "US"},
-            {"city": "Inukjuak", "airport": "Inukjuak Airport", "iata": "YPH", "country": "CA"},
-            {"city": "Inuvik", "airport": "Inuvik Mike Zubko Airport", "iata": "YEV", "country": "CA"},
-            {"city": "Invercargill", "airport": "Invercargill Airport", "iata": "IVC", "country": "NZ"},
-            {"city": "Inverell", "airport": "Inverell Airport", "iata": "IVR", "country": "AU"},
-            {"city": "Inverin", "airport": "Connemara Regional Airport", "iata": "NNR", "country": "IE"},
-            {"city": "Inverness", "airport": "Inverness Airport", "iata": "INV", "country": "GB"},
-            {"city": "Inverway", "airport": "Inverway Airport", "iata": "IVW", "country": "AU"},
-            {"city": "Inyati", "airport": "Inyati Airport", "iata": "INY", "country": "ZA"},
-            {"city": "Inyokern", "airport": "Inyokern Airport", "iata": "IYK", "country": "US"},
-            {"city": "Ioannina", "airport": "Ioannina King Pyrrhus National Airport", "iata": "IOA", "country": "GR"},
-            {"city": "Iokea", "airport": "Iokea Airport", "iata": "IOK", "country": "PG"},
-            {"city": "Ioma", "airport": "Ioma Airport", "iata": "IOP", "country": "PG"},
-            {"city": "Iowa City", "airport": "Iowa City Municipal Airport", "iata": "IOW", "country": "US"},
-            {"city": "Iowa Falls", "airport": "Iowa Falls Municipal Airport", "iata": "IFA", "country": "US"},
-            {"city": "Ipatinga", "airport": "Usiminas Airport", "iata": "IPN", "country": "BR"},
-            {"city": "Ipiales", "airport": "San Luis Airport", "iata": "IPI", "country": "CO"},
-            {"city": "Ipiaú", "airport": "Ipiaú Airport", "iata": "IPU", "country": "BR"},
-            {"city": "Ipil", "airport": "Ipil Airport", "iata": "IPE", "country": "PH"},
-            {"city": "Ipoh", "airport": "Sultan Azlan Shah Airport", "iata": "IPH", "country": "MY"},
-            {"city": "Ipota", "airport": "Ipota Airport", "iata": "IPA", "country": "VU"},
-            {"city": "Iqaluit", "airport": "Iqaluit Airport", "iata": "YFB", "country": "CA"},
-            {"city": "Iquique", "airport": "Diego Aracena Airport", "iata": "IQQ", "country": "CL"},
-            {"city": "Iquitos", "airport": "Coronel FAP Francisco Secada Vignetta International Airport", "iata": "IQT", "country": "PE"},
-            {"city": "Iraan", "airport": "Iraan Municipal Airport", "iata": "IRB", "country": "US"},
-            {"city": "Iranamadu", "airport": "Iranamadu Seaplane Base", "iata": "IRU", "country": "LK"},
-            {"city": "Iranshahr", "airport": "Iranshahr Airport", "iata": "IHR", "country": "IR"},
-            {"city": "Irecê", "airport": "Irecê Airport", "iata": "IRE", "country": "BR"},
-            {"city": "Iriona", "airport": "Iriona Airport", "iata": "IRN", "country": "HN"},
-            {"city": "Irkutsk", "airport": "Irkutsk International Airport", "iata": "IKT", "country": "RU"},
-            {"city": "Ironstone", "airport": "Penneshaw Airport", "iata": "PEA", "country": "AU"},
-            {"city": "Ironwood", "airport": "Gogebic Iron County Airport", "iata": "IWD", "country": "US"},
-            {"city": "Isalo", "airport": "Relais de la Reine Airport", "iata": "RLR", "country": "MG"},
-            {"city": "Iscuandé", "airport": "Santa Bárbara Airport", "iata": "ISD", "country": "CO"},
-            {"city": "Isfahan", "airport": "Isfahan Shahid Beheshti International Airport", "iata": "IFN", "country": "IR"},
-            {"city": "Ishigaki", "airport": "New Ishigaki Airport", "iata": "ISG", "country": "JP"},
-            {"city": "Ishurdi", "airport": "Ishurdi Airport", "iata": "IRD", "country": "BD"},
-            {"city": "Isiro", "airport": "Matari Airport", "iata": "IRP", "country": "CD"},
-            {"city": "Iskushuban", "airport": "Iskushuban Airport", "iata": "CMS", "country": "SO"},
-            {"city": "Isla Baltra", "airport": "Seymour Galapagos Ecological Airport", "iata": "GPS", "country": "EC"},
-            {"city": "Isla Colón", "airport": "Bocas del Toro International Airport", "iata": "BOC", "country": "PA"},
-            {"city": "Isla De Pascua", "airport": "Mataveri Airport", "iata": "IPC", "country": "CL"},
-            {"city": "Isla Lorenzo Bello", "airport": "Ailigandí Airport", "iata": "AIL", "country": "PA"},
-            {"city": "Isla Margarita", "airport": "Del Caribe Santiago Mariño International Airport", "iata": "PMV", "country": "VE"},
-            {"city": "Isla Mujeres", "airport": "Isla Mujeres National Airport", "iata": "ISJ", "country": "MX"},
-            {"city": "Isla Viveros", "airport": "Viveros Island Airport", "iata": "IVI", "country": "PA"},
-            {"city": "Isla de Coche", "airport": "Andrés Miguel Salazar Marcano Airport", "iata": "ICC", "country": "VE"},
-            {"city": "Isla de la Juventud", "airport": "Siguanea Airport", "iata": "SZJ", "country": "CU"},
-            {"city": "Isla del Rey", "airport": "San Miguel Airport", "iata": "NMG", "country": "PA"},
-            {"city": "Island Lake", "airport": "Island Lake Airport", "iata": "YIV", "country": "CA"},
-            {"city": "Isle of Islay, Argyll and Bute", "airport": "Islay Airport", "iata": "ILY", "country": "GB"},
-            {"city": "Islip", "airport": "Long Island Mac Arthur Airport", "iata": "ISP", "country": "US"},
-            {"city": "Isola di Capo Rizzuto (KR)", "airport": "Crotone Sant'Anna Pythagoras Airport", "iata": "CRV", "country": "IT"},
-            {"city": "Isortoq", "airport": "Isortoq Heliport", "iata": "IOQ", "country": "GL"},
-            {"city": "Isparta", "airport": "Süleyman Demirel International Airport", "iata": "ISE", "country": "TR"},
-            {"city": "Itabuna", "airport": "Tertuliano Guedes de Pinho Airport", "iata": "ITN", "country": "BR"},
-            {"city": "Itacoatiara", "airport": "Itacoatiara Airport", "iata": "ITA", "country": "BR"},
-            {"city": "Itaituba", "airport": "Itaituba Airport", "iata": "ITB", "country": "BR"},
-            {"city": "Itajaí", "airport": "Campo Comandantes Airport", "iata": "ITJ", "country": "BR"},
-            {"city": "Itambacuri", "airport": "Fazenda Americana Airport", "iata": "ITI", "country": "BR"},
-            {"city": "Itanhaém", "airport": "Itanhaém Airport", "iata": "JTN", "country": "BR"},
-            {"city": "Itaperuna", "airport": "Itaperuna Airport", "iata": "ITP", "country": "BR"},
-            {"city": "Itapetinga", "airport": "Itapetinga Airport", "iata": "QIT", "country": "BR"},
-            {"city": "Itaqui", "airport": "Itaqui Airport", "iata": "ITQ", "country": "BR"},
-            {"city": "Itenes", "airport": "Huacaraje Airport", "iata": "BVK", "country": "BO"},
-            {"city": "Ithaca", "airport": "Ithaca Tompkins Regional Airport", "iata": "ITH", "country": "US"},
-            {"city": "Itokama", "airport": "Itokama Airport", "iata": "ITK", "country": "PG"},
-            {"city": "Ittoqqortoormiit", "airport": "Ittoqqortoormiit Heliport", "iata": "OBY", "country": "GL"},
-            {"city": "Ituberá", "airport": "Ituberá Airport", "iata": "ITE", "country": "BR"},
-            {"city": "Itumbiara", "airport": "Francisco Vilela do Amaral Airport", "iata": "ITR", "country": "BR"},
-            {"city": "Ivalo", "airport": "Ivalo Airport", "iata": "IVL", "country": "FI"},
-            {"city": "Ivano-Frankivsk", "airport": "Ivano-Frankivsk International Airport", "iata": "IFO", "country": "UA"},
-            {"city": "Ivanof Bay", "airport": "Ivanof Bay Seaplane Base", "iata": "KIB", "country": "US"},
-            {"city": "Ivanovo", "airport": "Ivanovo South Airport", "iata": "IWA", "country": "RU"},
-            {"city": "Ivujivik", "airport": "Ivujivik Airport", "iata": "YIK", "country": "CA"},
-            {"city": "Iwakuni", "airport": "Iwakuni Kintaikyo Airport / Marine Corps Air Station Iwakuni", "iata": "IWK", "country": "JP"},
-            {"city": "Ixtapa", "airport": "Ixtapa-Zihuatanejo International Airport", "iata": "ZIH", "country": "MX"},
-            {"city": "Ixtepec", "airport": "General Antonio Cárdenas Rodríguez National Airport / Ixtepec Air Base", "iata": "IZT", "country": "MX"},
-            {"city": "Izhevsk", "airport": "Izhevsk Airport", "iata": "IJK", "country": "RU"},
-            {"city": "Izu Oshima", "airport": "Oshima Airport", "iata": "OIM", "country": "JP"},
-            {"city": "Izumo", "airport": "Izumo Enmusubi Airport", "iata": "IZO", "country": "JP"},
-            {"city": "Iğdır", "airport": "Iğdır Airport", "iata": "IGD", "country": "TR"},
-            {"city": "Jabalpur", "airport": "Jabalpur Airport", "iata": "JLR", "country": "IN"},
-            {"city": "Jabor Jaluit Atoll", "airport": "Jaluit Airport", "iata": "UIT", "country": "MH"},
-            {"city": "Jacareacanga", "airport": "Jacareacanga Airport", "iata": "JCR", "country": "BR"},
-            {"city": "Jackpot", "airport": "Jackpot Airport/Hayden Field", "iata": "KPT", "country": "US"},
-            {"city": "Jackson", "airport": "Hawkins Field", "iata": "HKS", "country": "US"},
-            {"city": "Jackson", "airport": "Jackson Hole Airport", "iata": "JAC", "country": "US"},
-            {"city": "Jackson", "airport": "Jackson-Medgar Wiley Evers International Airport", "iata": "JAN", "country": "US"},
-            {"city": "Jackson", "airport": "Jackson County Airport/Reynolds Field", "iata": "JXN", "country": "US"},
-            {"city": "Jackson", "airport": "Jackson Municipal Airport", "iata": "MJQ", "country": "US"},
-            {"city": "Jackson", "airport": "McKellar-Sipes Regional Airport", "iata": "MKL", "country": "US"},
-            {"city": "Jacksonville", "airport": "Jacksonville Executive at Craig Airport", "iata": "CRG", "country": "US"},
-            {"city": "Jacksonville", "airport": "Jacksonville Municipal Airport", "iata": "IJX", "country": "US"},
-            {"city": "Jacksonville", "airport": "Jacksonville International Airport", "iata": "JAX", "country": "US"},
-            {"city": "Jacksonville", "airport": "Cherokee County Airport", "iata": "JKV", "country": "US"},
-            {"city": "Jacksonville", "airport": "Little Rock Air Force Base", "iata": "LRF", "country": "US"},
-            {"city": "Jacksonville", "airport": "Whitehouse Naval Outlying Field", "iata": "NEN", "country": "US"},
-            {"city": "Jacksonville", "airport": "Jacksonville Naval Air Station (Towers Field)", "iata": "NIP", "country": "US"},
-            {"city": "Jacksonville", "airport": "Naval Station Mayport / Admiral David L McDonald Field", "iata": "NRB", "country": "US"},
-            {"city": "Jacksonville", "airport": "Cecil Airport", "iata": "VQQ", "country": "US"},
-            {"city": "Jacmel", "airport": "Jacmel Airport", "iata": "JAK", "country": "HT"},
-            {"city": "Jacobabad", "airport": "Shahbaz Air Base", "iata": "JAG", "country": "PK"},
-            {"city": "Jacobina", "airport": "Jacobina Airport", "iata": "JCM", "country": "BR"},
-            {"city": "Jacquinot Bay", "airport": "Jacquinot Bay Airport", "iata": "JAQ", "country": "PG"},
-            {"city": "Jaffna", "airport": "Jaffna International Airport", "iata": "JAF", "country": "LK"},
-            {"city": "Jaffrey", "airport": "Jaffrey Airfield Silver Ranch Airport", "iata": "AFN", "country": "US"},
-            {"city": "Jagdalpur", "airport": "Jagdalpur Airport", "iata": "JGB", "country": "IN"},
-            {"city": "Jagel", "airport": "Schleswig Air Base", "iata": "WBG", "country": "DE"},
-            {"city": "Jaguaruna", "airport": "Humberto Ghizzo Bortoluzzi Regional Airport", "iata": "JJG", "country": "BR"},
-            {"city": "Jahrom", "airport": "Jahrom Airport", "iata": "JAR", "country": "IR"},
-            {"city": "Jaipur", "airport": "Jaipur International Airport", "iata": "JAI", "country": "IN"},
-            {"city": "Jakar", "airport": "Bathpalathang Airport", "iata": "BUT", "country": "BT"},
-            {"city": "Jakarta", "airport": "Pulau Panjang Airport", "iata": "PPJ", "country": "ID"},
-            {"city": "Jakarta", "airport": "Halim Perdanakusuma International Airport", "iata": "HLP", "country": "ID"},
-            {"city": "Jakarta", "airport": "Pondok Cabe Air Base", "iata": "PCB", "country": "ID"},
-            {"city": "Jakarta", "airport": "Soekarno-Hatta International Airport", "iata": "CGK", "country": "ID"},
-            {"city": "Jalalabad", "airport": "Jalalabad Airport", "iata": "JAA", "country": "AF"},
-            {"city": "Jales", "airport": "Jales Airport", "iata": "JLS", "country": "BR"},
-            {"city": "Jalgaon", "airport": "Jalgaon Airport", "iata": "JLG", "country": "IN"},
-            {"city": "Jam", "airport": "Jam Airport", "iata": "KNR", "country": "IR"},
-            {"city": "Jamba", "airport": "Jamba Airport", "iata": "JMB", "country": "AO"},
-            {"city": "Jambi", "airport": "Sultan Thaha Airport", "iata": "DJB", "country": "ID"},
-            {"city": "Jamestown", "airport": "Chautauqua County-Jamestown Airport", "iata": "JHW", "country": "US"},
-            {"city": "Jamestown", "airport": "Jamestown Regional Airport", "iata": "JMS", "country": "US"},
-            {"city": "Jammu", "airport": "Jammu Airport", "iata": "IXJ", "country": "IN"},
-            {"city": "Jamnagar", "airport": "Jamnagar Airport", "iata": "JGA", "country": "IN"},
-            {"city": "Jamshedpur", "airport": "Sonari Airport", "iata": "IXW", "country": "IN"},
-            {"city": "Janakpur", "airport": "Janakpur Airport", "iata": "JKR", "country": "NP"},
-            {"city": "Janesville", "airport": "Southern Wisconsin Regional Airport", "iata": "JVL", "country": "US"},
-            {"city": "Januária", "airport": "Januária Airport", "iata": "JNA", "country": "BR"},
-            {"city": "Japal Camp", "airport": "Iron Bridge Mine Airport", "iata": "IBM", "country": "AU"},
-            {"city": "Jaqué", "airport": "Jaqué Airport", "iata": "JQE", "country": "PA"},
-            {"city": "Jashore (Jessore)", "airport": "Jessore Airport", "iata": "JSR", "country": "BD"},
-            {"city": "Jasionka", "airport": "Rzeszów-Jasionka Airport", "iata": "RZE", "country": "PL"},
-            {"city": "Jasper", "airport": "Jasper Airport", "iata": "YJA", "country": "CA"},
-            {"city": "Jasper", "airport": "Marion County Airport - Brown Field", "iata": "APT", "country": "US"},
-            {"city": "Jasper", "airport": "Jasper County Airport Bell Field", "iata": "JAS", "country": "US"},
-            {"city": "Jataí", "airport": "Jataí Airport", "iata": "JTI", "country": "BR"},
-            {"city": "Jauja", "airport": "Francisco Carle Airport", "iata": "JAU", "country": "PE"},
-            {"city": "Jaén", "airport": "Shumba Airport", "iata": "JAE", "country": "PE"},
-            {"city": "Jebel Ali", "airport": "Al Maktoum International Airport", "iata": "DWC", "country": "AE"},
-            {"city": "Jeddah", "airport": "King Abdulaziz International Airport", "iata": "JED", "country": "SA"},
-            {"city": "Jefferson", "airport": "Jefferson Municipal Airport", "iata": "EFW", "country": "US"},
-            {"city": "Jefferson City", "airport": "Jefferson City Memorial Airport", "iata": "JEF", "country": "US"},
-            {"city": "Jeju City", "airport": "Jeju International Airport", "iata": "CJU", "country": "KR"},
-            {"city": "Jeju Island", "airport": "Jeongseok Airport", "iata": "JDG", "country": "KR"},
-            {"city": "Jeki", "airport": "Jeki Airport", "iata": "JEK", "country": "ZM"},
-            {"city": "Jember", "airport": "Notohadinegoro Airport", "iata": "JBB", "country": "ID"},
-            {"city": "Jenpeg", "airport": "Jenpeg Airport", "iata": "ZJG", "country": "CA"},
-            {"city": "Jeonju", "airport": "Jeonju (G 703) Air Base", "iata": "CHN", "country": "KR"},
-            {"city": "Jequié", "airport": "Jequié Airport", "iata": "JEQ", "country": "BR"},
-            {"city": "Jerez de la Frontera", "airport": "Jerez Airport", "iata": "XRY", "country": "ES"},
-            {"city": "Jeypore", "airport": "Jeypore Airport", "iata": "PYB", "country": "IN"},
-            {"city": "Ji'an", "airport": "Jinggangshan Airport", "iata": "JGS", "country": "CN"},
-            {"city": "Ji-Paraná", "airport": "Ji-Paraná Airport", "iata": "JPR", "country": "BR"},
-            {"city": "Jiagedaqi", "airport": "Daxing'anling Elunchun Airport", "iata": "JGD", "country": "CN"},
-            {"city": "Jiamusi", "airport": "Jiamusi Dongjiao Airport", "iata": "JMU", "country": "CN"},
-            {"city": "Jiansanjiang", "airport": "Jiansanjiang Shidi Airport", "iata": "JSJ", "country": "CN"},
-            {"city": "Jiayuguan", "airport": "Jiayuguan Airport", "iata": "JGN", "country": "CN"},
-            {"city": "Jieyang (Rongcheng)", "airport": "Jieyang Chaoshan International Airport", "iata": "SWA", "country": "CN"},
-            {"city": "Jijiga", "airport": "Wilwal International Airport", "iata": "JIJ", "country": "ET"},
-            {"city": "Jilin", "airport": "Jilin Ertaizi Airport", "iata": "JIL", "country": "CN"},
-            {"city": "Jimma", "airport": "Jimma Airport", "iata": "JIM", "country": "ET"},
-            {"city": "Jinan (Licheng)", "airport": "Jinan Yaoqiang International Airport", "iata": "TNA", "country": "CN"},
-            {"city": "Jinchang", "airport": "Jinchang Jinchuan Airport", "iata": "JIC", "country": "CN"},
-            {"city": "Jingdezhen", "airport": "Jingdezhen Luojia Airport", "iata": "JDZ", "country": "CN"},
-            {"city": "Jinghong (Gasa)", "airport": "Xishuangbanna Gasa International Airport", "iata": "JHG", "country": "CN"},
-            {"city": "Jingzhou (Shashi)", "airport": "Jingzhou Shashi Airport", "iata": "SHS", "country": "CN"},
-            {"city": "Jinhae", "airport": "Jinhae Air Base", "iata": "CHF", "country": "KR"},
-            {"city": "Jinhua (Dongyang)", "airport": "Dongyang Hengdian General Airport", "iata": "HEW", "country": "CN"},
-            {"city": "Jinhua (Yiwu)", "airport": "Yiwu Airport", "iata": "YIW", "country": "CN"},
-            {"city": "Jining", "airport": "Jining Da'an Airport", "iata": "JNG", "country": "CN"},
-            {"city": "Jinja", "airport": "Jinja Airport", "iata": "JIN", "country": "UG"},
-            {"city": "Jinzhou (Linghai)", "airport": "Jinzhou Bay Airport", "iata": "JNZ", "country": "CN"},
-            {"city": "Jipijapa", "airport": "Jipijapa Airport", "iata": "JIP", "country": "EC"},
-            {"city": "Jiri", "airport": "Jiri Airport", "iata": "JIR", "country": "NP"},
-            {"city": "Jiroft", "airport": "Jiroft Airport", "iata": "JYR", "country": "IR"},
-            {"city": "Jiujiang", "airport": "Jiujiang Lushan Airport", "iata": "JIU", "country": "CN"},
-            {"city": "Jixi", "airport": "Jixi Xingkaihu Airport", "iata": "JXA", "country": "CN"},
-            {"city": "Jizan", "airport": "Jizan Regional Airport / King Abdullah bin Abdulaziz Airport", "iata": "GIZ", "country": "SA"},
-            {"city": "Joaçaba", "airport": "Santa Terezinha Airport", "iata": "JCB", "country": "BR"},
-            {"city": "Jodhpur", "airport": "Jodhpur Airport", "iata": "JDH", "country": "IN"},
-            {"city": "Joensuu", "airport": "Joensuu Airport", "iata": "JOE", "country": "FI"},
-            {"city": "Johannesburg", "airport": "Rand Airport", "iata": "QRA", "country": "ZA"},
-            {"city": "Johannesburg", "airport": "Lanseria International Airport", "iata": "HLA", "country": "ZA"},
-            {"city": "Johannesburg", "airport": "O.R. Tambo International Airport", "iata": "JNB", "country": "ZA"},
-            {"city": "John Day", "airport": "Grant County Regional Airport / Ogilvie Field", "iata": "JDA", "country": "US"},
-            {"city": "Johnstown", "airport": "John Murtha Johnstown Cambria County Airport", "iata": "JST", "country": "US"},
-            {"city": "Johor Bahru", "airport": "Senai International Airport", "iata": "JHB", "country": "MY"},
-            {"city": "Joinville", "airport": "Lauro Carneiro de Loyola Airport", "iata": "JOI", "country": "BR"},
-            {"city": "Joliet", "airport": "Joliet Regional Airport", "iata": "JOT", "country": "US"},
-            {"city": "Jolo", "airport": "Jolo Airport", "iata": "JOL", "country": "PH"},
-            {"city": "Jolon", "airport": "Tusi (Hunter Liggett) Army Heliport", "iata": "HGT", "country": "US"},
-            {"city": "Jomsom", "airport": "Jomsom Airport", "iata": "JMO", "country": "NP"},
-            {"city": "Jonesboro", "airport": "Jonesboro Municipal Airport", "iata": "JBR", "country": "US"},
-            {"city": "Joplin", "airport": "Joplin Regional Airport", "iata": "JLN", "country": "US"},
-            {"city": "Jordan", "airport": "Jordan Airport", "iata": "JDN", "country": "US"},
-            {"city": "Jorhat", "airport": "Jorhat Airport", "iata": "JRH", "country": "IN"},
-            {"city": "Jos", "airport": "Yakubu Gowon Airport", "iata": "JOS", "country": "NG"},
-            {"city": "Josephstaal", "airport": "Josephstaal Airport", "iata": "JOP", "country": "PG"},
-            {"city": "João Pessoa", "airport": "Presidente Castro Pinto International Airport", "iata": "JPA", "country": "BR"},
-            {"city": "Juanjuí", "airport": "Juanjui Airport", "iata": "JJI", "country": "PE"},
-            {"city": "Juara", "airport": "Inácio Luís do Nascimento Airport", "iata": "JUA", "country": "BR"},
-            {"city": "Juazeiro do Norte", "airport": "Orlando Bezerra de Menezes Airport", "iata": "JDO", "country": "BR"},
-            {"city": "Juba", "airport": "Juba International Airport", "iata": "JUB", "country": "SS"},
-            {"city": "Jubail", "airport": "Jubail Airport", "iata": "QJB", "country": "SA"},
-            {"city": "Jubbarhatti", "airport": "Shimla Airport", "iata": "SLV", "country": "IN"},
-            {"city": "Juist", "airport": "Juist Airport", "iata": "JUI", "country": "DE"},
-            {"city": "Juiz de Fora", "airport": "Francisco de Assis Airport", "iata": "JDF", "country": "BR"},
-            {"city": "Juiz de Fora", "airport": "Presidente Itamar Franco Airport", "iata": "IZA", "country": "BR"},
-            {"city": "Juliaca", "airport": "Inca Manco Capac International Airport", "iata": "JUL", "country": "PE"},
-            {"city": "Jumla", "airport": "Jumla Airport", "iata": "JUM", "country": "NP"},
-            {"city": "Junction", "airport": "Kimble County Airport", "iata": "JCT", "country": "US"},
-            {"city": "Jundah", "airport": "Jundah Airport", "iata": "JUN", "country": "AU"},
-            {"city": "Jundiaí", "airport": "Comte. Rolim Adolfo Amaro–Jundiaí State Airport", "iata": "QDV", "country": "BR"},
-            {"city": "Juneau", "airport": "Dodge County Airport", "iata": "UNU", "country": "US"},
-            {"city": "Juneau", "airport": "Juneau International Airport", "iata": "JNU", "country": "US"},
-            {"city": "Juradó", "airport": "Juradó Airport", "iata": "JUO", "country": "CO"},
-            {"city": "Jurien Bay", "airport": "Jurien Bay Airport", "iata": "JUR", "country": "AU"},
-            {"city": "Juruena", "airport": "Juruena Airport", "iata": "JRN", "country": "BR"},
-            {"city": "Juruti", "airport": "Juruti Airport", "iata": "JRT", "country": "BR"},
-            {"city": "Jutigalpa", "airport": "Jutigalpa airport", "iata": "JUT", "country": "HN"},
-            {"city": "Juína", "airport": "Juína Airport", "iata": "JIA", "country": "BR"},
-            {"city": "Jwaneng", "airport": "Jwaneng Airport", "iata": "JWA", "country": "BW"},
-            {"city": "Jyväskylän Maalaiskunta", "airport": "Jyväskylä Airport", "iata": "JYV", "country": "FI"},
-            {"city": "Jämsä", "airport": "Halli Airport", "iata": "KEV", "country": "FI"},
-            {"city": "Jönköping", "airport": "Jönköping Airport", "iata": "JKG", "country": "SE"},
-            {"city": "Kabala", "airport": "Kabala Airport", "iata": "KBA", "country": "SL"},
-            {"city": "Kabalo", "airport": "Kabalo Airport", "iata": "KBO", "country": "CD"},
-            {"city": "Kaben", "airport": "Kaben Airport", "iata": "KBT", "country": "MH"},
-            {"city": "Kabinda", "airport": "Tunta Airport", "iata": "KBN", "country": "CD"},
-            {"city": "Kabir", "airport": "Pantar Kabir Airport", "iata": "AXO", "country": "ID"},
-            {"city": "Kabola", "airport": "Alor Island - Mali Airport", "iata": "ARD", "country": "ID"},
-            {"city": "Kabul", "airport": "Kabul International Airport", "iata": "KBL", "country": "AF"},
-            {"city": "Kabupaten Gayo Lues", "airport": "Blangkejeren Airport", "iata": "GYO", "country": "ID"},
-            {"city": "Kadanwari", "airport": "Kadanwari Airport", "iata": "KCF", "country": "PK"},
-            {"city": "Kadapa", "airport": "Kadapa Airport", "iata": "CDP", "country": "IN"},
-            {"city": "Kadhdhoo", "airport": "Kadhdhoo Airport", "iata": "KDO", "country": "MV"},
-            {"city": "Kadugli", "airport": "Kadugli Airport", "iata": "KDX", "country": "SD"},
-            {"city": "Kaduna", "airport": "Kaduna Airport", "iata": "KAD", "country": "NG"},
-            {"city": "Kagau Island", "airport": "Kaghau Airport", "iata": "KGE", "country": "SB"},
-            {"city": "Kagi", "airport": "Kagi Airport", "iata": "KGW", "country": "PG"},
-            {"city": "Kagoshima", "airport": "Kagoshima Airport", "iata": "KOJ", "country": "JP"},
-            {"city": "Kagua", "airport": "Kagua Airport", "iata": "AGK", "country": "PG"},
-            {"city": "Kahama", "airport": "Kahama Airstrip", "iata": "KBH", "country": "TZ"},
-            {"city": "Kahramanmaraş", "airport": "Kahramanmaraş Airport", "iata": "KCM", "country": "TR"},
-            {"city": "Kahului", "airport": "Kahului International Airport", "iata": "OGG", "country": "US"},
-            {"city": "Kaieteur Falls", "airport": "Kaieteur International Airport", "iata": "KAI", "country": "GY"},
-            {"city": "Kaikohe", "airport": "Kaikohe Airport", "iata": "KKO", "country": "NZ"},
-            {"city": "Kailashahar", "airport": "Kailashahar Airport", "iata": "IXH", "country": "IN"},
-            {"city": "Kaili  (Huangping)", "airport": "Kaili Huangping Airport", "iata": "KJH", "country": "CN"},
-            {"city": "Kailua-Kona", "airport": "Ellison Onizuka Kona International Airport at Keahole", "iata": "KOA", "country": "US"},
-            {"city": "Kaimana", "airport": "Kaimana Airport", "iata": "KNG", "country": "ID"},
-            {"city": "Kaintiba", "airport": "Kaintiba Airport", "iata": "KZF", "country": "PG"},
-            {"city": "Kaiser Lake Ozark", "airport": "Lee C Fine Memorial Airport", "iata": "AIZ", "country": "US"},
-            {"city": "Kajaani", "airport": "Kajaani Airport", "iata": "KAJ", "country": "FI"},
-            {"city": "Kakadi", "airport": "Shirdi Airport", "iata": "SAG", "country": "IN"},
-            {"city": "Kakamega", "airport": "Kakamega Airport", "iata": "GGM", "country": "KE"},
-            {"city": "Kake", "airport": "Kake Seaplane Base", "iata": "KAE", "country": "US"},
-            {"city": "Kakoro", "airport": "Kakoro(Koroko) Airstrip", "iata": "KOR", "country": "PG"},
-            {"city": "Kalabo", "airport": "Kalabo Airport", "iata": "KLB", "country": "ZM"},
-            {"city": "Kalaburagi", "airport": "Kalaburagi Airport", "iata": "GBI", "country": "IN"},
-            {"city": "Kalakaket Creek", "airport": "Kalakaket Creek AS Airport", "iata": "KKK", "country": "US"},
-            {"city": "Kalaleh", "airport": "Kalaleh Airport", "iata": "KLM", "country": "IR"},
-            {"city": "Kalamata", "airport": "Kalamata Airport", "iata": "KLX", "country": "GR"},
-            {"city": "Kalamazoo", "airport": "Kalamazoo Battle Creek International Airport", "iata": "AZO", "country": "US"},
-            {"city": "Kalaupapa", "airport": "Kalaupapa Airport", "iata": "LUP", "country": "US"},
-            {"city": "Kalaw Township", "airport": "Heho Airport", "iata": "HEH", "country": "MM"},
-            {"city": "Kalbarri", "airport": "Kalbarri Airport", "iata": "KAX", "country": "AU"},
-            {"city": "Kalemie", "airport": "Kalemie Airport", "iata": "FMI", "country": "CD"},
-            {"city": "Kalemyo", "airport": "Kalay Airport", "iata": "KMV", "country": "MM"},
-            {"city": "Kalibo", "airport": "Kalibo International Airport", "iata": "KLO", "country": "PH"},
-            {"city": "Kalima", "airport": "Kinkungwa Airport", "iata": "KLY", "country": "CD"},
-            {"city": "Kaliningrad", "airport": "Khrabrovo Airport", "iata": "KGD", "country": "RU"},
-            {"city": "Kalispell", "airport": "Glacier Park International Airport", "iata": "FCA", "country": "US"},
-            {"city": "Kalmar", "airport": "Kalmar Airport", "iata": "KLR", "country": "SE"},
-            {"city": "Kalokol", "airport": "Kalokol Airport", "iata": "KLK", "country": "KE"},
-            {"city": "Kalokol", "airport": "Lake Rudolf Airport", "iata": "LKU", "country": "KE"},
-            {"city": "Kalpitiya Island", "airport": "Dutch Bay SPB", "iata": "DBK", "country": "LK"},
-            {"city": "Kalpower", "airport": "Kalpowar Airport", "iata": "KPP", "country": "AU"},
-            {"city": "Kalskag", "airport": "Kalskag Airport", "iata": "KLG", "country": "US"},
-            {"city": "Kaltag", "airport": "Kaltag Airport", "iata": "KAL", "country": "US"},
-            {"city": "Kaltukatjara", "airport": "Docker River Airport", "iata": "DKV", "country": "AU"},
-            {"city": "Kaluga", "airport": "Grabtsevo Airport", "iata": "KLF", "country": "RU"},
-            {"city": "Kalumbila", "airport": "Kalumbila Airport", "iata": "UMB", "country": "ZM"},
-            {"city": "Kalumburu", "airport": "Kalumburu Airport", "iata": "UBU", "country": "AU"},
-            {"city": "Kalutara", "airport": "Katukurunda Air Force Base", "iata": "KTY", "country": "LK"},
-            {"city": "Kalymnos Island", "airport": "Kalymnos Airport", "iata": "JKL", "country": "GR"},
-            {"city": "Kamakombe", "airport": "Bukavu Kavumu Airport", "iata": "BKY", "country": "CD"},
-            {"city": "Kamaran", "airport": "Kamaran Airport", "iata": "KAM", "country": "YE"},
-            {"city": "Kamaran Downs", "airport": "Kamaran Downs Airport", "iata": "KDS", "country": "AU"},
-            {"city": "Kamarang", "airport": "Kamarang Airport", "iata": "KAR", "country": "GY"},
-            {"city": "Kamarata", "airport": "Kamarata Airport", "iata": "KTV", "country": "VE"},
-            {"city": "Kambalda West", "airport": "Kambalda Airport", "iata": "KDB", "country": "AU"},
-            {"city": "Kamberatoro Mission", "airport": "Kamberatoro Airport", "iata": "KDQ", "country": "PG"},
-            {"city": "Kambuaya-Papua Island", "airport": "Kambuaya Airport", "iata": "KBX", "country": "ID"},
-            {"city": "Kamembe", "airport": "Kamembe Airport", "iata": "KME", "country": "RW"},
-            {"city": "Kamina", "airport": "Kamina City Airport", "iata": "KMN", "country": "CD"},
-            {"city": "Kamloops", "airport": "Kamloops John Moose Fulton Field Regional Airport", "iata": "YKA", "country": "CA"},
-            {"city": "Kampala", "airport": "Entebbe International Airport", "iata": "EBB", "country": "UG"},
-            {"city": "Kampala", "airport": "Kajjansi Airfield", "iata": "KJJ", "country": "UG"},
-            {"city": "Kampong Chhnang", "airport": "Kampong Chhnang Airport", "iata": "KZC", "country": "KH"},
-            {"city": "Kamra", "airport": "Minhas Air Base", "iata": "ATG", "country": "PK"},
-            {"city": "Kamulai Mission", "airport": "Kamulai Airport", "iata": "KAQ", "country": "PG"},
-            {"city": "Kamur", "airport": "Kamur Airport", "iata": "KCD", "country": "ID"},
-            {"city": "Kamusi", "airport": "Kamusi Airport", "iata": "KUY", "country": "PG"},
-            {"city": "Kamyan'ka", "airport": "Kam'yanets'-Podil's'kyi Airfield", "iata": "KCP", "country": "UA"},
-            {"city": "Kanab", "airport": "Kanab Municipal Airport", "iata": "KNB", "country": "US"},
-            {"city": "Kanabea", "airport": "Kanabea Airport", "iata": "KEX", "country": "PG"},
-            {"city": "Kanainj", "airport": "Kanainj Airport", "iata": "KNE", "country": "PG"},
-            {"city": "Kananga", "airport": "Kananga Airport", "iata": "KGA", "country": "CD"},
-            {"city": "Kanazawa", "airport": "Komatsu Airport / JASDF Komatsu Air Base", "iata": "KMQ", "country": "JP"},
-            {"city": "Kandep", "airport": "Kandep Airport", "iata": "KDP", "country": "PG"},
-            {"city": "Kandi", "airport": "Kandi Airport", "iata": "KDC", "country": "BJ"},
-            {"city": "Kandla", "airport": "Kandla Airport", "iata": "IXY", "country": "IN"},
-            {"city": "Kandrian", "airport": "Kandrian Airport", "iata": "KDR", "country": "PG"},
-            {"city": "Kandy", "airport": "Victoria Reservoir Seaplane Base", "iata": "KDW", "country": "LK"},
-            {"city": "Kandy", "airport": "Polgolla Reservoir Seaplane Base", "iata": "KDZ", "country": "LK"},
-            {"city": "Kaneohe", "airport": "Kaneohe Bay MCAS (Marion E. Carl Field) Airport", "iata": "NGF", "country": "US"},
-            {"city": "Kangaatsiaq", "airport": "Kangaatsiaq Heliport", "iata": "QPW", "country": "GL"},
-            {"city": "Kangaroo Island", "airport": "Parndana Airport", "iata": "PDN", "country": "AU"},
-            {"city": "Kangerlussuaq", "airport": "Kangerlussuaq Airport", "iata": "SFJ", "country": "GL"},
-            {"city": "Kangersuatsiaq", "airport": "Kangersuatsiaq Heliport", "iata": "KGQ", "country": "GL"},
-            {"city": "Kangilinnguit", "airport": "Kangilinnguit Heliport", "iata": "JGR", "country": "GL"},
-            {"city": "Kangiqsualujjuaq", "airport": "Kangiqsualujjuaq (Georges River) Airport", "iata": "XGR", "country": "CA"},
-            {"city": "Kangiqsujuaq", "airport": "Kangiqsujuaq (Wakeham Bay) Airport", "iata": "YWB", "country": "CA"},
-            {"city": "Kangirsuk", "airport": "Kangirsuk Airport", "iata": "YKG", "country": "CA"},
-            {"city": "Kangra", "airport": "Kangra Airport", "iata": "DHM", "country": "IN"},
-            {"city": "Kaniama", "airport": "Kaniama Airport", "iata": "KNM", "country": "CD"},
-            {"city": "Kankakee", "airport": "Greater Kankakee Airport", "iata": "IKK", "country": "US"},
-            {"city": "Kankan", "airport": "Kankan Airport", "iata": "KNN", "country": "GN"},
-            {"city": "Kannur", "airport": "Kannur International Airport", "iata": "CNN", "country": "IN"},
-            {"city": "Kano", "airport": "Mallam Aminu International Airport", "iata": "KAN", "country": "NG"},
-            {"city": "Kanpur", "airport": "Kanpur Airport", "iata": "KNU", "country": "IN"},
-            {"city": "Kansas City", "airport": "Kansas City International Airport", "iata": "MCI", "country": "US"},
-            {"city": "Kansas City", "airport": "Charles B. Wheeler Downtown Airport", "iata": "MKC", "country": "US"},
-            {"city": "Kantchari", "airport": "Kantchari Airport", "iata": "XKA", "country": "BF"},
-            {"city": "Kanti", "airport": "Kanti Airport", "iata": "KHM", "country": "MM"},
-            {"city": "Kao-Celebes Island", "airport": "Kuabang Airport", "iata": "KAZ", "country": "ID"},
-            {"city": "Kaohsiung (Cijin - Pratas Island)", "airport": "Dongsha Island (Pratas Island) Airport", "iata": "DSX", "country": "TW"},
-            {"city": "Kaohsiung (Xiaogang)", "airport": "Kaohsiung International Airport", "iata": "KHH", "country": "TW"},
-            {"city": "Kaolack", "airport": "Kaolack Airport", "iata": "KLC", "country": "SN"},
-            {"city": "Kaoma", "airport": "Kaoma Airport", "iata": "KMZ", "country": "ZM"},
-            {"city": "Kapal", "airport": "Kapal Airport", "iata": "KPL", "country": "PG"},
-            {"city": "Kapan", "airport": "Syunik Airport", "iata": "YUK", "country": "AM"},
-            {"city": "Kapanga", "airport": "Kapanga Airport", "iata": "KAP", "country": "CD"},
-            {"city": "Kapit", "airport": "Kapit Airport", "iata": "KPI", "country": "MY"},
-            {"city": "Kapolei", "airport": "Kalaeloa Airport", "iata": "JRF", "country": "US"},
-            {"city": "Kapuskasing", "airport": "Kapuskasing Airport", "iata": "YYU", "country": "CA"},
-            {"city": "Kar", "airport": "Kar Airport", "iata": "KAK", "country": "PG"},
-            {"city": "Kar Kar Island", "airport": "Kar Kar Airport", "iata": "KRX", "country": "PG"},
-            {"city": "Karachi", "airport": "Jinnah International Airport", "iata": "KHI", "country": "PK"},
-            {"city": "Karaganda", "airport": "Sary-Arka Airport", "iata": "KGF", "country": "KZ"},
-            {"city": "Karaj", "airport": "Payam Karaj International Airport", "iata": "PYK", "country": "IR"},
-            {"city": "Karakelong Island", "airport": "Melangguane Airport", "iata": "MNA", "country": "ID"},
-            {"city": "Karakol", "airport": "Karakol Airport", "iata": "IKG", "country": "KG"},
-            {"city": "Karamay", "airport": "Karamay Airport", "iata": "KRY", "country": "CN"},
-            {"city": "Karanambo", "airport": "Karanambo Airport", "iata": "KRM", "country": "GY"},
-            {"city": "Karara", "airport": "Karara Airport", "iata": "KQR", "country": "AU"},
-            {"city": "Karasabai", "airport": "Karasabai Airport", "iata": "KRG", "country": "GY"},
-            {"city": "Karasburg", "airport": "Karasburg Airport", "iata": "KAS", "country": "NA"},
-            {"city": "Karato", "airport": "Karato Airport", "iata": "KAF", "country": "PG"},
-            {"city": "Kariba", "airport": "Kariba International Airport", "iata": "KAB", "country": "ZW"},
-            {"city": "Karijini National Park", "airport": "Solomon Airport", "iata": "SLJ", "country": "AU"},
-            {"city": "Karimui", "airport": "Karimui Airport", "iata": "KMR", "country": "PG"},
-            {"city": "Karimunjawa", "airport": "Dewadaru Airport", "iata": "KWB", "country": "ID"},
-            {"city": "Karlovy Vary", "airport": "Karlovy Vary Airport", "iata": "KLV", "country": "CZ"},
-            {"city": "Karlskoga", "airport": "Karlskoga Airport", "iata": "KSK", "country": "SE"},
-            {"city": "Karlstad", "airport": "Karlstad Airport", "iata": "KSD", "country": "SE"},
-            {"city": "Karluk", "airport": "Karluk Airport", "iata": "KYK", "country": "US"},
-            {"city": "Karluk Lake", "airport": "Karluk Lake Seaplane Base", "iata": "KKL", "country": "US"},
-            {"city": "Karmøy", "airport": "Haugesund Airport, Karmøy", "iata": "HAU", "country": "NO"},
-            {"city": "Karonga", "airport": "Karonga Airport", "iata": "KGJ", "country": "MW"},
-            {"city": "Karpathos Island", "airport": "Karpathos Airport", "iata": "AOK", "country": "GR"},
-            {"city": "Karratha", "airport": "Karratha Airport", "iata": "KTA", "country": "AU"},
-            {"city": "Kars", "airport": "Kars Airport", "iata": "KSY", "country": "TR"},
-            {"city": "Karshi", "airport": "Karshi Airport", "iata": "KSQ", "country": "UZ"},
-            {"city": "Kartepe", "airport": "Cengiz Topel Airport", "iata": "KCO", "country": "TR"},
-            {"city": "Karubaga", "airport": "Karubaga Airport", "iata": "KBF", "country": "ID"},
-            {"city": "Karup", "airport": "Midtjyllands Airport / Air Base Karup", "iata": "KRP", "country": "DK"},
-            {"city": "Kasaan", "airport": "Kasaan Seaplane Base", "iata": "KXA", "country": "US"},
-            {"city": "Kasaba Bay", "airport": "Kasaba Bay Airport", "iata": "ZKB", "country": "ZM"},
-            {"city": "Kasabonika", "airport": "Kasabonika Airport", "iata": "XKS", "country": "CA"},
-            {"city": "Kasama", "airport": "Kasama Airport", "iata": "KAA", "country": "ZM"},
-            {"city": "Kasane", "airport": "Kasane Airport", "iata": "BBK", "country": "BW"},
-            {"city": "Kasba Lake", "airport": "Kasba Lake Airport", "iata": "YDU", "country": "CA"},
-            {"city": "Kasenga", "airport": "Kasenga Airport", "iata": "KEC", "country": "CD"},
-            {"city": "Kasese", "airport": "Kasese Airport", "iata": "KSE", "country": "UG"},
-            {"city": "Kashan", "airport": "Kashan Airport", "iata": "KKS", "country": "IR"},
-            {"city": "Kashechewan", "airport": "Kashechewan Airport", "iata": "ZKE", "country": "CA"},
-            {"city": "Kashgar", "airport": "Kashgar Laining International Airport", "iata": "KHG", "country": "CN"},
-            {"city": "Kasigluk", "airport": "Kasigluk Airport", "iata": "KUK", "country": "US"},
-            {"city": "Kasikasima", "airport": "Tepoe Airstrip", "iata": "KCB", "country": "SR"},
-            {"city": "Kasongo-Lunda", "airport": "Kasongo-Lunda Airport", "iata": "KGN", "country": "CD"},
-            {"city": "Kasonombe", "airport": "Kasonombe Airport", "iata": "KSB", "country": "PG"},
-            {"city": "Kasos Island", "airport": "Kasos Airport", "iata": "KSJ", "country": "GR"},
-            {"city": "Kassala", "airport": "Kassala Airport", "iata": "KSL", "country": "SD"},
-            {"city": "Kastamonu", "airport": "Kastamonu Airport", "iata": "KFS", "country": "TR"},
-            {"city": "Kastelorizo Island", "airport": "Kastelorizo Airport", "iata": "KZS", "country": "GR"},
-            {"city": "Kasungu", "airport": "Kasungu Airport", "iata": "KBQ", "country": "MW"},
-            {"city": "Kathmandu", "airport": "Tribhuvan International Airport", "iata": "KTM", "country": "NP"},
-            {"city": "Katiola", "airport": "Katiola Airport", "iata": "KTC", "country": "CI"},
-            {"city": "Katiu", "airport": "Katiu Airport", "iata": "KXU", "country": "PF"},
-            {"city": "Katmai National Park", "airport": "Lake Brooks Seaplane Base", "iata": "BKF", "country": "US"},
-            {"city": "Kato", "airport": "Kato Airport", "iata": "KTO", "country": "GY"},
-            {"city": "Katowice", "airport": "Katowice Wojciech Korfanty International Airport", "iata": "KTW", "country": "PL"},
-            {"city": "Katsina", "airport": "Katsina Airport", "iata": "DKA", "country": "NG"},
-            {"city": "Kattiniq", "airport": "Donaldson Airport", "iata": "YAU", "country": "CA"},
-            {"city": "Kauehi", "airport": "Kauehi Airport", "iata": "KHZ", "country": "PF"},
-            {"city": "Kauhajoki", "airport": "Kauhajoki Airfield", "iata": "KHJ", "country": "FI"},
-            {"city": "Kauhava", "airport": "Kauhava Airfield", "iata": "KAU", "country": "FI"},
-            {"city": "Kaunakakai", "airport": "Molokai Airport", "iata": "MKK", "country": "US"},
-            {"city": "Kaunas", "airport": "Kaunas International Airport", "iata": "KUN", "country": "LT"},
-            {"city": "Kavadja", "airport": "Kavadja Airport", "iata": "KWD", "country": "CF"},
-            {"city": "Kavala", "airport": "Kavala Alexander the Great International Airport", "iata": "KVA", "country": "GR"},
-            {"city": "Kavalerovo", "airport": "Kavalerovo Airport", "iata": "KVR", "country": "RU"},
-            {"city": "Kavanayén", "airport": "Kavanayen Airport", "iata": "KAV", "country": "VE"},
-            {"city": "Kavieng", "airport": "Kavieng Airport", "iata": "KVG", "country": "PG"},
-            {"city": "Kawbenaberi", "airport": "Ruti Airport", "iata": "RUU", "country": "PG"},
-            {"city": "Kawito", "airport": "Kawito Airport", "iata": "KWO", "country": "PG"},
-            {"city": "Kawthoung", "airport": "Kawthoung Airport", "iata": "KAW", "country": "MM"},
-            {"city": "Kaya", "airport": "Kaya Airport", "iata": "XKY", "country": "BF"},
-            {"city": "Kayenta", "airport": "Kayenta Airport", "iata": "MVM", "country": "US"},
-            {"city": "Kayseri", "airport": "Kayseri Erkilet Airport", "iata": "ASR", "country": "TR"},
-            {"city": "Kazan", "airport": "Kazan International Airport", "iata": "KZN", "country": "RU"},
-            {"city": "Kaédi", "airport": "Kaédi Airport", "iata": "KED", "country": "MR"},
-            {"city": "Kaélé", "airport": "Kaélé Airport", "iata": "KLE", "country": "CM"},
-            {"city": "Kaštel Štafilić", "airport": "Split Airport", "iata": "SPU", "country": "HR"},
-            {"city": "Kearney", "airport": "Kearney Regional Airport", "iata": "EAR", "country": "US"},
-            {"city": "Kebar", "airport": "Kebar Airport", "iata": "KEQ", "country": "ID"},
-            {"city": "Kebri Dahar", "airport": "Kebri Dahar Airport", "iata": "ABK", "country": "ET"},
-            {"city": "Kediri", "airport": "Dhoho International Airport", "iata": "DHX", "country": "ID"},
-            {"city": "Keekorok", "airport": "Keekorok Airport", "iata": "KEU", "country": "KE"},
-            {"city": "Keene", "airport": "Dillant Hopkins Airport", "iata": "EEN", "country": "US"},
-            {"city": "Keetmanshoop", "airport": "Keetmanshoop Airport", "iata": "KMP", "country": "NA"},
-            {"city": "Keewaywin", "airport": "Keewaywin Airport", "iata": "KEW", "country": "CA"},
-            {"city": "Kefallinia Island", "airport": "Kefallinia Airport", "iata": "EFL", "country": "GR"},
-            {"city": "Kekaha", "airport": "Barking Sands Airport", "iata": "BKH", "country": "US"},
-            {"city": "Kelafo", "airport": "Kelafo East Airport", "iata": "LFO", "country": "ET"},
-            {"city": "Kelila", "airport": "Kelila Airport", "iata": "LLN", "country": "ID"},
-            {"city": "Kelle", "airport": "Kelle Airport", "iata": "KEE", "country": "CG"},
-            {"city": "Kelowna", "airport": "Kelowna International Airport", "iata": "YLW", "country": "CA"},
-            {"city": "Kelsey", "airport": "Kelsey Airport", "iata": "KES", "country": "CA"},
-            {"city": "Kelso", "airport": "Southwest Washington Regional Airport", "iata": "KLS", "country": "US"},
-            {"city": "Kemerovo", "airport": "Kemerovo Airport", "iata": "KEJ", "country": "RU"},
-            {"city": "Kemi / Tornio", "airport": "Kemi-Tornio Airport", "iata": "KEM", "country": "FI"},
-            {"city": "Kemmerer", "airport": "Kemmerer Municipal Airport", "iata": "EMM", "country": "US"},
-            {"city": "Ken Jones", "airport": "Ken Jones Airport", "iata": "POT", "country": "JM"},
-            {"city": "Ken's Bore", "airport": "Ken's Bore airport", "iata": "KYB", "country": "AU"},
-            {"city": "Kenai", "airport": "Drift River Airport", "iata": "DRF", "country": "US"},
-            {"city": "Kenai", "airport": "Kenai Municipal Airport", "iata": "ENA", "country": "US"},
-            {"city": "Kendari", "airport": "Haluoleo Airport", "iata": "KDI", "country": "ID"},
-            {"city": "Kenema", "airport": "Kenema Airport", "iata": "KEN", "country": "SL"},
-            {"city": "Kengtung", "airport": "Kengtung Airport", "iata": "KET", "country": "MM"},
-            {"city": "Kenieba", "airport": "Kenieba Airport", "iata": "KNZ", "country": "ML"},
-            {"city": "Keningau", "airport": "Keningau Airport", "iata": "KGU", "country": "MY"},
-            {"city": "Kenitra", "airport": "Kenitra Air Base", "iata": "NNA", "country": "MA"},
-            {"city": "Kenmore", "airport": "Kenmore Air Harbor LLC Seaplane Base", "iata": "KEH", "country": "US"},
-            {"city": "Kennedy Lake", "airport": "Gahcho Kue", "iata": "GHK", "country": "CA"},
-            {"city": "Kennett", "airport": "Kennett Memorial Airport", "iata": "KNT", "country": "US"},
-            {"city": "Kenora", "airport": "Kenora Airport", "iata": "YQK", "country": "CA"},
-            {"city": "Kenosha", "airport": "Kenosha Regional Airport", "iata": "ENW", "country": "US"},
-            {"city": "Kentland", "airport": "Kentland Municipal Airport", "iata": "KKT", "country": "US"},
-            {"city": "Keokuk", "airport": "Keokuk Municipal Airport", "iata": "EOK", "country": "US"},
-            {"city": "Keperveem", "airport": "Keperveem Airport", "iata": "KPW", "country": "RU"},
-            {"city": "Kepi", "airport": "Kepi Airport", "iata": "KEI", "country": "ID"},
-            {"city": "Kerch", "airport": "Kerch Airport", "iata": "KHC", "country": "UA"},
-            {"city": "Kerema", "airport": "Kerema Airport", "iata": "KMA", "country": "PG"},
-            {"city": "Kericho", "airport": "Kericho Airport", "iata": "KEY", "country": "KE"},
-            {"city": "Kerikeri", "airport": "Kerikeri Airport", "iata": "KKE", "country": "NZ"},
-            {"city": "Kerki", "airport": "Kerki Airport", "iata": "KEA", "country": "TM"},
-            {"city": "Kerkyra (Corfu)", "airport": "Corfu Ioannis Kapodistrias International Airport", "iata": "CFU", "country": "GR"},
-            {"city": "Kerman", "airport": "Ayatollah Hashemi Rafsanjani International Airport", "iata": "KER", "country": "IR"},
-            {"city": "Kermanshah", "airport": "Shahid Ashrafi Esfahani Airport", "iata": "KSH", "country": "IR"},
-            {"city": "Kerrville", "airport": "Kerrville / Kerr County Airport at Louis Schreiner Field", "iata": "ERV", "country": "US"},
-            {"city": "Kertajati", "airport": "Kertajati International Airport", "iata": "KJT", "country": "ID"},
-            {"city": "Kerteh", "airport": "Kerteh Airport", "iata": "KTE", "country": "MY"},
-            {"city": "Keshod", "airport": "Keshod Airport", "iata": "IXK", "country": "IN"},
-            {"city": "Ketapang", "airport": "Rahadi Osman Airport", "iata": "KTG", "country": "ID"},
-            {"city": "Ketchikan", "airport": "Ketchikan Harbor Seaplane Base", "iata": "WFB", "country": "US"},
-            {"city": "Ketchikan", "airport": "Ketchikan International Airport", "iata": "KTN", "country": "US"},
-            {"city": "Key Lake", "airport": "Key Lake Airport", "iata": "YKJ", "country": "CA"},
-            {"city": "Key Largo", "airport": "Ocean Reef Club Airport", "iata": "OCA", "country": "US"},
-            {"city": "Key West", "airport": "Key West International Airport", "iata": "EYW", "country": "US"},
-            {"city": "Key West", "airport": "Naval Air Station Key West/Boca Chica Field", "iata": "NQX", "country": "US"},
-            {"city": "Khabarovsk", "airport": "Khabarovsk Novy Airport", "iata": "KHV", "country": "RU"},
-            {"city": "Khajuraho", "airport": "Khajuraho Airport", "iata": "HJR", "country": "IN"},
-            {"city": "Khamis Mushait", "airport": "King Khalid Air Base", "iata": "KMX", "country": "SA"},
-            {"city": "Khandyga", "airport": "Typliy Klyuch Airport", "iata": "KDY", "country": "RU"},
-            {"city": "Khaneh", "airport": "Khaneh Airport", "iata": "KHA", "country": "IR"},
-            {"city": "Khankhongor", "airport": "Bulagtai Resort Airport", "iata": "UGT", "country": "MN"},
-            {"city": "Khanty-Mansiysk", "airport": "Khanty Mansiysk Airport", "iata": "HMA", "country": "RU"},
-            {"city": "Kharja Oases", "airport": "El Kharja Airport", "iata": "UVL", "country": "EG"},
-            {"city": "Khark", "airport": "Khark Airport", "iata": "KHK", "country": "IR"},
-            {"city": "Kharkiv", "airport": "Kharkiv International Airport", "iata": "HRK", "country": "UA"},
-            {"city": "Khartoum", "airport": "Khartoum International Airport", "iata": "KRT", "country": "SD"},
-            {"city": "Khasab", "airport": "Khasab Airport", "iata": "KHS", "country": "OM"},
-            {"city": "Khashm El Girba", "airport": "Khashm El Girba Airport", "iata": "GBU", "country": "SD"},
-            {"city": "Khatanga", "airport": "Khatanga Airport", "iata": "HTG", "country": "RU"},
-            {"city": "Kherson", "airport": "Kherson International Airport", "iata": "KHE", "country": "UA"},
-            {"city": "Khiyaroo", "airport": "Persian Gulf International Airport", "iata": "PGU", "country": "IR"},
-            {"city": "Khmelnytskyi", "airport": "Khmelnytskyi Airport", "iata": "HMJ", "country": "UA"},
-            {"city": "Khoka Moya", "airport": "Khoka Moya Airport", "iata": "KHO", "country": "ZA"},
-            {"city": "Khon Kaen", "airport": "Khon Kaen Airport", "iata": "KKC", "country": "TH"},
-            {"city": "Khonuu", "airport": "Moma Airport", "iata": "MQJ", "country": "RU"},
-            {"city": "Khost", "airport": "Khost International Airport", "iata": "KHT", "country": "AF"},
-            {"city": "Khost", "airport": "Salerno Airport", "iata": "OLR", "country": "AF"},
-            {"city": "Khovd", "airport": "Khovd Airport", "iata": "HVD", "country": "MN"},
-            {"city": "Khowai", "airport": "Khowai Airport", "iata": "IXN", "country": "IN"},
-            {"city": "Khoy", "airport": "Khoy Airport", "iata": "KHY", "country": "IR"},
-            {"city": "Khujand", "airport": "Khujand Airport", "iata": "LBD", "country": "TJ"},
-            {"city": "Khujirt", "airport": "Khujirt Airport", "iata": "HJT", "country": "MN"},
-            {"city": "Khuzdar", "airport": "Khuzdar Airport", "iata": "KDD", "country": "PK"},
-            {"city": "Khvoshab", "airport": "Ahmad Shah Baba International Airport / Kandahar Airfield", "iata": "KDH", "country": "AF"},
-            {"city": "Khwahan", "airport": "Khwahan Airport", "iata": "KWH", "country": "AF"},
-            {"city": "Khwai River Lodge", "airport": "Khwai River Lodge Airport", "iata": "KHW", "country": "BW"},
-            {"city": "Kiana", "airport": "Bob Baker Memorial Airport", "iata": "IAN", "country": "US"},
-            {"city": "Kibuli", "airport": "Kibuli Airstrip", "iata": "KII", "country": "PG"},
-            {"city": "Kichwa Tembo", "airport": "Kichwa Tembo Airport", "iata": "KTJ", "country": "KE"},
-            {"city": "Kidlington, Oxfordshire", "airport": "London Oxford Airport", "iata": "OXF", "country": "GB"},
-            {"city": "Kiel", "airport": "Kiel-Holtenau Airport", "iata": "KEL", "country": "DE"},
-            {"city": "Kieta", "airport": "Aropa Airport", "iata": "KIE", "country": "PG"},
-            {"city": "Kiffa", "airport": "Kiffa Airport", "iata": "KFA", "country": "MR"},
-            {"city": "Kigali", "airport": "Kigali International Airport", "iata": "KGL", "country": "RW"},
-            {"city": "Kigoma", "airport": "Kigoma Airport", "iata": "TKQ", "country": "TZ"},
-            {"city": "Kihihi", "airport": "Savannah Airstrip", "iata": "KHX", "country": "UG"},
-            {"city": "Kikai", "airport": "Kikai Airport", "iata": "KKX", "country": "JP"},
-            {"city": "Kikori", "airport": "Kikori Airport", "iata": "KRI", "country": "PG"},
-            {"city": "Kikwit", "airport": "Kikwit Airport", "iata": "KKW", "country": "CD"},
-            {"city": "Kilaguni", "airport": "Kilaguni Airport", "iata": "ILU", "country": "KE"},
-            {"city": "Kili Island", "airport": "Kili Airport", "iata": "KIO", "country": "MH"},
-            {"city": "Kilindoni", "airport": "Mafia Airport", "iata": "MFA", "country": "TZ"},
-            {"city": "Kilkenny", "airport": "Kilkenny Airport", "iata": "KKY", "country": "IE"},
-            {"city": "Kill Devil Hills", "airport": "First Flight Airport", "iata": "FFA", "country": "US"},
-            {"city": "Killeen", "airport": "Skylark Field", "iata": "ILE", "country": "US"},
-            {"city": "Kilwa", "airport": "Kilwa Airport", "iata": "KIL", "country": "CD"},
-            {"city": "Kilwa Masoko", "airport": "Kilwa Airport", "iata": "KIY", "country": "TZ"},
-            {"city": "Kimaam", "airport": "Kimaam Airport", "iata": "KMM", "country": "ID"},
-            {"city": "Kimbe", "airport": "Hoskins Airport", "iata": "HKN", "country": "PG"},
-            {"city": "Kimberley", "airport": "Kimberley Airport", "iata": "KIM", "country": "ZA"},
-            {"city": "Kimberley Downs", "airport": "Kimberley Downs Airport", "iata": "KBD", "country": "AU"},
-            {"city": "Kimmirut", "airport": "Kimmirut Airport", "iata": "YLC", "country": "CA"},
-            {"city": "Kimsquit Valley", "airport": "Dean River Airport", "iata": "YRD", "country": "CA"},
-            {"city": "Kimwarer", "airport": "Kerio Valley Airport", "iata": "KRV", "country": "KE"},
-            {"city": "Kincardine", "airport": "Kincardine Municipal Airport", "iata": "YKD", "country": "CA"},
-            {"city": "Kincheloe", "airport": "Chippewa County International Airport", "iata": "CIU", "country": "US"},
-            {"city": "Kindamba", "airport": "Kindamba Airport", "iata": "KNJ", "country": "CG"},
-            {"city": "Kindersley", "airport": "Kindersley Airport", "iata": "YKY", "country": "CA"},
-            {"city": "Kindu", "airport": "Kindu Airport", "iata": "KND", "country": "CD"},
-            {"city": "King City", "airport": "Mesa Del Rey Airport", "iata": "KIC", "country": "US"},
-            {"city": "King Cove", "airport": "King Cove Airport", "iata": "KVC", "country": "US"},
-            {"city": "King Khaled Military City", "airport": "King Khaled Military City Airport", "iata": "KMC", "country": "SA"},
-            {"city": "King Salmon", "airport": "King Salmon Airport", "iata": "AKN", "country": "US"},
-            {"city": "King's Lynn, Norfolk", "airport": "RAF Marham", "iata": "KNF", "country": "GB"},
-            {"city": "Kingfisher Lake", "airport": "Kingfisher Lake Airport", "iata": "KIF", "country": "CA"},
-            {"city": "Kingman", "airport": "Kingman Airport", "iata": "IGM", "country": "US"},
-            {"city": "Kingsford", "airport": "Ford Airport", "iata": "IMT", "country": "US"},
-            {"city": "Kingston", "airport": "Kingston Norman Rogers Airport", "iata": "YGK", "country": "CA"},
-            {"city": "Kingston", "airport": "Norman Manley International Airport", "iata": "KIN", "country": "JM"},
-            {"city": "Kingstown", "airport": "Argyle International Airport", "iata": "SVD", "country": "VC"},
-            {"city": "Kingsville", "airport": "Kingsville Naval Air Station", "iata": "NQI", "country": "US"},
-            {"city": "Kinngait", "airport": "Cape Dorset Airport", "iata": "YTE", "country": "CA"},
-            {"city": "Kinshasa", "airport": "Ndjili International Airport", "iata": "FIH", "country": "CD"},
-            {"city": "Kinston", "airport": "Kinston Regional Jetport At Stallings Field", "iata": "ISO", "country": "US"},
-            {"city": "Kipnuk", "airport": "Kipnuk Airport", "iata": "KPN", "country": "US"},
-            {"city": "Kira", "airport": "Kira Airport", "iata": "KIQ", "country": "PG"},
-            {"city": "Kirakira", "airport": "Ngorangora Airport", "iata": "IRA", "country": "SB"},
-            {"city": "Kirby Lake", "airport": "Kirby Lake Airport", "iata": "KFM", "country": "CA"},
-            {"city": "Kirensk", "airport": "Kirensk Airport", "iata": "KCK", "country": "RU"},
-            {"city": "Kiri", "airport": "Kiri Airport", "iata": "KRZ", "country": "CD"},
-            {"city": "Kiritimati", "airport": "Cassidy International Airport", "iata": "CXI", "country": "KI"},
-            {"city": "Kirkenes", "airport": "Kirkenes Airport, Høybuktmoen", "iata": "KKN", "country": "NO"},
-            {"city": "Kirkimbie", "airport": "Kirkimbie Station Airport", "iata": "KBB", "country": "AU"},
-            {"city": "Kirkland Lake", "airport": "Kirkland Lake Airport", "iata": "YKX", "country": "CA"},
-            {"city": "Kirksville", "airport": "Kirksville Regional Airport", "iata": "IRK", "country": "US"},
-            {"city": "Kirkuk", "airport": "Kirkuk Air Base", "iata": "KIK", "country": "IQ"},
-            {"city": "Kirov", "airport": "Pobedilovo Airport", "iata": "KVX", "country": "RU"},
-            {"city": "Kirovograd", "airport": "Kirovograd Airport", "iata": "KGO", "country": "UA"},
-            {"city": "Kiruna", "airport": "Kiruna Airport", "iata": "KRN", "country": "SE"},
-            {"city": "Kirundo", "airport": "Kirundo Airport", "iata": "KRE", "country": "BI"},
-            {"city": "Kiryat Shmona", "airport": "Kiryat Shmona Airport", "iata": "KSW", "country": "IL"},
-            {"city": "Kisangani", "airport": "Bangoka International Airport", "iata": "FKI", "country": "CD"},
-            {"city": "Kish Island", "airport": "Kish International Airport", "iata": "KIH", "country": "IR"},
-            {"city": "Kismayo", "airport": "Kismayo Airport", "iata": "KMU", "country": "SO"},
-            {"city": "Kisoro", "airport": "Kisoro Airport", "iata": "KXO", "country": "UG"},
-            {"city": "Kissidougou", "airport": "Kissidougou Airport", "iata": "KSI", "country": "GN"},
-            {"city": "Kisumu", "airport": "Kisumu Airport", "iata": "KIS", "country": "KE"},
-            {"city": "Kitaakita", "airport": "Odate Noshiro Airport", "iata": "ONJ", "country": "JP"},
-            {"city": "Kitadaitōjima", "airport": "Kitadaito Airport", "iata": "KTD", "country": "JP"},
-            {"city": "Kitakyushu", "airport": "Kitakyushu Airport", "iata": "KKJ", "country": "JP"},
-            {"city": "Kitale", "airport": "Kitale Airport", "iata": "KTL", "country": "KE"},
-            {"city": "Kitava Island", "airport": "Kitava Airport", "iata": "KVE", "country": "PG"},
-            {"city": "Kitee", "airport": "Kitee Airport", "iata": "KTQ", "country": "FI"},
-            {"city": "Kithira Island", "airport": "Kithira Airport", "iata": "KIT", "country": "GR"},
-            {"city": "Kitkatla", "airport": "Kitkatla Seaplane Base", "iata": "YKK", "country": "CA"},
-            {"city": "Kitoi Bay", "airport": "Kitoi Bay Seaplane Base", "iata": "KKB", "country": "US"},
-            {"city": "Kitsissuarsuit", "airport": "Kitsissuarsuit Heliport", "iata": "QJE", "country": "GL"},
-            {"city": "Kittilä", "airport": "Kittilä Airport", "iata": "KTT", "country": "FI"},
-            {"city": "Kitwe", "airport": "Southdowns Airport", "iata": "KIW", "country": "ZM"},
-            {"city": "Kitzingen", "airport": "Kitzingen Airfield", "iata": "KZG", "country": "DE"},
-            {"city": "Kiunga", "airport": "Kiunga Airport", "iata": "UNG", "country": "PG"},
-            {"city": "Kiunga", "airport": "Kiunga Airport", "iata": "KIU", "country": "KE"},
-            {"city": "Kivalina", "airport": "Kivalina Airport", "iata": "KVL", "country": "US"},
-            {"city": "Kiwayu", "airport": "Kiwayu Airport", "iata": "KWY", "country": "KE"},
-            {"city": "Kjevik", "airport": "Kristiansand Airport, Kjevik", "iata": "KRS", "country": "NO"},
-            {"city": "Klagenfurt am Wörthersee", "airport": "Klagenfurt Airport", "iata": "KLU", "country": "AT"},
-            {"city": "Klamath Falls", "airport": "Crater Lake-Klamath Regional Airport", "iata": "LMT", "country": "US"},
-            {"city": "Klanten flyplass", "airport": "Gol Airport", "iata": "GLL", "country": "NO"},
-            {"city": "Klawock", "airport": "Klawock Airport", "iata": "KLW", "country": "US"},
-            {"city": "Kleinsee", "airport": "Kleinsee Airport", "iata": "KLZ", "country": "ZA"},
-            {"city": "Klemtu", "airport": "Klemtu Water Aerodrome", "iata": "YKT", "country": "CA"},
-            {"city": "Klerksdorp", "airport": "P C Pelser Airport", "iata": "KXE", "country": "ZA"},
-            {"city": "Klisa", "airport": "Osijek Airport", "iata": "OSI", "country": "HR"},
-            {"city": "Knee Lake", "airport": "Knee Lake Airport", "iata": "YKE", "country": "CA"},
-            {"city": "Kneeland", "airport": "Kneeland Airport", "iata": "NLN", "country": "US"},
-            {"city": "Knob Noster", "airport": "Whiteman Air Force Base", "iata": "SZL", "country": "US"},
-            {"city": "Kobe", "airport": "Kobe Airport", "iata": "UKB", "country": "JP"},
-            {"city": "Kobuk", "airport": "Kobuk Airport", "iata": "OBU", "country": "US"},
-            {"city": "Kochi", "airport": "Cochin International Airport", "iata": "COK", "country": "IN"},
-            {"city": "Kodiak", "airport": "Kodiak Airport", "iata": "ADQ", "country": "US"},
-            {"city": "Kodiak", "airport": "Kodiak Municipal Airport", "iata": "KDK", "country": "US"},
-            {"city": "Kogalym", "airport": "Kogalym International Airport", "iata": "KGP", "country": "RU"},
-            {"city": "Kohat", "airport": "Kohat Airport", "iata": "OHT", "country": "PK"},
-            {"city": "Koingnaas", "airport": "Koingnaas Airport", "iata": "KIG", "country": "ZA"},
-            {"city": "Kokand", "airport": "Kokand Airport", "iata": "OQN", "country": "UZ"},
-            {"city": "Kokhanok", "airport": "Kokhanok Airport", "iata": "KNK", "country": "US"},
-            {"city": "Kokkola / Kruunupyy", "airport": "Kokkola-Pietarsaari Airport", "iata": "KOK", "country": "FI"},
-            {"city": "Kokoda", "airport": "Kokoda Airport", "iata": "KKD", "country": "PG"},
-            {"city": "Kokomo", "airport": "Kokomo Municipal Airport", "iata": "OKK", "country": "US"},
-            {"city": "Kokonao", "airport": "Kokonao Airport", "iata": "KOX", "country": "ID"},
-            {"city": "Kokopo", "airport": "Tokua Airport", "iata": "RAB", "country": "PG"},
-            {"city": "Kokshetau", "airport": "Kokshetau Airport", "iata": "KOV", "country": "KZ"},
-            {"city": "Kol", "airport": "Kol Airport", "iata": "KQL", "country": "PG"},
-            {"city": "Kolaka", "airport": "Sangia Nibandera Airport", "iata": "KXB", "country": "ID"},
-            {"city": "Kolda", "airport": "Kolda Airport", "iata": "KDA", "country": "SN"},
-            {"city": "Kolhapur", "airport": "Kolhapur Airport", "iata": "KLH", "country": "IN"},
-            {"city": "Koliganek", "airport": "Koliganek Airport", "iata": "KGK", "country": "US"},
-            {"city": "Kolkata", "airport": "Netaji Subhash Chandra Bose International Airport", "iata": "CCU", "country": "IN"},
-            {"city": "Kolombangara Island", "airport": "Kukudu Airport", "iata": "KUE", "country": "SB"},
-            {"city": "Kolwezi", "airport": "Kolwezi Airport", "iata": "KWZ", "country": "CD"},
-            {"city": "Komaio", "airport": "Komaio Airport", "iata": "KCJ", "country": "PG"},
-            {"city": "Komako", "airport": "Komako Airport", "iata": "HOC", "country": "PG"},
-            {"city": "Komatipoort", "airport": "Komatipoort Airport", "iata": "KOF", "country": "ZA"},
-            {"city": "Komo", "airport": "Komo-Manda Airport", "iata": "KOM", "country": "PG"},
-            {"city": "Komsomolsk-on-Amur", "airport": "Komsomolsk-on-Amur Airport", "iata": "KXK", "country": "RU"},
-            {"city": "Konambe", "airport": "Koinambe Airport", "iata": "KMB", "country": "PG"},
-            {"city": "Konarak", "airport": "Chabahar Konarak International Airport", "iata": "ZBR", "country": "IR"},
-            {"city": "Konawaruk", "airport": "Konawaruk Airport", "iata": "KKG", "country": "GY"},
-            {"city": "Kondinskoye", "airport": "Kondinskoye Airport", "iata": "KXD", "country": "RU"},
-            {"city": "Kondobol", "airport": "Kondobol Airport", "iata": "KPF", "country": "PG"},
-            {"city": "Konge", "airport": "Konge Airport", "iata": "KGB", "country": "PG"},
-            {"city": "Kongiganak", "airport": "Kongiganak Airport", "iata": "KKH", "country": "US"},
-            {"city": "Kongolo", "airport": "Kongolo Airport", "iata": "KOO", "country": "CD"},
-            {"city": "Konya", "airport": "Konya Airport", "iata": "KYA", "country": "TR"},
-            {"city": "Koné", "airport": "Koné Airport", "iata": "KNQ", "country": "NC"},
-            {"city": "Koodaideri Mine", "airport": "Koodaideri Mine Airport", "iata": "OOD", "country": "AU"},
-            {"city": "Koolan Island", "airport": "Koolan Central Airport", "iata": "KCI", "country": "AU"},
-            {"city": "Koolburra", "airport": "Koolburra Airport", "iata": "KKP", "country": "AU"},
-            {"city": "Kopiago", "airport": "Kopiago Airport", "iata": "KPA", "country": "PG"},
-            {"city": "Kopitnari", "airport": "David the Builder Kutaisi International Airport", "iata": "KUT", "country": "GE"},
-            {"city": "Korhogo", "airport": "Korhogo Airport", "iata": "HGO", "country": "CI"},
-            {"city": "Korla", "airport": "Korla Licheng Airport", "iata": "KRL", "country": "CN"},
-            {"city": "Kornasoren", "airport": "Kornasoren Airport", "iata": "FOO", "country": "ID"},
-            {"city": "Koro Island", "airport": "Koro Island Airport", "iata": "KXF", "country": "FJ"},
-            {"city": "Koroba", "airport": "Koroba Airport", "iata": "KDE", "country": "PG"},
-            {"city": "Korolevu", "airport": "Korolevu Seaplane Base", "iata": "KVU", "country": "FJ"},
-            {"city": "Koromiko", "airport": "Picton Aerodrome", "iata": "PCN", "country": "NZ"},
-            {"city": "Kos Island", "airport": "Kos Airport", "iata": "KGS", "country": "GR"},
-            {"city": "Kosciusko", "airport": "Kosciusko Attala County Airport", "iata": "OSX", "country": "US"},
-            {"city": "Kosipe Mission", "airport": "Kosipe Airport", "iata": "KSP", "country": "PG"},
-            {"city": "Kostanay", "airport": "Kostanay West Airport", "iata": "KSN", "country": "KZ"},
-            {"city": "Kostroma", "airport": "Kostroma Sokerkino Airport", "iata": "KMW", "country": "RU"},
-            {"city": "Kota", "airport": "Kota Airport", "iata": "KTU", "country": "IN"},
-            {"city": "Kota Baharu", "airport": "Sultan Ismail Petra Airport", "iata": "KBR", "country": "MY"},
-            {"city": "Kota Kinabalu", "airport": "Kota Kinabalu International Airport", "iata": "BKI", "country": "MY"},
-            {"city": "Kota Mobagu", "airport": "Kota Mobagu/Mopait Airport", "iata": "BJG", "country": "ID"},
-            {"city": "Kotabangun-Borneo Island", "airport": "Kotabangun Airport", "iata": "KOD", "country": "ID"},
-            {"city": "Kotakoli", "airport": "Kotakoli Airbase", "iata": "KLI", "country": "CD"},
-            {"city": "Kotlas", "airport": "Kotlas Airport", "iata": "KSZ", "country": "RU"},
-            {"city": "Kotlik", "airport": "Kotlik Airport", "iata": "KOT", "country": "US"},
-            {"city": "Kotzebue", "airport": "Ralph Wien Memorial Airport", "iata": "OTZ", "country": "US"},
-            {"city": "Koulamoutou", "airport": "Koulamoutou Mabimbi Airport", "iata": "KOU", "country": "GA"},
-            {"city": "Koumac", "airport": "Koumac Airport", "iata": "KOC", "country": "NC"},
-            {"city": "Koundara", "airport": "Sambailo Airport", "iata": "SBI", "country": "GN"},
-            {"city": "Koutiala", "airport": "Koutiala Airport", "iata": "KTX", "country": "ML"},
-            {"city": "Kowanyama", "airport": "Kowanyama Airport", "iata": "KWM", "country": "AU"},
-            {"city": "Koyuk", "airport": "Koyuk Alfred Adams Airport", "iata": "KKA", "country": "US"},
-            {"city": "Koyukuk", "airport": "Koyukuk Airport", "iata": "KYU", "country": "US"},
-            {"city": "Kozani", "airport": "Kozani National Airport Filippos", "iata": "KZI", "country": "GR"},
-            {"city": "Košice", "airport": "Košice International Airport", "iata": "KSC", "country": "SK"},
-            {"city": "Krabi", "airport": "Krabi Airport", "iata": "KBV", "country": "TH"},
-            {"city": "Krakor", "airport": "Krakor Airport", "iata": "KZD", "country": "KH"},
-            {"city": "Kralendijk", "airport": "Flamingo International Airport", "iata": "BON", "country": "BQ"},
-            {"city": "Kraljevo", "airport": "Morava Airport", "iata": "KVO", "country": "RS"},
-            {"city": "Kramatorsk", "airport": "Kramatorsk Airport", "iata": "KRQ", "country": "UA"},
-            {"city": "Krasnodar", "airport": "Krasnodar Pashkovsky International Airport", "iata": "KRR", "country": "RU"},
-            {"city": "Krasnoselkup", "airport": "Krasnoselkup Airport", "iata": "KKQ", "country": "RU"},
-            {"city": "Krasnoyarsk", "airport": "Krasnoyarsk International Airport", "iata": "KJA", "country": "RU"},
-            {"city": "Krasnoyarsk", "airport": "Krasnoyarsk Cheremshanka Airport", "iata": "KCY", "country": "RU"},
-            {"city": "Krasnyi Kurgan", "airport": "Anapa Vityazevo Airport", "iata": "AAQ", "country": "RU"},
-            {"city": "Kremenchuk", "airport": "Kakhnovka Airfield", "iata": "KHU", "country": "UA"},
-            {"city": "Kribi", "airport": "Kribi Airport", "iata": "KBI", "country": "CM"},
-            {"city": "Kristianstad", "airport": "Kristianstad Airport", "iata": "KID", "country": "SE"},
-            {"city": "Krong Khemara Phoumin", "airport": "Koh Kong Airport", "iata": "KKZ", "country": "KH"},
-            {"city": "Krui", "airport": "Muhammad Taufiq Kiemas Airport", "iata": "TFY", "country": "ID"},
-            {"city": "Krymsk", "airport": "Krymsk Air Base", "iata": "NOI", "country": "RU"},
-            {"city": "Kryvyi Rih", "airport": "Kryvyi Rih International Airport", "iata": "KWG", "country": "UA"},
-            {"city": "Kuala Kurun", "airport": "Kuala Kurun Airport", "iata": "GXM", "country": "ID"},
-            {"city": "Kuala Pesisir", "airport": "Cut Nyak Dhien Airport", "iata": "MEQ", "country": "ID"},
-            {"city": "Kuala Terengganu", "airport": "Sultan Mahmud Airport", "iata": "TGG", "country": "MY"},
-            {"city": "Kuantan", "airport": "Kuantan Airport", "iata": "KUA", "country": "MY"},
-            {"city": "Kubin Island", "airport": "Kubin Island Airport", "iata": "KUG", "country": "AU"},
-            {"city": "Kuching", "airport": "Kuching International Airport", "iata": "KCH", "country": "MY"},
-            {"city": "Kudahuvadhoo", "airport": "Dhaalu Atoll Airport", "iata": "DDD", "country": "MV"},
-            {"city": "Kudat", "airport": "Kudat Airport", "iata": "KUD", "country": "MY"},
-            {"city": "Kufra", "airport": "Kufra Airport", "iata": "AKF", "country": "LY"},
-            {"city": "Kugaaruk", "airport": "Kugaaruk Airport", "iata": "YBB", "country": "CA"},
-            {"city": "Kugluktuk", "airport": "Kugluktuk Airport", "iata": "YCO", "country": "CA"},
-            {"city": "Kuito", "airport": "Kuito Airport", "iata": "SVP", "country": "AO"},
-            {"city": "Kukës", "airport": "Kukës International Airport", "iata": "KFZ", "country": "AL"},
-            {"city": "Kulhudhuffushi", "airport": "Kulhudhuffushi Airport", "iata": "HDK", "country": "MV"},
-            {"city": "Kulik Lake", "airport": "Kulik Lake Airport", "iata": "LKK", "country": "US"},
-            {"city": "Kullorsuaq", "airport": "Kullorsuaq Heliport", "iata": "KHQ", "country": "GL"},
-            {"city": "Kulusuk", "airport": "Kulusuk Airport", "iata": "KUS", "country": "GL"},
-            {"city": "Kulyab", "airport": "Kulob Airport", "iata": "TJU", "country": "TJ"},
-            {"city": "Kumaka", "airport": "Bemichi Airport", "iata": "BCG", "country": "GY"},
-            {"city": "Kumamoto", "airport": "Kumamoto Airport", "iata": "KMJ", "country": "JP"},
-            {"city": "Kumasi", "airport": "Kumasi Airport", "iata": "KMS", "country": "GH"},
-            {"city": "Kumejima", "airport": "Kumejima Airport", "iata": "UEO", "country": "JP"},
-            {"city": "Kundiawa", "airport": "Chimbu Airport", "iata": "CMU", "country": "PG"},
-            {"city": "Kunduz", "airport": "Kunduz Airport", "iata": "UND", "country": "AF"},
-            {"city": "Kungim", "airport": "Kungim Airport", "iata": "KGM", "country": "PG"},
-            {"city": "Kunming", "airport": "Kunming Changshui International Airport", "iata": "KMG", "country": "CN"},
-            {"city": "Kununurra", "airport": "East Kimberley Regional (Kununurra) Airport", "iata": "KNX", "country": "AU"},
-            {"city": "Kuopio / Siilinjärvi", "airport": "Kuopio Airport", "iata": "KUO", "country": "FI"},
-            {"city": "Kupang", "airport": "El Tari Airport", "iata": "KOE", "country": "ID"},
-            {"city": "Kuparuk", "airport": "Ugnu-Kuparuk Airport", "iata": "UUK", "country": "US"},
-            {"city": "Kupiano", "airport": "Kupiano Airport", "iata": "KUP", "country": "PG"},
-            {"city": "Kuqa", "airport": "Kuqa Qiuci Airport", "iata": "KCA", "country": "CN"},
-            {"city": "Kuressaare", "airport": "Kuressaare Airport", "iata": "URE", "country": "EE"},
-            {"city": "Kurgan", "airport": "Kurgan Airport", "iata": "KRO", "country": "RU"},
-            {"city": "Kurgan-Tyube", "airport": "Qurghonteppa International Airport", "iata": "KQT", "country": "TJ"},
-            {"city": "Kuri", "airport": "Kuri Airport", "iata": "KUQ", "country": "PG"},
-            {"city": "Kuria", "airport": "Kuria Airport", "iata": "KUC", "country": "KI"},
-            {"city": "Kurilsk", "airport": "Burevestnik Airport", "iata": "BVV", "country": "RU"},
-            {"city": "Kurilsk", "airport": "Iturup Airport", "iata": "ITU", "country": "RU"},
-            {"city": "Kursk", "airport": "Kursk East Airport", "iata": "URS", "country": "RU"},
-            {"city": "Kuruman", "airport": "Johan Pienaar Airport", "iata": "KMH", "country": "ZA"},
-            {"city": "Kurundi Station", "airport": "Kurundi Airport", "iata": "KRD", "country": "AU"},
-            {"city": "Kushinagar", "airport": "Kushinagar International Airport", "iata": "KBK", "country": "IN"},
-            {"city": "Kushiro", "airport": "Kushiro Airport", "iata": "KUH", "country": "JP"},
-            {"city": "Kuta, Badung", "airport": "Denpasar I Gusti Ngurah Rai International Airport", "iata": "DPS", "country": "ID"},
-            {"city": "Kutacane", "airport": "Alas Leuser Airport", "iata": "LSR", "country": "ID"},
-            {"city": "Kuujjuaq", "airport": "Kuujjuaq Airport", "iata": "YVP", "country": "CA"},
-            {"city": "Kuujjuarapik", "airport": "Kuujjuarapik Airport", "iata": "YGW", "country": "CA"},
-            {"city": "Kuummiut", "airport": "Kuummiut Heliport", "iata": "KUZ", "country": "GL"},
-            {"city": "Kuusamo", "airport": "Kuusamo Airport", "iata": "KAO", "country": "FI"},
-            {"city": "Kuwait City", "airport": "Kuwait International Airport", "iata": "KWI", "country": "KW"},
-            {"city": "Kvernberget", "airport": "Kristiansund Airport, Kvernberget", "iata": "KSU", "country": "NO"},
-            {"city": "Kwailabesi", "airport": "Kwailabesi Airport", "iata": "KWS", "country": "SB"},
-            {"city": "Kwajalein", "airport": "Bucholz Army Air Field", "iata": "KWA", "country": "MH"},
-            {"city": "Kwatta", "airport": "Eduard Alexander Gummels Airport", "iata": "EAX", "country": "SR"},
-            {"city": "Kwethluk", "airport": "Kwethluk Airport", "iata": "KWT", "country": "US"},
-            {"city": "Kwigillingok", "airport": "Kwigillingok Airport", "iata": "KWK", "country": "US"},
-            {"city": "Kyaukpyu", "airport": "Kyaukpyu Airport", "iata": "KYP", "country": "MM"},
-            {"city": "Kyauktu", "airport": "Kyauktu Airport", "iata": "KYT", "country": "MM"},
-            {"city": "Kyiv", "airport": "Ihor Sikorsky Kyiv International Airport (Zhuliany)", "iata": "IEV", "country": "UA"},
-            {"city": "Kyzyl", "airport": "Kyzyl Airport", "iata": "KYZ", "country": "RU"},
-            {"city": "Kyzylorda", "airport": "Kyzylorda Airport", "iata": "KZO", "country": "KZ"},
-            {"city": "Kzyl-Yar", "airport": "Oktyabrskiy Airport", "iata": "OKT", "country": "RU"},
-            {"city": "Kärdla", "airport": "Kärdla Airport", "iata": "KDL", "country": "EE"},
-            {"city": "Kédougou", "airport": "Kédougou Airport", "iata": "KGG", "country": "SN"},
-            {"city": "Kópasker", "airport": "Kópasker Airport", "iata": "OPA", "country": "IS"},
-            {"city": "Köln (Cologne)", "airport": "Cologne Bonn Airport", "iata": "CGN", "country": "DE"},
-            {"city": "Köthen (Anhalt)", "airport": "Köthen Airport", "iata": "KOQ", "country": "DE"},
-            {"city": "L'Hôpital-le-Mercier, Saône-et-Loire", "airport": "Saint-Yan Airport", "iata": "SYT", "country": "FR"},
-            {"city": "La Baie", "airport": "CFB Bagotville / Saguenay-Bagotville Airport", "iata": "YBG", "country": "CA"},
-            {"city": "La Baule-Escoublac", "airport": "La Baule-Escoublac Airport", "iata": "LBY", "country": "FR"},
-            {"city": "La Ceiba", "airport": "Goloson International Airport", "iata": "LCE", "country": "HN"},
-            {"city": "La Chorrera", "airport": "Virgilio Barco Vargas (La Chorrera) Airport", "iata": "LCR", "country": "CO"},
-            {"city": "La Crosse", "airport": "La Crosse Regional Airport", "iata": "LSE", "country": "US"},
-            {"city": "La Cumbre", "airport": "La Cumbre Airport", "iata": "LCM", "country": "AR"},
-            {"city": "La Dorada", "airport": "German Olano Air Base", "iata": "PAL", "country": "CO"},
-            {"city": "La Esperanza", "airport": "La Esperanza Airport", "iata": "LEZ", "country": "HN"},
-            {"city": "La Fortuna", "airport": "La Fortuna Arenal Airport", "iata": "FON", "country": "CR"},
-            {"city": "La Grande", "airport": "La Grande/Union County Airport", "iata": "LGD", "country": "US"},
-            {"city": "La Grande Rivière", "airport": "La Grande Rivière Airport", "iata": "YGL", "country": "CA"},
-            {"city": "La Grande-3", "airport": "La Grande-3 Airport", "iata": "YAR", "country": "CA"},
-            {"city": "La Grande-4", "airport": "La Grande-4 Airport", "iata": "YAH", "country": "CA"},
-            {"city": "La Isabela", "airport": "La Isabela International Airport", "iata": "JBQ", "country": "DO"},
-            {"city": "La Lima", "airport": "La Lima - Reginaldo Hammer Airport", "iata": "LLH", "country": "HN"},
-            {"city": "La Macarena", "airport": "La Macarena Airport", "iata": "LMC", "country": "CO"},
-            {"city": "La Macaza", "airport": "Mont-Tremblant International Airport", "iata": "YTM", "country": "CA"},
-            {"city": "La Mina-Maicao", "airport": "Jorge Isaac Airport", "iata": "MCJ", "country": "CO"},
-            {"city": "La Paz", "airport": "Manuel Márquez de León International Airport", "iata": "LAP", "country": "MX"},
-            {"city": "La Paz / El Alto", "airport": "El Alto International Airport", "iata": "LPB", "country": "BO"},
-            {"city": "La Pedrera", "airport": "La Pedrera Airport", "iata": "LPD", "country": "CO"},
-            {"city": "La Plata", "airport": "La Plata Airport", "iata": "LPG", "country": "AR"},
-            {"city": "La Porte", "airport": "La Porte Municipal Airport", "iata": "LPO", "country": "US"},
-            {"city": "La Primavera", "airport": "La Primavera Airport", "iata": "LPE", "country": "CO"},
-            {"city": "La Ribera", "airport": "Punta Colorada Airport", "iata": "PCO", "country": "MX"},
-            {"city": "La Rioja", "airport": "Capitan V A Almonacid Airport", "iata": "IRJ", "country": "AR"},
-            {"city": "La Roche-sur-Yon", "airport": "La Roche-sur-Yon Les Ajoncs Airport", "iata": "EDM", "country": "FR"},
-            {"city": "La Rochelle", "airport": "La Rochelle Île de Ré Airport", "iata": "LRH", "country": "FR"},
-            {"city": "La Romana", "airport": "Casa De Campo International Airport", "iata": "LRM", "country": "DO"},
-            {"city": "La Ronge", "airport": "La Ronge Airport", "iata": "YVC", "country": "CA"},
-            {"city": "La Rosita", "airport": "Rosita Airport", "iata": "RFS", "country": "NI"},
-            {"city": "La Sarre", "airport": "La Sarre Airport", "iata": "SSQ", "country": "CA"},
-            {"city": "La Serena-Coquimbo", "airport": "La Florida Airport", "iata": "LSC", "country": "CL"},
-            {"city": "La Seu d'Urgell Pyrenees and Andorra", "airport": "Pirineus - la Seu d'Urgel Airport", "iata": "LEU", "country": "ES"},
-            {"city": "La Tabatière", "airport": "La Tabatière Airport", "iata": "ZLT", "country": "CA"},
-            {"city": "La Toma (Catamayo)", "airport": "Ciudad de Catamayo Airport", "iata": "LOH", "country": "EC"},
-            {"city": "La Tuque", "airport": "La Tuque Airport", "iata": "YLQ", "country": "CA"},
-            {"city": "La Unión", "airport": "Carta Airport", "iata": "LUI", "country": "HN"},
-            {"city": "La Uribe", "airport": "Uribe Airport", "iata": "URI", "country": "CO"},
-            {"city": "La Verne", "airport": "Brackett Field", "iata": "POC", "country": "US"},
-            {"city": "La Virgen Del Camino", "airport": "León Int'l Airport", "iata": "LEN", "country": "ES"},
-            {"city": "LaGrange", "airport": "LaGrange Callaway Airport", "iata": "LGC", "country": "US"},
-            {"city": "Laage", "airport": "Rostock-Laage Airport", "iata": "RLG", "country": "DE"},
-            {"city": "Lab Lab Mission", "airport": "Lab Lab Airport", "iata": "LAB", "country": "PG"},
-            {"city": "Labasa", "airport": "Labasa Airport", "iata": "LBS", "country": "FJ"},
-            {"city": "Labuan", "airport": "Labuan Airport", "iata": "LBU", "country": "MY"},
-            {"city": "Labuan Bajo, Manggarai Barat", "airport": "Komodo Airport", "iata": "LBJ", "country": "ID"},
-            {"city": "Labuha-Halmahera Island", "airport": "Oesman Sadik Airport", "iata": "LAH", "country": "ID"},
-            {"city": "Labé", "airport": "Tata Airport", "iata": "LEK", "country": "GN"},
-            {"city": "Lac Brochet", "airport": "Lac Brochet Airport", "iata": "XLB", "country": "CA"},
-            {"city": "Lac La Biche", "airport": "Lac La Biche Airport", "iata": "YLB", "country": "CA"},
-            {"city": "Laceby", "airport": "Wangaratta Airport", "iata": "WGT", "country": "AU"},
-            {"city": "Laconia / Gilford", "airport": "Laconia Municipal Airport", "iata": "LCI", "country": "US"},
-            {"city": "Lady Elliot Island", "airport": "Lady Elliot Island Airstrip", "iata": "LYT", "country": "AU"},
-            {"city": "Ladysmith", "airport": "Ladysmith Airport", "iata": "LAY", "country": "ZA"},
-            {"city": "Lae", "airport": "Nadzab Airport", "iata": "LAE", "country": "PG"},
-            {"city": "Lae Island", "airport": "Lae Island Airport", "iata": "LML", "country": "MH"},
-            {"city": "Laem Ngop", "airport": "Trat Airport", "iata": "TDX", "country": "TH"},
-            {"city": "Lafayette", "airport": "Lafayette Regional Airport", "iata": "LFT", "country": "US"},
-            {"city": "Lafontaine", "airport": "Caviahue Airport", "iata": "CVH", "country": "AR"},
-            {"city": "Lages", "airport": "Lages Airport", "iata": "LAJ", "country": "BR"},
-            {"city": "Laghouat", "airport": "Laghouat - Molay Ahmed Medeghri Airport", "iata": "LOO", "country": "DZ"},
-            {"city": "Lago Agrio", "airport": "Nueva Loja Airport", "iata": "LGQ", "country": "EC"},
-            {"city": "Lagos", "airport": "Murtala Muhammed International Airport", "iata": "LOS", "country": "NG"},
-            {"city": "Lagos de Moreno", "airport": "Francisco Primo de Verdad y Ramos Airport", "iata": "LOM", "country": "MX"},
-            {"city": "Lague", "airport": "Lague Airport", "iata": "LCO", "country": "CG"},
-            {"city": "Laguindingan", "airport": "Laguindingan International Airport", "iata": "CGY", "country": "PH"},
-            {"city": "Lagunillas", "airport": "Lagunillas Airport", "iata": "LGY", "country": "VE"},
-            {"city": "Lahad Datu", "airport": "Lahad Datu Airport", "iata": "LDU", "country": "MY"},
-            {"city": "Lahaina", "airport": "Kapalua Airport", "iata": "JHM", "country": "US"},
-            {"city": "Lahore", "airport": "Allama Iqbal International Airport", "iata": "LHE", "country": "PK"},
-            {"city": "Lahr/Schwarzwald", "airport": "Lahr Airport", "iata": "LHA", "country": "DE"},
-            {"city": "Lai", "airport": "Lai Airport", "iata": "LTC", "country": "TD"},
-            {"city": "Lajamanu", "airport": "Hooker Creek Airport", "iata": "HOK", "country": "AU"},
-            {"city": "Lake Baringo", "airport": "Lake Baringo (Kampi Ya Samaki) Airport", "iata": "LBN", "country": "KE"},
-            {"city": "Lake Charles", "airport": "Chennault International Airport", "iata": "CWF", "country": "US"},
-            {"city": "Lake Charles", "airport": "Lake Charles Regional Airport", "iata": "LCH", "country": "US"},
-            {"city": "Lake City", "airport": "Lake City Gateway Airport", "iata": "LCQ", "country": "US"},
-            {"city": "Lake Geneva", "airport": "Grand Geneva Resort Airport", "iata": "XES", "country": "US"},
-            {"city": "Lake Gregory", "airport": "Mulan Airport", "iata": "LGE", "country": "AU"},
-            {"city": "Lake Havasu City", "airport": "Lake Havasu City International Airport", "iata": "HII", "country": "US"},
-            {"city": "Lake Manyara National Park", "airport": "Lake Manyara Airport", "iata": "LKY", "country": "TZ"},
-            {"city": "Lake Murray", "airport": "Lake Murray Airport", "iata": "LMY", "country": "PG"},
-            {"city": "Lake Placid", "airport": "Lake Placid Airport", "iata": "LKP", "country": "US"},
-            {"city": "Lakeba Island", "airport": "Lakeba Island Airport", "iata": "LKB", "country": "FJ"},
-            {"city": "Lakefield", "airport": "Lakefield Airport", "iata": "LFP", "country": "AU"},
-            {"city": "Lakefield National Park", "airport": "Bizant Airport", "iata": "BZP", "country": "AU"},
-            {"city": "Lakehurst", "airport": "Lakehurst Maxfield Field Airport", "iata": "NEL", "country": "US"},
-            {"city": "Lakeland", "airport": "Lakeland Linder International Airport", "iata": "LAL", "country": "US"},
-            {"city": "Lakeland Downs", "airport": "Lakeland Airport", "iata": "LKD", "country": "AU"},
-            {"city": "Lakeport", "airport": "Lampson Field", "iata": "CKE", "country": "US"},
-            {"city": "Lakeview", "airport": "Lake County Airport", "iata": "LKV", "country": "US"},
-            {"city": "Lakselv", "airport": "Lakselv Airport, Banak", "iata": "LKL", "country": "NO"},
-            {"city": "Lal-lo", "airport": "Cagayan North International Airport", "iata": "LLC", "country": "PH"},
-            {"city": "Lamap", "airport": "Lamap Airport", "iata": "LPM", "country": "VU"},
-            {"city": "Lamar", "airport": "Southeast Colorado Regional Airport", "iata": "LAA", "country": "US"},
-            {"city": "Lambarene", "airport": "Lambarene Airport", "iata": "LBQ", "country": "GA"},
-            {"city": "Lamen Bay", "airport": "Lamen Bay Airport", "iata": "LNB", "country": "VU"},
-            {"city": "Lamerd", "airport": "Lamerd Airport", "iata": "LFM", "country": "IR"},
-            {"city": "Lamezia Terme (CZ)", "airport": "Lamezia Terme Sant'Eufemia International Airport", "iata": "SUF", "country": "IT"},
-            {"city": "Lamidanda", "airport": "Lamidanda Airport", "iata": "LDN", "country": "NP"},
-            {"city": "Lampedusa", "airport": "Lampedusa Airport", "iata": "LMP", "country": "IT"},
-            {"city": "Lamu", "airport": "Manda Airport", "iata": "LAU", "country": "KE"},
-            {"city": "Lanai City", "airport": "Lanai Airport", "iata": "LNY", "country": "US"},
-            {"city": "Lanas, Ardèche", "airport": "Aubenas-South Ardèche Airport", "iata": "OBS", "country": "FR"},
-            {"city": "Lancaster", "airport": "Lancaster Airport", "iata": "LNS", "country": "US"},
-            {"city": "Lancaster", "airport": "General William J Fox Airfield", "iata": "WJF", "country": "US"},
-            {"city": "Land's End, Cornwall", "airport": "Land's End Airport", "iata": "LEQ", "country": "GB"},
-            {"city": "Landasan Ulin", "airport": "Syamsudin Noor International Airport", "iata": "BDJ", "country": "ID"},
-            {"city": "Lander", "airport": "Hunt Field", "iata": "LND", "country": "US"},
-            {"city": "Landivisiau", "airport": "Landivisiau Air Base", "iata": "LDV", "country": "FR"},
-            {"city": "Langebaanweg", "airport": "Langebaanweg Airport", "iata": "SDB", "country": "ZA"},
-            {"city": "Langeoog", "airport": "Langeoog Airport", "iata": "LGO", "country": "DE"},
-            {"city": "Langgur", "airport": "Karel Sadsuitubun Airport", "iata": "LUV", "country": "ID"},
-            {"city": "Langkawi", "airport": "Langkawi International Airport", "iata": "LGK", "country": "MY"},
-            {"city": "Langley", "airport": "Langley Airport", "iata": "YLY", "country": "CA"},
-            {"city": "Langtang", "airport": "Langtang Airport", "iata": "LTG", "country": "NP"},
-            {"city": "Lankaran", "airport": "Lankaran International Airport", "iata": "LLK", "country": "AZ"},
-            {"city": "Lannion", "airport": "Lannion Airport", "iata": "LAI", "country": "FR"},
-            {"city": "Lanping Bai", "airport": "Lanping Fenghua General Airport", "iata": "LFH", "country": "CN"},
-            {"city": "Lansdowne House", "airport": "Lansdowne House Airport", "iata": "YLH", "country": "CA"},
-            {"city": "Lansdowne Station", "airport": "Lansdowne Airport", "iata": "LDW", "country": "AU"},
-            {"city": "Lansing", "airport": "Capital City Airport", "iata": "LAN", "country": "US"},
-            {"city": "Lanzhou (Yongdeng)", "airport": "Lanzhou Zhongchuan International Airport", "iata": "LHW", "country": "CN"},
-            {"city": "Laoag City", "airport": "Laoag International Airport", "iata": "LAO", "country": "PH"},
-            {"city": "Lappeenranta", "airport": "Lappeenranta Airport", "iata": "LPP", "country": "FI"},
-            {"city": "Lapu-Lapu City", "airport": "Mactan Cebu International Airport", "iata": "CEB", "country": "PH"},
-            {"city": "Lar", "airport": "Lar Airport", "iata": "LRR", "country": "IR"},
-            {"city": "Lara", "airport": "Avalon Airport", "iata": "AVV", "country": "AU"},
-            {"city": "Laramie", "airport": "Laramie Regional Airport", "iata": "LAR", "country": "US"},
-            {"city": "Laredo", "airport": "Laredo International Airport", "iata": "LRD", "country": "US"},
-            {"city": "Larissa", "airport": "Larissa Air Base", "iata": "LRA", "country": "GR"},
-            {"city": "Larnaca", "airport": "Larnaca International Airport", "iata": "LCA", "country": "CY"},
-            {"city": "Larsen Bay", "airport": "Larsen Bay Airport", "iata": "KLN", "country": "US"},
-            {"city": "Las Cruces", "airport": "Las Cruces International Airport", "iata": "LRU", "country": "US"},
-            {"city": "Las Heras", "airport": "Las Heras Airport", "iata": "LHS", "country": "AR"},
-            {"city": "Las Khorey", "airport": "Las Khorey Airport", "iata": "LKR", "country": "SO"},
-            {"city": "Las Lomitas", "airport": "Alferez Armando Rodriguez Airport", "iata": "LLS", "country": "AR"},
-            {"city": "Las Malvinas", "airport": "Las Malvinas/Echarate Airport", "iata": "VVN", "country": "PE"},
-            {"city": "Las Perlas", "airport": "San José Island Airport", "iata": "SIC", "country": "PA"},
-            {"city": "Las Tunas", "airport": "Hermanos Ameijeiras Airport", "iata": "VTU", "country": "CU"},
-            {"city": "Las Vegas", "airport": "Henderson Executive Airport", "iata": "HSH", "country": "US"},
-            {"city": "Las Vegas", "airport": "Harry Reid International Airport", "iata": "LAS", "country": "US"},
-            {"city": "Las Vegas", "airport": "Nellis Air Force Base", "iata": "LSV", "country": "US"},
-            {"city": "Las Vegas", "airport": "Las Vegas Municipal Airport", "iata": "LVS", "country": "US"},
-            {"city": "Las Vegas", "airport": "North Las Vegas Metropolitan International Airport", "iata": "VGT", "country": "US"},
-            {"city": "Lashio", "airport": "Lashio Airport", "iata": "LSH", "country": "MM"},
-            {"city": "Lashkar Gah", "airport": "Bost Airport", "iata": "BST", "country": "AF"},
-            {"city": "Lashkar Gah", "airport": "Camp Shorabak Airfield", "iata": "OAZ", "country": "AF"},
-            {"city": "Lastourville", "airport": "Lastourville Airport", "iata": "LTL", "country": "GA"},
-            {"city": "Latacunga", "airport": "Cotopaxi International Airport", "iata": "LTX", "country": "EC"},
-            {"city": "Latakia", "airport": "Hmeimim Air Base", "iata": "LTK", "country": "SY"},
-            {"city": "Latrobe", "airport": "Arnold Palmer Regional Airport", "iata": "LBE", "country": "US"},
-            {"city": "Latur", "airport": "Murod Kond Airport", "iata": "LTU", "country": "IN"},
-            {"city": "Laucala Island", "airport": "Laucala Island Airport", "iata": "LUC", "country": "FJ"},
-            {"city": "Launceston (Western Junction)", "airport": "Launceston Airport", "iata": "LST", "country": "AU"},
-            {"city": "Laura Station", "airport": "New Laura Airport", "iata": "LUT", "country": "AU"},
-            {"city": "Laurel", "airport": "Hesler Noble Field", "iata": "LUL", "country": "US"},
-            {"city": "Laurie River", "airport": "Laurie River Airport", "iata": "LRQ", "country": "CA"},
-            {"city": "Laval, Mayenne", "airport": "Laval-Entrammes Airport", "iata": "LVA", "country": "FR"},
-            {"city": "Lavan Airport", "airport": "Lavan Airport", "iata": "LVP", "country": "IR"},
-            {"city": "Laverton", "airport": "Laverton Airport", "iata": "LVO", "country": "AU"},
-            {"city": "Laverton", "airport": "Windarra Airport", "iata": "WND", "country": "AU"},
-            {"city": "Lavras", "airport": "Padre Israel Airport", "iata": "VRZ", "country": "BR"},
-            {"city": "Lawas", "airport": "Lawas Airport", "iata": "LWY", "country": "MY"},
-            {"city": "Lawrence", "airport": "Lawrence Municipal Airport", "iata": "LWC", "country": "US"},
-            {"city": "Lawrence", "airport": "Lawrence Municipal Airport", "iata": "LWM", "country": "US"},
-            {"city": "Lawrenceville", "airport": "Brunswick Municipal Airport", "iata": "LVL", "country": "US"},
-            {"city": "Lawrenceville", "airport": "Lawrenceville Vincennes International Airport", "iata": "LWV", "country": "US"},
-            {"city": "Lawrenceville", "airport": "Gwinnett County Briscoe Field", "iata": "LZU", "country": "US"},
-            {"city": "Lawrenceville", "airport": "O'Neal Airport", "iata": "OEA", "country": "US"},
-            {"city": "Lawton", "airport": "Lawton Fort Sill Regional Airport", "iata": "LAW", "country": "US"},
-            {"city": "Lazy Bay", "airport": "Alitak Seaplane Base", "iata": "ALZ", "country": "US"},
-            {"city": "Le Castellet, Var", "airport": "Le Castellet Airport", "iata": "CTT", "country": "FR"},
-            {"city": "Le Golfe-du-Saint-Laurent", "airport": "La Romaine Airport", "iata": "ZGS", "country": "CA"},
-            {"city": "Le Havre", "airport": "Le Havre-Octeville Airport", "iata": "LEH", "country": "FR"},
-            {"city": "Le Mans, Sarthe", "airport": "Le Mans-Arnage Airport", "iata": "LME", "country": "FR"},
-            {"city": "Le Mars", "airport": "Le Mars Municipal Airport", "iata": "LRJ", "country": "US"},
-            {"city": "Le Touquet-Paris-Plage", "airport": "Le Touquet-Côte d'Opale Airport", "iata": "LTQ", "country": "FR"},
-            {"city": "Leadville", "airport": "Lake County Airport", "iata": "LXV", "country": "US"},
-            {"city": "Leaf Rapids", "airport": "Leaf Rapids Airport", "iata": "YLR", "country": "CA"},
-            {"city": "Lebak", "airport": "Lebak Rural Airport", "iata": "LWA", "country": "PH"},
-            {"city": "Lebakeng", "airport": "Lebakeng Airport", "iata": "LEF", "country": "LS"},
-            {"city": "Lebanon", "airport": "Lebanon Municipal Airport", "iata": "LEB", "country": "US"},
-            {"city": "Lebel-sur-Quévillon", "airport": "Lebel-sur-Quevillon Airport", "iata": "YLS", "country": "CA"},
-            {"city": "Leeds, West Yorkshire", "airport": "Leeds Bradford Airport", "iata": "LBA", "country": "GB"},
-            {"city": "Leesburg", "airport": "Leesburg International Airport", "iata": "LEE", "country": "US"},
-            {"city": "Leeuwarden", "airport": "Leeuwarden Air Base", "iata": "LWR", "country": "NL"},
-            {"city": "Lefkoniko (Geçitkale)", "airport": "Lefkoniko Airport / Geçitkale Air Base", "iata": "GEC", "country": "CY"},
-            {"city": "Legazpi", "airport": "Bicol International Airport", "iata": "DRP", "country": "PH"},
-            {"city": "Leh", "airport": "Leh Kushok Bakula Rimpochee Airport", "iata": "IXL", "country": "IN"},
-            {"city": "Leirvik", "airport": "Stord Airport, Sørstokken", "iata": "SRP", "country": "NO"},
-            {"city": "Leitre", "airport": "Leitre Airport", "iata": "LTF", "country": "PG"},
-            {"city": "Lekana", "airport": "Lekana Airport", "iata": "LKC", "country": "CG"},
-            {"city": "Lekhwair", "airport": "Lekhwair Airport", "iata": "LKW", "country": "OM"},
-            {"city": "Leknes", "airport": "Leknes Airport", "iata": "LKN", "country": "NO"},
-            {"city": "Lekoni", "airport": "Lekoni Airport", "iata": "LEO", "country": "GA"},
-            {"city": "Lelystad", "airport": "Lelystad Airport", "iata": "LEY", "country": "NL"},
-            {"city": "Lemmon", "airport": "Lemmon Municipal Airport", "iata": "LEM", "country": "US"},
-            {"city": "Lemoore", "airport": "Lemoore Naval Air Station (Reeves Field) Airport", "iata": "NLC", "country": "US"},
-            {"city": "Lensk", "airport": "Lensk Airport", "iata": "ULK", "country": "RU"},
-            {"city": "Lençóis", "airport": "Coronel Horácio de Mattos Airport", "iata": "LEC", "country": "BR"},
-            {"city": "Leo", "airport": "Leo Airport", "iata": "XLU", "country": "BF"},
-            {"city": "Leonora", "airport": "Leonora Airport", "iata": "LNO", "country": "AU"},
-            {"city": "Leopoldina", "airport": "Leopoldina Airport", "iata": "LEP", "country": "BR"},
-            {"city": "Lereh-Papua Island", "airport": "Lereh Airport", "iata": "LHI", "country": "ID"},
-            {"city": "Leribe", "airport": "Leribe Airport", "iata": "LRB", "country": "LS"},
-            {"city": "Leron Plains", "airport": "Leron Plains Airport", "iata": "LPN", "country": "PG"},
-            {"city": "Leros Island", "airport": "Leros Airport", "iata": "LRS", "country": "GR"},
-            {"city": "Lerwick, Shetland", "airport": "Sumburgh Airport", "iata": "LSI", "country": "GB"},
-            {"city": "Lerwick, Shetland Islands", "airport": "Lerwick / Tingwall Airport", "iata": "LWK", "country": "GB"},
-            {"city": "Les Allues", "airport": "Méribel Altiport", "iata": "MFX", "country": "FR"},
-            {"city": "Les Cayes", "airport": "Antoine-Simon International Airport", "iata": "CYA", "country": "HT"},
-            {"city": "Les Sables-d'Olonne", "airport": "Les Sables-d'Olonne Talmont Airport", "iata": "LSO", "country": "FR"},
-            {"city": "Les Saintes", "airport": "Terre-de-Haut Airport", "iata": "LSS", "country": "GP"},
-            {"city": "Les Îles-de-la-Madeleine", "airport": "Îles-de-la-Madeleine Airport", "iata": "YGR", "country": "CA"},
-            {"city": "Lese", "airport": "Lese Airport", "iata": "LNG", "country": "PG"},
-            {"city": "Leshukonskoye", "airport": "Leshukonskoye Airport", "iata": "LDG", "country": "RU"},
-            {"city": "Lesobeng", "airport": "Lesobeng Airport", "iata": "LES", "country": "LS"},
-            {"city": "Lesquin", "airport": "Lille Airport", "iata": "LIL", "country": "FR"},
-            {"city": "Lethbridge", "airport": "Lethbridge County Airport", "iata": "YQL", "country": "CA"},
-            {"city": "Lethem", "airport": "Lethem Airport", "iata": "LTM", "country": "GY"},
-            {"city": "Leticia", "airport": "Alfredo Vásquez Cobo International Airport", "iata": "LET", "country": "CO"},
-            {"city": "Leuchars, Fife", "airport": "Leuchars Station Airfield", "iata": "ADX", "country": "GB"},
-            {"city": "Levaldigi (CN)", "airport": "Cuneo International Airport", "iata": "CUF", "country": "IT"},
-            {"city": "Levelock", "airport": "Levelock Airport", "iata": "KLL", "country": "US"},
-            {"city": "Lewisburg", "airport": "Greenbrier Valley Airport", "iata": "LWB", "country": "US"},
-            {"city": "Lewiston", "airport": "Lewiston Nez Perce County Airport", "iata": "LWS", "country": "US"},
-            {"city": "Lewistown", "airport": "Lewistown Municipal Airport", "iata": "LWT", "country": "US"},
-            {"city": "Lewoleba", "airport": "Wonopito Airport", "iata": "LWE", "country": "ID"},
-            {"city": "Lexington", "airport": "Blue Grass Airport", "iata": "LEX", "country": "US"},
-            {"city": "Lexington", "airport": "Jim Kelly Field", "iata": "LXN", "country": "US"},
-            {"city": "Lhok Seumawe-Sumatra Island", "airport": "Malikus Saleh Airport", "iata": "LSW", "country": "ID"},
-            {"city": "Lhok Sukon-Sumatra Island", "airport": "Lhok Sukon Airport", "iata": "LSX", "country": "ID"},
-            {"city": "Liangia", "airport": "Geva Airport", "iata": "GEF", "country": "SB"},
-            {"city": "Liangping", "airport": "Liangping Airport", "iata": "LIA", "country": "CN"},
-            {"city": "Liangshan (Xichang)", "airport": "Xichang Qingshan Airport", "iata": "XIC", "country": "CN"},
-            {"city": "Lianyungang", "airport": "Lianyungang Huaguoshan International Airport", "iata": "LYG", "country": "CN"},
-            {"city": "Libenge", "airport": "Libenge Airport", "iata": "LIE", "country": "CD"},
-            {"city": "Liberal", "airport": "Liberal Mid-America Regional Airport", "iata": "LBL", "country": "US"},
-            {"city": "Liberia", "airport": "Guanacaste Airport", "iata": "LIR", "country": "CR"},
-            {"city": "Liboi", "airport": "Liboi Airport", "iata": "LBK", "country": "KE"},
-            {"city": "Libreville", "airport": "Libreville Leon M'ba International Airport", "iata": "LBV", "country": "GA"},
-            {"city": "Lichinga", "airport": "Lichinga Airport", "iata": "VXC", "country": "MZ"},
-            {"city": "Lidköping", "airport": "Lidköping-Hovby Airport", "iata": "LDK", "country": "SE"},
-            {"city": "Liepāja", "airport": "Liepāja International Airport", "iata": "LPX", "country": "LV"},
-            {"city": "Lifou", "airport": "Lifou Airport", "iata": "LIF", "country": "NC"},
-            {"city": "Lifuka", "airport": "Lifuka Island Airport", "iata": "HPA", "country": "TO"},
-            {"city": "Lihue", "airport": "Lihue Airport", "iata": "LIH", "country": "US"},
-            {"city": "Lijiang (Gucheng)", "airport": "Lijiang Sanyi International Airport", "iata": "LJG", "country": "CN"},
-            {"city": "Likiep Island", "airport": "Likiep Airport", "iata": "LIK", "country": "MH"},
-            {"city": "Likoma Island", "airport": "Likoma Island Airport", "iata": "LIX", "country": "MW"},
-            {"city": "Lilabari", "airport": "Lilabari North Lakhimpur Airport", "iata": "IXI", "country": "IN"},
-            {"city": "Lima", "airport": "Lima Allen County Airport", "iata": "AOH", "country": "US"},
-            {"city": "Lima", "airport": "Jorge Chávez International Airport", "iata": "LIM", "country": "PE"},
-            {"city": "Limbang", "airport": "Limbang Airport", "iata": "LMN", "country": "MY"},
-            {"city": "Limbunya", "airport": "Limbunya Airport", "iata": "LIB", "country": "AU"},
-            {"city": "Lime Acres", "airport": "Lime Acres Finsch Mine Airport", "iata": "LMR", "country": "ZA"},
-            {"city": "Lime Village", "airport": "Lime Village Airport", "iata": "LVD", "country": "US"},
-            {"city": "Limestone", "airport": "Loring International Airport", "iata": "LIZ", "country": "US"},
-            {"city": "Limnos Island", "airport": "Limnos Airport", "iata": "LXS", "country": "GR"},
-            {"city": "Limoges/Bellegarde", "airport": "Limoges Airport", "iata": "LIG", "country": "FR"},
-            {"city": "Limon", "airport": "Limon Municipal Airport", "iata": "LIC", "country": "US"},
-            {"city": "Limón", "airport": "Limon Airport", "iata": "LMH", "country": "HN"},
-            {"city": "Linares", "airport": "Municipal de Linares Airport", "iata": "ZLR", "country": "CL"},
-            {"city": "Lincang", "airport": "Lincang Boshang Airport", "iata": "LNJ", "country": "CN"},
-            {"city": "Lincang (Cangyuan)", "airport": "Cangyuan Washan Airport", "iata": "CWJ", "country": "CN"},
-            {"city": "Lincoln", "airport": "Lincoln Airport", "iata": "LNK", "country": "US"},
-            {"city": "Lincoln, Lincolnshire", "airport": "RAF Coningsby", "iata": "QCY", "country": "GB"},
-            {"city": "Lincoln, Lincolnshire", "airport": "RAF Waddington", "iata": "WTN", "country": "GB"},
-            {"city": "Lindeman Island", "airport": "Lindeman Island Airport", "iata": "LDC", "country": "AU"},
-            {"city": "Linden", "airport": "Linden Airport", "iata": "LDJ", "country": "US"},
-            {"city": "Lindi", "airport": "Lindi Airport", "iata": "LDI", "country": "TZ"},
-            {"city": "Linfen (Yaodu)", "airport": "Linfen Yaodu Airport", "iata": "LFQ", "country": "CN"},
-            {"city": "Linga Linga", "airport": "Linga Linga Airport", "iata": "LGN", "country": "PG"},
-            {"city": "Linhares", "airport": "Linhares Municipal Airport", "iata": "LHN", "country": "BR"},
-            {"city": "Linköping", "airport": "Linköping City Airport", "iata": "LPI", "country": "SE"},
-            {"city": "Lins", "airport": "Lins Airport", "iata": "LIP", "country": "BR"},
-            {"city": "Linyi (Hedong)", "airport": "Linyi Qiyang Airport", "iata": "LYI", "country": "CN"},
-            {"city": "Linz", "airport": "Linz-Hörsching Airport / Vogler Air Base", "iata": "LNZ", "country": "AT"},
-            {"city": "Lipetsk", "airport": "Lipetsk Airport", "iata": "LPK", "country": "RU"},
-            {"city": "Liping", "airport": "Liping Airport", "iata": "HZH", "country": "CN"},
-            {"city": "Lisala", "airport": "Lisala Airport", "iata": "LIQ", "country": "CD"},
-            {"city": "Lisbon", "airport": "Lisbon Humberto Delgado Airport", "iata": "LIS", "country": "PT"},
-            {"city": "Lishui (Liandu)", "airport": "Lishui Airport", "iata": "LIJ", "country": "CN"},
-            {"city": "Lismore", "airport": "Lismore Airport", "iata": "LSY", "country": "AU"},
-            {"city": "Lissadell Station", "airport": "Lissadell Airport", "iata": "LLL", "country": "AU"},
-            {"city": "Little Grand Rapids", "airport": "Little Grand Rapids Airport", "iata": "ZGR", "country": "CA"},
-            {"city": "Little Rock", "airport": "Bill & Hillary Clinton National Airport/Adams Field", "iata": "LIT", "country": "US"},
-            {"city": "Littlefield", "airport": "Grand Canyon Bar Ten Airstrip", "iata": "GCT", "country": "US"},
-            {"city": "Liupanshui (Zhongshan)", "airport": "Liupanshui Yuezhao Airport", "iata": "LPF", "country": "CN"},
-            {"city": "Liuzhou (Liujiang)", "airport": "Liuzhou Bailian Airport / Bailian Air Base", "iata": "LZH", "country": "CN"},
-            {"city": "Livengood", "airport": "Livengood Camp Airport", "iata": "LIV", "country": "US"},
-            {"city": "Livermore", "airport": "Livermore Municipal Airport", "iata": "LVK", "country": "US"},
-            {"city": "Liverpool", "airport": "Liverpool John Lennon Airport", "iata": "LPL", "country": "GB"},
-            {"city": "Livingston", "airport": "Mission Field", "iata": "LVM", "country": "US"},
-            {"city": "Livingstone", "airport": "Harry Mwanga Nkumbula International Airport", "iata": "LVI", "country": "ZM"},
-            {"city": "Liwonde National Park", "airport": "Mvuu Camp Airport", "iata": "VUU", "country": "MW"},
-            {"city": "Lleida", "airport": "Lleida-Alguaire Airport", "iata": "ILD", "country": "ES"},
-            {"city": "Lloydminster", "airport": "Lloydminster Airport", "iata": "YLL", "country": "CA"},
-            {"city": "Lobatse", "airport": "Lobatse Airport", "iata": "LOQ", "country": "BW"},
-            {"city": "Lobito", "airport": "Lobito Airport", "iata": "LLT", "country": "AO"},
-            {"city": "Lock", "airport": "Lock Airport", "iata": "LOC", "country": "AU"},
-            {"city": "Lock Haven", "airport": "William T. Piper Memorial Airport", "iata": "LHV", "country": "US"},
-            {"city": "Lockhart River", "airport": "Lockhart River Airport", "iata": "IRG", "country": "AU"},
-            {"city": "Lodja", "airport": "Lodja Airport", "iata": "LJA", "country": "CD"},
-            {"city": "Lodwar", "airport": "Lodwar Airport", "iata": "LOK", "country": "KE"},
-            {"city": "Logan", "airport": "Logan-Cache Airport", "iata": "LGU", "country": "US"},
-            {"city": "Logroño", "airport": "Logroño-Agoncillo Airport", "iata": "RJL", "country": "ES"},
-            {"city": "Loh/Linua", "airport": "Torres Airstrip", "iata": "TOH", "country": "VU"},
-            {"city": "Loikaw", "airport": "Loikaw Airport", "iata": "LIW", "country": "MM"},
-            {"city": "Lokichogio", "airport": "Lokichogio Airport", "iata": "LKG", "country": "KE"},
-            {"city": "Lolak", "airport": "Bolaang Mongondow Airport", "iata": "LKM", "country": "ID"},
-            {"city": "Lomlom", "airport": "Lomlom Airport", "iata": "LLM", "country": "SB"},
-            {"city": "Lompoc", "airport": "Lompoc Airport", "iata": "LPC", "country": "US"},
-            {"city": "Lompoc", "airport": "Vandenberg Space Force Base", "iata": "VBG", "country": "US"},
-            {"city": "Lomé", "airport": "Lomé–Tokoin International Airport", "iata": "LFW", "country": "TG"},
-            {"city": "Loncopue", "airport": "Loncopue Airport", "iata": "LCP", "country": "AR"},
-            {"city": "Londolovit", "airport": "Londolovit Airport", "iata": "LNV", "country": "PG"},
-            {"city": "Londolozi", "airport": "Londolozi Airport", "iata": "LDZ", "country": "ZA"},
-            {"city": "London", "airport": "London Airport", "iata": "YXU", "country": "CA"},
-            {"city": "London", "airport": "London Biggin Hill Airport", "iata": "BQH", "country": "GB"},
-            {"city": "London", "airport": "London Gatwick Airport", "iata": "LGW", "country": "GB"},
-            {"city": "London", "airport": "London City Airport", "iata": "LCY", "country": "GB"},
-            {"city": "London", "airport": "London Heathrow Airport", "iata": "LHR", "country": "GB"},
-            {"city": "London", "airport": "London Stansted Airport", "iata": "STN", "country": "GB"},
-            {"city": "London", "airport": "RAF Northolt", "iata": "NHT", "country": "GB"},
-            {"city": "London", "airport": "London-Corbin Airport/Magee Field", "iata": "LOZ", "country": "US"},
-            {"city": "Londrina", "airport": "Governor José Richa Airport", "iata": "LDB", "country": "BR"},
-            {"city": "Long Akah", "airport": "Long Akah Airport", "iata": "LKH", "country": "MY"},
-            {"city": "Long Apung-Borneo Island", "airport": "Long Apung Airport", "iata": "LPU", "country": "ID"},
-            {"city": "Long Banga", "airport": "Long Banga Airport", "iata": "LBP", "country": "MY"},
-            {"city": "Long Bawan", "airport": "Yuvai Semaring Airport", "iata": "LBW", "country": "ID"},
-            {"city": "Long Beach", "airport": "Long Beach Airport (Daugherty Field)", "iata": "LGB", "country": "US"},
-            {"city": "Long Datih", "airport": "Long Lellang Airport", "iata": "LGL", "country": "MY"},
-            {"city": "Long Island", "airport": "Long Island Airport", "iata": "LSJ", "country": "PG"},
-            {"city": "Long Island", "airport": "Happy Bay Helipad", "iata": "HAP", "country": "AU"},
-            {"city": "Long Miau", "airport": "Long Pasia Airport", "iata": "GSA", "country": "MY"},
-            {"city": "Long Semado", "airport": "Long Semado Airport", "iata": "LSM", "country": "MY"},
-            {"city": "Long Seridan", "airport": "Long Seridan Airport", "iata": "ODN", "country": "MY"},
-            {"city": "Long Sukang", "airport": "Long Sukang Airport", "iata": "LSU", "country": "MY"},
-            {"city": "Longana", "airport": "Longana Airport", "iata": "LOD", "country": "VU"},
-            {"city": "Longnan (Cheng)", "airport": "Longnan Chengzhou Airport", "iata": "LNL", "country": "CN"},
-            {"city": "Longreach", "airport": "Longreach Airport", "iata": "LRE", "country": "AU"},
-            {"city": "Longue-Pointe-de-Mingan", "airport": "Mingan Airport", "iata": "YLP", "country": "CA"},
-            {"city": "Longview", "airport": "East Texas Regional Airport", "iata": "GGG", "country": "US"},
-            {"city": "Longwood", "airport": "Saint Helena Airport", "iata": "HLE", "country": "SH"},
-            {"city": "Longyan (Liancheng)", "airport": "Liancheng Guanzhishan Airport", "iata": "LCX", "country": "CN"},
-            {"city": "Longyearbyen", "airport": "Svalbard Airport, Longyear", "iata": "LYR", "country": "NO"},
-            {"city": "Lonorore", "airport": "Lonorore Airport", "iata": "LNE", "country": "VU"},
-            {"city": "Lontras", "airport": "Helmuth Baungarten Airport", "iata": "LOI", "country": "BR"},
-            {"city": "Lop Buri", "airport": "Khok Kathiam Airport", "iata": "KKM", "country": "TH"},
-            {"city": "Lopez", "airport": "Lopez Island Airport", "iata": "LPS", "country": "US"},
-            {"city": "Loralai", "airport": "Loralai Airport", "iata": "LRG", "country": "PK"},
-            {"city": "Lord Howe Island", "airport": "Lord Howe Island Airport", "iata": "LDH", "country": "AU"},
-            {"city": "Lordsburg", "airport": "Lordsburg Municipal Airport", "iata": "LSB", "country": "US"},
-            {"city": "Loreto", "airport": "Loreto International Airport", "iata": "LTO", "country": "MX"},
-            {"city": "Lorient/Lann/Bihoué", "airport": "Lorient South Brittany (Bretagne Sud) Airport", "iata": "LRT", "country": "FR"},
-            {"city": "Loring", "airport": "Loring Seaplane Base", "iata": "WLR", "country": "US"},
-            {"city": "Los Alamos", "airport": "Los Alamos Airport", "iata": "LAM", "country": "US"},
-            {"city": "Los Andes", "airport": "San Rafael Airport", "iata": "LOB", "country": "CL"},
-            {"city": "Los Angeles", "airport": "Century City Heliport", "iata": "CCD", "country": "US"},
-            {"city": "Los Angeles", "airport": "Los Angeles International Airport", "iata": "LAX", "country": "US"},
-            {"city": "Los Angeles", "airport": "María Dolores Airport", "iata": "LSQ", "country": "CL"},
-            {"city": "Los Banos", "airport": "Los Banos Municipal Airport", "iata": "LSN", "country": "US"},
-            {"city": "Los Chiles", "airport": "Los Chiles Airport", "iata": "LSL", "country": "CR"},
-            {"city": "Los Menucos", "airport": "Los Menucos Airport", "iata": "LMD", "country": "AR"},
-            {"city": "Los Mochis", "airport": "Valle del Fuerte International Airport", "iata": "LMM", "country": "MX"},
-            {"city": "Lossiemouth", "airport": "RAF Lossiemouth", "iata": "LMO", "country": "GB"},
-            {"city": "Losuia", "airport": "Losuia Airport", "iata": "LSA", "country": "PG"},
-            {"city": "Lotus Vale", "airport": "Lotus Vale Airport", "iata": "LTV", "country": "AU"},
-            {"city": "Louis Trichardt", "airport": "Louis Trichardt Airport", "iata": "LCD", "country": "ZA"},
-            {"city": "Louisa", "airport": "Louisa County Airport / Freeman Field", "iata": "LOW", "country": "US"},
-            {"city": "Louisburg", "airport": "Triangle North Executive Airport", "iata": "LFN", "country": "US"},
-            {"city": "Louisville", "airport": "Louisville Winston County Airport", "iata": "LMS", "country": "US"},
-            {"city": "Louisville", "airport": "Bowman Field", "iata": "LOU", "country": "US"},
-            {"city": "Louisville", "airport": "Louisville Muhammad Ali International Airport", "iata": "SDF", "country": "US"},
-            {"city": "Loveland", "airport": "Northern Colorado Regional Airport", "iata": "FNL", "country": "US"},
-            {"city": "Lovell", "airport": "Mustique Airport", "iata": "MQS", "country": "VC"},
-            {"city": "Lovelock", "airport": "Derby Field", "iata": "LOL", "country": "US"},
-            {"city": "Lowai", "airport": "Lowai Airport", "iata": "LWI", "country": "PG"},
-            {"city": "Lower Zambezi River", "airport": "Royal Zambezi Lodge Airstrip", "iata": "RYL", "country": "ZM"},
-            {"city": "Loyengalani", "airport": "Loyengalani Airport", "iata": "LOY", "country": "KE"},
-            {"city": "Luabo", "airport": "Luabo Airport", "iata": "LBM", "country": "MZ"},
-            {"city": "Luanda", "airport": "Quatro de Fevereiro International Airport", "iata": "LAD", "country": "AO"},
-            {"city": "Luanda (Ícolo e Bengo)", "airport": "Dr. Antonio Agostinho Neto International Airport", "iata": "NBJ", "country": "AO"},
-            {"city": "Luang Namtha", "airport": "Luang Namtha Airport", "iata": "LXG", "country": "LA"},
-            {"city": "Luang Phabang", "airport": "Luang Phabang International Airport", "iata": "LPQ", "country": "LA"},
-            {"city": "Luau", "airport": "Luau Airport", "iata": "UAL", "country": "AO"},
-            {"city": "Lubang", "airport": "Lubang Airport", "iata": "LBX", "country": "PH"},
-            {"city": "Lubang", "airport": "Lasikin Airport", "iata": "LKI", "country": "ID"},
-            {"city": "Lubango", "airport": "Lubango Airport", "iata": "SDD", "country": "AO"},
-            {"city": "Lubbock", "airport": "Reese Airpark", "iata": "REE", "country": "US"},
-            {"city": "Lubbock", "airport": "Lubbock Preston Smith International Airport", "iata": "LBB", "country": "US"},
-            {"city": "Lublin", "airport": "Lublin Airport", "iata": "LUZ", "country": "PL"},
-            {"city": "Lubuk Linggau", "airport": "Silampari Airport", "iata": "LLJ", "country": "ID"},
-            {"city": "Lubumbashi", "airport": "Lubumbashi International Airport", "iata": "FBM", "country": "CD"},
-            {"city": "Lucapa", "airport": "Lucapa Airport", "iata": "LBZ", "country": "AO"},
-            {"city": "Lucas do Rio Verde", "airport": "Municipal Bom Futuro Airport", "iata": "LVR", "country": "BR"},
-            {"city": "Lucknow", "airport": "Chaudhary Charan Singh International Airport", "iata": "LKO", "country": "IN"},
-            {"city": "Luderitz", "airport": "Luderitz Airport", "iata": "LUD", "country": "NA"},
-            {"city": "Ludington", "airport": "Mason County Airport", "iata": "LDM", "country": "US"},
-            {"city": "Ludwigshafen am Rhein", "airport": "Ludwigshafen Accident Hospital Heliport", "iata": "ZOE", "country": "DE"},
-            {"city": "Luena", "airport": "Luena Airport", "iata": "LUO", "country": "AO"},
-            {"city": "Lufkin", "airport": "Angelina County Airport", "iata": "LFK", "country": "US"},
-            {"city": "Luganville", "airport": "Santo Pekoa International Airport", "iata": "SON", "country": "VU"},
-            {"city": "Luiza", "airport": "Luiza Airport", "iata": "LZA", "country": "CD"},
-            {"city": "Lukla", "airport": "Lukla Airport", "iata": "LUA", "country": "NP"},
-            {"city": "Lukulu", "airport": "Lukulu Airport", "iata": "LXU", "country": "ZM"},
-            {"city": "Luleå", "airport": "Luleå Airport", "iata": "LLA", "country": "SE"},
-            {"city": "Lumbadzi", "airport": "Kamuzu International Airport", "iata": "LLW", "country": "MW"},
-            {"city": "Lumbala N'guimbo", "airport": "Lumbala Airport", "iata": "GGC", "country": "AO"},
-            {"city": "Lumberton", "airport": "Lumberton Regional Airport", "iata": "LBT", "country": "US"},
-            {"city": "Lumberton", "airport": "South Jersey Regional Airport", "iata": "LLY", "country": "US"},
-            {"city": "Lumbo", "airport": "Lumbo Airport", "iata": "LFB", "country": "MZ"},
-            {"city": "Lumi", "airport": "Lumi Airport", "iata": "LMI", "country": "PG"},
-            {"city": "Lumid Pau", "airport": "Lumid Pau Airport", "iata": "LUB", "country": "GY"},
-            {"city": "Lunyuk", "airport": "Lunyuk Airport", "iata": "LYK", "country": "ID"},
-            {"city": "Luoyang (Laocheng)", "airport": "Luoyang Beijiao Airport", "iata": "LYA", "country": "CN"},
-            {"city": "Luozi", "airport": "Luozi Airport", "iata": "LZI", "country": "CD"},
-            {"city": "Lusaka", "airport": "Kenneth Kaunda International Airport", "iata": "LUN", "country": "ZM"},
-            {"city": "Lusambo", "airport": "Lusambo Airport", "iata": "LBO", "country": "CD"},
-            {"city": "Lusk", "airport": "Lusk Municipal Airport", "iata": "LSK", "country": "US"},
-            {"city": "Luton, Bedfordshire", "airport": "London Luton Airport", "iata": "LTN", "country": "GB"},
-            {"city": "Lutselk'e", "airport": "Lutselk'e Airport", "iata": "YSG", "country": "CA"},
-            {"city": "Lutsk", "airport": "Lutsk Airport", "iata": "UCK", "country": "UA"},
-            {"city": "Luuq", "airport": "Lugh Ganane Airport", "iata": "LGX", "country": "SO"},
-            {"city": "Luwok", "airport": "Syukuran Aminuddin Amir Airport", "iata": "LUW", "country": "ID"},
-            {"city": "Luxembourg", "airport": "Luxembourg-Findel International Airport", "iata": "LUX", "country": "LU"},
-            {"city": "Luxor", "airport": "Luxor International Airport", "iata": "LXR", "country": "EG"},
-            {"city": "Luzamba", "airport": "Luzamba Airport", "iata": "LZM", "country": "AO"},
-            {"city": "Luzhou (Yunlong)", "airport": "Luzhou Yunlong Airport", "iata": "LZO", "country": "CN"},
-            {"city": "Lučenec", "airport": "Lučenec Airfield", "iata": "LUE", "country": "SK"},
-            {"city": "Lviv", "airport": "Lviv International Airport", "iata": "LWO", "country": "UA"},
-            {"city": "Lycksele", "airport": "Lycksele Airport", "iata": "LYC", "country": "SE"},
-            {"city": "Lynchburg", "airport": "Lynchburg Regional Airport - Preston Glenn Field", "iata": "LYH", "country": "US"},
-            {"city": "Lyndhurst", "airport": "Lyndhurst Airport", "iata": "LTP", "country": "AU"},
-            {"city": "Lyndonville", "airport": "Caledonia County Airport", "iata": "LLX", "country": "US"},
-            {"city": "Lynn Lake", "airport": "Lynn Lake Airport", "iata": "YYL", "country": "CA"},
-            {"city": "Lyons", "airport": "Lyons-Rice County Municipal Airport", "iata": "LYO", "country": "US"},
-            {"city": "Lábrea", "airport": "Lábrea Airport", "iata": "LBR", "country": "BR"},
-            {"city": "Lázaro Cárdenas", "airport": "Lázaro Cárdenas Airport", "iata": "LZC", "country": "MX"},
-            {"city": "Lärz", "airport": "Müritz Airpark", "iata": "REB", "country": "DE"},
-            {"city": "Læsø", "airport": "Læsø Airport", "iata": "BYR", "country": "DK"},
-            {"city": "Lépaud, Creuse", "airport": "Montluçon-Guéret Airport", "iata": "MCU", "country": "FR"},
-            {"city": "Lübeck", "airport": "Lübeck Blankensee Airport", "iata": "LBC", "country": "DE"},
-            {"city": "Lüdao", "airport": "Lüdao Airport", "iata": "GNI", "country": "TW"},
-            {"city": "Lüliang", "airport": "Lüliang Dawu Airport", "iata": "LLV", "country": "CN"},
-            {"city": "M'Bigou", "airport": "M'Bigou Airport", "iata": "MBC", "country": "GA"},
-            {"city": "Maamigili", "airport": "Villa International Airport Maamigili", "iata": "VAM", "country": "MV"},
-            {"city": "Maasai Mara", "airport": "Angama Airport", "iata": "ANA", "country": "KE"},
-            {"city": "Maastricht", "airport": "Maastricht Aachen Airport", "iata": "MST", "country": "NL"},
-            {"city": "Maavaarulu", "airport": "Maavaarulaa Airport", "iata": "RUL", "country": "MV"},
-            {"city": "Mabalacat", "airport": "Clark International Airport / Clark Air Base", "iata": "CRK", "country": "PH"},
-            {"city": "Mabaruma", "airport": "Mabaruma Airport", "iata": "USI", "country": "GY"},
-            {"city": "Mabuiag Island", "airport": "Mabuiag Island Airport", "iata": "UBB", "country": "AU"},
-            {"city": "Macanal", "airport": "Macanal Airport", "iata": "NAD", "country": "CO"},
-            {"city": "Macapá", "airport": "Macapá - Alberto Alcolumbre International Airport", "iata": "MCP", "country": "BR"},
-            {"city": "Macará", "airport": "Jose Maria Velasco Ibarra Airport", "iata": "MRR", "country": "EC"},
-            {"city": "Macas", "airport": "Coronel E Carvajal Airport", "iata": "XMS", "country": "EC"},
-            {"city": "Macaé", "airport": "Macaé Benedito Lacerda Airport", "iata": "MEA", "country": "BR"},
-            {"city": "Maceió", "airport": "Zumbi dos Palmares Airport", "iata": "MCZ", "country": "BR"},
-            {"city": "Macenta", "airport": "Macenta Airport", "iata": "MCA", "country": "GN"},
-            {"city": "Mackay", "airport": "Mackay Airport", "iata": "MKY", "country": "AU"},
-            {"city": "Mackinac Island", "airport": "Mackinac Island Airport", "iata": "MCD", "country": "US"},
-            {"city": "Macmillan Pass", "airport": "Macmillan Pass Airport", "iata": "XMP", "country": "CA"},
-            {"city": "Macomb", "airport": "Macomb Municipal Airport", "iata": "MQB", "country": "US"},
-            {"city": "Macon", "airport": "Macon Downtown Airport", "iata": "MAC", "country": "US"},
-            {"city": "Macon", "airport": "Middle Georgia Regional Airport", "iata": "MCN", "country": "US"},
-            {"city": "Madang", "airport": "Madang Airport", "iata": "MAG", "country": "PG"},
-            {"city": "Madera", "airport": "Madera Municipal Airport", "iata": "MAE", "country": "US"},
-            {"city": "Madhurapudi", "airport": "Rajahmundry Airport", "iata": "RJA", "country": "IN"},
-            {"city": "Madison", "airport": "Madison Municipal Airport", "iata": "MDN", "country": "US"},
-            {"city": "Madison", "airport": "Bruce Campbell Field", "iata": "DXE", "country": "US"},
-            {"city": "Madison", "airport": "Madison Municipal Airport", "iata": "XMD", "country": "US"},
-            {"city": "Madison", "airport": "Dane County Regional Truax Field", "iata": "MSN", "country": "US"},
-            {"city": "Madras", "airport": "Madras Municipal Airport", "iata": "MDJ", "country": "US"},
-            {"city": "Madrid", "airport": "Adolfo Suárez Madrid–Barajas Airport", "iata": "MAD", "country": "ES"},
-            {"city": "Madrid", "airport": "Madrid–Torrejón Airport / Torrejón Air Base", "iata": "TOJ", "country": "ES"},
-            {"city": "Madurai", "airport": "Madurai Airport", "iata": "IXM", "country": "IN"},
-            {"city": "Mae Hong Son", "airport": "Mae Hong Son Airport", "iata": "HGN", "country": "TH"},
-            {"city": "Maewo Island", "airport": "Maewo-Naone Airport", "iata": "MWF", "country": "VU"},
-            {"city": "Mafeking", "airport": "Mmabatho International Airport", "iata": "MBD", "country": "ZA"},
-            {"city": "Mafeteng", "airport": "Mafeteng Airport", "iata": "MFC", "country": "LS"},
-            {"city": "Mafraq", "airport": "King Hussein Air College", "iata": "OMF", "country": "JO"},
-            {"city": "Magadan", "airport": "Sokol Airport", "iata": "GDX", "country": "RU"},
-            {"city": "Magan", "airport": "Magan Airport", "iata": "GYG", "country": "RU"},
-            {"city": "Magangué", "airport": "Baracoa Airport", "iata": "MGN", "country": "CO"},
-            {"city": "Maganja", "airport": "Maganja da Costa Airport", "iata": "MJS", "country": "MZ"},
-            {"city": "Magdalena", "airport": "Magdalena Airport", "iata": "MGD", "country": "BO"},
-            {"city": "Magnitogorsk", "airport": "Magnitogorsk International Airport", "iata": "MQF", "country": "RU"},
-            {"city": "Magnolia", "airport": "Magnolia Municipal Airport / Ralph C Weiser Field", "iata": "AGO", "country": "US"},
-            {"city": "Magway", "airport": "Magway Airport", "iata": "MWQ", "country": "MM"},
-            {"city": "Mahajanga", "airport": "Amborovy Airport", "iata": "MJN", "country": "MG"},
-            {"city": "Mahanoro", "airport": "Mahanoro Airport", "iata": "VVB", "country": "MG"},
-            {"city": "Mahdia", "airport": "Mahdia Airport", "iata": "MHA", "country": "GY"},
-            {"city": "Mahe Island", "airport": "Seychelles International Airport", "iata": "SEZ", "country": "SC"},
-            {"city": "Mahendranagar", "airport": "Mahendranagar Airport", "iata": "XMG", "country": "NP"},
-            {"city": "Mahovljani", "airport": "Banja Luka International Airport", "iata": "BNX", "country": "BA"},
-            {"city": "Mahshahr", "airport": "Mahshahr Airport", "iata": "MRX", "country": "IR"},
-            {"city": "Mahón (Maó)", "airport": "Menorca Airport", "iata": "MAH", "country": "ES"},
-            {"city": "Mai Son", "airport": "Na San Airport", "iata": "SQH", "country": "VN"},
-            {"city": "Maiana", "airport": "Maiana Airport", "iata": "MNK", "country": "KI"},
-            {"city": "Maiduguri", "airport": "Maiduguri International Airport", "iata": "MIU", "country": "NG"},
-            {"city": "Maikoor Island", "airport": "Benjina Airport", "iata": "BJK", "country": "ID"},
-            {"city": "Maikwak", "airport": "Maikwak Airport", "iata": "VEG", "country": "GY"},
-            {"city": "Mainoru", "airport": "Mainoru Airstrip", "iata": "MIZ", "country": "AU"},
-            {"city": "Maintirano", "airport": "Maintirano Airport", "iata": "MXT", "country": "MG"},
-            {"city": "Maiquetía", "airport": "Maiquetía Simón Bolívar International Airport", "iata": "CCS", "country": "VE"},
-            {"city": "Maisí", "airport": "Alfredo Noa Díaz Airport", "iata": "UMA", "country": "CU"},
-            {"city": "Maitanakunai", "airport": "Open Bay Airport", "iata": "OPB", "country": "PG"},
-            {"city": "Majkin", "airport": "Majkin Airport", "iata": "MJE", "country": "MH"},
-            {"city": "Majuro Atoll", "airport": "Marshall Islands International Airport", "iata": "MAJ", "country": "MH"},
-            {"city": "Makabana", "airport": "Makabana Airport", "iata": "KMK", "country": "CG"},
-            {"city": "Makale", "airport": "Pongtiku Airport", "iata": "TTR", "country": "ID"},
-            {"city": "Makemo", "airport": "Makemo Airport", "iata": "MKP", "country": "PF"},
-            {"city": "Makhachkala", "airport": "Makhachkala Uytash International Airport", "iata": "MCX", "country": "RU"},
-            {"city": "Makin Island", "airport": "Makin Island Airport", "iata": "MTK", "country": "KI"},
-            {"city": "Makini", "airport": "Makini Airport", "iata": "MPG", "country": "PG"},
-            {"city": "Makinohara / Shimada", "airport": "Mount Fuji Shizuoka Airport", "iata": "FSZ", "country": "JP"},
-            {"city": "Makkovik", "airport": "Makkovik Airport", "iata": "YMN", "country": "CA"},
-            {"city": "Makokou", "airport": "Makokou Airport", "iata": "MKU", "country": "GA"},
-            {"city": "Makoua", "airport": "Makoua Airport", "iata": "MKJ", "country": "CG"},
-            {"city": "Makurdi", "airport": "Makurdi Airport", "iata": "MDI", "country": "NG"},
-            {"city": "Mal Island", "airport": "Mal Airport", "iata": "MMV", "country": "PG"},
-            {"city": "Malabang", "airport": "Malabang Airport", "iata": "MLP", "country": "PH"},
-            {"city": "Malabo", "airport": "Malabo Airport", "iata": "SSG", "country": "GQ"},
-            {"city": "Malabou", "airport": "Poum / Malabou Airport", "iata": "PUV", "country": "NC"},
-            {"city": "Malacca", "airport": "Malacca International Airport", "iata": "MKZ", "country": "MY"},
-            {"city": "Malad City", "airport": "Malad City Airport", "iata": "MLD", "country": "US"},
-            {"city": "Malaimbandy", "airport": "Malaimbandy Airport", "iata": "WML", "country": "MG"},
-            {"city": "Malakal", "airport": "Malakal Airport", "iata": "MAK", "country": "SS"},
-            {"city": "Malalaua", "airport": "Malalaua Airport", "iata": "MLQ", "country": "PG"},
-            {"city": "Malam", "airport": "Malam Airport", "iata": "MQO", "country": "PG"},
-            {"city": "Malamala", "airport": "Malamala Airport", "iata": "AAM", "country": "ZA"},
-            {"city": "Malang", "airport": "Abdul Rachman Saleh Airport", "iata": "MLG", "country": "ID"},
-            {"city": "Malanje", "airport": "Malanje Airport", "iata": "MEG", "country": "AO"},
-            {"city": "Malargue", "airport": "Comodoro D.R. Salomón Airport", "iata": "LGS", "country": "AR"},
-            {"city": "Malatya", "airport": "Malatya Erhaç Airport", "iata": "MLX", "country": "TR"},
-            {"city": "Malda", "airport": "Malda Airport", "iata": "LDA", "country": "IN"},
-            {"city": "Malden", "airport": "Malden Regional Airport", "iata": "MAW", "country": "US"},
-            {"city": "Malekula Island", "airport": "Southwest Bay Airport", "iata": "SWJ", "country": "VU"},
-            {"city": "Malelane", "airport": "Malelane Airport", "iata": "LLE", "country": "ZA"},
-            {"city": "Mali Lošinj", "airport": "Lošinj Airport", "iata": "LSZ", "country": "HR"},
-            {"city": "Maliana", "airport": "Maliana Airport", "iata": "MPT", "country": "TL"},
-            {"city": "Malinau", "airport": "Robert Atty Bessing", "iata": "LNU", "country": "ID"},
-            {"city": "Malindi", "airport": "Malindi Airport", "iata": "MYD", "country": "KE"},
-            {"city": "Malmö", "airport": "Malmö Sturup Airport", "iata": "MMX", "country": "SE"},
-            {"city": "Maloelap Island", "airport": "Maloelap Island Airport", "iata": "MAV", "country": "MH"},
-            {"city": "Malolo Lailai Island", "airport": "Malolo Lailai Island Airport", "iata": "PTF", "country": "FJ"},
-            {"city": "Malta", "airport": "Malta Airport", "iata": "MLK", "country": "US"},
-            {"city": "Malung-Sälen", "airport": "Scandinavian Mountains Airport", "iata": "SCR", "country": "SE"},
-            {"city": "Malé", "airport": "Malé International Airport", "iata": "MLE", "country": "MV"},
-            {"city": "Mamai", "airport": "Mamai Airport", "iata": "MAP", "country": "PG"},
-            {"city": "Mambajao", "airport": "Camiguin Airport", "iata": "CGM", "country": "PH"},
-            {"city": "Mamburao", "airport": "Mamburao Airport", "iata": "MBO", "country": "PH"},
-            {"city": "Mamfe", "airport": "Mamfe Airport", "iata": "MMF", "country": "CM"},
-            {"city": "Mamitupu", "airport": "Mamitupu Airport", "iata": "MPI", "country": "PA"},
-            {"city": "Mamitupu", "airport": "Achutupu Airport", "iata": "ACU", "country": "PA"},
-            {"city": "Mammoth Lakes", "airport": "Mammoth Yosemite Airport", "iata": "MMH", "country": "US"},
-            {"city": "Mampikony", "airport": "Mampikony Airport", "iata": "WMP", "country": "MG"},
-            {"city": "Mamuju", "airport": "Tampa Padang Airport", "iata": "MJU", "country": "ID"},
-            {"city": "Mana Island", "airport": "Mana Island Airport", "iata": "MNF", "country": "FJ"},
-            {"city": "Manado", "airport": "Sam Ratulangi Airport", "iata": "MDC", "country": "ID"},
-            {"city": "Managua", "airport": "Augusto C. Sandino (Managua) International Airport", "iata": "MGA", "country": "NI"},
-            {"city": "Manakara", "airport": "Manakara Airport", "iata": "WVK", "country": "MG"},
-            {"city": "Manama", "airport": "Bahrain International Airport", "iata": "BAH", "country": "BH"},
-            {"city": "Mananara Nord", "airport": "Mananara Nord Airport", "iata": "WMR", "country": "MG"},
-            {"city": "Mananjary", "airport": "Mananjary Airport", "iata": "MNJ", "country": "MG"},
-            {"city": "Manaoba", "airport": "Manaoba Airport", "iata": "MHM", "country": "SB"},
-            {"city": "Manari", "airport": "Manari Airport", "iata": "MRM", "country": "PG"},
-            {"city": "Manassas", "airport": "Manassas Regional Airport/Harry P. Davis Field", "iata": "MNZ", "country": "US"},
-            {"city": "Manaung", "airport": "Manaung Airport", "iata": "MGU", "country": "MM"},
-            {"city": "Manaus", "airport": "Eduardo Gomes International Airport", "iata": "MAO", "country": "BR"},
-            {"city": "Manaus", "airport": "Ponta Pelada Airport / Manaus Air Base", "iata": "PLL", "country": "BR"},
-            {"city": "Manchester", "airport": "Arnold Air Force Base", "iata": "TUH", "country": "US"},
-            {"city": "Manchester", "airport": "Manchester-Boston Regional Airport", "iata": "MHT", "country": "US"},
-            {"city": "Manchester, Greater Manchester", "airport": "Manchester Airport", "iata": "MAN", "country": "GB"},
-            {"city": "Manching", "airport": "Ingolstadt Manching Airport", "iata": "IGS", "country": "DE"},
-            {"city": "Mandabe", "airport": "Mandabe Airport", "iata": "WMD", "country": "MG"},
-            {"city": "Mandailing", "airport": "Jenderal Besar Abdul Haris Nasution Airport", "iata": "JHN", "country": "ID"},
-            {"city": "Mandalay", "airport": "Chanmyathazi Airport", "iata": "VBC", "country": "MM"},
-            {"city": "Mandalay", "airport": "Mandalay International Airport", "iata": "MDL", "country": "MM"},
-            {"city": "Mandalgobi", "airport": "Mandalgobi Airport", "iata": "MXW", "country": "MN"},
-            {"city": "Mandera", "airport": "Mandera Airport", "iata": "NDE", "country": "KE"},
-            {"city": "Mandritsara", "airport": "Mandritsara Airport", "iata": "WMA", "country": "MG"},
-            {"city": "Manga Mission", "airport": "Manga Airport", "iata": "MGP", "country": "PG"},
-            {"city": "Mangaia Island", "airport": "Mangaia Island Airport", "iata": "MGS", "country": "CK"},
-            {"city": "Mangalore", "airport": "Mangalore International Airport", "iata": "IXE", "country": "IN"},
-            {"city": "Mangla", "airport": "Mangla Airport", "iata": "XJM", "country": "PK"},
-            {"city": "Mangole Island", "airport": "Mangole Airport, Falabisahaya", "iata": "MAL", "country": "ID"},
-            {"city": "Mangrove Cay", "airport": "Clarence A. Bain Airport", "iata": "MAY", "country": "BS"},
-            {"city": "Manguna", "airport": "Manguna Airport", "iata": "MFO", "country": "PG"},
-            {"city": "Manhattan", "airport": "Manhattan Regional Airport", "iata": "MHK", "country": "US"},
-            {"city": "Manhuaçu", "airport": "Aeroporto Elias Breder Airport", "iata": "JMA", "country": "BR"},
-            {"city": "Manicoré", "airport": "Manicoré Airport", "iata": "MNX", "country": "BR"},
-            {"city": "Manihiki Island", "airport": "Manihiki Island Airport", "iata": "MHX", "country": "CK"},
-            {"city": "Maniitsoq", "airport": "Maniitsoq Airport", "iata": "JSU", "country": "GL"},
-            {"city": "Manik Bhandar", "airport": "Kamalpur Airport", "iata": "IXQ", "country": "IN"},
-            {"city": "Manila", "airport": "Manila Municipal Airport", "iata": "MXA", "country": "US"},
-            {"city": "Manila (Pasay)", "airport": "Ninoy Aquino International Airport", "iata": "MNL", "country": "PH"},
-            {"city": "Maningrida", "airport": "Maningrida Airport", "iata": "MNG", "country": "AU"},
-            {"city": "Manistee", "airport": "Manistee County Blacker Airport", "iata": "MBL", "country": "US"},
-            {"city": "Manistique", "airport": "Schoolcraft County Airport", "iata": "ISQ", "country": "US"},
-            {"city": "Manitouwadge", "airport": "Manitouwadge Airport", "iata": "YMG", "country": "CA"},
-            {"city": "Manitowoc", "airport": "Manitowoc County Airport", "iata": "MTW", "country": "US"},
-            {"city": "Manizales", "airport": "La Nubia Airport", "iata": "MZL", "country": "CO"},
-            {"city": "Manja", "airport": "Manja Airport", "iata": "MJA", "country": "MG"},
-            {"city": "Mankato", "airport": "Mankato Regional Airport", "iata": "MKT", "country": "US"},
-            {"city": "Manley Hot Springs", "airport": "Manley Hot Springs Airport", "iata": "MLY", "country": "US"},
-            {"city": "Mannheim", "airport": "Mannheim-City Airport", "iata": "MHG", "country": "DE"},
-            {"city": "Manokotak", "airport": "Manokotak Airport", "iata": "KMO", "country": "US"},
-            {"city": "Manokwari", "airport": "Rendani Airport", "iata": "MKW", "country": "ID"},
-            {"city": "Manono", "airport": "Manono Airport", "iata": "MNO", "country": "CD"},
-            {"city": "Mansa", "airport": "Mansa Airport", "iata": "MNS", "country": "ZM"},
-            {"city": "Mansfield", "airport": "Mansfield Lahm Regional Airport", "iata": "MFD", "country": "US"},
-            {"city": "Mansons Landing", "airport": "Mansons Landing Seaplane Base", "iata": "YMU", "country": "CA"},
-            {"city": "Manta", "airport": "Eloy Alfaro International Airport", "iata": "MEC", "country": "EC"},
-            {"city": "Manteo", "airport": "Dare County Regional Airport", "iata": "MEO", "country": "US"},
-            {"city": "Manti", "airport": "Manti-Ephraim Airport", "iata": "NTJ", "country": "US"},
-            {"city": "Manumu", "airport": "Manumu Airport", "iata": "UUU", "country": "PG"},
-            {"city": "Manurewa", "airport": "Ardmore Airport", "iata": "AMZ", "country": "NZ"},
-            {"city": "Manus Island", "airport": "Momote Airport", "iata": "MAS", "country": "PG"},
-            {"city": "Manville", "airport": "Central Jersey Regional Airport", "iata": "JVI", "country": "US"},
-            {"city": "Manzanillo", "airport": "Playa de Oro International Airport", "iata": "ZLO", "country": "MX"},
-            {"city": "Manzanillo", "airport": "Sierra Maestra International Airport", "iata": "MZO", "country": "CU"},
-            {"city": "Manzhouli", "airport": "Manzhouli Xijiao Airport", "iata": "NZH", "country": "CN"},
-            {"city": "Manzini", "airport": "Matsapha Airport", "iata": "MTS", "country": "SZ"},
-            {"city": "Mao", "airport": "Mao Airport", "iata": "AMO", "country": "TD"},
-            {"city": "Maota", "airport": "Maota Airport", "iata": "MXS", "country": "WS"},
-            {"city": "Maple Bay", "airport": "Maple Bay Seaplane Base", "iata": "YAQ", "country": "CA"},
-            {"city": "Mapoda", "airport": "Mapoda Airport", "iata": "MPF", "country": "PG"},
-            {"city": "Mapun", "airport": "Cagayan de Sulu Airport", "iata": "CDY", "country": "PH"},
-            {"city": "Maputo", "airport": "Maputo Airport", "iata": "MPM", "country": "MZ"},
-            {"city": "Maquinchao", "airport": "Maquinchao Airport", "iata": "MQD", "country": "AR"},
-            {"city": "Mar del Plata", "airport": "Ástor Piazzola International Airport", "iata": "MDQ", "country": "AR"},
-            {"city": "Mara", "airport": "Mara North Conservancy Airstrip", "iata": "HKR", "country": "KE"},
-            {"city": "Marabá", "airport": "João Correa da Rocha Airport", "iata": "MAB", "country": "BR"},
-            {"city": "Maracaibo", "airport": "La Chinita International Airport", "iata": "MAR", "country": "VE"},
-            {"city": "Maracay", "airport": "Escuela Mariscal Sucre Airport", "iata": "MYC", "country": "VE"},
-            {"city": "Maradi", "airport": "Maradi Airport", "iata": "MFQ", "country": "NE"},
-            {"city": "Maragheh", "airport": "Sahand Airport", "iata": "ACP", "country": "IR"},
-            {"city": "Marakei", "airport": "Marakei Airport", "iata": "MZK", "country": "KI"},
-            {"city": "Maramag", "airport": "Maramag Airport", "iata": "XMA", "country": "PH"},
-            {"city": "Maramie", "airport": "Dunbar Airport", "iata": "DNB", "country": "AU"},
-            {"city": "Maramie", "airport": "Koolatah Airport", "iata": "KOH", "country": "AU"},
-            {"city": "Maramuni", "airport": "Maramuni Airport", "iata": "MWI", "country": "PG"},
-            {"city": "Marana", "airport": "Marana Regional Airport", "iata": "AVW", "country": "US"},
-            {"city": "Marana", "airport": "Pinal Airpark", "iata": "MZJ", "country": "US"},
-            {"city": "Marathon", "airport": "Marathon Airport", "iata": "YSP", "country": "CA"},
-            {"city": "Marathon", "airport": "The Florida Keys Marathon Airport", "iata": "MTH", "country": "US"},
-            {"city": "Maratua", "airport": "Maratua Airport", "iata": "RTU", "country": "ID"},
-            {"city": "Marau", "airport": "Marau Airport", "iata": "RUS", "country": "SB"},
-            {"city": "Marawaka", "airport": "Marawaka Airport", "iata": "MWG", "country": "PG"},
-            {"city": "Maraú", "airport": "Barra Grande Airport", "iata": "MUU", "country": "BR"},
-            {"city": "Marble Canyon", "airport": "Marble Canyon Airport", "iata": "MYH", "country": "US"},
-            {"city": "Marco Island", "airport": "Marco Island Executive Airport", "iata": "MRK", "country": "US"},
-            {"city": "Mardin", "airport": "Mardin Airport", "iata": "MQM", "country": "TR"},
-            {"city": "Mareeba", "airport": "Mareeba Airport", "iata": "MRG", "country": "AU"},
-            {"city": "Marfa", "airport": "Marfa Municipal Airport", "iata": "MRF", "country": "US"},
-            {"city": "Margate", "airport": "Margate Airport", "iata": "MGH", "country": "ZA"},
-            {"city": "Marib", "airport": "Marib Airport", "iata": "MYN", "country": "YE"},
-            {"city": "Maricá", "airport": "Maricá Airport", "iata": "JMR", "country": "BR"},
-            {"city": "Mariehamn", "airport": "Mariehamn Airport", "iata": "MHQ", "country": "FI"},
-            {"city": "Marietta", "airport": "Dobbins Air Reserve Base", "iata": "MGE", "country": "US"},
-            {"city": "Marignane, Bouches-du-Rhône", "airport": "Marseille Provence Airport", "iata": "MRS", "country": "FR"},
-            {"city": "Marigot", "airport": "Douglas-Charles Airport", "iata": "DOM", "country": "DM"},
-            {"city": "Marina", "airport": "Marina Municipal Airport", "iata": "OAR", "country": "US"},
-            {"city": "Maringá", "airport": "Regional de Maringá - Sílvio Name Júnior Airport", "iata": "MGF", "country": "BR"},
-            {"city": "Marion", "airport": "Marion Municipal Airport", "iata": "MNN", "country": "US"},
-            {"city": "Marion", "airport": "Veterans Airport of Southern Illinois", "iata": "MWA", "country": "US"},
-            {"city": "Marion", "airport": "Marion Municipal Airport", "iata": "MZZ", "country": "US"},
-            {"city": "Marion Downs", "airport": "Marion Downs Airport", "iata": "MXD", "country": "AU"},
-            {"city": "Maripasoula", "airport": "Maripasoula Airport", "iata": "MPY", "country": "GF"},
-            {"city": "Mariposa", "airport": "Mariposa Yosemite Airport", "iata": "RMY", "country": "US"},
-            {"city": "Mariquita", "airport": "Mariquita Airport", "iata": "MQU", "country": "CO"},
-            {"city": "Mariscal Estigarribia", "airport": "Aeropuerto Internacional Dr. Luis Maria Argaña", "iata": "ESG", "country": "PY"},
-            {"city": "Mariupol", "airport": "Mariupol International Airport", "iata": "MPW", "country": "UA"},
-            {"city": "Markovo", "airport": "Markovo Airport", "iata": "KVM", "country": "RU"},
-            {"city": "Marks", "airport": "Selfs Airport", "iata": "MMS", "country": "US"},
-            {"city": "Marla", "airport": "Marla Airport", "iata": "MRP", "country": "AU"},
-            {"city": "Marlow, Buckinghamshire", "airport": "Wycombe Air Park", "iata": "HYC", "country": "GB"},
-            {"city": "Marmul", "airport": "Marmul Airport", "iata": "OMM", "country": "OM"},
-            {"city": "Maroantsetra", "airport": "Maroantsetra Airport", "iata": "WMN", "country": "MG"},
-            {"city": "Maroochydore", "airport": "Sunshine Coast Airport", "iata": "MCY", "country": "AU"},
-            {"city": "Maroua", "airport": "Salak Airport", "iata": "MVR", "country": "CM"},
-            {"city": "Marqua", "airport": "Marqua Airport", "iata": "MQE", "country": "AU"},
-            {"city": "Marrakech", "airport": "Menara Airport", "iata": "RAK", "country": "MA"},
-            {"city": "Marromeu", "airport": "Marromeu Airport", "iata": "RRM", "country": "MZ"},
-            {"city": "Marsa Alam", "airport": "Marsa Alam International Airport", "iata": "RMF", "country": "EG"},
-            {"city": "Marsa Matruh", "airport": "Marsa Matruh International Airport", "iata": "MUH", "country": "EG"},
-            {"city": "Marsa al Brega", "airport": "Marsa al Brega Airport", "iata": "LMQ", "country": "LY"},
-            {"city": "Marsabit", "airport": "Marsabit Airport", "iata": "RBT", "country": "KE"},
-            {"city": "Marsh Harbour", "airport": "Leonard M Thompson International Airport", "iata": "MHH", "country": "BS"},
-            {"city": "Marshall", "airport": "Harrison County Airport", "iata": "ASL", "country": "US"},
-            {"city": "Marshall", "airport": "Marshall Memorial Municipal Airport", "iata": "MHL", "country": "US"},
-            {"city": "Marshall", "airport": "Southwest Minnesota Regional Airport - Marshall/Ryan Field", "iata": "MML", "country": "US"},
-            {"city": "Marshall", "airport": "Marshall Don Hunter Sr Airport", "iata": "MLL", "country": "US"},
-            {"city": "Marshalltown", "airport": "Marshalltown Municipal Airport", "iata": "MIW", "country": "US"},
-            {"city": "Marshfield", "airport": "Marshfield Municipal Airport", "iata": "MFI", "country": "US"},
-            {"city": "Martha's Vineyard", "airport": "Martha's Vineyard Airport", "iata": "MVY", "country": "US"},
-            {"city": "Martinsburg", "airport": "Eastern WV Regional Airport/Shepherd Field", "iata": "MRB", "country": "US"},
-            {"city": "Martuba", "airport": "Martuba Air Base", "iata": "DNF", "country": "LY"},
-            {"city": "Marudi", "airport": "Marudi Airport", "iata": "MUR", "country": "MY"},
-            {"city": "Mary", "airport": "Mary International Airport", "iata": "MYP", "country": "TM"},
-            {"city": "Mary River", "airport": "Mary River Aerodrome", "iata": "YMV", "country": "CA"},
-            {"city": "Mary's Harbour", "airport": "Mary's Harbour Airport", "iata": "YMH", "country": "CA"},
-            {"city": "Maryborough", "airport": "Maryborough Airport", "iata": "MBH", "country": "AU"},
-            {"city": "Marysville", "airport": "Yuba County Airport", "iata": "MYV", "country": "US"},
-            {"city": "Marzy, Nièvre", "airport": "Nevers-Fourchambault Airport", "iata": "NVS", "country": "FR"},
-            {"city": "Maré", "airport": "Maré Airport", "iata": "MEE", "country": "NC"},
-            {"city": "Marília", "airport": "Frank Miloye Milenkowichi–Marília State Airport", "iata": "MII", "country": "BR"},
-            {"city": "Masa", "airport": "Masa Airport", "iata": "MBV", "country": "PG"},
-            {"city": "Masada", "airport": "Bar Yehuda Airfield", "iata": "MTZ", "country": "IL"},
-            {"city": "Masai Mara", "airport": "Mara Serena Lodge Airstrip", "iata": "MRE", "country": "KE"},
-            {"city": "Masalembo Island", "airport": "Masalembo Airport", "iata": "MSI", "country": "ID"},
-            {"city": "Masamba", "airport": "Andi Jemma Airport", "iata": "MXB", "country": "ID"},
-            {"city": "Masasi", "airport": "Masasi Airport", "iata": "XMI", "country": "TZ"},
-            {"city": "Masbate", "airport": "Moises R. Espinosa Airport", "iata": "MBT", "country": "PH"},
-            {"city": "Mashhad", "airport": "Mashhad International Airport", "iata": "MHD", "country": "IR"},
-            {"city": "Masi Manimba", "airport": "Masi Manimba Airport", "iata": "MSM", "country": "CD"},
-            {"city": "Masindi", "airport": "Masindi Airport", "iata": "KCU", "country": "UG"},
-            {"city": "Masirah", "airport": "RAFO Masirah", "iata": "MSH", "country": "OM"},
-            {"city": "Masjed Soleyman", "airport": "Shahid Asiyaee Airport", "iata": "QMJ", "country": "IR"},
-            {"city": "Mason City", "airport": "Mason City Municipal Airport", "iata": "MCW", "country": "US"},
-            {"city": "Massawa", "airport": "Massawa International Airport", "iata": "MSW", "country": "ER"},
-            {"city": "Massena", "airport": "Massena International Airport Richards Field", "iata": "MSS", "country": "US"},
-            {"city": "Masset", "airport": "Masset Airport", "iata": "ZMT", "country": "CA"},
-            {"city": "Masterton", "airport": "Hood Airport", "iata": "MRO", "country": "NZ"},
-            {"city": "Masuda", "airport": "Iwami Airport", "iata": "IWJ", "country": "JP"},
-            {"city": "Masvingo", "airport": "Masvingo International Airport", "iata": "MVZ", "country": "ZW"},
-            {"city": "Matadi", "airport": "Tshimpi Airport", "iata": "MAT", "country": "CD"},
-            {"city": "Matagami", "airport": "Matagami Airport", "iata": "YNM", "country": "CA"},
-            {"city": "Matagorda Island", "airport": "National Wildlife Refuge Airport", "iata": "MGI", "country": "US"},
-            {"city": "Matamoros", "airport": "General Servando Canales International Airport", "iata": "MAM", "country": "MX"},
-            {"city": "Matane", "airport": "Matane Airport", "iata": "YME", "country": "CA"},
-            {"city": "Matanzas", "airport": "Juan Gualberto Gomez International Airport", "iata": "VRA", "country": "CU"},
-            {"city": "Mataram (Pujut, Lombok Tengah)", "airport": "Lombok International Airport", "iata": "LOP", "country": "ID"},
-            {"city": "Matei", "airport": "Matei Airport", "iata": "TVU", "country": "FJ"},
-            {"city": "Mati", "airport": "Mati National Airport", "iata": "MXI", "country": "PH"},
-            {"city": "Matoury", "airport": "Cayenne – Félix Eboué Airport", "iata": "CAY", "country": "GF"},
-            {"city": "Matsaile", "airport": "Matsaile Airport", "iata": "MSG", "country": "LS"},
-            {"city": "Matsu (Beigan)", "airport": "Matsu Beigan Airport", "iata": "MFK", "country": "TW"},
-            {"city": "Matsu (Nangan)", "airport": "Matsu Nangan Airport", "iata": "LZN", "country": "TW"},
-            {"city": "Matsumoto", "airport": "Shinshu-Matsumoto Airport", "iata": "MMJ", "country": "JP"},
-            {"city": "Matsuyama", "airport": "Matsuyama Airport", "iata": "MYJ", "country": "JP"},
-            {"city": "Mattala", "airport": "Mattala Rajapaksa International Airport", "iata": "HRI", "country": "LK"},
-            {"city": "Matthew Town", "airport": "Inagua Airport", "iata": "IGA", "country": "BS"},
-            {"city": "Matthews Ridge", "airport": "Matthews Ridge Airport", "iata": "MWJ", "country": "GY"},
-            {"city": "Mattoon", "airport": "Coles County Memorial Airport", "iata": "MTO", "country": "US"},
-            {"city": "Matupá", "airport": "Orlando Villas Boas Regional Airport", "iata": "MBK", "country": "BR"},
-            {"city": "Maturín", "airport": "José Tadeo Monagas International Airport", "iata": "MUN", "country": "VE"},
-            {"city": "Mauke Island", "airport": "Mauke Airport", "iata": "MUK", "country": "CK"},
-            {"city": "Maun", "airport": "Maun Airport", "iata": "MUB", "country": "BW"},
-            {"city": "Maués", "airport": "Maués Airport", "iata": "MBZ", "country": "BR"},
-            {"city": "Mawlamyine", "airport": "Mawlamyine Airport", "iata": "MNU", "country": "MM"},
-            {"city": "Maxton", "airport": "Laurinburg Maxton Airport", "iata": "MXE", "country": "US"},
-            {"city": "May Creek", "airport": "May Creek Airport", "iata": "MYK", "country": "US"},
-            {"city": "May River", "airport": "May River Airstrip", "iata": "MRH", "country": "PG"},
-            {"city": "Maya Flats", "airport": "San Ignacio Town (Maya Flats) Airstrip", "iata": "CYD", "country": "BZ"},
-            {"city": "Mayaguez", "airport": "Eugenio Maria De Hostos Airport", "iata": "MAZ", "country": "PR"},
-            {"city": "Mayajigua", "airport": "Mayajigua Airport", "iata": "MJG", "country": "CU"},
-            {"city": "Maymana", "airport": "Maymana Zahiraddin Faryabi Airport", "iata": "MMZ", "country": "AF"},
-            {"city": "Mayo", "airport": "Mayo Airport", "iata": "YMA", "country": "CA"},
-            {"city": "Mayumba", "airport": "Mayumba Airport", "iata": "MYB", "country": "GA"},
-            {"city": "Mazamari", "airport": "Mayor PNP Nancy Flores Paucar Airport", "iata": "MZA", "country": "PE"},
-            {"city": "Mazar-i-Sharif", "airport": "Mazar-i-Sharif International Airport", "iata": "MZR", "country": "AF"},
-            {"city": "Mazatlàn", "airport": "General Rafael Buelna International Airport", "iata": "MZT", "country": "MX"},
-            {"city": "Mazenod", "airport": "Moshoeshoe I International Airport", "iata": "MSU", "country": "LS"},
-            {"city": "Mbala", "airport": "Mbala Airport", "iata": "MMQ", "country": "ZM"},
-            {"city": "Mbambanakira", "airport": "Babanakira Airport", "iata": "MBU", "country": "SB"},
-            {"city": "Mbandaka", "airport": "Mbandaka Airport", "iata": "MDK", "country": "CD"},
-            {"city": "Mbanza Congo", "airport": "Mbanza Congo Airport", "iata": "SSY", "country": "AO"},
-            {"city": "Mbarara", "airport": "Mbarara Airport", "iata": "MBQ", "country": "UG"},
-            {"city": "Mbeya", "airport": "Songwe Airport", "iata": "MBI", "country": "TZ"},
-            {"city": "Mboki", "airport": "M'Boki Airport", "iata": "MKI", "country": "CF"},
-            {"city": "Mbuji Mayi", "airport": "Mbuji Mayi Airport", "iata": "MJM", "country": "CD"},
-            {"city": "Mc Alester", "airport": "Mc Alester Regional Airport", "iata": "MLC", "country": "US"},
-            {"city": "Mc Minnville", "airport": "Warren County Memorial Airport", "iata": "RNC", "country": "US"},
-            {"city": "Mc Pherson", "airport": "Mc Pherson Airport", "iata": "MPR", "country": "US"},
-            {"city": "Mc Rae", "airport": "Telfair Wheeler Airport", "iata": "MQW", "country": "US"},
-            {"city": "McAllen", "airport": "McAllen Miller International Airport", "iata": "MFE", "country": "US"},
-            {"city": "McArthur River Mine", "airport": "McArthur River Mine Airport", "iata": "MCV", "country": "AU"},
-            {"city": "McCall", "airport": "McCall Municipal Airport", "iata": "MYL", "country": "US"},
-            {"city": "McComb", "airport": "McComb-Pike County Airport / John E Lewis Field", "iata": "MCB", "country": "US"},
-            {"city": "McCook", "airport": "McCook Ben Nelson Regional Airport", "iata": "MCK", "country": "US"},
-            {"city": "McGrath", "airport": "McGrath Airport", "iata": "MCG", "country": "US"},
-            {"city": "Mccarthy", "airport": "Mc Carthy Airport", "iata": "MXY", "country": "US"},
-            {"city": "Meadow Lake", "airport": "Meadow Lake Airport", "iata": "YLJ", "country": "CA"},
-            {"city": "Meadville", "airport": "Port Meadville Airport", "iata": "MEJ", "country": "US"},
-            {"city": "Mecheria", "airport": "Mecheria Airport", "iata": "MZW", "country": "DZ"},
-            {"city": "Medan", "airport": "Soewondo Air Force Base", "iata": "MES", "country": "ID"},
-            {"city": "Medellín", "airport": "Enrique Olaya Herrera Airport", "iata": "EOH", "country": "CO"},
-            {"city": "Medellín", "airport": "Jose Maria Córdova International Airport", "iata": "MDE", "country": "CO"},
-            {"city": "Medford", "airport": "Taylor County Airport", "iata": "MDF", "country": "US"},
-            {"city": "Medford", "airport": "Rogue Valley International Medford Airport", "iata": "MFR", "country": "US"},
-            {"city": "Medicine Hat", "airport": "Medicine Hat Regional Airport", "iata": "YXH", "country": "CA"},
-            {"city": "Medina", "airport": "Prince Mohammad Bin Abdulaziz Airport", "iata": "MED", "country": "SA"},
-            {"city": "Medina", "airport": "Medina Airport", "iata": "MND", "country": "CO"},
-            {"city": "Meghauli", "airport": "Meghauli Airport", "iata": "MEY", "country": "NP"},
-            {"city": "Megève", "airport": "Megève Altiport", "iata": "MVV", "country": "FR"},
-            {"city": "Mehamn", "airport": "Mehamn Airport", "iata": "MEH", "country": "NO"},
-            {"city": "Meizhou (Meixian)", "airport": "Meizhou Meixian Changgangji International Airport", "iata": "MXZ", "country": "CN"},
-            {"city": "Meizhou (Xingning)", "airport": "Xingning Air Base", "iata": "XIN", "country": "CN"},
-            {"city": "Mejato Island", "airport": "Elenak Airport", "iata": "EAL", "country": "MH"},
-            {"city": "Mejit Atoll", "airport": "Mejit Atoll Airport", "iata": "MJB", "country": "MH"},
-            {"city": "Mekambo", "airport": "Mekambo Airport", "iata": "MKB", "country": "GA"},
-            {"city": "Mekane Selam", "airport": "Mekane Selam Airport", "iata": "MKS", "country": "ET"},
-            {"city": "Mekele", "airport": "Alula Aba Nega Airport", "iata": "MQX", "country": "ET"},
-            {"city": "Meknes", "airport": "Bassatine Airport", "iata": "MEK", "country": "MA"},
-            {"city": "Mekoryuk", "airport": "Mekoryuk Airport", "iata": "MYU", "country": "US"},
-            {"city": "Melak-Borneo Island", "airport": "Melalan Airport", "iata": "GHS", "country": "ID"},
-            {"city": "Melbourne", "airport": "Melbourne Orlando International Airport", "iata": "MLB", "country": "US"},
-            {"city": "Melbourne", "airport": "Melbourne Heliport, Batman Park", "iata": "KAH", "country": "AU"},
-            {"city": "Melbourne", "airport": "Melbourne Moorabbin Airport", "iata": "MBW", "country": "AU"},
-            {"city": "Melbourne", "airport": "Melbourne Airport", "iata": "MEL", "country": "AU"},
-            {"city": "Melfa", "airport": "Accomack County Airport", "iata": "MFV", "country": "US"},
-            {"city": "Melfi", "airport": "Melfi Airport", "iata": "MEF", "country": "TD"},
-            {"city": "Melilla", "airport": "Melilla Airport", "iata": "MLN", "country": "ES"},
-            {"city": "Melinda", "airport": "Melinda Airport", "iata": "MDB", "country": "BZ"},
-            {"city": "Melle", "airport": "Gordil Airport", "iata": "GDI", "country": "CF"},
-            {"city": "Mellita", "airport": "Djerba Zarzis International Airport", "iata": "DJE", "country": "TN"},
-            {"city": "Melo", "airport": "Cerro Largo International Airport", "iata": "MLZ", "country": "UY"},
-            {"city": "Memmingen", "airport": "Memmingen Allgau Airport", "iata": "FMM", "country": "DE"},
-            {"city": "Memphis", "airport": "Memphis International Airport", "iata": "MEM", "country": "US"},
-            {"city": "Mena", "airport": "Mena Intermountain Municipal Airport", "iata": "UMZ", "country": "US"},
-            {"city": "Mende/Brénoux", "airport": "Mende-Brenoux Airfield", "iata": "MEN", "country": "FR"},
-            {"city": "Mendi", "airport": "Mendi Airport", "iata": "MDU", "country": "PG"},
-            {"city": "Mendi", "airport": "Mendi Airport", "iata": "NDM", "country": "ET"},
-            {"city": "Mendoza", "airport": "El Plumerillo Airport", "iata": "MDZ", "country": "AR"},
-            {"city": "Menggala", "airport": "Astra Ksetra Airport", "iata": "AKQ", "country": "ID"},
-            {"city": "Mengnai", "airport": "Huatugou Airport", "iata": "HTT", "country": "CN"},
-            {"city": "Mengomeyén", "airport": "President Obiang Nguema International Airport", "iata": "GEM", "country": "GQ"},
-            {"city": "Menominee", "airport": "Menominee–Marinette Twin County Airport", "iata": "MNM", "country": "US"},
-            {"city": "Menongue", "airport": "Menongue Airport", "iata": "SPP", "country": "AO"},
-            {"city": "Menyamya", "airport": "Menyamya Airport", "iata": "MYX", "country": "PG"},
-            {"city": "Merauke", "airport": "Mopah International Airport", "iata": "MKQ", "country": "ID"},
-            {"city": "Merced", "airport": "Merced Regional Macready Field", "iata": "MCE", "country": "US"},
-            {"city": "Merced", "airport": "Castle Airport", "iata": "MER", "country": "US"},
-            {"city": "Mercedes", "airport": "Mercedes Airport", "iata": "MDX", "country": "AR"},
-            {"city": "Mercury", "airport": "Desert Rock Airport", "iata": "DRA", "country": "US"},
-            {"city": "Mercury", "airport": "Yucca Airstrip", "iata": "UCC", "country": "US"},
-            {"city": "Merdei-Papua Island", "airport": "Merdey Airport", "iata": "RDE", "country": "ID"},
-            {"city": "Meridian", "airport": "Key Field / Meridian Regional Airport", "iata": "MEI", "country": "US"},
-            {"city": "Merimbula", "airport": "Merimbula Airport", "iata": "MIM", "country": "AU"},
-            {"city": "Merlo", "airport": "Valle Del Conlara International Airport", "iata": "RLO", "country": "AR"},
-            {"city": "Merluna", "airport": "Merluna Airport", "iata": "MLV", "country": "AU"},
-            {"city": "Merowe", "airport": "Merowe Airport", "iata": "MWE", "country": "SD"},
-            {"city": "Merrill", "airport": "Merrill Municipal Airport", "iata": "RRL", "country": "US"},
-            {"city": "Merritt", "airport": "Merritt Airport", "iata": "YMB", "country": "CA"},
-            {"city": "Merritt Island", "airport": "Merritt Island Airport", "iata": "COI", "country": "US"},
-            {"city": "Mersing", "airport": "Mersing Airport", "iata": "MEP", "country": "MY"},
-            {"city": "Mertarvik", "airport": "Mertarvik Airport", "iata": "WWT", "country": "US"},
-            {"city": "Meru-Kinna", "airport": "Mulika Lodge Airport", "iata": "JJM", "country": "KE"},
-            {"city": "Merville, Nord", "airport": "Merville-Calonne Airport", "iata": "HZB", "country": "FR"},
-            {"city": "Mesa", "airport": "Falcon Field", "iata": "MSC", "country": "US"},
-            {"city": "Mesa", "airport": "Mesa Gateway Airport", "iata": "AZA", "country": "US"},
-            {"city": "Mesquite", "airport": "Mesquite Airport", "iata": "MFH", "country": "US"},
-            {"city": "Messines", "airport": "Maniwaki Airport", "iata": "YMW", "country": "CA"},
-            {"city": "Metema", "airport": "Metema Airport", "iata": "ETE", "country": "ET"},
-            {"city": "Metlakatla", "airport": "Metlakatla Seaplane Base", "iata": "MTM", "country": "US"},
-            {"city": "Metlakatla", "airport": "Annette Island Airport", "iata": "ANN", "country": "US"},
-            {"city": "Mexicali", "airport": "General Rodolfo Sánchez Taboada International Airport", "iata": "MXL", "country": "MX"},
-            {"city": "Mexicali", "airport": "San Felipe International Airport", "iata": "SFH", "country": "MX"},
-            {"city": "Mexico City", "airport": "General Felipe Ángeles International Airport", "iata": "NLU", "country": "MX"},
-            {"city": "Meyers Chuck", "airport": "Meyers Chuck Seaplane Base", "iata": "WMK", "country": "US"},
-            {"city": "Mfuwe", "airport": "Mfuwe Airport", "iata": "MFU", "country": "ZM"},
-            {"city": "Miami", "airport": "Miami International Airport", "iata": "MIA", "country": "US"},
-            {"city": "Miami", "airport": "Miami Municipal Airport", "iata": "MIO", "country": "US"},
-            {"city": "Miami", "airport": "Miami-Opa Locka Executive Airport", "iata": "OPF", "country": "US"},
-            {"city": "Miami", "airport": "Miami Executive Airport", "iata": "TMB", "country": "US"},
-            {"city": "Miami", "airport": "Dade Collier Training and Transition Airport", "iata": "TNT", "country": "US"},
-            {"city": "Miami", "airport": "Miami Seaplane Base", "iata": "MPB", "country": "US"},
-            {"city": "Miandrivazo", "airport": "Miandrivazo Airport", "iata": "ZVA", "country": "MG"},
-            {"city": "Miangas", "airport": "Miangas Airport", "iata": "IAX", "country": "ID"},
-            {"city": "Mianwali", "airport": "Mianwali Air Base", "iata": "MWD", "country": "PK"},
-            {"city": "Mianyang", "airport": "Beichuan Yongchang Airport", "iata": "BCJ", "country": "CN"},
-            {"city": "Mianyang (Fucheng)", "airport": "Mianyang Nanjiao Airport", "iata": "MIG", "country": "CN"},
-            {"city": "Micay", "airport": "Lopez de Micay Airport", "iata": "LMX", "country": "CO"},
-            {"city": "Michigan City", "airport": "Michigan City Municipal Airport", "iata": "MGC", "country": "US"},
-            {"city": "Middle Caicos", "airport": "Middle Caicos Airport", "iata": "MDS", "country": "TC"},
-            {"city": "Middleton Island", "airport": "Middleton Island Airport", "iata": "MDO", "country": "US"},
-            {"city": "Middletown", "airport": "Middletown Regional Airport", "iata": "MWO", "country": "US"},
-            {"city": "Midgard", "airport": "Midgard Airport", "iata": "MQG", "country": "NA"},
-            {"city": "Midland", "airport": "Midland International Air and Space Port", "iata": "MAF", "country": "US"},
-            {"city": "Midland", "airport": "Midland Airpark", "iata": "MDD", "country": "US"},
-            {"city": "Midrand", "airport": "Grand Central Airport", "iata": "GCJ", "country": "ZA"},
-            {"city": "Miele Mimbale", "airport": "Miele Mimbale Airport", "iata": "GIM", "country": "GA"},
-            {"city": "Mihail Kogălniceanu", "airport": "Mihail Kogălniceanu International Airport", "iata": "CND", "country": "RO"},
-            {"city": "Mihail Kogălniceanu", "airport": "Tulcea Danube Delta Airport", "iata": "TCE", "country": "RO"},
-            {"city": "Mikkeli", "airport": "Mikkeli Airport", "iata": "MIK", "country": "FI"},
-            {"city": "Mildura", "airport": "Mildura Airport", "iata": "MQL", "country": "AU"},
-            {"city": "Miles City", "airport": "Miles City Airport - Frank Wiley Field", "iata": "MLS", "country": "US"},
-            {"city": "Milford", "airport": "Milford Municipal-Ben and Judy Briscoe Field", "iata": "MLF", "country": "US"},
-            {"city": "Mili Island", "airport": "Mili Island Airport", "iata": "MIJ", "country": "MH"},
-            {"city": "Milikapiti", "airport": "Snake Bay Airport", "iata": "SNB", "country": "AU"},
-            {"city": "Milingimbi Island", "airport": "Milingimbi Airport", "iata": "MGT", "country": "AU"},
-            {"city": "Milledgeville", "airport": "Baldwin County Regional Airport", "iata": "MLJ", "country": "US"},
-            {"city": "Millington", "airport": "Millington-Memphis Airport", "iata": "NQA", "country": "US"},
-            {"city": "Millinocket", "airport": "Millinocket Municipal Airport", "iata": "MLT", "country": "US"},
-            {"city": "Millville", "airport": "Millville Municipal Airport", "iata": "MIV", "country": "US"},
-            {"city": "Milos Island", "airport": "Milos Airport", "iata": "MLO", "country": "GR"},
-            {"city": "Milton", "airport": "Whiting Field Naval Air Station - North", "iata": "NSE", "country": "US"},
-            {"city": "Milwaukee", "airport": "General Mitchell International Airport", "iata": "MKE", "country": "US"},
-            {"city": "Milwaukee", "airport": "Lawrence J Timmerman Airport", "iata": "MWC", "country": "US"},
-            {"city": "Minamidaito", "airport": "Minamidaito Airport", "iata": "MMD", "country": "JP"},
-            {"city": "Minaçu", "airport": "Minaçu Airport", "iata": "MQH", "country": "BR"},
-            {"city": "Minchumina", "airport": "Minchumina Airport", "iata": "LMA", "country": "US"},
-            {"city": "Minden", "airport": "Minden-Tahoe Airport", "iata": "MEV", "country": "US"},
-            {"city": "Mindik", "airport": "Mindik Airport", "iata": "MXK", "country": "PG"},
-            {"city": "Mindiptana-Papua Island", "airport": "Mindiptana Airport", "iata": "MDP", "country": "ID"},
-            {"city": "Mineral Wells", "airport": "Mineral Wells Regional Airport", "iata": "MWL", "country": "US"},
-            {"city": "Mineralnyye Vody", "airport": "Mineralnyye Vody Airport", "iata": "MRV", "country": "RU"},
-            {"city": "Miners Bay", "airport": "Mayne Island Seaplane Base", "iata": "YAV", "country": "CA"},
-            {"city": "Minj", "airport": "Minj Airport", "iata": "MZN", "country": "PG"},
-            {"city": "Minna", "airport": "Minna Airport", "iata": "MXJ", "country": "NG"},
-            {"city": "Minneapolis", "airport": "Flying Cloud Airport", "iata": "FCM", "country": "US"},
-            {"city": "Minneapolis", "airport": "Crystal Airport", "iata": "MIC", "country": "US"},
-            {"city": "Minneapolis", "airport": "Minneapolis–Saint Paul International Airport / Wold–Chamberlain Field", "iata": "MSP", "country": "US"},
-            {"city": "Minot", "airport": "Minot Air Force Base", "iata": "MIB", "country": "US"},
-            {"city": "Minot", "airport": "Minot International Airport", "iata": "MOT", "country": "US"},
-            {"city": "Minsk", "airport": "Minsk National Airport", "iata": "MSQ", "country": "BY"},
-            {"city": "Minto", "airport": "Minto Al Wright Airport", "iata": "MNT", "country": "US"},
-            {"city": "Minvoul", "airport": "Minvoul Airport", "iata": "MVX", "country": "GA"},
-            {"city": "Miquelon", "airport": "Miquelon Airport", "iata": "MQC", "country": "PM"},
-            {"city": "Miraflores", "airport": "Miraflores Airport", "iata": "MFS", "country": "CO"},
-            {"city": "Miramar", "airport": "Miramar Airport", "iata": "MJR", "country": "AR"},
-            {"city": "Miramichi", "airport": "Miramichi Airport", "iata": "YCH", "country": "CA"},
-            {"city": "Miranda Downs", "airport": "Miranda Downs Airport", "iata": "MWY", "country": "AU"},
-            {"city": "Miri", "airport": "Miri Airport", "iata": "MYY", "country": "MY"},
-            {"city": "Mirití-Paraná", "airport": "Miriti Parana Airport", "iata": "MIX", "country": "CO"},
-            {"city": "Mirny", "airport": "Mirny Airport", "iata": "MJZ", "country": "RU"},
-            {"city": "Mirpur Khas", "airport": "Sukkur Airport", "iata": "SKZ", "country": "PK"},
-            {"city": "Misawa", "airport": "Misawa Airport / Misawa Air Base", "iata": "MSJ", "country": "JP"},
-            {"city": "Misima Island", "airport": "Misima Island Airport", "iata": "MIS", "country": "PG"},
-            {"city": "Misrata", "airport": "Misrata International Airport", "iata": "MRA", "country": "LY"},
-            {"city": "Missoula", "airport": "Missoula International Airport", "iata": "MSO", "country": "US"},
-            {"city": "Mitchell", "airport": "Mitchell Municipal Airport", "iata": "MHE", "country": "US"},
-            {"city": "Mitchell Plateau", "airport": "Mitchell Plateau Airport", "iata": "MIH", "country": "AU"},
-            {"city": "Mitiaro Island", "airport": "Mitiaro Island Airport", "iata": "MOI", "country": "CK"},
-            {"city": "Mitzic", "airport": "Mitzic Airport", "iata": "MZC", "country": "GA"},
-            {"city": "Mitú", "airport": "Fabio Alberto Leon Bentley Airport", "iata": "MVP", "country": "CO"},
-            {"city": "Miyakejima", "airport": "Miyakejima Airport", "iata": "MYE", "country": "JP"},
-            {"city": "Miyakojima", "airport": "Miyako Airport", "iata": "MMY", "country": "JP"},
-            {"city": "Miyakojima", "airport": "Shimojishima Airport", "iata": "SHI", "country": "JP"},
-            {"city": "Miyanmin", "airport": "Miyanmin Airport", "iata": "MPX", "country": "PG"},
-            {"city": "Miyazaki", "airport": "Miyazaki Airport", "iata": "KMI", "country": "JP"},
-            {"city": "Mizan Teferi", "airport": "Mizan Teferi Airport", "iata": "MTF", "country": "ET"},
-            {"city": "Mkambati", "airport": "Mkambati Airport", "iata": "MBM", "country": "ZA"},
-            {"city": "Mkeik", "airport": "Myeik Airport", "iata": "MGZ", "country": "MM"},
-            {"city": "Mkuze", "airport": "Mkuze Airport", "iata": "MZQ", "country": "ZA"},
-            {"city": "Mnichovo Hradiště", "airport": "Mnichovo Hradiště Airport", "iata": "HRA", "country": "CZ"},
-            {"city": "Mo i Rana", "airport": "Mo i Rana Airport, Røssvoll", "iata": "MQN", "country": "NO"},
-            {"city": "Moa", "airport": "Orestes Acosta Airport", "iata": "MOA", "country": "CU"},
-            {"city": "Moab", "airport": "Canyonlands Regional Airport", "iata": "CNY", "country": "US"},
-            {"city": "Moabi", "airport": "Moabi Airport", "iata": "MGX", "country": "GA"},
-            {"city": "Moala", "airport": "Moala Airport", "iata": "MFJ", "country": "FJ"},
-            {"city": "Moanamani", "airport": "Moanamani Airport", "iata": "ONI", "country": "ID"},
-            {"city": "Moanda", "airport": "Moanda Airport", "iata": "MFF", "country": "GA"},
-            {"city": "Moba", "airport": "Moba Airport", "iata": "BDV", "country": "CD"},
-            {"city": "Moberly", "airport": "Omar N Bradley Airport", "iata": "MBY", "country": "US"},
-            {"city": "Mobile", "airport": "Mobile Downtown Airport", "iata": "BFM", "country": "US"},
-            {"city": "Mobile", "airport": "Mobile Regional Airport", "iata": "MOB", "country": "US"},
-            {"city": "Mobridge", "airport": "Mobridge Municipal Airport", "iata": "MBG", "country": "US"},
-            {"city": "Mocímboa da Praia", "airport": "Mocímboa da Praia Airport", "iata": "MZB", "country": "MZ"},
-            {"city": "Modesto", "airport": "Modesto City Co-Harry Sham Field", "iata": "MOD", "country": "US"},
-            {"city": "Moengo", "airport": "Moengo Airstrip", "iata": "MOJ", "country": "SR"},
-            {"city": "Moenjodaro", "airport": "Moenjodaro Airport", "iata": "MJD", "country": "PK"},
-            {"city": "Mogadishu", "airport": "Aden Adde International Airport", "iata": "MGQ", "country": "SO"},
-            {"city": "Mogilev", "airport": "Mogilev Airport", "iata": "MVQ", "country": "BY"},
-            {"city": "Mohe", "airport": "Mohe Gulian Airport", "iata": "OHE", "country": "CN"},
-            {"city": "Mojave", "airport": "Mojave Airport", "iata": "MHV", "country": "US"},
-            {"city": "Mokhotlong", "airport": "Mokhotlong Airport", "iata": "MKH", "country": "LS"},
-            {"city": "Moki", "airport": "Moki Airport", "iata": "MJJ", "country": "PG"},
-            {"city": "Mokuleia", "airport": "Kawaihapai Airfield", "iata": "HDH", "country": "US"},
-            {"city": "Mokuti Lodge", "airport": "Mokuti Lodge Airport", "iata": "OKU", "country": "NA"},
-            {"city": "Moline", "airport": "Quad City International Airport", "iata": "MLI", "country": "US"},
-            {"city": "Mombasa", "airport": "Moi International Airport", "iata": "MBA", "country": "KE"},
-            {"city": "Monahans", "airport": "Roy Hurd Memorial Airport", "iata": "MIF", "country": "US"},
-            {"city": "Monastir", "airport": "Monastir Habib Bourguiba International Airport", "iata": "MIR", "country": "TN"},
-            {"city": "Monbetsu", "airport": "Monbetsu Airport", "iata": "MBE", "country": "JP"},
-            {"city": "Monclova", "airport": "Monclova International Airport", "iata": "LOV", "country": "MX"},
-            {"city": "Moncton", "airport": "Greater Moncton Roméo LeBlanc International Airport", "iata": "YQM", "country": "CA"},
-            {"city": "Monflorite/Alcalá del Obispo", "airport": "Huesca-Pirineos Airport", "iata": "HSK", "country": "ES"},
-            {"city": "Monfort", "airport": "Monfort Airport", "iata": "MFB", "country": "CO"},
-            {"city": "Mong Hsat", "airport": "Mong Hsat Airport", "iata": "MOG", "country": "MM"},
-            {"city": "Mong Tong", "airport": "Mong Tong Airport", "iata": "MGK", "country": "MM"},
-            {"city": "Mongo", "airport": "Mongo Airport", "iata": "MVO", "country": "TD"},
-            {"city": "Mongu", "airport": "Mongu Airport", "iata": "MNR", "country": "ZM"},
-            {"city": "Monkey Bay", "airport": "Monkey Bay Airport", "iata": "MYZ", "country": "MW"},
-            {"city": "Monkey Mountain", "airport": "Monkey Mountain Airport", "iata": "MYM", "country": "GY"},
-            {"city": "Monroe", "airport": "Monroe Regional Airport", "iata": "MLU", "country": "US"},
-            {"city": "Monroeville", "airport": "Monroe County Aeroplex Airport", "iata": "MVC", "country": "US"},
-            {"city": "Monrovia", "airport": "Spriggs Payne Airport", "iata": "MLW", "country": "LR"},
-            {"city": "Monrovia", "airport": "Roberts International Airport", "iata": "ROB", "country": "LR"},
-            {"city": "Mont-Joli", "airport": "Mont Joli Airport", "iata": "YYY", "country": "CA"},
-            {"city": "Montague", "airport": "Montague-Yreka Rohrer Field", "iata": "ROF", "country": "US"},
-            {"city": "Montague", "airport": "Siskiyou County Airport", "iata": "SIY", "country": "US"},
-            {"city": "Montauk", "airport": "Montauk Airport", "iata": "MTP", "country": "US"},
-            {"city": "Monte Alegre", "airport": "Monte Alegre Airport", "iata": "MTE", "country": "BR"},
-            {"city": "Monte Caseros", "airport": "Monte Caseros Airport", "iata": "MCS", "country": "AR"},
-            {"city": "Montego Bay", "airport": "Sangster International Airport", "iata": "MBJ", "country": "JM"},
-            {"city": "Montelíbano", "airport": "Montelibano Airport", "iata": "MTB", "country": "CO"},
-            {"city": "Montenegro", "airport": "Montenegro Airport", "iata": "QGF", "country": "BR"},
-            {"city": "Montepuez", "airport": "Montepuez Airport", "iata": "MTU", "country": "MZ"},
-            {"city": "Monterey", "airport": "Monterey Peninsula Airport", "iata": "MRY", "country": "US"},
-            {"city": "Monterrey", "airport": "Del Norte International Airport", "iata": "NTR", "country": "MX"},
-            {"city": "Monterrey", "airport": "Monterrey International Airport", "iata": "MTY", "country": "MX"},
-            {"city": "Monterrey", "airport": "Monterrey Airport", "iata": "MOY", "country": "CO"},
-            {"city": "Montería", "airport": "Los Garzones Airport", "iata": "MTR", "country": "CO"},
-            {"city": "Montes Claros", "airport": "Mário Ribeiro Airport", "iata": "MOC", "country": "BR"},
-            {"city": "Montevideo", "airport": "Montevideo Chippewa County Airport", "iata": "MVE", "country": "US"},
-            {"city": "Montgomery", "airport": "Orange County Airport", "iata": "MGJ", "country": "US"},
-            {"city": "Montgomery", "airport": "Montgomery Regional (Dannelly Field) Airport", "iata": "MGM", "country": "US"},
-            {"city": "Montgomery", "airport": "Maxwell Air Force Base", "iata": "MXF", "country": "US"},
-            {"city": "Monticello", "airport": "Sullivan County International Airport", "iata": "MSV", "country": "US"},
-            {"city": "Monticello", "airport": "Monticello Regional Airport", "iata": "MXO", "country": "US"},
-            {"city": "Monticello", "airport": "Monticello Airport", "iata": "MXC", "country": "US"},
-            {"city": "Montichiari (BS)", "airport": "Brescia Gabriele d'Annunzio Airport", "iata": "VBS", "country": "IT"},
-            {"city": "Montpellier/Méditerranée", "airport": "Montpellier-Méditerranée Airport", "iata": "MPL", "country": "FR"},
-            {"city": "Montrose", "airport": "Montrose Regional Airport", "iata": "MTJ", "country": "US"},
-            {"city": "Montréal", "airport": "Montréal / Saint-Hubert Metropolitan Airport", "iata": "YHU", "country": "CA"},
-            {"city": "Montréal", "airport": "Montreal International (Mirabel) Airport", "iata": "YMX", "country": "CA"},
-            {"city": "Montréal", "airport": "Montreal / Pierre Elliott Trudeau International Airport", "iata": "YUL", "country": "CA"},
-            {"city": "Monywar", "airport": "Monywar Airport", "iata": "NYW", "country": "MM"},
-            {"city": "Moolawatana Station", "airport": "Moolawatana Airport", "iata": "MWT", "country": "AU"},
-            {"city": "Moomba", "airport": "Moomba Airport", "iata": "MOO", "country": "AU"},
-            {"city": "Moonyoonooka", "airport": "Geraldton Airport", "iata": "GET", "country": "AU"},
-            {"city": "Moorea-Maiao", "airport": "Moorea Temae Airport", "iata": "MOZ", "country": "PF"},
-            {"city": "Moose Jaw", "airport": "Moose Jaw Air Vice Marshal C. M. McEwen Airport", "iata": "YMJ", "country": "CA"},
-            {"city": "Moosonee", "airport": "Moosonee Airport", "iata": "YMO", "country": "CA"},
-            {"city": "Mopa", "airport": "Manohar International Airport", "iata": "GOX", "country": "IN"},
-            {"city": "Mora", "airport": "Mora Airport", "iata": "MXX", "country": "SE"},
-            {"city": "Moradabad", "airport": "Moradabad Airport", "iata": "MZS", "country": "IN"},
-            {"city": "Morafenobe", "airport": "Morafenobe Airport", "iata": "TVA", "country": "MG"},
-            {"city": "Moramanga", "airport": "Ambohibary Airport", "iata": "OHB", "country": "MG"},
-            {"city": "Moranbah", "airport": "Moranbah Airport", "iata": "MOV", "country": "AU"},
-            {"city": "Moree", "airport": "Moree Airport", "iata": "MRZ", "country": "AU"},
-            {"city": "Morehead", "airport": "Morehead Airport", "iata": "MHY", "country": "PG"},
-            {"city": "Morelia", "airport": "General Francisco J. Mujica International Airport", "iata": "MLM", "country": "MX"},
-            {"city": "Moreton", "airport": "Moreton Airport", "iata": "MET", "country": "AU"},
-            {"city": "Morganton", "airport": "Foothills Regional Airport", "iata": "MRN", "country": "US"},
-            {"city": "Morgantown", "airport": "Morgantown Municipal Airport Walter L. (Bill) Hart Field", "iata": "MGW", "country": "US"},
-            {"city": "Mori", "airport": "Socotra International Airport", "iata": "SCT", "country": "YE"},
-            {"city": "Morichal", "airport": "Morichal Airport", "iata": "MHF", "country": "CO"},
-            {"city": "Morlaix/Ploujean", "airport": "Morlaix-Ploujean Airport", "iata": "MXN", "country": "FR"},
-            {"city": "Moro", "airport": "Moro Airport", "iata": "MXH", "country": "PG"},
-            {"city": "Moroak", "airport": "Moroak Airport", "iata": "MRT", "country": "AU"},
-            {"city": "Morobe", "airport": "Morobe Airport", "iata": "OBM", "country": "PG"},
-            {"city": "Morombe", "airport": "Morombe Airport", "iata": "MXM", "country": "MG"},
-            {"city": "Morondava", "airport": "Morondava Airport", "iata": "MOQ", "country": "MG"},
-            {"city": "Moroni", "airport": "Prince Said Ibrahim International Airport", "iata": "HAH", "country": "KM"},
-            {"city": "Morowali", "airport": "Maleo Airport", "iata": "MOH", "country": "ID"},
-            {"city": "Morowali", "airport": "Indonesia Morowali Industrial Park (IMIP) Airport", "iata": "MWS", "country": "ID"},
-            {"city": "Morrilton", "airport": "Petit Jean Park Airport", "iata": "MPJ", "country": "US"},
-            {"city": "Morris", "airport": "Morris Municipal Airport Charlie Schmidt Field", "iata": "MOX", "country": "US"},
-            {"city": "Morristown", "airport": "Morristown Municipal Airport", "iata": "MMU", "country": "US"},
-            {"city": "Morristown", "airport": "Morristown Regional Airport", "iata": "MOR", "country": "US"},
-            {"city": "Morrisville", "airport": "Morrisville-Stowe State Airport", "iata": "MVL", "country": "US"},
-            {"city": "Moruroa Atoll", "airport": "Moruroa Airport", "iata": "UOA", "country": "PF"},
-            {"city": "Moruya", "airport": "Moruya Airport", "iata": "MYA", "country": "AU"},
-            {"city": "Morwell", "airport": "Latrobe Valley Airport", "iata": "TGN", "country": "AU"},
-            {"city": "Morón", "airport": "Moron Air Base", "iata": "OZP", "country": "ES"},
-            {"city": "Moscow", "airport": "Zhukovsky International Airport", "iata": "ZIA", "country": "RU"},
-            {"city": "Moscow", "airport": "Domodedovo International Airport", "iata": "DME", "country": "RU"},
-            {"city": "Moscow", "airport": "Sheremetyevo International Airport", "iata": "SVO", "country": "RU"},
-            {"city": "Moscow", "airport": "Ostafyevo International Airport", "iata": "OSF", "country": "RU"},
-            {"city": "Moscow", "airport": "Chkalovskiy Air Base", "iata": "CKL", "country": "RU"},
-            {"city": "Moscow", "airport": "Vnukovo International Airport", "iata": "VKO", "country": "RU"},
-            {"city": "Moselle", "airport": "Hattiesburg Laurel Regional Airport", "iata": "PIB", "country": "US"},
-            {"city": "Moser Bay", "airport": "Moser Bay Seaplane Base", "iata": "KMY", "country": "US"},
-            {"city": "Moses Lake", "airport": "Grant County International Airport", "iata": "MWH", "country": "US"},
-            {"city": "Moshi", "airport": "Moshi Airport", "iata": "QSI", "country": "TZ"},
-            {"city": "Mosinee", "airport": "Central Wisconsin Airport", "iata": "CWA", "country": "US"},
-            {"city": "Mosjøen", "airport": "Mosjøen Airport, Kjærstad", "iata": "MJF", "country": "NO"},
-            {"city": "Mosquera", "airport": "Mosquera Airport", "iata": "MQR", "country": "CO"},
-            {"city": "Moss Town", "airport": "Exuma International Airport", "iata": "GGT", "country": "BS"},
-            {"city": "Mossel Bay", "airport": "Mossel Bay Airport", "iata": "MZY", "country": "ZA"},
-            {"city": "Mossendjo", "airport": "Mossendjo Airport", "iata": "MSX", "country": "CG"},
-            {"city": "Mossoró", "airport": "Dix-Sept Rosado Airport", "iata": "MVF", "country": "BR"},
-            {"city": "Mostar", "airport": "Mostar International Airport", "iata": "OMO", "country": "BA"},
-            {"city": "Mosul", "airport": "Mosul International Airport", "iata": "OSM", "country": "IQ"},
-            {"city": "Motswari Private Game Reserve", "airport": "Motswari Airport", "iata": "MWR", "country": "ZA"},
-            {"city": "Motu Mute", "airport": "Bora Bora Airport", "iata": "BOB", "country": "PF"},
-            {"city": "Motygino", "airport": "Motygino Airport", "iata": "MJY", "country": "RU"},
-            {"city": "Moucha Island", "airport": "Moucha Airport", "iata": "MHI", "country": "DJ"},
-            {"city": "Moudjeria", "airport": "Letfotar Airport", "iata": "MOM", "country": "MR"},
-            {"city": "Mougulu", "airport": "Mougulu Airport", "iata": "GUV", "country": "PG"},
-            {"city": "Mouila", "airport": "Mouilla Ville Airport", "iata": "MJL", "country": "GA"},
-            {"city": "Moultrie", "airport": "Moultrie Municipal Airport", "iata": "MGR", "country": "US"},
-            {"city": "Moultrie", "airport": "Spence Airport", "iata": "MUL", "country": "US"},
-            {"city": "Moundou", "airport": "Moundou Airport", "iata": "MQQ", "country": "TD"},
-            {"city": "Mount Clemens", "airport": "Selfridge Air National Guard Base Airport", "iata": "MTC", "country": "US"},
-            {"city": "Mount Eba", "airport": "Prominent Hill Airport", "iata": "PXH", "country": "AU"},
-            {"city": "Mount Etjo Safari Lodge", "airport": "Mount Etjo Airport", "iata": "MJO", "country": "NA"},
-            {"city": "Mount Gambier", "airport": "Mount Gambier Airport", "iata": "MGB", "country": "AU"},
-            {"city": "Mount Gordon Mine", "airport": "Mount Gordon Airport", "iata": "GPD", "country": "AU"},
-            {"city": "Mount Gunson", "airport": "Mount Gunson Airport", "iata": "GSN", "country": "AU"},
-            {"city": "Mount Hagen", "airport": "Mount Hagen Kagamuga Airport", "iata": "HGU", "country": "PG"},
-            {"city": "Mount Hotham", "airport": "Mount Hotham Airport", "iata": "MHU", "country": "AU"},
-            {"city": "Mount Isa", "airport": "Mount Isa Airport", "iata": "ISA", "country": "AU"},
-            {"city": "Mount Pleasant", "airport": "Mount Pleasant Airport", "iata": "MPN", "country": "FK"},
-            {"city": "Mount Pleasant", "airport": "Mount Pleasant Municipal Airport", "iata": "MOP", "country": "US"},
-            {"city": "Mount Pleasant", "airport": "Mount Pleasant Municipal Airport", "iata": "MPZ", "country": "US"},
-            {"city": "Mount Pleasant", "airport": "Mount Pleasant Regional Airport", "iata": "MPS", "country": "US"},
-            {"city": "Mount Pocono", "airport": "Pocono Mountains Municipal Airport", "iata": "MPO", "country": "US"},
-            {"city": "Mount Vernon", "airport": "Mount Vernon Outland Airport", "iata": "MVN", "country": "US"},
-            {"city": "Mountain Home", "airport": "Ozark Regional Airport", "iata": "WMH", "country": "US"},
-            {"city": "Mountain Home", "airport": "Mountain Home Air Force Base", "iata": "MUO", "country": "US"},
-            {"city": "Mountain View", "airport": "Moffett Federal Airfield", "iata": "NUQ", "country": "US"},
-            {"city": "Mountain Village", "airport": "Mountain Village Airport", "iata": "MOU", "country": "US"},
-            {"city": "Mouyondzi", "airport": "Mouyondzi Airport", "iata": "MUY", "country": "CG"},
-            {"city": "Moyale", "airport": "Moyale Airport", "iata": "MYS", "country": "ET"},
-            {"city": "Moyale (Lower)", "airport": "Moyale Airport", "iata": "OYL", "country": "KE"},
-            {"city": "Moyo", "airport": "Moyo Airport", "iata": "OYG", "country": "UG"},
-            {"city": "Moyobamba", "airport": "Moyobamba Airport", "iata": "MBP", "country": "PE"},
-            {"city": "Moçâmedes", "airport": "Welwitschia Mirabilis International Airport", "iata": "MSZ", "country": "AO"},
-            {"city": "Mošnov", "airport": "Ostrava Leos Janáček Airport", "iata": "OSR", "country": "CZ"},
-            {"city": "Mpacha", "airport": "Katima Mulilo Airport", "iata": "MPA", "country": "NA"},
-            {"city": "Mpaka", "airport": "King Mswati III International Airport", "iata": "SHO", "country": "SZ"},
-            {"city": "Mpanda", "airport": "Mpanda Airport", "iata": "NPY", "country": "TZ"},
-            {"city": "Mpumalanga", "airport": "Kruger Mpumalanga International Airport", "iata": "MQP", "country": "ZA"},
-            {"city": "Mthatha", "airport": "K. D. Matanzima Airport", "iata": "UTT", "country": "ZA"},
-            {"city": "Mtwara", "airport": "Mtwara Airport", "iata": "MYW", "country": "TZ"},
-            {"city": "Muan (Piseo-ri)", "airport": "Muan International Airport", "iata": "MWX", "country": "KR"},
-            {"city": "Muanda", "airport": "Muanda Airport", "iata": "MNB", "country": "CD"},
-            {"city": "Muara Bungo", "airport": "Muara Bungo Airport", "iata": "BUU", "country": "ID"},
-            {"city": "Muara Teweh", "airport": "Haji Muhammad Sidik Airport", "iata": "HMS", "country": "ID"},
-            {"city": "Mubatuba", "airport": "Mubatuba Airport", "iata": "DUK", "country": "ZA"},
-            {"city": "Muccan Station", "airport": "Muccan Station Airport", "iata": "MUQ", "country": "AU"},
-            {"city": "Mucugê", "airport": "Mucugê Airport", "iata": "CHD", "country": "BR"},
-            {"city": "Mucuri", "airport": "Mucuri Airport", "iata": "MVS", "country": "BR"},
-            {"city": "Mudanjiang", "airport": "Mudanjiang Hailang International Airport", "iata": "MDG", "country": "CN"},
-            {"city": "Mudgee", "airport": "Mudgee Airport", "iata": "DGE", "country": "AU"},
-            {"city": "Mueda", "airport": "Mueda Airport", "iata": "MUD", "country": "MZ"},
-            {"city": "Mukah", "airport": "Mukah Airport", "iata": "MKM", "country": "MY"},
-            {"city": "Mukayras", "airport": "Mukeiras Airport", "iata": "UKR", "country": "YE"},
-            {"city": "Mukhaizna Oil Field", "airport": "Mukhaizna Airport", "iata": "UKH", "country": "OM"},
-            {"city": "Muko Muko", "airport": "Muko Muko Airport", "iata": "MPC", "country": "ID"},
-            {"city": "Mulatos", "airport": "Mulatos Airport", "iata": "ULS", "country": "CO"},
-            {"city": "Mulatupo", "airport": "Mulatupo Airport", "iata": "MPP", "country": "PA"},
-            {"city": "Mulege", "airport": "Mulege Airport", "iata": "MUG", "country": "MX"},
-            {"city": "Mulegé", "airport": "Punta Abreojos Airport", "iata": "AJS", "country": "MX"},
-            {"city": "Mulegé", "airport": "Punta Chivato Airport", "iata": "PCV", "country": "MX"},
-            {"city": "Mulegé", "airport": "San Ignacio Airport", "iata": "SGM", "country": "MX"},
-            {"city": "Mulegé", "airport": "Palo Verde Airport", "iata": "SRL", "country": "MX"},
-            {"city": "Muli", "airport": "Muli Airport", "iata": "MUM", "country": "MV"},
-            {"city": "Mulia-Papua Island", "airport": "Mulia Airport", "iata": "LII", "country": "ID"},
-            {"city": "Mulka", "airport": "Mulka Airport", "iata": "MVK", "country": "AU"},
-            {"city": "Mullen", "airport": "Hooker County Airport", "iata": "MHN", "country": "US"},
-            {"city": "Multan", "airport": "Multan International Airport", "iata": "MUX", "country": "PK"},
-            {"city": "Mulu", "airport": "Mulu Airport", "iata": "MZV", "country": "MY"},
-            {"city": "Mumbai", "airport": "Chhatrapati Shivaji International Airport", "iata": "BOM", "country": "IN"},
-            {"city": "Muncie", "airport": "Delaware County Johnson Field", "iata": "MIE", "country": "US"},
-            {"city": "Munda", "airport": "Munda Airport", "iata": "MUA", "country": "SB"},
-            {"city": "Munduku", "airport": "Munduku Airport", "iata": "MDM", "country": "PG"},
-            {"city": "Muneambuanas", "airport": "Lianshulu Lodge Airstrip", "iata": "LHU", "country": "NA"},
-            {"city": "Mungeranie", "airport": "Mungeranie Airport", "iata": "MNE", "country": "AU"},
-            {"city": "Munich", "airport": "Munich Airport", "iata": "MUC", "country": "DE"},
-            {"city": "Murmansk", "airport": "Murmansk Airport", "iata": "MMK", "country": "RU"},
-            {"city": "Murphysboro", "airport": "Southern Illinois Airport", "iata": "MDH", "country": "US"},
-            {"city": "Murray", "airport": "Murray-Calloway County Airport Kyle-Oakley Field", "iata": "CEY", "country": "US"},
-            {"city": "Murray Island", "airport": "Murray Island Airport", "iata": "MYI", "country": "AU"},
-            {"city": "Murrieta", "airport": "French Valley Airport", "iata": "RBK", "country": "US"},
-            {"city": "Murrin Murrin", "airport": "Murrin Murrin Airport", "iata": "WUI", "country": "AU"},
-            {"city": "Muscat", "airport": "Muscat International Airport", "iata": "MCT", "country": "OM"},
-            {"city": "Muscatine", "airport": "Muscatine Municipal Airport", "iata": "MUT", "country": "US"},
-            {"city": "Muscle Shoals", "airport": "Northwest Alabama Regional Airport", "iata": "MSL", "country": "US"},
-            {"city": "Musgrave", "airport": "Musgrave Airport", "iata": "MVU", "country": "AU"},
-            {"city": "Musiara", "airport": "Musiara Airstrip", "iata": "MDR", "country": "KE"},
-            {"city": "Musina", "airport": "Musina(Messina) Airport", "iata": "MEZ", "country": "ZA"},
-            {"city": "Muskegon", "airport": "Muskegon County Airport", "iata": "MKG", "country": "US"},
-            {"city": "Muskogee", "airport": "Muskogee-Davis Regional Airport", "iata": "MKO", "country": "US"},
-            {"city": "Muskrat Dam", "airport": "Muskrat Dam Airport", "iata": "MSA", "country": "CA"},
-            {"city": "Musoma", "airport": "Musoma Airport", "iata": "MUZ", "country": "TZ"},
-            {"city": "Mussau Island", "airport": "Mussau Airport", "iata": "MWU", "country": "PG"},
-            {"city": "Mutare", "airport": "Mutare Airport", "iata": "UTA", "country": "ZW"},
-            {"city": "Muynak", "airport": "Muynak Airport", "iata": "MOK", "country": "UZ"},
-            {"city": "Muzaffarabad", "airport": "Muzaffarabad Airport", "iata": "MFG", "country": "PK"},
-            {"city": "Muzaffarpur", "airport": "Muzaffarpur Airport", "iata": "MZU", "country": "IN"},
-            {"city": "Muş", "airport": "Muş Airport", "iata": "MSR", "country": "TR"},
-            {"city": "Mwadui", "airport": "Mwadui Airport", "iata": "MWN", "country": "TZ"},
-            {"city": "Mwanza", "airport": "Mwanza Airport", "iata": "MWZ", "country": "TZ"},
-            {"city": "Mweka", "airport": "Mweka Airport", "iata": "MEW", "country": "CD"},
-            {"city": "Myitkyina", "airport": "Myitkyina Airport", "iata": "MYT", "country": "MM"},
-            {"city": "Mykonos", "airport": "Mykonos Island National Airport", "iata": "JMK", "country": "GR"},
-            {"city": "Myrhorod", "airport": "Myrhorod Air Base", "iata": "MXR", "country": "UA"},
-            {"city": "Myrtle Beach", "airport": "Myrtle Beach International Airport", "iata": "MYR", "country": "US"},
-            {"city": "Mys Kamennyi", "airport": "Mys Kamenny Airport", "iata": "YMK", "country": "RU"},
-            {"city": "Mysore", "airport": "Mysore Airport", "iata": "MYQ", "country": "IN"},
-            {"city": "Mytilene", "airport": "Mytilene International Airport", "iata": "MJT", "country": "GR"},
-            {"city": "Myvatn", "airport": "Reykjahlíð Airport", "iata": "MVA", "country": "IS"},
-            {"city": "Mzuzu", "airport": "Mzuzu Airport", "iata": "ZZU", "country": "MW"},
-            {"city": "Málaga", "airport": "Málaga-Costa del Sol Airport", "iata": "AGP", "country": "ES"},
-            {"city": "Máncora", "airport": "Walter Braedt Segú Airport", "iata": "PTL", "country": "PE"},
-            {"city": "Målselv", "airport": "Bardufoss Airport", "iata": "BDU", "country": "NO"},
-            {"city": "Médouneu, Gabon", "airport": "Médouneu Airport", "iata": "MDV", "country": "GQ"},
-            {"city": "Mérida", "airport": "Manuel Crescencio Rejón International Airport", "iata": "MID", "country": "MX"},
-            {"city": "Mérida", "airport": "Alberto Carnevalli Airport", "iata": "MRD", "country": "VE"},
-            {"city": "Mönchengladbach", "airport": "Mönchengladbach Airport", "iata": "MGL", "country": "DE"},
-            {"city": "Mörön", "airport": "Mörön Airport", "iata": "MXV", "country": "MN"},
-            {"city": "N'Djamena", "airport": "N'Djamena International Airport", "iata": "NDJ", "country": "TD"},
-            {"city": "N'Djolé", "airport": "Ville Airport", "iata": "KDJ", "country": "GA"},
-            {"city": "N'Délé", "airport": "N'Délé Airport", "iata": "NDL", "country": "CF"},
-            {"city": "N'Gaoundéré", "airport": "N'Gaoundéré Airport", "iata": "NGE", "country": "CM"},
-            {"city": "N'Kolo-Fuma", "airport": "N'Kolo-Fuma Airport", "iata": "NKL", "country": "CD"},
-            {"city": "N'dalatando", "airport": "N'dalatando Airport", "iata": "NDF", "country": "AO"},
-            {"city": "N'dolo", "airport": "Ndolo Airport", "iata": "NLO", "country": "CD"},
-            {"city": "N'zeto", "airport": "N'zeto Airport", "iata": "ARZ", "country": "AO"},
-            {"city": "Na Thon (Ko Samui Island)", "airport": "Samui Airport", "iata": "USM", "country": "TH"},
-            {"city": "Nabire", "airport": "Douw Aturure Airport", "iata": "NBX", "country": "ID"},
-            {"city": "Nacala", "airport": "Nacala Airport", "iata": "MNC", "country": "MZ"},
-            {"city": "Nachingwea", "airport": "Nachingwea Airport", "iata": "NCH", "country": "TZ"},
-            {"city": "Nacogdoches", "airport": "A L Mangham Jr. Regional Airport", "iata": "OCH", "country": "US"},
-            {"city": "Nadi", "airport": "Nadi International Airport", "iata": "NAN", "country": "FJ"},
-            {"city": "Nadunumu", "airport": "Nadunumu Airport", "iata": "NDN", "country": "PG"},
-            {"city": "Nadym", "airport": "Nadym Airport", "iata": "NYM", "country": "RU"},
-            {"city": "Nafurah 1", "airport": "Nafurah 1 Airport", "iata": "NFR", "country": "LY"},
-            {"city": "Naga", "airport": "Naga Airport", "iata": "WNP", "country": "PH"},
-            {"city": "Nagasaki", "airport": "JMSDF Omura Air Base", "iata": "OMJ", "country": "JP"},
-            {"city": "Nagasaki", "airport": "Nagasaki Airport", "iata": "NGS", "country": "JP"},
-            {"city": "Nagoya", "airport": "Nagoya Airport / JASDF Komaki Air Base", "iata": "NKM", "country": "JP"},
-            {"city": "Nagpur", "airport": "Dr. Babasaheb Ambedkar International Airport", "iata": "NAG", "country": "IN"},
-            {"city": "Naha", "airport": "Naha Airport / JASDF Naha Air Base", "iata": "OKA", "country": "JP"},
-            {"city": "Naifaru", "airport": "Madivaru Airport", "iata": "LMV", "country": "MV"},
-            {"city": "Nain", "airport": "Nain Airport", "iata": "YDP", "country": "CA"},
-            {"city": "Nairobi", "airport": "Jomo Kenyatta International Airport", "iata": "NBO", "country": "KE"},
-            {"city": "Nairobi", "airport": "Nairobi Wilson Airport", "iata": "WIL", "country": "KE"},
-            {"city": "Naiu Atoll", "airport": "Naiu Airport", "iata": "NIU", "country": "PF"},
-            {"city": "Najaf", "airport": "Al Najaf International Airport", "iata": "NJF", "country": "IQ"},
-            {"city": "Najran", "airport": "Najran Domestic Airport", "iata": "EAM", "country": "SA"},
-            {"city": "Nakashibetsu", "airport": "Nakashibetsu Airport", "iata": "SHB", "country": "JP"},
-            {"city": "Nakhchivan", "airport": "Nakhchivan Airport", "iata": "NAJ", "country": "AZ"},
-            {"city": "Nakhon Pathom", "airport": "Kamphaeng Saen Airport", "iata": "KDT", "country": "TH"},
-            {"city": "Nakhon Phanom", "airport": "Nakhon Phanom Airport", "iata": "KOP", "country": "TH"},
-            {"city": "Nakhon Si Thammarat", "airport": "Nakhon Si Thammarat Airport", "iata": "NST", "country": "TH"},
-            {"city": "Nakina", "airport": "Nakina Airport", "iata": "YQN", "country": "CA"},
-            {"city": "Naknek", "airport": "Naknek Airport", "iata": "NNK", "country": "US"},
-            {"city": "Nakuru", "airport": "Nakuru Airport", "iata": "NUU", "country": "KE"},
-            {"city": "Nalchik", "airport": "Nalchik Airport", "iata": "NAL", "country": "RU"},
-            {"city": "Namane", "airport": "Nomane Airport", "iata": "NMN", "country": "PG"},
-            {"city": "Namangan", "airport": "Namangan Airport", "iata": "NMA", "country": "UZ"},
-            {"city": "Namatanai", "airport": "Namatanai Airport", "iata": "ATN", "country": "PG"},
-            {"city": "Nambaiyufa", "airport": "Nambaiyufa Airport", "iata": "NBA", "country": "PG"},
-            {"city": "Nambucca Heads", "airport": "Nambucca Heads Airport", "iata": "NBH", "country": "AU"},
-            {"city": "Namche Bazaar", "airport": "Syangboche Airport", "iata": "SYH", "country": "NP"},
-            {"city": "Namniwel", "airport": "Namniwel Airport", "iata": "NAM", "country": "ID"},
-            {"city": "Namorik Atoll", "airport": "Namorik Airport", "iata": "NDK", "country": "MH"},
-            {"city": "Nampula", "airport": "Nampula Airport", "iata": "APL", "country": "MZ"},
-            {"city": "Namrole", "airport": "Namrole Airport", "iata": "NRE", "country": "ID"},
-            {"city": "Namsang", "airport": "Namsang Airport", "iata": "NMS", "country": "MM"},
-            {"city": "Namsos", "airport": "Namsos Airport", "iata": "OSY", "country": "NO"},
-            {"city": "Namtu", "airport": "Namtu Airport", "iata": "NMT", "country": "MM"},
-            {"city": "Namu", "airport": "Namu Water Aerodrome", "iata": "ZNU", "country": "CA"},
-            {"city": "Namudi", "airport": "Namudi Airport", "iata": "NDI", "country": "PG"},
-            {"city": "Namutoni", "airport": "Namutoni Airport", "iata": "NNI", "country": "NA"},
-            {"city": "Nanaimo", "airport": "Nanaimo Harbour Water Aerodrome", "iata": "ZNA", "country": "CA"},
-            {"city": "Nanaimo", "airport": "Nanaimo Airport", "iata": "YCD", "country": "CA"},
-            {"city": "Nanchang", "airport": "Nanchang Yaohu Airport", "iata": "YHJ", "country": "CN"},
-            {"city": "Nanchang", "airport": "Nanchang Changbei International Airport", "iata": "KHN", "country": "CN"},
-            {"city": "Nanchong (Gaoping)", "airport": "Nanchong Gaoping Airport", "iata": "NAO", "country": "CN"},
-            {"city": "Nanchong (Langzhong)", "airport": "Langzhong Gucheng Airport", "iata": "LZG", "country": "CN"},
-            {"city": "Nandayure", "airport": "Islita Airport", "iata": "PBP", "country": "CR"},
-            {"city": "Nanded", "airport": "Nanded Airport", "iata": "NDC", "country": "IN"},
-            {"city": "Nanga Pinoh-Borneo Island", "airport": "Nanga Pinoh Airport", "iata": "NPO", "country": "ID"},
-            {"city": "Nangade", "airport": "Nangade Airport", "iata": "NND", "country": "MZ"},
-            {"city": "Nanjing", "airport": "Nanjing Lukou International Airport", "iata": "NKG", "country": "CN"},
-            {"city": "Nankoku", "airport": "Kochi Ryoma Airport", "iata": "KCZ", "country": "JP"},
-            {"city": "Nanning (Jiangnan)", "airport": "Nanning Wuxu Airport", "iata": "NNG", "country": "CN"},
-            {"city": "Nanortalik", "airport": "Nanortalik Heliport", "iata": "JNN", "country": "GL"},
-            {"city": "Nantes", "airport": "Nantes Atlantique Airport", "iata": "NTE", "country": "FR"},
-            {"city": "Nantong (Tongzhou)", "airport": "Nantong Xingdong International Airport", "iata": "NTG", "country": "CN"},
-            {"city": "Nantucket", "airport": "Nantucket Memorial Airport", "iata": "ACK", "country": "US"},
-            {"city": "Nanuku Auberge Resort", "airport": "Nanuku Airport", "iata": "PHR", "country": "FJ"},
-            {"city": "Nanuque", "airport": "Nanuque Airport", "iata": "NNU", "country": "BR"},
-            {"city": "Nanuya Lailai Island", "airport": "Blue Lagoon Seaplane Base", "iata": "BXL", "country": "FJ"},
-            {"city": "Nanuya Levu Island", "airport": "Turtle Island Seaplane Base", "iata": "TTL", "country": "FJ"},
-            {"city": "Nanwalek", "airport": "Nanwalek Airport", "iata": "KEB", "country": "US"},
-            {"city": "Nanyang (Wancheng)", "airport": "Nanyang Jiangying Airport", "iata": "NNY", "country": "CN"},
-            {"city": "Nanyuki", "airport": "Nanyuki Airport", "iata": "NYK", "country": "KE"},
-            {"city": "Naoro Vilage", "airport": "Naoro Airport", "iata": "NOO", "country": "PG"},
-            {"city": "Napa", "airport": "Napa County Airport", "iata": "APC", "country": "US"},
-            {"city": "Napakiak", "airport": "Napakiak Airport", "iata": "WNA", "country": "US"},
-            {"city": "Napaskiak", "airport": "Napaskiak Airport", "iata": "PKA", "country": "US"},
-            {"city": "Napier", "airport": "Hawke's Bay Airport", "iata": "NPE", "country": "NZ"},
-            {"city": "Naples", "airport": "Naples Municipal Airport", "iata": "APF", "country": "US"},
-            {"city": "Napoli", "airport": "Naples International Airport", "iata": "NAP", "country": "IT"},
-            {"city": "Napperby", "airport": "Napperby Airport", "iata": "NPP", "country": "AU"},
-            {"city": "Napuka Island", "airport": "Napuka Island Airport", "iata": "NAU", "country": "PF"},
-            {"city": "Nara", "airport": "Nara Airport", "iata": "NRM", "country": "ML"},
-            {"city": "Narita", "airport": "Narita International Airport", "iata": "NRT", "country": "JP"},
-            {"city": "Narrabri", "airport": "Narrabri Airport", "iata": "NAA", "country": "AU"},
-            {"city": "Narrandera", "airport": "Narrandera Airport", "iata": "NRA", "country": "AU"},
-            {"city": "Narrogin", "airport": "Narrogin Airport", "iata": "NRG", "country": "AU"},
-            {"city": "Narsaq", "airport": "Narsaq Heliport", "iata": "JNS", "country": "GL"},
-            {"city": "Narsarmijit", "airport": "Narsarmijit Heliport", "iata": "QFN", "country": "GL"},
-            {"city": "Narsarsuaq", "airport": "Narsarsuaq Airport", "iata": "UAK", "country": "GL"},
-            {"city": "Naryan Mar", "airport": "Naryan Mar Airport", "iata": "NNM", "country": "RU"},
-            {"city": "Nashua", "airport": "Nashua Airport / Boire Field", "iata": "ASH", "country": "US"},
-            {"city": "Nashville", "airport": "Nashville International Airport", "iata": "BNA", "country": "US"},
-            {"city": "Nasik", "airport": "Nashik Airport", "iata": "ISK", "country": "IN"},
-            {"city": "Nasiriyah", "airport": "Ali Air Base", "iata": "XNH", "country": "IQ"},
-            {"city": "Nassau", "airport": "Lynden Pindling International Airport", "iata": "NAS", "country": "BS"},
-            {"city": "Natal", "airport": "São Gonçalo do Amarante - Governador Aluízio Alves International Airport", "iata": "NAT", "country": "BR"},
-            {"city": "Natashquan", "airport": "Natashquan Airport", "iata": "YNA", "country": "CA"},
-            {"city": "Natchez", "airport": "Natchez–Adams County Airport / Hardy-Anders Field", "iata": "HEZ", "country": "US"},
-            {"city": "Natitingou", "airport": "Natitingou Airport", "iata": "NAE", "country": "BJ"},
-            {"city": "Natori", "airport": "Sendai Airport", "iata": "SDJ", "country": "JP"},
-            {"city": "Natuashish", "airport": "Natuashish Airport", "iata": "YNP", "country": "CA"},
-            {"city": "Nauiyu", "airport": "Daly River Airport", "iata": "DVR", "country": "AU"},
-            {"city": "Nausori", "airport": "Nausori International Airport", "iata": "SUV", "country": "FJ"},
-            {"city": "Navegantes", "airport": "Ministro Victor Konder International Airport", "iata": "NVT", "country": "BR"},
-            {"city": "Navi Mumbai", "airport": "Navi Mumbai International Airport", "iata": "NMI", "country": "IN"},
-            {"city": "Navoi", "airport": "Navoi Airport", "iata": "NVI", "country": "UZ"},
-            {"city": "Nawabashah", "airport": "Shaheed Benazirabad Airport", "iata": "WNS", "country": "PK"},
-            {"city": "Naxos", "airport": "Naxos Island National Airport", "iata": "JNX", "country": "GR"},
-            {"city": "Nazca", "airport": "Maria Reiche Neuman Airport", "iata": "NZC", "country": "PE"},
-            {"city": "Ndende", "airport": "Ndende Airport", "iata": "KDN", "country": "GA"},
-            {"city": "Ndola", "airport": "Simon Mwansa Kapwepwe International Airport", "iata": "NLA", "country": "ZM"},
-            {"city": "Nduli", "airport": "Iringa Airport", "iata": "IRI", "country": "TZ"},
-            {"city": "Nea Anchialos", "airport": "Nea Anchialos National Airport", "iata": "VOL", "country": "GR"},
-            {"city": "Necochea", "airport": "Necochea Airport", "iata": "NEC", "country": "AR"},
-            {"city": "Necocli", "airport": "Necocli Airport", "iata": "NCI", "country": "CO"},
-            {"city": "Needles", "airport": "Needles Airport", "iata": "EED", "country": "US"},
-            {"city": "Neerlerit Inaat", "airport": "Neerlerit Inaat Airport", "iata": "CNP", "country": "GL"},
-            {"city": "Nefteyugansk", "airport": "Nefteyugansk Airport", "iata": "NFG", "country": "RU"},
-            {"city": "Negage", "airport": "Negage Airport", "iata": "GXG", "country": "AO"},
-            {"city": "Negarbo", "airport": "Negarbo(Negabo) Airport", "iata": "GBF", "country": "PG"},
-            {"city": "Negele Borana", "airport": "Negele Airport", "iata": "EGL", "country": "ET"},
-            {"city": "Negril", "airport": "Negril Airport", "iata": "NEG", "country": "JM"},
-            {"city": "Neiva", "airport": "Benito Salas Airport", "iata": "NVA", "country": "CO"},
-            {"city": "Nejo", "airport": "Nejjo Airport", "iata": "NEJ", "country": "ET"},
-            {"city": "Nekemte", "airport": "Nekemte Airport", "iata": "NEK", "country": "ET"},
-            {"city": "Nelson", "airport": "Nelson Airport", "iata": "NSN", "country": "NZ"},
-            {"city": "Nelson Lagoon", "airport": "Nelson Lagoon Airport", "iata": "NLG", "country": "US"},
-            {"city": "Nelspruit", "airport": "Nelspruit Airport", "iata": "NLP", "country": "ZA"},
-            {"city": "Nemiscau", "airport": "Nemiscau Airport", "iata": "YNS", "country": "CA"},
-            {"city": "Nenana", "airport": "Nenana Municipal Airport", "iata": "ENN", "country": "US"},
-            {"city": "Neosho", "airport": "Neosho Hugh Robinson Airport", "iata": "EOS", "country": "US"},
-            {"city": "Nepalgunj", "airport": "Nepalgunj Airport", "iata": "KEP", "country": "NP"},
-            {"city": "Nepesi", "airport": "Param Airport", "iata": "PPX", "country": "PG"},
-            {"city": "Nephi", "airport": "J. Randy McKnight Nephi Municipal Airport", "iata": "NPH", "country": "US"},
-            {"city": "Neryungri", "airport": "Chulman Airport", "iata": "NER", "country": "RU"},
-            {"city": "Neumünster", "airport": "Neumünster Airport", "iata": "EUM", "country": "DE"},
-            {"city": "Neuquen", "airport": "Presidente Peron Airport", "iata": "NQN", "country": "AR"},
-            {"city": "Nevada", "airport": "Nevada Municipal Airport", "iata": "NVD", "country": "US"},
-            {"city": "Nevşehir", "airport": "Nevşehir Kapadokya Airport", "iata": "NAV", "country": "TR"},
-            {"city": "New Amsterdam", "airport": "New Amsterdam Airport", "iata": "QSX", "country": "GY"},
-            {"city": "New Barag Right Banner", "airport": "New Barag Right Banner Baogede Airport", "iata": "XRQ", "country": "CN"},
-            {"city": "New Bedford", "airport": "New Bedford Regional Airport", "iata": "EWB", "country": "US"},
-            {"city": "New Bern", "airport": "Coastal Carolina Regional Airport", "iata": "EWN", "country": "US"},
-            {"city": "New Cairo", "airport": "Katameya Air Base", "iata": "TFR", "country": "EG"},
-            {"city": "New Cairo", "airport": "Capital International Airport", "iata": "CCE", "country": "EG"},
-            {"city": "New Century", "airport": "New Century AirCenter Airport", "iata": "JCI", "country": "US"},
-            {"city": "New Delhi", "airport": "Indira Gandhi International Airport", "iata": "DEL", "country": "IN"},
-            {"city": "New Dixie", "airport": "Dixie Airport", "iata": "DXD", "country": "AU"},
-            {"city": "New Halfa", "airport": "New Halfa Airport", "iata": "NHF", "country": "SD"},
-            {"city": "New Haven", "airport": "Tweed New Haven Airport", "iata": "HVN", "country": "US"},
-            {"city": "New Iberia", "airport": "Acadiana Regional Airport", "iata": "ARA", "country": "US"},
-            {"city": "New Orleans", "airport": "Louis Armstrong New Orleans International Airport", "iata": "MSY", "country": "US"},
-            {"city": "New Orleans", "airport": "New Orleans NAS JRB/Alvin Callender Field", "iata": "NBG", "country": "US"},
-            {"city": "New Orleans", "airport": "Lakefront Airport", "iata": "NEW", "country": "US"},
-            {"city": "New Philadelphia", "airport": "Harry Clever Field", "iata": "PHD", "country": "US"},
-            {"city": "New Plymouth", "airport": "New Plymouth Airport", "iata": "NPL", "country": "NZ"},
-            {"city": "New Richmond", "airport": "New Richmond Regional Airport", "iata": "RNH", "country": "US"},
-            {"city": "New Stuyahok", "airport": "New Stuyahok Airport", "iata": "KNW", "country": "US"},
-            {"city": "New Ulm", "airport": "New Ulm Municipal Airport", "iata": "ULM", "country": "US"},
-            {"city": "New York", "airport": "East 34th Street Heliport", "iata": "TSS", "country": "US"},
-            {"city": "New York", "airport": "New York Skyports Inc Seaplane Base", "iata": "NYS", "country": "US"},
-            {"city": "New York", "airport": "West 30th Street Heliport", "iata": "JRA", "country": "US"},
-            {"city": "New York", "airport": "Downtown Manhattan Heliport", "iata": "JRB", "country": "US"},
-            {"city": "New York", "airport": "John F Kennedy International Airport", "iata": "JFK", "country": "US"},
-            {"city": "New York", "airport": "LaGuardia Airport", "iata": "LGA", "country": "US"},
-            {"city": "New York", "airport": "Newark Liberty International Airport", "iata": "EWR", "country": "US"},
-            {"city": "Newburgh", "airport": "New York Stewart International Airport", "iata": "SWF", "country": "US"},
-            {"city": "Newcastle", "airport": "Newcastle Airport", "iata": "NCS", "country": "ZA"},
-            {"city": "Newcastle", "airport": "Mondell Field", "iata": "ECS", "country": "US"},
-            {"city": "Newcastle upon Tyne, Tyne and Wear", "airport": "Newcastle International Airport", "iata": "NCL", "country": "GB"},
-            {"city": "Newman", "airport": "Newman Airport", "iata": "ZNE", "country": "AU"},
-            {"city": "Newport", "airport": "Parlin Field", "iata": "NWH", "country": "US"},
-            {"city": "Newport", "airport": "Northeast Kingdom International Airport", "iata": "EFK", "country": "US"},
-            {"city": "Newport", "airport": "Newport Municipal Airport", "iata": "ONP", "country": "US"},
-            {"city": "Newport", "airport": "Newport State Airport", "iata": "NPT", "country": "US"},
-            {"city": "Newport News", "airport": "Newport News Williamsburg International Airport", "iata": "PHF", "country": "US"},
-            {"city": "Newport News (Fort Eustis)", "airport": "Felker Army Air Field", "iata": "FAF", "country": "US"},
-            {"city": "Newquay", "airport": "Cornwall Airport Newquay", "iata": "NQY", "country": "GB"},
-            {"city": "Newry", "airport": "Newry Airport", "iata": "NRY", "country": "AU"},
-            {"city": "Newton", "airport": "Newton City-County Airport", "iata": "EWK", "country": "US"},
-            {"city": "Newton", "airport": "Newton Municipal Airport", "iata": "TNU", "country": "US"},
-            {"city": "Neyveli", "airport": "Neyveli Airport", "iata": "NVY", "country": "IN"},
-            {"city": "Ngala", "airport": "Ngala Airport", "iata": "NGL", "country": "ZA"},
-            {"city": "Ngau", "airport": "Ngau Airport", "iata": "NGI", "country": "FJ"},
-            {"city": "Ngawa (Hongyuan)", "airport": "Hongyuan Airport", "iata": "AHJ", "country": "CN"},
-            {"city": "Ngawa (Songpan)", "airport": "Jiuzhai Huanglong Airport", "iata": "JZH", "country": "CN"},
-            {"city": "Ngawal", "airport": "Manang Airport", "iata": "NGX", "country": "NP"},
-            {"city": "Ngiva", "airport": "Ngjiva Pereira Airport", "iata": "VPE", "country": "AO"},
-            {"city": "Ngoma", "airport": "Ngoma Airport", "iata": "ZGM", "country": "ZM"},
-            {"city": "Nhulunbuy", "airport": "Gove Airport", "iata": "GOV", "country": "AU"},
-            {"city": "Niagara Falls", "airport": "Niagara Falls International Airport", "iata": "IAG", "country": "US"},
-            {"city": "Niagara-on-the-Lake", "airport": "Niagara District Airport", "iata": "YCM", "country": "CA"},
-            {"city": "Niamey", "airport": "Diori Hamani International Airport", "iata": "NIM", "country": "NE"},
-            {"city": "Niamtougou", "airport": "Niamtougou International Airport", "iata": "LRL", "country": "TG"},
-            {"city": "Niaqornat", "airport": "Niaqornat Heliport", "iata": "NIQ", "country": "GL"},
-            {"city": "Nice, Alpes-Maritimes", "airport": "Nice-Côte d'Azur Airport", "iata": "NCE", "country": "FR"},
-            {"city": "Nicoya", "airport": "Nosara Airport", "iata": "NOB", "country": "CR"},
-            {"city": "Nicoya", "airport": "Tambor Airport", "iata": "TMU", "country": "CR"},
-            {"city": "Nicoya/Guanacate", "airport": "Guanacaste Airport", "iata": "NCT", "country": "CR"},
-            {"city": "Nieuw Nickerie", "airport": "Nieuw Nickerie - Major Henk Fernandes Airport", "iata": "ICK", "country": "SR"},
-            {"city": "Nightmute", "airport": "Nightmute Airport", "iata": "NME", "country": "US"},
-            {"city": "Niigata", "airport": "Niigata Airport", "iata": "KIJ", "country": "JP"},
-            {"city": "Nikolai", "airport": "Nikolai Airport", "iata": "NIB", "country": "US"},
-            {"city": "Nikolayev", "airport": "Mykolaiv International Airport", "iata": "NLV", "country": "UA"},
-            {"city": "Nikolayevsk-na-Amure Airport", "airport": "Nikolayevsk-na-Amure Airport", "iata": "NLI", "country": "RU"},
-            {"city": "Nikolski", "airport": "Nikolski Air Station", "iata": "IKO", "country": "US"},
-            {"city": "Nikunau", "airport": "Nikunau Airport", "iata": "NIG", "country": "KI"},
-            {"city": "Niles", "airport": "Jerry Tyler Memorial Airport", "iata": "NLE", "country": "US"},
-            {"city": "Nimba", "airport": "Nimba Airport", "iata": "NIA", "country": "LR"},
-            {"city": "Ningbo", "airport": "Ningbo Lishe International Airport", "iata": "NGB", "country": "CN"},
-            {"city": "Ninglang", "airport": "Ninglang Luguhu Airport", "iata": "NLH", "country": "CN"},
-            {"city": "Ninilchik", "airport": "Ninilchik Airport", "iata": "NIN", "country": "US"},
-            {"city": "Nioki", "airport": "Nioki Airport", "iata": "NIO", "country": "CD"},
-            {"city": "Niokolo-Koba National Park", "airport": "Niokolo-Koba Airport", "iata": "NIK", "country": "SN"},
-            {"city": "Nioro du Sahel", "airport": "Nioro du Sahel Airport", "iata": "NIX", "country": "ML"},
-            {"city": "Niort/Souché", "airport": "Niort - Marais Poitevin Airport", "iata": "NIT", "country": "FR"},
-            {"city": "Nipa", "airport": "Nipa Airport", "iata": "NPG", "country": "PG"},
-            {"city": "Niquelândia", "airport": "Niquelândia Airport", "iata": "NQL", "country": "BR"},
-            {"city": "Nissan Island", "airport": "Nissan Island Airport", "iata": "IIS", "country": "PG"},
-            {"city": "Niuatoputapu", "airport": "Kuini Lavenia Airport", "iata": "NTT", "country": "TO"},
-            {"city": "Nizhneangarsk", "airport": "Nizhneangarsk International Airport", "iata": "NZG", "country": "RU"},
-            {"city": "Nizhnekamsk", "airport": "Begishevo Airport", "iata": "NBC", "country": "RU"},
-            {"city": "Nizhnevartovsk", "airport": "Nizhnevartovsk Airport", "iata": "NJC", "country": "RU"},
-            {"city": "Nizhny Novgorod", "airport": "Nizhny Novgorod / Strigino International Airport", "iata": "GOJ", "country": "RU"},
-            {"city": "Niš", "airport": "Niš Constantine the Great Airport", "iata": "INI", "country": "RS"},
-            {"city": "Njombe", "airport": "Njombe Airport", "iata": "JOM", "country": "TZ"},
-            {"city": "Nkaus", "airport": "Nkaus Airport", "iata": "NKU", "country": "LS"},
-            {"city": "Nkayi", "airport": "Yokangassi Airport", "iata": "NKY", "country": "CG"},
-            {"city": "Noatak", "airport": "Noatak Airport", "iata": "WTK", "country": "US"},
-            {"city": "Nobitz", "airport": "Leipzig–Altenburg Airport", "iata": "AOC", "country": "DE"},
-            {"city": "Nogales", "airport": "Nogales International Airport", "iata": "OLS", "country": "US"},
-            {"city": "Nogales", "airport": "Nogales International Airport", "iata": "NOG", "country": "MX"},
-            {"city": "Nogliki", "airport": "Nogliki Airport", "iata": "NGK", "country": "RU"},
-            {"city": "Nomad River", "airport": "Nomad River Airport", "iata": "NOM", "country": "PG"},
-            {"city": "Nome", "airport": "Nome Airport", "iata": "OME", "country": "US"},
-            {"city": "Nondalton", "airport": "Nondalton Airport", "iata": "NNL", "country": "US"},
-            {"city": "Nonouti", "airport": "Nonouti Airport", "iata": "NON", "country": "KI"},
-            {"city": "Noonu Atoll", "airport": "Maafaru International Airport", "iata": "NMF", "country": "MV"},
-            {"city": "Noorvik", "airport": "Robert (Bob) Curtis Memorial Airport", "iata": "ORV", "country": "US"},
-            {"city": "Norddeich", "airport": "Norden-Norddeich Airport", "iata": "NOD", "country": "DE"},
-            {"city": "Norderney", "airport": "Norderney Airport", "iata": "NRD", "country": "DE"},
-            {"city": "Norfolk", "airport": "Norfolk Naval Station (Chambers Field)", "iata": "NGU", "country": "US"},
-            {"city": "Norfolk", "airport": "Karl Stefan Memorial Airport", "iata": "OFK", "country": "US"},
-            {"city": "Norfolk", "airport": "Norfolk International Airport", "iata": "ORF", "country": "US"},
-            {"city": "Norilsk", "airport": "Norilsk-Alykel Airport", "iata": "NSK", "country": "RU"},
-            {"city": "Norman", "airport": "University of Oklahoma Westheimer Airport", "iata": "OUN", "country": "US"},
-            {"city": "Norman Wells", "airport": "Norman Wells Airport", "iata": "YVQ", "country": "CA"},
-            {"city": "Normans Cay", "airport": "Normans Cay Airport", "iata": "NMC", "country": "BS"},
-            {"city": "Normanton", "airport": "Normanton Airport", "iata": "NTN", "country": "AU"},
-            {"city": "Norridgewock", "airport": "Central Maine/Norridgewock Airport", "iata": "OWK", "country": "US"},
-            {"city": "Norrköping", "airport": "Norrköping Airport", "iata": "NRK", "country": "SE"},
-            {"city": "Norseman", "airport": "Norseman Aerodrome", "iata": "NSM", "country": "AU"},
-            {"city": "Norsup", "airport": "Norsup Airport", "iata": "NUS", "country": "VU"},
-            {"city": "North Battleford", "airport": "North Battleford Airport", "iata": "YQW", "country": "CA"},
-            {"city": "North Bay", "airport": "North Bay Jack Garland Airport", "iata": "YYB", "country": "CA"},
-            {"city": "North Bend", "airport": "Southwest Oregon Regional Airport", "iata": "OTH", "country": "US"},
-            {"city": "North Caicos", "airport": "North Caicos Airport", "iata": "NCA", "country": "TC"},
-            {"city": "North Cat Cay", "airport": "Cat Cay Airport", "iata": "CXY", "country": "BS"},
-            {"city": "North Connel", "airport": "Oban Airport", "iata": "OBN", "country": "GB"},
-            {"city": "North Eleuthera", "airport": "North Eleuthera Airport", "iata": "ELH", "country": "BS"},
-            {"city": "North Kingstown", "airport": "Quonset State Airport", "iata": "NCO", "country": "US"},
-            {"city": "North Myrtle Beach", "airport": "Grand Strand Airport", "iata": "CRE", "country": "US"},
-            {"city": "North Platte", "airport": "North Platte Regional Airport Lee Bird Field", "iata": "LBF", "country": "US"},
-            {"city": "North Ronaldsay", "airport": "North Ronaldsay Airport", "iata": "NRL", "country": "GB"},
-            {"city": "North Spirit Lake", "airport": "North Spirit Lake Airport", "iata": "YNO", "country": "CA"},
-            {"city": "North Springfield", "airport": "Hartness State Airport", "iata": "VSF", "country": "US"},
-            {"city": "North Stradbroke Island", "airport": "Dunwich Airport", "iata": "SRR", "country": "AU"},
-            {"city": "North Wilkesboro", "airport": "Wilkes County Airport", "iata": "IKB", "country": "US"},
-            {"city": "Northampton, Northamptonshire", "airport": "Sywell Aerodrome", "iata": "ORM", "country": "GB"},
-            {"city": "Northway", "airport": "Northway Airport", "iata": "ORT", "country": "US"},
-            {"city": "Norway House", "airport": "Norway House Airport", "iata": "YNE", "country": "CA"},
-            {"city": "Norwich", "airport": "Lt Warren Eaton Airport", "iata": "OIC", "country": "US"},
-            {"city": "Norwich, Norfolk", "airport": "Norwich Airport", "iata": "NWI", "country": "GB"},
-            {"city": "Norwood", "airport": "Norwood Memorial Airport", "iata": "OWD", "country": "US"},
-            {"city": "Norðfjörður", "airport": "Norðfjörður Airport", "iata": "NOR", "country": "IS"},
-            {"city": "Nossa Senhora do Carmo", "airport": "Macau International Airport", "iata": "MFM", "country": "MO"},
-            {"city": "Nosy Be", "airport": "Fascene Airport", "iata": "NOS", "country": "MG"},
-            {"city": "Notodden", "airport": "Notodden Airport", "iata": "NTB", "country": "NO"},
-            {"city": "Nottingham", "airport": "Nottingham City Airport", "iata": "NQT", "country": "GB"},
-            {"city": "Nottingham", "airport": "East Midlands Airport", "iata": "EMA", "country": "GB"},
-            {"city": "Nouadhibou", "airport": "Nouadhibou International Airport", "iata": "NDB", "country": "MR"},
-            {"city": "Nouakchott", "airport": "Nouakchott–Oumtounsy International Airport", "iata": "NKC", "country": "MR"},
-            {"city": "Nouméa", "airport": "Nouméa Magenta Airport", "iata": "GEA", "country": "NC"},
-            {"city": "Nouméa (La Tontouta)", "airport": "La Tontouta International Airport", "iata": "NOU", "country": "NC"},
-            {"city": "Nouna", "airport": "Nouna Airport", "iata": "XNU", "country": "BF"},
-            {"city": "Nova Mutum", "airport": "Brigadeiro Eduardo Gomes Airport", "iata": "NVM", "country": "BR"},
-            {"city": "Nova Xavantina", "airport": "Xavantina Airport", "iata": "NOK", "country": "BR"},
-            {"city": "Novato", "airport": "Marin County Airport - Gnoss Field", "iata": "NOT", "country": "US"},
-            {"city": "Novo Aripuanã", "airport": "Novo Aripuanã Airport", "iata": "NVP", "country": "BR"},
-            {"city": "Novo Hamburgo", "airport": "Novo Hamburgo Airport", "iata": "QHV", "country": "BR"},
-            {"city": "Novo Progresso", "airport": "Novo Progresso Airport", "iata": "NPR", "country": "BR"},
-            {"city": "Novokuznetsk", "airport": "Spichenkovo Airport", "iata": "NOZ", "country": "RU"},
-            {"city": "Novosibirsk", "airport": "Novosibirsk Tolmachevo Airport", "iata": "OVB", "country": "RU"},
-            {"city": "Novy Urengoy", "airport": "Novy Urengoy Airport", "iata": "NUX", "country": "RU"},
-            {"city": "Nowata", "airport": "Nowata Airport", "iata": "NWT", "country": "PG"},
-            {"city": "Nowe Kramsko", "airport": "Zielona Góra-Babimost Airport", "iata": "IEG", "country": "PL"},
-            {"city": "Nowra Hill", "airport": "Naval Air Station Nowra - HMAS Albatross", "iata": "NOA", "country": "AU"},
-            {"city": "Nowshahr", "airport": "Nowshahr Airport", "iata": "NSH", "country": "IR"},
-            {"city": "Nowy Dwór Mazowiecki", "airport": "Modlin Airport", "iata": "WMI", "country": "PL"},
-            {"city": "Noyabrsk", "airport": "Noyabrsk Airport", "iata": "NOJ", "country": "RU"},
-            {"city": "Ntoum", "airport": "Nkan Airstrip", "iata": "NKA", "country": "GA"},
-            {"city": "Nueva Gerona", "airport": "Rafael Cabrera Airport", "iata": "GER", "country": "CU"},
-            {"city": "Nuevo Casas Grandes", "airport": "Aeropuerto Municipal de Nuevo Casas Grandes", "iata": "NCG", "country": "MX"},
-            {"city": "Nuevo Laredo", "airport": "Quetzalcóatl International Airport", "iata": "NLD", "country": "MX"},
-            {"city": "Nuguria Island", "airport": "Nuguria Airstrip", "iata": "NUG", "country": "PG"},
-            {"city": "Nuiqsut", "airport": "Nuiqsut Airport", "iata": "NUI", "country": "US"},
-            {"city": "Nuku", "airport": "Nuku Airport", "iata": "UKU", "country": "PG"},
-            {"city": "Nuku Hiva", "airport": "Nuku Hiva Airport", "iata": "NHV", "country": "PF"},
-            {"city": "Nuku'alofa", "airport": "Fua'amotu International Airport", "iata": "TBU", "country": "TO"},
-            {"city": "Nukus", "airport": "Nukus Airport", "iata": "NCU", "country": "UZ"},
-            {"city": "Nukutavake", "airport": "Nukutavake Airport", "iata": "NUK", "country": "PF"},
-            {"city": "Nukutepipi", "airport": "Nukutepipi Airport", "iata": "NKP", "country": "PF"},
-            {"city": "Nulato", "airport": "Nulato Airport", "iata": "NUL", "country": "US"},
-            {"city": "Nunam Iqua", "airport": "Nunam Iqua Airport", "iata": "SXP", "country": "US"},
-            {"city": "Nunapitchuk", "airport": "Nunapitchuk Airport", "iata": "NUP", "country": "US"},
-            {"city": "Nunchia", "airport": "Nunchia Airport", "iata": "NUH", "country": "CO"},
-            {"city": "Nunukan-Nunukan Island", "airport": "Nunukan Airport", "iata": "NNX", "country": "ID"},
-            {"city": "Nuquí", "airport": "Reyes Murillo Airport", "iata": "NQU", "country": "CO"},
-            {"city": "Nuremberg", "airport": "Nuremberg Airport", "iata": "NUE", "country": "DE"},
-            {"city": "Nutwood Downs", "airport": "Nutwood Downs Airport", "iata": "UTD", "country": "AU"},
-            {"city": "Nuugaatsiaq", "airport": "Nuugaatsiaq Heliport", "iata": "JUU", "country": "GL"},
-            {"city": "Nuuk", "airport": "Nuuk Airport", "iata": "GOH", "country": "GL"},
-            {"city": "Nuussuaq", "airport": "Nuussuaq Heliport", "iata": "NSQ", "country": "GL"},
-            {"city": "Nuwara Eliya", "airport": "Nuwara Eliya (Lake Gregory) Waterdrome", "iata": "NUA", "country": "LK"},
-            {"city": "Nyac", "airport": "Nyac Airport", "iata": "ZNC", "country": "US"},
-            {"city": "Nyagan", "airport": "Nyagan Airport", "iata": "NYA", "country": "RU"},
-            {"city": "Nyala", "airport": "Nyala Airport", "iata": "UYL", "country": "SD"},
-            {"city": "Nyaung U", "airport": "Bagan Airport", "iata": "NYU", "country": "MM"},
-            {"city": "Nyeri", "airport": "Nyeri Airport", "iata": "NYE", "country": "KE"},
-            {"city": "Nyingchi (Mainling)", "airport": "Nyingchi Mainling Airport", "iata": "LZY", "country": "CN"},
-            {"city": "Nyköping", "airport": "Stockholm Skavsta Airport", "iata": "NYO", "country": "SE"},
-            {"city": "Nyland", "airport": "Kramfors-Sollefteå Höga Kusten Airport", "iata": "KRF", "country": "SE"},
-            {"city": "Nyurba", "airport": "Nyurba Airport", "iata": "NYR", "country": "RU"},
-            {"city": "Nzagi", "airport": "Nzagi Airport", "iata": "NZA", "country": "AO"},
-            {"city": "Nzérékoré", "airport": "Nzérékoré Airport", "iata": "NZE", "country": "GN"},
-            {"city": "Néma", "airport": "Néma Airport", "iata": "EMN", "country": "MR"},
-            {"city": "Népoui", "airport": "Mueo Airport", "iata": "PDC", "country": "NC"},
-            {"city": "Nîmes/Garons", "airport": "Nîmes-Arles-Camargue Airport", "iata": "FNI", "country": "FR"},
-            {"city": "O'Neill", "airport": "O'Neill Municipal Airport–John L Baker Field", "iata": "ONL", "country": "US"},
-            {"city": "Oak Harbor", "airport": "Whidbey Island Naval Air Station (Ault Field)", "iata": "NUW", "country": "US"},
-            {"city": "Oak Harbor", "airport": "AJ Eisenberg Airport", "iata": "ODW", "country": "US"},
-            {"city": "Oakdale", "airport": "Oakdale Airport", "iata": "ODC", "country": "US"},
-            {"city": "Oakland", "airport": "San Francisco Bay Oakland International Airport", "iata": "OAK", "country": "US"},
-            {"city": "Oaktown", "airport": "Ed-Air Airport", "iata": "OTN", "country": "US"},
-            {"city": "Oaxaca", "airport": "Xoxocotlán International Airport", "iata": "OAX", "country": "MX"},
-            {"city": "Oban", "airport": "Ryan's Creek Aerodrome", "iata": "SZS", "country": "NZ"},
-            {"city": "Obano", "airport": "Obano Airport", "iata": "OBD", "country": "ID"},
-            {"city": "Obihiro", "airport": "Tokachi-Obihiro Airport", "iata": "OBO", "country": "JP"},
-            {"city": "Obo", "airport": "Obo Airport", "iata": "OBX", "country": "PG"},
-            {"city": "Obock", "airport": "Obock Airport", "iata": "OBC", "country": "DJ"},
-            {"city": "Obre Lake", "airport": "North of Sixty Airport", "iata": "YDW", "country": "CA"},
-            {"city": "Ocala", "airport": "Ocala International Airport - Jim Taylor Field", "iata": "OCF", "country": "US"},
-            {"city": "Ocaña", "airport": "Aguas Claras Airport", "iata": "OCV", "country": "CO"},
-            {"city": "Ocean City", "airport": "Ocean City Municipal Airport", "iata": "OCE", "country": "US"},
-            {"city": "Ocean Falls", "airport": "Ocean Falls Seaplane Base", "iata": "ZOF", "country": "CA"},
-            {"city": "Oceanside", "airport": "Oceanside Municipal Airport", "iata": "OCN", "country": "US"},
-            {"city": "Odense", "airport": "Odense Hans Christian Andersen Airport", "iata": "ODE", "country": "DK"},
-            {"city": "Odessa", "airport": "Odessa Schlemeyer Field", "iata": "ODT", "country": "US"},
-            {"city": "Odessa", "airport": "Odessa International Airport", "iata": "ODS", "country": "UA"},
-            {"city": "Odienne", "airport": "Odienne Airport", "iata": "KEO", "country": "CI"},
-            {"city": "Oecussi-Ambeno", "airport": "Rota Do Sândalo Oecusse Airport", "iata": "OEC", "country": "TL"},
-            {"city": "Oesterdeichstrich", "airport": "Heide-Büsum Airport", "iata": "HEI", "country": "DE"},
-            {"city": "Ofu", "airport": "Ofu Airport", "iata": "OFU", "country": "AS"},
-            {"city": "Ogallala", "airport": "Ogallala Municipal Airport Searle Field", "iata": "OGA", "country": "US"},
-            {"city": "Ogasawara", "airport": "JMSDF Minami Torishima Air Base", "iata": "MUS", "country": "JP"},
-            {"city": "Ogasawara", "airport": "Ioto (Iwo Jima) Airbase", "iata": "IWO", "country": "JP"},
-            {"city": "Ogden", "airport": "Hill Air Force Base", "iata": "HIF", "country": "US"},
-            {"city": "Ogden", "airport": "Ogden Hinckley Airport", "iata": "OGD", "country": "US"},
-            {"city": "Ogdensburg", "airport": "Ogdensburg International Airport", "iata": "OGS", "country": "US"},
-            {"city": "Ogle", "airport": "Eugene F. Correia International Airport", "iata": "OGL", "country": "GY"},
-            {"city": "Ogoki Post", "airport": "Ogoki Post Airport", "iata": "YOG", "country": "CA"},
-            {"city": "Ohrid", "airport": "Ohrid St. Paul the Apostle Airport", "iata": "OHD", "country": "MK"},
-            {"city": "Oiapoque", "airport": "Oiapoque Airport", "iata": "OYK", "country": "BR"},
-            {"city": "Oita", "airport": "Oita Airport", "iata": "OIT", "country": "JP"},
-            {"city": "Okaba", "airport": "Okaba Airport", "iata": "OKQ", "country": "ID"},
-            {"city": "Okao", "airport": "Okao Airport", "iata": "OKV", "country": "PG"},
-            {"city": "Okat", "airport": "Kosrae International Airport", "iata": "KSA", "country": "FM"},
-            {"city": "Okaukuejo", "airport": "Okaukuejo Airport", "iata": "OKF", "country": "NA"},
-            {"city": "Okayama", "airport": "Okayama Momotaro Airport", "iata": "OKJ", "country": "JP"},
-            {"city": "Okeechobee", "airport": "Okeechobee County Airport", "iata": "OBE", "country": "US"},
-            {"city": "Okha", "airport": "Okha Airport", "iata": "OHH", "country": "RU"},
-            {"city": "Okhotsk", "airport": "Okhotsk Airport", "iata": "OHO", "country": "RU"},
-            {"city": "Okinawa", "airport": "Kadena Air Base", "iata": "DNA", "country": "JP"},
-            {"city": "Okinoshima", "airport": "Oki Global Geopark Airport", "iata": "OKI", "country": "JP"},
-            {"city": "Oklahoma City", "airport": "Will Rogers World Airport", "iata": "OKC", "country": "US"},
-            {"city": "Oklahoma City", "airport": "Wiley Post Airport", "iata": "PWA", "country": "US"},
-            {"city": "Oklahoma City", "airport": "Tinker Air Force Base", "iata": "TIK", "country": "US"},
-            {"city": "Okmulgee", "airport": "Okmulgee Regional Airport", "iata": "OKM", "country": "US"},
-            {"city": "Okoboji", "airport": "Spirit Lake Municipal Airport", "iata": "RTL", "country": "US"},
-            {"city": "Okondja", "airport": "Okondja Airport", "iata": "OKN", "country": "GA"},
-            {"city": "Okoyo", "airport": "Okoyo Airport", "iata": "OKG", "country": "CG"},
-            {"city": "Okpe", "airport": "Warri Airport", "iata": "QRW", "country": "NG"},
-            {"city": "Oksapmin", "airport": "Oksapmin Airport", "iata": "OKP", "country": "PG"},
-            {"city": "Oksibil", "airport": "Oksibil Airport", "iata": "OKL", "country": "ID"},
-            {"city": "Okushiri Island", "airport": "Okushiri Airport", "iata": "OIR", "country": "JP"},
-            {"city": "Olanchito", "airport": "El Arrayán Airport", "iata": "OAN", "country": "HN"},
-            {"city": "Olathe", "airport": "Johnson County Executive Airport", "iata": "OJC", "country": "US"},
-            {"city": "Olavarria", "airport": "Olavarria Airport", "iata": "OVR", "country": "AR"},
-            {"city": "Olbia (SS)", "airport": "Olbia Costa Smeralda Airport", "iata": "OLB", "country": "IT"},
-            {"city": "Old Crow", "airport": "Old Crow Airport", "iata": "YOC", "country": "CA"},
-            {"city": "Old Harbor", "airport": "Old Harbor Airport", "iata": "OLH", "country": "US"},
-            {"city": "Old Town", "airport": "Dewitt Field - Old Town Municipal Airport", "iata": "OLD", "country": "US"},
-            {"city": "Olean", "airport": "Cattaraugus County-Olean Airport", "iata": "OLE", "country": "US"},
-            {"city": "Olenyok", "airport": "Olenyok Airport", "iata": "ONK", "country": "RU"},
-            {"city": "Olga Bay", "airport": "Olga Bay Seaplane Base", "iata": "KOY", "country": "US"},
-            {"city": "Olive Branch", "airport": "Olive Branch Airport", "iata": "OLV", "country": "US"},
-            {"city": "Oljato-Monument Valley", "airport": "Monument Valley Airport", "iata": "GMV", "country": "US"},
-            {"city": "Olkiombo", "airport": "Olkiombo Airport", "iata": "OLX", "country": "KE"},
-            {"city": "Olney", "airport": "Olney Municipal Airport", "iata": "ONY", "country": "US"},
-            {"city": "Olney-Noble", "airport": "Olney Noble Airport", "iata": "OLY", "country": "US"},
-            {"city": "Olomouc", "airport": "Olomouc Airport", "iata": "OLO", "country": "CZ"},
-            {"city": "Olongapo", "airport": "Subic Bay International Airport / Naval Air Station Cubi Point", "iata": "SFS", "country": "PH"},
-            {"city": "Olpoi", "airport": "North West Santo Airport", "iata": "OLJ", "country": "VU"},
-            {"city": "Olsobip", "airport": "Olsobip Airport", "iata": "OLQ", "country": "PG"},
-            {"city": "Olympia", "airport": "Olympia Regional Airport", "iata": "OLM", "country": "US"},
-            {"city": "Olympic Dam", "airport": "Olympic Dam Airport", "iata": "OLP", "country": "AU"},
-            {"city": "Olyokminsk", "airport": "Olyokminsk Airport", "iata": "OLZ", "country": "RU"},
-            {"city": "Omaha", "airport": "Millard Airport", "iata": "MIQ", "country": "US"},
-            {"city": "Omaha", "airport": "Offutt Air Force Base", "iata": "OFF", "country": "US"},
-            {"city": "Omaha", "airport": "Eppley Airfield", "iata": "OMA", "country": "US"},
-            {"city": "Omak", "airport": "Omak Airport", "iata": "OMK", "country": "US"},
-            {"city": "Ombika", "airport": "Ongava Lodge Airstrip", "iata": "OGV", "country": "NA"},
-            {"city": "Omboue", "airport": "Omboue Hospital Airport", "iata": "OMB", "country": "GA"},
-            {"city": "Omega", "airport": "Omega Airport", "iata": "OMG", "country": "NA"},
-            {"city": "Omidiyeh", "airport": "Omidiyeh Airport", "iata": "OMI", "country": "IR"},
-            {"city": "Omitama", "airport": "Ibaraki Airport / JASDF Hyakuri Air Base", "iata": "IBR", "country": "JP"},
-            {"city": "Omišalj", "airport": "Rijeka Airport", "iata": "RJK", "country": "HR"},
-            {"city": "Omo National Park", "airport": "Mui River Airport", "iata": "MUJ", "country": "ET"},
-            {"city": "Omora", "airport": "Omora Airport", "iata": "OSE", "country": "PG"},
-            {"city": "Omsk", "airport": "Omsk Central Airport", "iata": "OMS", "country": "RU"},
-            {"city": "Onange Mission", "airport": "Ononge Airport", "iata": "ONB", "country": "PG"},
-            {"city": "Ondangwa", "airport": "Ondangwa Airport", "iata": "OND", "country": "NA"},
-            {"city": "Oneonta", "airport": "Albert S Nader Regional Airport", "iata": "ONH", "country": "US"},
-            {"city": "Ono-i-Lau", "airport": "Ono-i-Lau Airport", "iata": "ONU", "country": "FJ"},
-            {"city": "Onotoa", "airport": "Onotoa Airport", "iata": "OOT", "country": "KI"},
-            {"city": "Ontario", "airport": "Ontario International Airport", "iata": "ONT", "country": "US"},
-            {"city": "Ontario County IDA", "airport": "Canandaigua Airport", "iata": "IUA", "country": "US"},
-            {"city": "Onundarfjörður", "airport": "Ingjaldssanður Airport", "iata": "HLO", "country": "IS"},
-            {"city": "Oombulgurri", "airport": "Oombulgurri Airport", "iata": "FVR", "country": "AU"},
-            {"city": "Oostende", "airport": "Oostende-Brugge International Airport", "iata": "OST", "country": "BE"},
-            {"city": "Opapimiskan Lake", "airport": "Opapimiskan Lake Airport", "iata": "YBS", "country": "CA"},
-            {"city": "Opelousas", "airport": "St Landry Parish Ahart Field", "iata": "OPL", "country": "US"},
-            {"city": "Opuwa", "airport": "Opuwa Airport", "iata": "OPW", "country": "NA"},
-            {"city": "Oradea", "airport": "Oradea International Airport", "iata": "OMR", "country": "RO"},
-            {"city": "Orange", "airport": "Orange Airport", "iata": "OAG", "country": "AU"},
-            {"city": "Orange Walk", "airport": "H.E Alfredo Martinez (Tower Hill) Airstrip", "iata": "ORZ", "country": "BZ"},
-            {"city": "Orangeburg", "airport": "Orangeburg Municipal Airport", "iata": "OGB", "country": "US"},
-            {"city": "Oranjemund", "airport": "Oranjemund Airport", "iata": "OMD", "country": "NA"},
-            {"city": "Oranjestad", "airport": "Queen Beatrix International Airport", "iata": "AUA", "country": "AW"},
-            {"city": "Oranjestad", "airport": "F. D. Roosevelt Airport", "iata": "EUX", "country": "BQ"},
-            {"city": "Orapa", "airport": "Orapa Airport", "iata": "ORP", "country": "BW"},
-            {"city": "Orchid Beach", "airport": "Orchid Beach Airport", "iata": "OKB", "country": "AU"},
-            {"city": "Orchid Island", "airport": "Lanyu Airport", "iata": "KYD", "country": "TW"},
-            {"city": "Ord River", "airport": "Ord River Airport", "iata": "ODR", "country": "AU"},
-            {"city": "Ordos", "airport": "Ordos Ejin Horo Airport", "iata": "DSN", "country": "CN"},
-            {"city": "Ordu", "airport": "Ordu–Giresun Airport", "iata": "OGU", "country": "TR"},
-            {"city": "Oregon", "airport": "Ontario Municipal Airport", "iata": "ONO", "country": "US"},
-            {"city": "Orehova Vas", "airport": "Maribor Edvard Rusjan Airport", "iata": "MBX", "country": "SI"},
-            {"city": "Orenburg", "airport": "Orenburg Central Airport", "iata": "REN", "country": "RU"},
-            {"city": "Orientos", "airport": "Orientos Airport", "iata": "OXO", "country": "AU"},
-            {"city": "Orinduik", "airport": "Orinduik Airport", "iata": "ORJ", "country": "GY"},
-            {"city": "Orio al Serio (BG)", "airport": "Milan Bergamo Airport / Antonio Locatelli Air Base", "iata": "BGY", "country": "IT"},
-            {"city": "Oristano", "airport": "Oristano-Fenosu Airport", "iata": "FNU", "country": "IT"},
-            {"city": "Oriximiná", "airport": "Trombetas Airport", "iata": "TMT", "country": "BR"},
-            {"city": "Oriximiná", "airport": "Oriximiná Airport", "iata": "ORX", "country": "BR"},
-            {"city": "Orkney Islands", "airport": "Kirkwall Airport", "iata": "KOI", "country": "GB"},
-            {"city": "Orlando", "airport": "Kissimmee Gateway Airport", "iata": "ISM", "country": "US"},
-            {"city": "Orlando", "airport": "Orlando International Airport", "iata": "MCO", "country": "US"},
-            {"city": "Orlando", "airport": "Orlando Executive Airport", "iata": "ORL", "country": "US"},
-            {"city": "Orlando", "airport": "Orlando Sanford International Airport", "iata": "SFB", "country": "US"},
-            {"city": "Ormara Raik", "airport": "Ormara Airport", "iata": "ORW", "country": "PK"},
-            {"city": "Ormoc City", "airport": "Ormoc Airport", "iata": "OMC", "country": "PH"},
-            {"city": "Orocue", "airport": "Orocue Airport", "iata": "ORC", "country": "CO"},
-            {"city": "Oroville", "airport": "Oroville Municipal Airport", "iata": "OVE", "country": "US"},
-            {"city": "Orsha", "airport": "Orsha Airport - Balbasovo Air Base", "iata": "TXC", "country": "BY"},
-            {"city": "Orsk", "airport": "Orsk Airport", "iata": "OSW", "country": "RU"},
-            {"city": "Oruro", "airport": "Juan Mendoza Airport", "iata": "ORU", "country": "BO"},
-            {"city": "Orvakal", "airport": "Kurnool Airport", "iata": "KJB", "country": "IN"},
-            {"city": "Orán", "airport": "Orán Airport", "iata": "ORA", "country": "AR"},
-            {"city": "Orūzgān", "airport": "Orūzgān Airport", "iata": "URZ", "country": "AF"},
-            {"city": "Osage Beach", "airport": "Grand Glaize Osage Beach Airport", "iata": "OSB", "country": "US"},
-            {"city": "Osaka", "airport": "Kansai International Airport", "iata": "KIX", "country": "JP"},
-            {"city": "Osaka", "airport": "Osaka International Airport", "iata": "ITM", "country": "JP"},
-            {"city": "Osbourn", "airport": "V C Bird International Airport", "iata": "ANU", "country": "AG"},
-            {"city": "Osceola", "airport": "L O Simenstad Municipal Airport", "iata": "OEO", "country": "US"},
-            {"city": "Oscoda", "airport": "Oscoda Wurtsmith Airport", "iata": "OSC", "country": "US"},
-            {"city": "Osh", "airport": "Osh Airport", "iata": "OSS", "country": "KG"},
-            {"city": "Oshakati", "airport": "Oshakati Airport", "iata": "OHI", "country": "NA"},
-            {"city": "Oshawa", "airport": "Oshawa Executive Airport", "iata": "YOO", "country": "CA"},
-            {"city": "Oshkosh", "airport": "Garden County Airport/King Rhiley Field", "iata": "OKS", "country": "US"},
-            {"city": "Oshkosh", "airport": "Wittman Regional Airport", "iata": "OSH", "country": "US"},
-            {"city": "Oskarshamn", "airport": "Oskarshamn Airport", "iata": "OSK", "country": "SE"},
-            {"city": "Oslo (Gardermoen)", "airport": "Oslo Airport, Gardermoen", "iata": "OSL", "country": "NO"},
-            {"city": "Osorno", "airport": "Cañal Bajo Carlos Hott Siebert Airport", "iata": "ZOS", "country": "CL"},
-            {"city": "Ossima", "airport": "Ossima Airport", "iata": "OSG", "country": "PG"},
-            {"city": "Otepa", "airport": "Hao Airport", "iata": "HOI", "country": "PF"},
-            {"city": "Otjiwarongo", "airport": "Otjiwarongo Airport", "iata": "OTJ", "country": "NA"},
-            {"city": "Otog Front Banner", "airport": "Otog Front Banner Oljoq Airport", "iata": "OTQ", "country": "CN"},
-            {"city": "Otopeni", "airport": "Bucharest Henri Coandă International Airport", "iata": "OTP", "country": "RO"},
-            {"city": "Ottawa", "airport": "Ottawa Macdonald-Cartier International Airport", "iata": "YOW", "country": "CA"},
-            {"city": "Ottawa", "airport": "Ottawa / Rockcliffe Airport", "iata": "YRO", "country": "CA"},
-            {"city": "Ottumwa", "airport": "Ottumwa Regional Airport", "iata": "OTM", "country": "US"},
-            {"city": "Ouadda", "airport": "Ouadda Airport", "iata": "ODA", "country": "CF"},
-            {"city": "Ouagadougou", "airport": "Ouagadougou Airport", "iata": "OUA", "country": "BF"},
-            {"city": "Ouahigouya", "airport": "Ouahigouya Airport", "iata": "OUG", "country": "BF"},
-            {"city": "Ouanda Djallé", "airport": "Ouanda Djallé Airport", "iata": "ODJ", "country": "CF"},
-            {"city": "Ouango Fitini", "airport": "Ouango Fitini Airport", "iata": "OFI", "country": "CI"},
-            {"city": "Ouani", "airport": "Ouani Airport", "iata": "AJN", "country": "KM"},
-            {"city": "Ouargla", "airport": "Ain Beida Airport", "iata": "OGX", "country": "DZ"},
-            {"city": "Ouarzazate", "airport": "Ouarzazate Airport", "iata": "OZZ", "country": "MA"},
-            {"city": "Oudomsay", "airport": "Oudomsay Airport", "iata": "ODY", "country": "LA"},
-            {"city": "Oudtshoorn", "airport": "Oudtshoorn Airport", "iata": "OUH", "country": "ZA"},
-            {"city": "Oulad Yaich", "airport": "Beni Mellal Airport", "iata": "BEM", "country": "MA"},
-            {"city": "Ouled Sidi Brahim", "airport": "Bou Saada Airport", "iata": "BUJ", "country": "DZ"},
-            {"city": "Oulu / Oulunsalo", "airport": "Oulu Airport", "iata": "OUL", "country": "FI"},
-            {"city": "Oum El Bouaghi", "airport": "Oum El Bouaghi Air Base", "iata": "QMH", "country": "DZ"},
-            {"city": "Oum Hadjer", "airport": "Oum Hadjer Airport", "iata": "OUM", "country": "TD"},
-            {"city": "Ourilândia do Norte", "airport": "Ourilândia do Norte Airport", "iata": "OIA", "country": "BR"},
-            {"city": "Ourinhos", "airport": "Jornalista Benedito Pimentel Airport", "iata": "OUS", "country": "BR"},
-            {"city": "Ouro Sogui", "airport": "Ouro Sogui Airport", "iata": "MAX", "country": "SN"},
-            {"city": "Ouvéa", "airport": "Ouvéa Airport", "iata": "UVE", "country": "NC"},
-            {"city": "Ouyen", "airport": "Ouyen Airport", "iata": "OYN", "country": "AU"},
-            {"city": "Ouzinkie", "airport": "Ouzinkie Airport", "iata": "KOZ", "country": "US"},
-            {"city": "Ovalle", "airport": "El Tuqui Airport", "iata": "OVL", "country": "CL"},
-            {"city": "Overberg", "airport": "Overberg Airport", "iata": "OVG", "country": "ZA"},
-            {"city": "Owando", "airport": "Owando Airport", "iata": "FTX", "country": "CG"},
-            {"city": "Owatonna", "airport": "Owatonna Degner Regional Airport", "iata": "OWA", "country": "US"},
-            {"city": "Owen Sound", "airport": "Owen Sound / Billy Bishop Regional Airport", "iata": "YOS", "country": "CA"},
-            {"city": "Owensboro", "airport": "Owensboro Daviess County Airport", "iata": "OWB", "country": "US"},
-            {"city": "Owerri", "airport": "Sam Mbakwe International Airport", "iata": "QOW", "country": "NG"},
-            {"city": "Oxford", "airport": "Waterbury Oxford Airport", "iata": "OXC", "country": "US"},
-            {"city": "Oxford", "airport": "Miami University Airport", "iata": "OXD", "country": "US"},
-            {"city": "Oxford", "airport": "University Oxford Airport", "iata": "UOX", "country": "US"},
-            {"city": "Oxford House", "airport": "Oxford House Airport", "iata": "YOH", "country": "CA"},
-            {"city": "Oxnard", "airport": "Oxnard Airport", "iata": "OXR", "country": "US"},
-            {"city": "Oyem", "airport": "Oyem Airport", "iata": "OYE", "country": "GA"},
-            {"city": "Oyo", "airport": "Oyo Ollombo Airport", "iata": "OLL", "country": "CG"},
-            {"city": "Ozamiz", "airport": "Labo Airport", "iata": "OZC", "country": "PH"},
-            {"city": "Ozona", "airport": "Ozona Municipal Airport", "iata": "OZA", "country": "US"},
-            {"city": "Pa Pun", "airport": "Hpapun Airport", "iata": "PPU", "country": "MM"},
-            {"city": "Paama Island", "airport": "Tavie Airport", "iata": "PBJ", "country": "VU"},
-            {"city": "Paamiut", "airport": "Paamiut Airport", "iata": "JFR", "country": "GL"},
-            {"city": "Pacific City", "airport": "Pacific City State Airport", "iata": "PFC", "country": "US"},
-            {"city": "Pacoima", "airport": "Whiteman Airport", "iata": "WHP", "country": "US"},
-            {"city": "Padang (Katapiang)", "airport": "Minangkabau International Airport", "iata": "PDG", "country": "ID"},
-            {"city": "Padang Sidempuan", "airport": "Aek Godang Airport", "iata": "AEG", "country": "ID"},
-            {"city": "Paducah", "airport": "Barkley Regional Airport", "iata": "PAH", "country": "US"},
-            {"city": "Pagadian", "airport": "Pagadian Airport", "iata": "PAG", "country": "PH"},
-            {"city": "Page", "airport": "Page Municipal Airport", "iata": "PGA", "country": "US"},
-            {"city": "Pago Pago", "airport": "Pago Pago International Airport", "iata": "PPG", "country": "AS"},
-            {"city": "Pagosa Springs", "airport": "Stevens Field", "iata": "PGO", "country": "US"},
-            {"city": "Pahokee", "airport": "Palm Beach County Glades Airport", "iata": "PHK", "country": "US"},
-            {"city": "Pai", "airport": "Pai Airport", "iata": "PYY", "country": "TH"},
-            {"city": "Paiela", "airport": "Paiela Airport", "iata": "PLE", "country": "PG"},
-            {"city": "Paipa", "airport": "Juan Jose Rondon Airport", "iata": "RON", "country": "CO"},
-            {"city": "Pajala", "airport": "Pajala Airport", "iata": "PJA", "country": "SE"},
-            {"city": "Pakhokku", "airport": "Pakhokku Airport", "iata": "PKK", "country": "MM"},
-            {"city": "Pakse", "airport": "Pakse International Airport", "iata": "PKZ", "country": "LA"},
-            {"city": "Pakuba", "airport": "Kabalega Falls Airport", "iata": "PAF", "country": "UG"},
-            {"city": "Pakyong", "airport": "Pakyong Airport", "iata": "PYG", "country": "IN"},
-            {"city": "Pala", "airport": "Pala Airport", "iata": "PLF", "country": "TD"},
-            {"city": "Palacios", "airport": "Palacios Municipal Airport", "iata": "PSX", "country": "US"},
-            {"city": "Palacios", "airport": "Palacios Airport", "iata": "PCH", "country": "HN"},
-            {"city": "Palanga", "airport": "Palanga International Airport", "iata": "PLQ", "country": "LT"},
-            {"city": "Palangkaraya", "airport": "Tjilik Riwut Airport", "iata": "PKY", "country": "ID"},
-            {"city": "Palembang", "airport": "Sultan Mahmud Badaruddin II Airport", "iata": "PLM", "country": "ID"},
-            {"city": "Palena", "airport": "Alto Palena Airport", "iata": "WAP", "country": "CL"},
-            {"city": "Palenque", "airport": "Palenque International Airport", "iata": "PQM", "country": "MX"},
-            {"city": "Palermo", "airport": "Falcone–Borsellino Airport", "iata": "PMO", "country": "IT"},
-            {"city": "Palestine", "airport": "Palestine Municipal Airport", "iata": "PSN", "country": "US"},
-            {"city": "Palibelo, Bima", "airport": "Sultan Muhammad Salahuddin Airport", "iata": "BMU", "country": "ID"},
-            {"city": "Palm Springs", "airport": "Palm Springs International Airport", "iata": "PSP", "country": "US"},
-            {"city": "Palm Springs", "airport": "Jacqueline Cochran Regional Airport", "iata": "TRM", "country": "US"},
-            {"city": "Palma", "airport": "Palma Airport", "iata": "LMZ", "country": "MZ"},
-            {"city": "Palma de Mallorca", "airport": "Palma de Mallorca Airport", "iata": "PMI", "country": "ES"},
-            {"city": "Palmar Sur", "airport": "Palmar Sur Airport", "iata": "PMZ", "country": "CR"},
-            {"city": "Palmarito", "airport": "Palmarito Airport", "iata": "PTM", "country": "VE"},
-            {"city": "Palmas", "airport": "Brigadeiro Lysias Rodrigues Airport", "iata": "PMW", "country": "BR"},
-            {"city": "Palmatak", "airport": "Matak Airport", "iata": "MWK", "country": "ID"},
-            {"city": "Palmdale", "airport": "Palmdale Regional Airport / USAF Plant 42 Airport", "iata": "PMD", "country": "US"},
-            {"city": "Palmer", "airport": "Warren "Bud" Woods Palmer Municipal Airport", "iata": "PAQ", "country": "US"},
-            {"city": "Palmer", "airport": "Drumduff Airport", "iata": "DFP", "country": "AU"},
-            {"city": "Palmerola", "airport": "Palmerola International Airport / José Enrique Soto Cano Air Base", "iata": "XPL", "country": "HN"},
-            {"city": "Palmerston North", "airport": "Palmerston North Airport", "iata": "PMR", "country": "NZ"},
-            {"city": "Palo Alto", "airport": "Palo Alto Airport", "iata": "PAO", "country": "US"},
-            {"city": "Paloemeu", "airport": "Vincent Fayks Airport", "iata": "OEM", "country": "SR"},
-            {"city": "Palopo", "airport": "Bua - Palopo Lagaligo Airport", "iata": "LLO", "country": "ID"},
-            {"city": "Palu", "airport": "Mutiara - SIS Al-Jufrie Airport", "iata": "PLW", "country": "ID"},
-            {"city": "Pama", "airport": "Pama Airport", "iata": "XPA", "country": "BF"},
-            {"city": "Pamol", "airport": "Pamol Airport", "iata": "PAY", "country": "MY"},
-            {"city": "Pampa", "airport": "Perry Lefors Field", "iata": "PPA", "country": "US"},
-            {"city": "Pamplona", "airport": "Pamplona Airport", "iata": "PNA", "country": "ES"},
-            {"city": "Panama City", "airport": "Tyndall Air Force Base", "iata": "PAM", "country": "US"},
-            {"city": "Panama City Beach", "airport": "Northwest Florida Beaches International Airport", "iata": "ECP", "country": "US"},
-            {"city": "Panamá City", "airport": "Panamá Pacífico International Airport", "iata": "BLB", "country": "PA"},
-            {"city": "Panevėžys", "airport": "Panevėžys Air Base", "iata": "PNV", "country": "LT"},
-            {"city": "Pangia", "airport": "Pangia Airport", "iata": "PGN", "country": "PG"},
-            {"city": "Pangkal Pinang", "airport": "Depati Amir Airport", "iata": "PGK", "country": "ID"},
-            {"city": "Pangkalanbun", "airport": "Iskandar Airport", "iata": "PKN", "country": "ID"},
-            {"city": "Pangkor Island", "airport": "Pulau Pangkor Airport", "iata": "PKG", "country": "MY"},
-            {"city": "Panglao", "airport": "Bohol-Panglao International Airport", "iata": "TAG", "country": "PH"},
-            {"city": "Pangnirtung", "airport": "Pangnirtung Airport", "iata": "YXP", "country": "CA"},
-            {"city": "Pangoa", "airport": "Pangoa Airport", "iata": "PGB", "country": "PG"},
-            {"city": "Panguitch", "airport": "Panguitch Municipal Airport", "iata": "PNU", "country": "US"},
-            {"city": "Panjgur", "airport": "Panjgur Airport", "iata": "PJG", "country": "PK"},
-            {"city": "Pantelleria (TP)", "airport": "Pantelleria Airport", "iata": "PNL", "country": "IT"},
-            {"city": "Pantnagar", "airport": "Pantnagar Airport", "iata": "PGH", "country": "IN"},
-            {"city": "Panzhihua (Renhe)", "airport": "Panzhihua Bao'anying Airport", "iata": "PZI", "country": "CN"},
-            {"city": "Paonia", "airport": "North Fork Valley Airport", "iata": "WPO", "country": "US"},
-            {"city": "Papa Westray", "airport": "Papa Westray Airport", "iata": "PPW", "country": "GB"},
-            {"city": "Papeete", "airport": "Faa'a International Airport", "iata": "PPT", "country": "PF"},
-            {"city": "Paphos", "airport": "Paphos International Airport", "iata": "PFO", "country": "CY"},
-            {"city": "Paraburdoo", "airport": "Paraburdoo Airport", "iata": "PBO", "country": "AU"},
-            {"city": "Paracatu", "airport": "Pedro Rabelo de Souza Airport", "iata": "PYT", "country": "BR"},
-            {"city": "Parachinar", "airport": "Parachinar Airport", "iata": "PAJ", "country": "PK"},
-            {"city": "Paradise", "airport": "Paradise Skypark Airport", "iata": "PYS", "country": "US"},
-            {"city": "Paragominas", "airport": "Nagib Demachki Airport", "iata": "JPE", "country": "BR"},
-            {"city": "Paragould", "airport": "Kirk Field", "iata": "PGR", "country": "US"},
-            {"city": "Paraguaná", "airport": "Josefa Camejo International Airport", "iata": "LSP", "country": "VE"},
-            {"city": "Parai-tepuí", "airport": "Perai-Tepuy Airport", "iata": "PPH", "country": "VE"},
-            {"city": "Parakou", "airport": "Parakou Airport", "iata": "PKO", "country": "BJ"},
-            {"city": "Paramakatoi", "airport": "Paramakatoi Airport", "iata": "PMT", "country": "GY"},
-            {"city": "Paramaribo", "airport": "Zorg en Hoop Airport", "iata": "ORG", "country": "SR"},
-            {"city": "Parana", "airport": "General Urquiza Airport", "iata": "PRA", "country": "AR"},
-            {"city": "Paranaguá", "airport": "Paranaguá Airport", "iata": "PNG", "country": "BR"},
-            {"city": "Paranavaí", "airport": "Paranavaí Airport", "iata": "PVI", "country": "BR"},
-            {"city": "Paranaíba", "airport": "Paranaíba Airport", "iata": "PBB", "country": "BR"},
-            {"city": "Parapat-Sumatra Island", "airport": "Sibisa Airport", "iata": "SIW", "country": "ID"},
-            {"city": "Parasi", "airport": "Parasi Airport", "iata": "PRS", "country": "SB"},
-            {"city": "Paratebueno", "airport": "Paratebueno Airport", "iata": "EUO", "country": "CO"},
-            {"city": "Paraty", "airport": "Paraty Airport", "iata": "JPY", "country": "BR"},
-            {"city": "Parauapebas", "airport": "Carajás Airport", "iata": "CKS", "country": "BR"},
-            {"city": "Pardoo", "airport": "Pardoo Airport", "iata": "PRD", "country": "AU"},
-            {"city": "Pardubice", "airport": "Pardubice Airport", "iata": "PED", "country": "CZ"},
-            {"city": "Parintins", "airport": "Parintins Airport", "iata": "PIN", "country": "BR"},
-            {"city": "Paris", "airport": "Henry County Airport", "iata": "PHT", "country": "US"},
-            {"city": "Paris", "airport": "Cox Field", "iata": "PRX", "country": "US"},
-            {"city": "Paris", "airport": "Paris-Le Bourget Airport", "iata": "LBG", "country": "FR"},
-            {"city": "Paris (Orly, Val-de-Marne)", "airport": "Paris-Orly Airport", "iata": "ORY", "country": "FR"},
-            {"city": "Paris (Roissy-en-France, Val-d'Oise)", "airport": "Charles de Gaulle International Airport", "iata": "CDG", "country": "FR"},
-            {"city": "Park Falls", "airport": "Park Falls Municipal Airport", "iata": "PKF", "country": "US"},
-            {"city": "Park Rapids", "airport": "Park Rapids Municipal Airport Konshok Field", "iata": "PKD", "country": "US"},
-            {"city": "Parkersburg (Williamstown)", "airport": "Mid Ohio Valley Regional Airport", "iata": "PKB", "country": "US"},
-            {"city": "Parkes", "airport": "Parkes Airport", "iata": "PKE", "country": "AU"},
-            {"city": "Parma (PR)", "airport": "Parma Airport", "iata": "PMF", "country": "IT"},
-            {"city": "Parnaíba", "airport": "Parnaíba - Prefeito Doutor João Silva Filho International Airport", "iata": "PHB", "country": "BR"},
-            {"city": "Paro", "airport": "Paro International Airport", "iata": "PBH", "country": "BT"},
-            {"city": "Paros", "airport": "Paros National Airport", "iata": "PAS", "country": "GR"},
-            {"city": "Parry Sound", "airport": "Parry Sound Area Municipal Airport", "iata": "YPD", "country": "CA"},
-            {"city": "Parsabad", "airport": "Parsabad-Moghan Airport", "iata": "PFQ", "country": "IR"},
-            {"city": "Parsons", "airport": "Tri-City Airport", "iata": "PPF", "country": "US"},
-            {"city": "Paruima", "airport": "Paruima Airport", "iata": "PRR", "country": "GY"},
-            {"city": "Pascagoula", "airport": "Trent Lott International Airport", "iata": "PGL", "country": "US"},
-            {"city": "Pasco", "airport": "Tri Cities Airport", "iata": "PSC", "country": "US"},
-            {"city": "Pasighat", "airport": "Pasighat Airport", "iata": "IXT", "country": "IN"},
-            {"city": "Pasir Pengarayan", "airport": "Tuanku Tambusai Airport", "iata": "PPR", "country": "ID"},
-            {"city": "Pasirkuning-Singkep Island", "airport": "Dabo Airport", "iata": "SIQ", "country": "ID"},
-            {"city": "Pasni", "airport": "Pasni Airport", "iata": "PSI", "country": "PK"},
-            {"city": "Paso Caballos", "airport": "Paso Caballos Airport", "iata": "PCG", "country": "GT"},
-            {"city": "Paso Robles", "airport": "Paso Robles Municipal Airport", "iata": "PRB", "country": "US"},
-            {"city": "Paso de los Libres", "airport": "Paso De Los Libres Airport", "iata": "AOL", "country": "AR"},
-            {"city": "Passo Fundo", "airport": "Lauro Kurtz Airport", "iata": "PFB", "country": "BR"},
-            {"city": "Passos", "airport": "Municipal José Figueiredo Airport", "iata": "PSW", "country": "BR"},
-            {"city": "Pathankot", "airport": "Pathankot Airport", "iata": "IXP", "country": "IN"},
-            {"city": "Pathein", "airport": "Pathein Airport", "iata": "BSX", "country": "MM"},
-            {"city": "Patna", "airport": "Jay Prakash Narayan Airport", "iata": "PAT", "country": "IN"},
-            {"city": "Pato Branco", "airport": "Juvenal Loureiro Cardoso Airport", "iata": "PTO", "country": "BR"},
-            {"city": "Patos", "airport": "Aeroporto Brigadeiro Firmino Ayres", "iata": "JPO", "country": "BR"},
-            {"city": "Patos de Minas", "airport": "Patos de Minas Airport", "iata": "POJ", "country": "BR"},
-            {"city": "Patras", "airport": "Patras Araxos Agamemnon Airport", "iata": "GPA", "country": "GR"},
-            {"city": "Patreksfjörður", "airport": "Patreksfjörður Airport", "iata": "PFJ", "country": "IS"},
-            {"city": "Patterson", "airport": "Harry P Williams Memorial Airport", "iata": "PTN", "country": "US"},
-            {"city": "Patuxent River", "airport": "Patuxent River Naval Air Station (Trapnell Field)", "iata": "NHK", "country": "US"},
-            {"city": "Pau/Pyrénées (Uzein)", "airport": "Pau Pyrénées Airport", "iata": "PUF", "country": "FR"},
-            {"city": "Pauk", "airport": "Pauk Airport", "iata": "PAU", "country": "MM"},
-            {"city": "Paulatuk", "airport": "Paulatuk (Nora Aliqatchialuk Ruben) Airport", "iata": "YPC", "country": "CA"},
-            {"city": "Paulo Afonso", "airport": "Paulo Afonso Airport", "iata": "PAV", "country": "BR"},
-            {"city": "Pavlodar", "airport": "Pavlodar Airport", "iata": "PWQ", "country": "KZ"},
-            {"city": "Pawe", "airport": "Beles Airport", "iata": "PWI", "country": "ET"},
-            {"city": "Pawtucket", "airport": "North Central State Airport", "iata": "SFZ", "country": "US"},
-            {"city": "Paya Lebar", "airport": "Paya Lebar Air Base", "iata": "QPG", "country": "SG"},
-            {"city": "Payerne", "airport": "Payerne Air Base", "iata": "VIP", "country": "CH"},
-            {"city": "Paysandú", "airport": "Tydeo Larre Borges Airport", "iata": "PDU", "country": "UY"},
-            {"city": "Payson", "airport": "Payson Airport", "iata": "PJB", "country": "US"},
-            {"city": "Payán", "airport": "Payán Airport", "iata": "PYN", "country": "CO"},
-            {"city": "Paz De Ariporo", "airport": "Paz De Ariporo Airport", "iata": "PZA", "country": "CO"},
-            {"city": "Peace River", "airport": "Peace River Airport", "iata": "YPE", "country": "CA"},
-            {"city": "Peach Springs", "airport": "Grand Canyon West Airport", "iata": "GCW", "country": "US"},
-            {"city": "Peach Springs", "airport": "Grand Canyon Caverns Airport", "iata": "PGS", "country": "US"},
-            {"city": "Peawanuck", "airport": "Peawanuck Airport", "iata": "YPO", "country": "CA"},
-            {"city": "Pebane", "airport": "Pebane Airport", "iata": "PEB", "country": "MZ"},
-            {"city": "Pechora", "airport": "Pechora Airport", "iata": "PEX", "country": "RU"},
-            {"city": "Pecos", "airport": "Pecos Municipal Airport", "iata": "PEQ", "country": "US"},
-            {"city": "Pedasí", "airport": "Capt. J. Montenegro Airport", "iata": "PDM", "country": "PA"},
-            {"city": "Pedro Bay", "airport": "Pedro Bay Airport", "iata": "PDB", "country": "US"},
-            {"city": "Pedro Juan Caballero", "airport": "Aeropuerto Nacional Dr. Augusto Roberto Fuster", "iata": "PJC", "country": "PY"},
-            {"city": "Peenemünde", "airport": "Peenemünde Airport", "iata": "PEF", "country": "DE"},
-            {"city": "Pehuajó", "airport": "Comodoro Pedro Zanni Airport", "iata": "PEH", "country": "AR"},
-            {"city": "Pekanbaru", "airport": "Sultan Syarif Kasim II International Airport / Roesmin Nurjadin AFB", "iata": "PKU", "country": "ID"},
-            {"city": "Pekaulang", "airport": "Buli Airport", "iata": "PGQ", "country": "ID"},
-            {"city": "Pelaneng", "airport": "Pelaneng Airport", "iata": "PEL", "country": "LS"},
-            {"city": "Pelican", "airport": "Pelican Seaplane Base", "iata": "PEC", "country": "US"},
-            {"city": "Pell City", "airport": "St Clair County Airport", "iata": "PLR", "country": "US"},
-            {"city": "Pellston", "airport": "Pellston Regional Airport of Emmet County Airport", "iata": "PLN", "country": "US"},
-            {"city": "Pelotas", "airport": "João Simões Lopes Neto International Airport", "iata": "PET", "country": "BR"},
-            {"city": "Pemba", "airport": "Pemba Airport", "iata": "POL", "country": "MZ"},
-            {"city": "Pembina", "airport": "Pembina Municipal Airport", "iata": "PMB", "country": "US"},
-            {"city": "Pembroke", "airport": "Pembroke Airport", "iata": "YTA", "country": "CA"},
-            {"city": "Penang", "airport": "Penang International Airport", "iata": "PEN", "country": "MY"},
-            {"city": "Pendik, Istanbul", "airport": "Istanbul Sabiha Gökçen International Airport", "iata": "SAW", "country": "TR"},
-            {"city": "Pendleton", "airport": "Eastern Oregon Regional Airport at Pendleton", "iata": "PDT", "country": "US"},
-            {"city": "Penong", "airport": "Penong Airport", "iata": "PEY", "country": "AU"},
-            {"city": "Penrhyn Island", "airport": "Tongareva Airport", "iata": "PYE", "country": "CK"},
-            {"city": "Penrose", "airport": "Fremont County Airport", "iata": "CNE", "country": "US"},
-            {"city": "Pensacola", "airport": "Naval Air Station Pensacola Forrest Sherman Field", "iata": "NPA", "country": "US"},
-            {"city": "Pensacola", "airport": "Pensacola International Airport", "iata": "PNS", "country": "US"},
-            {"city": "Pentecost Island", "airport": "Sara Airport", "iata": "SSR", "country": "VU"},
-            {"city": "Penticton", "airport": "Penticton Airport", "iata": "YYF", "country": "CA"},
-            {"city": "Penza", "airport": "Penza Airport", "iata": "PEZ", "country": "RU"},
-            {"city": "Penzance, Cornwall", "airport": "Penzance Heliport", "iata": "PZE", "country": "GB"},
-            {"city": "Peoria", "airport": "General Wayne A. Downing Peoria International Airport", "iata": "PIA", "country": "US"},
-            {"city": "Peppimenarti", "airport": "Peppimenarti Airport", "iata": "PEP", "country": "AU"},
-            {"city": "Pereira", "airport": "Matecaña International Airport", "iata": "PEI", "country": "CO"},
-            {"city": "Perito Moreno", "airport": "Perito Moreno Jalil Hamer Airport", "iata": "PMQ", "country": "AR"},
-            {"city": "Perm", "airport": "Perm International Airport", "iata": "PEE", "country": "RU"},
-            {"city": "Perpignan/Rivesaltes", "airport": "Perpignan-Rivesaltes (Llabanère) Airport", "iata": "PGF", "country": "FR"},
-            {"city": "Perry", "airport": "Perry-Foley Airport", "iata": "FPY", "country": "US"},
-            {"city": "Perry", "airport": "Perry Municipal Airport", "iata": "PRO", "country": "US"},
-            {"city": "Perry Island", "airport": "Perry Island Seaplane Base", "iata": "PYL", "country": "US"},
-            {"city": "Perryville", "airport": "Perryville Airport", "iata": "KPV", "country": "US"},
-            {"city": "Perth", "airport": "Perth/Scone Airport", "iata": "PSL", "country": "GB"},
-            {"city": "Perth", "airport": "Perth Jandakot Airport", "iata": "JAD", "country": "AU"},
-            {"city": "Perth", "airport": "Perth International Airport", "iata": "PER", "country": "AU"},
-            {"city": "Peru", "airport": "Grissom Air Reserve Base", "iata": "GUS", "country": "US"},
-            {"city": "Peru", "airport": "Illinois Valley Regional Airport Walter A Duncan Field", "iata": "VYS", "country": "US"},
-            {"city": "Perugia (PG)", "airport": "Perugia San Francesco d'Assisi – Umbria International Airport", "iata": "PEG", "country": "IT"},
-            {"city": "Pescara", "airport": "Abruzzo Airport", "iata": "PSR", "country": "IT"},
-            {"city": "Peshawar", "airport": "Peshawar International Airport", "iata": "PEW", "country": "PK"},
-            {"city": "Petawawa", "airport": "Petawawa Heliport", "iata": "YWA", "country": "CA"},
-            {"city": "Peterborough", "airport": "Peterborough Municipal Airport", "iata": "YPQ", "country": "CA"},
-            {"city": "Petermann", "airport": "Kings Canyon Airport", "iata": "KBJ", "country": "AU"},
-            {"city": "Petermann", "airport": "Kings Creek Airport", "iata": "KCS", "country": "AU"},
-            {"city": "Petersburg", "airport": "Dinwiddie County Airport", "iata": "PTB", "country": "US"},
-            {"city": "Petersburg", "airport": "Grant County Airport", "iata": "PGC", "country": "US"},
-            {"city": "Petersburg", "airport": "Petersburg James A Johnson Airport", "iata": "PSG", "country": "US"},
-            {"city": "Petrolina", "airport": "Senador Nilo Coelho Airport", "iata": "PNZ", "country": "BR"},
-            {"city": "Petropavl", "airport": "Petropavl Airport", "iata": "PPK", "country": "KZ"},
-            {"city": "Petropavlovsk-Kamchatsky", "airport": "Yelizovo Airport", "iata": "PKC", "country": "RU"},
-            {"city": "Petrozavodsk", "airport": "Petrozavodsk Airport", "iata": "PES", "country": "RU"},
-            {"city": "Pewsey, Wiltshire", "airport": "Upavon Aerodrome", "iata": "UPV", "country": "GB"},
-            {"city": "Phalaborwa", "airport": "Hendrik Van Eck Airport", "iata": "PHW", "country": "ZA"},
-            {"city": "Phan Rang", "airport": "Phan Rang Airport", "iata": "PHA", "country": "VN"},
-            {"city": "Phaplu", "airport": "Phaplu Airport", "iata": "PPL", "country": "NP"},
-            {"city": "Philadelphia", "airport": "Wings Field", "iata": "BBX", "country": "US"},
-            {"city": "Philadelphia", "airport": "Philadelphia International Airport", "iata": "PHL", "country": "US"},
-            {"city": "Philadelphia", "airport": "Northeast Philadelphia Airport", "iata": "PNE", "country": "US"},
-            {"city": "Philip", "airport": "Philip Airport", "iata": "PHP", "country": "US"},
-            {"city": "Philipsburg", "airport": "Mid-State Regional Airport", "iata": "PSB", "country": "US"},
-            {"city": "Phinda", "airport": "Zulu Inyala Airport", "iata": "PZL", "country": "ZA"},
-            {"city": "Phitsanulok", "airport": "Phitsanulok Airport", "iata": "PHS", "country": "TH"},
-            {"city": "Phnom Penh (Boeng Khyang)", "airport": "Techo International Airport", "iata": "KTI", "country": "KH"},
-            {"city": "Phnom Penh (Pou Senchey)", "airport": "Phnom Penh International Airport", "iata": "PNH", "country": "KH"},
-            {"city": "Phoenix", "airport": "Phoenix Deer Valley Airport", "iata": "DVT", "country": "US"},
-            {"city": "Phoenix", "airport": "Phoenix Sky Harbor International Airport", "iata": "PHX", "country": "US"},
-            {"city": "Phongsaly", "airport": "Boun Neau Airport", "iata": "PCQ", "country": "LA"},
-            {"city": "Phosphate Hill", "airport": "The Monument Airport", "iata": "PHQ", "country": "AU"},
-            {"city": "Phu Quoc Island", "airport": "Phu Quoc International Airport", "iata": "PQC", "country": "VN"},
-            {"city": "Phuket", "airport": "Phuket International Airport", "iata": "HKT", "country": "TH"},
-            {"city": "Pica", "airport": "Coposa Airport", "iata": "CPP", "country": "CL"},
-            {"city": "Pickens", "airport": "Pickens County Airport", "iata": "LQK", "country": "US"},
-            {"city": "Pickle Lake", "airport": "Pickle Lake Airport", "iata": "YPL", "country": "CA"},
-            {"city": "Pico Island", "airport": "Pico Airport", "iata": "PIX", "country": "PT"},
-            {"city": "Picos", "airport": "Picos Airport", "iata": "PCS", "country": "BR"},
-            {"city": "Piedras", "airport": "Santa Ana Airport", "iata": "SQB", "country": "CO"},
-            {"city": "Piedras Negras", "airport": "Piedras Negras International Airport", "iata": "PDS", "country": "MX"},
-            {"city": "Pierre", "airport": "Pierre Regional Airport", "iata": "PIR", "country": "US"},
-            {"city": "Pietermaritzburg", "airport": "Pietermaritzburg Airport", "iata": "PZB", "country": "ZA"},
-            {"city": "Piešťany", "airport": "Piešťany Airport", "iata": "PZY", "country": "SK"},
-            {"city": "Pikangikum", "airport": "Pikangikum Airport", "iata": "YPM", "country": "CA"},
-            {"city": "Pikeville", "airport": "Pike County Airport Hatcher Field", "iata": "PVL", "country": "US"},
-            {"city": "Pikwitonei", "airport": "Pikwitonei Airport", "iata": "PIW", "country": "CA"},
-            {"city": "Pilanesberg", "airport": "Pilanesberg International Airport", "iata": "NTY", "country": "ZA"},
-            {"city": "Pilar", "airport": "Aeródromo Don Carlos Miguel Gimenez", "iata": "PIL", "country": "PY"},
-            {"city": "Pilot Point", "airport": "Pilot Point Airport", "iata": "PIP", "country": "US"},
-            {"city": "Pilot Point", "airport": "Ugashik Bay Airport", "iata": "UGB", "country": "US"},
-            {"city": "Pilot Station", "airport": "Pilot Station Airport", "iata": "PQS", "country": "US"},
-            {"city": "Pimaga", "airport": "Pimaga Airport", "iata": "PMP", "country": "PG"},
-            {"city": "Pimenta Bueno", "airport": "Pimenta Bueno Airport", "iata": "PBQ", "country": "BR"},
-            {"city": "Pinar del Rio", "airport": "La Coloma Airport", "iata": "LCL", "country": "CU"},
-            {"city": "Pincher Creek", "airport": "Pincher Creek Airport", "iata": "WPC", "country": "CA"},
-            {"city": "Pindiu", "airport": "Pindiu Airport", "iata": "PDI", "country": "PG"},
-            {"city": "Pine Bluff", "airport": "Pine Bluff Regional Airport, Grider Field", "iata": "PBF", "country": "US"},
-            {"city": "Pine Cay", "airport": "Pine Cay Airport", "iata": "PIC", "country": "TC"},
-            {"city": "Pine Mountain", "airport": "Harris County Airport", "iata": "PIM", "country": "US"},
-            {"city": "Pine Ridge", "airport": "Pine Ridge Airport", "iata": "XPR", "country": "US"},
-            {"city": "Pinedale", "airport": "Ralph Wenz Field", "iata": "PWY", "country": "US"},
-            {"city": "Pinehouse Lake", "airport": "Pinehouse Lake Airport", "iata": "ZPO", "country": "CA"},
-            {"city": "Pinellas Park", "airport": "St. Petersburg Clearwater International Airport", "iata": "PIE", "country": "US"},
-            {"city": "Pingtung", "airport": "Pingtung Air Force Base North", "iata": "PIF", "country": "TW"},
-            {"city": "Pinheiro", "airport": "Pinheiro Airport", "iata": "PHI", "country": "BR"},
-            {"city": "Pipillipai", "airport": "Pipillipai Airport", "iata": "PIQ", "country": "GY"},
-            {"city": "Pirapora", "airport": "Pirapora Airport", "iata": "PIV", "country": "BR"},
-            {"city": "Pirassununga", "airport": "Campo Fontenelle", "iata": "QPS", "country": "BR"},
-            {"city": "Pirlangimpi", "airport": "Garden Point Airport", "iata": "GPN", "country": "AU"},
-            {"city": "Pisa (PI)", "airport": "Pisa International Airport", "iata": "PSA", "country": "IT"},
-            {"city": "Pisco", "airport": "Captain Renán Elías Olivera International Airport", "iata": "PIO", "country": "PE"},
-            {"city": "Pitalito", "airport": "Pitalito Airport", "iata": "PTX", "country": "CO"},
-            {"city": "Pitts Town", "airport": "Pitts Town Airport", "iata": "PWN", "country": "BS"},
-            {"city": "Pittsburg", "airport": "Atkinson Municipal Airport", "iata": "PTS", "country": "US"},
-            {"city": "Pittsburgh", "airport": "Allegheny County Airport", "iata": "AGC", "country": "US"},
-            {"city": "Pittsburgh", "airport": "Pittsburgh International Airport", "iata": "PIT", "country": "US"},
-            {"city": "Pittsfield", "airport": "Pittsfield Municipal Airport", "iata": "PSF", "country": "US"},
-            {"city": "Pituffik", "airport": "Pituffik Space Base", "iata": "THU", "country": "GL"},
-            {"city": "Piura", "airport": "Capitán FAP Guillermo Concha Iberico International Airport", "iata": "PIU", "country": "PE"},
-            {"city": "Placencia", "airport": "Placencia Airport", "iata": "PLJ", "country": "BZ"},
-            {"city": "Placerville", "airport": "Placerville Airport", "iata": "PVF", "country": "US"},
-            {"city": "Plaine Magnien", "airport": "Sir Seewoosagur Ramgoolam International Airport", "iata": "MRU", "country": "MU"},
-            {"city": "Plainview", "airport": "Hale County Airport", "iata": "PVW", "country": "US"},
-            {"city": "Planadas", "airport": "Planadas Airport", "iata": "PLA", "country": "CO"},
-            {"city": "Plastun", "airport": "Plastun Airport", "iata": "TLY", "country": "RU"},
-            {"city": "Platinum", "airport": "Platinum Airport", "iata": "PTU", "country": "US"},
-            {"city": "Plato", "airport": "Plato Airport", "iata": "PLT", "country": "CO"},
-            {"city": "Plattsburgh", "airport": "Plattsburgh International Airport", "iata": "PBG", "country": "US"},
-            {"city": "Playa Grande", "airport": "Playa Grande Airport", "iata": "PKJ", "country": "GT"},
-            {"city": "Playa del Carmen", "airport": "Playa del Carmen National Airport", "iata": "PCM", "country": "MX"},
-            {"city": "Plaza Saposoa", "airport": "Saposoa Airport", "iata": "SQU", "country": "PE"},
-            {"city": "Pleiku", "airport": "Pleiku Airport", "iata": "PXU", "country": "VN"},
-            {"city": "Plentywood", "airport": "Sher-Wood Airport", "iata": "PWD", "country": "US"},
-            {"city": "Plettenberg Bay", "airport": "Plettenberg Bay Airport", "iata": "PBZ", "country": "ZA"},
-            {"city": "Plovdiv", "airport": "Plovdiv International Airport", "iata": "PDV", "country": "BG"},
-            {"city": "Plymouth", "airport": "Plymouth Municipal Airport", "iata": "PLY", "country": "US"},
-            {"city": "Plymouth", "airport": "Plymouth Municipal Airport", "iata": "PYM", "country": "US"},
-            {"city": "Po", "airport": "Po Airport", "iata": "PUP", "country": "BF"},
-            {"city": "Pocahontas", "airport": "Pocahontas Municipal Airport", "iata": "POH", "country": "US"},
-            {"city": "Pocatello", "airport": "Pocatello Regional Airport", "iata": "PIH", "country": "US"},
-            {"city": "Pocheon", "airport": "Pocheon (G-217) Airport", "iata": "QJP", "country": "KR"},
-            {"city": "Pococi", "airport": "Barra del Colorado Airport", "iata": "BCL", "country": "CR"},
-            {"city": "Pococi", "airport": "Guapiles Airport", "iata": "GPL", "country": "CR"},
-            {"city": "Podgorica", "airport": "Podgorica Airport / Podgorica Golubovci Airbase", "iata": "TGD", "country": "ME"},
-            {"city": "Podor", "airport": "Podor Airport", "iata": "POD", "country": "SN"},
-            {"city": "Pohang", "airport": "Pohang Airport (G-815/K-3)", "iata": "KPO", "country": "KR"},
-            {"city": "Pohnpei Island", "airport": "Pohnpei International Airport", "iata": "PNI", "country": "FM"},
-            {"city": "Point Baker", "airport": "Point Baker Seaplane Base", "iata": "KPB", "country": "US"},
-            {"city": "Point Hope", "airport": "Point Hope Airport", "iata": "PHO", "country": "US"},
-            {"city": "Point Lay", "airport": "Point Lay LRRS Airport", "iata": "PIZ", "country": "US"},
-            {"city": "Point Lonely", "airport": "Point Lonely Short Range Radar Site Airfield", "iata": "LNI", "country": "US"},
-            {"city": "Point Mugu", "airport": "Point Mugu Naval Air Station (Naval Base Ventura Co)", "iata": "NTD", "country": "US"},
-            {"city": "Pointe Noire", "airport": "Antonio Agostinho-Neto International Airport", "iata": "PNR", "country": "CG"},
-            {"city": "Pointe-à-Pitre", "airport": "Guadeloupe - Maryse Condé International Airport", "iata": "PTP", "country": "GP"},
-            {"city": "Points North Landing", "airport": "Points North Landing Airport", "iata": "YNL", "country": "CA"},
-            {"city": "Poitiers/Biard", "airport": "Poitiers-Biard Airport", "iata": "PIS", "country": "FR"},
-            {"city": "Pokhara", "airport": "Pokhara International Airport", "iata": "PHH", "country": "NP"},
-            {"city": "Pokhara", "airport": "Pokhara Airport", "iata": "PKR", "country": "NP"},
-            {"city": "Polacca", "airport": "Polacca Airport", "iata": "PXL", "country": "US"},
-            {"city": "Polokwane", "airport": "Polokwane International Airport", "iata": "PTG", "country": "ZA"},
-            {"city": "Polonnaruwa Town", "airport": "Hingurakgoda Air Force Base", "iata": "HIM", "country": "LK"},
-            {"city": "Poltava", "airport": "Suprunovka Airport", "iata": "PLV", "country": "UA"},
-            {"city": "Pompano Beach", "airport": "Pompano Beach Airpark", "iata": "PPM", "country": "US"},
-            {"city": "Ponca City", "airport": "Ponca City Regional Airport", "iata": "PNC", "country": "US"},
-            {"city": "Ponce", "airport": "Mercedita Airport", "iata": "PSE", "country": "PR"},
-            {"city": "Pond Inlet", "airport": "Pond Inlet Airport", "iata": "YIO", "country": "CA"},
-            {"city": "Ponta Delgada", "airport": "João Paulo II Airport", "iata": "PDL", "country": "PT"},
-            {"city": "Ponta Grossa", "airport": "Ponta Grossa Airport - Comandante Antonio Amilton Beraldo", "iata": "PGZ", "country": "BR"},
-            {"city": "Ponta Porã", "airport": "Ponta Porã Airport", "iata": "PMG", "country": "BR"},
-            {"city": "Ponta do Ouro", "airport": "Ponta do Ouro Airport", "iata": "PDD", "country": "MZ"},
-            {"city": "Ponta do Sol", "airport": "Agostinho Neto Airport", "iata": "NTO", "country": "CV"},
-            {"city": "Pontes e Lacerda", "airport": "André Antônio Maggi Airport", "iata": "LCB", "country": "BR"},
-            {"city": "Pontiac", "airport": "Oakland County International Airport", "iata": "PTK", "country": "US"},
-            {"city": "Pontianak", "airport": "Supadio Airport", "iata": "PNK", "country": "ID"},
-            {"city": "Popayán", "airport": "Guillermo León Valencia Airport", "iata": "PPN", "country": "CO"},
-            {"city": "Poplar Bluff", "airport": "Poplar Bluff Municipal Airport", "iata": "POF", "country": "US"},
-            {"city": "Poplar Hill", "airport": "Poplar Hill Airport", "iata": "YHP", "country": "CA"},
-            {"city": "Poplar River", "airport": "Poplar River Airport", "iata": "XPP", "country": "CA"},
-            {"city": "Poplarville", "airport": "Poplarville Pearl River County Airport", "iata": "PCU", "country": "US"},
-            {"city": "Popondetta", "airport": "Girua Airport", "iata": "PNP", "country": "PG"},
-            {"city": "Poprad", "airport": "Poprad-Tatry Airport", "iata": "TAT", "country": "SK"},
-            {"city": "Poptún", "airport": "Poptún Airport", "iata": "PON", "country": "GT"},
-            {"city": "Porbandar", "airport": "Porbandar Airport", "iata": "PBD", "country": "IN"},
-            {"city": "Pore", "airport": "Pore Airport", "iata": "PRE", "country": "CO"},
-            {"city": "Pori", "airport": "Pori Airport", "iata": "POR", "country": "FI"},
-            {"city": "Pormpuraaw", "airport": "Pormpuraaw Airport", "iata": "EDR", "country": "AU"},
-            {"city": "Port Alberni", "airport": "Alberni Valley Regional Airport", "iata": "YPB", "country": "CA"},
-            {"city": "Port Alexander", "airport": "Port Alexander Seaplane Base", "iata": "PTD", "country": "US"},
-            {"city": "Port Alfred", "airport": "Port Alfred Airport", "iata": "AFD", "country": "ZA"},
-            {"city": "Port Alice", "airport": "Port Alice Seaplane Base", "iata": "PTC", "country": "US"},
-            {"city": "Port Alsworth", "airport": "Port Alsworth Airport", "iata": "PTA", "country": "US"},
-            {"city": "Port Amboim", "airport": "Porto Amboim Airport", "iata": "PBN", "country": "AO"},
-            {"city": "Port Angeles", "airport": "William R Fairchild International Airport", "iata": "CLM", "country": "US"},
-            {"city": "Port Bailey", "airport": "Port Bailey Seaplane Base", "iata": "KPY", "country": "US"},
-            {"city": "Port Bergé", "airport": "Port Bergé Airport", "iata": "WPB", "country": "MG"},
-            {"city": "Port Blair", "airport": "Veer Savarkar International Airport / INS Utkrosh", "iata": "IXZ", "country": "IN"},
-            {"city": "Port Clarence", "airport": "Port Clarence Coast Guard Station", "iata": "KPC", "country": "US"},
-            {"city": "Port Denison", "airport": "Dongara Airport", "iata": "DOX", "country": "AU"},
-            {"city": "Port Gentil", "airport": "Port Gentil Airport", "iata": "POG", "country": "GA"},
-            {"city": "Port Graham", "airport": "Port Graham Airport", "iata": "PGM", "country": "US"},
-            {"city": "Port Harcourt", "airport": "Port Harcourt International Airport", "iata": "PHC", "country": "NG"},
-            {"city": "Port Harcourt", "airport": "Port Harcourt City Airport / Port Harcourt Air Force Base", "iata": "PHG", "country": "NG"},
-            {"city": "Port Hardy", "airport": "Port Hardy Airport", "iata": "YZT", "country": "CA"},
-            {"city": "Port Hawkesbury", "airport": "Port Hawkesbury Airport", "iata": "YPS", "country": "CA"},
-            {"city": "Port Hedland", "airport": "Port Hedland International Airport", "iata": "PHE", "country": "AU"},
-            {"city": "Port Heiden", "airport": "Port Heiden Airport", "iata": "PTH", "country": "US"},
-            {"city": "Port Hope Simpson", "airport": "Port Hope Simpson Airport", "iata": "YHA", "country": "CA"},
-            {"city": "Port Huron", "airport": "St Clair County International Airport", "iata": "PHN", "country": "US"},
-            {"city": "Port Kaituma", "airport": "Port Kaituma Airport", "iata": "PKM", "country": "GY"},
-            {"city": "Port Lincoln", "airport": "Port Lincoln Airport", "iata": "PLO", "country": "AU"},
-            {"city": "Port Lions", "airport": "Port Lions Airport", "iata": "ORI", "country": "US"},
-            {"city": "Port Macquarie", "airport": "Port Macquarie Airport", "iata": "PQQ", "country": "AU"},
-            {"city": "Port Mathurin", "airport": "Sir Charles Gaetan Duval Airport", "iata": "RRG", "country": "MU"},
-            {"city": "Port McNeill", "airport": "Port McNeill Airport", "iata": "YMP", "country": "CA"},
-            {"city": "Port Moresby", "airport": "Port Moresby Jacksons International Airport", "iata": "POM", "country": "PG"},
-            {"city": "Port Nelson", "airport": "Rum Cay International Airport", "iata": "RCY", "country": "BS"},
-            {"city": "Port Protection", "airport": "Port Protection Seaplane Base", "iata": "PPV", "country": "US"},
-            {"city": "Port Said", "airport": "Port Said International Airport", "iata": "PSD", "country": "EG"},
-            {"city": "Port St Johns", "airport": "Port St Johns Airport", "iata": "JOH", "country": "ZA"},
-            {"city": "Port Sudan", "airport": "Port Sudan New International Airport", "iata": "PZU", "country": "SD"},
-            {"city": "Port Townsend", "airport": "Jefferson County International Airport", "iata": "TWD", "country": "US"},
-            {"city": "Port Vila", "airport": "Bauerfield International Airport", "iata": "VLI", "country": "VU"},
-            {"city": "Port Walter", "airport": "Port Walter Seaplane Base", "iata": "PWR", "country": "US"},
-            {"city": "Port Williams", "airport": "Port Williams Seaplane Base", "iata": "KPR", "country": "US"},
-            {"city": "Port of Spain", "airport": "Piarco International Airport", "iata": "POS", "country": "TT"},
-            {"city": "Port-Menier", "airport": "Port-Menier Airport", "iata": "YPN", "country": "CA"},
-            {"city": "Port-au-Prince", "airport": "Toussaint Louverture International Airport", "iata": "PAP", "country": "HT"},
-            {"city": "Port-de-Paix", "airport": "Port-de-Paix Airport", "iata": "PAX", "country": "HT"},
-            {"city": "Portage Creek", "airport": "Portage Creek Airport", "iata": "PCA", "country": "US"},
-            {"city": "Portage la Prairie", "airport": "Portage-la-Prairie / Southport Airport", "iata": "YPG", "country": "CA"},
-            {"city": "Porterville", "airport": "Porterville Municipal Airport", "iata": "PTV", "country": "US"},
-            {"city": "Portimão", "airport": "Portimão Airport", "iata": "PRM", "country": "PT"},
-            {"city": "Portland", "airport": "Portland Hillsboro Airport", "iata": "HIO", "country": "US"},
-            {"city": "Portland", "airport": "Portland International Airport", "iata": "PDX", "country": "US"},
-            {"city": "Portland", "airport": "Portland International Jetport", "iata": "PWM", "country": "US"},
-            {"city": "Portland", "airport": "Portland Troutdale Airport", "iata": "TTD", "country": "US"},
-            {"city": "Porto", "airport": "Francisco de Sá Carneiro Airport", "iata": "OPO", "country": "PT"},
-            {"city": "Porto Alegre", "airport": "Canoas Air Force Base", "iata": "QNS", "country": "BR"},
-            {"city": "Porto Alegre", "airport": "Salgado Filho International Airport", "iata": "POA", "country": "BR"},
-            {"city": "Porto Alegre do Norte", "airport": "Fazenda Piraguassu Airport", "iata": "PBX", "country": "BR"},
-            {"city": "Porto De Moz", "airport": "Porto de Moz Airport", "iata": "PTQ", "country": "BR"},
-            {"city": "Porto Nacional", "airport": "Porto Nacional Airport", "iata": "PNB", "country": "BR"},
-            {"city": "Porto Seguro", "airport": "Porto Seguro Airport", "iata": "BPS", "country": "BR"},
-            {"city": "Porto Velho", "airport": "Governador Jorge Teixeira de Oliveira Airport", "iata": "PVH", "country": "BR"},
-            {"city": "Portoviejo", "airport": "Reales Tamarindos Airport", "iata": "PVO", "country": "EC"},
-            {"city": "Portsmouth", "airport": "Greater Portsmouth Regional Airport", "iata": "PMH", "country": "US"},
-            {"city": "Portsmouth", "airport": "Portsmouth International at Pease Airport", "iata": "PSM", "country": "US"},
-            {"city": "Porvenir", "airport": "Captain Fuentes Martinez Airport", "iata": "WPR", "country": "CL"},
-            {"city": "Posadas", "airport": "Libertador Gral D Jose De San Martin Airport", "iata": "PSS", "country": "AR"},
-            {"city": "Poso-Celebes Island", "airport": "Kasiguncu Airport", "iata": "PSJ", "country": "ID"},
-            {"city": "Postville", "airport": "Postville Airport", "iata": "YSO", "country": "CA"},
-            {"city": "Potchefstroom", "airport": "Potchefstroom Airport", "iata": "PCF", "country": "ZA"},
-            {"city": "Poteau", "airport": "Robert S Kerr Airport", "iata": "RKR", "country": "US"},
-            {"city": "Potosí", "airport": "Capitan Nicolas Rojas Airport", "iata": "POI", "country": "BO"},
-            {"city": "Pottstown", "airport": "Heritage Field", "iata": "PTW", "country": "US"},
-            {"city": "Pottuvil", "airport": "Arugam Bay SPB", "iata": "AYY", "country": "LK"},
-            {"city": "Poughkeepsie", "airport": "Dutchess County Airport", "iata": "POU", "country": "US"},
-            {"city": "Poulsbo", "airport": "Port of Poulsbo Marina Moorage Seaplane Base", "iata": "PUL", "country": "US"},
-            {"city": "Pouso Alegre", "airport": "Pouso Alegre Airport", "iata": "PPY", "country": "BR"},
-            {"city": "Powell", "airport": "Powell Municipal Airport", "iata": "POY", "country": "US"},
-            {"city": "Powell River", "airport": "Powell Lake Seaplane Base", "iata": "WPL", "country": "CA"},
-            {"city": "Powell River", "airport": "Powell River Airport", "iata": "YPW", "country": "CA"},
-            {"city": "Poza Rica", "airport": "El Tajín National Airport", "iata": "PAZ", "country": "MX"},
-            {"city": "Poznań", "airport": "Poznań-Ławica Airport", "iata": "POZ", "country": "PL"},
-            {"city": "Poços De Caldas", "airport": "Poços de Caldas - Embaixador Walther Moreira Salles Airport", "iata": "POO", "country": "BR"},
-            {"city": "Prado", "airport": "Prado Airport", "iata": "PDF", "country": "BR"},
-            {"city": "Prague", "airport": "Václav Havel Airport Prague", "iata": "PRG", "country": "CZ"},
-            {"city": "Praia", "airport": "Nelson Mandela International Airport", "iata": "RAI", "country": "CV"},
-            {"city": "Praia da Vitória", "airport": "Lajes Airport", "iata": "TER", "country": "PT"},
-            {"city": "Prairie Du Chien", "airport": "Prairie Du Chien Municipal Airport", "iata": "PCD", "country": "US"},
-            {"city": "Praslin Island", "airport": "Praslin Island Airport", "iata": "PRI", "country": "SC"},
-            {"city": "Pratt", "airport": "Pratt Regional Airport", "iata": "PTT", "country": "US"},
-            {"city": "Preah Sihanouk", "airport": "Sihanoukville International Airport", "iata": "KOS", "country": "KH"},
-            {"city": "Preguiça", "airport": "Preguiça Airport", "iata": "SNE", "country": "CV"},
-            {"city": "Prentice", "airport": "Prentice Airport", "iata": "PRW", "country": "US"},
-            {"city": "Preobrazheniye", "airport": "Preobrazheniye Airport", "iata": "RZH", "country": "RU"},
-            {"city": "Prescott", "airport": "Prescott International Airport - Ernest A. Love Field", "iata": "PRC", "country": "US"},
-            {"city": "Presidencia Roque Sáenz Peña", "airport": "Termal Airport", "iata": "PRQ", "country": "AR"},
-            {"city": "Presidente Dutra", "airport": "Presidente José Sarney Airport", "iata": "PDR", "country": "BR"},
-            {"city": "Presidente Prudente", "airport": "Presidente Prudente Airport", "iata": "PPB", "country": "BR"},
-            {"city": "Presque Isle", "airport": "Presque Isle International Airport", "iata": "PQI", "country": "US"},
-            {"city": "Prestwick, South Ayrshire", "airport": "Glasgow Prestwick Airport", "iata": "PIK", "country": "GB"},
-            {"city": "Pretoria", "airport": "Wonderboom Airport", "iata": "PRY", "country": "ZA"},
-            {"city": "Pretoria", "airport": "Waterkloof Air Force Base", "iata": "WKF", "country": "ZA"},
-            {"city": "Pretoria", "airport": "Pretoria Central Heliport", "iata": "HPR", "country": "ZA"},
-            {"city": "Preveza", "airport": "Aktion National Airport", "iata": "PVK", "country": "GR"},
-            {"city": "Prešov", "airport": "Prešov Air Base", "iata": "POV", "country": "SK"},
-            {"city": "Price", "airport": "Carbon County Regional Airport / Buck Davis Field", "iata": "PUC", "country": "US"},
-            {"city": "Prieska", "airport": "Prieska Airport", "iata": "PRK", "country": "ZA"},
-            {"city": "Primrose", "airport": "Primrose Airport", "iata": "PFM", "country": "CA"},
-            {"city": "Prince Albert", "airport": "Prince Albert Glass Field", "iata": "YPA", "country": "CA"},
-            {"city": "Prince George", "airport": "Prince George Airport", "iata": "YXS", "country": "CA"},
-            {"city": "Prince Rupert", "airport": "Prince Rupert Airport", "iata": "YPR", "country": "CA"},
-            {"city": "Prince Rupert", "airport": "Prince Rupert/Seal Cove Seaplane Base", "iata": "ZSW", "country": "CA"},
-            {"city": "Princeton", "airport": "Princeton Municipal Airport", "iata": "PNN", "country": "US"},
-            {"city": "Princeton/Rocky Hill", "airport": "Princeton Airport", "iata": "PCT", "country": "US"},
-            {"city": "Prineville", "airport": "Prineville Airport", "iata": "PRZ", "country": "US"},
-            {"city": "Prishtina", "airport": "Priština Adem Jashari International Airport", "iata": "PRN", "country": "XK"},
-            {"city": "Propriano", "airport": "Propriano Airport", "iata": "PRP", "country": "FR"},
-            {"city": "Proserpine", "airport": "Proserpine Whitsunday Coast Airport", "iata": "PPP", "country": "AU"},
-            {"city": "Prospect Creek", "airport": "Prospect Creek Airport", "iata": "PPC", "country": "US"},
-            {"city": "Providencia", "airport": "El Embrujo Airport", "iata": "PVA", "country": "CO"},
-            {"city": "Providenciales", "airport": "Providenciales International Airport", "iata": "PLS", "country": "TC"},
-            {"city": "Provincetown", "airport": "Provincetown Municipal Airport", "iata": "PVC", "country": "US"},
-            {"city": "Provo", "airport": "Provo-Utah Lake International Airport", "iata": "PVU", "country": "US"},
-            {"city": "Pskov", "airport": "Pskov Airport", "iata": "PKV", "country": "RU"},
-            {"city": "Pu'er", "airport": "Pu'er Simao Airport", "iata": "SYM", "country": "CN"},
-            {"city": "Pu'er (Lancang)", "airport": "Lancang Jingmai Airport", "iata": "JMJ", "country": "CN"},
-            {"city": "Puas Mission", "airport": "Puas Airport", "iata": "PUA", "country": "PG"},
-            {"city": "Pucallpa", "airport": "Cap FAP David Abenzur Rengifo International Airport", "iata": "PCL", "country": "PE"},
-            {"city": "Pucon", "airport": "Pucón Airport", "iata": "ZPC", "country": "CL"},
-            {"city": "Puducherry (Pondicherry)", "airport": "Pondicherry Airport", "iata": "PNY", "country": "IN"},
-            {"city": "Puebla", "airport": "Hermanos Serdán International Airport", "iata": "PBC", "country": "MX"},
-            {"city": "Pueblo", "airport": "Pueblo Memorial Airport", "iata": "PUB", "country": "US"},
-            {"city": "Puerto Armuelles", "airport": "Puerto Armuelles Airport", "iata": "AML", "country": "PA"},
-            {"city": "Puerto Asís", "airport": "Tres De Mayo Airport", "iata": "PUU", "country": "CO"},
-            {"city": "Puerto Ayacucho", "airport": "Cacique Aramare Airport", "iata": "PYH", "country": "VE"},
-            {"city": "Puerto Aysén", "airport": "Cabo Juan Román Airfield", "iata": "WPA", "country": "CL"},
-            {"city": "Puerto Baquerizo Moreno", "airport": "San Cristóbal Airport", "iata": "SCY", "country": "EC"},
-            {"city": "Puerto Barrios", "airport": "Puerto Barrios Airport", "iata": "PBR", "country": "GT"},
-            {"city": "Puerto Berrio", "airport": "Puerto Berrio Airport", "iata": "PBE", "country": "CO"},
-            {"city": "Puerto Boyacá", "airport": "Velásquez Airport", "iata": "PYA", "country": "CO"},
-            {"city": "Puerto Cabello", "airport": "General Bartolome Salom International Airport", "iata": "PBL", "country": "VE"},
-            {"city": "Puerto Cabezas", "airport": "Puerto Cabezas Airport", "iata": "PUZ", "country": "NI"},
-            {"city": "Puerto Carreño", "airport": "Guerima Airport", "iata": "GMC", "country": "CO"},
-            {"city": "Puerto Carreño", "airport": "German Olano Airport", "iata": "PCR", "country": "CO"},
-            {"city": "Puerto Deseado", "airport": "Puerto Deseado Airport", "iata": "PUD", "country": "AR"},
-            {"city": "Puerto Escondido", "airport": "Puerto Escondido International Airport", "iata": "PXM", "country": "MX"},
-            {"city": "Puerto Gaitán", "airport": "Morelia Airport", "iata": "MSK", "country": "CO"},
-            {"city": "Puerto Iguazu", "airport": "Cataratas Del Iguazú International Airport", "iata": "IGR", "country": "AR"},
-            {"city": "Puerto Inírida", "airport": "Obando Cesar Gaviria Trujillo Airport", "iata": "PDA", "country": "CO"},
-            {"city": "Puerto Jimenez", "airport": "Puerto Jimenez Airport", "iata": "PJM", "country": "CR"},
-            {"city": "Puerto La Victoria", "airport": "Aeródromo de Puerto La Victoria", "iata": "PCJ", "country": "PY"},
-            {"city": "Puerto Leda", "airport": "Aeródromo de Puerto Leda", "iata": "PBT", "country": "PY"},
-            {"city": "Puerto Leguízamo", "airport": "Caucaya Airport", "iata": "LQM", "country": "CO"},
-            {"city": "Puerto Lempira", "airport": "Puerto Lempira Airport", "iata": "PEU", "country": "HN"},
-            {"city": "Puerto Limon", "airport": "Limon International Airport", "iata": "LIO", "country": "CR"},
-            {"city": "Puerto López", "airport": "Carimagua Airport", "iata": "CCO", "country": "CO"},
-            {"city": "Puerto Madryn", "airport": "El Tehuelche Airport", "iata": "PMY", "country": "AR"},
-            {"city": "Puerto Maldonado", "airport": "Padre Aldamiz International Airport", "iata": "PEM", "country": "PE"},
-            {"city": "Puerto Montt", "airport": "El Tepual Airport", "iata": "PMC", "country": "CL"},
-            {"city": "Puerto Mosquito", "airport": "Gamarra Airport", "iata": "GRA", "country": "CO"},
-            {"city": "Puerto Natales", "airport": "Lieutenant Julio Gallardo Airport", "iata": "PNT", "country": "CL"},
-            {"city": "Puerto Obaldía", "airport": "Puerto Obaldía Airport", "iata": "PUE", "country": "PA"},
-            {"city": "Puerto Ordaz-Ciudad Guayana", "airport": "General Manuel Carlos Piar International Airport", "iata": "PZO", "country": "VE"},
-            {"city": "Puerto Paez", "airport": "Puerto Paez Airport", "iata": "PPZ", "country": "VE"},
-            {"city": "Puerto Peñasco", "airport": "Mar de Cortés International Airport", "iata": "PPE", "country": "MX"},
-            {"city": "Puerto Piña", "airport": "Bahia Piña Airport", "iata": "BFQ", "country": "PA"},
-            {"city": "Puerto Plata", "airport": "Gregorio Luperon International Airport", "iata": "POP", "country": "DO"},
-            {"city": "Puerto Princesa", "airport": "Puerto Princesa International Airport / PAF Antonio Bautista Air Base", "iata": "PPS", "country": "PH"},
-            {"city": "Puerto Putumayo", "airport": "Putumayo Airport", "iata": "PYO", "country": "EC"},
-            {"city": "Puerto Rico", "airport": "Puerto Rico Airport", "iata": "PCC", "country": "CO"},
-            {"city": "Puerto Rico/Manuripi", "airport": "Puerto Rico Airport", "iata": "PUR", "country": "BO"},
-            {"city": "Puerto San José", "airport": "San José Airport", "iata": "GSJ", "country": "GT"},
-            {"city": "Puerto Santa Cruz", "airport": "Santa Cruz Airport", "iata": "RZA", "country": "AR"},
-            {"city": "Puerto Suárez", "airport": "Capitán Av. Salvador Ogaya G. airport", "iata": "PSZ", "country": "BO"},
-            {"city": "Puerto Vallarta", "airport": "Puerto Vallarta International Airport", "iata": "PVR", "country": "MX"},
-            {"city": "Puerto Vallemi", "airport": "Aeropuerto Nacional Doctor Juan Plate", "iata": "VMI", "country": "PY"},
-            {"city": "Puerto Varas", "airport": "El Mirador Airport", "iata": "PUX", "country": "CL"},
-            {"city": "Puerto Villamil", "airport": "General Villamil Airport", "iata": "IBB", "country": "EC"},
-            {"city": "Puerto Williams", "airport": "Guardia Marina Zañartu Airport", "iata": "WPU", "country": "CL"},
-            {"city": "Pukapuka Atoll", "airport": "Pukapuka Island Airport", "iata": "PZK", "country": "CK"},
-            {"city": "Pukaruha", "airport": "Pukaruha Airport", "iata": "PUK", "country": "PF"},
-            {"city": "Pukatawagan", "airport": "Pukatawagan Airport", "iata": "XPK", "country": "CA"},
-            {"city": "Pula", "airport": "Pula Airport", "iata": "PUY", "country": "HR"},
-            {"city": "Pulau Layang-Layang (Swallow Reef)", "airport": "Layang-Layang Airport", "iata": "LAC", "country": "MY"},
-            {"city": "Pullman", "airport": "Pullman-Moscow Regional Airport", "iata": "PUW", "country": "US"},
-            {"city": "Pumani", "airport": "Pumani Airport", "iata": "PMN", "country": "PG"},
-            {"city": "Pumululu National Park", "airport": "Bellburn Airstrip", "iata": "BXF", "country": "AU"},
-            {"city": "Pune", "airport": "Pune Airport / Lohagaon Air Force Station", "iata": "PNQ", "country": "IN"},
-            {"city": "Punia", "airport": "Punia Airport", "iata": "PUN", "country": "CD"},
-            {"city": "Punta Arenas", "airport": "Buenos Aires Airport", "iata": "BAI", "country": "CR"},
-            {"city": "Punta Arenas", "airport": "President Carlos Ibañez del Campo International Airport", "iata": "PUQ", "country": "CL"},
-            {"city": "Punta Cana", "airport": "Punta Cana International Airport", "iata": "PUJ", "country": "DO"},
-            {"city": "Punta Gorda", "airport": "Punta Gorda Airport", "iata": "PND", "country": "BZ"},
-            {"city": "Punta Gorda", "airport": "Punta Gorda Airport", "iata": "PGD", "country": "US"},
-            {"city": "Punta del Este", "airport": "Capitan Corbeta CA Curbelo International Airport", "iata": "PDP", "country": "UY"},
-            {"city": "Puntarenas", "airport": "Chacarita Airport", "iata": "JAP", "country": "CR"},
-            {"city": "Puntarenas", "airport": "Drake Bay Airport", "iata": "DRK", "country": "CR"},
-            {"city": "Puri", "airport": "Walluanda Airport", "iata": "WLU", "country": "PG"},
-            {"city": "Purwokerto-Java Island", "airport": "Jenderal Besar Soedirman Airport", "iata": "PWL", "country": "ID"},
-            {"city": "Putao", "airport": "Putao Airport", "iata": "PBU", "country": "MM"},
-            {"city": "Puttaparthi", "airport": "Sri Sathya Sai Airport", "iata": "PUT", "country": "IN"},
-            {"city": "Putussibau-Borneo Island", "airport": "Pangsuma Airport", "iata": "PSU", "country": "ID"},
-            {"city": "Puvirnituq", "airport": "Puvirnituq Airport", "iata": "YPX", "country": "CA"},
-            {"city": "Pweto", "airport": "Pweto Airport", "iata": "PWO", "country": "CD"},
-            {"city": "Pye", "airport": "Pyay Airport", "iata": "PRU", "country": "MM"},
-            {"city": "Pyeongtaek", "airport": "Osan Air Base", "iata": "OSN", "country": "KR"},
-            {"city": "Pyinmana", "airport": "Nay Pyi Taw International Airport", "iata": "NYT", "country": "MM"},
-            {"city": "Pyongyang", "airport": "Pyongyang Sunan International Airport", "iata": "FNJ", "country": "KP"},
-            {"city": "Pärnu", "airport": "Pärnu Airport", "iata": "EPU", "country": "EE"},
-            {"city": "Pécs", "airport": "Pécs-Pogány Airport", "iata": "PEV", "country": "HU"},
-            {"city": "Pérez Zeledón", "airport": "San Isidro del General Airport", "iata": "IPZ", "country": "CR"},
-            {"city": "Périgueux/Bassillac", "airport": "Périgueux-Bassillac Airport", "iata": "PGX", "country": "FR"},
-            {"city": "Přerov", "airport": "Přerov Air Base", "iata": "PRV", "country": "CZ"},
-            {"city": "Qaanaaq", "airport": "Qaanaaq Airport", "iata": "NAQ", "country": "GL"},
-            {"city": "Qacha's Nek", "airport": "Qacha's Nek Airport", "iata": "UNE", "country": "LS"},
-            {"city": "Qaisumah", "airport": "Al Qaisumah/Hafr Al Batin Airport", "iata": "AQI", "country": "SA"},
-            {"city": "Qala-i-Naw", "airport": "Qala-i-Naw Airport", "iata": "LQN", "country": "AF"},
-            {"city": "Qamishly", "airport": "Qamishli Airport", "iata": "KAC", "country": "SY"},
-            {"city": "Qaqortoq", "airport": "Qaqortoq Heliport", "iata": "JJU", "country": "GL"},
-            {"city": "Qasigiannguit", "airport": "Qasigiannguit Heliport", "iata": "JCH", "country": "GL"},
-            {"city": "Qassimiut", "airport": "Qassimiut Heliport", "iata": "QJH", "country": "GL"},
-            {"city": "Qayyarah", "airport": "Qayyarah West Airport", "iata": "RQW", "country": "IQ"},
-            {"city": "Qazvin", "airport": "Qazvin Airport", "iata": "GZW", "country": "IR"},
-            {"city": "Qeqertaq", "airport": "Qeqertaq Heliport", "iata": "PQT", "country": "GL"},
-            {"city": "Qeqertarsuaq", "airport": "Qeqertarsuaq Heliport", "iata": "JGO", "country": "GL"},
-            {"city": "Qian Gorlos Mongol Autonomous County", "airport": "Songyuan Chaganhu Airport", "iata": "YSQ", "country": "CN"},
-            {"city": "Qianjiang", "airport": "Qianjiang Wulingshan Airport", "iata": "JIQ", "country": "CN"},
-            {"city": "Qiannan (Libo)", "airport": "Libo Airport", "iata": "LLB", "country": "CN"},
-            {"city": "Qiemo", "airport": "Qiemo Yudu Airport", "iata": "IQM", "country": "CN"},
-            {"city": "Qikiqtarjuaq", "airport": "Qikiqtarjuaq Airport", "iata": "YVM", "country": "CA"},
-            {"city": "Qimei", "airport": "Qimei Airport", "iata": "CMJ", "country": "TW"},
-            {"city": "Qingdao (Jiaozhou)", "airport": "Qingdao Jiaodong International Airport", "iata": "TAO", "country": "CN"},
-            {"city": "Qingyang (Xifeng)", "airport": "Qingyang Xifeng Airport", "iata": "IQN", "country": "CN"},
-            {"city": "Qinhuangdao (Changli)", "airport": "Qinhuangdao Beidaihe Airport", "iata": "BPE", "country": "CN"},
-            {"city": "Qionghai (Basuo)", "airport": "Qionghai Bo'ao Airport", "iata": "BAR", "country": "CN"},
-            {"city": "Qiqihar", "airport": "Qiqihar Sanjiazi Airport", "iata": "NDG", "country": "CN"},
-            {"city": "Qishn", "airport": "Qishn Airport", "iata": "IHN", "country": "YE"},
-            {"city": "Qitai", "airport": "Qitai Jiangbulake Airport", "iata": "JBK", "country": "CN"},
-            {"city": "Quadra Island", "airport": "April Point Seaplane Base", "iata": "YQJ", "country": "CA"},
-            {"city": "Quakertown", "airport": "Quakertown Airport", "iata": "UKT", "country": "US"},
-            {"city": "Qualicum Beach", "airport": "Qualicum Beach Airport", "iata": "XQU", "country": "CA"},
-            {"city": "Quantico", "airport": "Quantico Marine Corps Airfield / Turner Field", "iata": "NYG", "country": "US"},
-            {"city": "Quanzhou", "airport": "Quanzhou Jinjiang International Airport", "iata": "JJN", "country": "CN"},
-            {"city": "Quaqtaq", "airport": "Quaqtaq Airport", "iata": "YQC", "country": "CA"},
-            {"city": "Quebec", "airport": "Quebec Jean Lesage International Airport", "iata": "YQB", "country": "CA"},
-            {"city": "Queen Charlotte", "airport": "Queen Charlotte City Seaplane Base", "iata": "ZQS", "country": "CA"},
-            {"city": "Queenstown", "airport": "Queenstown Airport", "iata": "UTW", "country": "ZA"},
-            {"city": "Queenstown", "airport": "Queenstown International Airport", "iata": "ZQN", "country": "NZ"},
-            {"city": "Quelimane", "airport": "Quelimane Airport", "iata": "UEL", "country": "MZ"},
-            {"city": "Quepos", "airport": "Quepos Managua Airport", "iata": "XQP", "country": "CR"},
-            {"city": "Querétaro", "airport": "Querétaro Intercontinental Airport", "iata": "QRO", "country": "MX"},
-            {"city": "Quesnel", "airport": "Quesnel Airport", "iata": "YQZ", "country": "CA"},
-            {"city": "Quetta", "airport": "Quetta International Airport", "iata": "UET", "country": "PK"},
-            {"city": "Quezaltenango", "airport": "Quezaltenango Airport", "iata": "AAZ", "country": "GT"},
-            {"city": "Quibdó", "airport": "El Caraño Airport", "iata": "UIB", "country": "CO"},
-            {"city": "Quijarro", "airport": "Uyuni Joya Andina Airport", "iata": "UYU", "country": "BO"},
-            {"city": "Quillayute", "airport": "Quillayute Airport", "iata": "UIL", "country": "US"},
-            {"city": "Quimper/Pluguffan", "airport": "Quimper-Cornouaille Airport", "iata": "UIP", "country": "FR"},
-            {"city": "Quince Mil", "airport": "Quincemil Air Base", "iata": "UMI", "country": "PE"},
-            {"city": "Quincy", "airport": "Gansner Field", "iata": "GNF", "country": "US"},
-            {"city": "Quincy", "airport": "Quincy Regional Airport Baldwin Field", "iata": "UIN", "country": "US"},
-            {"city": "Quinhagak", "airport": "Quinhagak Airport", "iata": "KWN", "country": "US"},
-            {"city": "Quito", "airport": "Mariscal Sucre International Airport", "iata": "UIO", "country": "EC"},
-            {"city": "Quthing", "airport": "Quthing Airport", "iata": "UTG", "country": "LS"},
-            {"city": "Quy Nohn", "airport": "Phu Cat Airport", "iata": "UIH", "country": "VN"},
-            {"city": "Quzhou (Kezheng)", "airport": "Quzhou Airport", "iata": "JUZ", "country": "CN"},
-            {"city": "Rabaraba", "airport": "Raba Raba Airport", "iata": "RBP", "country": "PG"},
-            {"city": "Rabat", "airport": "Rabat-Salé Airport", "iata": "RBA", "country": "MA"},
-            {"city": "Rabi Island", "airport": "Rabi Island Airport", "iata": "RBI", "country": "FJ"},
-            {"city": "Rabil", "airport": "Rabil Airport", "iata": "BVC", "country": "CV"},
-            {"city": "Rach Gia", "airport": "Rach Gia Airport", "iata": "VKG", "country": "VN"},
-            {"city": "Racine", "airport": "John H Batten Airport", "iata": "RAC", "country": "US"},
-            {"city": "Radamata", "airport": "Tambolaka Airport", "iata": "TMC", "country": "ID"},
-            {"city": "Radom", "airport": "Warsaw Radom Airport", "iata": "RDO", "country": "PL"},
-            {"city": "Rafaela", "airport": "Rafaela Airport", "iata": "RAF", "country": "AR"},
-            {"city": "Rafaï", "airport": "Rafaï Airport", "iata": "RFA", "country": "CF"},
-            {"city": "Rafha", "airport": "Rafha Domestic Airport", "iata": "RAH", "country": "SA"},
-            {"city": "Rafsanjan", "airport": "Rafsanjan Airport", "iata": "RJN", "country": "IR"},
-            {"city": "Raglan", "airport": "Raglan Aerodrome", "iata": "RAG", "country": "NZ"},
-            {"city": "Raha", "airport": "Sugimanuru Airport", "iata": "RAQ", "country": "ID"},
-            {"city": "Rahim Yar Khan", "airport": "Shaikh Zaid Airport", "iata": "RYK", "country": "PK"},
-            {"city": "Rainbow Lake", "airport": "Rainbow Lake Airport", "iata": "YOP", "country": "CA"},
-            {"city": "Raipur", "airport": "Swami Vivekananda Airport", "iata": "RPR", "country": "IN"},
-            {"city": "Raitahiti", "airport": "Kaukura Airport", "iata": "KKR", "country": "PF"},
-            {"city": "Rajbiraj", "airport": "Rajbiraj Airport", "iata": "RJB", "country": "NP"},
-            {"city": "Rajkot", "airport": "Rajkot International Airport", "iata": "HSR", "country": "IN"},
-            {"city": "Rajkot", "airport": "Rajkot Airport", "iata": "RAJ", "country": "IN"},
-            {"city": "Rajouri", "airport": "Rajouri Airport", "iata": "RJI", "country": "IN"},
-            {"city": "Rajshahi", "airport": "Shah Mokhdum Airport", "iata": "RJH", "country": "BD"},
-            {"city": "Rakanda", "airport": "Rakanda Airport", "iata": "RAA", "country": "PG"},
-            {"city": "Raleigh/Durham", "airport": "Raleigh Durham International Airport", "iata": "RDU", "country": "US"},
-            {"city": "Ralston", "airport": "Canadian Forces Base Suffield Heliport", "iata": "YSD", "country": "CA"},
-            {"city": "Ramagundam", "airport": "Basanth Nagar Airport", "iata": "RMD", "country": "IN"},
-            {"city": "Ramallah", "airport": "Ramallah Heliport", "iata": "ZDM", "country": "PS"},
-            {"city": "Ramata", "airport": "Ramata Airport", "iata": "RBV", "country": "SB"},
-            {"city": "Ramechhap", "airport": "Ramechhap Airport", "iata": "RHP", "country": "NP"},
-            {"city": "Rampart", "airport": "Rampart Airport", "iata": "RMP", "country": "US"},
-            {"city": "Ramsar", "airport": "Ramsar Airport", "iata": "RZR", "country": "IR"},
-            {"city": "Ramstein-Miesenbach", "airport": "Ramstein Air Base", "iata": "RMS", "country": "DE"},
-            {"city": "Ranai-Natuna Besar Island", "airport": "Ranai Airport", "iata": "NTX", "country": "ID"},
-            {"city": "Ranau", "airport": "Ranau Airport", "iata": "RNU", "country": "MY"},
-            {"city": "Ranchi", "airport": "Birsa Munda Airport", "iata": "IXR", "country": "IN"},
-            {"city": "Ranger", "airport": "Ranger Municipal Airport", "iata": "RGR", "country": "US"},
-            {"city": "Rankin Inlet", "airport": "Rankin Inlet Airport", "iata": "YRT", "country": "CA"},
-            {"city": "Ranong", "airport": "Ranong Airport", "iata": "UNN", "country": "TH"},
-            {"city": "Ransiki-Papua Island", "airport": "Abresso Airport", "iata": "RSK", "country": "ID"},
-            {"city": "Ranón", "airport": "Asturias Airport", "iata": "OVD", "country": "ES"},
-            {"city": "Rapid City", "airport": "Rapid City Regional Airport", "iata": "RAP", "country": "US"},
-            {"city": "Rapid City", "airport": "Ellsworth Air Force Base", "iata": "RCA", "country": "US"},
-            {"city": "Raroia", "airport": "Raroia Airport", "iata": "RRR", "country": "PF"},
-            {"city": "Ras Abu Rudeis", "airport": "Abu Rudeis Airport", "iata": "AUE", "country": "EG"},
-            {"city": "Ras Al Khaimah", "airport": "Ras Al Khaimah International Airport", "iata": "RKT", "country": "AE"},
-            {"city": "Rasht", "airport": "Sardar-e-Jangal Airport", "iata": "RAS", "country": "IR"},
-            {"city": "Ratanakiri", "airport": "Ratanakiri Airport", "iata": "RBE", "country": "KH"},
-            {"city": "Raton", "airport": "Raton Municipal Airport / Crews Field", "iata": "RTN", "country": "US"},
-            {"city": "Raufarhöfn", "airport": "Raufarhöfn Airport", "iata": "RFN", "country": "IS"},
-            {"city": "Ravenna (RA)", "airport": "Ravenna Airport", "iata": "RAN", "country": "IT"},
-            {"city": "Rawalakot", "airport": "Rawalakot Airport", "iata": "RAZ", "country": "PK"},
-            {"city": "Rawlins", "airport": "Rawlins Municipal Airport/Harvey Field", "iata": "RWL", "country": "US"},
-            {"city": "Rawson", "airport": "Almirante Marco Andres Zar Airport", "iata": "REL", "country": "AR"},
-            {"city": "Rayong", "airport": "U-Tapao International Airport", "iata": "UTP", "country": "TH"},
-            {"city": "Reading", "airport": "Reading Regional Airport (Carl A Spaatz Field)", "iata": "RDG", "country": "US"},
-            {"city": "Reao", "airport": "Reao Airport", "iata": "REA", "country": "PF"},
-            {"city": "Rebun", "airport": "Rebun Airport", "iata": "RBJ", "country": "JP"},
-            {"city": "Recea", "airport": "Târgu Mureş Transilvania International Airport", "iata": "TGM", "country": "RO"},
-            {"city": "Recife", "airport": "Recife/Guararapes - Gilberto Freyre International Airport", "iata": "REC", "country": "BR"},
-            {"city": "Reconquista", "airport": "Reconquista Airport", "iata": "RCQ", "country": "AR"},
-            {"city": "Red Bluff", "airport": "Red Bluff Municipal Airport", "iata": "RBL", "country": "US"},
-            {"city": "Red Devil", "airport": "Red Devil Airport", "iata": "RDV", "country": "US"},
-            {"city": "Red Dog", "airport": "Red Dog Airport", "iata": "RDB", "country": "US"},
-            {"city": "Red Lake", "airport": "Red Lake Airport", "iata": "YRL", "country": "CA"},
-            {"city": "Red Sucker Lake", "airport": "Red Sucker Lake Airport", "iata": "YRS", "country": "CA"},
-            {"city": "Redang", "airport": "LTS Pulau Redang Airport", "iata": "RDN", "country": "MY"},
-            {"city": "Redcliffe", "airport": "Redcliffe Airport", "iata": "RCL", "country": "VU"},
-            {"city": "Redding", "airport": "Redding Municipal Airport", "iata": "RDD", "country": "US"},
-            {"city": "Redding", "airport": "Benton Field", "iata": "BZF", "country": "US"},
-            {"city": "Redenção", "airport": "Redenção Airport", "iata": "RDC", "country": "BR"},
-            {"city": "Redmond", "airport": "Roberts Field", "iata": "RDM", "country": "US"},
-            {"city": "Redstone Arsnl Huntsville", "airport": "Redstone Army Air Field", "iata": "HUA", "country": "US"},
-            {"city": "Redwood Falls", "airport": "Redwood Falls Municipal Airport", "iata": "RWF", "country": "US"},
-            {"city": "Reed City", "airport": "Nartron Field", "iata": "RCT", "country": "US"},
-            {"city": "Reedsville", "airport": "Mifflin County Airport", "iata": "RED", "country": "US"},
-            {"city": "Refugio", "airport": "Rooke Field", "iata": "RFG", "country": "US"},
-            {"city": "Reg", "airport": "Dwyer Airport", "iata": "DWR", "country": "AF"},
-            {"city": "Reggio Calabria", "airport": "Reggio Calabria Airport", "iata": "REG", "country": "IT"},
-            {"city": "Regina", "airport": "Regina International Airport", "iata": "YQR", "country": "CA"},
-            {"city": "Reivilo", "airport": "Reivilo Airport", "iata": "RVO", "country": "ZA"},
-            {"city": "Remedios", "airport": "Otu Airport", "iata": "OTU", "country": "CO"},
-            {"city": "Rengat-Sumatra Island", "airport": "Japura Airport", "iata": "RGT", "country": "ID"},
-            {"city": "Rennell Island", "airport": "Rennell/Tingoa Airport", "iata": "RNL", "country": "SB"},
-            {"city": "Reno", "airport": "Reno Tahoe International Airport", "iata": "RNO", "country": "US"},
-            {"city": "Rensselaer", "airport": "Jasper County Airport", "iata": "RNZ", "country": "US"},
-            {"city": "Renton", "airport": "Renton Municipal Airport", "iata": "RNT", "country": "US"},
-            {"city": "Reola", "airport": "Tartu Airport", "iata": "TAY", "country": "EE"},
-            {"city": "Repulse Bay", "airport": "Naujaat Airport", "iata": "YUT", "country": "CA"},
-            {"city": "Resende", "airport": "Resende Airport", "iata": "REZ", "country": "BR"},
-            {"city": "Resistencia", "airport": "Resistencia International Airport", "iata": "RES", "country": "AR"},
-            {"city": "Resolute Bay", "airport": "Resolute Bay Airport", "iata": "YRB", "country": "CA"},
-            {"city": "Retalhuleu", "airport": "Retalhuleu Airport", "iata": "RER", "country": "GT"},
-            {"city": "Reus", "airport": "Reus Airport", "iata": "REU", "country": "ES"},
-            {"city": "Revelstoke", "airport": "Revelstoke Airport", "iata": "YRV", "country": "CA"},
-            {"city": "Rewa", "airport": "Rewa Airport, Chorhata, REWA", "iata": "REW", "country": "IN"},
-            {"city": "Rexburg", "airport": "Rexburg Madison County Airport", "iata": "RXE", "country": "US"},
-            {"city": "Reyes", "airport": "Reyes Airport", "iata": "REY", "country": "BO"},
-            {"city": "Reykhólar", "airport": "Reykhólar Airport", "iata": "RHA", "country": "IS"},
-            {"city": "Reykjavík", "airport": "Keflavik International Airport", "iata": "KEF", "country": "IS"},
-            {"city": "Reykjavík", "airport": "Reykjavík Domestic Airport", "iata": "RKV", "country": "IS"},
-            {"city": "Reynosa", "airport": "General Lucio Blanco International Airport", "iata": "REX", "country": "MX"},
-            {"city": "Rheinmünster", "airport": "Karlsruhe Baden-Baden Airport", "iata": "FKB", "country": "DE"},
-            {"city": "Rhinelander", "airport": "Rhinelander Oneida County Airport", "iata": "RHI", "country": "US"},
-            {"city": "Rhodes", "airport": "Diagoras Airport", "iata": "RHO", "country": "GR"},
-            {"city": "Ribeirão Preto", "airport": "Leite Lopes Airport", "iata": "RAO", "country": "BR"},
-            {"city": "Riberalta", "airport": "Capitán Av. Selin Zeitun Lopez Airport", "iata": "RIB", "country": "BO"},
-            {"city": "Rice Lake", "airport": "Rice Lake Regional Airport - Carl's Field", "iata": "RIE", "country": "US"},
-            {"city": "Richard Toll", "airport": "Richard Toll Airport", "iata": "RDT", "country": "SN"},
-            {"city": "Richards Bay", "airport": "Richards Bay Airport", "iata": "RCB", "country": "ZA"},
-            {"city": "Richfield", "airport": "Richfield Municipal Airport", "iata": "RIF", "country": "US"},
-            {"city": "Richland", "airport": "Richland Airport", "iata": "RLD", "country": "US"},
-            {"city": "Richlands", "airport": "Albert J Ellis Airport", "iata": "OAJ", "country": "US"},
-            {"city": "Richmond", "airport": "Richmond International Airport", "iata": "RIC", "country": "US"},
-            {"city": "Richmond", "airport": "Richmond Municipal Airport", "iata": "RID", "country": "US"},
-            {"city": "Richmond", "airport": "RAAF Base Richmond", "iata": "XRH", "country": "AU"},
-            {"city": "Riesa", "airport": "Riesa-Göhlis Airport", "iata": "IES", "country": "DE"},
-            {"city": "Rif", "airport": "Rif Airport", "iata": "OLI", "country": "IS"},
-            {"city": "Rifle", "airport": "Garfield County Regional Airport", "iata": "RIL", "country": "US"},
-            {"city": "Riga", "airport": "Riga International Airport", "iata": "RIX", "country": "LV"},
-            {"city": "Rigolet", "airport": "Rigolet Airport", "iata": "YRG", "country": "CA"},
-            {"city": "Rijen", "airport": "Gilze Rijen Air Base", "iata": "GLZ", "country": "NL"},
-            {"city": "Rimatara Island", "airport": "Rimatara Airport", "iata": "RMT", "country": "PF"},
-            {"city": "Rimini (RN)", "airport": "Federico Fellini International Airport", "iata": "RMI", "country": "IT"},
-            {"city": "Rimouski", "airport": "Rimouski Airport", "iata": "YXK", "country": "CA"},
-            {"city": "Rinas", "airport": "Tirana International Airport Mother Teresa", "iata": "TIA", "country": "AL"},
-            {"city": "Rincon de los Sauces", "airport": "Rincon De Los Sauces Airport", "iata": "RDS", "country": "AR"},
-            {"city": "Ringi Cove", "airport": "Ringi Cove Airport", "iata": "RIN", "country": "SB"},
-            {"city": "Rio Branco", "airport": "Rio Branco-Plácido de Castro International Airport", "iata": "RBR", "country": "BR"},
-            {"city": "Rio Cuarto", "airport": "Area De Material Airport", "iata": "RCU", "country": "AR"},
-            {"city": "Rio De Janeiro", "airport": "Rio Galeão – Tom Jobim International Airport", "iata": "GIG", "country": "BR"},
-            {"city": "Rio De Janeiro", "airport": "Jacarepaguá - Roberto Marinho Airport", "iata": "RRJ", "country": "BR"},
-            {"city": "Rio Dulce", "airport": "Las Vegas Airport", "iata": "LCF", "country": "GT"},
-            {"city": "Rio Frio / Progreso", "airport": "Rio Frio / Progreso Airport", "iata": "RFR", "country": "CR"},
-            {"city": "Rio Gallegos", "airport": "Piloto Civil N. Fernández Airport", "iata": "RGL", "country": "AR"},
-            {"city": "Rio Grande", "airport": "Gobernador Ramón Trejo Noel International Airport", "iata": "RGA", "country": "AR"},
-            {"city": "Rio Grande", "airport": "Rio Grande Regional Airport", "iata": "RIG", "country": "BR"},
-            {"city": "Rio Mayo", "airport": "Rio Mayo Airport", "iata": "ROY", "country": "AR"},
-            {"city": "Rio Turbio", "airport": "28 de Noviembre Airport", "iata": "RYO", "country": "AR"},
-            {"city": "Rio Verde", "airport": "General Leite de Castro Airport", "iata": "RVD", "country": "BR"},
-            {"city": "Rio de Janeiro", "airport": "Santos Dumont Airport", "iata": "SDU", "country": "BR"},
-            {"city": "Rio de Janeiro", "airport": "Santa Cruz Air Force Base", "iata": "SNZ", "country": "BR"},
-            {"city": "Riohacha", "airport": "Almirante Padilla Airport", "iata": "RCH", "country": "CO"},
-            {"city": "Rioja", "airport": "Juan Simons Vela Airport", "iata": "RIJ", "country": "PE"},
-            {"city": "Rishiri", "airport": "Rishiri Airport", "iata": "RIS", "country": "JP"},
-            {"city": "River Cess", "airport": "River Cess Airport and Heliport", "iata": "RVC", "country": "LR"},
-            {"city": "Rivera", "airport": "Presidente General Don Oscar D. Gestido International Airport", "iata": "RVY", "country": "UY"},
-            {"city": "Rivers Inlet", "airport": "Rivers Inlet Seaplane Base", "iata": "YRN", "country": "CA"},
-            {"city": "Riverside", "airport": "Riverside Municipal Airport", "iata": "RAL", "country": "US"},
-            {"city": "Riverside", "airport": "Flabob Airport", "iata": "RIR", "country": "US"},
-            {"city": "Riverside", "airport": "March Air Reserve Base", "iata": "RIV", "country": "US"},
-            {"city": "Riverton", "airport": "Central Wyoming Regional Airport", "iata": "RIW", "country": "US"},
-            {"city": "Rivière-du-Loup", "airport": "Rivière-du-Loup Airport", "iata": "YRI", "country": "CA"},
-            {"city": "Rivne", "airport": "Rivne International Airport", "iata": "RWN", "country": "UA"},
-            {"city": "Riyadh", "airport": "King Khaled International Airport", "iata": "RUH", "country": "SA"},
-            {"city": "Riyan", "airport": "Riyan Mukalla International Airport", "iata": "RIY", "country": "YE"},
-            {"city": "Rizal", "airport": "Tagbita Airstrip", "iata": "TGB", "country": "PH"},
-            {"city": "Rize", "airport": "Rize–Artvin Airport", "iata": "RZV", "country": "TR"},
-            {"city": "Rizhao (Donggang)", "airport": "Rizhao Shanzihe Airport", "iata": "RIZ", "country": "CN"},
-            {"city": "Roanoke", "airport": "Roanoke–Blacksburg Regional Airport", "iata": "ROA", "country": "US"},
-            {"city": "Robertson", "airport": "Robertson Airport", "iata": "ROD", "country": "ZA"},
-            {"city": "Roberval", "airport": "Roberval Airport", "iata": "YRJ", "country": "CA"},
-            {"city": "Robinvale", "airport": "Robinvale Airport", "iata": "RBC", "country": "AU"},
-            {"city": "Roboré", "airport": "Roboré Airport", "iata": "RBO", "country": "BO"},
-            {"city": "Roche Harbor", "airport": "Roche Harbor Airport", "iata": "RCE", "country": "US"},
-            {"city": "Rochefort/Saint-Agnant", "airport": "Rochefort-Saint-Agnant (BA 721) Airport", "iata": "RCO", "country": "FR"},
-            {"city": "Rochester", "airport": "Fulton County Airport", "iata": "RCR", "country": "US"},
-            {"city": "Rochester", "airport": "Frederick Douglass Greater Rochester International Airport", "iata": "ROC", "country": "US"},
-            {"city": "Rochester", "airport": "Rochester International Airport", "iata": "RST", "country": "US"},
-            {"city": "Rochester, Kent", "airport": "Rochester Airport", "iata": "RCS", "country": "GB"},
-            {"city": "Rock Falls", "airport": "Whiteside County Airport - Joseph H Bittorf Field", "iata": "SQI", "country": "US"},
-            {"city": "Rock Hill", "airport": "Rock Hill - York County Airport", "iata": "RKH", "country": "US"},
-            {"city": "Rock Sound", "airport": "Rock Sound Airport", "iata": "RSD", "country": "BS"},
-            {"city": "Rock Springs", "airport": "Southwest Wyoming Regional Airport", "iata": "RKS", "country": "US"},
-            {"city": "Rockdale", "airport": "H H Coffield Regional Airport", "iata": "RCK", "country": "US"},
-            {"city": "Rockhampton", "airport": "Rockhampton Airport", "iata": "ROK", "country": "AU"},
-            {"city": "Rockhampton Downs", "airport": "Rockhampton Downs Airport", "iata": "RDA", "country": "AU"},
-            {"city": "Rockland", "airport": "Knox County Regional Airport", "iata": "RKD", "country": "US"},
-            {"city": "Rockport", "airport": "Aransas County Airport", "iata": "RKP", "country": "US"},
-            {"city": "Rockwood", "airport": "Rockwood Municipal Airport", "iata": "RKW", "country": "US"},
-            {"city": "Rocky Mount", "airport": "Rocky Mount Wilson Regional Airport", "iata": "RWI", "country": "US"},
-            {"city": "Rocky Mountain House", "airport": "Rocky Mountain House Airport", "iata": "YRM", "country": "CA"},
-            {"city": "Rodez/Marcillac", "airport": "Rodez–Aveyron Airport", "iata": "RDZ", "country": "FR"},
-            {"city": "Rodriguez de Mendoza", "airport": "San Nicolas Airport", "iata": "RIM", "country": "PE"},
-            {"city": "Roebourne", "airport": "Roebourne Airport", "iata": "RBU", "country": "AU"},
-            {"city": "Rogers", "airport": "Rogers Municipal Airport-Carter Field", "iata": "ROG", "country": "US"},
-            {"city": "Rogojampi, Banyuwangi", "airport": "Banyuwangi Airport", "iata": "BWX", "country": "ID"},
-            {"city": "Roi Et", "airport": "Roi Et Airport", "iata": "ROI", "country": "TH"},
-            {"city": "Rokeby", "airport": "Rokeby Airport", "iata": "RKY", "country": "AU"},
-            {"city": "Rolla", "airport": "Rolla Downtown Airport", "iata": "RLA", "country": "US"},
-            {"city": "Rolling Fork", "airport": "Rollang Field", "iata": "RFK", "country": "US"},
-            {"city": "Rolpa", "airport": "Rolpa Airport", "iata": "RPA", "country": "NP"},
-            {"city": "Roma", "airport": "Roma Airport", "iata": "RMA", "country": "AU"},
-            {"city": "Rome", "airport": "Rome State Airport", "iata": "REO", "country": "US"},
-            {"city": "Rome", "airport": "Griffiss International Airport", "iata": "RME", "country": "US"},
-            {"city": "Rome", "airport": "Richard B Russell Airport", "iata": "RMG", "country": "US"},
-            {"city": "Rome", "airport": "Ciampino–G. B. Pastine International Airport", "iata": "CIA", "country": "IT"},
-            {"city": "Rome", "airport": "Rome–Fiumicino Leonardo da Vinci International Airport", "iata": "FCO", "country": "IT"},
-            {"city": "Romney Marsh, Kent", "airport": "Lydd London Ashford Airport", "iata": "LYX", "country": "GB"},
-            {"city": "Ronchi dei Legionari (GO)", "airport": "Trieste–Friuli Venezia Giulia Airport", "iata": "TRS", "country": "IT"},
-            {"city": "Rondonópolis", "airport": "Maestro Marinho Franco Airport", "iata": "ROO", "country": "BR"},
-            {"city": "Rongelap Island", "airport": "Rongelap Island Airport", "iata": "RNP", "country": "MH"},
-            {"city": "Ronneby", "airport": "Ronneby Airport", "iata": "RNB", "country": "SE"},
-            {"city": "Rooikop", "airport": "Walvis Bay Airport", "iata": "WVB", "country": "NA"},
-            {"city": "Roosevelt", "airport": "Roosevelt Municipal Airport", "iata": "ROL", "country": "US"},
-            {"city": "Roper Bar", "airport": "Roper Bar Airport", "iata": "RPB", "country": "AU"},
-            {"city": "Roper Valley", "airport": "Roper Valley Airport", "iata": "RPV", "country": "AU"},
-            {"city": "Rosario", "airport": "Rosario Islas Malvinas International Airport", "iata": "ROS", "country": "AR"},
-            {"city": "Rosario", "airport": "Rosario Seaplane Base", "iata": "RSJ", "country": "US"},
-            {"city": "Roseau", "airport": "Roseau Municipal Rudy Billberg Field", "iata": "ROX", "country": "US"},
-            {"city": "Roseburg", "airport": "Roseburg Regional Airport", "iata": "RBG", "country": "US"},
-            {"city": "Rosella Plains", "airport": "Rosella Plains Airport", "iata": "RLP", "country": "AU"},
-            {"city": "Rosh Pina", "airport": "Rosh Pina Airport", "iata": "RPN", "country": "IL"},
-            {"city": "Rosh Pinah", "airport": "Skorpion Mine Airport", "iata": "RHN", "country": "NA"},
-            {"city": "Roskilde", "airport": "Copenhagen Roskilde Airport", "iata": "RKE", "country": "DK"},
-            {"city": "Ross River", "airport": "Ross River Airport", "iata": "XRR", "country": "CA"},
-            {"city": "Rostov-on-Don", "airport": "Platov International Airport", "iata": "ROV", "country": "RU"},
-            {"city": "Roswell", "airport": "Roswell Air Center Airport", "iata": "ROW", "country": "US"},
-            {"city": "Rota", "airport": "Rota Naval Station Airport", "iata": "ROZ", "country": "ES"},
-            {"city": "Rota Island", "airport": "Rota International Airport", "iata": "ROP", "country": "MP"},
-            {"city": "Rotorua", "airport": "Rotorua Regional Airport", "iata": "ROT", "country": "NZ"},
-            {"city": "Rotterdam", "airport": "Rotterdam The Hague Airport", "iata": "RTM", "country": "NL"},
-            {"city": "Rotuma", "airport": "Rotuma Airport", "iata": "RTA", "country": "FJ"},
-            {"city": "Round Lake", "airport": "Round Lake (Weagamow Lake) Airport", "iata": "ZRJ", "country": "CA"},
-            {"city": "Roundup", "airport": "Roundup Airport", "iata": "RPX", "country": "US"},
-            {"city": "Rourkela", "airport": "Rourkela Airport", "iata": "RRK", "country": "IN"},
-            {"city": "Rouses Point", "airport": "Rouses Point Seaplane Base", "iata": "RSX", "country": "US"},
-            {"city": "Rouyn-Noranda", "airport": "Rouyn Noranda Airport", "iata": "YUY", "country": "CA"},
-            {"city": "Rovaniemi", "airport": "Rovaniemi Airport", "iata": "RVN", "country": "FI"},
-            {"city": "Roxas City", "airport": "Roxas Airport", "iata": "RXS", "country": "PH"},
-            {"city": "Royan/Médis", "airport": "Royan-Médis Airport", "iata": "RYN", "country": "FR"},
-            {"city": "Rubelsanto", "airport": "Rubelsanto Airport", "iata": "RUV", "country": "GT"},
-            {"city": "Ruby", "airport": "Ruby Airport", "iata": "RBY", "country": "US"},
-            {"city": "Rugao (Nantong)", "airport": "Rugao Air Base", "iata": "RUG", "country": "CN"},
-            {"city": "Ruhengeri", "airport": "Ruhengeri Airport", "iata": "RHG", "country": "RW"},
-            {"city": "Rukumkot", "airport": "Rukum Chaurjahari Airport", "iata": "RUK", "country": "NP"},
-            {"city": "Rumbek", "airport": "Rumbek Airport", "iata": "RBX", "country": "SS"},
-            {"city": "Rumjatar", "airport": "Rumjatar Airport", "iata": "RUM", "country": "NP"},
-            {"city": "Rundu", "airport": "Rundu Airport", "iata": "NDU", "country": "NA"},
-            {"city": "Ruoqiang Town", "airport": "Ruoqiang Loulan Airport", "iata": "RQA", "country": "CN"},
-            {"city": "Ruperto Polania", "airport": "El Recreo Airport", "iata": "ELJ", "country": "CO"},
-            {"city": "Rupsi", "airport": "Rupsi Airport", "iata": "RUP", "country": "IN"},
-            {"city": "Rurrenabaque", "airport": "Rurrenabaque Airport", "iata": "RBQ", "country": "BO"},
-            {"city": "Russell", "airport": "Russell Municipal Airport", "iata": "RSL", "country": "US"},
-            {"city": "Russian Mission", "airport": "Russian Mission Airport", "iata": "RSH", "country": "US"},
-            {"city": "Ruston", "airport": "Ruston Regional Airport", "iata": "RSN", "country": "US"},
-            {"city": "Rutland", "airport": "Rutland - Southern Vermont Regional Airport", "iata": "RUT", "country": "US"},
-            {"city": "Rybinsk", "airport": "Staroselye Airport", "iata": "RYB", "country": "RU"},
-            {"city": "Råda", "airport": "Hagfors Airport", "iata": "HFS", "country": "SE"},
-            {"city": "Régina", "airport": "Régina Airport", "iata": "REI", "country": "GF"},
-            {"city": "Río Hato", "airport": "Scarlett Martinez International Airport", "iata": "RIH", "country": "PA"},
-            {"city": "Rødby", "airport": "Lolland Falster Maribo Airport", "iata": "MRW", "country": "DK"},
-            {"city": "Rønne", "airport": "Bornholm Airport", "iata": "RNN", "country": "DK"},
-            {"city": "Røros", "airport": "Røros Airport", "iata": "RRS", "country": "NO"},
-            {"city": "Rørvik", "airport": "Rørvik Airport, Ryum", "iata": "RVK", "country": "NO"},
-            {"city": "Røst", "airport": "Røst Airport", "iata": "RET", "country": "NO"},
-            {"city": "Sa'dah", "airport": "Sadah Airport", "iata": "SYE", "country": "YE"},
-            {"city": "Saarbrücken", "airport": "Saarbrücken Airport", "iata": "SCN", "country": "DE"},
-            {"city": "Saarloq", "airport": "Saarloq Heliport", "iata": "QOQ", "country": "GL"},
-            {"city": "Saattut", "airport": "Saattut Heliport", "iata": "SAE", "country": "GL"},
-            {"city": "Sabah", "airport": "Sabah Airport", "iata": "SBV", "country": "PG"},
-            {"city": "Sabana de Torres", "airport": "Las Cruces Airport", "iata": "SNT", "country": "CO"},
-            {"city": "Sabang", "airport": "Maimun Saleh Airport", "iata": "SBG", "country": "ID"},
-            {"city": "Sabetta", "airport": "Sabetta International Airport", "iata": "SBT", "country": "RU"},
-            {"city": "Sabha", "airport": "Sabha Airport", "iata": "SEB", "country": "LY"},
-            {"city": "Sable Island", "airport": "Sable Island Landing Strip", "iata": "YSA", "country": "CA"},
-            {"city": "Sabu-Sawu Island", "airport": "Sabu-Tardanu Airport", "iata": "SAU", "country": "ID"},
-            {"city": "Sabzevar", "airport": "Sabzevar National Airport", "iata": "AFZ", "country": "IR"},
-            {"city": "Sacheon", "airport": "Sacheon Airport / Sacheon Air Base", "iata": "HIN", "country": "KR"},
-            {"city": "Sachigo Lake", "airport": "Sachigo Lake Airport", "iata": "ZPB", "country": "CA"},
-            {"city": "Sachs Harbour", "airport": "Sachs Harbour (David Nasogaluak Jr. Saaryuaq) Airport", "iata": "YSY", "country": "CA"},
-            {"city": "Sacramento", "airport": "McClellan Airfield", "iata": "MCC", "country": "US"},
-            {"city": "Sacramento", "airport": "Sacramento Mather Airport", "iata": "MHR", "country": "US"},
-            {"city": "Sacramento", "airport": "Sacramento Executive Airport", "iata": "SAC", "country": "US"},
-            {"city": "Sacramento", "airport": "Sacramento International Airport", "iata": "SMF", "country": "US"},
-            {"city": "Sado", "airport": "Sado Airport", "iata": "SDS", "country": "JP"},
-            {"city": "Safford", "airport": "Safford Regional Airport", "iata": "SAD", "country": "US"},
-            {"city": "Safia", "airport": "Safia Airport", "iata": "SFU", "country": "PG"},
-            {"city": "Saga", "airport": "Saga Airport", "iata": "HSG", "country": "JP"},
-            {"city": "Saginaw Bay", "airport": "Saginaw Seaplane Base", "iata": "SGW", "country": "US"},
-            {"city": "Saglek", "airport": "Saglek Airport", "iata": "YSV", "country": "CA"},
-            {"city": "Sahabat", "airport": "Sahabat [Sahabat 16] Airport", "iata": "SXS", "country": "MY"},
-            {"city": "Saibai Island", "airport": "Saibai Island Airport", "iata": "SBR", "country": "AU"},
-            {"city": "Saidor", "airport": "Saidor Airport", "iata": "SDI", "country": "PG"},
-            {"city": "Saidpur", "airport": "Saidpur Airport", "iata": "SPD", "country": "BD"},
-            {"city": "Saidu Sharif", "airport": "Saidu Sharif Airport", "iata": "SDT", "country": "PK"},
-            {"city": "Saint Anne", "airport": "Alderney Airport", "iata": "ACI", "country": "GG"},
-            {"city": "Saint Catherine", "airport": "Saint Catherine International Airport", "iata": "SKV", "country": "EG"},
-            {"city": "Saint Cloud", "airport": "Saint Cloud Regional Airport", "iata": "STC", "country": "US"},
-            {"city": "Saint George's", "airport": "Maurice Bishop International Airport", "iata": "GND", "country": "GD"},
-            {"city": "Saint John", "airport": "Saint John Airport", "iata": "YSJ", "country": "CA"},
-            {"city": "Saint Louis", "airport": "Saint Louis Airport", "iata": "XLS", "country": "SN"},
-            {"city": "Saint Martin", "airport": "Marigot Seaplane Base", "iata": "MSB", "country": "MF"},
-            {"city": "Saint Paul", "airport": "Saint Paul Downtown Holman Field", "iata": "STP", "country": "US"},
-            {"city": "Saint Peter Port", "airport": "Guernsey Airport", "iata": "GCI", "country": "GG"},
-            {"city": "Saint-Aubin-sur-Scie", "airport": "Dieppe-Saint-Aubin Airport", "iata": "DPE", "country": "FR"},
-            {"city": "Saint-Bon", "airport": "Courchevel Altiport", "iata": "CVF", "country": "FR"},
-            {"city": "Saint-Christophe (AO)", "airport": "Aosta Corrado Gex Airport", "iata": "AOT", "country": "IT"},
-            {"city": "Saint-Crépin, Hautes-Alpes", "airport": "Mont-Dauphin Saint-Crépin Airfield", "iata": "SCP", "country": "FR"},
-            {"city": "Saint-Denis-de-l'Hôtel, Loiret", "airport": "Orléans–Saint-Denis-de-l'Hôtel Airport", "iata": "ORE", "country": "FR"},
-            {"city": "Saint-Georges-de-l'Oyapock", "airport": "Saint-Georges-de-l'Oyapock Airport", "iata": "OYP", "country": "GF"},
-            {"city": "Saint-Jacques-de-la-Lande, Ille-et-Vilaine", "airport": "Rennes-Saint-Jacques Airport", "iata": "RNS", "country": "FR"},
-            {"city": "Saint-Laurent-du-Maroni", "airport": "Saint-Laurent-du-Maroni Airport", "iata": "LDX", "country": "GF"},
-            {"city": "Saint-Léger-sur-Roanne", "airport": "Roanne-Renaison Airport", "iata": "RNE", "country": "FR"},
-            {"city": "Saint-Léonard", "airport": "Saint-Léonard Airport", "iata": "YSL", "country": "CA"},
-            {"city": "Saint-Nazaire/Montoir", "airport": "Saint-Nazaire-Montoir Airport", "iata": "SNR", "country": "FR"},
-            {"city": "Saint-Pierre", "airport": "Pierrefonds Airport", "iata": "ZSE", "country": "RE"},
-            {"city": "Saint-Pierre", "airport": "St Pierre Airport", "iata": "FSP", "country": "PM"},
-            {"city": "Saint-Pons, Alpes-de-Haute-Provence", "airport": "Barcelonnette - Saint-Pons Airfield", "iata": "BAE", "country": "FR"},
-            {"city": "Saint-Tropez", "airport": "La Môle Airport", "iata": "LTT", "country": "FR"},
-            {"city": "Sainte-Marie", "airport": "Roland Garros Airport", "iata": "RUN", "country": "RE"},
-            {"city": "Sainyabuli", "airport": "Sayaboury Airport", "iata": "ZBY", "country": "LA"},
-            {"city": "Salalah", "airport": "Salalah Airport", "iata": "SLL", "country": "OM"},
-            {"city": "Salamanca", "airport": "Salamanca Airport", "iata": "SLM", "country": "ES"},
-            {"city": "Salamo", "airport": "Salamo Airport", "iata": "SAM", "country": "PG"},
-            {"city": "Salavan", "airport": "Salavan Airport", "iata": "VNA", "country": "LA"},
-            {"city": "Sale", "airport": "West Sale Airport", "iata": "SXE", "country": "AU"},
-            {"city": "Salekhard", "airport": "Salekhard Airport", "iata": "SLY", "country": "RU"},
-            {"city": "Salem", "airport": "Salem-Willamette Valley Airport/McNary Field", "iata": "SLE", "country": "US"},
-            {"city": "Salem", "airport": "Salem–Leckrone Airport", "iata": "SLO", "country": "US"},
-            {"city": "Salem", "airport": "Salem Airport", "iata": "SXV", "country": "IN"},
-            {"city": "Salerno", "airport": "Salerno Costa d'Amalfi Airport", "iata": "QSR", "country": "IT"},
-            {"city": "Salida", "airport": "Salida Airport - Harriet Alexander Field", "iata": "SLT", "country": "US"},
-            {"city": "Salima", "airport": "Salima Airport", "iata": "LMB", "country": "MW"},
-            {"city": "Salina", "airport": "Salina Gunnison Airport", "iata": "SBO", "country": "US"},
-            {"city": "Salina", "airport": "Salina Municipal Airport", "iata": "SLN", "country": "US"},
-            {"city": "Salina Cruz", "airport": "Estación Aeronaval de Salina Cruz", "iata": "SCX", "country": "MX"},
-            {"city": "Salinas", "airport": "Salinas Municipal Airport", "iata": "SNS", "country": "US"},
-            {"city": "Salinas", "airport": "General Ulpiano Paez Airport", "iata": "SNC", "country": "EC"},
-            {"city": "Salinópolis", "airport": "Salinópolis Airport", "iata": "OPP", "country": "BR"},
-            {"city": "Salisbury", "airport": "Mid-Carolina Regional Airport", "iata": "SRW", "country": "US"},
-            {"city": "Salisbury", "airport": "Salisbury Ocean City Wicomico Regional Airport", "iata": "SBY", "country": "US"},
-            {"city": "Salluit", "airport": "Salluit Airport", "iata": "YZG", "country": "CA"},
-            {"city": "Salmon", "airport": "Lemhi County Airport", "iata": "SMN", "country": "US"},
-            {"city": "Salmon Arm", "airport": "Shuswap Regional Airport", "iata": "YSN", "country": "CA"},
-            {"city": "Salt Cay", "airport": "Salt Cay Airport", "iata": "SLX", "country": "TC"},
-            {"city": "Salt Lake City", "airport": "Salt Lake City International Airport", "iata": "SLC", "country": "US"},
-            {"city": "Salt Spring Island", "airport": "Ganges Seaplane Base", "iata": "YGG", "country": "CA"},
-            {"city": "Salta", "airport": "Martin Miguel De Guemes International Airport", "iata": "SLA", "country": "AR"},
-            {"city": "Saltillo", "airport": "Plan De Guadalupe International Airport", "iata": "SLW", "country": "MX"},
-            {"city": "Salto", "airport": "Nueva Hesperides International Airport", "iata": "STY", "country": "UY"},
-            {"city": "Salton City", "airport": "Salton Sea Airport", "iata": "SAS", "country": "US"},
-            {"city": "Salvador", "airport": "Deputado Luiz Eduardo Magalhães International Airport", "iata": "SSA", "country": "BR"},
-            {"city": "Salzburg", "airport": "Salzburg Airport", "iata": "SZG", "country": "AT"},
-            {"city": "Samana", "airport": "Samaná El Catey International Airport", "iata": "AZS", "country": "DO"},
-            {"city": "Samara", "airport": "Kurumoch International Airport", "iata": "KUF", "country": "RU"},
-            {"city": "Samarai Island", "airport": "China Strait Airstrip", "iata": "SQT", "country": "PG"},
-            {"city": "Samarinda", "airport": "Aji Pangeran Tumenggung Pranoto International Airport", "iata": "AAP", "country": "ID"},
-            {"city": "Samarkand", "airport": "Samarkand Airport", "iata": "SKD", "country": "UZ"},
-            {"city": "Sambava", "airport": "Sambava Airport", "iata": "SVB", "country": "MG"},
-            {"city": "Samburu", "airport": "Samburu Airport", "iata": "UAS", "country": "KE"},
-            {"city": "Samedan", "airport": "Samedan Airport", "iata": "SMV", "country": "CH"},
-            {"city": "Samjiyŏn", "airport": "Samjiyŏn Airport", "iata": "YJS", "country": "KP"},
-            {"city": "Samos Island", "airport": "Samos Airport", "iata": "SMI", "country": "GR"},
-            {"city": "Sampit", "airport": "Sampit (Hasan) Airport", "iata": "SMQ", "country": "ID"},
-            {"city": "Samsun", "airport": "Samsun-Çarşamba Airport", "iata": "SZF", "country": "TR"},
-            {"city": "San Andrés", "airport": "Gustavo Rojas Pinilla International Airport", "iata": "ADZ", "country": "CO"},
-            {"city": "San Angelo", "airport": "San Angelo Regional Mathis Field", "iata": "SJT", "country": "US"},
-            {"city": "San Antonio", "airport": "Martindale Army Heliport", "iata": "MDA", "country": "US"},
-            {"city": "San Antonio", "airport": "San Antonio International Airport", "iata": "SAT", "country": "US"},
-            {"city": "San Antonio", "airport": "Lackland Air Force Base", "iata": "SKF", "country": "US"},
-            {"city": "San Antonio", "airport": "Stinson Municipal Airport", "iata": "SSF", "country": "US"},
-            {"city": "San Antonio Oeste", "airport": "Antoine de Saint Exupéry Airport", "iata": "OES", "country": "AR"},
-            {"city": "San Antonio de Palé", "airport": "Annobón Airport", "iata": "NBN", "country": "GQ"},
-            {"city": "San Bartolomé", "airport": "César Manrique-Lanzarote Airport", "iata": "ACE", "country": "ES"},
-            {"city": "San Benito", "airport": "Mundo Maya International Airport", "iata": "FRS", "country": "GT"},
-            {"city": "San Bernardino", "airport": "San Bernardino International Airport", "iata": "SBD", "country": "US"},
-            {"city": "San Blas", "airport": "Wannukandi Airport", "iata": "NBL", "country": "PA"},
-            {"city": "San Borja", "airport": "Capitán Av. German Quiroga G. Airport", "iata": "SRJ", "country": "BO"},
-            {"city": "San Carlos", "airport": "San Carlos Airport", "iata": "SQL", "country": "US"},
-            {"city": "San Carlos", "airport": "San Carlos Airport", "iata": "NCR", "country": "NI"},
-            {"city": "San Carlos de Bariloche", "airport": "San Carlos de Bariloche Airport", "iata": "BRC", "country": "AR"},
-            {"city": "San Carlos del Zulia", "airport": "Miguel Urdaneta Fernández Airport", "iata": "STB", "country": "VE"},
-            {"city": "San Cristóbal", "airport": "Paramillo Airport", "iata": "SCI", "country": "VE"},
-            {"city": "San Diego", "airport": "Montgomery-Gibbs Executive Airport", "iata": "MYF", "country": "US"},
-            {"city": "San Diego", "airport": "Miramar Marine Corps Air Station - Mitscher Field", "iata": "NKX", "country": "US"},
-            {"city": "San Diego", "airport": "North Island Naval Air Station-Halsey Field", "iata": "NZY", "country": "US"},
-            {"city": "San Diego", "airport": "San Diego International Airport", "iata": "SAN", "country": "US"},
-            {"city": "San Diego", "airport": "Brown Field Municipal Airport", "iata": "SDM", "country": "US"},
-            {"city": "San Diego/El Cajon", "airport": "Gillespie Field", "iata": "SEE", "country": "US"},
-            {"city": "San Felipe", "airport": "Víctor Lafón Airport", "iata": "SSD", "country": "CL"},
-            {"city": "San Felipe", "airport": "Sub Teniente Nestor Arias Airport", "iata": "SNF", "country": "VE"},
-            {"city": "San Fernando", "airport": "San Fernando Airport", "iata": "SFE", "country": "PH"},
-            {"city": "San Fernando de Apure", "airport": "San Fernando de Apure Las Flecheras National Airport", "iata": "SFD", "country": "VE"},
-            {"city": "San Francisco", "airport": "San Francisco International Airport", "iata": "SFO", "country": "US"},
-            {"city": "San Ignacio de Moxos", "airport": "San Ignacio de Moxos Airport", "iata": "SNM", "country": "BO"},
-            {"city": "San Ignacio de Velasco", "airport": "Capitán Av. Juan Cochamanidis S. Airport", "iata": "SNG", "country": "BO"},
-            {"city": "San Javier", "airport": "San Javier Airport", "iata": "SJV", "country": "BO"},
-            {"city": "San Joaquín", "airport": "San Joaquín Airport", "iata": "SJB", "country": "BO"},
-            {"city": "San Jose", "airport": "Reid-Hillview Airport of Santa Clara County", "iata": "RHV", "country": "US"},
-            {"city": "San Jose", "airport": "Norman Y. Mineta San Jose International Airport", "iata": "SJC", "country": "US"},
-            {"city": "San Jose", "airport": "Tobías Bolaños International Airport", "iata": "SYQ", "country": "CR"},
-            {"city": "San Jose", "airport": "San Jose Airport", "iata": "SJI", "country": "PH"},
-            {"city": "San Jose", "airport": "Evelio Javier Airport", "iata": "EUQ", "country": "PH"},
-            {"city": "San José (Alajuela)", "airport": "Juan Santamaría International Airport", "iata": "SJO", "country": "CR"},
-            {"city": "San José Del Guaviare", "airport": "Jorge E. Gonzalez Torres Airport", "iata": "SJE", "country": "CO"},
-            {"city": "San José de Chiquitos", "airport": "San José De Chiquitos Airport", "iata": "SJS", "country": "BO"},
-            {"city": "San José del Cabo", "airport": "Los Cabos International Airport", "iata": "SJD", "country": "MX"},
-            {"city": "San Juan", "airport": "Domingo Faustino Sarmiento Airport", "iata": "UAQ", "country": "AR"},
-            {"city": "San Juan", "airport": "Fernando Luis Ribas Dominicci Airport", "iata": "SIG", "country": "PR"},
-            {"city": "San Juan", "airport": "Luis Munoz Marin International Airport", "iata": "SJU", "country": "PR"},
-            {"city": "San Juan", "airport": "San Juan /Uganik/ Seaplane Base", "iata": "UGI", "country": "US"},
-            {"city": "San Juan De Uraba", "airport": "San Juan De Uraba Airport", "iata": "SJR", "country": "CO"},
-            {"city": "San Juan Del César", "airport": "San Juan Del César Airport", "iata": "SJH", "country": "CO"},
-            {"city": "San Juan de Marcona", "airport": "San Juan de Marcona Airport", "iata": "SJA", "country": "PE"},
-            {"city": "San Julian", "airport": "Capitan D Daniel Vazquez Airport", "iata": "ULA", "country": "AR"},
-            {"city": "San Luis", "airport": "Brigadier Mayor D Cesar Raul Ojeda Airport", "iata": "LUQ", "country": "AR"},
-            {"city": "San Luis De Palenque", "airport": "San Luis De Palenque Airport", "iata": "SQE", "country": "CO"},
-            {"city": "San Luis Obispo", "airport": "San Luis County Regional Airport", "iata": "SBP", "country": "US"},
-            {"city": "San Luis Potosí", "airport": "Ponciano Arriaga International Airport", "iata": "SLP", "country": "MX"},
-            {"city": "San Luis Río Colorado", "airport": "San Luis Río Colorado Airport", "iata": "UAC", "country": "MX"},
-            {"city": "San Marcos", "airport": "San Marcos Airport", "iata": "SRS", "country": "CO"},
-            {"city": "San Matías", "airport": "San Matías Airport", "iata": "MQK", "country": "BO"},
-            {"city": "San Miguel de Tucumán", "airport": "Teniente Benjamin Matienzo Airport", "iata": "TUC", "country": "AR"},
-            {"city": "San Pedro", "airport": "Catalina Air-Sea Terminal Heliport", "iata": "SPQ", "country": "US"},
-            {"city": "San Pedro", "airport": "John Greif II Airport", "iata": "SPR", "country": "BZ"},
-            {"city": "San Pedro Sula", "airport": "Ramón Villeda Morales International Airport", "iata": "SAP", "country": "HN"},
-            {"city": "San Pedro de Urabá", "airport": "San Pedro Airport", "iata": "NPU", "country": "CO"},
-            {"city": "San Quintín", "airport": "Guerrero Negro Airport", "iata": "GUB", "country": "MX"},
-            {"city": "San Quintín", "airport": "San Quintín Military Airstrip", "iata": "SNQ", "country": "MX"},
-            {"city": "San Rafael", "airport": "Suboficial Ay Santiago Germano Airport", "iata": "AFA", "country": "AR"},
-            {"city": "San Ramón / Mamoré", "airport": "San Ramón Airport", "iata": "SRD", "country": "BO"},
-            {"city": "San Salvador", "airport": "Ilopango International Airport", "iata": "ILS", "country": "SV"},
-            {"city": "San Salvador", "airport": "San Salvador Airport", "iata": "ZSA", "country": "BS"},
-            {"city": "San Salvador (San Luis Talpa)", "airport": "Monseñor Óscar Arnulfo Romero International Airport", "iata": "SAL", "country": "SV"},
-            {"city": "San Salvador de Jujuy", "airport": "Gobernador Horacio Guzman International Airport", "iata": "JUJ", "country": "AR"},
-            {"city": "San Salvador de Paul", "airport": "San Salvador de Paul Airport", "iata": "SVV", "country": "VE"},
-            {"city": "San Vicente", "airport": "San Vicente Airport", "iata": "SWL", "country": "PH"},
-            {"city": "San Vicente Del Caguán", "airport": "Eduardo Falla Solano Airport", "iata": "SVI", "country": "CO"},
-            {"city": "San Vicente Del Caguán", "airport": "Yaguara Airport", "iata": "AYG", "country": "CO"},
-            {"city": "Sanaa", "airport": "Sanaa International Airport", "iata": "SAH", "country": "YE"},
-            {"city": "Sanana", "airport": "Emalamo Sanana Airport", "iata": "SQN", "country": "ID"},
-            {"city": "Sancti Spiritus", "airport": "Sancti Spiritus Airport", "iata": "USS", "country": "CU"},
-            {"city": "Sand Creek", "airport": "Sand Creek Airport", "iata": "SDC", "country": "GY"},
-            {"city": "Sand Island", "airport": "Henderson Field", "iata": "MDY", "country": "UM"},
-            {"city": "Sand Point", "airport": "Sand Point Airport", "iata": "SDP", "country": "US"},
-            {"city": "Sandakan", "airport": "Sandakan Airport", "iata": "SDK", "country": "MY"},
-            {"city": "Sandane", "airport": "Sandane Airport, Anda", "iata": "SDN", "country": "NO"},
-            {"city": "Sanday", "airport": "Sanday Airport", "iata": "NDY", "country": "GB"},
-            {"city": "Sandino", "airport": "San Julián Air Base", "iata": "SNJ", "country": "CU"},
-            {"city": "Sandringham Station", "airport": "Sandringham Airport", "iata": "SRM", "country": "AU"},
-            {"city": "Sandspit", "airport": "Sandspit Airport", "iata": "YZP", "country": "CA"},
-            {"city": "Sandstone", "airport": "Sandstone Airport", "iata": "NDS", "country": "AU"},
-            {"city": "Sandy Lake", "airport": "Sandy Lake Airport", "iata": "ZSJ", "country": "CA"},
-            {"city": "Sanfebagar", "airport": "Sanfebagar Airport", "iata": "FEB", "country": "NP"},
-            {"city": "Sanford", "airport": "Sanford Seacoast Regional Airport", "iata": "SFM", "country": "US"},
-            {"city": "Sanggata/Sangkimah", "airport": "Sanggata/Sangkimah Airport", "iata": "SGQ", "country": "ID"},
-            {"city": "Sango", "airport": "Sultan Babullah Airport", "iata": "TTE", "country": "ID"},
-            {"city": "Sanikiluaq", "airport": "Sanikiluaq Airport", "iata": "YSK", "country": "CA"},
-            {"city": "Sanirajak", "airport": "Hall Beach Airport", "iata": "YUX", "country": "CA"},
-            {"city": "Sankt Anton am Arlberg", "airport": "Sankt Anton am Arlberg Heliport", "iata": "ANT", "country": "AT"},
-            {"city": "Sankt Peter-Ording", "airport": "Sankt Peter-Ording Airport", "iata": "PSH", "country": "DE"},
-            {"city": "Sanming (Sha)", "airport": "Sanming Shaxian Airport", "iata": "SQJ", "country": "CN"},
-            {"city": "Santa Ana", "airport": "John Wayne Orange County International Airport", "iata": "SNA", "country": "US"},
-            {"city": "Santa Ana Island", "airport": "Santa Ana Airport", "iata": "NNB", "country": "SB"},
-            {"city": "Santa Ana del Yacuma", "airport": "Santa Ana Del Yacuma Airport", "iata": "SBL", "country": "BO"},
-            {"city": "Santa Barbara", "airport": "Santa Barbara Municipal Airport", "iata": "SBA", "country": "US"},
-            {"city": "Santa Bárbara", "airport": "Santa Bárbara de Barinas Airport", "iata": "SBB", "country": "VE"},
-            {"city": "Santa Carolina", "airport": "Paradise Island Airport", "iata": "NTC", "country": "MZ"},
-            {"city": "Santa Catalina", "airport": "Santa Catalina Airport", "iata": "SCA", "country": "CO"},
-            {"city": "Santa Clara", "airport": "Abel Santamaria Airport", "iata": "SNU", "country": "CU"},
-            {"city": "Santa Cruz", "airport": "Santa Cruz Airport", "iata": "STU", "country": "BZ"},
-            {"city": "Santa Cruz", "airport": "El Trompillo Airport", "iata": "SRZ", "country": "BO"},
-            {"city": "Santa Cruz", "airport": "Viru Viru International Airport", "iata": "VVI", "country": "BO"},
-            {"city": "Santa Cruz Island", "airport": "Santa Cruz Island Airport", "iata": "SZN", "country": "US"},
-            {"city": "Santa Cruz da Graciosa", "airport": "Graciosa Airport", "iata": "GRW", "country": "PT"},
-            {"city": "Santa Cruz das Flores", "airport": "Flores Airport", "iata": "FLW", "country": "PT"},
-            {"city": "Santa Cruz de Mompóx", "airport": "San Bernardo Airport", "iata": "MMP", "country": "CO"},
-            {"city": "Santa Cruz del Quiché", "airport": "Quiché Airport", "iata": "AQB", "country": "GT"},
-            {"city": "Santa Cruz do Sul", "airport": "Santa Cruz do Sul Airport", "iata": "CSU", "country": "BR"},
-            {"city": "Santa Cruz/Graciosa Bay/Luova", "airport": "Santa Cruz/Graciosa Bay/Luova Airport", "iata": "SCZ", "country": "SB"},
-            {"city": "Santa Elena de Uairén", "airport": "Santa Elena de Uairen Airport", "iata": "SNV", "country": "VE"},
-            {"city": "Santa Fe", "airport": "Santa Fe Municipal Airport", "iata": "SAF", "country": "US"},
-            {"city": "Santa Fe", "airport": "Sauce Viejo Airport", "iata": "SFN", "country": "AR"},
-            {"city": "Santa Fé do Sul", "airport": "Santa Fé do Sul Airport", "iata": "SFV", "country": "BR"},
-            {"city": "Santa Isabel Do Rio Negro", "airport": "Tapuruquara Airport", "iata": "IRZ", "country": "BR"},
-            {"city": "Santa Maria", "airport": "Santa Maria Public Airport Captain G Allan Hancock Field", "iata": "SMX", "country": "US"},
-            {"city": "Santa Maria", "airport": "Santa Maria Airport", "iata": "RIA", "country": "BR"},
-            {"city": "Santa Marta", "airport": "Kawama Airport", "iata": "VRO", "country": "CU"},
-            {"city": "Santa Marta", "airport": "Simón Bolívar International Airport", "iata": "SMR", "country": "CO"},
-            {"city": "Santa Monica", "airport": "Santa Monica Municipal Airport", "iata": "SMO", "country": "US"},
-            {"city": "Santa Paula", "airport": "Santa Paula Airport", "iata": "SZP", "country": "US"},
-            {"city": "Santa Rosa", "airport": "Charles M. Schulz Sonoma County Airport", "iata": "STS", "country": "US"},
-            {"city": "Santa Rosa", "airport": "Santa Rosa Airport", "iata": "RSA", "country": "AR"},
-            {"city": "Santa Rosa", "airport": "Santa Rosa - Artillery Colonel Victor Larrea International Airport", "iata": "ETR", "country": "EC"},
-            {"city": "Santa Rosa", "airport": "Santa Rosa De Yacuma Airport", "iata": "SRB", "country": "BO"},
-            {"city": "Santa Rosa", "airport": "Luis Alberto Lehr Airport", "iata": "SRA", "country": "BR"},
-            {"city": "Santa Rosalia", "airport": "Santa Rosalia Airport", "iata": "SSL", "country": "CO"},
-            {"city": "Santa Teresita", "airport": "Santa Teresita Airport", "iata": "SST", "country": "AR"},
-            {"city": "Santa Terezinha", "airport": "Santa Terezinha Airport", "iata": "STZ", "country": "BR"},
-            {"city": "Santa Vitória do Palmar", "airport": "Santa Vitória do Palmar Airport", "iata": "CTQ", "country": "BR"},
-            {"city": "Santa Ynez", "airport": "Santa Ynez Airport", "iata": "SQA", "country": "US"},
-            {"city": "Santana Ramos", "airport": "Santana Ramos Airport", "iata": "SRO", "country": "CO"},
-            {"city": "Santana do Araguaia", "airport": "Santana do Araguaia Airport", "iata": "CMP", "country": "BR"},
-            {"city": "Santander", "airport": "Seve Ballesteros-Santander Airport", "iata": "SDR", "country": "ES"},
-            {"city": "Santarém", "airport": "Santarém - Maestro Wilson Fonseca International Airport", "iata": "STM", "country": "BR"},
-            {"city": "Santiago", "airport": "Cibao International Airport", "iata": "STI", "country": "DO"},
-            {"city": "Santiago", "airport": "Ruben Cantu Airport", "iata": "SYP", "country": "PA"},
-            {"city": "Santiago", "airport": "Antonio Maceo International Airport", "iata": "SCU", "country": "CU"},
-            {"city": "Santiago", "airport": "Comodoro Arturo Merino Benítez International Airport", "iata": "SCL", "country": "CL"},
-            {"city": "Santiago de Compostela", "airport": "Santiago-Rosalía de Castro Airport", "iata": "SCQ", "country": "ES"},
-            {"city": "Santiago de Méndez", "airport": "Méndez Airport", "iata": "MZD", "country": "EC"},
-            {"city": "Santiago de Tolú", "airport": "Golfo de Morrosquillo Airport", "iata": "TLU", "country": "CO"},
-            {"city": "Santiago del Estero", "airport": "Vicecomodoro Angel D. La Paz Aragonés Airport", "iata": "SDE", "country": "AR"},
-            {"city": "Santo Antônio do Içá", "airport": "Ipiranga Airport", "iata": "IPG", "country": "BR"},
-            {"city": "Santo Domingo", "airport": "Las Américas International Airport", "iata": "SDQ", "country": "DO"},
-            {"city": "Santo Domingo", "airport": "Mayor Buenaventura Vivas International Airport", "iata": "STD", "country": "VE"},
-            {"city": "Santo Ângelo", "airport": "Santo Ângelo Airport", "iata": "GEL", "country": "BR"},
-            {"city": "Santorini Island", "airport": "Santorini Airport", "iata": "JTR", "country": "GR"},
-            {"city": "Sanya (Tianya)", "airport": "Sanya Phoenix International Airport", "iata": "SYX", "country": "CN"},
-            {"city": "Sapezal", "airport": "Fazenda Tucunaré Airport", "iata": "AZL", "country": "BR"},
-            {"city": "Sapir", "airport": "Ein Yahav Airfield", "iata": "EIY", "country": "IL"},
-            {"city": "Sapmanga", "airport": "Sapmanga Airport", "iata": "SMH", "country": "PG"},
-            {"city": "Sapporo", "airport": "New Chitose Airport", "iata": "CTS", "country": "JP"},
-            {"city": "Sapporo", "airport": "Sapporo Okadama Airport", "iata": "OKD", "country": "JP"},
-            {"city": "Sarajevo", "airport": "Sarajevo International Airport", "iata": "SJJ", "country": "BA"},
-            {"city": "Sarakhs", "airport": "Sarakhs Airport", "iata": "CKT", "country": "IR"},
-            {"city": "Saranac Lake", "airport": "Adirondack Regional Airport", "iata": "SLK", "country": "US"},
-            {"city": "Saransk", "airport": "Saransk Airport", "iata": "SKX", "country": "RU"},
-            {"city": "Sarasota/Bradenton", "airport": "Sarasota Bradenton International Airport", "iata": "SRQ", "country": "US"},
-            {"city": "Saratoga", "airport": "Shively Field", "iata": "SAA", "country": "US"},
-            {"city": "Saratov", "airport": "Gagarin International Airport", "iata": "GSV", "country": "RU"},
-            {"city": "Saravena", "airport": "Los Colonizadores Airport", "iata": "RVE", "country": "CO"},
-            {"city": "Sardeh Band", "airport": "Sardeh Band Airport", "iata": "SBF", "country": "AF"},
-            {"city": "Sargodha", "airport": "Mushaf Air Base", "iata": "SGI", "country": "PK"},
-            {"city": "Sarh", "airport": "Sarh Airport", "iata": "SRH", "country": "TD"},
-            {"city": "Sari", "airport": "Sari Dasht-e Naz International Airport", "iata": "SRY", "country": "IR"},
-            {"city": "Sarmi", "airport": "Mararena Sarmi Airport", "iata": "ZRM", "country": "ID"},
-            {"city": "Sarmiento", "airport": "Lago Musters Airport", "iata": "OLN", "country": "AR"},
-            {"city": "Sarnia", "airport": "Chris Hadfield Airport", "iata": "YZR", "country": "CA"},
-            {"city": "Sartaneja", "airport": "Sartaneja Airport", "iata": "SJX", "country": "BZ"},
-            {"city": "Sarıçam", "airport": "İncirlik Air Base", "iata": "UAB", "country": "TR"},
-            {"city": "Sasereme", "airport": "Sasereme Airport", "iata": "TDS", "country": "PG"},
-            {"city": "Saskatoon", "airport": "Saskatoon John G. Diefenbaker International Airport", "iata": "YXE", "country": "CA"},
-            {"city": "Saskylakh", "airport": "Saskylakh Airport", "iata": "SYS", "country": "RU"},
-            {"city": "Sassandra", "airport": "Sassandra Airport", "iata": "ZSS", "country": "CI"},
-            {"city": "Sasstown", "airport": "Sasstown Airport", "iata": "SAZ", "country": "LR"},
-            {"city": "Satar Tacik, Manggarai", "airport": "Frans Sales Lega Airport", "iata": "RTG", "country": "ID"},
-            {"city": "Satu Mare", "airport": "Satu Mare International Airport", "iata": "SUJ", "country": "RO"},
-            {"city": "Saturna Island", "airport": "Lyall Harbour Seaplane Base", "iata": "YAJ", "country": "CA"},
-            {"city": "Satwag", "airport": "Satwag Airport", "iata": "SWG", "country": "PG"},
-            {"city": "Sault Ste Marie", "airport": "Sault Ste Marie Airport", "iata": "YAM", "country": "CA"},
-            {"city": "Saumlaki-Yamdena Island", "airport": "Mathilda Batlayeri Airport", "iata": "SXK", "country": "ID"},
-            {"city": "Sauren", "airport": "Sauren Airport", "iata": "SXW", "country": "PG"},
-            {"city": "Saurimo", "airport": "Catoca Airport", "iata": "CTV", "country": "AO"},
-            {"city": "Saurimo", "airport": "Saurimo Airport", "iata": "VHC", "country": "AO"},
-            {"city": "Sauðárkrókur", "airport": "Sauðárkrókur Airport", "iata": "SAK", "country": "IS"},
-            {"city": "Savannah", "airport": "Savannah Hilton Head International Airport", "iata": "SAV", "country": "US"},
-            {"city": "Savannah", "airport": "Hunter Army Air Field", "iata": "SVN", "country": "US"},
-            {"city": "Savissivik", "airport": "Savissivik Heliport", "iata": "SVR", "country": "GL"},
-            {"city": "Savonlinna", "airport": "Savonlinna Airport", "iata": "SVL", "country": "FI"},
-            {"city": "Savoonga", "airport": "Savoonga Airport", "iata": "SVA", "country": "US"},
-            {"city": "Savoy", "airport": "University of Illinois Willard Airport", "iata": "CMI", "country": "US"},
-            {"city": "Savusavu", "airport": "Savusavu Airport", "iata": "SVU", "country": "FJ"},
-            {"city": "Savuti", "airport": "Savuti Airport", "iata": "SVT", "country": "BW"},
-            {"city": "Savé", "airport": "Savé Airport", "iata": "SVF", "country": "BJ"},
-            {"city": "Sawan Gas Field", "airport": "Sawan Airport", "iata": "RZS", "country": "PK"},
-            {"city": "Sayada", "airport": "Mostaganem Airport", "iata": "MQV", "country": "DZ"},
-            {"city": "Saïss", "airport": "Fes Saïss International Airport", "iata": "FEZ", "country": "MA"},
-            {"city": "Saül", "airport": "Saül Airport", "iata": "XAU", "country": "GF"},
-            {"city": "Scammon Bay", "airport": "Scammon Bay Airport", "iata": "SCM", "country": "US"},
-            {"city": "Scarborough", "airport": "A.N.R. Robinson International Airport", "iata": "TAB", "country": "TT"},
-            {"city": "Schefferville", "airport": "Schefferville Airport", "iata": "YKL", "country": "CA"},
-            {"city": "Schenectady", "airport": "Schenectady County Airport", "iata": "SCH", "country": "US"},
-            {"city": "Schkeuditz", "airport": "Leipzig/Halle Airport", "iata": "LEJ", "country": "DE"},
-            {"city": "Scottsbluff", "airport": "Western Neb. Rgnl/William B. Heilig Airport", "iata": "BFF", "country": "US"},
-            {"city": "Scottsdale", "airport": "Scottsdale Airport", "iata": "SCF", "country": "US"},
-            {"city": "Scribner", "airport": "Scribner State Airport", "iata": "SCB", "country": "US"},
-            {"city": "Seal Bay", "airport": "Seal Bay Seaplane Base", "iata": "SYB", "country": "US"},
-            {"city": "Searcy", "airport": "Searcy Municipal Airport", "iata": "SRC", "country": "US"},
-            {"city": "Seattle", "airport": "Boeing Field King County International Airport", "iata": "BFI", "country": "US"},
-            {"city": "Seattle", "airport": "Seattle–Tacoma International Airport", "iata": "SEA", "country": "US"},
-            {"city": "Seattle", "airport": "Kenmore Air Harbor Seaplane Base", "iata": "LKE", "country": "US"},
-            {"city": "Sebba", "airport": "Sebba Airport", "iata": "XSE", "country": "BF"},
-            {"city": "Sebring", "airport": "Sebring Regional Airport", "iata": "SEF", "country": "US"},
-            {"city": "Sechelt", "airport": "Sechelt-Gibsons Airport", "iata": "YHS", "country": "CA"},
-            {"city": "Secunda", "airport": "Secunda Airport", "iata": "ZEC", "country": "ZA"},
-            {"city": "Sedalia", "airport": "Sedalia Memorial Airport", "iata": "DMO", "country": "US"},
-            {"city": "Sedona", "airport": "Sedona Airport", "iata": "SDX", "country": "US"},
-            {"city": "Sege", "airport": "Sege Airport", "iata": "EGM", "country": "SB"},
-            {"city": "Segrate (MI)", "airport": "Milano Linate Airport", "iata": "LIN", "country": "IT"},
-            {"city": "Sehonghong", "airport": "Sehonghong Airport", "iata": "SHK", "country": "LS"},
-            {"city": "Sehulea", "airport": "Sehulea Airport", "iata": "SXH", "country": "PG"},
-            {"city": "Sehwan Sharif", "airport": "Sehwan Sharif Airport", "iata": "SYW", "country": "PK"},
-            {"city": "Seinäjoki / Ilmajoki", "airport": "Seinäjoki Airport", "iata": "SJY", "country": "FI"},
-            {"city": "Seiyun", "airport": "Seiyun Hadhramaut International Airport", "iata": "GXF", "country": "YE"},
-            {"city": "Sekakes", "airport": "Sekakes Airport", "iata": "SKQ", "country": "LS"},
-            {"city": "Sekondi-Takoradi", "airport": "Takoradi Airport", "iata": "TKD", "country": "GH"},
-            {"city": "Selawik", "airport": "Selawik Airport", "iata": "WLK", "country": "US"},
-            {"city": "Selbang", "airport": "Selbang Airport", "iata": "SBC", "country": "PG"},
-            {"city": "Seldovia", "airport": "Seldovia Airport", "iata": "SOV", "country": "US"},
-            {"city": "Selebi Phikwe", "airport": "Selebi Phikwe Airport", "iata": "PKW", "country": "BW"},
-            {"city": "Seletar", "airport": "Seletar Airport", "iata": "XSP", "country": "SG"},
-            {"city": "Selinsgrove", "airport": "Penn Valley Airport", "iata": "SEG", "country": "US"},
-            {"city": "Selma", "airport": "Craig Field", "iata": "SEM", "country": "US"},
-            {"city": "Selçuk", "airport": "Selçuk Efes Airport", "iata": "IZM", "country": "TR"},
-            {"city": "Semarang", "airport": "Achmad Yani Airport", "iata": "SRG", "country": "ID"},
-            {"city": "Sematan", "airport": "Sematan Airport", "iata": "BSE", "country": "MY"},
-            {"city": "Semera", "airport": "Semera Airport", "iata": "SZE", "country": "ET"},
-            {"city": "Semey", "airport": "Semey Airport", "iata": "PLX", "country": "KZ"},
-            {"city": "Semnan", "airport": "Semnan Municipal Airport", "iata": "SNX", "country": "IR"},
-            {"city": "Semonkong", "airport": "Semonkong Airport", "iata": "SOK", "country": "LS"},
-            {"city": "Semporna", "airport": "Semporna Airport", "iata": "SMM", "country": "MY"},
-            {"city": "Sen Monorom", "airport": "Mondulkiri Airport", "iata": "MWV", "country": "KH"},
-            {"city": "Sena Madureira", "airport": "Sena Madureira Airport", "iata": "ZMD", "country": "BR"},
-            {"city": "Senanga", "airport": "Senanga Airport", "iata": "SXG", "country": "ZM"},
-            {"city": "Sengapi", "airport": "Sengapi Airstrip", "iata": "SGK", "country": "PG"},
-            {"city": "Senggeh", "airport": "Senggeh Airport", "iata": "SEH", "country": "ID"},
-            {"city": "Senggo-Papua Island", "airport": "Senggo Airport", "iata": "ZEG", "country": "ID"},
-            {"city": "Sentani", "airport": "Dortheys Hiyo Eluay International Airport", "iata": "DJJ", "country": "ID"},
-            {"city": "Seongnam", "airport": "Seoul Air Base (K-16)", "iata": "SSN", "country": "KR"},
-            {"city": "Seosan", "airport": "Seosan Air Base", "iata": "HMY", "country": "KR"},
-            {"city": "Seoul", "airport": "Incheon International Airport", "iata": "ICN", "country": "KR"},
-            {"city": "Seoul", "airport": "Gimpo International Airport", "iata": "GMP", "country": "KR"},
-            {"city": "Sepang", "airport": "Kuala Lumpur International Airport", "iata": "KUL", "country": "MY"},
-            {"city": "Sepik Plains", "airport": "Sepik Plains Airport", "iata": "SPV", "country": "PG"},
-            {"city": "Sept-Îles", "airport": "Sept-Îles Airport", "iata": "YZV", "country": "CA"},
-            {"city": "Sepulot", "airport": "Sepulot Airport", "iata": "SPE", "country": "MY"},
-            {"city": "Sequim", "airport": "Sequim Valley Airport", "iata": "SQV", "country": "US"},
-            {"city": "Serik", "airport": "Serik Bus Station Helipad", "iata": "XXX", "country": "TR"},
-            {"city": "Sermiligaaq", "airport": "Sermiligaaq Heliport", "iata": "SGG", "country": "GL"},
-            {"city": "Seronera", "airport": "Seronera Airport", "iata": "SEU", "country": "TZ"},
-            {"city": "Serra Talhada", "airport": "Santa Magalhães Airport", "iata": "SET", "country": "BR"},
-            {"city": "Serui", "airport": "Stevanus Rumbewas Airport", "iata": "ZRI", "country": "ID"},
-            {"city": "Seruyan", "airport": "Seruyan Kuala Pembuang Airport", "iata": "KLP", "country": "ID"},
-            {"city": "Sesheke", "airport": "Sesheke Airport", "iata": "SJQ", "country": "ZM"},
-            {"city": "Seshutes", "airport": "Seshutes Airport", "iata": "SHZ", "country": "LS"},
-            {"city": "Sesriem", "airport": "Sesriem Airport", "iata": "SZM", "country": "NA"},
-            {"city": "Sevastopol", "airport": "Sevastopol International Airport / Belbek Air Base", "iata": "UKS", "country": "UA"},
-            {"city": "Severo-Yeniseysk", "airport": "Severo-Yeniseysk Airport", "iata": "VEO", "country": "RU"},
-            {"city": "Sevierville", "airport": "Gatlinburg-Pigeon Forge Airport", "iata": "GKT", "country": "US"},
-            {"city": "Sevilla", "airport": "Sevilla Airport", "iata": "SVQ", "country": "ES"},
-            {"city": "Sewanee", "airport": "Franklin County Airport", "iata": "UOS", "country": "US"},
-            {"city": "Seward", "airport": "Seward Airport", "iata": "SWD", "country": "US"},
-            {"city": "Seyhan", "airport": "Adana Şakirpaşa Airport", "iata": "ADA", "country": "TR"},
-            {"city": "Seymour", "airport": "Freeman Municipal Airport", "iata": "SER", "country": "US"},
-            {"city": "Sečovlje", "airport": "Portorož Airport", "iata": "POW", "country": "SI"},
-            {"city": "Sfax", "airport": "Sfax Thyna International Airport", "iata": "SFA", "country": "TN"},
-            {"city": "Shache", "airport": "Shache Airport", "iata": "QSZ", "country": "CN"},
-            {"city": "Shafter", "airport": "Shafter Airport - Minter Field", "iata": "MIT", "country": "US"},
-            {"city": "Shageluk", "airport": "Shageluk Airport", "iata": "SHX", "country": "US"},
-            {"city": "Shahrekord", "airport": "Shahrekord Airport", "iata": "CQD", "country": "IR"},
-            {"city": "Shahrisabz", "airport": "Shahrisabz Southwest Airport", "iata": "RBZ", "country": "UZ"},
-            {"city": "Shahrud", "airport": "Shahrud International Airport", "iata": "RUD", "country": "IR"},
-            {"city": "Shakawe", "airport": "Shakawe Airport", "iata": "SWX", "country": "BW"},
-            {"city": "Shakhtyorsk", "airport": "Shakhtyorsk Airport", "iata": "EKS", "country": "RU"},
-            {"city": "Shakiso", "airport": "Shakiso Airport", "iata": "SKR", "country": "ET"},
-            {"city": "Shaktoolik", "airport": "Shaktoolik Airport", "iata": "SKK", "country": "US"},
-            {"city": "Shamattawa", "airport": "Shamattawa Airport", "iata": "ZTM", "country": "CA"},
-            {"city": "Shamshernagar", "airport": "Shamshernagar Airport", "iata": "ZHM", "country": "BD"},
-            {"city": "Shang-I", "airport": "Kinmen Airport", "iata": "KNH", "country": "TW"},
-            {"city": "Shanghai (Minhang)", "airport": "Shanghai Hongqiao International Airport", "iata": "SHA", "country": "CN"},
-            {"city": "Shanghai (Pudong)", "airport": "Shanghai Pudong International Airport", "iata": "PVG", "country": "CN"},
-            {"city": "Shangluo (Danfeng)", "airport": "Shangluo Airport", "iata": "DFA", "country": "CN"},
-            {"city": "Shangrao (Hengfeng)", "airport": "Shangrao Sanqingshan Airport", "iata": "SQD", "country": "CN"},
-            {"city": "Shannan", "airport": "Shannan Longzi Airport", "iata": "LGZ", "country": "CN"},
-            {"city": "Shannan (Gonggar)", "airport": "Lhasa Gonggar Airport", "iata": "LXA", "country": "CN"},
-            {"city": "Shannon", "airport": "Shannon Airport", "iata": "SNN", "country": "IE"},
-            {"city": "Shanshan", "airport": "Shanshan Airport", "iata": "SXJ", "country": "CN"},
-            {"city": "Shaoguan", "airport": "Shaoguan Danxia Airport", "iata": "HSC", "country": "CN"},
-            {"city": "Shaoyang (Wugang)", "airport": "Shaoyang Wugang Airport", "iata": "WGN", "country": "CN"},
-            {"city": "Sharana", "airport": "Sharana Airstrip", "iata": "OAS", "country": "AF"},
-            {"city": "Sharjah", "airport": "Sharjah International Airport", "iata": "SHJ", "country": "AE"},
-            {"city": "Sharm El Sheikh", "airport": "Sharm El Sheikh International Airport", "iata": "SSH", "country": "EG"},
-            {"city": "Sharma", "airport": "Neom Bay Airport", "iata": "NUM", "country": "SA"},
-            {"city": "Sharq El Owainat", "airport": "El Owainat East International Airport", "iata": "GSQ", "country": "EG"},
-            {"city": "Sharurah", "airport": "Sharurah Domestic Airport", "iata": "SHW", "country": "SA"},
-            {"city": "Shaw River", "airport": "Shaw River Airport", "iata": "SWB", "country": "AU"},
-            {"city": "Shawnee", "airport": "Shawnee Regional Airport", "iata": "SNL", "country": "US"},
-            {"city": "Shay Gap", "airport": "Shay Gap Airport", "iata": "SGP", "country": "AU"},
-            {"city": "Sheboygan", "airport": "Sheboygan County Memorial Airport", "iata": "SBM", "country": "US"},
-            {"city": "Sheep Mountain", "airport": "Sheep Mountain Airport", "iata": "SMU", "country": "US"},
-            {"city": "Sheguiandah", "airport": "Manitoulin East Municipal Airport", "iata": "YEM", "country": "CA"},
-            {"city": "Shelburne", "airport": "Heathlands Airport", "iata": "HAT", "country": "AU"},
-            {"city": "Shelby", "airport": "Shelby Airport", "iata": "SBX", "country": "US"},
-            {"city": "Shelbyville", "airport": "Bomar Field / Shelbyville Municipal Airport", "iata": "SYI", "country": "US"},
-            {"city": "Shell Mera", "airport": "Rio Amazonas Airport", "iata": "PTZ", "country": "EC"},
-            {"city": "Shelton", "airport": "Sanderson Field", "iata": "SHN", "country": "US"},
-            {"city": "Shemya", "airport": "Eareckson Air Station", "iata": "SYA", "country": "US"},
-            {"city": "Shennongjia (Hongping)", "airport": "Shennongjia Hongping Airport", "iata": "HPG", "country": "CN"},
-            {"city": "Shenzhen (Bao'an)", "airport": "Shenzhen Bao'an International Airport", "iata": "SZX", "country": "CN"},
-            {"city": "Sherbrooke", "airport": "Sherbrooke Airport", "iata": "YSC", "country": "CA"},
-            {"city": "Sheridan", "airport": "Sheridan County Airport", "iata": "SHR", "country": "US"},
-            {"city": "Sherpur Naqeebpur", "airport": "Sarsawa Air Force Station", "iata": "SWN", "country": "IN"},
-            {"city": "Shihezi", "airport": "Shihezi Huayuan Airport", "iata": "SHF", "country": "CN"},
-            {"city": "Shijiazhuang", "airport": "Shijiazhuang Luancheng Airport", "iata": "LCT", "country": "CN"},
-            {"city": "Shijiazhuang", "airport": "Shijiazhuang Zhengding International Airport", "iata": "SJW", "country": "CN"},
-            {"city": "Shilavo", "airport": "Shilavo Airport", "iata": "HIL", "country": "ET"},
-            {"city": "Shillong", "airport": "Shillong Airport", "iata": "SHL", "country": "IN"},
-            {"city": "Shimoga", "airport": "Rashtrakavi Kuvempu Airport", "iata": "RQY", "country": "IN"},
-            {"city": "Shindand", "airport": "Shindand Air Base", "iata": "OAH", "country": "AF"},
-            {"city": "Shinyanga", "airport": "Shinyanga Airport", "iata": "SHY", "country": "TZ"},
-            {"city": "Shiquanhe", "airport": "Ngari Gunsa Airport", "iata": "NGQ", "country": "CN"},
-            {"city": "Shirahama", "airport": "Nanki Shirahama Airport", "iata": "SHM", "country": "JP"},
-            {"city": "Shiraz", "airport": "Shiraz Shahid Dastghaib International Airport", "iata": "SYZ", "country": "IR"},
-            {"city": "Shire Inda Selassie", "airport": "Shire Inda Selassie Airport", "iata": "SHC", "country": "ET"},
-            {"city": "Shiringayoc", "airport": "Shiringayoc Airport", "iata": "SYC", "country": "PE"},
-            {"city": "Shirley", "airport": "Brookhaven Calabro Airport", "iata": "WSH", "country": "US"},
-            {"city": "Shishmaref", "airport": "Shishmaref Airport", "iata": "SHH", "country": "US"},
-            {"city": "Shiveh", "airport": "Sheghnan Airport", "iata": "SGA", "country": "AF"},
-            {"city": "Shiyan (Maojian)", "airport": "Shiyan Wudangshan Airport", "iata": "WDS", "country": "CN"},
-            {"city": "Shonai", "airport": "Shonai Airport", "iata": "SYO", "country": "JP"},
-            {"city": "Show Low", "airport": "Show Low Regional Airport", "iata": "SOW", "country": "US"},
-            {"city": "Showt", "airport": "Maku National Airport", "iata": "IMQ", "country": "IR"},
-            {"city": "Shravasti", "airport": "Shravasti Airport", "iata": "VSV", "country": "IN"},
-            {"city": "Shreveport", "airport": "Shreveport Downtown Airport", "iata": "DTN", "country": "US"},
-            {"city": "Shreveport", "airport": "Shreveport Regional Airport", "iata": "SHV", "country": "US"},
-            {"city": "Shtraklevo", "airport": "Ruse Airport", "iata": "ROU", "country": "BG"},
-            {"city": "Shuangta, Chaoyang", "airport": "Chaoyang Airport", "iata": "CHG", "country": "CN"},
-            {"city": "Shuishang", "airport": "Chiayi Airport", "iata": "CYI", "country": "TW"},
-            {"city": "Shungnak", "airport": "Shungnak Airport", "iata": "SHG", "country": "US"},
-            {"city": "Shuozhou", "airport": "Shuozhou Zirun Airport", "iata": "SZH", "country": "CN"},
-            {"city": "Shute Harbour", "airport": "Shute Harbour/Whitsunday Airport", "iata": "WSY", "country": "AU"},
-            {"city": "Shymkent", "airport": "Shymkent Airport", "iata": "CIT", "country": "KZ"},
-            {"city": "Sialkot", "airport": "Sialkot International Airport", "iata": "SKT", "country": "PK"},
-            {"city": "Sialum", "airport": "Sialum Airport", "iata": "SXA", "country": "PG"},
-            {"city": "Siassi", "airport": "Siassi Airport", "iata": "SSS", "country": "PG"},
-            {"city": "Sibi", "airport": "Sibi Airport", "iata": "SBQ", "country": "PK"},
-            {"city": "Sibiti", "airport": "Sibiti Airport", "iata": "SIB", "country": "CG"},
-            {"city": "Sibiu", "airport": "Sibiu International Airport", "iata": "SBZ", "country": "RO"},
-            {"city": "Sibolga (Pinangsori)", "airport": "Dr. Ferdinand Lumban Tobing Airport", "iata": "FLZ", "country": "ID"},
-            {"city": "Siborong-Borong", "airport": "Silangit Airport", "iata": "DTB", "country": "ID"},
-            {"city": "Sibu", "airport": "Sibu Airport", "iata": "SBW", "country": "MY"},
-            {"city": "Siddharthanagar (Bhairahawa)", "airport": "Gautam Buddha International Airport", "iata": "BWA", "country": "NP"},
-            {"city": "Sidi Bel Abbès", "airport": "Sidi Bel Abbes Airport", "iata": "BFW", "country": "DZ"},
-            {"city": "Sidi El Barrani", "airport": "Sidi EL Barrani Airport", "iata": "SQK", "country": "EG"},
-            {"city": "Sidney", "airport": "Sidney Municipal Airport", "iata": "SXY", "country": "US"},
-            {"city": "Sidney", "airport": "Sidney - Richland Regional Airport", "iata": "SDY", "country": "US"},
-            {"city": "Sidney", "airport": "Sidney Municipal Airport Lloyd W Carr Field", "iata": "SNY", "country": "US"},
-            {"city": "Siem Reap", "airport": "Siem Reap-Angkor International Airport", "iata": "SAI", "country": "KH"},
-            {"city": "Sierra Grande", "airport": "Sierra Grande Airport", "iata": "SGV", "country": "AR"},
-            {"city": "Sigiriya", "airport": "Sigiriya Air Force Base", "iata": "GIU", "country": "LK"},
-            {"city": "Siglufjörður", "airport": "Siglufjörður Airport", "iata": "SIJ", "country": "IS"},
-            {"city": "Siguiri", "airport": "Siguiri Airport", "iata": "GII", "country": "GN"},
-            {"city": "Siirt", "airport": "Siirt Airport", "iata": "SXZ", "country": "TR"},
-            {"city": "Sikasso", "airport": "Sikasso Airport", "iata": "KSS", "country": "ML"},
-            {"city": "Sikeston", "airport": "Sikeston Memorial Municipal Airport", "iata": "SIK", "country": "US"},
-            {"city": "Sila Mission", "airport": "Sila Airport", "iata": "SIL", "country": "PG"},
-            {"city": "Silao", "airport": "Del Bajío International Airport", "iata": "BJX", "country": "MX"},
-            {"city": "Silchar", "airport": "Silchar Airport", "iata": "IXS", "country": "IN"},
-            {"city": "Silgadi Doti", "airport": "Silgadi Doti Airport", "iata": "SIH", "country": "NP"},
-            {"city": "Siliguri", "airport": "Bagdogra Airport", "iata": "IXB", "country": "IN"},
-            {"city": "Siloam Springs", "airport": "Smith Field", "iata": "SLG", "country": "US"},
-            {"city": "Silur Mission", "airport": "Silur Airport", "iata": "SWR", "country": "PG"},
-            {"city": "Silver City", "airport": "Grant County Airport", "iata": "SVC", "country": "US"},
-            {"city": "Silver Creek", "airport": "Silver Creek Airport", "iata": "SVK", "country": "BZ"},
-            {"city": "Silver Plains", "airport": "Silver Plains Airport", "iata": "SSP", "country": "AU"},
-            {"city": "Sim", "airport": "Sim Airport", "iata": "SMJ", "country": "PG"},
-            {"city": "Simara", "airport": "Simara Airport", "iata": "SIF", "country": "NP"},
-            {"city": "Simbai", "airport": "Simbai Airport", "iata": "SIM", "country": "PG"},
-            {"city": "Simberi Island", "airport": "Simberi Airport", "iata": "NIS", "country": "PG"},
-            {"city": "Simenti", "airport": "Simenti Airport", "iata": "SMY", "country": "SN"},
-            {"city": "Simferopol", "airport": "Simferopol International Airport", "iata": "SIP", "country": "UA"},
-            {"city": "Simikot", "airport": "Simikot Airport", "iata": "IMK", "country": "NP"},
-            {"city": "Sinak", "airport": "Sinak Airport", "iata": "NKD", "country": "ID"},
-            {"city": "Sindal", "airport": "Sindal Airport", "iata": "CNL", "country": "DK"},
-            {"city": "Sindhri", "airport": "Sindhri Tharparkar Airport", "iata": "MPD", "country": "PK"},
-            {"city": "Singapore", "airport": "Singapore Changi Airport", "iata": "SIN", "country": "SG"},
-            {"city": "Singita Safari Lodge", "airport": "Singita Safari Lodge Airport", "iata": "SSX", "country": "ZA"},
-            {"city": "Singkawang", "airport": "Singkawang Airport", "iata": "SKJ", "country": "ID"},
-            {"city": "Singleton", "airport": "Singleton Airport", "iata": "SIX", "country": "AU"},
-            {"city": "Sinop", "airport": "Sinop Airport", "iata": "NOP", "country": "TR"},
-            {"city": "Sinop", "airport": "Presidente João Batista Figueiredo Airport", "iata": "OPS", "country": "BR"},
-            {"city": "Sint Maarten", "airport": "Princess Juliana International Airport", "iata": "SXM", "country": "SX"},
-            {"city": "Sintang", "airport": "Tebelian Airport", "iata": "SQG", "country": "ID"},
-            {"city": "Siocon", "airport": "Siocon Airport", "iata": "XSO", "country": "PH"},
-            {"city": "Sion", "airport": "Sion Airport", "iata": "SIR", "country": "CH"},
-            {"city": "Siorapaluk", "airport": "Siorapaluk Heliport", "iata": "SRK", "country": "GL"},
-            {"city": "Sioux City", "airport": "Sioux Gateway Airport / Brigadier General Bud Day Field", "iata": "SUX", "country": "US"},
-            {"city": "Sioux Falls", "airport": "Sioux Falls Regional Airport / Joe Foss Field", "iata": "FSD", "country": "US"},
-            {"city": "Sioux Lookout", "airport": "Sioux Lookout Airport", "iata": "YXL", "country": "CA"},
-            {"city": "Sipitang", "airport": "Sipitang Airport", "iata": "SPT", "country": "MY"},
-            {"city": "Sipura Island", "airport": "Mentawai Airport", "iata": "RKI", "country": "ID"},
-            {"city": "Sir Bani Yas", "airport": "Sir Bani Yas Airport", "iata": "XSB", "country": "AE"},
-            {"city": "Siri", "airport": "Siri Airport", "iata": "SXI", "country": "IR"},
-            {"city": "Sirjan", "airport": "Sirjan Airport", "iata": "SYJ", "country": "IR"},
-            {"city": "Sirt", "airport": "Sirt International Airport / Ghardabiya Airbase", "iata": "SRX", "country": "LY"},
-            {"city": "Sishen", "airport": "Sishen Airport", "iata": "SIS", "country": "ZA"},
-            {"city": "Sisimiut", "airport": "Sisimiut Airport", "iata": "JHS", "country": "GL"},
-            {"city": "Sissano", "airport": "Sissano Airport", "iata": "SIZ", "country": "PG"},
-            {"city": "Sitiawan", "airport": "Sitiawan Airport", "iata": "SWY", "country": "MY"},
-            {"city": "Sitka", "airport": "Sitka Rocky Gutierrez Airport", "iata": "SIT", "country": "US"},
-            {"city": "Sittwe", "airport": "Sittwe Airport", "iata": "AKY", "country": "MM"},
-            {"city": "Siuna", "airport": "Siuna", "iata": "SIU", "country": "NI"},
-            {"city": "Sivas", "airport": "Sivas Nuri Demirağ Airport", "iata": "VAS", "country": "TR"},
-            {"city": "Siwa Oasis", "airport": "Siwa Oasis North Airport", "iata": "SEW", "country": "EG"},
-            {"city": "Siwea", "airport": "Siwea Airport", "iata": "SWE", "country": "PG"},
-            {"city": "Skagway", "airport": "Skagway Airport", "iata": "SGY", "country": "US"},
-            {"city": "Skardu", "airport": "Skardu Airport", "iata": "KDU", "country": "PK"},
-            {"city": "Skazar", "airport": "Razer Airport", "iata": "KUR", "country": "AF"},
-            {"city": "Skeldon", "airport": "Skeldon Airport", "iata": "SKM", "country": "GY"},
-            {"city": "Skellefteå", "airport": "Skellefteå Airport", "iata": "SFT", "country": "SE"},
-            {"city": "Skiathos", "airport": "Skiathos Island National Airport", "iata": "JSI", "country": "GR"},
-            {"city": "Skiros Island", "airport": "Skiros Airport", "iata": "SKU", "country": "GR"},
-            {"city": "Skive", "airport": "Skive Airport", "iata": "SQW", "country": "DK"},
-            {"city": "Skjern", "airport": "Stauning Vestjylland  Airport", "iata": "STA", "country": "DK"},
-            {"city": "Skukuza", "airport": "Skukuza Airport", "iata": "SZK", "country": "ZA"},
-            {"city": "Skwentna", "airport": "Skwentna Airport", "iata": "SKW", "country": "US"},
-            {"city": "Skövde", "airport": "Skövde Airport", "iata": "KVB", "country": "SE"},
-            {"city": "Slave Lake", "airport": "Slave Lake Airport", "iata": "YZH", "country": "CA"},
-            {"city": "Slayton", "airport": "Slayton Municipal Airport", "iata": "NSL", "country": "US"},
-            {"city": "Sleetmute", "airport": "Sleetmute Airport", "iata": "SLQ", "country": "US"},
-            {"city": "Slemon Park", "airport": "Summerside Airport", "iata": "YSU", "country": "CA"},
-            {"city": "Sliač", "airport": "Sliač Airport", "iata": "SLD", "country": "SK"},
-            {"city": "Sligo", "airport": "Sligo Airport", "iata": "SXL", "country": "IE"},
-            {"city": "Smara", "airport": "Smara Airport", "iata": "SMW", "country": "EH"},
-            {"city": "Smithers", "airport": "Smithers Airport", "iata": "YYD", "country": "CA"},
-            {"city": "Smiths Falls", "airport": "Smiths Falls-Montague (Russ Beach) Airport", "iata": "YSH", "country": "CA"},
-            {"city": "Smolensk", "airport": "Smolensk North Airport", "iata": "LNX", "country": "RU"},
-            {"city": "Smyrna", "airport": "Smyrna Airport", "iata": "MQY", "country": "US"},
-            {"city": "Snap Lake Mine", "airport": "Snap Lake Airport", "iata": "YNX", "country": "CA"},
-            {"city": "Snyder", "airport": "Winston Field", "iata": "SNK", "country": "US"},
-            {"city": "Soa, Ngada", "airport": "Bajawa Soa (Turelelo) Airport", "iata": "BJW", "country": "ID"},
-            {"city": "Soalala", "airport": "Soalala Airport", "iata": "DWB", "country": "MG"},
-            {"city": "Sobral", "airport": "Dr. Luciano de Arruda Coelho Regional Airport", "iata": "JSO", "country": "BR"},
-            {"city": "Sochi", "airport": "Sochi International Airport", "iata": "AER", "country": "RU"},
-            {"city": "Socorro", "airport": "Socorro Municipal Airport", "iata": "ONM", "country": "US"},
-            {"city": "Sodankyla", "airport": "Sodankyla Airport", "iata": "SOT", "country": "FI"},
-            {"city": "Soddu", "airport": "Soddu Airport", "iata": "SXU", "country": "ET"},
-            {"city": "Sofia", "airport": "Sofia Airport", "iata": "SOF", "country": "BG"},
-            {"city": "Sogamoso", "airport": "Alberto Lleras Camargo Airport", "iata": "SOX", "country": "CO"},
-            {"city": "Sogndal", "airport": "Sogndal Airport, Haukåsen", "iata": "SOG", "country": "NO"},
-            {"city": "Sohar", "airport": "Sohar Airport", "iata": "OHS", "country": "OM"},
-            {"city": "Sokoto", "airport": "Sadiq Abubakar III International Airport", "iata": "SKO", "country": "NG"},
-            {"city": "Sola", "airport": "Sola Airport", "iata": "SLH", "country": "VU"},
-            {"city": "Solano", "airport": "Solano Airport", "iata": "SQF", "country": "CO"},
-            {"city": "Solapur", "airport": "Solapur Airport", "iata": "SSE", "country": "IN"},
-            {"city": "Soldotna", "airport": "Soldotna Airport", "iata": "SXQ", "country": "US"},
-            {"city": "Solenzara", "airport": "Solenzara (BA 126) Air Base", "iata": "SOZ", "country": "FR"},
-            {"city": "Solita", "airport": "Solita Airport", "iata": "SOH", "country": "CO"},
-            {"city": "Solomon", "airport": "Solomon State Field", "iata": "SOL", "country": "US"},
-            {"city": "Solovetsky Islands", "airport": "Solovki Airport", "iata": "CSH", "country": "RU"},
-            {"city": "Solwesi", "airport": "Solwesi Airport", "iata": "SLI", "country": "ZM"},
-            {"city": "Somerset", "airport": "Lake Cumberland Regional Airport", "iata": "SME", "country": "US"},
-            {"city": "Songea", "airport": "Songea Airport", "iata": "SGX", "country": "TZ"},
-            {"city": "Sopu", "airport": "Sopu Airport", "iata": "SPH", "country": "PG"},
-            {"city": "Soroako", "airport": "Soroako Airport", "iata": "SQR", "country": "ID"},
-            {"city": "Sorocaba", "airport": "Sorocaba Airport", "iata": "SOD", "country": "BR"},
-            {"city": "Sorong", "airport": "Domine Eduard Osok Airport", "iata": "SOQ", "country": "ID"},
-            {"city": "Soroti", "airport": "Soroti Airport", "iata": "SRT", "country": "UG"},
-            {"city": "Sorriso", "airport": "Adolino Bedin Regional Airport", "iata": "SMT", "country": "BR"},
-            {"city": "Souanke", "airport": "Souanke Airport", "iata": "SOE", "country": "CG"},
-            {"city": "Souda", "airport": "Chania International Airport", "iata": "CHQ", "country": "GR"},
-            {"city": "Soure", "airport": "Soure Airport", "iata": "SFK", "country": "BR"},
-            {"city": "South Bend", "airport": "South Bend Regional Airport", "iata": "SBN", "country": "US"},
-            {"city": "South Bimini", "airport": "South Bimini Airport", "iata": "BIM", "country": "BS"},
-            {"city": "South Burlington", "airport": "Burlington International Airport", "iata": "BTV", "country": "US"},
-            {"city": "South Caicos", "airport": "South Caicos Airport", "iata": "XSC", "country": "TC"},
-            {"city": "South Indian Lake", "airport": "South Indian Lake Airport", "iata": "XSI", "country": "CA"},
-            {"city": "South Lake Tahoe", "airport": "Lake Tahoe Airport", "iata": "TVL", "country": "US"},
-            {"city": "South Molle Island Resort", "airport": "South Molle Island Helipad", "iata": "SOI", "country": "AU"},
-            {"city": "South Naknek", "airport": "South Naknek Number 2 Airport", "iata": "WSN", "country": "US"},
-            {"city": "South Point", "airport": "Lawrence County Airpark", "iata": "HTW", "country": "US"},
-            {"city": "South Tetagouche", "airport": "Bathurst Airport", "iata": "ZBF", "country": "CA"},
-            {"city": "Southampton", "airport": "Southampton Airport", "iata": "SOU", "country": "GB"},
-            {"city": "Southend-on-Sea, Essex", "airport": "London Southend Airport", "iata": "SEN", "country": "GB"},
-            {"city": "Sovetskaya Gavan", "airport": "Sovetskaya Gavan (Maygatka) Airport", "iata": "GVN", "country": "RU"},
-            {"city": "Sovetskiy", "airport": "Sovetskiy Airport", "iata": "OVS", "country": "RU"},
-            {"city": "Sowa", "airport": "Sua Pan Airport", "iata": "SXN", "country": "BW"},
-            {"city": "Soyo", "airport": "Soyo Airport", "iata": "SZA", "country": "AO"},
-            {"city": "Spanish Lookout", "airport": "Matthew Spain Airport", "iata": "SQS", "country": "BZ"},
-            {"city": "Spanish Town", "airport": "Virgin Gorda Airport", "iata": "VIJ", "country": "VG"},
-            {"city": "Sparrevohn", "airport": "Sparrevohn LRRS Airport", "iata": "SVW", "country": "US"},
-            {"city": "Sparta", "airport": "Sparta Fort McCoy Airport", "iata": "CMY", "country": "US"},
-            {"city": "Sparta", "airport": "Sparta Community Airport - Hunter Field", "iata": "SAR", "country": "US"},
-            {"city": "Spartanburg", "airport": "Spartanburg Downtown Memorial Airport", "iata": "SPA", "country": "US"},
-            {"city": "Sparti", "airport": "Sparti Airfield", "iata": "SPJ", "country": "GR"},
-            {"city": "Spata-Artemida", "airport": "Athens Eleftherios Venizelos International Airport", "iata": "ATH", "country": "GR"},
-            {"city": "Spearfish", "airport": "Black Hills Airport-Clyde Ice Field", "iata": "SPF", "country": "US"},
-            {"city": "Spencer", "airport": "Spencer Municipal Airport", "iata": "SPW", "country": "US"},
-            {"city": "Spokane", "airport": "Spokane International Airport", "iata": "GEG", "country": "US"},
-            {"city": "Spokane", "airport": "Felts Field", "iata": "SFF", "country": "US"},
-            {"city": "Spokane", "airport": "Fairchild Air Force Base", "iata": "SKA", "country": "US"},
-            {"city": "Spring Green", "airport": "Tri-County Regional Airport", "iata": "LNR", "country": "US"},
-            {"city": "Spring Point", "airport": "Spring Point Airport", "iata": "AXP", "country": "BS"},
-            {"city": "Springbok", "airport": "Springbok Airport", "iata": "SBU", "country": "ZA"},
-            {"city": "Springbrook", "airport": "Red Deer Regional Airport", "iata": "YQF", "country": "CA"},
-            {"city": "Springdale", "airport": "Springdale Municipal Airport", "iata": "SPZ", "country": "US"},
-            {"city": "Springfield", "airport": "Springfield Branson National Airport", "iata": "SGF", "country": "US"},
-            {"city": "Springfield", "airport": "Springfield-Beckley Municipal Airport", "iata": "SGH", "country": "US"},
-            {"city": "Springfield", "airport": "Abraham Lincoln Capital Airport", "iata": "SPI", "country": "US"},
-            {"city": "Springvale", "airport": "Springvale Airport", "iata": "ZVG", "country": "AU"},
-            {"city": "Squamish", "airport": "Squamish Airport", "iata": "YSE", "country": "CA"},
-            {"city": "Srednekolymsk", "airport": "Srednekolymsk Airport", "iata": "SEK", "country": "RU"},
-            {"city": "Sri Jayawardenepura Kotte", "airport": "Diyawanna Oya Seaplane Base", "iata": "DWO", "country": "LK"},
-            {"city": "Srinagar", "airport": "Sheikh ul Alam International Airport", "iata": "SXR", "country": "IN"},
-            {"city": "St Augustine", "airport": "Northeast Florida Regional Airport", "iata": "UST", "country": "US"},
-            {"city": "St George", "airport": "St George Regional Airport", "iata": "SGU", "country": "US"},
-            {"city": "St George", "airport": "St George Airport", "iata": "STG", "country": "US"},
-            {"city": "St Jean", "airport": "St Jean Airport", "iata": "YJN", "country": "CA"},
-            {"city": "St Johns", "airport": "St Johns Industrial Air Park", "iata": "SJN", "country": "US"},
-            {"city": "St Joseph", "airport": "Rosecrans Memorial Airport", "iata": "STJ", "country": "US"},
-            {"city": "St Louis", "airport": "St. Louis Lambert International Airport", "iata": "STL", "country": "US"},
-            {"city": "St Louis", "airport": "Spirit of St Louis Airport", "iata": "SUS", "country": "US"},
-            {"city": "St Mary's", "airport": "St Mary's Airport", "iata": "KSM", "country": "US"},
-            {"city": "St Marys", "airport": "St Marys Municipal Airport", "iata": "STQ", "country": "US"},
-            {"city": "St Michael", "airport": "St Michael Airport", "iata": "SMK", "country": "US"},
-            {"city": "St Paul Island", "airport": "St Paul Island Airport", "iata": "SNP", "country": "US"},
-            {"city": "St Petersburg", "airport": "Albert Whitted Airport", "iata": "SPG", "country": "US"},
-            {"city": "St Simons Island", "airport": "St Simons Island Airport", "iata": "SSI", "country": "US"},
-            {"city": "St Thomas", "airport": "St Thomas Municipal Airport", "iata": "YQS", "country": "CA"},
-            {"city": "St-Augustin", "airport": "St Augustin Airport", "iata": "YIF", "country": "CA"},
-            {"city": "St-François", "airport": "St-François Airport", "iata": "SFC", "country": "GP"},
-            {"city": "St. Anthony", "airport": "St. Anthony Airport", "iata": "YAY", "country": "CA"},
-            {"city": "St. Gallen", "airport": "Sankt Gallen Altenrhein Airport", "iata": "ACH", "country": "CH"},
-            {"city": "St. John's", "airport": "St. John's International Airport", "iata": "YYT", "country": "CA"},
-            {"city": "St. Lewis", "airport": "St. Lewis (Fox Harbour) Airport", "iata": "YFX", "country": "CA"},
-            {"city": "St. Mary's, Isles of Scilly", "airport": "St. Mary's Airport", "iata": "ISC", "country": "GB"},
-            {"city": "St. Peter", "airport": "Jersey Airport", "iata": "JER", "country": "JE"},
-            {"city": "St. Petersburg", "airport": "Pulkovo Airport", "iata": "LED", "country": "RU"},
-            {"city": "St. Theresa Point", "airport": "St. Theresa Point Airport", "iata": "YST", "country": "CA"},
-            {"city": "Sta Cruz de la Palma, La Palma Island", "airport": "La Palma Airport", "iata": "SPC", "country": "ES"},
-            {"city": "Stagen", "airport": "Gusti Syamsir Alam Airport", "iata": "KBU", "country": "ID"},
-            {"city": "Staniel Cay", "airport": "Staniel Cay Airport", "iata": "TYM", "country": "BS"},
-            {"city": "Stanley", "airport": "Port Stanley Airport", "iata": "PSY", "country": "FK"},
-            {"city": "Stapari", "airport": "Ponikve Airport", "iata": "UZC", "country": "RS"},
-            {"city": "Star Harbor", "airport": "Nana Airport", "iata": "NAZ", "country": "SB"},
-            {"city": "State College", "airport": "State College Regional Airport", "iata": "SCE", "country": "US"},
-            {"city": "Statesboro", "airport": "Statesboro Bulloch County Airport", "iata": "TBR", "country": "US"},
-            {"city": "Statesville", "airport": "Statesville Regional Airport", "iata": "SVH", "country": "US"},
-            {"city": "Stavanger", "airport": "Stavanger Airport, Sola", "iata": "SVG", "country": "NO"},
-            {"city": "Staverton", "airport": "Gloucestershire Airport", "iata": "GLO", "country": "GB"},
-            {"city": "Stavropol", "airport": "Stavropol Shpakovskoye Airport", "iata": "STW", "country": "RU"},
-            {"city": "Steamboat Bay", "airport": "Steamboat Bay Seaplane Base", "iata": "WSB", "country": "US"},
-            {"city": "Steamboat Springs", "airport": "Steamboat Springs Bob Adams Field", "iata": "SBS", "country": "US"},
-            {"city": "Stebbins", "airport": "Stebbins Airport", "iata": "WBB", "country": "US"},
-            {"city": "Stella Maris", "airport": "Stella Maris Airport", "iata": "SML", "country": "BS"},
-            {"city": "Stephens Island", "airport": "Stephens Island Seaplane Base", "iata": "STF", "country": "AU"},
-            {"city": "Stephenville", "airport": "Dymond Airport", "iata": "YJT", "country": "CA"},
-            {"city": "Stephenville", "airport": "Stephenville Clark Regional Airport", "iata": "SEP", "country": "US"},
-            {"city": "Sterling", "airport": "Sterling Municipal Airport", "iata": "STK", "country": "US"},
-            {"city": "Stevens Point", "airport": "Stevens Point Municipal Airport", "iata": "STE", "country": "US"},
-            {"city": "Stevens Village", "airport": "Stevens Village Airport", "iata": "SVS", "country": "US"},
-            {"city": "Stewart", "airport": "Stewart Airport", "iata": "ZST", "country": "CA"},
-            {"city": "Stillwater", "airport": "Stillwater Regional Airport", "iata": "SWO", "country": "US"},
-            {"city": "Stirling Island", "airport": "Mono Airport", "iata": "MNY", "country": "SB"},
-            {"city": "Stockholm", "airport": "Stockholm-Arlanda Airport", "iata": "ARN", "country": "SE"},
-            {"city": "Stockholm", "airport": "Stockholm-Bromma Airport", "iata": "BMA", "country": "SE"},
-            {"city": "Stockholm", "airport": "Stockholm Landing Strip", "iata": "SMP", "country": "PG"},
-            {"city": "Stockholm / Västerås", "airport": "Stockholm Västerås Airport", "iata": "VST", "country": "SE"},
-            {"city": "Stockton", "airport": "Stockton Metropolitan Airport", "iata": "SCK", "country": "US"},
-            {"city": "Stoelmanseiland", "airport": "Stoelmanseiland Airport", "iata": "SMZ", "country": "SR"},
-            {"city": "Stonewall", "airport": "LBJ Ranch Airport", "iata": "JCY", "country": "US"},
-            {"city": "Stony Rapids", "airport": "Stony Rapids Airport", "iata": "YSF", "country": "CA"},
-            {"city": "Stony River", "airport": "Stony River 2 Airport", "iata": "SRV", "country": "US"},
-            {"city": "Storm Lake", "airport": "Storm Lake Municipal Airport", "iata": "SLB", "country": "US"},
-            {"city": "Stornoway, Western Isles", "airport": "Stornoway Airport", "iata": "SYY", "country": "GB"},
-            {"city": "Storuman", "airport": "Storuman Airport", "iata": "SQO", "country": "SE"},
-            {"city": "Stow", "airport": "Minute Man Air Field", "iata": "MMN", "country": "US"},
-            {"city": "Strasbourg", "airport": "Strasbourg Airport", "iata": "SXB", "country": "FR"},
-            {"city": "Strathmore", "airport": "Strathmore Airport", "iata": "STH", "country": "AU"},
-            {"city": "Strezhevoy", "airport": "Strezhevoy Airport", "iata": "SWT", "country": "RU"},
-            {"city": "Stronsay", "airport": "Stronsay Airport", "iata": "SOY", "country": "GB"},
-            {"city": "Stroud", "airport": "Stroud Municipal Airport", "iata": "SUD", "country": "US"},
-            {"city": "Stuart", "airport": "Witham Field", "iata": "SUA", "country": "US"},
-            {"city": "Stuart Island", "airport": "Big Bay Seaplane Base", "iata": "YIG", "country": "CA"},
-            {"city": "Sturgeon Bay", "airport": "Door County Cherryland Airport", "iata": "SUE", "country": "US"},
-            {"city": "Sturgis", "airport": "Kirsch Municipal Airport", "iata": "IRS", "country": "US"},
-            {"city": "Sturt Creek", "airport": "Sturt Creek Airport", "iata": "SSK", "country": "AU"},
-            {"city": "Stuttgart", "airport": "Stuttgart Airport", "iata": "STR", "country": "DE"},
-            {"city": "Stuttgart", "airport": "Stuttgart Municipal Airport / Carl Humphrey Field", "iata": "SGT", "country": "US"},
-            {"city": "Stykkishólmur", "airport": "Stykkishólmur Airport", "iata": "SYK", "country": "IS"},
-            {"city": "Suai", "airport": "Suai Airport", "iata": "UAI", "country": "TL"},
-            {"city": "Suavanao", "airport": "Suavanao Airport", "iata": "VAO", "country": "SB"},
-            {"city": "Subang", "airport": "Sultan Abdul Aziz Shah International Airport", "iata": "SZB", "country": "MY"},
-            {"city": "Suceava", "airport": "Suceava Stefan cel Mare Airport", "iata": "SCV", "country": "RO"},
-            {"city": "Sucúa", "airport": "Sucúa Airport", "iata": "SUQ", "country": "EC"},
-            {"city": "Sudbury", "airport": "Sudbury Airport", "iata": "YSB", "country": "CA"},
-            {"city": "Sudest Island", "airport": "Tagula Airport", "iata": "TGL", "country": "PG"},
-            {"city": "Sue Islet", "airport": "Warraber Island Airport", "iata": "SYU", "country": "AU"},
-            {"city": "Suhaj", "airport": "Sohag International Airport", "iata": "HMB", "country": "EG"},
-            {"city": "Sui", "airport": "Sui Airport", "iata": "SUL", "country": "PK"},
-            {"city": "Suifenhe", "airport": "Suifenhe Dongning Airport", "iata": "HSF", "country": "CN"},
-            {"city": "Suihua", "airport": "Zhaodong Beidahuang General Airport", "iata": "HLJ", "country": "CN"},
-            {"city": "Sukagawa", "airport": "Fukushima Airport", "iata": "FKS", "country": "JP"},
-            {"city": "Sukhumi", "airport": "Sukhumi Babushara /  Vladislav Ardzinba International Airport", "iata": "SUI", "country": "GE"},
-            {"city": "Suki", "airport": "Suki Airport", "iata": "SKC", "country": "PG"},
-            {"city": "Sulaco", "airport": "Sulaco Airport", "iata": "SCD", "country": "HN"},
-            {"city": "Sulaymaniyah", "airport": "Sulaymaniyah International Airport", "iata": "ISU", "country": "IQ"},
-            {"city": "Sule", "airport": "Sule Airport", "iata": "ULE", "country": "PG"},
-            {"city": "Sullivan", "airport": "Sullivan County Airport", "iata": "SIV", "country": "US"},
-            {"city": "Sullivan Bay", "airport": "Sullivan Bay Seaplane Base", "iata": "YTG", "country": "CA"},
-            {"city": "Sulphur Springs", "airport": "Sulphur Springs Municipal Airport", "iata": "SLR", "country": "US"},
-            {"city": "Sumbawa Besar", "airport": "Sultan Muhammad Kaharuddin III Airport", "iata": "SWQ", "country": "ID"},
-            {"city": "Sumbawanga", "airport": "Sumbawanga Airport", "iata": "SUT", "country": "TZ"},
-            {"city": "Sumbe", "airport": "Sumbe Airport", "iata": "NDD", "country": "AO"},
-            {"city": "Sumenep", "airport": "Trunojoyo Airport", "iata": "SUP", "country": "ID"},
-            {"city": "Summer Beaver", "airport": "Summer Beaver Airport", "iata": "SUR", "country": "CA"},
-            {"city": "Sumter", "airport": "Sumter Airport", "iata": "SUM", "country": "US"},
-            {"city": "Sumter", "airport": "Shaw Air Force Base", "iata": "SSC", "country": "US"},
-            {"city": "Sumy", "airport": "Sumy Airport", "iata": "UMY", "country": "UA"},
-            {"city": "Sunchales", "airport": "Sunchales Aeroclub Airport", "iata": "NCJ", "country": "AR"},
-            {"city": "Suncor Energy Site", "airport": "Fort Mackay / Firebag", "iata": "YFI", "country": "CA"},
-            {"city": "Sundsvall/ Härnösand", "airport": "Sundsvall-Härnösand Airport", "iata": "SDL", "country": "SE"},
-            {"city": "Sungai Penuh", "airport": "Departi Parbo Airport", "iata": "KRC", "country": "ID"},
-            {"city": "Sungai Tekai", "airport": "Sungai Tekai Airport", "iata": "GTK", "country": "MY"},
-            {"city": "Sunriver", "airport": "Sunriver Airport", "iata": "SUO", "country": "US"},
-            {"city": "Sunshine Coast", "airport": "Pender Harbour Seaplane Base", "iata": "YPT", "country": "CA"},
-            {"city": "Suntar", "airport": "Suntar Airport", "iata": "SUY", "country": "RU"},
-            {"city": "Sunyani", "airport": "Sunyani Airport", "iata": "NYI", "country": "GH"},
-            {"city": "Sunzha", "airport": "Magas Airport", "iata": "IGT", "country": "RU"},
-            {"city": "Supai Village", "airport": "Lava Falls Heliport", "iata": "HAE", "country": "US"},
-            {"city": "Superior", "airport": "Richard I Bong Memorial Airport", "iata": "SUW", "country": "US"},
-            {"city": "Surabaya", "airport": "Juanda International Airport", "iata": "SUB", "country": "ID"},
-            {"city": "Surakarta", "airport": "Adisumarmo Airport", "iata": "SOC", "country": "ID"},
-            {"city": "Surallah", "airport": "Allah Valley Airport", "iata": "AAV", "country": "PH"},
-            {"city": "Surat", "airport": "Surat Airport", "iata": "STV", "country": "IN"},
-            {"city": "Surat Thani", "airport": "Surat Thani Airport", "iata": "URT", "country": "TH"},
-            {"city": "Surgut", "airport": "Surgut Airport", "iata": "SGC", "country": "RU"},
-            {"city": "Surigao City", "airport": "Surigao Airport", "iata": "SUG", "country": "PH"},
-            {"city": "Surin", "airport": "Surin Airport", "iata": "PXR", "country": "TH"},
-            {"city": "Surkhet", "airport": "Surkhet Airport", "iata": "SKH", "country": "NP"},
-            {"city": "Susanville", "airport": "Susanville Municipal Airport", "iata": "SVE", "country": "US"},
-            {"city": "Suwon", "airport": "Suwon Airport", "iata": "SWU", "country": "KR"},
-            {"city": "Suzhou", "airport": "Suzhou Guangfu Airport", "iata": "SZV", "country": "CN"},
-            {"city": "Sveg", "airport": "Sveg Airport", "iata": "EVG", "country": "SE"},
-            {"city": "Svetlaya", "airport": "Svetlaya Airport", "iata": "ETL", "country": "RU"},
-            {"city": "Svetlogorsk", "airport": "Svetlogorsk Airport", "iata": "SES", "country": "RU"},
-            {"city": "Svolvær", "airport": "Svolvær Airport, Helle", "iata": "SVJ", "country": "NO"},
-            {"city": "Swakopmund", "airport": "Swakopmund Municipal Aerodrome", "iata": "SWP", "country": "NA"},
-            {"city": "Swan River", "airport": "Swan River Airport", "iata": "ZJN", "country": "CA"},
-            {"city": "Swansea", "airport": "Swansea Airport", "iata": "SWS", "country": "GB"},
-            {"city": "Sweetwater", "airport": "Avenger Field", "iata": "SWW", "country": "US"},
-            {"city": "Swift Current", "airport": "Swift Current Airport", "iata": "YYN", "country": "CA"},
-            {"city": "Sydney", "airport": "Sydney / J.A. Douglas McCurdy Airport", "iata": "YQY", "country": "CA"},
-            {"city": "Sydney", "airport": "Palm Beach Seaplane Base", "iata": "LBH", "country": "AU"},
-            {"city": "Sydney", "airport": "Rose Bay Seaplane Base", "iata": "RSE", "country": "AU"},
-            {"city": "Sydney", "airport": "Sydney Bankstown Airport", "iata": "BWU", "country": "AU"},
-            {"city": "Sydney (Badgerys Creek)", "airport": "Western Sydney International (Nancy Bird Walton) Airport", "iata": "SWZ", "country": "AU"},
-            {"city": "Sydney (Mascot)", "airport": "Sydney Kingsford Smith International Airport", "iata": "SYD", "country": "AU"},
-            {"city": "Syktyvkar", "airport": "Syktyvkar Airport", "iata": "SCW", "country": "RU"},
-            {"city": "Sylhet", "airport": "Osmany International Airport", "iata": "ZYL", "country": "BD"},
-            {"city": "Sylt", "airport": "Westerland Sylt Airport", "iata": "GWT", "country": "DE"},
-            {"city": "Sylvester", "airport": "Sylvester Airport", "iata": "SYV", "country": "US"},
-            {"city": "Syracuse", "airport": "Syracuse Hancock International Airport", "iata": "SYR", "country": "US"},
-            {"city": "Syros Island", "airport": "Syros Airport", "iata": "JSY", "country": "GR"},
-            {"city": "Szymany", "airport": "Olsztyn-Mazury Airport", "iata": "SZY", "country": "PL"},
-            {"city": "Sármellék", "airport": "Hévíz–Balaton Airport", "iata": "SOB", "country": "HU"},
-            {"city": "São Benedito", "airport": "Walfrido Salmito de Almeida Airport", "iata": "JSB", "country": "BR"},
-            {"city": "São Borja", "airport": "São Borja Airport", "iata": "JBS", "country": "BR"},
-            {"city": "São Carlos", "airport": "Mário Pereira Lopes–São Carlos International Airport", "iata": "QSC", "country": "BR"},
-            {"city": "São Filipe", "airport": "São Filipe Airport", "iata": "SFL", "country": "CV"},
-            {"city": "São Félix Do Araguaia", "airport": "São Félix do Araguaia Airport", "iata": "SXO", "country": "BR"},
-            {"city": "São Félix do Xingu", "airport": "São Félix do Xingu Airport", "iata": "SXX", "country": "BR"},
-            {"city": "São Gabriel da Cachoeira", "airport": "São Gabriel da Cachoeira Airport", "iata": "SJL", "country": "BR"},
-            {"city": "São José Dos Campos", "airport": "Professor Urbano Ernesto Stumpf Airport", "iata": "SJK", "country": "BR"},
-            {"city": "São José do Rio Preto", "airport": "Prof. Eribelto Manoel Reino State Airport", "iata": "SJP", "country": "BR"},
-            {"city": "São João Del Rei", "airport": "Prefeito Octávio de Almeida Neves Airport", "iata": "JDR", "country": "BR"},
-            {"city": "São Lourenço", "airport": "São Lourenço Airport", "iata": "SSO", "country": "BR"},
-            {"city": "São Lourenço Do Sul", "airport": "São Lourenço do Sul Airport", "iata": "SQY", "country": "BR"},
-            {"city": "São Luís", "airport": "Marechal Cunha Machado International Airport", "iata": "SLZ", "country": "BR"},
-            {"city": "São Mateus", "airport": "São Mateus - Ernesto Bonomo Airport", "iata": "SBJ", "country": "BR"},
-            {"city": "São Miguel do Araguaia", "airport": "São Miguel do Araguaia Airport", "iata": "SQM", "country": "BR"},
-            {"city": "São Miguel do Oeste", "airport": "São Miguel do Oeste Hélio Wasum Airport", "iata": "SQX", "country": "BR"},
-            {"city": "São Paulo", "airport": "Guarulhos - Governador André Franco Montoro International Airport", "iata": "GRU", "country": "BR"},
-            {"city": "São Paulo", "airport": "Campo de Marte Airport", "iata": "RTE", "country": "BR"},
-            {"city": "São Paulo", "airport": "Congonhas Airport", "iata": "CGH", "country": "BR"},
-            {"city": "São Paulo De Olivença", "airport": "Senadora Eunice Micheles Airport", "iata": "OLC", "country": "BR"},
-            {"city": "São Pedro", "airport": "São Pedro Airport", "iata": "VXE", "country": "CV"},
-            {"city": "São Raimundo Nonato", "airport": "Serra da Capivara Airport", "iata": "NSR", "country": "BR"},
-            {"city": "São Roque", "airport": "São Paulo Catarina Executive Airport", "iata": "JHF", "country": "BR"},
-            {"city": "São Tomé", "airport": "São Tomé International Airport", "iata": "TMS", "country": "ST"},
-            {"city": "São Tomé & Príncipe", "airport": "Principe Airport", "iata": "PCP", "country": "ST"},
-            {"city": "Sé", "airport": "Macau Heliport at Outer Harbour Ferry Terminal", "iata": "XZM", "country": "MO"},
-            {"city": "Séguéla", "airport": "Séguéla Airport", "iata": "SEO", "country": "CI"},
-            {"city": "Sélibaby", "airport": "Sélibaby Airport", "iata": "SEY", "country": "MR"},
-            {"city": "Sétif", "airport": "Ain Arnat Airport", "iata": "QSF", "country": "DZ"},
-            {"city": "Sévaré", "airport": "Mopti Ambodédjo International Airport", "iata": "MZI", "country": "ML"},
-            {"city": "Sóc Trăng", "airport": "Sóc Trăng Airport", "iata": "SOA", "country": "VN"},
-            {"city": "Söderhamn", "airport": "Söderhamn Airport", "iata": "SOO", "country": "SE"},
-            {"city": "Sønderborg", "airport": "Sønderborg Airport", "iata": "SGD", "country": "DK"},
-            {"city": "Sørkjosen", "airport": "Sørkjosen Airport", "iata": "SOJ", "country": "NO"},
-            {"city": "Sŏndŏng-ni", "airport": "Sondok Airport", "iata": "DSO", "country": "KP"},
-            {"city": "T2", "airport": "Al Thaurah Airport", "iata": "SOR", "country": "SY"},
-            {"city": "Ta Noun", "airport": "Dara Sakor International Airport", "iata": "DSY", "country": "KH"},
-            {"city": "Ta'izz", "airport": "Ta'izz International Airport", "iata": "TAI", "country": "YE"},
-            {"city": "Taba", "airport": "Taba International Airport", "iata": "TCP", "country": "EG"},
-            {"city": "Tabal Island", "airport": "Tabal Airstrip", "iata": "TBV", "country": "MH"},
-            {"city": "Tabarka", "airport": "Tabarka-Aïn Draham International Airport", "iata": "TBJ", "country": "TN"},
-            {"city": "Tabas", "airport": "Tabas Airport", "iata": "TCX", "country": "IR"},
-            {"city": "Tabatinga", "airport": "Tabatinga Airport", "iata": "TBT", "country": "BR"},
-            {"city": "Tabiteuea South", "airport": "Tabiteuea South Airport", "iata": "TSU", "country": "KI"},
-            {"city": "Tablas Island", "airport": "Tugdan Airport", "iata": "TBH", "country": "PH"},
-            {"city": "Tablón De Tamara", "airport": "Tablón De Tamara Airport", "iata": "TTM", "country": "CO"},
-            {"city": "Tabora", "airport": "Tabora Airport", "iata": "TBO", "country": "TZ"},
-            {"city": "Tabou", "airport": "Tabou Airport", "iata": "TXU", "country": "CI"},
-            {"city": "Tabriz", "airport": "Tabriz International Airport", "iata": "TBZ", "country": "IR"},
-            {"city": "Tabuaeran Island", "airport": "Tabuaeran Island Airport", "iata": "TNV", "country": "KI"},
-            {"city": "Tabubil", "airport": "Tabubil Airport", "iata": "TBG", "country": "PG"},
-            {"city": "Tabuk", "airport": "Tabuk Airport", "iata": "TUU", "country": "SA"},
-            {"city": "Tabukan Utara, Sangihe Islands", "airport": "Naha Airport", "iata": "NAH", "country": "ID"},
-            {"city": "Tacheng", "airport": "Tacheng Qianquan Airport", "iata": "TCG", "country": "CN"},
-            {"city": "Tachileik", "airport": "Tachileik Airport", "iata": "THL", "country": "MM"},
-            {"city": "Tachina", "airport": "Carlos Concha Torres International Airport", "iata": "ESM", "country": "EC"},
-            {"city": "Tacloban City", "airport": "Daniel Z. Romualdez Airport", "iata": "TAC", "country": "PH"},
-            {"city": "Tacna", "airport": "Coronel FAP Carlos Ciriani Santa Rosa International Airport", "iata": "TCQ", "country": "PE"},
-            {"city": "Tacoma", "airport": "McChord Air Force Base", "iata": "TCM", "country": "US"},
-            {"city": "Tacoma", "airport": "Tacoma Narrows Airport", "iata": "TIW", "country": "US"},
-            {"city": "Tacuarembo", "airport": "Tacuarembo Airport", "iata": "TAW", "country": "UY"},
-            {"city": "Tadjoura", "airport": "Tadjoura Airport", "iata": "TDJ", "country": "DJ"},
-            {"city": "Tadmur", "airport": "Palmyra Airport", "iata": "PMS", "country": "SY"},
-            {"city": "Tadoule Lake", "airport": "Tadoule Lake Airport", "iata": "XTL", "country": "CA"},
-            {"city": "Taean", "airport": "Taean Airport", "iata": "QDY", "country": "KR"},
-            {"city": "Tafraoui", "airport": "Oran Tafraoui Airport", "iata": "TAF", "country": "DZ"},
-            {"city": "Taftan", "airport": "Taftan Airport", "iata": "TFT", "country": "PK"},
-            {"city": "Taganrog", "airport": "Taganrog Yuzhny Airport", "iata": "TGK", "country": "RU"},
-            {"city": "Taharoa", "airport": "Taharoa Aerodrome", "iata": "THH", "country": "NZ"},
-            {"city": "Tahir", "airport": "Jijel Ferhat Abbas Airport", "iata": "GJL", "country": "DZ"},
-            {"city": "Tahoua", "airport": "Tahoua Airport", "iata": "THZ", "country": "NE"},
-            {"city": "Tahsis", "airport": "Tahsis Seaplane Base", "iata": "ZTS", "country": "CA"},
-            {"city": "Taichung (Qingshui)", "airport": "Taichung International Airport / Ching Chuang Kang Air Base", "iata": "RMQ", "country": "TW"},
-            {"city": "Tainan (Rende)", "airport": "Tainan International Airport / Tainan Air Base", "iata": "TNN", "country": "TW"},
-            {"city": "Taipei (Songshan)", "airport": "Taipei Songshan Airport", "iata": "TSA", "country": "TW"},
-            {"city": "Taiping", "airport": "Taiping (Tekah) Airport", "iata": "TPG", "country": "MY"},
-            {"city": "Taisha", "airport": "Taisha Airport", "iata": "TSC", "country": "EC"},
-            {"city": "Taitung City", "airport": "Taitung Airport", "iata": "TTT", "country": "TW"},
-            {"city": "Taiyuan", "airport": "Taiyuan Yaocheng Airport", "iata": "TYC", "country": "CN"},
-            {"city": "Taiyuan", "airport": "Taiyuan Wusu International Airport", "iata": "TYN", "country": "CN"},
-            {"city": "Taizhou (Luqiao)", "airport": "Taizhou Luqiao Airport", "iata": "HYN", "country": "CN"},
-            {"city": "Takamatsu", "airport": "Takamatsu Airport", "iata": "TAK", "country": "JP"},
-            {"city": "Takengon", "airport": "Rembele Airport", "iata": "TXE", "country": "ID"},
-            {"city": "Taketomi", "airport": "Hateruma Airport", "iata": "HTR", "country": "JP"},
-            {"city": "Takotna", "airport": "Tatalina LRRS Airport", "iata": "TLJ", "country": "US"},
-            {"city": "Takotna", "airport": "Takotna Airport", "iata": "TCT", "country": "US"},
-            {"city": "Taksimo", "airport": "Taksimo Airport", "iata": "TKM", "country": "RU"},
-            {"city": "Taku Lodge", "airport": "Taku Lodge Seaplane Base", "iata": "TKL", "country": "US"},
-            {"city": "Takume", "airport": "Takume Airport", "iata": "TJN", "country": "PF"},
-            {"city": "Talakan Oil Field", "airport": "Talakan Airport", "iata": "TLK", "country": "RU"},
-            {"city": "Talang Gudang-Sumatra Island", "airport": "Pendopo Airport", "iata": "PDO", "country": "ID"},
-            {"city": "Talara", "airport": "Captain Victor Montes Arias International Airport", "iata": "TYL", "country": "PE"},
-            {"city": "Talasea", "airport": "Talasea Airport", "iata": "TLW", "country": "PG"},
-            {"city": "Talca", "airport": "Panguilemo Airport", "iata": "TLX", "country": "CL"},
-            {"city": "Taldykorgan", "airport": "Taldykorgan Airport", "iata": "TDK", "country": "KZ"},
-            {"city": "Taleqan", "airport": "Taleqan Airport", "iata": "TQN", "country": "AF"},
-            {"city": "Talkeetna", "airport": "Talkeetna Airport", "iata": "TKA", "country": "US"},
-            {"city": "Talladega", "airport": "Talladega Municipal Airport", "iata": "ASN", "country": "US"},
-            {"city": "Tallahassee", "airport": "Tallahassee Regional Airport", "iata": "TLH", "country": "US"},
-            {"city": "Tallard, Hautes-Alpes", "airport": "Gap-Tallard Airfield", "iata": "GAT", "country": "FR"},
-            {"city": "Tallinn", "airport": "Tallinn Linnahall Heliport", "iata": "CHE", "country": "EE"},
-            {"city": "Tallinn", "airport": "Lennart Meri Tallinn Airport", "iata": "TLL", "country": "EE"},
-            {"city": "Taloyoak", "airport": "Taloyoak Airport", "iata": "YYH", "country": "CA"},
-            {"city": "Taltal", "airport": "Las Breas Airport", "iata": "TTC", "country": "CL"},
-            {"city": "Taltheilei Narrows", "airport": "Taltheilei Narrows Airport", "iata": "GSL", "country": "CA"},
-            {"city": "Tam Nghĩa", "airport": "Chu Lai Airport", "iata": "VCL", "country": "VN"},
-            {"city": "Tamale", "airport": "Tamale Airport", "iata": "TML", "country": "GH"},
-            {"city": "Taman Negara", "airport": "Sungai Tiang Airport", "iata": "SXT", "country": "MY"},
-            {"city": "Tamana Island", "airport": "Tamana Island Airport", "iata": "TMN", "country": "KI"},
-            {"city": "Tamanrasset", "airport": "Aguenar – Hadj Bey Akhamok Airport", "iata": "TMR", "country": "DZ"},
-            {"city": "Tamarindo", "airport": "Tamarindo Airport", "iata": "TNO", "country": "CR"},
-            {"city": "Tambacounda", "airport": "Tambacounda Airport", "iata": "TUD", "country": "SN"},
-            {"city": "Tambao", "airport": "Tambao Airport", "iata": "TMQ", "country": "BF"},
-            {"city": "Tambelan", "airport": "Tambelan Airport", "iata": "TBX", "country": "ID"},
-            {"city": "Tambohorano", "airport": "Tambohorano Airport", "iata": "WTA", "country": "MG"},
-            {"city": "Tambov", "airport": "Donskoye Airport", "iata": "TBW", "country": "RU"},
-            {"city": "Tamchakett", "airport": "Tamchakett Airport", "iata": "THT", "country": "MR"},
-            {"city": "Tamchy", "airport": "Issyk-Kul International Airport", "iata": "IKU", "country": "KG"},
-            {"city": "Tame", "airport": "Gustavo Vargas Airport", "iata": "TME", "country": "CO"},
-            {"city": "Tampa", "airport": "MacDill Air Force Base", "iata": "MCF", "country": "US"},
-            {"city": "Tampa", "airport": "Tampa International Airport", "iata": "TPA", "country": "US"},
-            {"city": "Tampa", "airport": "Peter O Knight Airport", "iata": "TPF", "country": "US"},
-            {"city": "Tampa", "airport": "Tampa North Aero Park Airport", "iata": "KYO", "country": "US"},
-            {"city": "Tampere / Pirkkala", "airport": "Tampere-Pirkkala Airport", "iata": "TMP", "country": "FI"},
-            {"city": "Tampico", "airport": "General Francisco Javier Mina International Airport", "iata": "TAM", "country": "MX"},
-            {"city": "Tamuín", "airport": "Tamuín National Airport", "iata": "TSL", "country": "MX"},
-            {"city": "Tamworth", "airport": "Tamworth Airport", "iata": "TMW", "country": "AU"},
-            {"city": "Tan Tan", "airport": "Tan Tan Airport", "iata": "TTA", "country": "MA"},
-            {"city": "Tanacross", "airport": "Tanacross Airport", "iata": "TSG", "country": "US"},
-            {"city": "Tanah Grogot", "airport": "Tanah Grogot Airport", "iata": "TNB", "country": "ID"},
-            {"city": "Tanah Merah", "airport": "Tanah Merah Airport", "iata": "TMH", "country": "ID"},
-            {"city": "Tanana", "airport": "Ralph M Calhoun Memorial Airport", "iata": "TAL", "country": "US"},
-            {"city": "Tanandava", "airport": "Samangoky Airport", "iata": "TDV", "country": "MG"},
-            {"city": "Tanbar", "airport": "Arrabury Airport", "iata": "AAB", "country": "AU"},
-            {"city": "Tanbar Station", "airport": "Tanbar Airport", "iata": "TXR", "country": "AU"},
-            {"city": "Tandag", "airport": "Tandag Airport", "iata": "TDG", "country": "PH"},
-            {"city": "Tandil", "airport": "Héroes de Malvinas Airport", "iata": "TDL", "country": "AR"},
-            {"city": "Tanegashima", "airport": "New Tanegashima Airport", "iata": "TNE", "country": "JP"},
-            {"city": "Tanga", "airport": "Tanga Airport", "iata": "TGT", "country": "TZ"},
-            {"city": "Tangará da Serra", "airport": "Tangará da Serra Airport", "iata": "TGQ", "country": "BR"},
-            {"city": "Tangbu", "airport": "Wuzhou Xijiang Airport", "iata": "WUZ", "country": "CN"},
-            {"city": "Tangerang-Java Island", "airport": "Budiarto Airport", "iata": "RTO", "country": "ID"},
-            {"city": "Tangier", "airport": "Tangier Ibn Battuta Airport", "iata": "TNG", "country": "MA"},
-            {"city": "Tangshan (Fengrun)", "airport": "Tangshan Sannühe Airport", "iata": "TVS", "country": "CN"},
-            {"city": "Tanjung Balai-Karinmunbesar Island", "airport": "Raja Haji Abdullah Airport", "iata": "TJB", "country": "ID"},
-            {"city": "Tanjung Pandan", "airport": "H A S Hanandjoeddin International Airport", "iata": "TJQ", "country": "ID"},
-            {"city": "Tanjung Pinang-Bintan Island", "airport": "Raja Haji Fisabilillah International Airport", "iata": "TNJ", "country": "ID"},
-            {"city": "Tanjung Redeb - Borneo Island", "airport": "Kalimarau Airport", "iata": "BEJ", "country": "ID"},
-            {"city": "Tanjung Selor-Borneo Island", "airport": "Tanjung Harapan Airport", "iata": "TJS", "country": "ID"},
-            {"city": "Tanna Island", "airport": "Whitegrass Airport", "iata": "TAH", "country": "VU"},
-            {"city": "Tanta-Tabalong", "airport": "Warukin Airport", "iata": "TJG", "country": "ID"},
-            {"city": "Taos", "airport": "Taos Regional Airport", "iata": "TSM", "country": "US"},
-            {"city": "Taoyuan", "airport": "Taiwan Taoyuan International Airport", "iata": "TPE", "country": "TW"},
-            {"city": "Tapachula", "airport": "Tapachula International Airport", "iata": "TAP", "country": "MX"},
-            {"city": "Tapaktuan", "airport": "Teuku Cut Ali Airport", "iata": "TPK", "country": "ID"},
-            {"city": "Tapeta", "airport": "Tapeta Airport", "iata": "TPT", "country": "LR"},
-            {"city": "Tapini", "airport": "Tapini Airport", "iata": "TPI", "country": "PG"},
-            {"city": "Taplejung", "airport": "Taplejung Airport", "iata": "TPJ", "country": "NP"},
-            {"city": "Tarabo", "airport": "Tarabo Airport", "iata": "TBQ", "country": "PG"},
-            {"city": "Tarakan", "airport": "Juwata International Airport / Suharnoko Harbani AFB", "iata": "TRK", "country": "ID"},
-            {"city": "Tarakbits", "airport": "Tarakbits Airport", "iata": "TRJ", "country": "PG"},
-            {"city": "Tarama", "airport": "Tarama Airport", "iata": "TRA", "country": "JP"},
-            {"city": "Tarapacá", "airport": "Tarapacá Airport", "iata": "TCD", "country": "CO"},
-            {"city": "Tarapoa", "airport": "Tarapoa Airport", "iata": "TPC", "country": "EC"},
-            {"city": "Tarapoto", "airport": "Cadete FAP Guillermo Del Castillo Paredes Airport", "iata": "TPP", "country": "PE"},
-            {"city": "Tarauacá", "airport": "Tarauacá Airport", "iata": "TRQ", "country": "BR"},
-            {"city": "Tarawa", "airport": "Bonriki International Airport", "iata": "TRW", "country": "KI"},
-            {"city": "Taraz", "airport": "Taraz Airport", "iata": "DMB", "country": "KZ"},
-            {"city": "Tarbela", "airport": "Tarbela Dam Airport", "iata": "TLB", "country": "PK"},
-            {"city": "Tarbes/Lourdes/Pyrénées", "airport": "Tarbes-Lourdes-Pyrénées Airport", "iata": "LDE", "country": "FR"},
-            {"city": "Tarcoola", "airport": "Tarcoola Airport", "iata": "TAQ", "country": "AU"},
-            {"city": "Taree", "airport": "Taree Airport", "iata": "TRO", "country": "AU"},
-            {"city": "Tari", "airport": "Tari Airport", "iata": "TIZ", "country": "PG"},
-            {"city": "Tarija", "airport": "Capitan Oriel Lea Plaza Airport", "iata": "TJA", "country": "BO"},
-            {"city": "Tarinkot", "airport": "Tarinkot Airport", "iata": "TII", "country": "AF"},
-            {"city": "Tarko-Sale", "airport": "Tarko-Sale Airport", "iata": "TQL", "country": "RU"},
-            {"city": "Tarsus", "airport": "Çukurova International Airport", "iata": "COV", "country": "TR"},
-            {"city": "Tartagal", "airport": "General Enrique Mosconi Airport", "iata": "TTG", "country": "AR"},
-            {"city": "Tashikuergan", "airport": "Tashikuergan Hongqilafu Airport", "iata": "HQL", "country": "CN"},
-            {"city": "Tashkent", "airport": "Tashkent International Airport", "iata": "TAS", "country": "UZ"},
-            {"city": "Tasiilaq", "airport": "Tasiilaq Heliport", "iata": "AGM", "country": "GL"},
-            {"city": "Tasikmalaya-Java Island", "airport": "Cibeureum Airport", "iata": "TSY", "country": "ID"},
-            {"city": "Tasiujaq", "airport": "Tasiujaq Airport", "iata": "YTQ", "country": "CA"},
-            {"city": "Tasiusak", "airport": "Tasiusaq Heliport", "iata": "XEQ", "country": "GL"},
-            {"city": "Tasiusaq", "airport": "Tasiusaq Heliport", "iata": "TQA", "country": "GL"},
-            {"city": "Tatakoto", "airport": "Tatakoto Airport", "iata": "TKV", "country": "PF"},
-            {"city": "Tatau Island", "airport": "Mapua(Mabua) Airport", "iata": "MPU", "country": "PG"},
-            {"city": "Tatitlek", "airport": "Tatitlek Airport", "iata": "TEK", "country": "US"},
-            {"city": "Taupo", "airport": "Taupo Airport", "iata": "TUO", "country": "NZ"},
-            {"city": "Tauramena", "airport": "Tauramena Airport", "iata": "TAU", "country": "CO"},
-            {"city": "Tauranga", "airport": "Tauranga Airport", "iata": "TRG", "country": "NZ"},
-            {"city": "Tauá", "airport": "Pedro Teixeira Castelo Airport", "iata": "JTA", "country": "BR"},
-            {"city": "Tawa", "airport": "Tawa Airport", "iata": "TWY", "country": "PG"},
-            {"city": "Tawau", "airport": "Tawau Airport", "iata": "TWU", "country": "MY"},
-            {"city": "Taylor", "airport": "Taylor Airport", "iata": "TWE", "country": "US"},
-            {"city": "Taylor", "airport": "Taylor Airport", "iata": "TYZ", "country": "US"},
-            {"city": "Taytay", "airport": "Cesar Lim Rodriguez (Taytay-Sandoval) Airport", "iata": "RZP", "country": "PH"},
-            {"city": "Ta’if", "airport": "Ta’if Regional Airport", "iata": "TIF", "country": "SA"},
-            {"city": "Tbeng Meanchey", "airport": "Preah Vinhear Airport", "iata": "OMY", "country": "KH"},
-            {"city": "Tbilisi", "airport": "Tbilisi International Airport", "iata": "TBS", "country": "GE"},
-            {"city": "Tchibanga", "airport": "Tchibanga Airport", "iata": "TCH", "country": "GA"},
-            {"city": "Te One", "airport": "Chatham Islands / Tuuta Airport", "iata": "CHT", "country": "NZ"},
-            {"city": "Tefé", "airport": "Tefé Airport", "iata": "TFF", "country": "BR"},
-            {"city": "Tegucigalpa", "airport": "Toncontín International Airport", "iata": "TGU", "country": "HN"},
-            {"city": "Tehachapi", "airport": "Tehachapi Municipal Airport", "iata": "TSP", "country": "US"},
-            {"city": "Tehran", "airport": "Imam Khomeini International Airport", "iata": "IKA", "country": "IR"},
-            {"city": "Tehran", "airport": "Mehrabad International Airport", "iata": "THR", "country": "IR"},
-            {"city": "Tehuacán", "airport": "Tehuacán National Airport", "iata": "TCN", "country": "MX"},
-            {"city": "Teixeira de Freitas", "airport": "9 de Maio - Teixeira de Freitas Airport", "iata": "TXF", "country": "BR"},
-            {"city": "Tekadu", "airport": "Tekadu Airport", "iata": "TKB", "country": "PG"},
-            {"city": "Tekin", "airport": "Tekin Airport", "iata": "TKW", "country": "PG"},
-            {"city": "Tel Aviv", "airport": "Ben Gurion International Airport", "iata": "TLV", "country": "IL"},
-            {"city": "Tela", "airport": "Tela Airport", "iata": "TEA", "country": "HN"},
-            {"city": "Telefomin", "airport": "Telefomin Airport", "iata": "TFM", "country": "PG"},
-            {"city": "Telida", "airport": "Telida Airport", "iata": "TLF", "country": "US"},
-            {"city": "Teller", "airport": "Teller Airport", "iata": "TLA", "country": "US"},
-            {"city": "Telluride", "airport": "Telluride Regional Airport", "iata": "TEX", "country": "US"},
-            {"city": "Telupid", "airport": "Telupid Airport", "iata": "TEL", "country": "MY"},
-            {"city": "Telêmaco Borba", "airport": "Telêmaco Borba Airport", "iata": "TEC", "country": "BR"},
-            {"city": "Temixco", "airport": "General Mariano Matamoros International Airport", "iata": "CVJ", "country": "MX"},
-            {"city": "Temora", "airport": "Temora Airport", "iata": "TEM", "country": "AU"},
-            {"city": "Temple", "airport": "Draughon Miller Central Texas Regional Airport", "iata": "TPL", "country": "US"},
-            {"city": "Temuco", "airport": "La Araucanía Airport", "iata": "ZCO", "country": "CL"},
-            {"city": "Temuco", "airport": "Maquehue Airport", "iata": "PZS", "country": "CL"},
-            {"city": "Tenakee Springs", "airport": "Tenakee Seaplane Base", "iata": "TKE", "country": "US"},
-            {"city": "Tenerife", "airport": "Tenerife Sur Airport", "iata": "TFS", "country": "ES"},
-            {"city": "Tenerife", "airport": "Tenerife Norte-Ciudad de La Laguna Airport", "iata": "TFN", "country": "ES"},
-            {"city": "Tenkodogo", "airport": "Tenkodogo Airport", "iata": "TEG", "country": "BF"},
-            {"city": "Tennant Creek", "airport": "Tennant Creek Airport", "iata": "TCA", "country": "AU"},
-            {"city": "Tepic", "airport": "Amado Nervo National Airport", "iata": "TPQ", "country": "MX"},
-            {"city": "Teptep", "airport": "Tep Tep Airport", "iata": "TEP", "country": "PG"},
-            {"city": "Teraina", "airport": "Washington Island Airstrip", "iata": "TNQ", "country": "KI"},
-            {"city": "Terapo Mission", "airport": "Terapo Airport", "iata": "TEO", "country": "PG"},
-            {"city": "Teresina", "airport": "Senador Petrônio Portela Airport", "iata": "THE", "country": "BR"},
-            {"city": "Termas de Río Hondo", "airport": "Termas de Río Hondo international Airport", "iata": "RHD", "country": "AR"},
-            {"city": "Termez", "airport": "Termez Airport", "iata": "TMJ", "country": "UZ"},
-            {"city": "Terney", "airport": "Terney Airport", "iata": "NEI", "country": "RU"},
-            {"city": "Ternopil", "airport": "Ternopil International Airport", "iata": "TNL", "country": "UA"},
-            {"city": "Terrace", "airport": "Northwest Regional Airport Terrace-Kitimat", "iata": "YXT", "country": "CA"},
-            {"city": "Terrace Bay", "airport": "Terrace Bay Airport", "iata": "TCY", "country": "NA"},
-            {"city": "Terre Haute", "airport": "Terre Haute Regional Airport, Hulman Field", "iata": "HUF", "country": "US"},
-            {"city": "Terrell", "airport": "Terrell Municipal Airport", "iata": "TRL", "country": "US"},
-            {"city": "Teruel", "airport": "Teruel Airport", "iata": "TEV", "country": "ES"},
-            {"city": "Teslin", "airport": "Teslin Airport", "iata": "YZW", "country": "CA"},
-            {"city": "Tessenei", "airport": "Tessenei Airport", "iata": "TES", "country": "ER"},
-            {"city": "Tete", "airport": "Chingozi Airport", "iata": "TET", "country": "MZ"},
-            {"city": "Tetebedi", "airport": "Tetebedi Airport", "iata": "TDB", "country": "PG"},
-            {"city": "Teterboro", "airport": "Teterboro Airport", "iata": "TEB", "country": "US"},
-            {"city": "Tetiaroa", "airport": "Tetiaroa Airport", "iata": "TTI", "country": "PF"},
-            {"city": "Tetlin", "airport": "Tetlin Airport", "iata": "TEH", "country": "US"},
-            {"city": "Texada", "airport": "Texada Gillies Bay Airport", "iata": "YGB", "country": "CA"},
-            {"city": "Texarkana", "airport": "Texarkana Regional Airport (Webb Field)", "iata": "TXK", "country": "US"},
-            {"city": "Tezu", "airport": "Tezu Airport", "iata": "TEI", "country": "IN"},
-            {"city": "Teófilo Otoni", "airport": "Juscelino Kubitscheck Airport", "iata": "TFL", "country": "BR"},
-            {"city": "Thaba-Tseka", "airport": "Thaba-Tseka Airport", "iata": "THB", "country": "LS"},
-            {"city": "Thakhek", "airport": "Thakhek Airport", "iata": "THK", "country": "LA"},
-            {"city": "Thakurgaon", "airport": "Thakurgaon Airport", "iata": "TKR", "country": "BD"},
-            {"city": "Thandwe", "airport": "Thandwe Airport", "iata": "SNW", "country": "MM"},
-            {"city": "Thanh Hóa", "airport": "Tho Xuan Airport", "iata": "THD", "country": "VN"},
-            {"city": "Thanjavur", "airport": "Thanjavur Air Force Station", "iata": "TJV", "country": "IN"},
-            {"city": "Thargomindah", "airport": "Thargomindah Airport", "iata": "XTG", "country": "AU"},
-            {"city": "The Granites Gold Mine", "airport": "The Granites Airport", "iata": "GTS", "country": "AU"},
-            {"city": "The Pas", "airport": "The Pas Airport", "iata": "YQD", "country": "CA"},
-            {"city": "The Valley", "airport": "Clayton J Lloyd International Airport", "iata": "AXA", "country": "AI"},
-            {"city": "Thermopolis", "airport": "Hot Springs County Airport", "iata": "THP", "country": "US"},
-            {"city": "Thessaloniki", "airport": "Thessaloniki Macedonia International Airport", "iata": "SKG", "country": "GR"},
-            {"city": "Thetis Island", "airport": "Telegraph Harbour Seaplane Base", "iata": "YBQ", "country": "CA"},
-            {"city": "Thicket Portage", "airport": "Thicket Portage Airport", "iata": "YTD", "country": "CA"},
-            {"city": "Thief River Falls", "airport": "Thief River Falls Regional Airport", "iata": "TVF", "country": "US"},
-            {"city": "Thimarafushi", "airport": "Thimarafushi Airport", "iata": "TMF", "country": "MV"},
-            {"city": "Thiruvananthapuram", "airport": "Thiruvananthapuram International Airport", "iata": "TRV", "country": "IN"},
-            {"city": "Thisted", "airport": "Thisted Airport", "iata": "TED", "country": "DK"},
-            {"city": "Thohoyandou", "airport": "Thohoyandou Airport", "iata": "THY", "country": "ZA"},
-            {"city": "Thomasville", "airport": "York Airport", "iata": "THV", "country": "US"},
-            {"city": "Thomasville", "airport": "Thomasville Regional Airport", "iata": "TVI", "country": "US"},
-            {"city": "Thompson", "airport": "Thompson Airport", "iata": "YTH", "country": "CA"},
-            {"city": "Thompson Falls", "airport": "Thompson Falls Airport", "iata": "THM", "country": "US"},
-            {"city": "Thorne Bay", "airport": "Thorne Bay Seaplane Base", "iata": "KTB", "country": "US"},
-            {"city": "Three Rivers", "airport": "Three Rivers Municipal Dr Haines Airport", "iata": "HAI", "country": "US"},
-            {"city": "Thumrait", "airport": "Thumrait Air Base", "iata": "TTH", "country": "OM"},
-            {"city": "Thunder Bay", "airport": "Thunder Bay Airport", "iata": "YQT", "country": "CA"},
-            {"city": "Tiakur", "airport": "Jos Orno Imsula Airport", "iata": "JIO", "country": "ID"},
-            {"city": "Tianjin", "airport": "Tianjin Binhai International Airport", "iata": "TSN", "country": "CN"},
-            {"city": "Tianshui (Maiji)", "airport": "Tianshui Maijishan Airport", "iata": "THQ", "country": "CN"},
-            {"city": "Tiaret", "airport": "Abdelhafid Boussouf Bou Chekif Airport", "iata": "TID", "country": "DZ"},
-            {"city": "Tibú", "airport": "Tibú Airport", "iata": "TIB", "country": "CO"},
-            {"city": "Ticantiquí", "airport": "Ticantiquí Airport", "iata": "TJC", "country": "PA"},
-            {"city": "Tichitt", "airport": "Tichitt Airport", "iata": "THI", "country": "MR"},
-            {"city": "Tidjikja", "airport": "Tidjikja Airport", "iata": "TIY", "country": "MR"},
-            {"city": "Tifalmin", "airport": "Tifalmin Airport", "iata": "TFB", "country": "PG"},
-            {"city": "Tifton", "airport": "Henry Tift Myers Airport", "iata": "TMA", "country": "US"},
-            {"city": "Tiga", "airport": "Tiga Airport", "iata": "TGJ", "country": "NC"},
-            {"city": "Tigi", "airport": "Deiyai / Waghete Baru Airport", "iata": "WET", "country": "ID"},
-            {"city": "Tijuana", "airport": "General Abelardo L. Rodriguez International Airport", "iata": "TIJ", "country": "MX"},
-            {"city": "Tikapur", "airport": "Tikapur Airport", "iata": "TPU", "country": "NP"},
-            {"city": "Tikchik", "airport": "Tikchik Lodge Seaplane Base", "iata": "KTH", "country": "US"},
-            {"city": "Tiko", "airport": "Tiko Airport", "iata": "TKC", "country": "CM"},
-            {"city": "Tikong-Taliabu Island", "airport": "Taliabu Island Airport", "iata": "TAX", "country": "ID"},
-            {"city": "Tiksi", "airport": "Tiksi Airport", "iata": "IKS", "country": "RU"},
-            {"city": "Tilin", "airport": "Tilin Airport", "iata": "TIO", "country": "MM"},
-            {"city": "Tillamook", "airport": "Tillamook Airport", "iata": "OTK", "country": "US"},
-            {"city": "Timbavati", "airport": "Tanda Tula Airport", "iata": "TDT", "country": "ZA"},
-            {"city": "Timbedra", "airport": "Timbedra Airport", "iata": "TMD", "country": "MR"},
-            {"city": "Timbiqui", "airport": "Timbiqui Airport", "iata": "TBD", "country": "CO"},
-            {"city": "Timbuktu", "airport": "Timbuktu Airport", "iata": "TOM", "country": "ML"},
-            {"city": "Timbunke", "airport": "Timbunke Airport", "iata": "TBE", "country": "PG"},
-            {"city": "Timika", "airport": "Mozes Kilangin Airport", "iata": "TIM", "country": "ID"},
-            {"city": "Timimoun", "airport": "Timimoun Airport", "iata": "TMX", "country": "DZ"},
-            {"city": "Timişoara", "airport": "Timişoara Traian Vuia Airport", "iata": "TSR", "country": "RO"},
-            {"city": "Timmins", "airport": "Timmins/Victor M. Power", "iata": "YTS", "country": "CA"},
-            {"city": "Tin City", "airport": "Tin City Long Range Radar Station Airport", "iata": "TNC", "country": "US"},
-            {"city": "Tinboli", "airport": "Tinboli Airport", "iata": "TCK", "country": "PG"},
-            {"city": "Tindouf", "airport": "Tindouf Airport", "iata": "TIN", "country": "DZ"},
-            {"city": "Tingo Maria", "airport": "Tingo Maria Airport", "iata": "TGI", "country": "PE"},
-            {"city": "Tinian Island", "airport": "Tinian International Airport", "iata": "TIQ", "country": "MP"},
-            {"city": "Tiniteqilaaq", "airport": "Tiniteqilaaq Heliport", "iata": "TQI", "country": "GL"},
-            {"city": "Tinson Pen", "airport": "Tinson Pen Airport", "iata": "KTP", "country": "JM"},
-            {"city": "Tinúm", "airport": "Chichén Itzá International Airport", "iata": "CZA", "country": "MX"},
-            {"city": "Tioga", "airport": "Tioga Municipal Airport", "iata": "VEX", "country": "US"},
-            {"city": "Tiom-Papua Island", "airport": "Tiom Airport", "iata": "TMY", "country": "ID"},
-            {"city": "Tioman Island", "airport": "Tioman Airport", "iata": "TOD", "country": "MY"},
-            {"city": "Tippi", "airport": "Tippi Airport", "iata": "TIE", "country": "ET"},
-            {"city": "Tiputini", "airport": "Tiputini Airport", "iata": "TPN", "country": "EC"},
-            {"city": "Tiruchirappalli", "airport": "Tiruchirappalli International Airport", "iata": "TRZ", "country": "IN"},
-            {"city": "Tirupati", "airport": "Tirupati Airport", "iata": "TIR", "country": "IN"},
-            {"city": "Tisdale", "airport": "Tisdale Airport", "iata": "YTT", "country": "CA"},
-            {"city": "Tissamaharama", "airport": "Tissa Tank Waterdrome", "iata": "TTW", "country": "LK"},
-            {"city": "Titusville", "airport": "Space Coast Regional Airport", "iata": "TIX", "country": "US"},
-            {"city": "Tivat", "airport": "Tivat Airport", "iata": "TIV", "country": "ME"},
-            {"city": "Tiwatobi", "airport": "Larantuka Gewayentana Airport", "iata": "LKA", "country": "ID"},
-            {"city": "Tizimin", "airport": "Aeródromo de Cupul", "iata": "TZM", "country": "MX"},
-            {"city": "Tlokoeng", "airport": "Tlokoeng Airport", "iata": "TKO", "country": "LS"},
-            {"city": "Toamasina", "airport": "Toamasina Ambalamanasy Airport", "iata": "TMM", "country": "MG"},
-            {"city": "Tobermorey", "airport": "Tobermorey Airport", "iata": "TYP", "country": "AU"},
-            {"city": "Tobolsk", "airport": "Remezov Airport", "iata": "RMZ", "country": "RU"},
-            {"city": "Tobolsk", "airport": "Tobolsk Airport", "iata": "TOX", "country": "RU"},
-            {"city": "Toccoa", "airport": "Toccoa Airport - R.G. Letourneau Field", "iata": "TOC", "country": "US"},
-            {"city": "Tocoa", "airport": "Tocoa Airport", "iata": "TCF", "country": "HN"},
-            {"city": "Tocopilla", "airport": "Barriles Airport", "iata": "TOQ", "country": "CL"},
-            {"city": "Tocumen", "airport": "Tocumen International Airport", "iata": "PTY", "country": "PA"},
-            {"city": "Tofino", "airport": "Tofino Harbour Seaplane Base", "iata": "YTP", "country": "CA"},
-            {"city": "Tofino", "airport": "Tofino / Long Beach Airport", "iata": "YAZ", "country": "CA"},
-            {"city": "Togiak Village", "airport": "Togiak Airport", "iata": "TOG", "country": "US"},
-            {"city": "Tojo Una-Una", "airport": "Tanjung Api Airport", "iata": "OJU", "country": "ID"},
-            {"city": "Tok", "airport": "Tok Junction Airport", "iata": "TKJ", "country": "US"},
-            {"city": "Tokat", "airport": "Tokat Airport", "iata": "TJK", "country": "TR"},
-            {"city": "Tokeen", "airport": "Tokeen Seaplane Base", "iata": "TKI", "country": "US"},
-            {"city": "Tokoname", "airport": "Chubu Centrair International Airport", "iata": "NGO", "country": "JP"},
-            {"city": "Tokoroa", "airport": "Tokoroa Airfield", "iata": "TKZ", "country": "NZ"},
-            {"city": "Toksook Bay", "airport": "Toksook Bay Airport", "iata": "OOK", "country": "US"},
-            {"city": "Tokushima", "airport": "Tokushima Awaodori Airport / JMSDF Tokushima Air Base", "iata": "TKS", "country": "JP"},
-            {"city": "Tokyo", "airport": "Tokyo Haneda International Airport", "iata": "HND", "country": "JP"},
-            {"city": "Tol", "airport": "Tol Airport", "iata": "TLO", "country": "PG"},
-            {"city": "Tola", "airport": "Costa Esmeralda Airport", "iata": "ECI", "country": "NI"},
-            {"city": "Toledo", "airport": "Ed Carlson Memorial Field South Lewis County Airport", "iata": "TDO", "country": "US"},
-            {"city": "Toledo", "airport": "Toledo Executive Airport", "iata": "TDZ", "country": "US"},
-            {"city": "Toledo", "airport": "Eugene F. Kranz Toledo Express Airport", "iata": "TOL", "country": "US"},
-            {"city": "Toledo", "airport": "Toledo - Luiz Dalcanale Filho Municipal Airport", "iata": "TOW", "country": "BR"},
-            {"city": "Toli Toli-Celebes Island", "airport": "Sultan Bantilan Airport", "iata": "TLI", "country": "ID"},
-            {"city": "Toliara", "airport": "Toliara Airport", "iata": "TLE", "country": "MG"},
-            {"city": "Toluca", "airport": "Adolfo López Mateos International Airport", "iata": "TLC", "country": "MX"},
-            {"city": "Tom Price", "airport": "Tom Price Airport", "iata": "TPR", "country": "AU"},
-            {"city": "Tomanggong", "airport": "Tomanggong Airport", "iata": "TMG", "country": "MY"},
-            {"city": "Tomblaine, Meurthe-et-Moselle", "airport": "Nancy-Essey Airport", "iata": "ENC", "country": "FR"},
-            {"city": "Toms River", "airport": "Ocean County Airport", "iata": "MJX", "country": "US"},
-            {"city": "Tomsk", "airport": "Bogashevo Airport", "iata": "TOF", "country": "RU"},
-            {"city": "Ton Phueng", "airport": "Bokeo International Airport", "iata": "BOR", "country": "LA"},
-            {"city": "Tonghua", "airport": "Tonghua Sanyuanpu Airport", "iata": "TNH", "country": "CN"},
-            {"city": "Tongliao", "airport": "Tongliao Airport", "iata": "TGO", "country": "CN"},
-            {"city": "Tongoa Island", "airport": "Tongoa Airport", "iata": "TGH", "country": "VU"},
-            {"city": "Tongren (Daxing)", "airport": "Tongren Fenghuang Airport", "iata": "TEN", "country": "CN"},
-            {"city": "Tonopah", "airport": "Tonopah Test Range Airport", "iata": "XSD", "country": "US"},
-            {"city": "Tonopah", "airport": "Tonopah Airport", "iata": "TPH", "country": "US"},
-            {"city": "Tonu", "airport": "Tonu Airport", "iata": "TON", "country": "PG"},
-            {"city": "Toowoomba", "airport": "Toowoomba Wellcamp Airport", "iata": "WTB", "country": "AU"},
-            {"city": "Toowoomba", "airport": "Toowoomba Airport", "iata": "TWB", "country": "AU"},
-            {"city": "Topeka", "airport": "Topeka Regional Airport", "iata": "FOE", "country": "US"},
-            {"city": "Topeka", "airport": "Philip Billard Municipal Airport", "iata": "TOP", "country": "US"},
-            {"city": "Toraja", "airport": "Toraja Airport", "iata": "TRT", "country": "ID"},
-            {"city": "Toranagallu", "airport": "Jindal Vijaynagar Airport", "iata": "VDY", "country": "IN"},
-            {"city": "Torembi", "airport": "Torembi Airport", "iata": "TCJ", "country": "PG"},
-            {"city": "Torokina", "airport": "Torokina Airport", "iata": "TOK", "country": "PG"},
-            {"city": "Toronto", "airport": "Billy Bishop Toronto City Centre Airport", "iata": "YTZ", "country": "CA"},
-            {"city": "Toronto", "airport": "Toronto Lester B. Pearson International Airport", "iata": "YYZ", "country": "CA"},
-            {"city": "Tororo", "airport": "Tororo Airport", "iata": "TRY", "country": "UG"},
-            {"city": "Torp", "airport": "Sandefjord Airport, Torp", "iata": "TRF", "country": "NO"},
-            {"city": "Torrance", "airport": "Zamperini Field", "iata": "TOA", "country": "US"},
-            {"city": "Torres", "airport": "Torres Airport", "iata": "TSQ", "country": "BR"},
-            {"city": "Torreón", "airport": "Francisco Sarabia Tinoco International Airport", "iata": "TRC", "country": "MX"},
-            {"city": "Torrington", "airport": "Torrington Municipal Airport", "iata": "TOR", "country": "US"},
-            {"city": "Torsby", "airport": "Torsby Airport", "iata": "TYF", "country": "SE"},
-            {"city": "Tortola", "airport": "Tortola West End Seaplane Base", "iata": "TOV", "country": "VG"},
-            {"city": "Tortola", "airport": "Road Town Seaplane Base", "iata": "RAD", "country": "VG"},
-            {"city": "Tortuguero", "airport": "Barra del Tortuguero", "iata": "TTQ", "country": "CR"},
-            {"city": "Torwood", "airport": "Torwood Airport", "iata": "TWP", "country": "AU"},
-            {"city": "Tosontsengel", "airport": "Tosontsengel Airport", "iata": "TNZ", "country": "MN"},
-            {"city": "Totness", "airport": "Totness Airport", "iata": "TOT", "country": "SR"},
-            {"city": "Tottori", "airport": "Tottori Sand Dunes Conan Airport", "iata": "TTJ", "country": "JP"},
-            {"city": "Touba", "airport": "Mahana Airport", "iata": "TOZ", "country": "CI"},
-            {"city": "Tougan", "airport": "Tougan Airport", "iata": "TUQ", "country": "BF"},
-            {"city": "Touggourt", "airport": "Touggourt Sidi Madhi Airport", "iata": "TGR", "country": "DZ"},
-            {"city": "Touho", "airport": "Touho Airport", "iata": "TOU", "country": "NC"},
-            {"city": "Toulouse/Blagnac", "airport": "Toulouse-Blagnac Airport", "iata": "TLS", "country": "FR"},
-            {"city": "Tours, Indre-et-Loire", "airport": "Tours Val de Loire Airport", "iata": "TUF", "country": "FR"},
-            {"city": "Toussus-le-Noble, Yvelines", "airport": "Toussus-le-Noble Airport", "iata": "TNF", "country": "FR"},
-            {"city": "Townsville", "airport": "Townsville Airport / RAAF Base Townsville", "iata": "TSV", "country": "AU"},
-            {"city": "Toyama", "airport": "Toyama Airport", "iata": "TOY", "country": "JP"},
-            {"city": "Toyooka", "airport": "Konotori Tajima Airport", "iata": "TJH", "country": "JP"},
-            {"city": "Tozeur", "airport": "Tozeur Nefta International Airport", "iata": "TOE", "country": "TN"},
-            {"city": "Trabzon", "airport": "Trabzon International Airport", "iata": "TZX", "country": "TR"},
-            {"city": "Trail", "airport": "Trail Regional Airport", "iata": "YZZ", "country": "CA"},
-            {"city": "Trang", "airport": "Trang Airport", "iata": "TST", "country": "TH"},
-            {"city": "Trapani (TP)", "airport": "Vincenzo Florio Airport Trapani-Birgi", "iata": "TPS", "country": "IT"},
-            {"city": "Traverse City", "airport": "Cherry Capital Airport", "iata": "TVC", "country": "US"},
-            {"city": "Treasure Cay", "airport": "Treasure Cay Airport", "iata": "TCB", "country": "BS"},
-            {"city": "Treinta y Tres", "airport": "Treinta y Tres Airport", "iata": "TYT", "country": "UY"},
-            {"city": "Trenton", "airport": "CFB Trenton", "iata": "YTR", "country": "CA"},
-            {"city": "Trenton", "airport": "Trenton Municipal Airport", "iata": "TRX", "country": "US"},
-            {"city": "Trepell", "airport": "Trepell Airport", "iata": "TQP", "country": "AU"},
-            {"city": "Tres Arroyos", "airport": "Tres Arroyos Airport", "iata": "OYO", "country": "AR"},
-            {"city": "Tres Esquinas", "airport": "Captain Ernesto Esguerra Cubides Air Base", "iata": "TQS", "country": "CO"},
-            {"city": "Treviso (TV)", "airport": "Treviso Antonio Canova Airport", "iata": "TSF", "country": "IT"},
-            {"city": "Trier", "airport": "Spangdahlem Air Base", "iata": "SPM", "country": "DE"},
-            {"city": "Trincomalee", "airport": "Trincomalee Harbor Waterdrome", "iata": "THW", "country": "LK"},
-            {"city": "Trincomalee", "airport": "China Bay Airport", "iata": "TRR", "country": "LK"},
-            {"city": "Trinidad", "airport": "Perry Stokes Airport", "iata": "TAD", "country": "US"},
-            {"city": "Trinidad", "airport": "Alberto Delgado Airport", "iata": "TND", "country": "CU"},
-            {"city": "Trinidad", "airport": "Trinidad Airport", "iata": "TDA", "country": "CO"},
-            {"city": "Trinidad", "airport": "Teniente Av. Jorge Henrich Arauz Airport", "iata": "TDD", "country": "BO"},
-            {"city": "Tripoli", "airport": "Mitiga International Airport", "iata": "MJI", "country": "LY"},
-            {"city": "Tripoli", "airport": "Rene Mouawad Air Base / Kleyate Airport", "iata": "KYE", "country": "LB"},
-            {"city": "Trois-Rivières", "airport": "Trois-Rivières Airport", "iata": "YRQ", "country": "CA"},
-            {"city": "Trollenhagen", "airport": "Neubrandenburg Trollenhagen Airport", "iata": "FNB", "country": "DE"},
-            {"city": "Trollhättan", "airport": "Trollhättan-Vänersborg Airport", "iata": "THN", "country": "SE"},
-            {"city": "Tromsø", "airport": "Tromsø Airport, Langnes", "iata": "TOS", "country": "NO"},
-            {"city": "Trona", "airport": "Trona Airport", "iata": "TRH", "country": "US"},
-            {"city": "Trondheim", "airport": "Trondheim Airport, Værnes", "iata": "TRD", "country": "NO"},
-            {"city": "Troy", "airport": "Troy Municipal Airport at N Kenneth Campbell Field", "iata": "TOI", "country": "US"},
-            {"city": "Truckee", "airport": "Truckee Tahoe Airport", "iata": "TKF", "country": "US"},
-            {"city": "Trujillo", "airport": "Trujillo Airport", "iata": "TJI", "country": "HN"},
-            {"city": "Trujillo", "airport": "Capitan FAP Carlos Martinez De Pinillos International Airport", "iata": "TRU", "country": "PE"},
-            {"city": "Truth or Consequences", "airport": "Truth or Consequences Municipal Airport", "iata": "TCS", "country": "US"},
-            {"city": "Trémuson, Côtes-d'Armor", "airport": "Saint-Brieuc-Armor Airport", "iata": "SBK", "country": "FR"},
-            {"city": "Três Lagoas", "airport": "Plínio Alarcom Airport", "iata": "TJL", "country": "BR"},
-            {"city": "Tsaratanana", "airport": "Tsaratanana Airport", "iata": "TTS", "country": "MG"},
-            {"city": "Tsetserleg", "airport": "Tsetserleg Airport", "iata": "TSZ", "country": "MN"},
-            {"city": "Tsewi", "airport": "Tsewi Airport", "iata": "TSW", "country": "PG"},
-            {"city": "Tshabong", "airport": "Tshabong Airport", "iata": "TBY", "country": "BW"},
-            {"city": "Tshikapa", "airport": "Tshikapa Airport", "iata": "TSH", "country": "CD"},
-            {"city": "Tshipise", "airport": "Tshipise Airport", "iata": "TSD", "country": "ZA"},
-            {"city": "Tsile Tsile", "airport": "Tsile Tsile Airport", "iata": "TSI", "country": "PG"},
-            {"city": "Tsiroanomandidy", "airport": "Tsiroanomandidy Airport", "iata": "WTS", "country": "MG"},
-            {"city": "Tsumeb", "airport": "Tsumeb Airport", "iata": "TSB", "country": "NA"},
-            {"city": "Tsushima", "airport": "Tsushima Airport", "iata": "TSJ", "country": "JP"},
-            {"city": "Tuba City", "airport": "Tuba City Airport", "iata": "TBC", "country": "US"},
-            {"city": "Tucson", "airport": "Davis Monthan Air Force Base", "iata": "DMA", "country": "US"},
-            {"city": "Tucson", "airport": "Tucson International Airport / Morris Air National Guard Base", "iata": "TUS", "country": "US"},
-            {"city": "Tucumcari", "airport": "Tucumcari Municipal Airport", "iata": "TCC", "country": "US"},
-            {"city": "Tucupita", "airport": "Tucupita Airport", "iata": "TUV", "country": "VE"},
-            {"city": "Tucuruí", "airport": "Tucuruí Airport", "iata": "TUR", "country": "BR"},
-            {"city": "Tufi", "airport": "Tufi Airport", "iata": "TFI", "country": "PG"},
-            {"city": "Tuguegarao City", "airport": "Tuguegarao Airport", "iata": "TUG", "country": "PH"},
-            {"city": "Tuherahera", "airport": "Tikehau Airport", "iata": "TIH", "country": "PF"},
-            {"city": "Tuktoyaktuk", "airport": "Tuktoyaktuk / James Gruben Airport", "iata": "YUB", "country": "CA"},
-            {"city": "Tula", "airport": "Klokovo Air Base", "iata": "TYA", "country": "RU"},
-            {"city": "Tulaghi Island", "airport": "Tulaghi Heliport", "iata": "TLG", "country": "SB"},
-            {"city": "Tulare", "airport": "Mefford Field", "iata": "TLR", "country": "US"},
-            {"city": "Tulcán", "airport": "Lieutenant Colonel Luis A. Mantilla International Airport", "iata": "TUA", "country": "EC"},
-            {"city": "Tuli Lodge", "airport": "Tuli Lodge Airport", "iata": "TLD", "country": "BW"},
-            {"city": "Tulita", "airport": "Tulita Airport", "iata": "ZFN", "country": "CA"},
-            {"city": "Tullahoma", "airport": "Tullahoma Regional Airport William Northern Field", "iata": "THA", "country": "US"},
-            {"city": "Tulsa", "airport": "Tulsa Riverside Airport", "iata": "RVS", "country": "US"},
-            {"city": "Tulsa", "airport": "Tulsa International Airport", "iata": "TUL", "country": "US"},
-            {"city": "Tuluksak", "airport": "Tuluksak Airport", "iata": "TLT", "country": "US"},
-            {"city": "Tulum", "airport": "Felipe Carrillo Puerto International Airport", "iata": "TQO", "country": "MX"},
-            {"city": "Tulum", "airport": "Base Aeronaval de Tulum", "iata": "TUY", "country": "MX"},
-            {"city": "Tuluá", "airport": "Heriberto Gíl Martínez Airport", "iata": "ULQ", "country": "CO"},
-            {"city": "Tum", "airport": "Tum Airport", "iata": "TUJ", "country": "ET"},
-            {"city": "Tumaco", "airport": "La Florida Airport", "iata": "TCO", "country": "CO"},
-            {"city": "Tumbang Samba-Borneo Island", "airport": "Tumbang Samba Airport", "iata": "TBM", "country": "ID"},
-            {"city": "Tumbes", "airport": "Captain Pedro Canga Rodríguez International Airport", "iata": "TBP", "country": "PE"},
-            {"city": "Tumbler Ridge", "airport": "Tumbler Ridge Airport", "iata": "TUX", "country": "CA"},
-            {"city": "Tumling Tar", "airport": "Tumling Tar Airport", "iata": "TMI", "country": "NP"},
-            {"city": "Tumolbil", "airport": "Tumolbil Airport", "iata": "TLP", "country": "PG"},
-            {"city": "Tumut", "airport": "Tumut Aerodrome", "iata": "TUM", "country": "AU"},
-            {"city": "Tumxuk", "airport": "Tumxuk Tangwangcheng Airport", "iata": "TWC", "country": "CN"},
-            {"city": "Tungsten", "airport": "Tungsten (Cantung) Airport", "iata": "TNS", "country": "CA"},
-            {"city": "Tunica", "airport": "Tunica Municipal Airport", "iata": "UTM", "country": "US"},
-            {"city": "Tunis", "airport": "Tunis Carthage International Airport", "iata": "TUN", "country": "TN"},
-            {"city": "Tunoshna", "airport": "Tunoshna Airport", "iata": "IAR", "country": "RU"},
-            {"city": "Tuntutuliak", "airport": "Tuntutuliak Airport", "iata": "WTL", "country": "US"},
-            {"city": "Tununak", "airport": "Tununak Airport", "iata": "TNK", "country": "US"},
-            {"city": "Tupai Atoll", "airport": "Tupai Airport", "iata": "TPX", "country": "PF"},
-            {"city": "Tupelo", "airport": "Tupelo Regional Airport", "iata": "TUP", "country": "US"},
-            {"city": "Tupile", "airport": "Corazón de Jesús Airport", "iata": "CZJ", "country": "PA"},
-            {"city": "Tura", "airport": "Tura Mountain Airport", "iata": "GOY", "country": "RU"},
-            {"city": "Turaif", "airport": "Turaif Domestic Airport", "iata": "TUI", "country": "SA"},
-            {"city": "Turbat", "airport": "Turbat International Airport", "iata": "TUK", "country": "PK"},
-            {"city": "Turbo", "airport": "Gonzalo Mejía Airport", "iata": "TRB", "country": "CO"},
-            {"city": "Tureia", "airport": "Tureia Airport", "iata": "ZTA", "country": "PF"},
-            {"city": "Turkey Creek", "airport": "Turkey Creek Airport", "iata": "TKY", "country": "AU"},
-            {"city": "Turkmenbashi", "airport": "Turkmenbashi International Airport", "iata": "KRW", "country": "TM"},
-            {"city": "Turku", "airport": "Turku Airport", "iata": "TKU", "country": "FI"},
-            {"city": "Turkıstan", "airport": "Hazrat Sultan International Airport", "iata": "HSA", "country": "KZ"},
-            {"city": "Turpan", "airport": "Turpan Jiaohe Airport", "iata": "TLQ", "country": "CN"},
-            {"city": "Turukhansk", "airport": "Turukhansk Airport", "iata": "THX", "country": "RU"},
-            {"city": "Tuscaloosa", "airport": "Tuscaloosa National Airport", "iata": "TCL", "country": "US"},
-            {"city": "Tuxekan Island", "airport": "Naukati Bay Seaplane Base", "iata": "NKI", "country": "US"},
-            {"city": "Tuxtla Gutiérrez", "airport": "Angel Albino Corzo International Airport", "iata": "TGZ", "country": "MX"},
-            {"city": "Tuy Hoa", "airport": "Dong Tac Airport", "iata": "TBB", "country": "VN"},
-            {"city": "Tver", "airport": "Migalovo Air Base", "iata": "KLD", "country": "RU"},
-            {"city": "Twentynine Palms", "airport": "Twentynine Palms Airport", "iata": "TNP", "country": "US"},
-            {"city": "Twin Falls", "airport": "Joslin Field Magic Valley Regional Airport", "iata": "TWF", "country": "US"},
-            {"city": "Twin Hills", "airport": "Twin Hills Airport", "iata": "TWA", "country": "US"},
-            {"city": "Twitzel", "airport": "Pukaki Airport", "iata": "TWZ", "country": "NZ"},
-            {"city": "Two Harbors", "airport": "Two Harbors Amphibious Terminal", "iata": "TWH", "country": "US"},
-            {"city": "Tyler", "airport": "Tyler Pounds Regional Airport", "iata": "TYR", "country": "US"},
-            {"city": "Tymbou (Kirklar)", "airport": "Nicosia (Lefkoşa) Ercan International Airport", "iata": "ECN", "country": "CY"},
-            {"city": "Tymovskoye", "airport": "Zonalnoye Airport", "iata": "ZZO", "country": "RU"},
-            {"city": "Tynda", "airport": "Tynda Airport", "iata": "TYD", "country": "RU"},
-            {"city": "Tyonek", "airport": "Tyonek Airport", "iata": "TYE", "country": "US"},
-            {"city": "Tyumen", "airport": "Roshchino International Airport", "iata": "TJM", "country": "RU"},
-            {"city": "Tzaneen", "airport": "Tzaneen Airport", "iata": "LTA", "country": "ZA"},
-            {"city": "Tébessi", "airport": "Cheikh Larbi Tébessi Airport", "iata": "TEE", "country": "DZ"},
-            {"city": "Tétouan", "airport": "Sania Ramel Airport", "iata": "TTU", "country": "MA"},
-            {"city": "Tête-à-la-Baleine", "airport": "Tête-à-la-Baleine Airport", "iata": "ZTB", "country": "CA"},
-            {"city": "Tôlanaro", "airport": "Tôlanaro Airport", "iata": "FTU", "country": "MG"},
-            {"city": "Türkmenabat", "airport": "Türkmenabat International Airport", "iata": "CRZ", "country": "TM"},
-            {"city": "Tăuții-Măgherăuș", "airport": "Maramureș International Airport", "iata": "BAY", "country": "RO"},
-            {"city": "Ua Huka", "airport": "Ua Huka Airport", "iata": "UAH", "country": "PF"},
-            {"city": "Ua Pou", "airport": "Ua Pou Airport", "iata": "UAP", "country": "PF"},
-            {"city": "Uaxactun", "airport": "Uaxactun Airport", "iata": "UAX", "country": "GT"},
-            {"city": "Ubari", "airport": "Ubari Airport", "iata": "QUB", "country": "LY"},
-            {"city": "Ubatuba", "airport": "Ubatuba Gastão Madeira State Airport", "iata": "UBT", "country": "BR"},
-            {"city": "Ube", "airport": "Yamaguchi Ube Airport", "iata": "UBJ", "country": "JP"},
-            {"city": "Uberaba", "airport": "Mário de Almeida Franco Airport", "iata": "UBA", "country": "BR"},
-            {"city": "Uberlândia", "airport": "Ten. Cel. Aviador César Bombonato Airport", "iata": "UDI", "country": "BR"},
-            {"city": "Ubon Ratchathani", "airport": "Ubon Ratchathani Airport", "iata": "UBP", "country": "TH"},
-            {"city": "Uchiza", "airport": "Uchiza Airport", "iata": "UCZ", "country": "PE"},
-            {"city": "Udaipur", "airport": "Maharana Pratap Airport", "iata": "UDR", "country": "IN"},
-            {"city": "Uden", "airport": "Volkel Air Base", "iata": "UDE", "country": "NL"},
-            {"city": "Udon Thani", "airport": "Udon Thani Airport", "iata": "UTH", "country": "TH"},
-            {"city": "Ufa", "airport": "Ufa International Airport", "iata": "UFA", "country": "RU"},
-            {"city": "Ugashik", "airport": "Ugashik Airport", "iata": "UGS", "country": "US"},
-            {"city": "Uherské Hradiště", "airport": "Kunovice Airport", "iata": "UHE", "country": "CZ"},
-            {"city": "Uige", "airport": "Uige Airport", "iata": "UGO", "country": "AO"},
-            {"city": "Uiju", "airport": "Uiju Airport", "iata": "UJU", "country": "KP"},
-            {"city": "Ujae Atoll", "airport": "Ujae Atoll Airport", "iata": "UJE", "country": "MH"},
-            {"city": "Ujung Pandang", "airport": "Hasanuddin International Airport", "iata": "UPG", "country": "ID"},
-            {"city": "Ukhta", "airport": "Ukhta Airport", "iata": "UCT", "country": "RU"},
-            {"city": "Ukiah", "airport": "Ukiah Municipal Airport", "iata": "UKI", "country": "US"},
-            {"city": "Ukkusissat", "airport": "Ukkusissat Heliport", "iata": "JUK", "country": "GL"},
-            {"city": "Ukunda", "airport": "Ukunda Airstrip", "iata": "UKA", "country": "KE"},
-            {"city": "Ukupseni", "airport": "Playón Chico Airport", "iata": "PYC", "country": "PA"},
-            {"city": "Ulaanbaatar", "airport": "Buyant-Ukhaa International Airport", "iata": "ULN", "country": "MN"},
-            {"city": "Ulaanbaatar (Sergelen)", "airport": "Ulaanbaatar Chinggis Khaan International Airport", "iata": "UBN", "country": "MN"},
-            {"city": "Ulaangom", "airport": "Ulaangom Airport", "iata": "ULO", "country": "MN"},
-            {"city": "Ulan Ude", "airport": "Baikal International Airport", "iata": "UUD", "country": "RU"},
-            {"city": "Ulanhot", "airport": "Ulanhot Yilelite Airport", "iata": "HLH", "country": "CN"},
-            {"city": "Ulanqab", "airport": "Ulanqab Jining Airport", "iata": "UCB", "country": "CN"},
-            {"city": "Uliastai", "airport": "Donoi Airport", "iata": "ULZ", "country": "MN"},
-            {"city": "Ulsan", "airport": "Ulsan Airport", "iata": "USN", "country": "KR"},
-            {"city": "Ulukhaktok", "airport": "Ulukhaktok Holman Airport", "iata": "YHI", "country": "CA"},
-            {"city": "Ulundi", "airport": "Prince Mangosuthu Buthelezi Airport", "iata": "ULD", "country": "ZA"},
-            {"city": "Ulusaba", "airport": "Ulusaba Airport", "iata": "ULX", "country": "ZA"},
-            {"city": "Ulyanovsk", "airport": "Ulyanovsk Baratayevka Airport", "iata": "ULV", "country": "RU"},
-            {"city": "Umba", "airport": "Umba Airport", "iata": "UMC", "country": "PG"},
-            {"city": "Umeå", "airport": "Umeå Airport", "iata": "UME", "country": "SE"},
-            {"city": "Umiat", "airport": "Umiat Airport", "iata": "UMT", "country": "US"},
-            {"city": "Umiujaq", "airport": "Umiujaq Airport", "iata": "YUD", "country": "CA"},
-            {"city": "Umuarama", "airport": "Orlando de Carvalho Airport", "iata": "UMU", "country": "BR"},
-            {"city": "Una", "airport": "Una-Comandatuba Airport", "iata": "UNA", "country": "BR"},
-            {"city": "Unalakleet", "airport": "Unalakleet Airport", "iata": "UNK", "country": "US"},
-            {"city": "Unalaska", "airport": "Tom Madsen (Dutch Harbor) Airport", "iata": "DUT", "country": "US"},
-            {"city": "Undara", "airport": "Undara Airport", "iata": "UDA", "country": "AU"},
-            {"city": "Unea Island", "airport": "Bali Airport", "iata": "BAJ", "country": "PG"},
-            {"city": "Unguía", "airport": "Unguía Airport", "iata": "UNC", "country": "CO"},
-            {"city": "Union", "airport": "Union County, Troy Shelton Field", "iata": "USC", "country": "US"},
-            {"city": "Union City", "airport": "Everett-Stewart Regional Airport", "iata": "UCY", "country": "US"},
-            {"city": "Union Glacier", "airport": "Union Glacier Blue-Ice Runway", "iata": "UGL", "country": "AQ"},
-            {"city": "Union Island", "airport": "Union Island International Airport", "iata": "UNI", "country": "VC"},
-            {"city": "Universal City", "airport": "Randolph Air Force Base", "iata": "RND", "country": "US"},
-            {"city": "União da Vitória", "airport": "José Cleto Airport", "iata": "UVI", "country": "BR"},
-            {"city": "Uonquén", "airport": "Uon Quen Airport", "iata": "WOK", "country": "VE"},
-            {"city": "Upala", "airport": "Upala Airport", "iata": "UPL", "country": "CR"},
-            {"city": "Upernavik", "airport": "Upernavik Airport", "iata": "JUV", "country": "GL"},
-            {"city": "Upiara", "airport": "Upiara Airport", "iata": "UPR", "country": "PG"},
-            {"city": "Upington", "airport": "Pierre Van Ryneveld Airport", "iata": "UTN", "country": "ZA"},
-            {"city": "Upland", "airport": "Upland-Cable Airport", "iata": "CCB", "country": "US"},
-            {"city": "Urad Middle Banner", "airport": "Urad Middle Banner Airport", "iata": "WZQ", "country": "CN"},
-            {"city": "Uralsk", "airport": "Uralsk Airport", "iata": "URA", "country": "KZ"},
-            {"city": "Uranium City", "airport": "Uranium City Airport", "iata": "YBE", "country": "CA"},
-            {"city": "Uray", "airport": "Uray Airport", "iata": "URJ", "country": "RU"},
-            {"city": "Urengoy", "airport": "Urengoy Airport", "iata": "UEN", "country": "RU"},
-            {"city": "Urgench", "airport": "Urgench Airport", "iata": "UGC", "country": "UZ"},
-            {"city": "Urgun", "airport": "Urgun Airport", "iata": "URN", "country": "AF"},
-            {"city": "Urhu", "airport": "Orku Baikouquan Airport (under construction)", "iata": "WRH", "country": "CN"},
-            {"city": "Urimán", "airport": "Uriman Airport", "iata": "URM", "country": "VE"},
-            {"city": "Urmia", "airport": "Urmia Airport", "iata": "OMH", "country": "IR"},
-            {"city": "Uroubi", "airport": "Uroubi Airport", "iata": "URU", "country": "PG"},
-            {"city": "Urrao", "airport": "Urrao Airport", "iata": "URR", "country": "CO"},
-            {"city": "Uruapan", "airport": "Uruapan - Licenciado y General Ignacio Lopez Rayon International Airport", "iata": "UPN", "country": "MX"},
-            {"city": "Urucu", "airport": "Urucu Airport", "iata": "RPU", "country": "BR"},
-            {"city": "Uruguaiana", "airport": "Rubem Berta Airport", "iata": "URG", "country": "BR"},
-            {"city": "Urzhar", "airport": "Urzhar Airport", "iata": "UZR", "country": "KZ"},
-            {"city": "Useless Loop", "airport": "Useless Loop Airport", "iata": "USL", "country": "AU"},
-            {"city": "Ushant", "airport": "Ouessant Airport", "iata": "OUI", "country": "FR"},
-            {"city": "Usharal", "airport": "Usharal Airport", "iata": "USJ", "country": "KZ"},
-            {"city": "Ushuaia", "airport": "Ushuaia - Malvinas Argentinas International Airport", "iata": "USH", "country": "AR"},
-            {"city": "Usinsk", "airport": "Usinsk Airport", "iata": "USK", "country": "RU"},
-            {"city": "Ust-Ilimsk", "airport": "Ust-Ilimsk Airport", "iata": "UIK", "country": "RU"},
-            {"city": "Ust-Kamenogorsk (Oskemen)", "airport": "Ust-Kamenogorsk Airport", "iata": "UKK", "country": "KZ"},
-            {"city": "Ust-Kut", "airport": "Ust-Kut Airport", "iata": "UKX", "country": "RU"},
-            {"city": "Ust-Kuyga", "airport": "Ust-Kuyga Airport", "iata": "UKG", "country": "RU"},
-            {"city": "Ust-Maya", "airport": "Ust-Maya Airport", "iata": "UMS", "country": "RU"},
-            {"city": "Ust-Nera", "airport": "Ust-Nera Airport", "iata": "USR", "country": "RU"},
-            {"city": "Ust-Tsylma", "airport": "Ust-Tsylma Airport", "iata": "UTS", "country": "RU"},
-            {"city": "Ustupu", "airport": "Ogobsucum Airport", "iata": "OGM", "country": "PA"},
-            {"city": "Ustupu", "airport": "Ustupu Airport", "iata": "UTU", "country": "PA"},
-            {"city": "Utila Island", "airport": "Utila Airport", "iata": "UII", "country": "HN"},
-            {"city": "Utirik Island", "airport": "Utirik Airport", "iata": "UTK", "country": "MH"},
-            {"city": "Utopia Creek", "airport": "Indian Mountain LRRS Airport", "iata": "UTO", "country": "US"},
-            {"city": "Utqiaġvik", "airport": "Wiley Post Will Rogers Memorial Airport", "iata": "BRW", "country": "US"},
-            {"city": "Uttaradit", "airport": "Uttaradit Airport", "iata": "UTR", "country": "TH"},
-            {"city": "Utti / Valkeala", "airport": "Utti Air Base", "iata": "UTI", "country": "FI"},
-            {"city": "Uturoa", "airport": "Raiatea Airport", "iata": "RFP", "country": "PF"},
-            {"city": "Uummannaq", "airport": "Uummannaq Heliport", "iata": "UMD", "country": "GL"},
-            {"city": "Uummannaq", "airport": "Qaarsut Airport", "iata": "JQA", "country": "GL"},
-            {"city": "Uvalde", "airport": "Garner Field", "iata": "UVA", "country": "US"},
-            {"city": "Uvol", "airport": "Uvol Airport", "iata": "UVO", "country": "PG"},
-            {"city": "Uyo", "airport": "Akwa Ibom International Airport", "iata": "QUO", "country": "NG"},
-            {"city": "Uzhhorod", "airport": "Uzhhorod International Airport", "iata": "UDJ", "country": "UA"},
-            {"city": "Uşak", "airport": "Uşak Airport", "iata": "USQ", "country": "TR"},
-            {"city": "Vaasa", "airport": "Vaasa Airport", "iata": "VAA", "country": "FI"},
-            {"city": "Vacaria", "airport": "Vacaria Airport", "iata": "VCC", "country": "BR"},
-            {"city": "Vadodara", "airport": "Vadodara Airport", "iata": "BDQ", "country": "IN"},
-            {"city": "Vadsø", "airport": "Vadsø Airport", "iata": "VDS", "country": "NO"},
-            {"city": "Vagaikulam", "airport": "Tuticorin Airport", "iata": "TCR", "country": "IN"},
-            {"city": "Vahitahi", "airport": "Vahitahi Airport", "iata": "VHZ", "country": "PF"},
-            {"city": "Val-d'Or", "airport": "Val-d'Or Airport", "iata": "YVO", "country": "CA"},
-            {"city": "Valcheta", "airport": "Valcheta Airport", "iata": "VCF", "country": "AR"},
-            {"city": "Valdez", "airport": "Valdez Pioneer Field", "iata": "VDZ", "country": "US"},
-            {"city": "Valdivia", "airport": "Pichoy Airport", "iata": "ZAL", "country": "CL"},
-            {"city": "Valdosta", "airport": "Moody Air Force Base", "iata": "VAD", "country": "US"},
-            {"city": "Valdosta", "airport": "Valdosta Regional Airport", "iata": "VLD", "country": "US"},
-            {"city": "Valencia", "airport": "Valencia Airport", "iata": "VLC", "country": "ES"},
-            {"city": "Valencia", "airport": "Arturo Michelena International Airport", "iata": "VLN", "country": "VE"},
-            {"city": "Valentine", "airport": "Miller Field", "iata": "VTN", "country": "US"},
-            {"city": "Valença", "airport": "Valença Airport", "iata": "VAL", "country": "BR"},
-            {"city": "Valera", "airport": "Dr. Antonio Nicolás Briceño Airport", "iata": "VLV", "country": "VE"},
-            {"city": "Valladolid", "airport": "Valladolid Airport", "iata": "VLL", "country": "ES"},
-            {"city": "Valledupar", "airport": "Alfonso López Pumarejo Airport", "iata": "VUP", "country": "CO"},
-            {"city": "Vallegrande", "airport": "Capitán Av. Vidal Villagomez Toledo Airport", "iata": "VAH", "country": "BO"},
-            {"city": "Vallenar", "airport": "Vallenar Airport", "iata": "VLR", "country": "CL"},
-            {"city": "Valletta", "airport": "Malta International Airport", "iata": "MLA", "country": "MT"},
-            {"city": "Valparaiso", "airport": "Destin-Fort Walton Beach Airport", "iata": "VPS", "country": "US"},
-            {"city": "Valparaiso", "airport": "Porter County Municipal Airport", "iata": "VPZ", "country": "US"},
-            {"city": "Van", "airport": "Van Ferit Melen Airport", "iata": "VAN", "country": "TR"},
-            {"city": "Van Don", "airport": "Van Don International Airport", "iata": "VDO", "country": "VN"},
-            {"city": "Van Horn", "airport": "Culberson County Airport", "iata": "VHN", "country": "US"},
-            {"city": "Van Nuys", "airport": "Van Nuys Airport", "iata": "VNY", "country": "US"},
-            {"city": "Vanavara", "airport": "Vanavara Airport", "iata": "VAQ", "country": "RU"},
-            {"city": "Vancouver", "airport": "Vancouver Harbour Water Aerodrome", "iata": "CXH", "country": "CA"},
-            {"city": "Vancouver", "airport": "Vancouver International Airport", "iata": "YVR", "country": "CA"},
-            {"city": "Vandalia", "airport": "Vandalia Municipal Airport", "iata": "VLA", "country": "US"},
-            {"city": "Vangaindrano", "airport": "Vangaindrano Airport", "iata": "VND", "country": "MG"},
-            {"city": "Vanimo", "airport": "Vanimo Airport", "iata": "VAI", "country": "PG"},
-            {"city": "Vannes/Meucon", "airport": "Vannes-Meucon Airport", "iata": "VNE", "country": "FR"},
-            {"city": "Vanua Balavu", "airport": "Vanua Balavu Airport", "iata": "VBV", "country": "FJ"},
-            {"city": "Varanasi", "airport": "Lal Bahadur Shastri Airport", "iata": "VNS", "country": "IN"},
-            {"city": "Varandey", "airport": "Varandey Airport", "iata": "VRI", "country": "RU"},
-            {"city": "Vardø", "airport": "Vardø Airport, Svartnes", "iata": "VAW", "country": "NO"},
-            {"city": "Varginha", "airport": "Major Brigadeiro Trompowsky Airport", "iata": "VAG", "country": "BR"},
-            {"city": "Varkaus / Joroinen", "airport": "Varkaus Airport", "iata": "VRK", "country": "FI"},
-            {"city": "Varna", "airport": "Varna Airport", "iata": "VAR", "country": "BG"},
-            {"city": "Vasco da Gama", "airport": "Dabolim Airport", "iata": "GOI", "country": "IN"},
-            {"city": "Vatomandry", "airport": "Vatomandry Airport", "iata": "VAT", "country": "MG"},
-            {"city": "Vatulele", "airport": "Vatulele Airport", "iata": "VTF", "country": "FJ"},
-            {"city": "Vava'u Island", "airport": "Vava'u International Airport", "iata": "VAV", "country": "TO"},
-            {"city": "Velas", "airport": "São Jorge Airport", "iata": "SJZ", "country": "PT"},
-            {"city": "Velika Gorica", "airport": "Zagreb Franjo Tuđman International Airport", "iata": "ZAG", "country": "HR"},
-            {"city": "Velikiy Ustyug", "airport": "Velikiy Ustyug Airport", "iata": "VUS", "country": "RU"},
-            {"city": "Venetie", "airport": "Venetie Airport", "iata": "VEE", "country": "US"},
-            {"city": "Venezia (VE)", "airport": "Venice Marco Polo Airport", "iata": "VCE", "country": "IT"},
-            {"city": "Venice", "airport": "Venice Municipal Airport", "iata": "VNC", "country": "US"},
-            {"city": "Ventspils", "airport": "Ventspils International Airport", "iata": "VNT", "country": "LV"},
-            {"city": "Veracruz", "airport": "General Heriberto Jara International Airport", "iata": "VER", "country": "MX"},
-            {"city": "Verkhnevilyuisk", "airport": "Verkhnevilyuisk Airport", "iata": "VHV", "country": "RU"},
-            {"city": "Vermilion", "airport": "Vermilion Airport", "iata": "YVG", "country": "CA"},
-            {"city": "Vernal", "airport": "Vernal Regional Airport", "iata": "VEL", "country": "US"},
-            {"city": "Vernon", "airport": "Vernon Regional Airport", "iata": "YVE", "country": "CA"},
-            {"city": "Vernon", "airport": "Wilbarger County Airport", "iata": "WIB", "country": "US"},
-            {"city": "Vero Beach", "airport": "Vero Beach Regional Airport", "iata": "VRB", "country": "US"},
-            {"city": "Versailles", "airport": "Roy Otten Memorial Airfield", "iata": "VRS", "country": "US"},
-            {"city": "Vestmannaeyjar", "airport": "Vestmannaeyjar Airport", "iata": "VEY", "country": "IS"},
-            {"city": "Vichadero", "airport": "Vichadero Airport", "iata": "VCH", "country": "UY"},
-            {"city": "Vichy", "airport": "Rolla National Airport", "iata": "VIH", "country": "US"},
-            {"city": "Vicksburg", "airport": "Vicksburg Municipal Airport", "iata": "VKS", "country": "US"},
-            {"city": "Victoria", "airport": "Victoria Harbour Seaplane Base", "iata": "YWH", "country": "CA"},
-            {"city": "Victoria", "airport": "Victoria International Airport", "iata": "YYJ", "country": "CA"},
-            {"city": "Victoria", "airport": "Victoria Regional Airport", "iata": "VCT", "country": "US"},
-            {"city": "Victoria", "airport": "Victoria Airport", "iata": "ZIC", "country": "CL"},
-            {"city": "Victoria Falls", "airport": "Victoria Falls International Airport", "iata": "VFA", "country": "ZW"},
-            {"city": "Victoria River", "airport": "Victoria River Downs Airport", "iata": "VCD", "country": "AU"},
-            {"city": "Victorville", "airport": "Southern California Logistics Airport", "iata": "VCV", "country": "US"},
-            {"city": "Vidalia", "airport": "Vidalia Regional Airport", "iata": "VDI", "country": "US"},
-            {"city": "Videira", "airport": "Videira Airport", "iata": "VIA", "country": "BR"},
-            {"city": "Viedma / Carmen de Patagones", "airport": "Gobernador Castello Airport", "iata": "VDM", "country": "AR"},
-            {"city": "Vienna", "airport": "Vienna International Airport", "iata": "VIE", "country": "AT"},
-            {"city": "Vientiane", "airport": "Wattay International Airport", "iata": "VTE", "country": "LA"},
-            {"city": "Vieques", "airport": "Antonio Rivera Rodriguez Airport", "iata": "VQS", "country": "PR"},
-            {"city": "Vieux Fort", "airport": "Hewanorra International Airport", "iata": "UVF", "country": "LC"},
-            {"city": "Vigo", "airport": "Vigo Airport", "iata": "VGO", "country": "ES"},
-            {"city": "Vila", "airport": "Atauro Airport", "iata": "AUT", "country": "TL"},
-            {"city": "Vila Baleira", "airport": "Porto Santo Airport", "iata": "PXO", "country": "PT"},
-            {"city": "Vila Bela Da Santíssima Trindade", "airport": "Vila Bela da Santíssima Trindade Airport", "iata": "MTG", "country": "BR"},
-            {"city": "Vila Real", "airport": "Vila Real Airport", "iata": "VRL", "country": "PT"},
-            {"city": "Vila Rica", "airport": "Vila Rica Airport", "iata": "VLP", "country": "BR"},
-            {"city": "Vila do Maio", "airport": "Maio Airport", "iata": "MMO", "country": "CV"},
-            {"city": "Vila do Mosteiros", "airport": "Mosteiros Airport", "iata": "MTI", "country": "CV"},
-            {"city": "Vila do Porto", "airport": "Santa Maria Airport", "iata": "SMA", "country": "PT"},
-            {"city": "Vilanculo", "airport": "Vilankulo Airport", "iata": "VNX", "country": "MZ"},
-            {"city": "Vilhelmina", "airport": "Vilhelmina South Lapland Airport", "iata": "VHM", "country": "SE"},
-            {"city": "Vilhena", "airport": "Brigadeiro Camarão Airport", "iata": "BVH", "country": "BR"},
-            {"city": "Villa Dolores", "airport": "Villa Dolores Airport", "iata": "VDR", "country": "AR"},
-            {"city": "Villa Garzón", "airport": "Villa Garzón Airport", "iata": "VGZ", "country": "CO"},
-            {"city": "Villa Gesell", "airport": "Villa Gesell Airport", "iata": "VLG", "country": "AR"},
-            {"city": "Villa Las Estrellas", "airport": "Teniente Rodolfo Marsh Martin Airport", "iata": "TNM", "country": "AQ"},
-            {"city": "Villa Mercedes", "airport": "Villa Reynolds Airport", "iata": "VME", "country": "AR"},
-            {"city": "Villahermosa", "airport": "Carlos Rovirosa Pérez International Airport", "iata": "VSA", "country": "MX"},
-            {"city": "Villamontes", "airport": "Teniente Coronel Rafael Pabón Airport", "iata": "VLM", "country": "BO"},
-            {"city": "Villavicencio", "airport": "Vanguardia Airport", "iata": "VVC", "country": "CO"},
-            {"city": "Vilnius", "airport": "Vilnius International Airport", "iata": "VNO", "country": "LT"},
-            {"city": "Vilyuisk", "airport": "Vilyuisk Airport", "iata": "VYI", "country": "RU"},
-            {"city": "Vingt Cinq", "airport": "Agalega Island Airstrip", "iata": "AHG", "country": "MU"},
-            {"city": "Vinh", "airport": "Vinh Airport", "iata": "VII", "country": "VN"},
-            {"city": "Vinnitsa", "airport": "Vinnytsia/Gavyryshivka International Airport", "iata": "VIN", "country": "UA"},
-            {"city": "Vipingo Estate", "airport": "Vipingo Estate Airport", "iata": "VPG", "country": "KE"},
-            {"city": "Viqueque", "airport": "Viqueque Airport", "iata": "VIQ", "country": "TL"},
-            {"city": "Virac", "airport": "Virac Airport", "iata": "VRC", "country": "PH"},
-            {"city": "Virginia Beach", "airport": "Oceana Naval Air Station", "iata": "NTU", "country": "US"},
-            {"city": "Viru", "airport": "Viru Harbour Airstrip", "iata": "VIU", "country": "SB"},
-            {"city": "Visakhapatnam", "airport": "Visakhapatnam Airport", "iata": "VTZ", "country": "IN"},
-            {"city": "Visalia", "airport": "Visalia Municipal Airport", "iata": "VIS", "country": "US"},
-            {"city": "Visby", "airport": "Visby Airport", "iata": "VBY", "country": "SE"},
-            {"city": "Viseu", "airport": "Aerodromo Goncalves Lobato (Viseu Airport)", "iata": "VSE", "country": "PT"},
-            {"city": "Vitebsk", "airport": "Vitebsk Vostochny Airport", "iata": "VTB", "country": "BY"},
-            {"city": "Vitória", "airport": "Eurico de Aguiar Salles Airport", "iata": "VIX", "country": "BR"},
-            {"city": "Vitória da Conquista", "airport": "Glauber de Andrade Rocha Airport", "iata": "VDC", "country": "BR"},
-            {"city": "Vivigani", "airport": "Vivigani Airfield", "iata": "VIV", "country": "PG"},
-            {"city": "Viña Del Mar", "airport": "Rodelillo Airport", "iata": "VAP", "country": "CL"},
-            {"city": "Viña del Mar", "airport": "Viña del Mar Airport", "iata": "KNA", "country": "CL"},
-            {"city": "Vodochody", "airport": "Vodochody Airport", "iata": "VOD", "country": "CZ"},
-            {"city": "Vohemar", "airport": "Vohemar Airport", "iata": "VOH", "country": "MG"},
-            {"city": "Vohilava", "airport": "Sainte Marie Airport", "iata": "SMS", "country": "MG"},
-            {"city": "Voinjama", "airport": "Voinjama Airport", "iata": "VOI", "country": "LR"},
-            {"city": "Vojens", "airport": "Skrydstrup Air Base", "iata": "SKS", "country": "DK"},
-            {"city": "Volgograd", "airport": "Volgograd International Airport", "iata": "VOG", "country": "RU"},
-            {"city": "Vologda", "airport": "Vologda Airport", "iata": "VGD", "country": "RU"},
-            {"city": "Vopnafjörður", "airport": "Vopnafjörður Airport", "iata": "VPN", "country": "IS"},
-            {"city": "Vorkuta", "airport": "Vorkuta Airport", "iata": "VKT", "country": "RU"},
-            {"city": "Voronezh", "airport": "Voronezh International Airport", "iata": "VOZ", "country": "RU"},
-            {"city": "Votuporanga", "airport": "Domingos Pignatari Airport", "iata": "VOT", "country": "BR"},
-            {"city": "Vredendal", "airport": "Vredendal Airport", "iata": "VRE", "country": "ZA"},
-            {"city": "Vryheid", "airport": "Vryheid Airport", "iata": "VYD", "country": "ZA"},
-            {"city": "Vunisea", "airport": "Vunisea Airport", "iata": "KDV", "country": "FJ"},
-            {"city": "Vyrburg", "airport": "Vryburg Airport", "iata": "VRU", "country": "ZA"},
-            {"city": "Vágar", "airport": "Vágar Airport", "iata": "FAE", "country": "FO"},
-            {"city": "Västervik", "airport": "Västervik Airport", "iata": "VVK", "country": "SE"},
-            {"city": "Växjö", "airport": "Växjö Kronoberg Airport", "iata": "VXO", "country": "SE"},
-            {"city": "Værøy", "airport": "Værøy Heliport", "iata": "VRY", "country": "NO"},
-            {"city": "Vélizy-Villacoublay, Yvelines", "airport": "Vélizy-Villacoublay Air Base", "iata": "VIY", "country": "FR"},
-            {"city": "Vũng Tàu", "airport": "Vung Tau Airport", "iata": "VTG", "country": "VN"},
-            {"city": "Wa", "airport": "Wa Airport", "iata": "WZA", "country": "GH"},
-            {"city": "Waala", "airport": "Île Art - Waala Airport", "iata": "BMY", "country": "NC"},
-            {"city": "Waana", "airport": "Wana Airport", "iata": "WAF", "country": "PK"},
-            {"city": "Wabo", "airport": "Wabo Airport", "iata": "WAO", "country": "PG"},
-            {"city": "Wabush", "airport": "Wabush Airport", "iata": "YWK", "country": "CA"},
-            {"city": "Waco", "airport": "Waco Regional Airport", "iata": "ACT", "country": "US"},
-            {"city": "Waco", "airport": "TSTC Waco Airport", "iata": "CNW", "country": "US"},
-            {"city": "Waco Kungo", "airport": "Waco Kungo Airport", "iata": "CEO", "country": "AO"},
-            {"city": "Wadeye", "airport": "Port Keats Airport", "iata": "PKT", "country": "AU"},
-            {"city": "Wadi Al Dawasir", "airport": "Wadi Al Dawasir Domestic Airport", "iata": "WAE", "country": "SA"},
-            {"city": "Wadi Halfa", "airport": "Wadi Halfa Airport", "iata": "WHF", "country": "SD"},
-            {"city": "Wadomari", "airport": "Okinoerabu Airport", "iata": "OKE", "country": "JP"},
-            {"city": "Wageningen", "airport": "Wageningen Airstrip", "iata": "AGI", "country": "SR"},
-            {"city": "Waha-Tomea Island", "airport": "Maranggo Airport", "iata": "TQQ", "country": "ID"},
-            {"city": "Wahai", "airport": "Wahai Airport", "iata": "WBA", "country": "ID"},
-            {"city": "Wahiawa", "airport": "Wheeler Army Airfield", "iata": "HHI", "country": "US"},
-            {"city": "Wahpeton", "airport": "Harry Stern Airport", "iata": "WAH", "country": "US"},
-            {"city": "Waiheke Island", "airport": "Waiheke Island Aerodrome", "iata": "WIK", "country": "NZ"},
-            {"city": "Waikoloa Village", "airport": "Waikoloa Heliport", "iata": "WKL", "country": "US"},
-            {"city": "Waimea (Kamuela)", "airport": "Waimea Kohala Airport", "iata": "MUE", "country": "US"},
-            {"city": "Waimea (Kamuela)", "airport": "Bradshaw Army Airfield", "iata": "BSF", "country": "US"},
-            {"city": "Waingapu-Sumba Island", "airport": "Umbu Mehang Kunda Airport", "iata": "WGP", "country": "ID"},
-            {"city": "Wainwright", "airport": "Wainwright Airport", "iata": "AIN", "country": "US"},
-            {"city": "Waioti", "airport": "Frans Xavier Seda Airport", "iata": "MOF", "country": "ID"},
-            {"city": "Wairoa", "airport": "Wairoa Airport", "iata": "WIR", "country": "NZ"},
-            {"city": "Waisai", "airport": "Marinda Airport", "iata": "RJM", "country": "ID"},
-            {"city": "Wajima", "airport": "Noto Satoyama Airport", "iata": "NTQ", "country": "JP"},
-            {"city": "Wajir", "airport": "Wajir Airport", "iata": "WJR", "country": "KE"},
-            {"city": "Wakaya Island", "airport": "Wakaya Island Airport", "iata": "KAY", "country": "FJ"},
-            {"city": "Wake Island", "airport": "Wake Island Airfield", "iata": "AWK", "country": "UM"},
-            {"city": "Wakkanai", "airport": "Wakkanai Airport", "iata": "WKJ", "country": "JP"},
-            {"city": "Wakunai", "airport": "Wakunai Airport", "iata": "WKN", "country": "PG"},
-            {"city": "Walaha", "airport": "Walaha Airport", "iata": "WLH", "country": "VU"},
-            {"city": "Wales", "airport": "Wales Airport", "iata": "WAA", "country": "US"},
-            {"city": "Walkers Cay", "airport": "Walkers Cay Airport", "iata": "WKR", "country": "BS"},
-            {"city": "Walla Walla", "airport": "Walla Walla Regional Airport", "iata": "ALW", "country": "US"},
-            {"city": "Wallingford, Oxfordshire", "airport": "RAF Benson", "iata": "BEX", "country": "GB"},
-            {"city": "Wallis Island", "airport": "Hihifo Airport", "iata": "WLS", "country": "WF"},
-            {"city": "Wallops Island", "airport": "Wallops Flight Facility Airport", "iata": "WAL", "country": "US"},
-            {"city": "Walnut Ridge", "airport": "Walnut Ridge Regional Airport", "iata": "ARG", "country": "US"},
-            {"city": "Walterboro", "airport": "Lowcountry Regional Airport", "iata": "RBW", "country": "US"},
-            {"city": "Wamena", "airport": "Wamena Airport", "iata": "WMX", "country": "ID"},
-            {"city": "Wanaka", "airport": "Wanaka Airport", "iata": "WKA", "country": "NZ"},
-            {"city": "Wando Vale", "airport": "Mount Full Stop Airport", "iata": "MFL", "country": "AU"},
-            {"city": "Wang'an", "airport": "Wang'an Airport", "iata": "WOT", "country": "TW"},
-            {"city": "Wanganui", "airport": "Wanganui Airport", "iata": "WAG", "country": "NZ"},
-            {"city": "Wangerooge", "airport": "Wangerooge Airport", "iata": "AGE", "country": "DE"},
-            {"city": "Wangi-wangi Island", "airport": "Matahora Airport", "iata": "WNI", "country": "ID"},
-            {"city": "Wangkat Jungka", "airport": "Christmas Creek Station Airport", "iata": "CXQ", "country": "AU"},
-            {"city": "Wanigela", "airport": "Wanigela Airport", "iata": "AGL", "country": "PG"},
-            {"city": "Wantoat", "airport": "Wantoat Airport", "iata": "WTT", "country": "PG"},
-            {"city": "Wanuma", "airport": "Wanuma Airport", "iata": "WNU", "country": "PG"},
-            {"city": "Wanzhou", "airport": "Wanzhou Wuqiao Airport", "iata": "WXN", "country": "CN"},
-            {"city": "Wapakoneta", "airport": "Neil Armstrong Airport", "iata": "AXV", "country": "US"},
-            {"city": "Wapenamanda", "airport": "Wapenamanda Airport", "iata": "WBM", "country": "PG"},
-            {"city": "Wapolu", "airport": "Wapolu Airport", "iata": "WBC", "country": "PG"},
-            {"city": "Warangal", "airport": "Warangal Airport", "iata": "WGC", "country": "IN"},
-            {"city": "Warder", "airport": "Warder Airport", "iata": "WRA", "country": "ET"},
-            {"city": "Ware", "airport": "Ware Airport", "iata": "UWA", "country": "US"},
-            {"city": "Warner Robins", "airport": "Robins Air Force Base", "iata": "WRB", "country": "US"},
-            {"city": "Warroad", "airport": "Warroad International Memorial Airport", "iata": "RRT", "country": "US"},
-            {"city": "Warsaw", "airport": "Warsaw Chopin Airport", "iata": "WAW", "country": "PL"},
-            {"city": "Warton", "airport": "Warton Aerodrome", "iata": "WRT", "country": "GB"},
-            {"city": "Warwick", "airport": "Theodore Francis Green State Airport", "iata": "PVD", "country": "US"},
-            {"city": "Washabo", "airport": "Washabo Airport", "iata": "WSO", "country": "SR"},
-            {"city": "Washington", "airport": "Washington County Airport", "iata": "WSG", "country": "US"},
-            {"city": "Washington", "airport": "Ronald Reagan Washington National Airport", "iata": "DCA", "country": "US"},
-            {"city": "Washington", "airport": "Warren Field", "iata": "OCW", "country": "US"},
-            {"city": "Washington DC", "airport": "Pentagon Army Heliport", "iata": "JPN", "country": "US"},
-            {"city": "Wasilla", "airport": "Wasilla Airport", "iata": "WWA", "country": "US"},
-            {"city": "Wasior", "airport": "Wasior Airport", "iata": "WSR", "country": "ID"},
-            {"city": "Waskaganish", "airport": "Waskaganish Airport", "iata": "YKQ", "country": "CA"},
-            {"city": "Waspam", "airport": "Waspam Airport", "iata": "WSP", "country": "NI"},
-            {"city": "Wasu", "airport": "Wasu Airport", "iata": "WSU", "country": "PG"},
-            {"city": "Wasua", "airport": "Wasua Airport", "iata": "WSA", "country": "PG"},
-            {"city": "Wasum", "airport": "Wasum Airport", "iata": "WUM", "country": "PG"},
-            {"city": "Waterfall", "airport": "Waterfall Seaplane Base", "iata": "KWF", "country": "US"},
-            {"city": "Waterford", "airport": "Waterford Airport", "iata": "WAT", "country": "IE"},
-            {"city": "Waterloo", "airport": "Waterloo Regional Airport", "iata": "ALO", "country": "US"},
-            {"city": "Watertown", "airport": "Watertown International Airport", "iata": "ART", "country": "US"},
-            {"city": "Watertown", "airport": "Watertown Regional Airport", "iata": "ATY", "country": "US"},
-            {"city": "Waterville", "airport": "Waterville Robert Lafleur Airport", "iata": "WVL", "country": "US"},
-            {"city": "Watson Lake", "airport": "Watson Lake Airport", "iata": "YQH", "country": "CA"},
-            {"city": "Watsonville", "airport": "Watsonville Municipal Airport", "iata": "WVI", "country": "US"},
-            {"city": "Wau", "airport": "Wau Airport", "iata": "WUG", "country": "PG"},
-            {"city": "Wau", "airport": "Wau Airport", "iata": "WUU", "country": "SS"},
-            {"city": "Wauchope", "airport": "Wauchope Airport", "iata": "WAU", "country": "AU"},
-            {"city": "Waukesha", "airport": "Waukesha County Airport", "iata": "UES", "country": "US"},
-            {"city": "Waukon", "airport": "Waukon Municipal Airport", "iata": "UKN", "country": "US"},
-            {"city": "Wausau", "airport": "Wausau Downtown Airport", "iata": "AUW", "country": "US"},
-            {"city": "Waverney", "airport": "Waverney Airport", "iata": "WAN", "country": "AU"},
-            {"city": "Wavoi Falls", "airport": "Wawoi Falls Airport", "iata": "WAJ", "country": "PG"},
-            {"city": "Wawa", "airport": "Wawa Airport", "iata": "YXZ", "country": "CA"},
-            {"city": "Waycross", "airport": "Waycross Ware County Airport", "iata": "AYS", "country": "US"},
-            {"city": "Waynesburg", "airport": "Greene County Airport", "iata": "WAY", "country": "US"},
-            {"city": "Weam", "airport": "Weam Airport", "iata": "WEP", "country": "PG"},
-            {"city": "Weatherford", "airport": "Parker County Airport", "iata": "WEA", "country": "US"},
-            {"city": "Webequie", "airport": "Webequie Airport", "iata": "YWP", "country": "CA"},
-            {"city": "Webster City", "airport": "Webster City Municipal Airport", "iata": "EBS", "country": "US"},
-            {"city": "Wedau", "airport": "Wedau Airport", "iata": "WED", "country": "PG"},
-            {"city": "Weeping Water", "airport": "Browns Airport", "iata": "EPG", "country": "US"},
-            {"city": "Weerawila", "airport": "Weerawila Airport", "iata": "WRZ", "country": "LK"},
-            {"city": "Weeze", "airport": "Weeze Airport", "iata": "NRN", "country": "DE"},
-            {"city": "Weifang (Kuiwen)", "airport": "Weifang Nanyuan Airport", "iata": "WEF", "country": "CN"},
-            {"city": "Weihai", "airport": "Weihai Dashuibo Airport", "iata": "WEH", "country": "CN"},
-            {"city": "Weipa", "airport": "Weipa Airport", "iata": "WEI", "country": "AU"},
-            {"city": "Wekweètì", "airport": "Wekweètì Airport", "iata": "YFJ", "country": "CA"},
-            {"city": "Welkom", "airport": "Welkom Airport", "iata": "WEL", "country": "ZA"},
-            {"city": "Wellington", "airport": "Wellington International Airport", "iata": "WLG", "country": "NZ"},
-            {"city": "Wells", "airport": "Wells Municipal Airport/Harriet Field", "iata": "LWL", "country": "US"},
-            {"city": "Wellsville", "airport": "Wellsville Municipal Airport - Tarantine Field", "iata": "ELZ", "country": "US"},
-            {"city": "Welshpool", "airport": "Welshpool Airport", "iata": "WHL", "country": "AU"},
-            {"city": "Wemindji", "airport": "Wemindji Airport", "iata": "YNC", "country": "CA"},
-            {"city": "Wenatchee", "airport": "Pangborn Memorial Airport", "iata": "EAT", "country": "US"},
-            {"city": "Wendover", "airport": "Wendover Airport", "iata": "ENV", "country": "US"},
-            {"city": "Weno Island", "airport": "Chuuk International Airport", "iata": "TKK", "country": "FM"},
-            {"city": "Wenshan", "airport": "Wenshan Puzhehei Airport", "iata": "WNH", "country": "CN"},
-            {"city": "Wenzhou (Longwan)", "airport": "Wenzhou Longwan International Airport", "iata": "WNZ", "country": "CN"},
-            {"city": "West Bend", "airport": "West Bend Municipal Airport", "iata": "ETB", "country": "US"},
-            {"city": "West Branch", "airport": "West Branch Community Airport", "iata": "WBK", "country": "US"},
-            {"city": "West End", "airport": "Charles Kirkconnell International Airport", "iata": "CYB", "country": "KY"},
-            {"city": "West End", "airport": "West End Airport", "iata": "WTD", "country": "BS"},
-            {"city": "West Helena", "airport": "Thompson-Robbins Airport", "iata": "HEE", "country": "US"},
-            {"city": "West Island", "airport": "Cocos (Keeling) Islands Airport", "iata": "CCK", "country": "CC"},
-            {"city": "West Kelowna", "airport": "Alpine Heliport", "iata": "CBA", "country": "CA"},
-            {"city": "West Lafayette", "airport": "Purdue University Airport", "iata": "LAF", "country": "US"},
-            {"city": "West Memphis", "airport": "West Memphis Municipal Airport", "iata": "AWM", "country": "US"},
-            {"city": "West Palm Beach", "airport": "Palm Beach County Park Airport", "iata": "LNA", "country": "US"},
-            {"city": "West Palm Beach", "airport": "Palm Beach International Airport", "iata": "PBI", "country": "US"},
-            {"city": "West Point", "airport": "West Point Village Seaplane Base", "iata": "KWP", "country": "US"},
-            {"city": "West Sound", "airport": "Westsound/WSX Seaplane Base", "iata": "WSX", "country": "US"},
-            {"city": "West Wyalong", "airport": "West Wyalong Airport", "iata": "WWY", "country": "AU"},
-            {"city": "West Yellowstone", "airport": "Yellowstone Airport", "iata": "WYS", "country": "US"},
-            {"city": "Westerly", "airport": "Westerly State Airport", "iata": "WST", "country": "US"},
-            {"city": "Western Water Catchment", "airport": "Tengah Air Base", "iata": "TGA", "country": "SG"},
-            {"city": "Westfield", "airport": "Westfield-Barnes Regional Airport", "iata": "BAF", "country": "US"},
-            {"city": "Westhampton Beach", "airport": "Francis S Gabreski Airport", "iata": "FOK", "country": "US"},
-            {"city": "Westport", "airport": "Westport Airport", "iata": "WSZ", "country": "NZ"},
-            {"city": "Westray", "airport": "Westray Airport", "iata": "WRY", "country": "GB"},
-            {"city": "Wevelgem", "airport": "Flanders International Airport Kortrijk-Wevelgem", "iata": "KJK", "country": "BE"},
-            {"city": "Wewak", "airport": "Wewak International Airport", "iata": "WWK", "country": "PG"},
-            {"city": "Weyers Cave", "airport": "Shenandoah Valley Regional Airport", "iata": "SHD", "country": "US"},
-            {"city": "Weßling", "airport": "Oberpfaffenhofen Airport", "iata": "OBF", "country": "DE"},
-            {"city": "Whale Cove", "airport": "Whale Cove Airport", "iata": "YXN", "country": "CA"},
-            {"city": "Whale Pass", "airport": "Whale Pass Seaplane Float Harbor Facility", "iata": "WWP", "country": "US"},
-            {"city": "Whalsay, Shetlands", "airport": "Whalsay Airstrip", "iata": "WHS", "country": "GB"},
-            {"city": "Whangarei", "airport": "Whangarei Airport", "iata": "WRE", "country": "NZ"},
-            {"city": "Wharton", "airport": "Wharton Regional Airport", "iata": "WHT", "country": "US"},
-            {"city": "Whatì", "airport": "Whatì Airport", "iata": "YLE", "country": "CA"},
-            {"city": "Wheatland", "airport": "Phifer Airfield", "iata": "EAN", "country": "US"},
-            {"city": "Wheeling", "airport": "Wheeling Ohio County Airport", "iata": "HLG", "country": "US"},
-            {"city": "Whistler", "airport": "Whistler/Green Lake Water Aerodrome", "iata": "YWS", "country": "CA"},
-            {"city": "White Mountain", "airport": "White Mountain Airport", "iata": "WMO", "country": "US"},
-            {"city": "White Plains", "airport": "Westchester County Airport", "iata": "HPN", "country": "US"},
-            {"city": "White River", "airport": "White River Seaplane Base", "iata": "YWR", "country": "CA"},
-            {"city": "Whitecourt", "airport": "Whitecourt Airport", "iata": "YZU", "country": "CA"},
-            {"city": "Whitefield", "airport": "Mount Washington Regional Airport", "iata": "HIE", "country": "US"},
-            {"city": "Whitehorse", "airport": "Whitehorse / Erik Nielsen International Airport", "iata": "YXY", "country": "CA"},
-            {"city": "Whitemark", "airport": "Flinders Island Airport", "iata": "FLS", "country": "AU"},
-            {"city": "Whiteriver", "airport": "Whiteriver Airport", "iata": "WTR", "country": "US"},
-            {"city": "Whitianga", "airport": "Whitianga Airport", "iata": "WTZ", "country": "NZ"},
-            {"city": "Whitsundays", "airport": "Daydream Island Helipad", "iata": "DDI", "country": "AU"},
-            {"city": "Whyalla", "airport": "Whyalla Airport", "iata": "WYA", "country": "AU"},
-            {"city": "Wiarton", "airport": "Wiarton Airport", "iata": "YVV", "country": "CA"},
-            {"city": "Wichita", "airport": "Beech Factory Airport", "iata": "BEC", "country": "US"},
-            {"city": "Wichita", "airport": "Cessna Aircraft Field", "iata": "CEA", "country": "US"},
-            {"city": "Wichita", "airport": "McConnell Air Force Base", "iata": "IAB", "country": "US"},
-            {"city": "Wichita", "airport": "Wichita Eisenhower National Airport", "iata": "ICT", "country": "US"},
-            {"city": "Wichita Falls", "airport": "Kickapoo Downtown Airport", "iata": "KIP", "country": "US"},
-            {"city": "Wichita Falls", "airport": "Wichita Falls Municipal Airport / Sheppard Air Force Base", "iata": "SPS", "country": "US"},
-            {"city": "Wick", "airport": "Wick John O'Groats Airport", "iata": "WIC", "country": "GB"},
-            {"city": "Wiesbaden", "airport": "Wiesbaden Army Airfield", "iata": "WIE", "country": "DE"},
-            {"city": "Wildwood", "airport": "Cape May County Airport", "iata": "WWD", "country": "US"},
-            {"city": "Wiley Ford", "airport": "Greater Cumberland Regional Airport", "iata": "CBE", "country": "US"},
-            {"city": "Wilhelmshaven", "airport": "JadeWeser Airport", "iata": "WVN", "country": "DE"},
-            {"city": "Wilkes-Barre", "airport": "Wilkes Barre Wyoming Valley Airport", "iata": "WBW", "country": "US"},
-            {"city": "Wilkes-Barre/Scranton", "airport": "Wilkes Barre Scranton International Airport", "iata": "AVP", "country": "US"},
-            {"city": "Willcox", "airport": "Cochise County Airport", "iata": "CWX", "country": "US"},
-            {"city": "Willemstad", "airport": "Hato International Airport", "iata": "CUR", "country": "CW"},
-            {"city": "Williams Harbour", "airport": "Williams Harbour Airport", "iata": "YWM", "country": "CA"},
-            {"city": "Williams Lake", "airport": "Williams Lake Airport", "iata": "YWL", "country": "CA"},
-            {"city": "Williamsport", "airport": "Williamsport Regional Airport", "iata": "IPT", "country": "US"},
-            {"city": "Williamtown", "airport": "Newcastle Airport", "iata": "NTL", "country": "AU"},
-            {"city": "Williston", "airport": "Williston Basin International Airport", "iata": "XWA", "country": "US"},
-            {"city": "Willmar", "airport": "Willmar Municipal Airport John L Rice Field (2006)", "iata": "ILL", "country": "US"},
-            {"city": "Willoughby", "airport": "Lake County Executive Airport", "iata": "LNN", "country": "US"},
-            {"city": "Willow", "airport": "Willow Airport", "iata": "WOW", "country": "US"},
-            {"city": "Willows", "airport": "Willows Glenn County Airport", "iata": "WLW", "country": "US"},
-            {"city": "Wilmington", "airport": "Wilmington Airport", "iata": "ILG", "country": "US"},
-            {"city": "Wilmington", "airport": "Wilmington International Airport", "iata": "ILM", "country": "US"},
-            {"city": "Wilmington", "airport": "Wilmington Airpark", "iata": "ILN", "country": "US"},
-            {"city": "Winchester", "airport": "Winchester Regional Airport", "iata": "WGO", "country": "US"},
-            {"city": "Windarling Mine", "airport": "Windarling Airport", "iata": "WRN", "country": "AU"},
-            {"city": "Winder", "airport": "Barrow County Airport", "iata": "WDR", "country": "US"},
-            {"city": "Windhoek", "airport": "Eros Airport", "iata": "ERS", "country": "NA"},
-            {"city": "Windhoek", "airport": "Hosea Kutako International Airport", "iata": "WDH", "country": "NA"},
-            {"city": "Windom", "airport": "Windom Municipal Airport", "iata": "MWM", "country": "US"},
-            {"city": "Windorah", "airport": "Windorah Airport", "iata": "WNR", "country": "AU"},
-            {"city": "Windsor", "airport": "Windsor Airport", "iata": "YQG", "country": "CA"},
-            {"city": "Winfield / Arkansas City", "airport": "Strother Field", "iata": "WLD", "country": "US"},
-            {"city": "Wink", "airport": "Winkler County Airport", "iata": "INK", "country": "US"},
-            {"city": "Winnemucca", "airport": "Winnemucca Municipal Airport", "iata": "WMC", "country": "US"},
-            {"city": "Winnipeg", "airport": "Winnipeg / James Armstrong Richardson International Airport", "iata": "YWG", "country": "CA"},
-            {"city": "Winona", "airport": "Winona Municipal Airport Max Conrad Field", "iata": "ONA", "country": "US"},
-            {"city": "Winslow", "airport": "Winslow Lindbergh Regional Airport", "iata": "INW", "country": "US"},
-            {"city": "Winston Salem", "airport": "Smith Reynolds Airport", "iata": "INT", "country": "US"},
-            {"city": "Winter Haven", "airport": "Winter Haven Regional Airport - Gilbert Field", "iata": "GIF", "country": "US"},
-            {"city": "Wipim", "airport": "Wipim Airport", "iata": "WPM", "country": "PG"},
-            {"city": "Wiscasset", "airport": "Wiscasset Airport", "iata": "ISS", "country": "US"},
-            {"city": "Wisconsin Rapids", "airport": "Alexander Field South Wood County Airport", "iata": "ISW", "country": "US"},
-            {"city": "Wise", "airport": "Lonesome Pine Airport", "iata": "LNP", "country": "US"},
-            {"city": "Wiseman", "airport": "Wiseman Airport", "iata": "WSM", "country": "US"},
-            {"city": "Wodgina", "airport": "Port Hedland/Wodgina Airport", "iata": "GYB", "country": "AU"},
-            {"city": "Woja", "airport": "Woja Airport", "iata": "WJA", "country": "MH"},
-            {"city": "Wolf Point", "airport": "L M Clayton Airport", "iata": "OLF", "country": "US"},
-            {"city": "Wollaston Lake", "airport": "Wollaston Lake Airport", "iata": "ZWL", "country": "CA"},
-            {"city": "Wondoola", "airport": "Wondoola Airport", "iata": "WON", "country": "AU"},
-            {"city": "Wonenara", "airport": "Wonenara Airport", "iata": "WOA", "country": "PG"},
-            {"city": "Wonga Wongué Presidential Reserve", "airport": "Alowe Airport", "iata": "AWE", "country": "GA"},
-            {"city": "Wonju", "airport": "Wonju Airport / Hoengseong Air Base (K-38/K-46)", "iata": "WJU", "country": "KR"},
-            {"city": "Wonsan", "airport": "Wonsan Kalma International Airport", "iata": "WOS", "country": "KP"},
-            {"city": "Woodie Woodie", "airport": "Woodie Woodie Airport", "iata": "WWI", "country": "AU"},
-            {"city": "Woodlark (Muyua) Island", "airport": "Guasopa Airport", "iata": "GAZ", "country": "PG"},
-            {"city": "Woodruff", "airport": "Lakeland Airport Noble F Lee Memorial Field", "iata": "ARV", "country": "US"},
-            {"city": "Woodward", "airport": "West Woodward Airport", "iata": "WWR", "country": "US"},
-            {"city": "Woomera", "airport": "Woomera Airfield", "iata": "UMR", "country": "AU"},
-            {"city": "Wooster", "airport": "Wayne County Airport", "iata": "BJJ", "country": "US"},
-            {"city": "Worcester", "airport": "Worcester Regional Airport", "iata": "ORH", "country": "US"},
-            {"city": "Worland", "airport": "Worland Municipal Airport", "iata": "WRL", "country": "US"},
-            {"city": "Worthington", "airport": "Worthington Municipal Airport", "iata": "OTG", "country": "US"},
-            {"city": "Wotho Island", "airport": "Wotho Island Airport", "iata": "WTO", "country": "MH"},
-            {"city": "Wotje", "airport": "Wotje Airport", "iata": "WTE", "country": "MH"},
-            {"city": "Wrangell", "airport": "Wrangell Airport", "iata": "WRG", "country": "US"},
-            {"city": "Wrightstown", "airport": "Mc Guire Air Force Base", "iata": "WRI", "country": "US"},
-            {"city": "Wrigley", "airport": "Wrigley Airport", "iata": "YWY", "country": "CA"},
-            {"city": "Wrocław", "airport": "Copernicus Wrocław Airport", "iata": "WRO", "country": "PL"},
-            {"city": "Wrotham Park", "airport": "Wrotham Park Airport", "iata": "WPK", "country": "AU"},
-            {"city": "Wuhai", "airport": "Wuhai Airport", "iata": "WUA", "country": "CN"},
-            {"city": "Wuhan (Hannan)", "airport": "Wuhan Hannan Municipal Airport", "iata": "WHN", "country": "CN"},
-            {"city": "Wuhan (Huangpi)", "airport": "Wuhan Tianhe International Airport", "iata": "WUH", "country": "CN"},
-            {"city": "Wuhu", "airport": "Wuhu Xuanzhou Airport", "iata": "WHA", "country": "CN"},
-            {"city": "Wuhu", "airport": "Wuhu Wanli Airport / Wuhu Air Base", "iata": "WHU", "country": "CN"},
-            {"city": "Wulan", "airport": "Otog Banner Wulan Airport", "iata": "OTO", "country": "CN"},
-            {"city": "Wulong", "airport": "Chongqing Xiannüshan Airport", "iata": "CQW", "country": "CN"},
-            {"city": "Wunaamin Miliwundi Ranges", "airport": "Mount Barnett Airport", "iata": "MBN", "country": "AU"},
-            {"city": "Wunaamin Miliwundi Ranges", "airport": "Beverley Springs Airport", "iata": "BVZ", "country": "AU"},
-            {"city": "Wunaamin Miliwundi Ranges", "airport": "Mount House Airport", "iata": "MHO", "country": "AU"},
-            {"city": "Wunnumin Lake", "airport": "Wunnumin Lake Airport", "iata": "WNN", "country": "CA"},
-            {"city": "Wurrumiyanga", "airport": "Bathurst Island Airport", "iata": "BRT", "country": "AU"},
-            {"city": "Wurster Nordseeküste", "airport": "Sea-Airport Cuxhaven/Nordholz / Nordholz Naval Airbase", "iata": "FCN", "country": "DE"},
-            {"city": "Wushan", "airport": "Chongqing Wushan Airport", "iata": "WSK", "country": "CN"},
-            {"city": "Wuvulu Island", "airport": "Wuvulu Island Airport", "iata": "WUV", "country": "PG"},
-            {"city": "Wuxi", "airport": "Sunan Shuofang International Airport", "iata": "WUX", "country": "CN"},
-            {"city": "Wuyishan", "airport": "Nanping Wuyishan Airport", "iata": "WUS", "country": "CN"},
-            {"city": "Wyk auf Föhr", "airport": "Wyk auf Föhr Airport", "iata": "OHR", "country": "DE"},
-            {"city": "Xai-Xai", "airport": "Xai-Xai Chongoene Airport", "iata": "VJB", "country": "MZ"},
-            {"city": "Xangongo", "airport": "Xangongo Airport", "iata": "XGN", "country": "AO"},
-            {"city": "Xanxerê", "airport": "Xanxerê Airport", "iata": "AXE", "country": "BR"},
-            {"city": "Xi'an (Baqiao)", "airport": "Xi'an Xiguan Airport", "iata": "SIA", "country": "CN"},
-            {"city": "Xiamen", "airport": "Xiamen Gaoqi International Airport", "iata": "XMN", "country": "CN"},
-            {"city": "Xiangxi", "airport": "Xiangxi Biancheng Airport", "iata": "DXJ", "country": "CN"},
-            {"city": "Xiangyang (Laohekou)", "airport": "Guangzhou MR Air Base / Guanghua Airport", "iata": "LHK", "country": "CN"},
-            {"city": "Xiangyang (Xiangzhou)", "airport": "Xiangyang Liuji Airport", "iata": "XFN", "country": "CN"},
-            {"city": "Xianyang (Weicheng)", "airport": "Xi'an Xianyang International Airport", "iata": "XIY", "country": "CN"},
-            {"city": "Xieng Khouang", "airport": "Xieng Khouang Airport", "iata": "XKH", "country": "LA"},
-            {"city": "Xienglom", "airport": "Xienglom Airport", "iata": "XIE", "country": "LA"},
-            {"city": "Xigazê (Dingri)", "airport": "Rikaze Dingri Airport", "iata": "DDR", "country": "CN"},
-            {"city": "Xigazê (Samzhubzê)", "airport": "Xigaze Peace Airport / Shigatse Air Base", "iata": "RKZ", "country": "CN"},
-            {"city": "Xilinhot", "airport": "Xilinhot Airport", "iata": "XIL", "country": "CN"},
-            {"city": "Xingtai", "airport": "Xingtai Dalian Airport", "iata": "XNT", "country": "CN"},
-            {"city": "Xinguara", "airport": "Xinguara Municipal Airport", "iata": "XIG", "country": "BR"},
-            {"city": "Xingyi", "airport": "Xingyi Wanfenglin Airport", "iata": "ACX", "country": "CN"},
-            {"city": "Xinyang", "airport": "Xinyang Minggang Airport", "iata": "XAI", "country": "CN"},
-            {"city": "Xinyuan", "airport": "Xinyuan Nalati Airport", "iata": "NLT", "country": "CN"},
-            {"city": "Xinzhou", "airport": "Xinzhou Wutaishan Airport", "iata": "WUT", "country": "CN"},
-            {"city": "Xuzhou", "airport": "Xuzhou Guanyin International Airport", "iata": "XUZ", "country": "CN"},
-            {"city": "Yacuíba", "airport": "Yacuiba Airport", "iata": "BYC", "country": "BO"},
-            {"city": "Yagoonya", "airport": "Rutland Plains Airport", "iata": "RTP", "country": "AU"},
-            {"city": "Yagoua", "airport": "Yagoua Airport", "iata": "GXX", "country": "CM"},
-            {"city": "Yakataga", "airport": "Yakataga Airport", "iata": "CYT", "country": "US"},
-            {"city": "Yakima", "airport": "Yakima Air Terminal McAllister Field", "iata": "YKM", "country": "US"},
-            {"city": "Yakushima", "airport": "Yakushima Airport", "iata": "KUM", "country": "JP"},
-            {"city": "Yakutat", "airport": "Yakutat Airport", "iata": "YAK", "country": "US"},
-            {"city": "Yakutia", "airport": "Polyarny Airport", "iata": "PYJ", "country": "RU"},
-            {"city": "Yakutsk", "airport": "Yakutsk Airport", "iata": "YKS", "country": "RU"},
-            {"city": "Yalata Mission", "airport": "Yalata Mission Airport", "iata": "KYI", "country": "AU"},
-            {"city": "Yalgoo", "airport": "Yalgoo Airport", "iata": "YLG", "country": "AU"},
-            {"city": "Yalinga", "airport": "Yalinga Airport", "iata": "AIG", "country": "CF"},
-            {"city": "Yalumet", "airport": "Yalumet Airport", "iata": "KYX", "country": "PG"},
-            {"city": "Yam Island", "airport": "Yam Island Airport", "iata": "XMY", "country": "AU"},
-            {"city": "Yamoussoukro", "airport": "Yamoussoukro Airport", "iata": "ASK", "country": "CI"},
-            {"city": "Yamparaez", "airport": "Alcantarí Airport", "iata": "SRE", "country": "BO"},
-            {"city": "Yan'an (Baota)", "airport": "Yan'an Nanniwan Airport", "iata": "ENY", "country": "CN"},
-            {"city": "Yanbu", "airport": "Prince Abdul Mohsin bin Abdulaziz International Airport / Yanbu Airport", "iata": "YNB", "country": "SA"},
-            {"city": "Yancheng (Tinghu)", "airport": "Yancheng Nanyang International Airport", "iata": "YNZ", "country": "CN"},
-            {"city": "Yandina", "airport": "Yandina Airport", "iata": "XYA", "country": "SB"},
-            {"city": "Yangambi", "airport": "Yangambi Airport", "iata": "YAN", "country": "CD"},
-            {"city": "Yangon", "airport": "Yangon International Airport", "iata": "RGN", "country": "MM"},
-            {"city": "Yangzhou", "airport": "Yangzhou Taizhou Airport", "iata": "YTY", "country": "CN"},
-            {"city": "Yanji", "airport": "Yanji Chaoyangchuan Airport", "iata": "YNJ", "country": "CN"},
-            {"city": "Yankton", "airport": "Chan Gurney Municipal Airport", "iata": "YKN", "country": "US"},
-            {"city": "Yantai", "airport": "Penglai Shahekou Airport", "iata": "PNJ", "country": "CN"},
-            {"city": "Yantai", "airport": "Yantai Penglai International Airport", "iata": "YNT", "country": "CN"},
-            {"city": "Yaoundé", "airport": "Yaoundé Airport", "iata": "YAO", "country": "CM"},
-            {"city": "Yaoundé", "airport": "Yaoundé Nsimalen International Airport", "iata": "NSI", "country": "CM"},
-            {"city": "Yap Island", "airport": "Yap International Airport", "iata": "YAP", "country": "FM"},
-            {"city": "Yaren District", "airport": "Nauru International Airport", "iata": "INU", "country": "NR"},
-            {"city": "Yari", "airport": "Yari Airport", "iata": "AYI", "country": "CO"},
-            {"city": "Yarmouth", "airport": "Yarmouth Airport", "iata": "YQI", "country": "CA"},
-            {"city": "Yartsevo", "airport": "Yartsevo Airport", "iata": "YAE", "country": "RU"},
-            {"city": "Yasawa Island", "airport": "Yasawa Island Airport", "iata": "YAS", "country": "FJ"},
-            {"city": "Yasuj", "airport": "Yasuj Airport", "iata": "YES", "country": "IR"},
-            {"city": "Yasuru", "airport": "Yasuru Airport", "iata": "KSX", "country": "PG"},
-            {"city": "Yavarate", "airport": "Yavarate Airport", "iata": "VAB", "country": "CO"},
-            {"city": "Yaviza", "airport": "Yaviza Airport", "iata": "PYV", "country": "PA"},
-            {"city": "Yazd", "airport": "Shahid Sadooghi Airport", "iata": "AZD", "country": "IR"},
-            {"city": "Ye", "airport": "Ye Airport", "iata": "XYE", "country": "MM"},
-            {"city": "Yecheon-ri", "airport": "Yecheon Airbase", "iata": "YEC", "country": "KR"},
-            {"city": "Yedinka", "airport": "Yedinka Airport", "iata": "EDN", "country": "RU"},
-            {"city": "Yekaterinburg", "airport": "Koltsovo Airport", "iata": "SVX", "country": "RU"},
-            {"city": "Yellow River Mission", "airport": "Edwaki Airport", "iata": "XYR", "country": "PG"},
-            {"city": "Yellowknife", "airport": "Yellowknife International Airport", "iata": "YZF", "country": "CA"},
-            {"city": "Yengema", "airport": "Yengema Airport", "iata": "WYE", "country": "SL"},
-            {"city": "Yeniseysk", "airport": "Yeniseysk Airport", "iata": "EIE", "country": "RU"},
-            {"city": "Yenişehir", "airport": "Bursa Yenişehir Airport", "iata": "YEI", "country": "TR"},
-            {"city": "Yeosu", "airport": "Yeosu Airport", "iata": "RSU", "country": "KR"},
-            {"city": "Yeovil, Somerset", "airport": "RNAS Yeovilton", "iata": "YEO", "country": "GB"},
-            {"city": "Yerevan", "airport": "Zvartnots International Airport", "iata": "EVN", "country": "AM"},
-            {"city": "Yerington", "airport": "Yerington Municipal Airport", "iata": "EYR", "country": "US"},
-            {"city": "Yes Bay", "airport": "Yes Bay Lodge Seaplane Base", "iata": "WYB", "country": "US"},
-            {"city": "Yeva", "airport": "Yeva Airport", "iata": "YVD", "country": "PG"},
-            {"city": "Yevlakh", "airport": "Yevlakh Airport", "iata": "YLV", "country": "AZ"},
-            {"city": "Yeysk", "airport": "Yeysk Airport", "iata": "EIK", "country": "RU"},
-            {"city": "Yibin (Cuiping)", "airport": "Yibin Wuliangye Airport", "iata": "YBP", "country": "CN"},
-            {"city": "Yichang (Xiaoting)", "airport": "Yichang Sanxia Airport", "iata": "YIH", "country": "CN"},
-            {"city": "Yichun", "airport": "Yichun Mingyueshan Airport", "iata": "YIC", "country": "CN"},
-            {"city": "Yichun", "airport": "Yichun Lindu Airport", "iata": "LDS", "country": "CN"},
-            {"city": "Yigo", "airport": "Andersen Air Force Base", "iata": "UAM", "country": "GU"},
-            {"city": "Yinchuan", "airport": "Yinchuan Yueyahu Airport", "iata": "YEH", "country": "CN"},
-            {"city": "Yinchuan", "airport": "Yinchuan Hedong International Airport", "iata": "INC", "country": "CN"},
-            {"city": "Yingkou (Laobian)", "airport": "Yingkou Lanqi Airport", "iata": "YKH", "country": "CN"},
-            {"city": "Yingzhou, Fuyang", "airport": "Fuyang Xiguan Airport", "iata": "FUG", "country": "CN"},
-            {"city": "Ylivieska", "airport": "Ylivieska Airfield", "iata": "YLI", "country": "FI"},
-            {"city": "Yogyakarta", "airport": "Yogyakarta International Airport", "iata": "YIA", "country": "ID"},
-            {"city": "Yogyakarta", "airport": "Adisutjipto Airport", "iata": "JOG", "country": "ID"},
-            {"city": "Yola", "airport": "Yola Airport", "iata": "YOL", "country": "NG"},
-            {"city": "Yonago", "airport": "Yonago Kitaro Airport / JASDF Miho Air Base", "iata": "YGJ", "country": "JP"},
-            {"city": "Yonaguni", "airport": "Yonaguni Airport", "iata": "OGN", "country": "JP"},
-            {"city": "Yongai", "airport": "Yongai Airport", "iata": "KGH", "country": "PG"},
-            {"city": "Yongphulla", "airport": "Yongphulla Airport", "iata": "YON", "country": "BT"},
-            {"city": "Yongzhou", "airport": "Yongzhou Lingling Airport", "iata": "LLF", "country": "CN"},
-            {"city": "Yopal", "airport": "El Alcaravan - Yopal Airport", "iata": "EYP", "country": "CO"},
-            {"city": "York Landing", "airport": "York Landing Airport", "iata": "ZAC", "country": "CA"},
-            {"city": "Yorke Island", "airport": "Yorke Island Airport", "iata": "OKR", "country": "AU"},
-            {"city": "Yorkton", "airport": "Yorkton Municipal Airport", "iata": "YQV", "country": "CA"},
-            {"city": "Yoro", "airport": "Yoro Airport", "iata": "ORO", "country": "HN"},
-            {"city": "Yoron", "airport": "Yoron Airport", "iata": "RNJ", "country": "JP"},
-            {"city": "Yoshkar-Ola", "airport": "Yoshkar-Ola Airport", "iata": "JOK", "country": "RU"},
-            {"city": "Yotvata", "airport": "Yotvata Airfield", "iata": "YOT", "country": "IL"},
-            {"city": "Youngstown/Warren", "airport": "Youngstown Warren Regional Airport", "iata": "YNG", "country": "US"},
-            {"city": "Yueyang (Yueyanglou)", "airport": "Yueyang Sanhe Airport", "iata": "YYA", "country": "CN"},
-            {"city": "Yulara", "airport": "Ayers Rock Connellan Airport", "iata": "AYQ", "country": "AU"},
-            {"city": "Yule Island", "airport": "Kairuku Airport", "iata": "RKU", "country": "PG"},
-            {"city": "Yulin", "airport": "Yulin Yuyang Airport", "iata": "UYN", "country": "CN"},
-            {"city": "Yuma", "airport": "Yuma International Airport / Marine Corps Air Station Yuma", "iata": "YUM", "country": "US"},
-            {"city": "Yuma Proving Ground(Yuma)", "airport": "Laguna Army Airfield", "iata": "LGF", "country": "US"},
-            {"city": "Yuncheng (Yanhu)", "airport": "Yuncheng Zhangxiao Airport", "iata": "YCU", "country": "CN"},
-            {"city": "Yundum", "airport": "Banjul International Airport", "iata": "BJL", "country": "GM"},
-            {"city": "Yurimaguas", "airport": "Moises Benzaquen Rengifo Airport", "iata": "YMS", "country": "PE"},
-            {"city": "Yushu (Batang)", "airport": "Yushu Batang Airport", "iata": "YUS", "country": "CN"},
-            {"city": "Yuzhno-Kurilsk", "airport": "Yuzhno-Kurilsk Mendeleyevo Airport", "iata": "DEE", "country": "RU"},
-            {"city": "Yuzhno-Sakhalinsk", "airport": "Yuzhno-Sakhalinsk Airport", "iata": "UUS", "country": "RU"},
-            {"city": "Yélimané", "airport": "Yélimané Airport", "iata": "EYL", "country": "ML"},
-            {"city": "Yùlín", "airport": "Yulin Fumian Airport", "iata": "YLX", "country": "CN"},
-            {"city": "ZaKouma", "airport": "Zakuoma Airport", "iata": "AKM", "country": "TD"},
-            {"city": "Zaamin", "airport": "Zomin Airport", "iata": "OMN", "country": "UZ"},
-            {"city": "Zabol", "airport": "Zabol Airport", "iata": "ACZ", "country": "IR"},
-            {"city": "Zabrat", "airport": "Zabrat Airport", "iata": "ZXT", "country": "AZ"},
-            {"city": "Zabré", "airport": "Zabré Airport", "iata": "XZA", "country": "BF"},
-            {"city": "Zacatecas", "airport": "General Leobardo C. Ruiz International Airport", "iata": "ZCL", "country": "MX"},
-            {"city": "Zachar Bay", "airport": "Zachar Bay Seaplane Base", "iata": "KZB", "country": "US"},
-            {"city": "Zagora", "airport": "Zagora Airport", "iata": "OZG", "country": "MA"},
-            {"city": "Zahedan", "airport": "Zahedan International Airport", "iata": "ZAH", "country": "IR"},
-            {"city": "Zakynthos", "airport": "Zakynthos International Airport Dionysios Solomos", "iata": "ZTH", "country": "GR"},
-            {"city": "Zalingei", "airport": "Zalingei Airport", "iata": "ZLX", "country": "SD"},
-            {"city": "Zamami", "airport": "Kerama Airport", "iata": "KJP", "country": "JP"},
-            {"city": "Zambezi", "airport": "Zambezi Airport", "iata": "BBZ", "country": "ZM"},
-            {"city": "Zamboanga", "airport": "Zamboanga International Airport", "iata": "ZAM", "country": "PH"},
-            {"city": "Zamora", "airport": "Zamora Airport", "iata": "ZMM", "country": "MX"},
-            {"city": "Zamzama Gas Field", "airport": "Zamzama Heliport", "iata": "ZIZ", "country": "PK"},
-            {"city": "Zanaga", "airport": "Zanaga Airport", "iata": "ANJ", "country": "CG"},
-            {"city": "Zandery", "airport": "Johan Adolf Pengel International Airport", "iata": "PBM", "country": "SR"},
-            {"city": "Zanesville", "airport": "Zanesville Municipal Airport", "iata": "ZZV", "country": "US"},
-            {"city": "Zangilan", "airport": "Zangilan International Airport", "iata": "ZZE", "country": "AZ"},
-            {"city": "Zanjan", "airport": "Zanjan Airport", "iata": "JWN", "country": "IR"},
-            {"city": "Zanzibar", "airport": "Abeid Amani Karume International Airport", "iata": "ZNZ", "country": "TZ"},
-            {"city": "Zapala", "airport": "Zapala Airport", "iata": "APZ", "country": "AR"},
-            {"city": "Zapatoca", "airport": "Zapatoca Airport", "iata": "AZT", "country": "CO"},
-            {"city": "Zaporizhia", "airport": "Zaporizhzhia International Airport", "iata": "OZH", "country": "UA"},
-            {"city": "Zaqatala", "airport": "Zaqatala International Airport", "iata": "ZTU", "country": "AZ"},
-            {"city": "Zarafshan", "airport": "Sugraly Airport", "iata": "AFS", "country": "UZ"},
-            {"city": "Zaragoza", "airport": "Zaragoza Airport", "iata": "ZAZ", "country": "ES"},
-            {"city": "Zaranj", "airport": "Zaranj Airport", "iata": "ZAJ", "country": "AF"},
-            {"city": "Zaraza", "airport": "Zaraza Airport", "iata": "ZRZ", "country": "VE"},
-            {"city": "Zaria", "airport": "Zaria Airport", "iata": "ZAR", "country": "NG"},
-            {"city": "Zaventem", "airport": "Brussels Airport", "iata": "BRU", "country": "BE"},
-            {"city": "Zaysan", "airport": "Zaysan Airport", "iata": "SZI", "country": "KZ"},
-            {"city": "Zemio", "airport": "Zemio Airport", "iata": "IMO", "country": "CF"},
-            {"city": "Zemun", "airport": "Batajnica Air Base", "iata": "BJY", "country": "RS"},
-            {"city": "Zemunik Donji (Zadar)", "airport": "Zadar Airport", "iata": "ZAD", "country": "HR"},
-            {"city": "Zenag", "airport": "Zenag Airport", "iata": "ZEN", "country": "PG"},
-            {"city": "Zenata", "airport": "Zenata – Messali El Hadj Airport", "iata": "TLM", "country": "DZ"},
-            {"city": "Zephyrhills", "airport": "Zephyrhills Municipal Airport", "iata": "ZPH", "country": "US"},
-            {"city": "Zeya", "airport": "Zeya Airport", "iata": "EYA", "country": "RU"},
-            {"city": "Zgornji Brnik", "airport": "Ljubljana Jože Pučnik Airport", "iata": "LJU", "country": "SI"},
-            {"city": "Zhalantun", "airport": "Zhalantun Genghis Khan Airport", "iata": "NZL", "country": "CN"},
-            {"city": "Zhangjiajie (Yongding)", "airport": "Zhangjiajie Hehua International Airport", "iata": "DYG", "country": "CN"},
-            {"city": "Zhangjiakou", "airport": "Zhangjiakou Ningyuan Airport", "iata": "ZQZ", "country": "CN"},
-            {"city": "Zhangye (Ganzhou)", "airport": "Zhangye Ganzhou Airport", "iata": "YZY", "country": "CN"},
-            {"city": "Zhanjiang", "airport": "Zhanjiang Wuchuan Airport", "iata": "ZHA", "country": "CN"},
-            {"city": "Zhaosu", "airport": "Zhaosu Tianma Airport", "iata": "ZFL", "country": "CN"},
-            {"city": "Zhaotong (Zhaoyang)", "airport": "Zhaotong Airport", "iata": "ZAT", "country": "CN"},
-            {"city": "Zhayrem", "airport": "Sary Su Airport", "iata": "HRC", "country": "KZ"},
-            {"city": "Zhengzhou", "airport": "Zhengzhou Shangjie Airport", "iata": "HSJ", "country": "CN"},
-            {"city": "Zhengzhou", "airport": "Zhengzhou Xinzheng International Airport", "iata": "CGO", "country": "CN"},
-            {"city": "Zhenjiang", "airport": "Zhenjiang Dalu Airport", "iata": "AZJ", "country": "CN"},
-            {"city": "Zhezkazgan", "airport": "Zhezkazgan National Airport", "iata": "DZN", "country": "KZ"},
-            {"city": "Zhigansk", "airport": "Zhigansk Airport", "iata": "ZIX", "country": "RU"},
-            {"city": "Zhongshan", "airport": "Zhongshan Ferry Port", "iata": "ZGN", "country": "CN"},
-            {"city": "Zhongwei (Shapotou)", "airport": "Zhongwei Shapotou Airport", "iata": "ZHY", "country": "CN"},
-            {"city": "Zhoushan", "airport": "Zhoushan Putuoshan Airport", "iata": "HSN", "country": "CN"},
-            {"city": "Zhuhai (Jinwan)", "airport": "Zhuhai Jinwan Airport", "iata": "ZUH", "country": "CN"},
-            {"city": "Zhytomyr", "airport": "Zhytomyr Airport", "iata": "ZTR", "country": "UA"},
-            {"city": "Zigong (Gongjing)", "airport": "Zigong Fengming Airport", "iata": "ZKL", "country": "CN"},
-            {"city": "Ziguinchor", "airport": "Ziguinchor Airport", "iata": "ZIG", "country": "SN"},
-            {"city": "Zilfi", "airport": "Zilfi Airport", "iata": "ZUL", "country": "SA"},
-            {"city": "Zinder", "airport": "Zinder Airport", "iata": "ZND", "country": "NE"},
-            {"city": "Zintan", "airport": "Alzintan Airport", "iata": "ZIS", "country": "LY"},
-            {"city": "Zion's Hill", "airport": "Juancho E. Yrausquin Airport", "iata": "SAB", "country": "BQ"},
-            {"city": "Zirchow", "airport": "Heringsdorf Airport", "iata": "HDF", "country": "DE"},
-            {"city": "Ziro", "airport": "Ziro Airport", "iata": "ZER", "country": "IN"},
-            {"city": "Zoersel", "airport": "Oostmalle Airfield", "iata": "OBL", "country": "BE"},
-            {"city": "Zonguldak", "airport": "Zonguldak Çaycuma Airport", "iata": "ONQ", "country": "TR"},
-            {"city": "Zouérate", "airport": "Tazadit Airport", "iata": "OUZ", "country": "MR"},
-            {"city": "Zunyi", "airport": "Zunyi Maotai Airport", "iata": "WMT", "country": "CN"},
-            {"city": "Zunyi", "airport": "Zunyi Xinzhou Airport", "iata": "ZYI", "country": "CN"},
-            {"city": "Zurich", "airport": "Zürich Airport", "iata": "ZRH", "country": "CH"},
-            {"city": "Zuwarah", "airport": "Zuwarah International Airport", "iata": "WAX", "country": "LY"},
-            {"city": "Zwedru", "airport": "Tchien Airport", "iata": "THC", "country": "LR"},
-            {"city": "Zweibrücken", "airport": "Zweibrücken Airport", "iata": "ZQW", "country": "DE"},
-            {"city": "Zyryanka", "airport": "Zyryanka Airport", "iata": "ZKP", "country": "RU"},
-            {"city": "Água Boa", "airport": "Frederico Carlos Müller Airport", "iata": "GGB", "country": "BR"},
-            {"city": "Álamos", "airport": "Álamos Airport", "iata": "XAL", "country": "MX"},
-            {"city": "Ängelholm", "airport": "Ängelholm-Helsingborg Airport", "iata": "AGH", "country": "SE"},
-            {"city": "Ålesund", "airport": "Ålesund Airport, Vigra", "iata": "AES", "country": "NO"},
-            {"city": "Årø", "airport": "Molde Airport, Årø", "iata": "MOL", "country": "NO"},
-            {"city": "Çanakkale", "airport": "Çanakkale Airport", "iata": "CKZ", "country": "TR"},
-            {"city": "Çiğli", "airport": "Çiğli Airbase", "iata": "IGL", "country": "TR"},
-            {"city": "Çorlu", "airport": "Tekirdağ Çorlu Airport", "iata": "TEQ", "country": "TR"},
-            {"city": "Éléonore Mine", "airport": "Opinaca Aerodrome", "iata": "YOI", "country": "CA"},
-            {"city": "Épinal", "airport": "Épinal Mirecourt Airport", "iata": "EPL", "country": "FR"},
-            {"city": "Ísafjörður", "airport": "Ísafjörður Airport", "iata": "IFJ", "country": "IS"},
-            {"city": "Île d'Yeu", "airport": "Île d'Yeu Airport", "iata": "IDY", "country": "FR"},
-            {"city": "Île des Pins", "airport": "Île des Pins Airport", "iata": "ILP", "country": "NC"},
-            {"city": "Óbidos", "airport": "Óbidos Municipal Airport", "iata": "OBI", "country": "BR"},
-            {"city": "Ólafsfjörður", "airport": "Ólafsfjörður Airport", "iata": "OFJ", "country": "IS"},
-            {"city": "Ölgii", "airport": "Ölgii Mongolei Airport", "iata": "ULG", "country": "MN"},
-            {"city": "Öndörkhaan", "airport": "Öndörkhaan Airport", "iata": "UNR", "country": "MN"},
-            {"city": "Örebro", "airport": "Örebro Airport", "iata": "ORB", "country": "SE"},
-            {"city": "Örnsköldsvik", "airport": "Örnsköldsvik Airport", "iata": "OER", "country": "SE"},
-            {"city": "Östersund", "airport": "Åre Östersund Airport", "iata": "OSD", "country": "SE"},
-            {"city": "Ørland", "airport": "Ørland Airport", "iata": "OLA", "country": "NO"},
-            {"city": "Ørsta", "airport": "Ørsta-Volda Airport, Hovden", "iata": "HOV", "country": "NO"},
-            {"city": "Ürümqi", "airport": "Ürümqi Tianshan International Airport", "iata": "URC", "country": "CN"},
-            {"city": "Þingeyri", "airport": "Þingeyri Airport", "iata": "TEY", "country": "IS"},
-            {"city": "Þórshöfn", "airport": "Þórshöfn Airport", "iata": "THO", "country": "IS"},
-            {"city": "České Budějovice", "airport": "České Budějovice South Bohemian Airport", "iata": "JCL", "country": "CZ"},
-            {"city": "Čilipi", "airport": "Dubrovnik Ruđer Bošković Airport", "iata": "DBV", "country": "HR"},
-            {"city": "Đăk R'Lấp", "airport": "Nhon Co Airfield", "iata": "HOO", "country": "VN"},
-            {"city": "Łódź", "airport": "Łódź Władysław Reymont Airport", "iata": "LCJ", "country": "PL"},
-            {"city": "Ōzora", "airport": "Memanbetsu Airport", "iata": "MMB", "country": "JP"},
-            {"city": "Şanlıurfa", "airport": "Şanlıurfa GAP Airport", "iata": "GNY", "country": "TR"},
-            {"city": "Şırnak", "airport": "Şırnak Şerafettin Elçi Airport", "iata": "NKT", "country": "TR"},
-            {"city": "Šiauliai", "airport": "Šiauliai International Airport", "iata": "SQQ", "country": "LT"}
-        ]
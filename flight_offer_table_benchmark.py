@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+FLIGHT OFFER TABLE BENCHMARK
+============================
+
+Compares the legacy per-dict filtering of /api/flights/search (list
+comprehensions calling extract_hour_from_time for every flight, then sorted()
+with a Python key) with the columnar OfferTable (vectorized budget / time band
+/ stops masks and one lexsort) on synthetic result sets of 10k+ offers, the
+size of a flexible-dates + nearby-airports search across several suppliers.
+The legacy path runs on the API's flight dicts, the table on FlightOffers.
+
+The table is built once per search and reused for every filter change, so its
+build time is reported separately. Run from the repository root:
+
+    python flight_offer_table_benchmark.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+
+from flight_offer import FlightOffer  # noqa: E402
+from offer_table import OfferTable  # noqa: E402
+
+SIZES = (10_000, 50_000)
+ROUNDS = 20
+AIRLINES = [("6E", "IndiGo"), ("AI", "Air India"), ("UK", "Vistara"), ("SG", "SpiceJet"),
+            ("QP", "Akasa Air"), ("IX", "Air India Express"), ("EK", "Emirates"), ("G8", "Go First")]
+# One filter change: budget, morning departures, at most one stop, cheapest then shortest
+BUDGET = (3500, 9000)
+BAND = "morning"
+MAX_STOPS = 1
+
+
+def synthetic_offers(count, seed=7):
+    rng = random.Random(seed)
+    offers = []
+    for i in range(count):
+        code, name = rng.choice(AIRLINES)
+        departure = rng.randrange(0, 24 * 60, 5)
+        duration = rng.randrange(55, 900, 5)
+        arrival = (departure + duration) % (24 * 60)
+        offers.append(FlightOffer.build(
+            supplier="tbo",
+            id=f"OFFER_{i}",
+            airline_code=code,
+            airline=name,
+            flight_number=str(rng.randrange(100, 9999)),
+            origin_code="DEL",
+            destination_code="BOM",
+            departure_time=f"{departure // 60:02d}:{departure % 60:02d}",
+            arrival_time=f"{arrival // 60:02d}:{arrival % 60:02d}",
+            travel_date="2025-08-01",
+            duration=duration,
+            stops=rng.choice((0, 0, 0, 1, 1, 2)),
+            price=rng.randrange(2500, 25000),
+            fare_types=[{"type": "saver", "refundable": False}, {"type": "regular", "refundable": rng.random() < 0.6}],
+        ))
+    return offers
+
+
+def extract_hour_from_time(time_str):
+    """The legacy server.py helper, kept here only as the benchmark baseline"""
+    try:
+        if 'T' in time_str:
+            return int(time_str.split('T')[1].split(':')[0])
+        return int(time_str.split(':')[0])
+    except (ValueError, IndexError):
+        return 12
+
+
+def legacy_filter_sort(offers):
+    """The pre-table algorithm: one list comprehension per filter, then sorted()"""
+    flights = [f for f in offers if BUDGET[0] <= f.get('price', 0) <= BUDGET[1]]
+    flights = [f for f in flights if 5 <= extract_hour_from_time(f.get('departure_time', '12:00')) < 12]
+    flights = [f for f in flights if (f.get('stops') or 0) <= MAX_STOPS]
+    return sorted(flights, key=lambda f: (f['price'], f['duration_minutes']))
+
+
+def table_filter_sort(table, offers):
+    mask = table.mask(min_price=BUDGET[0], max_price=BUDGET[1], time_bands=[BAND], max_stops=MAX_STOPS)
+    return table.select(offers, table.order(mask, ['price', 'duration']))
+
+
+def mean_ms(call, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        call()
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+def main():
+    print("✈️  FLIGHT OFFER TABLE BENCHMARK")
+    print("=" * 80)
+    print(f"Filter: price {BUDGET[0]}-{BUDGET[1]}, {BAND} departures, <= {MAX_STOPS} stop; sort price, duration")
+    print(f"{'offers':>7}  {'matches':>7}  {'legacy ms':>10}  {'table ms':>9}  {'speedup':>8}  {'build ms':>9}")
+    for size in SIZES:
+        offers = synthetic_offers(size)
+        flights = [offer.to_dict() for offer in offers]
+        table = OfferTable(offers)
+
+        # Sanity check: both paths must return the same offers in the same order
+        expected = legacy_filter_sort(flights)
+        assert [offer.id for offer in table_filter_sort(table, offers)] == [f['id'] for f in expected]
+
+        legacy = mean_ms(lambda: legacy_filter_sort(flights), ROUNDS)
+        vectorized = mean_ms(lambda: table_filter_sort(table, offers), ROUNDS)
+        build = mean_ms(lambda: OfferTable(offers), 3)
+        print(f"{size:>7}  {len(expected):>7}  {legacy:>10.2f}  {vectorized:>9.2f}  {legacy / vectorized:>7.1f}x  {build:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,12 @@ for the TourSmile OTA platform. This ensures 100% coverage of all IATA airports.
 import csv
 import json
 import re
+import sys
+from pathlib import Path
 from typing import List, Dict, Any
 
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+
 def process_openflights_data(data_text: str) -> List[Dict[str, Any]]:
     """Process OpenFlights CSV data and extract airports with valid IATA codes"""
     
@@ -53,6 +57,13 @@ def process_openflights_data(data_text: str) -> List[Dict[str, Any]]:
                     "countryName": country
                 }
                 
+                # Coordinates feed the backend's nearby-airport index
+                try:
+                    airport_entry["lat"] = round(float(row[6]), 4)
+                    airport_entry["lon"] = round(float(row[7]), 4)
+                except ValueError:
+                    airport_entry.pop("lat", None)
+                
                 airports.append(airport_entry)
                 
         except Exception as e:
@@ -246,26 +257,13 @@ def generate_frontend_js(airports: List[Dict[str, Any]]) -> str:
         js_entry = f'  {{ city: "{airport["city"]}", iata: "{airport["iata"]}", airport: "{airport["airport"]}", country: "{airport["country"]}", countryName: "{airport["countryName"]}" }}'
         js_entries.append(js_entry)
     
+    entries = ',\n'.join(js_entries)
     js_content = f"""const GLOBAL_AIRPORTS_DATABASE = [
-{',\\n'.join(js_entries)}
+{entries}
 ];"""
     
     return js_content
 
-def generate_backend_python(airports: List[Dict[str, Any]]) -> str:
-    """Generate backend Python list for the airport database"""
-    
-    py_entries = []
-    for airport in airports:
-        py_entry = f'            {{"city": "{airport["city"]}", "airport": "{airport["airport"]}", "iata": "{airport["iata"]}", "country": "{airport["country"]}"}}'
-        py_entries.append(py_entry)
-    
-    py_content = f"""        airports_db = [
-{',\\n'.join(py_entries)}
-        ]"""
-    
-    return py_content
-
 if __name__ == "__main__":
     # OpenFlights raw data (first few hundred lines for processing)
     sample_data = '''1,"Goroka Airport","Goroka","Papua New Guinea","GKA","AYGA",-6.081689834590001,145.391998291,5282,10,"U","Pacific/Port_Moresby","airport","OurAirports"
@@ -275,14 +273,23 @@ if __name__ == "__main__":
     print("🚀 Processing OpenFlights airport database...")
     print("📊 This will create a comprehensive IATA airport database for TourSmile OTA")
     
-    # For demo purposes - in production, you would load the full dataset
-    print("⚠️  Demo mode - processing sample data")
-    print("💡 In production, load the full OpenFlights dataset for complete coverage")
-    
-    airports = process_openflights_data(sample_data)
+    # With an airports.dat path the full dataset becomes the backend catalogue;
+    # without one only the sample is processed and nothing is written
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as f:
+            airports = process_openflights_data(f.read())
+    else:
+        print("⚠️  Demo mode - processing sample data")
+        print("💡 Pass the OpenFlights airports.dat path to export the full dataset")
+        airports = process_openflights_data(sample_data)
     
     print(f"✅ Successfully processed {len(airports)} airports")
     for airport in airports[:5]:
         print(f"   {airport['iata']} - {airport['airport']}, {airport['city']}")
     
-    print("\n📝 Generate frontend and backend code with these airports")
\ No newline at end of file
+    if len(sys.argv) > 1:
+        from airport_index import AIRPORTS_DB_PATH, AIRPORT_SNAPSHOT_PATH, export_catalogue
+        index = export_catalogue(airports)
+        print(f"📦 Wrote {AIRPORTS_DB_PATH.name} and {AIRPORT_SNAPSHOT_PATH.name} ({len(index)} airports)")
+    
+    print("\n📝 Generate frontend code with these airports")
\ No newline at end of file
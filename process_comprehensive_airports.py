@@ -7,7 +7,13 @@ for the TourSmile OTA platform ensuring 100% coverage.
 import csv
 import json
 import re
+import sys
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+
+from airport_index import AIRPORTS_DB_PATH, AIRPORT_SNAPSHOT_PATH, export_catalogue  # noqa: E402
 
 def process_comprehensive_airports():
     """Process the comprehensive airports database"""
@@ -94,6 +100,7 @@ def process_comprehensive_airports():
                 airport_name = row.get('name', '').strip().strip('"')
                 municipality = row.get('municipality', '').strip().strip('"')
                 iso_country = row.get('iso_country', '').strip().strip('"')
+                airport_type = row.get('type', '').strip().strip('"')
                 
                 # Only include airports with valid 3-letter IATA codes
                 if (iata_code and 
@@ -114,6 +121,17 @@ def process_comprehensive_airports():
                         "countryName": country_name
                     }
                     
+                    # Coordinates and size feed the backend's nearby-airport index
+                    try:
+                        lat = round(float(row.get('latitude_deg', '')), 4)
+                        lon = round(float(row.get('longitude_deg', '')), 4)
+                        airport_entry["lat"] = lat
+                        airport_entry["lon"] = lon
+                    except ValueError:
+                        pass
+                    if airport_type:
+                        airport_entry["type"] = airport_type
+                    
                     iata_airports.append(airport_entry)
         
         # Remove duplicates based on IATA code (keep first occurrence)
@@ -166,26 +184,6 @@ def generate_frontend_js(airports):
     
     return js_content
 
-def generate_backend_python(airports):
-    """Generate Python list for backend"""
-    py_entries = []
-    
-    for airport in airports:
-        # Escape quotes in names
-        city = airport['city'].replace('"', '\\"')
-        airport_name = airport['airport'].replace('"', '\\"')
-        
-        py_entry = f'            {{"city": "{city}", "airport": "{airport_name}", "iata": "{airport["iata"]}", "country": "{airport["country"]}"}}'
-        py_entries.append(py_entry)
-    
-    py_entries_joined = ',\n'.join(py_entries)
-    py_content = f"""        # 🌍 COMPREHENSIVE IATA AIRPORT DATABASE - {len(airports)} AIRPORTS
-        airports_db = [
-{py_entries_joined}
-        ]"""
-    
-    return py_content
-
 if __name__ == "__main__":
     print("🚀 TourSmile Comprehensive Airport Database Processor")
     print("=" * 60)
@@ -200,11 +198,13 @@ if __name__ == "__main__":
         # Generate code snippets
         print("\n📝 Generating code snippets...")
         frontend_code = generate_frontend_js(airports[:100])  # Sample for display
-        backend_code = generate_backend_python(airports[:100])  # Sample for display
         
         print("✅ Code generation complete")
         print(f"🔧 Frontend snippet length: {len(frontend_code)} chars")
-        print(f"🔧 Backend snippet length: {len(backend_code)} chars")
+        
+        # Backend loads a binary snapshot instead of a pasted Python literal
+        index = export_catalogue(airports)
+        print(f"📦 Wrote {AIRPORTS_DB_PATH.name} and {AIRPORT_SNAPSHOT_PATH.name} ({len(index)} airports)")
         
         # Save airports to JSON for easy import
         with open('/app/comprehensive_airports.json', 'w') as f:
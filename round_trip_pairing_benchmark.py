@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+ROUND TRIP PAIRING BENCHMARK
+============================
+
+Compares pricing every outbound x return combination of a round-trip search
+(score all pairs, then sort) with the heap k-best merge in
+round_trip_pairing.pair_round_trips, on synthetic one-day searches with a
+minimum stay and a same-carrier bonus. Both must return the same scores.
+Run from the repository root:
+
+    python round_trip_pairing_benchmark.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+
+from flight_offer import FlightOffer  # noqa: E402
+from round_trip_pairing import pair_round_trips, same_carrier  # noqa: E402
+
+SIZES = (100, 300, 1000)
+K = 10
+ROUNDS = 20
+MIN_STAY = 120
+BONUS = 250.0
+AIRLINES = [("6E", "IndiGo"), ("AI", "Air India"), ("UK", "Vistara"), ("SG", "SpiceJet"),
+            ("QP", "Akasa Air"), ("IX", "Air India Express")]
+
+
+def synthetic_leg(count, origin, destination, travel_date, seed):
+    rng = random.Random(seed)
+    offers = []
+    for i in range(count):
+        code, name = rng.choice(AIRLINES)
+        departure = rng.randrange(0, 24 * 60, 5)
+        duration = rng.randrange(55, 300, 5)
+        arrival = departure + duration
+        offers.append(FlightOffer.build(
+            supplier="tbo",
+            id=f"{origin}{destination}_{i}",
+            airline_code=code,
+            airline=name,
+            flight_number=str(rng.randrange(100, 9999)),
+            origin_code=origin,
+            destination_code=destination,
+            # "HH:MM" on travel_date; an arrival past midnight rolls to the next day
+            departure_time=f"{departure // 60:02d}:{departure % 60:02d}",
+            arrival_time=f"{arrival // 60 % 24:02d}:{arrival % 60:02d}",
+            travel_date=travel_date,
+            duration=duration,
+            price=rng.randrange(2500, 15000),
+        ))
+    return offers
+
+
+def cross_product(outbound, inbound, k):
+    """Every combination scored, then sorted: the baseline"""
+    pairs = []
+    for out_offer in outbound:
+        for ret_offer in inbound:
+            if ret_offer.departure - out_offer.arrival < MIN_STAY:
+                continue
+            score = out_offer.price + ret_offer.price - (BONUS if same_carrier(out_offer, ret_offer) else 0)
+            pairs.append((score, out_offer, ret_offer))
+    pairs.sort(key=lambda pair: pair[0])
+    return pairs[:k]
+
+
+def heap_pairs(outbound, inbound, k):
+    return pair_round_trips(outbound, inbound, k, min_stay_minutes=MIN_STAY, same_carrier_bonus=BONUS)
+
+
+def mean_ms(call, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        call()
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+def main():
+    print("✈️  ROUND TRIP PAIRING BENCHMARK")
+    print("=" * 80)
+    print(f"Top {K} same-day round trips, stay >= {MIN_STAY} min, same-carrier bonus {BONUS:.0f}")
+    print(f"{'per leg':>7}  {'pairs':>9}  {'cross ms':>9}  {'heap ms':>8}  {'speedup':>8}")
+    for size in SIZES:
+        outbound = synthetic_leg(size, "DEL", "BOM", "2025-08-01", seed=7)
+        inbound = synthetic_leg(size, "BOM", "DEL", "2025-08-01", seed=11)
+
+        # Sanity check: both must find the same best scores
+        expected = [pair[0] for pair in cross_product(outbound, inbound, K)]
+        assert [pair.score for pair in heap_pairs(outbound, inbound, K)] == expected
+
+        rounds = max(1, ROUNDS * 100 // size)
+        cross = mean_ms(lambda: cross_product(outbound, inbound, K), max(1, rounds // 10))
+        heap = mean_ms(lambda: heap_pairs(outbound, inbound, K), rounds)
+        print(f"{size:>7}  {size * size:>9}  {cross:>9.2f}  {heap:>8.2f}  {cross / heap:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import pytest
+
+from airport_index import AirportIndex
+
+QUERIES = ["d", "de", "del", "delhi", "lon", "london", "new y", "heathrow", "frankfrut", "bangaluru",
+           "sao paulo", "zürich", "aalb", "xyzzy", "DXB", "Dubai Intl"]
+
+
+@pytest.fixture(scope="module")
+def indexes(tmp_path_factory):
+    """A freshly built index and the same index mapped back from its snapshot"""
+    path = tmp_path_factory.mktemp("airports") / "airports_snapshot.bin"
+    fresh = AirportIndex.from_json()
+    fresh.save(path)
+    return fresh, AirportIndex.open(path), path
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_snapshot_answers_byte_for_byte_like_a_fresh_build(indexes, query):
+    fresh, mapped, _ = indexes
+    for fuzzy in (True, False):
+        assert mapped.search_json(query, 10, fuzzy) == fresh.search_json(query, 10, fuzzy)
+
+
+def test_snapshot_lookups_match_a_fresh_build(indexes):
+    fresh, mapped, _ = indexes
+    codes = ["DEL", "LON", "NYC", "BOM", "ZZZ"]
+    assert mapped.resolve(codes) == fresh.resolve(codes)
+    for place in ("DEL", "Mumbai", "London", "nowhere"):
+        assert mapped.nearby_codes(place) == fresh.nearby_codes(place)
+    assert len(mapped) == len(fresh)
+
+
+def test_saving_a_mapped_snapshot_rewrites_the_same_bytes(indexes, tmp_path):
+    _, mapped, path = indexes
+    mapped.save(tmp_path / "again.bin")
+    assert (tmp_path / "again.bin").read_bytes() == path.read_bytes()
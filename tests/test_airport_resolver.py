@@ -0,0 +1,28 @@
+import pytest
+
+from airport_resolver import AirportCodeResolver
+
+
+@pytest.fixture(scope="module")
+def resolver():
+    return AirportCodeResolver()
+
+
+@pytest.mark.parametrize("typed, code", [
+    ("DEL", "DEL"),
+    ("lon", "LON"),
+    ("Jaipur", "JAI"),
+    ("Bombay", "BOM"),
+    ("Frankfurt am Main", "FRA"),
+    # Near-miss spellings resolve through the ranked search
+    ("Heatrow", "LHR"),
+    ("Frankfrut", "FRA"),
+    ("Bankok", "BKK"),
+])
+def test_resolves_codes_names_and_typos(resolver, typed, code):
+    assert resolver.resolve(typed) == code
+
+
+@pytest.mark.parametrize("typed", ["xyzzy", "Europe", "zzz", "", "  "])
+def test_unknown_places_do_not_become_codes(resolver, typed):
+    assert resolver.resolve(typed) is None
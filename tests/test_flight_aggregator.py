@@ -0,0 +1,73 @@
+import asyncio
+
+from flight_aggregator import FlightAggregator, FlightSupplier, merge_offers
+from flight_cache import FlightSearchCache
+from flight_offer import FlightOffer
+from flight_search import SearchVariant
+
+VARIANT = SearchVariant("DEL", "BOM", "2030-01-15")
+
+
+def offer(supplier, flight_number, price, departure_time="06:00", price_estimated=False):
+    return FlightOffer.build(
+        supplier=supplier, id=f"{supplier}-{flight_number}", airline_code="6E", airline="IndiGo",
+        flight_number=flight_number, origin_code="DEL", destination_code="BOM", departure_time=departure_time,
+        arrival_time="08:10", travel_date=VARIANT.departure_date, price=price, price_estimated=price_estimated,
+    )
+
+
+def test_same_flight_keeps_the_cheapest_fare_with_every_source():
+    tbo = offer("tbo", "6E-123", 5200)
+    tripjack = offer("tripjack", "123", 4900)
+    other = offer("tbo", "456", 3000)
+
+    merged = merge_offers([tbo, other, tripjack])
+
+    assert [flight.id for flight in merged] == ["tripjack-123", "tbo-456"]
+    assert merged[0].price == 4900
+    assert merged[0].offers == [
+        {"supplier": "tbo", "id": "tbo-6E-123", "price": 5200.0},
+        {"supplier": "tripjack", "id": "tripjack-123", "price": 4900.0},
+    ]
+    # Inputs may be cached and shared: they are never mutated
+    assert len(tbo.offers) == 1 and len(tripjack.offers) == 1
+
+
+def test_real_fares_beat_estimates_and_unpriced_offers():
+    estimate = offer("aerodatabox", "123", 1000, price_estimated=True)
+    unpriced = offer("amadeus", "123", 0)
+    real = offer("tbo", "123", 5000)
+
+    merged = merge_offers([estimate, unpriced, real])
+
+    assert len(merged) == 1
+    assert merged[0].supplier == "tbo"
+    assert [source["supplier"] for source in merged[0].offers] == ["aerodatabox", "amadeus", "tbo"]
+
+
+def test_other_departures_are_other_flights():
+    assert len(merge_offers([offer("tbo", "123", 5000), offer("tbo", "123", 5000, departure_time="18:00")])) == 2
+
+
+def test_search_merges_suppliers_and_reports_failures():
+    async def tbo(origin, destination, departure_date, **_):
+        return [offer("tbo", "123", 5200)]
+
+    async def tripjack(origin, destination, departure_date, **_):
+        return [offer("tripjack", "123", 4900), offer("tripjack", "789", 6100)]
+
+    async def amadeus(origin, destination, departure_date, **_):
+        raise RuntimeError("supplier down")
+
+    suppliers = [FlightSupplier(name, search, blocking=False)
+                 for name, search in (("tbo", tbo), ("tripjack", tripjack), ("amadeus", amadeus))]
+    aggregator = FlightAggregator(suppliers, cache=FlightSearchCache(redis_factory=lambda: None),
+                                  enabled="tbo,tripjack,amadeus")
+    report = {}
+
+    flights = asyncio.run(aggregator.search(VARIANT, report=report))
+
+    assert [(flight.supplier, flight.price) for flight in flights] == [("tripjack", 4900.0), ("tripjack", 6100.0)]
+    assert {source["supplier"] for source in flights[0].offers} == {"tbo", "tripjack"}
+    assert report["amadeus"]["error"] == 1
+    assert report["tripjack"]["offers"] == 2
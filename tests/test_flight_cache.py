@@ -0,0 +1,245 @@
+import asyncio
+import time
+from datetime import datetime
+
+import flight_cache
+from flight_cache import CacheEntry, FlightSearchCache, RedisTier
+from flight_offer import FlightOffer
+
+DEPARTURE = "2030-01-15"
+
+
+def offer(flight_id, price=5000.0):
+    return FlightOffer.build(
+        supplier="tbo", id=flight_id, airline_code="6E", airline="IndiGo", flight_number="123",
+        origin_code="DEL", destination_code="BOM", departure_time="06:00", arrival_time="08:10",
+        travel_date=DEPARTURE, price=price,
+    )
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.gets = 0
+
+    def get(self, key):
+        self.gets += 1
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+class BrokenRedis:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+    def set(self, key, value, ex=None):
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+
+def counting_loader(flights, delay=0.01):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return flights
+
+    return load, calls
+
+
+def test_concurrent_misses_share_one_load():
+    load, calls = counting_loader([offer("A")])
+
+    async def main():
+        cache = FlightSearchCache(redis_factory=lambda: None)
+        results = await asyncio.gather(*(cache.fetch("key", DEPARTURE, load) for _ in range(10)))
+        return cache, results
+
+    cache, results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(status == "miss" and [f.id for f in flights] == ["A"] for flights, status in results)
+    assert cache.metrics["misses"] == 10
+    assert cache.in_flight.metrics["coalesced"] == 9
+
+
+def test_fresh_entry_is_a_hit():
+    load, calls = counting_loader([offer("A")])
+
+    async def main():
+        cache = FlightSearchCache(redis_factory=lambda: None)
+        await cache.fetch("key", DEPARTURE, load)
+        return await cache.fetch("key", DEPARTURE, load), cache
+
+    (flights, status), cache = asyncio.run(main())
+    assert status == "hit"
+    assert len(calls) == 1
+    assert cache.metrics["hits_local"] == 1
+
+
+def test_stale_hit_serves_old_flights_and_refreshes_in_background():
+    old_load, _ = counting_loader([offer("OLD")])
+    new_load, new_calls = counting_loader([offer("NEW")])
+
+    async def main():
+        cache = FlightSearchCache(redis_factory=lambda: None)
+        await cache.fetch("key", DEPARTURE, old_load)
+        cache._entries["key"].fresh_until = time.time() - 1
+
+        # Several stale readers: all get the old flights, one refresh runs
+        stale = await asyncio.gather(*(cache.fetch("key", DEPARTURE, new_load) for _ in range(3)))
+        assert len(cache._refreshing) == 1
+        await asyncio.gather(*cache._refreshing.values())
+        fresh = await cache.fetch("key", DEPARTURE, new_load)
+        return stale, fresh, cache
+
+    stale, (fresh_flights, fresh_status), cache = asyncio.run(main())
+    assert all(status == "stale" and [f.id for f in flights] == ["OLD"] for flights, status in stale)
+    assert len(new_calls) == 1
+    assert fresh_status == "hit" and [f.id for f in fresh_flights] == ["NEW"]
+    assert cache.metrics["stale_hits"] == 3
+    assert cache.metrics["refreshes"] == 1
+    assert not cache._refreshing
+
+
+def test_failed_refresh_keeps_serving_the_stale_entry():
+    old_load, _ = counting_loader([offer("OLD")])
+
+    async def failing():
+        raise RuntimeError("supplier down")
+
+    async def main():
+        cache = FlightSearchCache(redis_factory=lambda: None)
+        await cache.fetch("key", DEPARTURE, old_load)
+        cache._entries["key"].fresh_until = time.time() - 1
+        await cache.fetch("key", DEPARTURE, failing)
+        await asyncio.gather(*cache._refreshing.values())
+        return await cache.fetch("key", DEPARTURE, failing), cache
+
+    (flights, status), cache = asyncio.run(main())
+    assert status == "stale" and [f.id for f in flights] == ["OLD"]
+    assert cache.metrics["refresh_errors"] == 1
+
+
+def test_empty_results_are_not_cached():
+    load, calls = counting_loader([])
+
+    async def main():
+        cache = FlightSearchCache(redis_factory=lambda: None)
+        await cache.fetch("key", DEPARTURE, load)
+        await cache.fetch("key", DEPARTURE, load)
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_entries_are_shared_through_redis():
+    redis = FakeRedis()
+    load, calls = counting_loader([offer("A", 4200.0)])
+
+    async def main():
+        writer = FlightSearchCache(redis_factory=lambda: redis)
+        reader = FlightSearchCache(redis_factory=lambda: redis)
+        await writer.fetch("key", DEPARTURE, load)
+        return await reader.fetch("key", DEPARTURE, load), reader
+
+    (flights, status), reader = asyncio.run(main())
+    assert status == "hit"
+    assert len(calls) == 1
+    assert [(f.id, f.price) for f in flights] == [("A", 4200.0)]
+    assert reader.metrics["hits_redis"] == 1
+
+
+def test_redis_error_turns_the_tier_off_for_the_retry_window():
+    redis = BrokenRedis()
+    connects = []
+
+    def factory():
+        connects.append(1)
+        return redis
+
+    async def main():
+        tier = RedisTier("test:", "Test", factory)
+        assert await tier.get("key") is None
+        # Within the retry window Redis is neither called nor reconnected
+        assert await tier.get("key") is None
+        await tier.set("key", lambda: "value", 10)
+        return tier
+
+    tier = asyncio.run(main())
+    assert redis.calls == 1
+    assert len(connects) == 1
+    assert tier.errors == 1
+    assert not tier.available
+
+
+def test_redis_is_retried_after_the_window(monkeypatch):
+    redis = BrokenRedis()
+    now = [1000.0]
+    monkeypatch.setattr(flight_cache.time, "monotonic", lambda: now[0])
+
+    async def main():
+        tier = RedisTier("test:", "Test", lambda: redis)
+        await tier.get("key")
+        now[0] += flight_cache.REDIS_RETRY_SECONDS + 1
+        await tier.get("key")
+        return tier
+
+    tier = asyncio.run(main())
+    assert redis.calls == 2
+    assert tier.errors == 2
+
+
+def test_slow_redis_times_out_without_failing_the_search(monkeypatch):
+    monkeypatch.setattr(flight_cache, "REDIS_TIMEOUT_SECONDS", 0.01)
+
+    class SlowRedis(FakeRedis):
+        def get(self, key):
+            time.sleep(0.1)
+            return super().get(key)
+
+    load, calls = counting_loader([offer("A")])
+
+    async def main():
+        cache = FlightSearchCache(redis_factory=lambda: SlowRedis())
+        return await cache.fetch("key", DEPARTURE, load), cache
+
+    (flights, status), cache = asyncio.run(main())
+    assert status == "miss" and [f.id for f in flights] == ["A"]
+    assert cache.redis.errors == 1
+
+
+def test_entries_are_not_serialized_without_redis(monkeypatch):
+    encoded = []
+    monkeypatch.setattr(CacheEntry, "to_json", lambda entry: encoded.append(1) or "{}")
+    load, _ = counting_loader([offer("A")])
+
+    async def main():
+        cache = FlightSearchCache(redis_factory=lambda: None)
+        await cache.fetch("key", DEPARTURE, load)
+
+    asyncio.run(main())
+    assert encoded == []
+
+
+def test_non_json_details_still_reach_redis():
+    redis = FakeRedis()
+    flight = offer("A")
+    flight.details["fetched_at"] = datetime(2030, 1, 1, 9, 30)
+    load, _ = counting_loader([flight])
+
+    async def main():
+        writer = FlightSearchCache(redis_factory=lambda: redis)
+        await writer.fetch("key", DEPARTURE, load)
+        return writer
+
+    writer = asyncio.run(main())
+    assert writer.redis.errors == 0
+    stored = CacheEntry.from_json(next(iter(redis.values.values())))
+    assert stored.flights[0].details["fetched_at"] == "2030-01-01 09:30:00"
@@ -0,0 +1,51 @@
+import json
+
+from flight_offer import ROW_FIELDS, FlightOffer
+
+
+def test_build_parses_supplier_values():
+    flight = FlightOffer.build(
+        supplier="tbo", id=7, airline_code=" 6e ", airline="IndiGo", flight_number="6E-0123",
+        origin_code="del", destination_code="bom", departure_time="23:30", arrival_time="01:40",
+        travel_date="2030-01-15T00:00:00", duration="2h 10m", price=5200,
+        fare_types=[{"price": 4800, "refundable": True}, {"price": 6100}],
+    )
+
+    assert flight.to_dict()["departure_date"] == "2030-01-15"
+    # An arrival earlier than the departure lands the next day
+    assert flight.arrival - flight.departure == 130
+    assert (flight.departure_minute, flight.arrival_minute) == (23 * 60 + 30, 100)
+    assert flight.duration == 130
+    assert flight.price == 4800.0
+    assert flight.refundable is True
+    assert (flight.airline_code, flight.origin_code, flight.key[1]) == ("6E", "DEL", "123")
+
+
+def test_unknown_times_and_prices_stay_unknown():
+    flight = FlightOffer.build(
+        supplier="tripjack", id="x", airline_code="", airline="Akasa Air", flight_number="QP 1101",
+        origin_code="BOM", destination_code="BLR", departure_time="", arrival_time=None,
+    )
+
+    assert (flight.departure, flight.arrival, flight.duration) == (None, None, None)
+    assert flight.departure_minute == flight.arrival_minute == -1
+    assert flight.price_key == float('inf')
+    assert flight.key[0] == "AKASA AIR"
+    assert flight.to_dict()["departure_time"] == ""
+
+
+def test_rows_survive_a_json_round_trip():
+    flight = FlightOffer.build(
+        supplier="amadeus", id="A1", airline_code="AI", airline="Air India", flight_number="AI 865",
+        origin_code="DEL", destination_code="BOM", departure_time="2030-01-15T06:05:00+05:30",
+        arrival_time="2030-01-15T08:20:00+05:30", duration="PT2H15M", stops=1, price=7300.5,
+        price_estimated=True, segments=[{"origin_code": "DEL", "destination_code": "BOM"}],
+    )
+    flight = flight.replace(offers=flight.offers + [{"supplier": "tbo", "id": "T9", "price": 7400.0}])
+
+    restored = FlightOffer.from_row(json.loads(json.dumps(flight.to_row())))
+
+    assert [getattr(restored, name) for name in ROW_FIELDS] == [getattr(flight, name) for name in ROW_FIELDS]
+    assert (restored.key, restored.price_key, restored.departure_minute) == (
+        flight.key, flight.price_key, flight.departure_minute)
+    assert restored.to_dict() == flight.to_dict()
@@ -0,0 +1,91 @@
+import asyncio
+
+from flight_offer import FlightOffer
+from flight_results import ResultSession, ResultSessionStore
+
+DEPARTURE = "2030-01-15"
+
+
+def offer(flight_id, price=5000.0):
+    return FlightOffer.build(
+        supplier="tbo", id=flight_id, airline_code="6E", airline="IndiGo", flight_number="123",
+        origin_code="DEL", destination_code="BOM", departure_time="06:00", arrival_time="08:10",
+        travel_date=DEPARTURE, price=price,
+    )
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+def test_sessions_are_not_serialized_without_redis(monkeypatch):
+    encoded = []
+    monkeypatch.setattr(ResultSession, "to_json", lambda session: encoded.append(1) or "{}")
+
+    async def main():
+        store = ResultSessionStore(redis_factory=lambda: None)
+        await store.put("search", [offer("A")])
+        return await store.get("search")
+
+    session = asyncio.run(main())
+    assert encoded == []
+    assert [flight.id for flight in session.offers] == ["A"]
+
+
+def test_another_worker_reads_the_session_from_redis():
+    redis = FakeRedis()
+
+    async def main():
+        await ResultSessionStore(redis_factory=lambda: redis).put("search", [offer("A"), offer("B", 4000.0)])
+        reader = ResultSessionStore(redis_factory=lambda: redis)
+        return reader, await reader.get("search")
+
+    reader, session = asyncio.run(main())
+    assert reader.metrics["hits_redis"] == 1
+    assert [flight.id for flight in session.offers] == ["A", "B"]
+    # Facets travel with the offers, the reader never builds the table
+    assert session._table is None
+    assert session.facets["airlines"]
+
+
+def test_facets_only_search_then_pages_agree_with_the_facets():
+    # facetsOnly: the search answers with search_id and facets, the client
+    # then pages and filters the stored offers
+    airlines = ["6E", "AI", "UK"]
+    offers = [
+        FlightOffer.build(
+            supplier="tbo", id=str(i), airline_code=airlines[i % 3], airline="", flight_number=str(100 + i),
+            origin_code="DEL", destination_code="BOM", departure_time=f"{(i * 5) % 24:02d}:15" if i % 7 else "",
+            arrival_time="", travel_date=DEPARTURE, stops=i % 2, price=3000 + 97 * i if i % 11 else 0,
+        )
+        for i in range(45)
+    ]
+
+    async def main():
+        store = ResultSessionStore(redis_factory=lambda: None)
+        facets = (await store.put("search", offers)).facets
+        return facets, await store.get("search")
+
+    facets, session = asyncio.run(main())
+    pages = [session.query(page=page, page_size=10) for page in range(1, 6)]
+
+    assert facets["total"] == pages[0]["total"] == 45
+    assert pages[0]["pages"] == 5
+    paged_ids = [flight["id"] for page in pages for flight in page["flights"]]
+    assert sorted(paged_ids, key=int) == [offer.id for offer in offers]
+    prices = [flight["price"] for page in pages for flight in page["flights"]]
+    priced = [price for price in prices if price > 0]
+    assert priced == sorted(priced) and prices[len(priced):] == [0.0] * (45 - len(priced))
+
+    for airline in facets["airlines"]:
+        assert session.query(airlines=[airline["code"]])["filtered"] == airline["count"]
+    for band, count in facets["time_bands"].items():
+        assert session.query(time_bands=[band])["filtered"] == count
+    assert session.query(max_stops=0)["filtered"] == facets["stops"]["0"]
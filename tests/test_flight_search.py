@@ -0,0 +1,106 @@
+import asyncio
+
+from flight_offer import FlightOffer
+from flight_search import SearchVariant, fan_out, iter_variant_results, search_variants
+
+VARIANTS = [
+    SearchVariant("DEL", "BOM", "2030-01-15"),
+    SearchVariant("DEL", "BOM", "2030-01-16"),
+    SearchVariant("DEL", "BOM", "2030-01-17"),
+]
+
+
+def offer(variant):
+    return FlightOffer.build(
+        supplier="tbo", id=variant.departure_date, airline_code="6E", airline="IndiGo", flight_number="123",
+        origin_code=variant.origin, destination_code=variant.destination, departure_time="06:00",
+        arrival_time="08:10", travel_date=variant.departure_date, price=5000,
+    )
+
+
+def stub_search(delays, errors=()):
+    """Supplier stub: answers each variant after its delay, or raises for variants in ``errors``"""
+    async def search(variant):
+        await asyncio.sleep(delays[variant])
+        if variant in errors:
+            raise RuntimeError("supplier down")
+        return [offer(variant)]
+    return search
+
+
+def test_variants_past_the_deadline_are_reported_as_timeouts():
+    delays = {VARIANTS[0]: 0.0, VARIANTS[1]: 5.0, VARIANTS[2]: 0.01}
+    results = asyncio.run(fan_out(VARIANTS, stub_search(delays), deadline=0.2))
+
+    assert [result.variant for result in results] == VARIANTS
+    assert [result.status for result in results] == ["ok", "timeout", "ok"]
+    assert results[1].flights == []
+    assert results[1].timing()["status"] == "timeout"
+    assert [len(result.flights) for result in results] == [1, 0, 1]
+
+
+def test_queued_variants_past_the_deadline_are_timeouts_too():
+    delays = {variant: 5.0 for variant in VARIANTS}
+    delays[VARIANTS[0]] = 0.0
+    # One slot: the first answers, the second holds the slot past the deadline,
+    # the third never starts
+    results = asyncio.run(fan_out(VARIANTS, stub_search(delays), concurrency=1, deadline=0.1))
+
+    assert [result.status for result in results] == ["ok", "timeout", "timeout"]
+    assert results[2].wait_ms is None
+
+
+def test_results_stream_in_completion_order_with_errors_reported():
+    delays = {VARIANTS[0]: 0.05, VARIANTS[1]: 0.0, VARIANTS[2]: 0.02}
+
+    async def collect():
+        return [result async for result in iter_variant_results(
+            VARIANTS, stub_search(delays, errors={VARIANTS[2]}), deadline=1.0)]
+
+    results = asyncio.run(collect())
+    assert [result.variant for result in results] == [VARIANTS[1], VARIANTS[2], VARIANTS[0]]
+    assert [result.status for result in results] == ["ok", "error", "ok"]
+    assert results[1].error == "supplier down"
+
+
+def test_concurrency_is_bounded():
+    running = []
+    peak = []
+
+    async def search(variant):
+        running.append(variant)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(variant)
+        return []
+
+    variants = search_variants(["DEL"], ["BOM"], [f"2030-01-{day:02d}" for day in range(10, 20)])
+    results = asyncio.run(fan_out(variants, search, concurrency=3, deadline=1.0))
+
+    assert max(peak) == 3
+    assert all(result.status == "ok" for result in results)
+
+
+def test_closing_the_stream_cancels_searches_in_flight():
+    delays = {VARIANTS[0]: 0.0, VARIANTS[1]: 5.0, VARIANTS[2]: 5.0}
+    cancelled = []
+
+    async def search(variant):
+        try:
+            return await stub_search(delays)(variant)
+        except asyncio.CancelledError:
+            cancelled.append(variant)
+            raise
+
+    async def first_then_close():
+        results = iter_variant_results(VARIANTS, search, deadline=10.0)
+        first = await results.__anext__()
+        # What the stream endpoint does when its client disconnects
+        await results.aclose()
+        await asyncio.sleep(0)
+        # Checked before asyncio.run tears down whatever is left
+        return first, list(cancelled)
+
+    first, cancelled_on_close = asyncio.run(first_then_close())
+    assert first.variant == VARIANTS[0]
+    assert sorted(cancelled_on_close) == sorted(VARIANTS[1:])
@@ -0,0 +1,74 @@
+import numpy as np
+
+from flight_offer import FlightOffer
+from offer_table import OfferTable
+
+
+def offer(flight_id, airline_code, departure_time, price, duration=None, stops=0, refundable=False):
+    return FlightOffer.build(
+        supplier="tbo", id=flight_id, airline_code=airline_code, airline=f"{airline_code} Air",
+        flight_number=flight_id, origin_code="DEL", destination_code="BOM", departure_time=departure_time,
+        arrival_time="", travel_date="2030-01-15", duration=duration, stops=stops, price=price,
+        refundable=refundable,
+    )
+
+
+OFFERS = [
+    offer("1", "6E", "06:00", 5000, duration=130),
+    offer("2", "AI", "", 4000, duration=None, stops=1),
+    offer("3", "6E", "13:30", 0, duration=150),
+    offer("4", "UK", "19:15", 6500, duration=125, refundable=True),
+    offer("5", "AI", "23:40", 4000, duration=200, stops=1),
+]
+
+
+def ids(rows):
+    return [OFFERS[row].id for row in rows.tolist()]
+
+
+def test_missing_values_sort_last_both_ways():
+    table = OfferTable(OFFERS)
+
+    assert ids(table.order()) == ["2", "5", "1", "4", "3"]
+    assert ids(table.order(descending=True)) == ["4", "1", "2", "5", "3"]
+    # Unknown duration (offer 2) is last either way; ties fall back to price
+    assert ids(table.order(sort=["duration"])) == ["4", "1", "3", "5", "2"]
+    assert ids(table.order(sort=["duration"], descending=True)) == ["5", "3", "1", "4", "2"]
+    assert ids(table.order(sort=["departure"]))[-1] == "2"
+
+
+def test_equal_rows_keep_their_order():
+    table = OfferTable(OFFERS)
+    assert ids(table.order(sort=["stops"])) == ["1", "4", "3", "2", "5"]
+
+
+def test_mask_filters_combine():
+    table = OfferTable(OFFERS)
+
+    assert ids(np.flatnonzero(table.mask(min_price=4500))) == ["1", "4"]
+    assert ids(np.flatnonzero(table.mask(max_stops=0, refundable=False))) == ["1", "3"]
+    assert ids(np.flatnonzero(table.mask(airlines=["ai", "UK Air"]))) == ["2", "4", "5"]
+    # An unknown departure counts as midday
+    assert ids(np.flatnonzero(table.mask(time_bands=["afternoon"]))) == ["2", "3"]
+    assert ids(np.flatnonzero(table.mask(time_bands=["any"]))) == ids(np.arange(len(OFFERS)))
+    assert ids(table.order(table.mask(max_price=4500))) == ["2", "5", "3"]
+
+
+def test_facets_count_every_offer():
+    facets = OfferTable(OFFERS).facets(price_bins=2)
+
+    assert facets["total"] == 5
+    assert facets["price"]["min"] == 4000
+    assert facets["price"]["max"] == 6500
+    assert sum(bucket["count"] for bucket in facets["price"]["histogram"]) == 4
+    assert [(a["code"], a["count"], a["min_price"]) for a in facets["airlines"]] == [
+        ("6E", 2, 5000.0), ("AI", 2, 4000.0), ("UK", 1, 6500.0)]
+    assert facets["stops"] == {"0": 3, "1": 2}
+    assert sum(facets["time_bands"].values()) == 5
+    assert facets["refundable"] == 1
+
+
+def test_empty_table():
+    table = OfferTable([])
+    assert len(table.order()) == 0
+    assert table.facets()["price"] == {"min": None, "max": None, "histogram": []}
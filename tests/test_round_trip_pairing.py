@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from flight_offer import FlightOffer
+from round_trip_pairing import LegWeights, pair_round_trips, same_carrier, split_legs
+
+AIRLINES = ["6E", "AI", "UK", "SG"]
+
+
+def legs(count, origin, destination, seed):
+    """Same-day offers, some with unknown times and some unpriced"""
+    rng = random.Random(seed)
+    offers = []
+    for i in range(count):
+        departure = rng.randrange(0, 20 * 60, 5)
+        duration = rng.randrange(60, 240, 5)
+        known = rng.random() > 0.1
+        offers.append(FlightOffer.build(
+            supplier="tbo", id=f"{origin}{destination}{i}", airline_code=rng.choice(AIRLINES), airline="",
+            flight_number=str(100 + i), origin_code=origin, destination_code=destination,
+            departure_time=f"{departure // 60:02d}:{departure % 60:02d}" if known else "",
+            arrival_time=f"{(departure + duration) // 60:02d}:{(departure + duration) % 60:02d}" if known else "",
+            travel_date="2030-01-15", duration=duration, stops=rng.randrange(0, 2),
+            price=rng.randrange(2000, 9000) if rng.random() > 0.05 else 0,
+        ))
+    return offers
+
+
+def brute_force(outbound, inbound, k, weights, min_stay, bonus):
+    """Every pair scored, then sorted"""
+    scores = []
+    for out_offer in outbound:
+        for ret_offer in inbound:
+            if not out_offer.price or not ret_offer.price:
+                continue
+            if (out_offer.arrival is not None and ret_offer.departure is not None
+                    and ret_offer.departure - out_offer.arrival < min_stay):
+                continue
+            score = weights.score(out_offer) + weights.score(ret_offer)
+            scores.append(score - bonus if same_carrier(out_offer, ret_offer) else score)
+    return sorted(scores)[:k]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("weights, bonus", [
+    (LegWeights(), 0.0),
+    (LegWeights(), 250.0),
+    (LegWeights(duration=5.0, stops=400.0), 600.0),
+])
+def test_matches_the_cross_product(seed, weights, bonus):
+    outbound = legs(40, "DEL", "BOM", seed)
+    inbound = legs(40, "BOM", "DEL", seed + 100)
+
+    trips = pair_round_trips(outbound, inbound, k=15, weights=weights, min_stay_minutes=120,
+                             same_carrier_bonus=bonus)
+
+    assert [trip.score for trip in trips] == pytest.approx(brute_force(outbound, inbound, 15, weights, 120, bonus))
+    for trip in trips:
+        assert trip.price > 0
+        assert trip.stay_minutes is None or trip.stay_minutes >= 120
+
+
+def test_candidate_cap_bounds_the_work():
+    outbound = legs(50, "DEL", "BOM", 1)
+    inbound = legs(50, "BOM", "DEL", 2)
+
+    assert len(pair_round_trips(outbound, inbound, k=100, max_candidates=10)) <= 10
+    assert pair_round_trips(outbound, inbound, k=0) == []
+    assert pair_round_trips(outbound, [], k=5) == []
+
+
+def test_legs_split_on_the_searched_origins():
+    outbound = legs(3, "DEL", "BOM", 1) + legs(2, "DEL", "BOM", 2)
+    inbound = legs(4, "BOM", "DEL", 3)
+
+    found_out, found_in = split_legs(inbound[:2] + outbound + inbound[2:], ["del"])
+    assert found_out == outbound
+    assert found_in == inbound
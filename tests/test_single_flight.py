@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def main():
+        single = SingleFlight("test")
+        results = await asyncio.gather(*(single.run("key", call) for _ in range(5)))
+        return single, results
+
+    single, results = asyncio.run(main())
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert single.metrics["calls"] == 1
+    assert single.metrics["coalesced"] == 4
+    assert single.stats()["in_flight"] == 0
+
+
+def test_cancelled_first_caller_does_not_cancel_shared_call():
+    async def call():
+        await asyncio.sleep(0.02)
+        return "result"
+
+    async def main():
+        single = SingleFlight("test")
+        first = asyncio.ensure_future(single.run("key", call))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(single.run("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second, single
+
+    result, single = asyncio.run(main())
+    assert result == "result"
+    assert single.metrics["calls"] == 1
+
+
+def test_failure_reaches_every_waiter_and_is_not_kept():
+    attempts = []
+
+    async def failing():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("supplier down")
+
+    async def main():
+        single = SingleFlight("test")
+        results = await asyncio.gather(*(single.run("key", failing) for _ in range(3)), return_exceptions=True)
+        # The failed call is gone, so the next caller starts a new one
+        retry = await asyncio.gather(single.run("key", failing), return_exceptions=True)
+        return results + retry
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(attempts) == 2
@@ -0,0 +1,68 @@
+import asyncio
+
+import travel_tips
+from travel_tips import TravelTipCache
+
+
+def failing_generator():
+    calls = []
+
+    async def generate(prompt):
+        calls.append(prompt)
+        raise RuntimeError("llm down")
+
+    return generate, calls
+
+
+def test_failed_generation_is_not_retried_until_it_expires(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(travel_tips.time, "monotonic", lambda: clock[0])
+    generate, calls = failing_generator()
+
+    async def main():
+        cache = TravelTipCache(generate, failure_ttl=60)
+        assert await cache.fetch("flight:DEL-BOM", "prompt") is None
+        # Every search peeks; none of them calls the LLM again within the TTL
+        for _ in range(5):
+            assert cache.peek("flight:DEL-BOM", "prompt") is None
+        assert await cache.fetch("flight:DEL-BOM", "prompt") is None
+        assert len(calls) == 1
+
+        clock[0] += 61
+        assert await cache.fetch("flight:DEL-BOM", "prompt") is None
+        return cache
+
+    cache = asyncio.run(main())
+    assert len(calls) == 2
+    assert cache.stats()["failed"] == 1
+
+
+def test_empty_tip_counts_as_a_failure():
+    calls = []
+
+    async def generate(prompt):
+        calls.append(prompt)
+        return ""
+
+    async def main():
+        cache = TravelTipCache(generate)
+        await cache.fetch("hotel:goa", "prompt")
+        await cache.fetch("hotel:goa", "prompt")
+
+    asyncio.run(main())
+    assert len(calls) == 1
+
+
+def test_success_is_cached_and_other_keys_are_unaffected():
+    async def generate(prompt):
+        if prompt == "bad":
+            raise RuntimeError("llm down")
+        return f"tip for {prompt}"
+
+    async def main():
+        cache = TravelTipCache(generate)
+        assert await cache.fetch("flight:DEL-XXX", "bad") is None
+        assert await cache.fetch("flight:DEL-BOM", "good") == "tip for good"
+        return cache.peek("flight:DEL-BOM", "good")
+
+    assert asyncio.run(main()) == "tip for good"